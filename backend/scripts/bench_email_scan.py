@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""Benchmark: inbox scan throughput, one email at a time vs pipelined.
+
+Replays a recorded inbox (scripts/fixtures/email_scan_inbox.json): the
+emails, the rows the scan reads (integrations, VIP list, monitored
+entities, semantic memory, drafts, calendar, earlier scan log) and the
+classification the LLM returned for each email. ``--copies`` repeats the
+inbox, with fresh message and thread IDs, to model a larger morning inbox.
+
+Both modes run against an in-memory PostgREST stand-in that sleeps
+``--db-ms`` per query, and an LLM stand-in that sleeps ``--llm-ms`` per
+call plus ``--llm-email-ms`` per email in the call (output tokens):
+
+- sequential: ``categorize_email`` then ``_log_scan_decision`` per email,
+              as scan_inbox did before
+- pipelined:  ``_categorize_emails`` then ``_log_scan_decisions``
+
+It reports emails/second, queries and LLM calls per mode, and checks that
+both modes categorized every email identically and logged the same rows
+(ignoring IDs, timestamps and the user_replied cache).
+
+Usage (from backend/):
+    python -m scripts.bench_email_scan [--copies 4] [--batch-size 10] [--llm-concurrency 4]
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# The simulation never talks to Supabase or an LLM; satisfy startup validation only.
+for _key in ("SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY", "ANTHROPIC_API_KEY", "APP_SECRET_KEY"):
+    os.environ.setdefault(_key, "http://bench.local" if _key == "SUPABASE_URL" else "bench")
+
+from src.core.config import settings  # noqa: E402
+from src.services.email_analyzer import EmailAnalyzer, EmailCategory  # noqa: E402
+
+FIXTURE = backend_dir / "scripts" / "fixtures" / "email_scan_inbox.json"
+
+# email_scan_log columns that differ between runs by design. user_replied
+# is a reply-check cache (NULL = not checked): the sequential scan also
+# caches a thread's check on rows it logged earlier in the thread, and
+# scan_inbox's update_replied_emails fills in the rest afterwards.
+_VOLATILE_COLUMNS = {"id", "scanned_at", "created_at", "user_replied"}
+
+
+class _Query:
+    """Sync PostgREST builder over in-memory tables."""
+
+    def __init__(self, db: "_FakeSupabase", table: str) -> None:
+        self._db = db
+        self._table = table
+        self._op = "select"
+        self._payload: Any = None
+        self._filters: list[Any] = []
+        self._order: tuple[str, bool] | None = None
+        self._limit: int | None = None
+        self._negate = False
+
+    def select(self, *_args: Any, **_kwargs: Any) -> "_Query":
+        return self
+
+    def insert(self, rows: Any) -> "_Query":
+        self._op, self._payload = "insert", rows
+        return self
+
+    def update(self, values: dict[str, Any]) -> "_Query":
+        self._op, self._payload = "update", values
+        return self
+
+    def _where(self, test: Any) -> "_Query":
+        negate, self._negate = self._negate, False
+        self._filters.append((lambda row: not test(row)) if negate else test)
+        return self
+
+    @property
+    def not_(self) -> "_Query":
+        self._negate = True
+        return self
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        return self._where(lambda row: row.get(column) == value)
+
+    def in_(self, column: str, values: list[Any]) -> "_Query":
+        return self._where(lambda row: row.get(column) in values)
+
+    def is_(self, column: str, _value: str) -> "_Query":
+        return self._where(lambda row: row.get(column) is None)
+
+    def gt(self, column: str, value: str) -> "_Query":
+        return self._where(lambda row: row.get(column) is not None and row[column] > value)
+
+    def gte(self, column: str, value: str) -> "_Query":
+        return self._where(lambda row: row.get(column) is not None and row[column] >= value)
+
+    def lte(self, column: str, value: str) -> "_Query":
+        return self._where(lambda row: row.get(column) is not None and row[column] <= value)
+
+    def ilike(self, column: str, pattern: str) -> "_Query":
+        regex = re.compile(
+            "^" + ".*".join(re.escape(part) for part in pattern.split("%")) + "$",
+            re.IGNORECASE | re.DOTALL,
+        )
+        return self._where(lambda row: bool(regex.match(str(row.get(column) or ""))))
+
+    def contains(self, column: str, values: list[Any]) -> "_Query":
+        return self._where(lambda row: set(values) <= set(row.get(column) or []))
+
+    def order(self, column: str, desc: bool = False) -> "_Query":
+        self._order = (column, desc)
+        return self
+
+    def limit(self, n: int) -> "_Query":
+        self._limit = n
+        return self
+
+    def execute(self) -> Any:
+        time.sleep(self._db.latency)
+        with self._db.lock:
+            self._db.queries += 1
+            rows = self._db.tables.setdefault(self._table, [])
+            if self._op == "insert":
+                new_rows = self._payload if isinstance(self._payload, list) else [self._payload]
+                now = datetime.now(UTC).isoformat()
+                for row in new_rows:
+                    rows.append(
+                        {"id": str(uuid.uuid4()), "created_at": now, "scanned_at": now, **row}
+                    )
+                return SimpleNamespace(data=copy.deepcopy(new_rows))
+            matched = [row for row in rows if all(test(row) for test in self._filters)]
+            if self._op == "update":
+                for row in matched:
+                    row.update(self._payload)
+                return SimpleNamespace(data=copy.deepcopy(matched))
+            if self._order is not None:
+                column, desc = self._order
+                matched.sort(key=lambda row: str(row.get(column) or ""), reverse=desc)
+            if self._limit is not None:
+                matched = matched[: self._limit]
+            return SimpleNamespace(data=copy.deepcopy(matched))
+
+
+class _FakeSupabase:
+    """Sync Supabase client over in-memory tables with fixed query latency."""
+
+    def __init__(
+        self, tables: dict[str, list[dict[str, Any]]], user: dict[str, str], latency: float
+    ):
+        self.tables = tables
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.queries = 0
+
+        def get_user_by_id(_user_id: str) -> Any:
+            time.sleep(latency)
+            with self.lock:
+                self.queries += 1
+            return SimpleNamespace(user=SimpleNamespace(email=user["email"]))
+
+        self.auth = SimpleNamespace(admin=SimpleNamespace(get_user_by_id=get_user_by_id))
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+
+class _RecordedLLM:
+    """Answers classification prompts with the recorded verdicts."""
+
+    _EMAIL = re.compile(r"^From: .* <([^>]*)>\nSubject: (.*)$", re.MULTILINE)
+
+    def __init__(self, verdicts: dict[str, dict[str, Any]], call_ms: float, email_ms: float):
+        self._verdicts = verdicts
+        self._call = call_ms / 1000.0
+        self._email = email_ms / 1000.0
+        self.calls = 0
+
+    async def generate_response(self, messages: list[dict[str, str]], **_kwargs: Any) -> str:
+        prompt = messages[-1]["content"]
+        found = self._EMAIL.findall(prompt)
+        self.calls += 1
+        await asyncio.sleep(self._call + self._email * len(found))
+        answers = [self._verdicts[f"{sender}|{subject}"] for sender, subject in found]
+        if prompt.startswith("Classify each of these"):
+            return json.dumps([{"index": n, **a} for n, a in enumerate(answers, start=1)])
+        return json.dumps(answers[0])
+
+
+def _load_inbox(copies: int) -> tuple[dict[str, Any], list[dict[str, Any]], dict[str, Any]]:
+    """Fixture rows with times resolved against now, the emails and the verdicts."""
+    fixture = json.loads(FIXTURE.read_text())
+    now = datetime.now(UTC)
+
+    tables = fixture["tables"]
+    for event in tables["calendar_events"]:
+        event["start_time"] = (now + timedelta(minutes=event.pop("start_in_minutes"))).isoformat()
+    for row in tables["email_scan_log"]:
+        at = (now - timedelta(minutes=row.pop("minutes_ago"))).isoformat()
+        row.update(id=str(uuid.uuid4()), scanned_at=at, created_at=at)
+
+    emails: list[dict[str, Any]] = []
+    verdicts: dict[str, Any] = {}
+    for copy_n in range(copies):
+        for entry in fixture["emails"]:
+            email = dict(entry["email"])
+            if copy_n:
+                email["id"] = f"{email['id']}-{copy_n}"
+                email["thread_id"] = f"{email['thread_id']}-{copy_n}"
+            received = now - timedelta(minutes=entry["minutes_ago"], seconds=copy_n)
+            email["date"] = received.isoformat()
+            emails.append(email)
+            if entry["verdict"]:
+                key = f"{email['sender_email']}|{email['subject']}"
+                verdicts[key] = entry["verdict"]
+    emails.sort(key=lambda e: e["date"], reverse=True)
+    return {"user": fixture["user"], "tables": tables}, emails, verdicts
+
+
+async def _scan(
+    mode: str,
+    fixture: dict[str, Any],
+    emails: list[dict[str, Any]],
+    verdicts: dict[str, Any],
+    args: argparse.Namespace,
+) -> tuple[float, list[EmailCategory], _FakeSupabase, _RecordedLLM]:
+    db = _FakeSupabase(copy.deepcopy(fixture["tables"]), fixture["user"], args.db_ms / 1000.0)
+    llm = _RecordedLLM(verdicts, args.llm_ms, args.llm_email_ms)
+    analyzer = EmailAnalyzer.__new__(EmailAnalyzer)
+    analyzer._db = db
+    analyzer._llm = llm
+    user_id = fixture["user"]["id"]
+
+    start = time.perf_counter()
+    exclusions = await analyzer._load_exclusions(user_id)
+    if mode == "sequential":
+        results = []
+        for email in emails:
+            categorized = await analyzer.categorize_email(email, user_id, exclusions)
+            results.append(categorized)
+            await analyzer._log_scan_decision(user_id, categorized)
+    else:
+        results = await analyzer._categorize_emails(emails, user_id, exclusions)
+        await analyzer._log_scan_decisions(user_id, results)
+    return time.perf_counter() - start, results, db, llm
+
+
+def _logged(db: _FakeSupabase) -> list[dict[str, Any]]:
+    rows = [
+        {k: v for k, v in row.items() if k not in _VOLATILE_COLUMNS}
+        for row in db.tables.get("email_scan_log", [])
+    ]
+    return sorted(rows, key=lambda row: json.dumps(row, sort_keys=True, default=str))
+
+
+async def _run(args: argparse.Namespace) -> None:
+    settings.EMAIL_SCAN_LLM_BATCH_SIZE = args.batch_size
+    settings.EMAIL_SCAN_LLM_CONCURRENCY = args.llm_concurrency
+    settings.EMAIL_SCAN_LOOKUP_CONCURRENCY = args.lookup_concurrency
+
+    fixture, emails, verdicts = _load_inbox(args.copies)
+    print(
+        f"Inbox: {len(emails)} emails, {len({e['sender_email'] for e in emails})} senders "
+        f"(batch={args.batch_size}, llm_concurrency={args.llm_concurrency}, "
+        f"db={args.db_ms:.0f}ms, llm={args.llm_ms:.0f}ms+{args.llm_email_ms:.0f}ms/email)\n"
+    )
+
+    runs = {}
+    print(f"{'mode':>12}{'seconds':>10}{'emails/s':>10}{'queries':>9}{'llm calls':>11}")
+    for mode in ("sequential", "pipelined"):
+        elapsed, results, db, llm = await _scan(mode, fixture, emails, verdicts, args)
+        runs[mode] = (results, db)
+        print(
+            f"{mode:>12}{elapsed:>10.2f}{len(emails) / elapsed:>10.1f}"
+            f"{db.queries:>9}{llm.calls:>11}"
+        )
+
+    (seq_results, seq_db), (pipe_results, pipe_db) = runs["sequential"], runs["pipelined"]
+    differing = [
+        a.email_id
+        for a, b in zip(seq_results, pipe_results, strict=False)
+        if a.model_dump() != b.model_dump()
+    ]
+    if len(seq_results) != len(pipe_results):
+        differing.append(f"count {len(seq_results)} != {len(pipe_results)}")
+    print(f"\nCategorizations identical: {'yes' if not differing else 'NO ' + str(differing)}")
+    same_log = _logged(seq_db) == _logged(pipe_db)
+    print(f"Scan log rows identical:   {'yes' if same_log else 'NO'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--copies", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--llm-concurrency", type=int, default=4)
+    parser.add_argument("--lookup-concurrency", type=int, default=8)
+    parser.add_argument("--db-ms", type=float, default=5.0)
+    parser.add_argument("--llm-ms", type=float, default=300.0)
+    parser.add_argument("--llm-email-ms", type=float, default=40.0)
+    args = parser.parse_args()
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
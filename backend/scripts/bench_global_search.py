@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Benchmark: global search latency over the full-text search index.
+
+Unlike the other benchmarks this one needs a real database: ranking,
+prefix matching and trigram typo tolerance all run inside Postgres
+(``search_items``, migration 20260316000004_search_index.sql). Point the
+usual SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY at a development project
+with that migration applied.
+
+The script seeds ``--items`` rows into ``search_index`` for a throwaway
+owner id, spread over the user-scoped types (memory, lead, goal,
+conversation, briefing). Then it replays as-you-type query sequences,
+including a typo, through ``SearchService.global_search``. It reports
+p50/p95 latency per keystroke for:
+
+- concurrent: the service path (one ``search_items`` call per type, gathered)
+- sequential: the same calls awaited one after another, as the old
+  per-table scans were
+
+The seeded rows are deleted afterwards (also on failure).
+
+Usage (from backend/):
+    python -m scripts.bench_global_search [--items 100000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.db.supabase import SupabaseClient, execute_async  # noqa: E402
+from src.services.search_service import SearchService  # noqa: E402
+
+_TYPES = {
+    "memory": "memory_semantic",
+    "lead": "leads",
+    "goal": "goals",
+    "conversation": "conversations",
+    "briefing": "briefings",
+}
+
+_COMPANIES = [
+    "Pfizer",
+    "Moderna",
+    "Lonza",
+    "Catalent",
+    "Samsung Biologics",
+    "WuXi AppTec",
+    "Regeneron",
+    "Genentech",
+    "Novartis",
+    "AstraZeneca",
+    "Biogen",
+    "Vertex",
+    "Gilead",
+    "Amgen",
+    "Takeda",
+    "Sanofi",
+    "Bayer",
+    "Merck",
+    "AbbVie",
+    "Thermo Fisher",
+]
+_WORDS = [
+    "oncology",
+    "manufacturing",
+    "capacity",
+    "antibody",
+    "conjugate",
+    "fill",
+    "finish",
+    "clinical",
+    "phase",
+    "trial",
+    "partnership",
+    "expansion",
+    "biologics",
+    "cell",
+    "gene",
+    "therapy",
+    "regulatory",
+    "approval",
+    "pipeline",
+    "budget",
+    "renewal",
+    "contract",
+    "pricing",
+    "proposal",
+    "meeting",
+    "followup",
+    "quarterly",
+    "review",
+]
+
+# Each sequence is typed one character at a time
+_QUERIES = ["pfizer oncology", "samsung biologics", "cell therapy", "catalnet"]
+
+_INSERT_BATCH = 1000
+
+
+def _make_rows(owner_id: str, n: int, seed: int = 7) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    now = datetime.now(UTC)
+    item_types = list(_TYPES)
+    rows = []
+    for _ in range(n):
+        company = rng.choice(_COMPANIES)
+        words = " ".join(rng.sample(_WORDS, 6))
+        item_type = rng.choice(item_types)
+        title = company if item_type == "lead" else f"{company} {words[:40]}"
+        rows.append(
+            {
+                "item_type": item_type,
+                "item_id": str(uuid.uuid4()),
+                "owner_id": owner_id,
+                "title": title,
+                "body": f"{company} {words}",
+                "metadata": {"stage": "lead", "health_score": 50},
+                "boost": round(rng.random(), 3),
+                "updated_at": (now - timedelta(days=rng.uniform(0, 720))).isoformat(),
+            }
+        )
+    return rows
+
+
+async def _seed(db: Any, rows: list[dict[str, Any]]) -> None:
+    for start in range(0, len(rows), _INSERT_BATCH):
+        await execute_async(db.table("search_index").insert(rows[start : start + _INSERT_BATCH]))
+
+
+async def _cleanup(db: Any, owner_id: str) -> None:
+    await execute_async(db.table("search_index").delete().eq("owner_id", owner_id))
+
+
+async def _sequential(service: SearchService, owner_id: str, query: str) -> None:
+    for item_type in _TYPES:
+        await execute_async(
+            service._db.rpc(
+                "search_items",
+                {"p_user_id": owner_id, "p_query": query, "p_item_type": item_type, "p_limit": 10},
+            )
+        )
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return statistics.median(ordered) * 1000, p95 * 1000
+
+
+async def _run(items: int, repeat: int) -> None:
+    db = SupabaseClient.get_client()
+    service = SearchService()
+    owner_id = str(uuid.uuid4())
+    types = list(_TYPES.values())
+
+    try:
+        print(f"Seeding {items} index rows for owner {owner_id}...")
+        start = time.perf_counter()
+        await _seed(db, _make_rows(owner_id, items))
+        print(f"Seeded in {time.perf_counter() - start:.1f}s\n")
+
+        # Fail loudly instead of timing the ILIKE fallback if the RPC is missing
+        await _sequential(service, owner_id, "pfizer")
+
+        print(f"{'query':>20}{'mode':>12}{'p50 ms':>10}{'p95 ms':>10}{'hits':>6}")
+        for text in _QUERIES:
+            for length in range(1, len(text) + 1):
+                query = text[:length]
+                concurrent: list[float] = []
+                sequential: list[float] = []
+                hits = 0
+                for _ in range(repeat):
+                    t = time.perf_counter()
+                    results = await service.global_search(owner_id, query, types=types)
+                    concurrent.append(time.perf_counter() - t)
+                    hits = len(results)
+
+                    t = time.perf_counter()
+                    await _sequential(service, owner_id, query)
+                    sequential.append(time.perf_counter() - t)
+
+                for mode, samples in (("concurrent", concurrent), ("sequential", sequential)):
+                    p50, p95 = _percentiles(samples)
+                    print(f"{query!r:>20}{mode:>12}{p50:>10.1f}{p95:>10.1f}{hits:>6}")
+    finally:
+        await _cleanup(db, owner_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(_run(args.items, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Benchmark: Graphiti memory retrieval latency, scoped and cached.
+
+Needs a real Neo4j: point NEO4J_URI / NEO4J_USER / NEO4J_PASSWORD at a
+development instance. The script writes a synthetic graph straight to
+the database (no LLM extraction): ``--users`` groups of ``--facts``
+facts each, with deterministic pseudo-embeddings. Query embeddings come
+from a stand-in embedder that sleeps ``--embed-ms`` per call, the
+typical OpenAI round trip.
+
+Each user replays ``--queries`` searches drawn from ``--distinct``
+phrasings (context is rebuilt from similar queries every turn). It
+reports p50/p95 latency per search for:
+
+- unscoped: Graphiti.search over the whole graph, as before partitioning
+- scoped:   the same searches limited to the user's group
+- cached:   CachingGraphiti + CachingEmbedder (src/db/graphiti_cache.py),
+            scoped
+
+The synthetic groups are deleted afterwards (also on failure).
+
+Usage (from backend/):
+    python -m scripts.bench_graphiti_search [--users 200] [--facts 500] [--queries 40]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import zlib
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# Only Neo4j is used; satisfy startup validation and the default
+# Graphiti LLM/reranker clients, which are never called here.
+for _key in ("SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY", "ANTHROPIC_API_KEY", "APP_SECRET_KEY"):
+    os.environ.setdefault(_key, "http://bench.local" if _key == "SUPABASE_URL" else "bench")
+os.environ.setdefault("OPENAI_API_KEY", "bench")
+
+from graphiti_core import Graphiti  # noqa: E402
+from graphiti_core.edges import EntityEdge  # noqa: E402
+from graphiti_core.embedder.client import EMBEDDING_DIM, EmbedderClient  # noqa: E402
+from graphiti_core.nodes import EntityNode  # noqa: E402
+from graphiti_core.utils.bulk_utils import add_nodes_and_edges_bulk  # noqa: E402
+from graphiti_core.utils.maintenance.graph_data_operations import clear_data  # noqa: E402
+
+from src.core.cache import get_cache  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.db.graphiti import SEARCH_CACHE_REGION  # noqa: E402
+from src.db.graphiti_cache import CachingEmbedder, CachingGraphiti  # noqa: E402
+
+_COMPANIES = [
+    "Pfizer",
+    "Moderna",
+    "Lonza",
+    "Catalent",
+    "Samsung Biologics",
+    "WuXi AppTec",
+    "Regeneron",
+    "Genentech",
+    "Novartis",
+    "AstraZeneca",
+]
+_PEOPLE = ["Alice Chen", "Raj Patel", "Maria Lopez", "Tom Becker", "Yuki Sato", "Omar Haddad"]
+_RELATIONS = [
+    ("WORKS_AT", "{a} works at {b}"),
+    ("DISCUSSED", "{a} discussed pricing with {b}"),
+    ("EVALUATING", "{a} is evaluating a fill-finish contract with {b}"),
+    ("MET_WITH", "{a} met with {b} about the oncology pipeline"),
+    ("RENEWAL", "{a} has a renewal with {b} due next quarter"),
+]
+_TOPICS = ["pricing", "renewal", "oncology", "capacity", "budget", "meeting", "contract"]
+
+
+def _vector(text: str) -> list[float]:
+    rng = np.random.default_rng(zlib.crc32(text.encode()))
+    v = rng.standard_normal(EMBEDDING_DIM)
+    return (v / np.linalg.norm(v)).tolist()  # type: ignore[no-any-return]
+
+
+class _SlowEmbedder(EmbedderClient):
+    """Deterministic embeddings after a fixed delay."""
+
+    def __init__(self, delay_ms: float) -> None:
+        self._delay = delay_ms / 1000.0
+        self.calls = 0
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        text = input_data if isinstance(input_data, str) else " ".join(map(str, input_data))
+        return _vector(text)
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        await asyncio.sleep(self._delay)
+        return [_vector(text) for text in input_data_list]
+
+
+def _make_group(group_id: str, facts: int, rng: random.Random) -> tuple[list[Any], list[Any]]:
+    now = datetime.now(UTC)
+    names = _PEOPLE + _COMPANIES + [f"{rng.choice(_COMPANIES)} site {i}" for i in range(facts // 4)]
+    nodes = {
+        name: EntityNode(
+            name=name,
+            group_id=group_id,
+            labels=["Entity"],
+            created_at=now,
+            name_embedding=_vector(name),
+        )
+        for name in names
+    }
+    edges = []
+    for _ in range(facts):
+        a, b = rng.sample(names, 2)
+        relation, template = rng.choice(_RELATIONS)
+        fact = template.format(a=a, b=b)
+        valid_at = now - timedelta(days=rng.uniform(0, 720))
+        edges.append(
+            EntityEdge(
+                group_id=group_id,
+                source_node_uuid=nodes[a].uuid,
+                target_node_uuid=nodes[b].uuid,
+                created_at=valid_at,
+                valid_at=valid_at,
+                name=relation,
+                fact=fact,
+                fact_embedding=_vector(fact),
+            )
+        )
+    return list(nodes.values()), edges
+
+
+def _queries(rng: random.Random, distinct: int, n: int) -> list[str]:
+    pool = [
+        f"{rng.choice(_PEOPLE + _COMPANIES)} {rng.choice(_TOPICS)}" for _ in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return statistics.median(ordered) * 1000, p95 * 1000
+
+
+async def _run(users: int, facts: int, queries: int, distinct: int, embed_ms: float) -> None:
+    password = settings.NEO4J_PASSWORD.get_secret_value()
+    plain_embedder = _SlowEmbedder(embed_ms)
+    plain = Graphiti(settings.NEO4J_URI, settings.NEO4J_USER, password, embedder=plain_embedder)
+    cached_embedder = _SlowEmbedder(embed_ms)
+    cached = CachingGraphiti(
+        settings.NEO4J_URI,
+        settings.NEO4J_USER,
+        password,
+        embedder=CachingEmbedder(cached_embedder, settings.GRAPHITI_EMBEDDING_CACHE_SIZE),
+    )
+    rng = random.Random(7)
+    groups = [f"bench_{i}" for i in range(users)]
+
+    try:
+        await plain.build_indices_and_constraints()
+        print(f"Seeding {users} groups x {facts} facts...")
+        start = time.perf_counter()
+        for group_id in groups:
+            nodes, edges = _make_group(group_id, facts, rng)
+            await add_nodes_and_edges_bulk(plain.driver, [], [], nodes, edges, plain_embedder)
+        print(f"Seeded in {time.perf_counter() - start:.1f}s\n")
+
+        streams = {group_id: _queries(rng, distinct, queries) for group_id in groups}
+        modes = {
+            "unscoped": lambda _g, q: plain.search(q),
+            "scoped": lambda g, q: plain.search(q, group_ids=[g]),
+            "cached": lambda g, q: cached.search(q, group_ids=[g]),
+        }
+
+        print(f"{'mode':>10}{'p50 ms':>10}{'p95 ms':>10}{'embeds':>8}")
+        for mode, search in modes.items():
+            embedder = cached_embedder if mode == "cached" else plain_embedder
+            embedder.calls = 0
+            samples: list[float] = []
+            # Interleave users, as concurrent sessions would
+            for i in range(queries):
+                for group_id in groups:
+                    t = time.perf_counter()
+                    await search(group_id, streams[group_id][i])
+                    samples.append(time.perf_counter() - t)
+            p50, p95 = _percentiles(samples)
+            print(f"{mode:>10}{p50:>10.1f}{p95:>10.1f}{embedder.calls:>8}")
+
+        stats = get_cache().region(SEARCH_CACHE_REGION).stats()
+        print(f"\nSearch cache hit rate: {stats['hit_rate']:.0%}")
+    finally:
+        await clear_data(plain.driver, group_ids=groups)
+        await plain.close()
+        await cached.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--facts", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=40)
+    parser.add_argument("--distinct", type=int, default=10)
+    parser.add_argument("--embed-ms", type=float, default=80.0)
+    args = parser.parse_args()
+    asyncio.run(_run(args.users, args.facts, args.queries, args.distinct, args.embed_ms))
+
+
+if __name__ == "__main__":
+    main()
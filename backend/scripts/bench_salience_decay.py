@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""Benchmark: salience decay, per-row updates vs vectorized batch write-back.
+
+Builds an in-memory salience table for one tenant and decays it with:
+
+- legacy: the previous loop (decay one row at a time in Python, one
+          ``UPDATE ... WHERE id = ?`` per changed row)
+- batch:  ``SalienceService.update_all_salience`` (pages read as columnar
+          arrays, NumPy decay, one ``bulk_update_memory_salience`` RPC per page)
+
+Every request to the fake database sleeps ``--latency-ms`` to stand in for
+the PostgREST round trip, which dominates the legacy loop. Both modes must
+produce identical salience values. The legacy loop makes one request per
+changed row, so it is skipped above ``--legacy-max`` rows.
+
+Usage (from backend/):
+    python -m scripts.bench_salience_decay [--sizes 10000 100000] [--latency-ms 2]
+"""
+
+import argparse
+import asyncio
+import bisect
+import math
+import os
+import random
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# The benchmark never talks to Supabase; satisfy startup validation only.
+for _key in ("SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY", "ANTHROPIC_API_KEY", "APP_SECRET_KEY"):
+    os.environ.setdefault(_key, "http://bench.local" if _key == "SUPABASE_URL" else "bench")
+
+from src.memory.salience import SalienceService  # noqa: E402
+
+_TABLE = "episodic_memory_salience"
+
+
+class _Result:
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+
+class _Query:
+    """Just enough of the PostgREST builder for the salience code paths."""
+
+    def __init__(self, db: "_FakeDB", table: str) -> None:
+        self._db = db
+        self._table = table
+        self._filters: list[tuple[str, str, Any]] = []
+        self._limit: int | None = None
+        self._update: dict[str, Any] | None = None
+
+    def select(self, _columns: str) -> "_Query":
+        return self
+
+    def update(self, values: dict[str, Any]) -> "_Query":
+        self._update = values
+        return self
+
+    def eq(self, column: str, value: Any) -> "_Query":
+        self._filters.append(("eq", column, value))
+        return self
+
+    def in_(self, column: str, values: list[Any]) -> "_Query":
+        self._filters.append(("in", column, set(values)))
+        return self
+
+    def gt(self, column: str, value: Any) -> "_Query":
+        self._filters.append(("gt", column, value))
+        return self
+
+    def order(self, _column: str) -> "_Query":
+        return self
+
+    def limit(self, n: int) -> "_Query":
+        self._limit = n
+        return self
+
+    def _matches(self, row: dict[str, Any]) -> bool:
+        for op, column, value in self._filters:
+            if op == "eq" and row[column] != value:
+                return False
+            if op == "in" and row[column] not in value:
+                return False
+            if op == "gt" and not row[column] > value:
+                return False
+        return True
+
+    def execute(self) -> _Result:
+        self._db.round_trip()
+        rows = self._db.tables[self._table]
+        if self._update is not None:
+            # Only used by the legacy loop, always as .eq("id", ...)
+            row = self._db.find(self._table, self._filters[0][2])
+            if row is not None:
+                row.update(self._update)
+            return _Result([])
+        # Rows are stored in id order; seek past an id cursor like an index would
+        start = 0
+        for op, column, value in self._filters:
+            if op == "gt" and column == "id":
+                start = bisect.bisect_right(self._db.ids[self._table], value)
+        matched = []
+        for row in rows[start:]:
+            if self._matches(row):
+                matched.append(dict(row))
+                if self._limit and len(matched) == self._limit:
+                    break
+        return _Result(matched)
+
+
+class _Rpc:
+    def __init__(self, db: "_FakeDB", params: dict[str, Any]) -> None:
+        self._db = db
+        self._params = params
+
+    def execute(self) -> _Result:
+        self._db.round_trip()
+        for change in self._params["p_rows"]:
+            row = self._db.find(self._params["p_table"], change["id"])
+            if row is not None:
+                row["current_salience"] = change["current_salience"]
+        return _Result(len(self._params["p_rows"]))
+
+
+class _FakeDB:
+    def __init__(self, rows: list[dict[str, Any]], latency_s: float) -> None:
+        self.tables = {_TABLE: rows, "semantic_fact_salience": []}
+        self.ids = {name: [row["id"] for row in table] for name, table in self.tables.items()}
+        self.latency_s = latency_s
+        self.requests = 0
+
+    def round_trip(self) -> None:
+        self.requests += 1
+        time.sleep(self.latency_s)
+
+    def find(self, table: str, row_id: str) -> dict[str, Any] | None:
+        i = bisect.bisect_left(self.ids[table], row_id)
+        if i < len(self.ids[table]) and self.ids[table][i] == row_id:
+            return self.tables[table][i]
+        return None
+
+    def table(self, name: str) -> _Query:
+        return _Query(self, name)
+
+    def rpc(self, _name: str, params: dict[str, Any]) -> _Rpc:
+        return _Rpc(self, params)
+
+
+def _make_rows(n: int, now: datetime, seed: int = 11) -> list[dict[str, Any]]:
+    """n rows for one user with varied access counts and ages."""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        accessed = now - timedelta(days=rng.uniform(0, 365))
+        rows.append(
+            {
+                "id": f"{i:08d}",
+                "user_id": "user-1",
+                "current_salience": round(rng.uniform(0.01, 1.0), 4),
+                "access_count": rng.randint(0, 12),
+                "last_accessed_at": accessed.isoformat(),
+            }
+        )
+    return rows
+
+
+def _legacy_update(service: SalienceService, db: _FakeDB, user_id: str) -> int:
+    """The pre-batch per-row loop from SalienceService._update_table_salience."""
+    result = (
+        db.table(_TABLE)
+        .select("id, current_salience, access_count, last_accessed_at")
+        .eq("user_id", user_id)
+        .execute()
+    )
+    updated = 0
+    now = datetime.now(UTC)
+    for record in result.data:
+        last_accessed = datetime.fromisoformat(record["last_accessed_at"])
+        days_since = (now - last_accessed).total_seconds() / 86400
+        new_salience = service.calculate_decay(
+            access_count=record["access_count"],
+            days_since_last_access=days_since,
+        )
+        if abs(new_salience - record["current_salience"]) > 0.01:
+            db.table(_TABLE).update({"current_salience": new_salience}).eq(
+                "id", record["id"]
+            ).execute()
+            updated += 1
+    return updated
+
+
+def _values(db: _FakeDB) -> list[float]:
+    return [row["current_salience"] for row in db.tables[_TABLE]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    args = parser.parse_args()
+
+    now = datetime.now(UTC)
+    latency_s = args.latency_ms / 1000.0
+
+    print(f"{'rows':>10}{'mode':>8}{'updated':>10}{'requests':>10}{'seconds':>10}{'match':>8}")
+    for n in args.sizes:
+        rows = _make_rows(n, now)
+
+        batch_db = _FakeDB([dict(r) for r in rows], latency_s)
+        service = SalienceService(db_client=batch_db)
+        start = time.perf_counter()
+        batch_updated = asyncio.run(service.update_all_salience("user-1"))
+        batch_s = time.perf_counter() - start
+
+        match = "-"
+        if n <= args.legacy_max:
+            legacy_db = _FakeDB([dict(r) for r in rows], latency_s)
+            start = time.perf_counter()
+            legacy_updated = _legacy_update(service, legacy_db, "user-1")
+            legacy_s = time.perf_counter() - start
+            same = all(
+                math.isclose(a, b, abs_tol=1e-4)
+                for a, b in zip(_values(legacy_db), _values(batch_db), strict=True)
+            )
+            match = "yes" if same and legacy_updated == batch_updated else "NO"
+            print(
+                f"{n:>10}{'legacy':>8}{legacy_updated:>10}{legacy_db.requests:>10}"
+                f"{legacy_s:>10.2f}{'':>8}"
+            )
+        print(
+            f"{n:>10}{'batch':>8}{batch_updated:>10}{batch_db.requests:>10}"
+            f"{batch_s:>10.2f}{match:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
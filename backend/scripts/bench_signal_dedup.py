@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark: signal clustering, all-pairs Jaccard vs MinHash/LSH.
+
+Generates synthetic market-signal headlines — distinct events per company,
+each reported by several "sources" with reworded headlines — and clusters
+them with:
+
+- legacy: the previous all-pairs loop (word sets rebuilt in the inner loop)
+- lsh:    ``cluster_signals`` (MinHash signatures + banded LSH by company)
+
+When both run, the cluster assignments are compared and must match. The
+legacy loop is quadratic, so it is skipped above ``--legacy-max`` signals.
+
+Usage (from backend/):
+    python -m scripts.bench_signal_dedup [--sizes 10000 100000] [--legacy-max 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# The benchmark never talks to Supabase; satisfy startup validation only.
+for _key in ("SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY", "ANTHROPIC_API_KEY", "APP_SECRET_KEY"):
+    os.environ.setdefault(_key, "http://bench.local" if _key == "SUPABASE_URL" else "bench")
+
+from src.intelligence.signal_deduplication import cluster_signals  # noqa: E402
+
+_VOCAB = [f"w{i}" for i in range(5000)]
+_FILLER = ["the", "a", "of", "to", "in", "for", "on", "with", "and", "reports"]
+
+
+def _make_signals(n: int, seed: int = 7) -> list[dict[str, Any]]:
+    """~n headlines: events of 1-5 reworded reports over n/25 companies."""
+    rng = random.Random(seed)
+    companies = [f"Company {i}" for i in range(max(1, n // 25))]
+    signals: list[dict[str, Any]] = []
+    while len(signals) < n:
+        company = rng.choice(companies)
+        base = rng.sample(_VOCAB, 8) + rng.sample(_FILLER, 3)
+        for _ in range(rng.randint(1, 5)):
+            words = list(base)
+            # Reword: drop/replace a couple of words, sometimes add detail
+            for _ in range(rng.randint(0, 2)):
+                words[rng.randrange(len(words))] = rng.choice(_VOCAB)
+            if rng.random() < 0.3:
+                words += rng.sample(_VOCAB, 2)
+            rng.shuffle(words)
+            signals.append(
+                {
+                    "id": f"sig-{len(signals)}",
+                    "headline": " ".join(words).capitalize(),
+                    "company_name": company,
+                }
+            )
+            if len(signals) >= n:
+                break
+    rng.shuffle(signals)
+    return signals
+
+
+def _legacy_clusters(signals: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """The pre-LSH all-pairs loop from SignalDeduplicator, without DB writes."""
+    clusters: list[list[dict[str, Any]]] = []
+    processed: set[str] = set()
+    for i, sig_a in enumerate(signals):
+        if sig_a["id"] in processed:
+            continue
+        cluster = [sig_a]
+        words_a = set((sig_a.get("headline") or "").lower().split())
+        for j, sig_b in enumerate(signals):
+            if i == j or sig_b["id"] in processed:
+                continue
+            if sig_a.get("company_name") != sig_b.get("company_name"):
+                continue
+            words_b = set((sig_b.get("headline") or "").lower().split())
+            if not words_a or not words_b:
+                continue
+            union = words_a | words_b
+            if len(words_a & words_b) / len(union) >= 0.4:
+                cluster.append(sig_b)
+        if len(cluster) > 1:
+            cluster.sort(key=lambda s: len(s.get("headline") or ""), reverse=True)
+            processed.update(s["id"] for s in cluster)
+            clusters.append(cluster)
+    return clusters
+
+
+def _ids(clusters: list[list[dict[str, Any]]]) -> list[list[str]]:
+    return [[s["id"] for s in c] for c in clusters]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'signals':>10}{'mode':>8}{'clusters':>10}{'seconds':>10}{'match':>8}")
+    for n in args.sizes:
+        signals = _make_signals(n)
+
+        start = time.perf_counter()
+        lsh = cluster_signals(signals)
+        lsh_s = time.perf_counter() - start
+
+        match = "-"
+        if n <= args.legacy_max:
+            start = time.perf_counter()
+            legacy = _legacy_clusters(signals)
+            legacy_s = time.perf_counter() - start
+            match = "yes" if _ids(legacy) == _ids(lsh) else "NO"
+            print(f"{n:>10}{'legacy':>8}{len(legacy):>10}{legacy_s:>10.2f}{'':>8}")
+        print(f"{n:>10}{'lsh':>8}{len(lsh):>10}{lsh_s:>10.2f}{match:>8}")
+
+
+if __name__ == "__main__":
+    main()
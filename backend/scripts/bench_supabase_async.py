@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Benchmark: concurrent chat requests per worker, blocking vs async DB access.
+
+Simulates the DB fan-out of one chat turn (HotContextBuilder's six parallel
+section fetches, then a few sequential writes such as usage tracking) against
+a PostgREST stand-in with fixed round-trip latency. Three access modes are
+compared:
+
+- blocking: sync ``.execute()`` called inline on the event loop (old path)
+- shim:     sync builders awaited through ``execute_async`` (thread offload)
+- native:   async builders from the pooled ``AsyncClient``
+
+No database is needed; latency is injected so the numbers isolate event-loop
+blocking from real network cost.
+
+Usage (from backend/):
+    python -m scripts.bench_supabase_async [--requests 200] [--concurrency 50] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# The simulation never talks to Supabase; satisfy startup validation only.
+for _key in ("SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY", "ANTHROPIC_API_KEY", "APP_SECRET_KEY"):
+    os.environ.setdefault(_key, "http://bench.local" if _key == "SUPABASE_URL" else "bench")
+
+from src.db.supabase import execute_async  # noqa: E402
+
+PARALLEL_READS = 6  # HotContextBuilder sections
+SEQUENTIAL_WRITES = 3  # message persist, usage_tracking RPC, llm_usage insert
+
+
+class _SyncQuery:
+    """Stand-in for a sync supabase-py builder: execute() blocks the thread."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    def execute(self) -> Any:
+        time.sleep(self._latency)
+        return SimpleNamespace(data=[])
+
+
+class _AsyncQuery:
+    """Stand-in for an AsyncClient builder: execute() yields to the loop."""
+
+    def __init__(self, latency: float) -> None:
+        self._latency = latency
+
+    async def execute(self) -> Any:
+        await asyncio.sleep(self._latency)
+        return SimpleNamespace(data=[])
+
+
+async def _run_query(mode: str, latency: float) -> Any:
+    if mode == "blocking":
+        return _SyncQuery(latency).execute()
+    if mode == "shim":
+        return await execute_async(_SyncQuery(latency))
+    return await execute_async(_AsyncQuery(latency))
+
+
+async def _chat_request(mode: str, latency: float) -> None:
+    await asyncio.gather(*(_run_query(mode, latency) for _ in range(PARALLEL_READS)))
+    for _ in range(SEQUENTIAL_WRITES):
+        await _run_query(mode, latency)
+
+
+async def _bench(mode: str, requests: int, concurrency: int, latency: float) -> dict[str, float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    durations: list[float] = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await _chat_request(mode, latency)
+            durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    durations.sort()
+    return {
+        "elapsed_s": elapsed,
+        "req_per_s": requests / elapsed,
+        "p50_ms": durations[len(durations) // 2] * 1000,
+        "p95_ms": durations[int(len(durations) * 0.95) - 1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    print(
+        f"{args.requests} chat requests, concurrency={args.concurrency}, "
+        f"{PARALLEL_READS} parallel reads + {SEQUENTIAL_WRITES} writes @ {args.latency_ms:.0f}ms"
+    )
+    print(f"{'mode':<10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'total s':>10}")
+    for mode in ("blocking", "shim", "native"):
+        stats = asyncio.run(_bench(mode, args.requests, args.concurrency, latency))
+        print(
+            f"{mode:<10}{stats['req_per_s']:>10.1f}{stats['p50_ms']:>10.0f}"
+            f"{stats['p95_ms']:>10.0f}{stats['elapsed_s']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
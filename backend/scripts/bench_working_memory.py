@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark: WorkingMemory token accounting on long sessions.
+
+Builds a session of ``--messages`` messages under a token limit small
+enough that every add truncates, then restores it from its dict form:
+
+- legacy:   the previous implementation (re-tokenize each dropped message
+            and rescan from the front for a non-system message)
+- tiktoken: ``WorkingMemory`` with cached per-message counts
+- estimate: ``WorkingMemory(estimate=True)``, no tokenizer at all
+
+Legacy and tiktoken modes must keep the same messages.
+
+Usage (from backend/):
+    python -m scripts.bench_working_memory [--messages 5000] [--max-tokens 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+# The benchmark never talks to Supabase; satisfy startup validation only.
+for _key in ("SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY", "ANTHROPIC_API_KEY", "APP_SECRET_KEY"):
+    os.environ.setdefault(_key, "http://bench.local" if _key == "SUPABASE_URL" else "bench")
+
+from src.memory.working import WorkingMemory, count_tokens  # noqa: E402
+
+_WORDS = [
+    "pipeline",
+    "renewal",
+    "oncology",
+    "biologics",
+    "deal",
+    "stakeholder",
+    "pricing",
+    "trial",
+    "launch",
+]
+
+
+class _LegacyWorkingMemory:
+    """The pre-change add_message / _truncate_if_needed loop."""
+
+    def __init__(self, max_tokens: int) -> None:
+        self.messages: list[dict[str, Any]] = []
+        self.context_tokens = 0
+        self.max_tokens = max_tokens
+
+    def add_message(self, role: str, content: str) -> None:
+        self.messages.append({"role": role, "content": content})
+        self.context_tokens += count_tokens(content)
+        while self.context_tokens > self.max_tokens and len(self.messages) > 1:
+            for i, msg in enumerate(self.messages):
+                if msg["role"] != "system":
+                    removed_tokens = count_tokens(msg["content"])
+                    self.messages.pop(i)
+                    self.context_tokens -= removed_tokens
+                    break
+            else:
+                break
+
+
+def _make_messages(n: int, seed: int = 3) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    out = [("system", "You are ARIA, a life sciences commercial assistant.")]
+    for i in range(n - 1):
+        role = "user" if i % 2 == 0 else "assistant"
+        out.append((role, " ".join(rng.choice(_WORDS) for _ in range(rng.randint(8, 120)))))
+    return out
+
+
+def _timed(fn: Any) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--max-tokens", type=int, default=20000)
+    parser.add_argument("--system-every", type=int, default=500)
+    args = parser.parse_args()
+
+    messages = _make_messages(args.messages)
+    # Sprinkle system messages through the history so truncation must skip them
+    messages = [
+        ("system", f"Checkpoint {i}.") if i and i % args.system_every == 0 else m
+        for i, m in enumerate(messages)
+    ]
+
+    def fill(memory: Any) -> Any:
+        for role, content in messages:
+            memory.add_message(role, content)
+        return memory
+
+    legacy, legacy_s = _timed(lambda: fill(_LegacyWorkingMemory(args.max_tokens)))
+    cached, cached_s = _timed(
+        lambda: fill(WorkingMemory("conv", "user", max_tokens=args.max_tokens))
+    )
+    estimated, estimate_s = _timed(
+        lambda: fill(WorkingMemory("conv", "user", max_tokens=args.max_tokens, estimate=True))
+    )
+
+    same = [m["content"] for m in legacy.messages] == [m["content"] for m in cached.messages]
+
+    data = cached.to_dict()
+    # Pre-change sessions carry no cached counts; restore them as-is
+    legacy_data = {**data, "messages": [
+        {"role": m["role"], "content": m["content"]} for m in data["messages"]
+    ]}
+    _, restore_s = _timed(lambda: WorkingMemory.from_dict(data))
+    _, restore_uncached_s = _timed(lambda: WorkingMemory.from_dict(legacy_data))
+
+    print(f"{args.messages} messages, max_tokens={args.max_tokens}, kept={len(cached.messages)}")
+    print(f"{'mode':<28}{'seconds':>10}{'per add (us)':>14}")
+    for name, seconds in (
+        ("legacy add+truncate", legacy_s),
+        ("cached add+truncate", cached_s),
+        ("estimate add+truncate", estimate_s),
+    ):
+        print(f"{name:<28}{seconds:>10.3f}{seconds / args.messages * 1e6:>14.1f}")
+    print(f"{'restore (cached counts)':<28}{restore_s:>10.4f}")
+    print(f"{'restore (pre-change dict)':<28}{restore_uncached_s:>10.4f}")
+    print(f"same kept messages as legacy: {'yes' if same else 'NO'}")
+    print(f"estimated tokens kept: {estimated.context_tokens} (tiktoken: {cached.context_tokens})")
+
+
+if __name__ == "__main__":
+    main()
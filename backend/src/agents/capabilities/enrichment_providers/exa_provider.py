@@ -43,9 +43,13 @@ from src.agents.capabilities.enrichment_providers.base import (
 )
 from src.core.config import settings
 from src.core.resilience import exa_circuit_breaker
+from src.core.timing import EXA, httpx_timing_hooks
 
 logger = logging.getLogger(__name__)
 
+# Times every Exa request as an Exa dependency call
+_TIMING_HOOKS = httpx_timing_hooks(EXA)
+
 
 # ---------------------------------------------------------------------------
 # Result Models
@@ -178,6 +182,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
         async with httpx.AsyncClient(
             timeout=30.0,
             headers=self._get_headers(),
+            event_hooks=_TIMING_HOOKS,
         ) as client:
             # Search 1: LinkedIn profile
             linkedin_results = await self._exa_search(
@@ -300,6 +305,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
         async with httpx.AsyncClient(
             timeout=30.0,
             headers=self._get_headers(),
+            event_hooks=_TIMING_HOOKS,
         ) as client:
             # Search 1: Company overview
             overview_results = await self._exa_search(
@@ -429,6 +435,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
         async with httpx.AsyncClient(
             timeout=30.0,
             headers=self._get_headers(),
+            event_hooks=_TIMING_HOOKS,
         ) as client:
             # Search academic sources
             results = await self._exa_search(
@@ -508,6 +515,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=10.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/search",
@@ -553,6 +561,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=5.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/search",
@@ -652,6 +661,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=10.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(f"{self._base_url}/search", json=payload)
                 if resp.status_code != 200:
@@ -738,6 +748,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=30.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(f"{self._base_url}/search", json=payload)
                 if resp.status_code != 200:
@@ -812,6 +823,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=20.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/search",
@@ -891,6 +903,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=20.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/findSimilar",
@@ -949,6 +962,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=30.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/answer",
@@ -1007,6 +1021,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=60.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 # Try the research endpoint
                 resp = await client.post(
@@ -1079,6 +1094,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=30.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/contents",
@@ -1269,6 +1285,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=30.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/websets/v0/websets",
@@ -1334,6 +1351,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=15.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.get(
                     f"{self._base_url}/websets/v0/websets/{webset_id}",
@@ -1400,6 +1418,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=30.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.get(
                     f"{self._base_url}/websets/v0/websets/{webset_id}/items",
@@ -1472,6 +1491,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=30.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/websets/v0/websets/{webset_id}/enrichments",
@@ -1549,6 +1569,7 @@ class ExaEnrichmentProvider(BaseEnrichmentProvider):
             async with httpx.AsyncClient(
                 timeout=15.0,
                 headers=self._get_headers(),
+                event_hooks=_TIMING_HOOKS,
             ) as client:
                 resp = await client.post(
                     f"{self._base_url}/websets/v0/webhooks",
@@ -0,0 +1,479 @@
+"""Process-wide fetch cache for Signal Radar's public data sources.
+
+Every user's radar scan used to download the same RSS feeds and query the
+same FDA / ClinicalTrials.gov / SEC endpoints for the same entity names.
+This module fetches each resource once per TTL and shares it across users:
+
+- RSS feeds are fetched concurrently with conditional GET
+  (``If-None-Match`` / ``If-Modified-Since``) and parsed once into
+  ``FeedItem`` objects; a 304 just extends the cached parse.
+- JSON sources are cached per URL + params, so FDA, trial, and SEC
+  lookups are shared by every user who monitors the same entities (FDA and
+  trial queries are OR-batched over a normalized keyword set). openFDA's
+  404 ("no matches") is cached as an empty result.
+- Concurrent requests for the same key wait on one in-flight fetch, run
+  in its own task so a cancelled caller doesn't cancel it for the others.
+- On a failed refresh the stale entry is served rather than nothing.
+
+``match_rss_items`` matches every user's entity names against all cached
+feed items in one Aho-Corasick pass and returns each user only their hits.
+
+Usage:
+    cache = get_signal_feed_cache()
+    feeds = await cache.get_all_rss_items()
+    hits = match_rss_items(feeds, {user_id: ["pfizer", "moderna"]})
+"""
+
+import asyncio
+import logging
+import time
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from src.utils.aho_corasick import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+_MAX_ITEMS_PER_FEED = 30
+
+
+@dataclass(frozen=True)
+class FeedItem:
+    """One parsed RSS/Atom article."""
+
+    title: str
+    description: str
+    link: str
+    pub_date: str
+    # Lowercased "title description", the text entity names are matched in
+    match_text: str = field(repr=False, compare=False, default="")
+
+
+@dataclass(frozen=True)
+class RssHit:
+    """A feed item that matched one of a user's entity names."""
+
+    feed_name: str
+    item: FeedItem
+    entity_lower: str
+
+
+def _consume_exception(task: "asyncio.Future[Any]") -> None:
+    """Mark a shared fetch's exception as retrieved if every caller went away."""
+    if not task.cancelled():
+        task.exception()
+
+
+@dataclass
+class _Entry:
+    payload: Any
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def parse_feed_items(xml_text: str, feed_name: str) -> list[FeedItem]:
+    """Parse RSS 2.0 or Atom XML into FeedItems (first 30 entries).
+
+    Args:
+        xml_text: Raw feed XML.
+        feed_name: Feed key, for logging.
+
+    Returns:
+        Parsed items; empty if the XML is malformed.
+    """
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        logger.warning("Failed to parse RSS feed: %s", feed_name)
+        return []
+
+    items = root.findall(".//item")  # RSS 2.0
+    if not items:
+        items = root.findall(".//atom:entry", _ATOM_NS)  # Atom
+
+    parsed: list[FeedItem] = []
+    for item in items[:_MAX_ITEMS_PER_FEED]:
+        title_el = item.find("title")
+        if title_el is None:
+            title_el = item.find("atom:title", _ATOM_NS)
+        desc_el = item.find("description")
+        if desc_el is None:
+            desc_el = item.find("atom:summary", _ATOM_NS)
+        link_el = item.find("link")
+        if link_el is None:
+            link_el = item.find("atom:link", _ATOM_NS)
+        pub_el = item.find("pubDate")
+        if pub_el is None:
+            pub_el = item.find("atom:published", _ATOM_NS)
+
+        title = (title_el.text or "") if title_el is not None else ""
+        description = (desc_el.text or "") if desc_el is not None else ""
+        link = ""
+        if link_el is not None:
+            link = link_el.text or link_el.get("href", "") or ""
+        pub_date = (pub_el.text or "") if pub_el is not None else ""
+
+        parsed.append(
+            FeedItem(
+                title=title,
+                description=description,
+                link=link,
+                pub_date=pub_date,
+                match_text=f"{title} {description}".lower(),
+            )
+        )
+    return parsed
+
+
+def match_rss_items(
+    feeds: dict[str, list[FeedItem]],
+    entities_by_user: dict[str, list[str]],
+) -> dict[str, list[RssHit]]:
+    """Match all users' entity names against all feed items in one pass.
+
+    Each item is scanned once by an automaton over the union of every
+    user's names. A user gets at most one hit per item: the first of their
+    own names (in their list order) that occurs in it, which is what a
+    per-user ``name in text`` loop would pick.
+
+    Args:
+        feeds: Feed name -> parsed items.
+        entities_by_user: User ID -> entity names, in priority order.
+
+    Returns:
+        User ID -> hits, in feed then item order. Users without hits are
+        omitted.
+    """
+    # pattern -> [(user_id, rank)]
+    owners: dict[str, list[tuple[str, int]]] = {}
+    for user_id, names in entities_by_user.items():
+        for rank, name in enumerate(names):
+            name_lower = name.lower()
+            if name_lower:
+                owners.setdefault(name_lower, []).append((user_id, rank))
+    if not owners:
+        return {}
+
+    matcher = AhoCorasick(owners)
+    hits: dict[str, list[RssHit]] = {}
+    for feed_name, items in feeds.items():
+        for item in items:
+            found = matcher.find_all(item.match_text)
+            if not found:
+                continue
+            best: dict[str, tuple[int, str]] = {}
+            for pattern in found:
+                for user_id, rank in owners[pattern]:
+                    current = best.get(user_id)
+                    if current is None or rank < current[0]:
+                        best[user_id] = (rank, pattern)
+            for user_id, (_, pattern) in best.items():
+                hits.setdefault(user_id, []).append(RssHit(feed_name, item, pattern))
+    return hits
+
+
+class SignalFeedCache:
+    """TTL cache with conditional GET and single-flight for radar sources."""
+
+    def __init__(
+        self,
+        feed_ttl: float = 600.0,
+        source_ttl: float = 3000.0,
+        max_entries: int = 5000,
+        max_concurrent_fetches: int = 8,
+        user_agent: str = "ARIA-Intelligence/1.0 (support@aria-intel.com)",
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            feed_ttl: Seconds before an RSS feed is revalidated.
+            source_ttl: Seconds before a JSON source response is refetched.
+            max_entries: LRU bound on cached responses.
+            max_concurrent_fetches: Outbound requests in flight at once.
+            user_agent: User-Agent header for all requests.
+        """
+        self._feed_ttl = feed_ttl
+        self._source_ttl = source_ttl
+        self._max_entries = max_entries
+        self._max_concurrent_fetches = max_concurrent_fetches
+        self._user_agent = user_agent
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._fetch_slots: asyncio.Semaphore | None = None
+
+        # Metrics
+        self._hits = 0
+        self._misses = 0
+        self._not_modified = 0
+        self._coalesced = 0
+        self._stale_served = 0
+        self._errors = 0
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=20.0,
+                follow_redirects=True,
+                headers={"User-Agent": self._user_agent},
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    # -- Core ------------------------------------------------------------------
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        loader: Callable[[_Entry | None], Awaitable[_Entry | None]],
+        ttl: float,
+    ) -> Any:
+        """Return the cached payload for ``key``, loading it if stale.
+
+        Args:
+            key: Cache key.
+            loader: Called with the stale entry (or None) and returns a new
+                entry, or None on failure.
+            ttl: Freshness window in seconds.
+
+        Returns:
+            The payload, a stale payload if the refresh failed, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry.fetched_at < ttl:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.payload
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._coalesced += 1
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._fetch(key, entry, loader))
+        task.add_done_callback(_consume_exception)
+        self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch(
+        self,
+        key: Hashable,
+        entry: _Entry | None,
+        loader: Callable[[_Entry | None], Awaitable[_Entry | None]],
+    ) -> Any:
+        this = asyncio.current_task()
+        try:
+            if self._fetch_slots is None:
+                self._fetch_slots = asyncio.Semaphore(self._max_concurrent_fetches)
+            async with self._fetch_slots:
+                try:
+                    fresh = await loader(entry)
+                except Exception as exc:
+                    logger.warning("Signal source fetch failed for %s: %s", key, exc)
+                    fresh = None
+            if fresh is None:
+                self._errors += 1
+                if entry is not None:
+                    self._stale_served += 1
+                return entry.payload if entry is not None else None
+            self._store(key, fresh)
+            return fresh.payload
+        finally:
+            if self._inflight.get(key) is this:
+                del self._inflight[key]
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def _conditional_get(
+        self,
+        url: str,
+        params: dict[str, Any] | None,
+        previous: _Entry | None,
+        parse: Callable[[httpx.Response], Any],
+        empty_statuses: frozenset[int] = frozenset(),
+    ) -> _Entry | None:
+        headers: dict[str, str] = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        resp = await self._get_client().get(url, params=params, headers=headers)
+        now = time.monotonic()
+        if resp.status_code == 304 and previous is not None:
+            self._not_modified += 1
+            return _Entry(previous.payload, now, previous.etag, previous.last_modified)
+        self._misses += 1
+        if resp.status_code in empty_statuses:
+            return _Entry(None, now)
+        if resp.status_code != 200:
+            logger.info("Signal source %s returned %d", url, resp.status_code)
+            return None
+        return _Entry(
+            parse(resp),
+            now,
+            resp.headers.get("etag"),
+            resp.headers.get("last-modified"),
+        )
+
+    # -- Sources ---------------------------------------------------------------
+
+    async def get_rss_items(self, feed_name: str, url: str) -> list[FeedItem]:
+        """Parsed items of one feed, revalidated at most every feed_ttl.
+
+        Args:
+            feed_name: Feed key (e.g. "stat_news").
+            url: Feed URL.
+
+        Returns:
+            Parsed items; empty if the feed has never been fetched successfully.
+        """
+
+        async def load(previous: _Entry | None) -> _Entry | None:
+            return await self._conditional_get(
+                url, None, previous, lambda r: parse_feed_items(r.text, feed_name)
+            )
+
+        items = await self.get_or_fetch(("rss", url), load, self._feed_ttl)
+        return items or []
+
+    async def get_all_rss_items(
+        self, feeds: dict[str, str] | None = None
+    ) -> dict[str, list[FeedItem]]:
+        """Fetch (or reuse) every feed concurrently.
+
+        Args:
+            feeds: Feed name -> URL. Defaults to Signal Radar's RSS_FEEDS.
+
+        Returns:
+            Feed name -> parsed items.
+        """
+        if feeds is None:
+            from src.agents.capabilities.signal_radar import RSS_FEEDS
+
+            feeds = RSS_FEEDS
+        names = list(feeds)
+        results = await asyncio.gather(
+            *(self.get_rss_items(name, feeds[name]) for name in names),
+            return_exceptions=True,
+        )
+        out: dict[str, list[FeedItem]] = {}
+        for name, result in zip(names, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("RSS feed %s failed: %s", name, result)
+                continue
+            out[name] = result
+        return out
+
+    async def get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        *,
+        ttl: float | None = None,
+        empty_statuses: frozenset[int] = frozenset(),
+    ) -> Any:
+        """Cached JSON GET keyed by URL and params.
+
+        Args:
+            url: Endpoint URL.
+            params: Query parameters (part of the cache key).
+            ttl: Freshness window; defaults to source_ttl.
+            empty_statuses: Statuses cached as a None payload instead of
+                treated as errors (e.g. openFDA's 404 for no matches).
+
+        Returns:
+            Decoded JSON, or None if unavailable or an empty status.
+        """
+        key = ("json", url, tuple(sorted((params or {}).items())))
+
+        async def load(previous: _Entry | None) -> _Entry | None:
+            return await self._conditional_get(
+                url, params, previous, lambda r: r.json(), empty_statuses
+            )
+
+        return await self.get_or_fetch(key, load, self._source_ttl if ttl is None else ttl)
+
+    async def get_cached(
+        self,
+        key: Hashable,
+        fetch: Callable[[httpx.AsyncClient], Awaitable[Any]],
+        *,
+        ttl: float | None = None,
+    ) -> Any:
+        """Cache an arbitrary fetch (e.g. one with a non-HTTP fallback).
+
+        Args:
+            key: Cache key.
+            fetch: Called with the shared client; returns the payload, or
+                None on failure (not cached).
+            ttl: Freshness window; defaults to source_ttl.
+
+        Returns:
+            The payload, a stale payload if the refresh failed, or None.
+        """
+
+        async def load(_previous: _Entry | None) -> _Entry | None:
+            payload = await fetch(self._get_client())
+            if payload is None:
+                return None
+            self._misses += 1
+            return _Entry(payload, time.monotonic())
+
+        return await self.get_or_fetch(key, load, self._source_ttl if ttl is None else ttl)
+
+    def stats(self) -> dict[str, Any]:
+        """Cache effectiveness counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "not_modified": self._not_modified,
+            "coalesced": self._coalesced,
+            "stale_served": self._stale_served,
+            "errors": self._errors,
+        }
+
+
+# Singleton instance
+_signal_feed_cache: SignalFeedCache | None = None
+
+
+def get_signal_feed_cache() -> SignalFeedCache:
+    """Get or create the shared Signal Radar fetch cache.
+
+    Returns:
+        The process-wide SignalFeedCache instance.
+    """
+    global _signal_feed_cache
+    if _signal_feed_cache is None:
+        from src.core.config import settings
+
+        _signal_feed_cache = SignalFeedCache(
+            feed_ttl=settings.SIGNAL_FEED_CACHE_TTL_SECONDS,
+            source_ttl=settings.SIGNAL_SOURCE_CACHE_TTL_SECONDS,
+            max_entries=settings.SIGNAL_SOURCE_CACHE_MAX_ENTRIES,
+        )
+    return _signal_feed_cache
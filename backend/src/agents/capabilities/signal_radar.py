@@ -14,7 +14,9 @@ Data sources:
 
 Per-user monitoring is configured via the ``monitored_entities`` table.
 The capability is designed to run on an hourly cron during business hours
-via the SyncScheduler.
+via the SyncScheduler. RSS feeds and the FDA, ClinicalTrials.gov and SEC
+lookups go through the process-wide ``SignalFeedCache``, so users watching
+the same entities share one fetch per interval.
 """
 
 import asyncio
@@ -32,6 +34,12 @@ from urllib.parse import urlencode
 from pydantic import BaseModel, Field
 
 from src.agents.capabilities.base import BaseCapability, CapabilityResult
+from src.agents.capabilities.signal_feed_cache import (
+    RssHit,
+    get_signal_feed_cache,
+    match_rss_items,
+    parse_feed_items,
+)
 from src.core.llm import LLMClient
 from src.core.task_types import TaskType
 from src.db.supabase import SupabaseClient
@@ -62,10 +70,16 @@ FDA_WARNING_LETTERS_URL = "https://api.fda.gov/drug/enforcement.json"
 FDA_DEVICE_APPROVALS_URL = "https://api.fda.gov/device/510k.json"
 CLINICAL_TRIALS_URL = "https://clinicaltrials.gov/api/v2/studies"
 SEC_EDGAR_SUBMISSIONS_URL = "https://data.sec.gov/submissions"
+SEC_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
 # NOTE: The old developer.uspto.gov IBD API was retired in 2025.
 # Patent search now uses Google Patents as primary source.
 GOOGLE_PATENTS_XHR_URL = "https://patents.google.com/xhr/query"
 
+# openFDA answers 404 when a search has no matches; cache that as "empty"
+_OPENFDA_NO_MATCH = frozenset({404})
+# The ~1MB SEC ticker index changes rarely; refresh it daily
+_SEC_TICKERS_TTL_SECONDS = 86400.0
+
 # ── Wire service URLs ──────────────────────────────────────────────────
 PR_NEWSWIRE_SEARCH_URL = "https://www.prnewswire.com/search/news/"
 GLOBENEWSWIRE_SEARCH_URL = "https://www.globenewswire.com/search"
@@ -153,6 +167,23 @@ BIOPROCESS_KEYWORDS: set[str] = {
 }
 
 
+def _query_keywords(keywords: list[str], limit: int = 10) -> list[str]:
+    """Normalize the first ``limit`` distinct keywords for one OR query.
+
+    Keywords are stripped, lowercased, deduped and sorted, so users
+    monitoring the same set (in any order or casing) build the same query
+    and share its cached response.
+    """
+    unique: list[str] = []
+    for keyword in keywords:
+        keyword = keyword.strip().lower()
+        if keyword and keyword not in unique:
+            unique.append(keyword)
+            if len(unique) == limit:
+                break
+    return sorted(unique)
+
+
 # ── Domain models ──────────────────────────────────────────────────────
 
 
@@ -353,7 +384,12 @@ class SignalRadarCapability(BaseCapability):
 
     # ── Public methods ───────────────────────────────────────────────
 
-    async def scan_all_sources(self, user_id: str) -> list[Signal]:
+    async def scan_all_sources(
+        self,
+        user_id: str,
+        entities: list[dict[str, Any]] | None = None,
+        rss_hits: list[RssHit] | None = None,
+    ) -> list[Signal]:
         """Aggregate signals from all configured sources for a user.
 
         Reads the user's ``monitored_entities`` to determine which
@@ -362,13 +398,17 @@ class SignalRadarCapability(BaseCapability):
 
         Args:
             user_id: Authenticated user UUID.
+            entities: Pre-loaded monitored entities (loaded if None).
+            rss_hits: Pre-matched RSS hits from a cross-user pass
+                (matched here if None).
 
         Returns:
             Deduplicated list of Signal objects from all sources.
         """
         import asyncio
 
-        entities = await self._get_monitored_entities(user_id)
+        if entities is None:
+            entities = await self._get_monitored_entities(user_id)
         if not entities:
             logger.info("No monitored entities for user %s", user_id)
             return []
@@ -379,7 +419,7 @@ class SignalRadarCapability(BaseCapability):
 
         # Fan out to all sources in parallel
         results = await asyncio.gather(
-            self._scan_rss_feeds(entities),
+            self._scan_rss_feeds(entities, rss_hits),
             self._scan_fda(keywords + topic_names),
             self._scan_clinical_trials(keywords + topic_names),
             self._scan_sec_edgar(company_names),
@@ -789,39 +829,30 @@ class SignalRadarCapability(BaseCapability):
 
     # ── Source scanners (private) ────────────────────────────────────
 
-    async def _scan_rss_feeds(self, entities: list[dict[str, Any]]) -> list[Signal]:
+    async def _scan_rss_feeds(
+        self,
+        entities: list[dict[str, Any]],
+        rss_hits: list[RssHit] | None = None,
+    ) -> list[Signal]:
         """Scan life sciences RSS feeds for signals matching entities.
 
-        Parses RSS/Atom feeds from 8 industry publications and matches
-        articles against monitored entity names.
+        Feeds from 8 industry publications come from the shared feed
+        cache; articles are matched against monitored entity names.
 
         Args:
             entities: List of monitored entity dicts from Supabase.
+            rss_hits: Hits already matched for this user by the cron's
+                cross-user pass. Matched here when None.
 
         Returns:
             List of Signal objects from RSS matches.
         """
-        import httpx
+        if rss_hits is None:
+            feeds = await get_signal_feed_cache().get_all_rss_items()
+            entity_names = [e["entity_name"] for e in entities]
+            rss_hits = match_rss_items(feeds, {"": entity_names}).get("", [])
 
-        signals: list[Signal] = []
-        entity_names_lower = [e["entity_name"].lower() for e in entities]
-
-        async with httpx.AsyncClient(
-            timeout=15.0,
-            follow_redirects=True,
-            headers={"User-Agent": DEFAULT_USER_AGENT},
-        ) as client:
-            for feed_name, feed_url in RSS_FEEDS.items():
-                try:
-                    resp = await client.get(feed_url)
-                    if resp.status_code != 200:
-                        continue
-                    feed_signals = self._parse_rss_feed(resp.text, feed_name, entity_names_lower)
-                    signals.extend(feed_signals)
-                except httpx.HTTPError as exc:
-                    logger.warning("RSS feed %s failed: %s", feed_name, exc)
-
-        return signals
+        return [self._rss_hit_to_signal(hit) for hit in rss_hits]
 
     async def _scan_fda(self, keywords: list[str]) -> list[Signal]:
         """Scan FDA openFDA APIs for drug approvals and warning letters.
@@ -839,35 +870,31 @@ class SignalRadarCapability(BaseCapability):
         """
         import asyncio
 
-        import httpx
-
         signals: list[Signal] = []
-        search_term = " OR ".join(f'"{kw}"' for kw in keywords[:10])
+        terms = _query_keywords(keywords)
+        if not terms:
+            return signals
+        search_term = " OR ".join(f'"{kw}"' for kw in terms)
 
-        async with httpx.AsyncClient(
-            timeout=20.0,
-            headers={"User-Agent": DEFAULT_USER_AGENT},
-        ) as client:
-            tasks = [
-                self._fetch_fda_approvals(client, search_term),
-                self._fetch_fda_enforcement(client, search_term),
-                self._fetch_fda_devices(client, search_term),
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        tasks = [
+            self._fetch_fda_approvals(search_term),
+            self._fetch_fda_enforcement(search_term),
+            self._fetch_fda_devices(search_term),
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            for result in results:
-                if isinstance(result, BaseException):
-                    logger.warning("FDA sub-scan failed: %s", result)
-                    continue
-                signals.extend(result)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning("FDA sub-scan failed: %s", result)
+                continue
+            signals.extend(result)
 
         return signals
 
-    async def _fetch_fda_approvals(self, client: Any, search_term: str) -> list[Signal]:
+    async def _fetch_fda_approvals(self, search_term: str) -> list[Signal]:
         """Fetch recent drug approvals from openFDA.
 
         Args:
-            client: httpx.AsyncClient instance.
             search_term: openFDA search query string.
 
         Returns:
@@ -875,18 +902,18 @@ class SignalRadarCapability(BaseCapability):
         """
         signals: list[Signal] = []
         try:
-            resp = await client.get(
+            data = await get_signal_feed_cache().get_json(
                 FDA_DRUG_APPROVALS_URL,
                 params={
                     "search": f"openfda.brand_name:{search_term}",
                     "limit": "20",
                     "sort": "submissions.submission_status_date:desc",
                 },
+                empty_statuses=_OPENFDA_NO_MATCH,
             )
-            if resp.status_code != 200:
+            if not data:
                 return signals
 
-            data = resp.json()
             for result in data.get("results", []):
                 brand_names = result.get("openfda", {}).get("brand_name", [])
                 manufacturer = (
@@ -928,11 +955,10 @@ class SignalRadarCapability(BaseCapability):
 
         return signals
 
-    async def _fetch_fda_enforcement(self, client: Any, search_term: str) -> list[Signal]:
+    async def _fetch_fda_enforcement(self, search_term: str) -> list[Signal]:
         """Fetch FDA enforcement actions (recalls, warning letters).
 
         Args:
-            client: httpx.AsyncClient instance.
             search_term: openFDA search query string.
 
         Returns:
@@ -940,18 +966,18 @@ class SignalRadarCapability(BaseCapability):
         """
         signals: list[Signal] = []
         try:
-            resp = await client.get(
+            data = await get_signal_feed_cache().get_json(
                 FDA_WARNING_LETTERS_URL,
                 params={
                     "search": f"recalling_firm:{search_term}",
                     "limit": "20",
                     "sort": "report_date:desc",
                 },
+                empty_statuses=_OPENFDA_NO_MATCH,
             )
-            if resp.status_code != 200:
+            if not data:
                 return signals
 
-            data = resp.json()
             for result in data.get("results", []):
                 firm = result.get("recalling_firm", "Unknown")
                 signals.append(
@@ -979,11 +1005,10 @@ class SignalRadarCapability(BaseCapability):
 
         return signals
 
-    async def _fetch_fda_devices(self, client: Any, search_term: str) -> list[Signal]:
+    async def _fetch_fda_devices(self, search_term: str) -> list[Signal]:
         """Fetch FDA 510(k) device clearances.
 
         Args:
-            client: httpx.AsyncClient instance.
             search_term: openFDA search query string.
 
         Returns:
@@ -991,18 +1016,18 @@ class SignalRadarCapability(BaseCapability):
         """
         signals: list[Signal] = []
         try:
-            resp = await client.get(
+            data = await get_signal_feed_cache().get_json(
                 FDA_DEVICE_APPROVALS_URL,
                 params={
                     "search": f"applicant:{search_term}",
                     "limit": "20",
                     "sort": "decision_date:desc",
                 },
+                empty_statuses=_OPENFDA_NO_MATCH,
             )
-            if resp.status_code != 200:
+            if not data:
                 return signals
 
-            data = resp.json()
             for result in data.get("results", []):
                 applicant = result.get("applicant", "Unknown")
                 device_name = result.get("device_name", "Unknown device")
@@ -1047,60 +1072,20 @@ class SignalRadarCapability(BaseCapability):
         Returns:
             List of Signal objects from clinical trial matches.
         """
-        import httpx
-
         signals: list[Signal] = []
-        search_term = " OR ".join(keywords[:10])
-        params: dict[str, Any] = {
-            "query.term": search_term,
-            "pageSize": 20,
-            "sort": "LastUpdatePostDate:desc",
-            "format": "json",
-        }
-
-        data: dict[str, Any] | None = None
-        try:
-            async with httpx.AsyncClient(
-                timeout=20.0,
-                headers={"User-Agent": DEFAULT_USER_AGENT},
-            ) as client:
-                resp = await client.get(CLINICAL_TRIALS_URL, params=params)
-                if resp.status_code == 200:
-                    data = resp.json()
-                else:
-                    logger.info(
-                        "ClinicalTrials.gov httpx returned %d, trying curl",
-                        resp.status_code,
-                    )
-        except httpx.HTTPError as exc:
-            logger.info("ClinicalTrials.gov httpx failed (%s), trying curl", exc)
-
-        # Curl fallback - CT.gov blocks some HTTP clients via TLS fingerprinting
-        if data is None:
-            try:
-                url = f"{CLINICAL_TRIALS_URL}?{urlencode(params, doseq=True)}"
-                proc = await asyncio.to_thread(
-                    subprocess.run,
-                    ["curl", "-s", "-f", "--max-time", "30", url],
-                    capture_output=True,
-                    text=True,
-                    timeout=35,
-                )
-                if proc.returncode == 0:
-                    data = json.loads(proc.stdout)
-                else:
-                    logger.warning(
-                        "ClinicalTrials.gov curl fallback failed (exit %d)",
-                        proc.returncode,
-                    )
-            except Exception as curl_exc:
-                logger.warning("ClinicalTrials.gov curl fallback error: %s", curl_exc)
+        terms = _query_keywords(keywords)
+        if not terms:
+            return signals
+        search_term = " OR ".join(terms)
 
+        data = await get_signal_feed_cache().get_cached(
+            ("clinical_trials", search_term),
+            lambda client: self._fetch_clinical_trials(client, search_term),
+        )
         if data is None:
             return signals
 
-        studies = data.get("studies", [])
-        for study in studies:
+        for study in data.get("studies", []):
             protocol = study.get("protocolSection", {})
             ident = protocol.get("identificationModule", {})
             status_mod = protocol.get("statusModule", {})
@@ -1136,6 +1121,58 @@ class SignalRadarCapability(BaseCapability):
 
         return signals
 
+    async def _fetch_clinical_trials(self, client: Any, search_term: str) -> dict[str, Any] | None:
+        """Query ClinicalTrials.gov, falling back to curl.
+
+        CT.gov blocks some HTTP clients via TLS fingerprinting, so a
+        non-200 or transport error retries the request with curl.
+
+        Args:
+            client: Shared httpx.AsyncClient from the feed cache.
+            search_term: ``query.term`` value (keywords joined with OR).
+
+        Returns:
+            Decoded response, or None if both attempts failed.
+        """
+        import httpx
+
+        params: dict[str, Any] = {
+            "query.term": search_term,
+            "pageSize": 20,
+            "sort": "LastUpdatePostDate:desc",
+            "format": "json",
+        }
+
+        try:
+            resp = await client.get(CLINICAL_TRIALS_URL, params=params)
+            if resp.status_code == 200:
+                return resp.json()
+            logger.info(
+                "ClinicalTrials.gov httpx returned %d, trying curl",
+                resp.status_code,
+            )
+        except httpx.HTTPError as exc:
+            logger.info("ClinicalTrials.gov httpx failed (%s), trying curl", exc)
+
+        try:
+            url = f"{CLINICAL_TRIALS_URL}?{urlencode(params, doseq=True)}"
+            proc = await asyncio.to_thread(
+                subprocess.run,
+                ["curl", "-s", "-f", "--max-time", "30", url],
+                capture_output=True,
+                text=True,
+                timeout=35,
+            )
+            if proc.returncode == 0:
+                return json.loads(proc.stdout)
+            logger.warning(
+                "ClinicalTrials.gov curl fallback failed (exit %d)",
+                proc.returncode,
+            )
+        except Exception as curl_exc:
+            logger.warning("ClinicalTrials.gov curl fallback error: %s", curl_exc)
+        return None
+
     async def _scan_sec_edgar(self, company_names: list[str]) -> list[Signal]:
         """Scan SEC EDGAR for new filings from monitored companies.
 
@@ -1148,89 +1185,64 @@ class SignalRadarCapability(BaseCapability):
         Returns:
             List of Signal objects from SEC filing matches.
         """
-        import httpx
-
         signals: list[Signal] = []
+        cache = get_signal_feed_cache()
 
-        async with httpx.AsyncClient(
-            timeout=20.0,
-            headers={
-                "User-Agent": DEFAULT_USER_AGENT,
-                "Accept": "application/json",
-            },
-        ) as client:
-            # Search via the company tickers lookup
-            try:
-                resp = await client.get(
-                    "https://www.sec.gov/files/company_tickers.json",
-                )
-                if resp.status_code != 200:
-                    return signals
-                tickers_data = resp.json()
-            except httpx.HTTPError as exc:
-                logger.warning("SEC tickers lookup failed: %s", exc)
-                return signals
+        # Search via the company tickers lookup
+        tickers_data = await cache.get_json(SEC_COMPANY_TICKERS_URL, ttl=_SEC_TICKERS_TTL_SECONDS)
+        if not tickers_data:
+            return signals
 
-            for company in company_names[:10]:
-                company_lower = company.lower()
-                cik = None
-                for entry in tickers_data.values():
-                    if company_lower in str(entry.get("title", "")).lower():
-                        cik = str(entry.get("cik_str", "")).zfill(10)
-                        break
-
-                if not cik:
-                    continue
+        for company in company_names[:10]:
+            company_lower = company.lower()
+            cik = None
+            for entry in tickers_data.values():
+                if company_lower in str(entry.get("title", "")).lower():
+                    cik = str(entry.get("cik_str", "")).zfill(10)
+                    break
 
-                try:
-                    resp = await client.get(
-                        f"{SEC_EDGAR_SUBMISSIONS_URL}/CIK{cik}.json",
-                    )
-                    if resp.status_code != 200:
-                        continue
+            if not cik:
+                continue
 
-                    data = resp.json()
-                    company_name = data.get("name", company)
-                    recent = data.get("filings", {}).get("recent", {})
-                    forms = recent.get("form", [])
-                    dates = recent.get("filingDate", [])
-                    accessions = recent.get("accessionNumber", [])
-                    descriptions = recent.get("primaryDocDescription", [])
-
-                    target_forms = {"10-K", "10-Q", "8-K", "S-1", "6-K"}
-                    for i, form in enumerate(forms[:20]):
-                        if form not in target_forms:
-                            continue
-                        accession = accessions[i] if i < len(accessions) else ""
-                        accession_path = accession.replace("-", "")
-
-                        signals.append(
-                            Signal(
-                                company_name=company_name,
-                                signal_type="sec_filing",
-                                headline=(
-                                    f"SEC {form}: {company_name} "
-                                    f"({dates[i] if i < len(dates) else ''})"
-                                ),
-                                summary=(
-                                    descriptions[i] if i < len(descriptions) else f"{form} filing"
-                                ),
-                                source_url=(
-                                    f"https://www.sec.gov/Archives/"
-                                    f"edgar/data/{cik}/{accession_path}/"
-                                ),
-                                source_name="SEC EDGAR",
-                                metadata={
-                                    "form_type": form,
-                                    "cik": cik,
-                                    "accession_number": accession,
-                                    "filed_date": (dates[i] if i < len(dates) else ""),
-                                },
-                            )
-                        )
+            data = await cache.get_json(f"{SEC_EDGAR_SUBMISSIONS_URL}/CIK{cik}.json")
+            if not data:
+                continue
 
-                except httpx.HTTPError as exc:
-                    logger.warning("SEC EDGAR scan for %s failed: %s", company, exc)
+            company_name = data.get("name", company)
+            recent = data.get("filings", {}).get("recent", {})
+            forms = recent.get("form", [])
+            dates = recent.get("filingDate", [])
+            accessions = recent.get("accessionNumber", [])
+            descriptions = recent.get("primaryDocDescription", [])
+
+            target_forms = {"10-K", "10-Q", "8-K", "S-1", "6-K"}
+            for i, form in enumerate(forms[:20]):
+                if form not in target_forms:
+                    continue
+                accession = accessions[i] if i < len(accessions) else ""
+                accession_path = accession.replace("-", "")
+
+                signals.append(
+                    Signal(
+                        company_name=company_name,
+                        signal_type="sec_filing",
+                        headline=(
+                            f"SEC {form}: {company_name} "
+                            f"({dates[i] if i < len(dates) else ''})"
+                        ),
+                        summary=(descriptions[i] if i < len(descriptions) else f"{form} filing"),
+                        source_url=(
+                            f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession_path}/"
+                        ),
+                        source_name="SEC EDGAR",
+                        metadata={
+                            "form_type": form,
+                            "cik": cik,
+                            "accession_number": accession,
+                            "filed_date": (dates[i] if i < len(dates) else ""),
+                        },
+                    )
+                )
 
         return signals
 
@@ -1632,7 +1644,6 @@ class SignalRadarCapability(BaseCapability):
     ) -> list[Signal]:
         """Parse RSS/Atom XML and extract matching signals.
 
-        Uses a lightweight XML parser to avoid heavy dependencies.
         Matches articles whose title or description contain any
         monitored entity name.
 
@@ -1644,73 +1655,32 @@ class SignalRadarCapability(BaseCapability):
         Returns:
             List of Signal objects matching entities.
         """
-        import xml.etree.ElementTree as ET
-
-        signals: list[Signal] = []
+        items = parse_feed_items(xml_text, feed_name)
+        hits = match_rss_items({feed_name: items}, {"": entity_names_lower}).get("", [])
+        return [self._rss_hit_to_signal(hit) for hit in hits]
 
-        try:
-            root = ET.fromstring(xml_text)
-        except ET.ParseError:
-            logger.warning("Failed to parse RSS feed: %s", feed_name)
-            return signals
+    def _rss_hit_to_signal(self, hit: RssHit) -> Signal:
+        """Build a Signal from a matched feed item.
 
-        # Handle both RSS 2.0 and Atom
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        items = root.findall(".//item")  # RSS 2.0
-        if not items:
-            items = root.findall(".//atom:entry", ns)  # Atom
-
-        for item in items[:30]:
-            # RSS 2.0 fields
-            title_el = item.find("title")
-            if title_el is None:
-                title_el = item.find("atom:title", ns)
-            desc_el = item.find("description")
-            if desc_el is None:
-                desc_el = item.find("atom:summary", ns)
-            link_el = item.find("link")
-            if link_el is None:
-                link_el = item.find("atom:link", ns)
-            pub_el = item.find("pubDate")
-            if pub_el is None:
-                pub_el = item.find("atom:published", ns)
-
-            title = (title_el.text or "") if title_el is not None else ""
-            description = (desc_el.text or "") if desc_el is not None else ""
-            link = ""
-            if link_el is not None:
-                link = link_el.text or link_el.get("href", "") or ""
-            pub_date = (pub_el.text or "") if pub_el is not None else ""
-
-            # Match against entities
-            combined = f"{title} {description}".lower()
-            matched_entity = ""
-            for entity in entity_names_lower:
-                if entity in combined:
-                    matched_entity = entity
-                    break
-
-            if not matched_entity:
-                continue
-
-            signal_type = self._classify_headline(title)
-
-            signals.append(
-                Signal(
-                    company_name=matched_entity.title(),
-                    signal_type=signal_type,
-                    headline=title[:300],
-                    summary=self._strip_html_tags(description)[:500],
-                    source_url=link,
-                    source_name=feed_name.replace("_", " ").title(),
-                    metadata={
-                        "feed": feed_name,
-                        "published": pub_date,
-                    },
-                )
-            )
+        Args:
+            hit: Feed item matched against one of the user's entities.
 
-        return signals
+        Returns:
+            Signal attributed to the matched entity.
+        """
+        item = hit.item
+        return Signal(
+            company_name=hit.entity_lower.title(),
+            signal_type=self._classify_headline(item.title),
+            headline=item.title[:300],
+            summary=self._strip_html_tags(item.description)[:500],
+            source_url=item.link,
+            source_name=hit.feed_name.replace("_", " ").title(),
+            metadata={
+                "feed": hit.feed_name,
+                "published": item.pub_date,
+            },
+        )
 
     def _parse_wire_html(self, html: str, company: str, source: str) -> list[Signal]:
         """Parse wire service HTML into Signal objects.
@@ -2095,7 +2065,23 @@ Respond with JSON:
 # ── Scheduler helper ───────────────────────────────────────────────────
 
 
-async def run_signal_radar_scan(user_id: str) -> dict[str, Any]:
+def _build_radar_capability(user_id: str) -> SignalRadarCapability:
+    """Create a throwaway SignalRadarCapability for a scheduled scan."""
+    from src.agents.capabilities.base import UserContext
+
+    return SignalRadarCapability(
+        supabase_client=SupabaseClient.get_client(),
+        memory_service=None,
+        knowledge_graph=None,
+        user_context=UserContext(user_id=user_id),
+    )
+
+
+async def run_signal_radar_scan(
+    user_id: str,
+    entities: list[dict[str, Any]] | None = None,
+    rss_hits: list[RssHit] | None = None,
+) -> dict[str, Any]:
     """Run a full signal radar scan for a single user.
 
     This is the entry point for the SyncScheduler cron. It creates a
@@ -2103,22 +2089,15 @@ async def run_signal_radar_scan(user_id: str) -> dict[str, Any]:
 
     Args:
         user_id: User UUID to scan for.
+        entities: Pre-loaded monitored entities (loaded if None).
+        rss_hits: Pre-matched RSS hits for this user (matched if None).
 
     Returns:
         Summary dict with scan results.
     """
-    from src.agents.capabilities.base import UserContext
+    capability = _build_radar_capability(user_id)
 
-    client = SupabaseClient.get_client()
-
-    capability = SignalRadarCapability(
-        supabase_client=client,
-        memory_service=None,
-        knowledge_graph=None,
-        user_context=UserContext(user_id=user_id),
-    )
-
-    signals = await capability.scan_all_sources(user_id)
+    signals = await capability.scan_all_sources(user_id, entities=entities, rss_hits=rss_hits)
 
     # Run implication detection on top signals
     implication_triggers_total = 0
@@ -2153,7 +2132,9 @@ async def run_signal_radar_cron() -> None:
     """Cron entry point: scan all users with active monitored entities.
 
     Designed to be called hourly during business hours (8am-8pm)
-    by the SyncScheduler.
+    by the SyncScheduler. Loads every user's entities first, then fetches
+    the RSS feeds once and matches all users' entity names in a single
+    pass, handing each user scan only its own hits.
     """
     import asyncio
 
@@ -2176,10 +2157,40 @@ async def run_signal_radar_cron() -> None:
     # Process users in parallel (max 5 concurrent)
     semaphore = asyncio.Semaphore(5)
 
+    async def _load_entities(uid: str) -> list[dict[str, Any]] | None:
+        async with semaphore:
+            try:
+                return await _build_radar_capability(uid)._get_monitored_entities(uid)
+            except Exception as exc:
+                logger.warning("Failed to load monitored entities for %s: %s", uid, exc)
+                return None
+
+    loaded = await asyncio.gather(*[_load_entities(uid) for uid in user_ids])
+    entities_by_user = {
+        uid: entities for uid, entities in zip(user_ids, loaded, strict=True) if entities is not None
+    }
+
+    rss_hits_by_user: dict[str, list[RssHit]] | None = None
+    try:
+        feeds = await get_signal_feed_cache().get_all_rss_items()
+        rss_hits_by_user = match_rss_items(
+            feeds,
+            {
+                uid: [e["entity_name"] for e in entities]
+                for uid, entities in entities_by_user.items()
+            },
+        )
+    except Exception as exc:
+        logger.warning("Shared RSS match failed, users will match individually: %s", exc)
+
     async def _scan_with_limit(uid: str) -> dict[str, Any] | None:
+        entities = entities_by_user.get(uid)
+        rss_hits = None
+        if entities is not None and rss_hits_by_user is not None:
+            rss_hits = rss_hits_by_user.get(uid, [])
         async with semaphore:
             try:
-                return await run_signal_radar_scan(uid)
+                return await run_signal_radar_scan(uid, entities=entities, rss_hits=rss_hits)
             except Exception as exc:
                 logger.error(
                     "Signal radar scan failed for user %s: %s",
@@ -2198,4 +2209,5 @@ async def run_signal_radar_cron() -> None:
         "Signal radar cron complete: %d/%d users scanned",
         successes,
         len(user_ids),
+        extra={"feed_cache": get_signal_feed_cache().stats()},
     )
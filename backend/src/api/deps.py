@@ -3,7 +3,7 @@
 import logging
 from typing import TYPE_CHECKING, Annotated, Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.core.exceptions import AuthenticationError, AuthorizationError
@@ -107,11 +107,16 @@ def require_role(required_roles: list[str]) -> Any:
     """
 
     async def role_checker(
+        request: Request,
         current_user: Annotated[Any, Depends(get_current_user)],
     ) -> Any:
         """Check if user has required role.
 
+        Marks admin requests (``request.state.is_admin``) so the timing
+        middleware may send them the ``Server-Timing`` breakdown.
+
         Args:
+            request: The incoming request.
             current_user: The authenticated user.
 
         Returns:
@@ -128,6 +133,8 @@ def require_role(required_roles: list[str]) -> Any:
             if user_role not in required_roles:
                 raise AuthorizationError("Insufficient permissions for this action")
 
+            if user_role == "admin":
+                request.state.is_admin = True
             return current_user
 
         except AuthorizationError as e:
@@ -94,7 +94,8 @@ async def poll_activity(
 ) -> dict[str, Any]:
     """Poll for new activities since a timestamp.
 
-    Lightweight endpoint designed for frequent polling (every ~10s).
+    Fallback for clients without a WebSocket connection, which otherwise
+    receive new activities as ``activity.new`` events.
 
     Args:
         current_user: Authenticated user.
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import APIRouter, Query, Request, status
-from fastapi.responses import StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, EmailStr, Field
 
 from src.api.deps import AdminUser, CurrentUser
@@ -881,17 +881,63 @@ async def run_ambient_gaps(
 async def get_perf_stats(
     _current_user: AdminUser,
 ) -> dict[str, Any]:
-    """Return p50/p95/p99 response times by endpoint for the last 1000 requests.
+    """Return p50/p95/p99 response times by route template and dependency.
 
     Args:
         _current_user: Authenticated admin user.
 
     Returns:
-        Performance summary with global and per-endpoint percentiles.
+        Performance summary with global, per-endpoint and per-dependency
+        percentiles over the recent window, plus
+        usage write-behind buffer queue depth and flush latency,
+        per-endpoint rate limit rejections, per-region cache stats,
+        Graphiti episode queue throughput, lag and backlog, and periodic
+        email check scan latency with the slowest users.
     """
+    from src.core.cache import get_cache
+    from src.core.rate_limiter import _global_tracker
+    from src.core.usage_writer import get_usage_write_buffer
+    from src.db.graphiti_queue import get_episode_write_queue
+    from src.jobs.periodic_email_check import get_email_check_latency
     from src.middleware.performance import perf_stats
 
-    return perf_stats.summarize()
+    summary = perf_stats.summarize()
+    summary["usage_write_buffer"] = get_usage_write_buffer().stats()
+    summary["rate_limits"] = _global_tracker.stats()
+    summary["cache"] = get_cache().get_stats()
+    summary["email_check"] = get_email_check_latency().stats()
+
+    episode_queue = get_episode_write_queue()
+    summary["graphiti_queue"] = episode_queue.stats()
+    if episode_queue.is_running:
+        try:
+            summary["graphiti_queue"]["backlog"] = await episode_queue.backlog()
+        except Exception:
+            logger.warning("Could not read graphiti_episode_queue backlog", exc_info=True)
+    return summary
+
+
+@router.get(
+    "/perf-stats/prometheus",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_perf_stats_prometheus(
+    _current_user: AdminUser,
+) -> PlainTextResponse:
+    """Export request and dependency latency histograms in Prometheus text format.
+
+    Args:
+        _current_user: Authenticated admin user.
+
+    Returns:
+        Prometheus exposition-format metrics.
+    """
+    from src.middleware.performance import perf_stats
+
+    return PlainTextResponse(
+        perf_stats.to_prometheus(), media_type="text/plain; version=0.0.4"
+    )
 
 
 # --- Usage Tracking Routes (Wave 0: Cost Governor) ---
@@ -290,7 +290,7 @@ async def chat_stream(
                 "and routing to conversational response"
             )
             # Update working memory with enriched message for LLM context
-            working_memory.messages.pop()  # Remove original message
+            working_memory.pop_message()  # Remove original message
             working_memory.add_message("user", enriched_message)  # Add enriched version
 
         # --- Quick Action Detection (BEFORE intent classification) ---
@@ -1,21 +1,25 @@
 """Centralized caching module for ARIA.
 
-Provides in-memory caching using cachetools TTLCache with:
-- Configurable TTL (time-to-live) and maxsize
+Provides in-memory caching with:
+- Named cache regions (one per @cached function), each LRU-bounded
+- Per-entry TTL (time-to-live)
 - @cached decorator for easy application to service methods
 - Custom key generation via key_func
-- Cache invalidation by key or pattern
-- Statistics tracking (hits, misses)
+- Tag-based invalidation (e.g. everything tagged ``user:{id}``)
+- Single-flight loading: concurrent misses for a key share one load
+- Per-region statistics (hits, misses, coalesced loads, evictions)
 """
 
+import asyncio
 import functools
 import logging
-import re
-from collections.abc import Callable, Coroutine
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
 from typing import Any, ParamSpec, TypeVar
 
-from cachetools import TTLCache
-
 logger = logging.getLogger(__name__)
 
 P = ParamSpec("P")
@@ -25,29 +29,266 @@ T = TypeVar("T")
 DEFAULT_MAXSIZE = 1000
 DEFAULT_TTL = 300  # 5 minutes
 
+# Region backing Cache.get/Cache.set
+DEFAULT_REGION = "default"
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    expires_at: float
+    tags: tuple[str, ...]
+
+
+@dataclass(slots=True)
+class _Load:
+    task: "asyncio.Future[Any]"
+    epoch: int
+
+
+def _consume_exception(task: "asyncio.Future[Any]") -> None:
+    """Mark a shared load's exception as retrieved if every caller went away."""
+    if not task.cancelled():
+        task.exception()
+
+
+class CacheRegion:
+    """A named, LRU-bounded set of entries with per-entry TTLs.
+
+    Regions are created through ``Cache.region`` and share their owner's
+    tag index and clock.
+    """
+
+    def __init__(self, name: str, owner: "Cache", maxsize: int, default_ttl: float) -> None:
+        """Initialize the region.
+
+        Args:
+            name: Region name (the function name for @cached regions).
+            owner: Cache holding the tag index.
+            maxsize: Maximum number of entries before LRU eviction.
+            default_ttl: TTL in seconds for entries set without one.
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        self._owner = owner
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._inflight: dict[str, _Load] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._entries.get(key)  # type: ignore[call-overload]
+        return entry is not None and entry.expires_at > self._owner._timer()
+
+    def get(self, key: str) -> tuple[Any, bool]:
+        """Get a value, counting a hit or miss.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Tuple of (value, found).
+        """
+        entry = self._lookup(key)
+        if entry is None:
+            self.misses += 1
+            return None, False
+        self.hits += 1
+        return entry.value, True
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Store a value.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            ttl: TTL in seconds; the region default if None.
+            tags: Tags the entry can be invalidated by.
+        """
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._owner._unindex(self.name, key, old.tags)
+        elif len(self._entries) >= self.maxsize:
+            lru_key, lru = self._entries.popitem(last=False)
+            self._owner._unindex(self.name, lru_key, lru.tags)
+            self.evictions += 1
+
+        entry = _Entry(
+            value=value,
+            expires_at=self._owner._timer() + (self.default_ttl if ttl is None else ttl),
+            tags=tuple(tags),
+        )
+        self._entries[key] = entry
+        self._owner._index(self.name, key, entry.tags)
+
+    def delete(self, key: str) -> bool:
+        """Delete a key and abandon any load in progress for it.
+
+        Args:
+            key: The cache key to delete.
+
+        Returns:
+            True if the key was deleted, False if it didn't exist.
+        """
+        self._inflight.pop(key, None)
+        if self._remove(key) is None:
+            return False
+        self.invalidations += 1
+        return True
+
+    def clear(self) -> int:
+        """Remove every entry.
+
+        Returns:
+            Number of entries removed.
+        """
+        count = len(self._entries)
+        for key, entry in self._entries.items():
+            self._owner._unindex(self.name, key, entry.tags)
+        self._entries.clear()
+        self._inflight.clear()
+        self.invalidations += count
+        return count
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: float | None = None,
+        tags: Iterable[str] = (),
+    ) -> T:
+        """Return the cached value, loading it on a miss.
+
+        Concurrent misses for the same key await a single shared load.
+        The load runs in its own task, so a caller that is cancelled does
+        not cancel it for the others. Exceptions propagate to every waiter
+        and are not cached. A load that overlaps an invalidation is
+        returned to its callers but not stored.
+
+        Args:
+            key: The cache key.
+            loader: Zero-argument coroutine function producing the value.
+            ttl: TTL in seconds; the region default if None.
+            tags: Tags the entry can be invalidated by.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self.hits += 1
+            return entry.value  # type: ignore[no-any-return]
+
+        load = self._inflight.get(key)
+        if load is not None and load.epoch == self._owner._epoch:
+            self.coalesced += 1
+            return await asyncio.shield(load.task)  # type: ignore[no-any-return]
+
+        self.misses += 1
+        task = asyncio.ensure_future(self._load(key, loader, ttl, tuple(tags)))
+        task.add_done_callback(_consume_exception)
+        self._inflight[key] = _Load(task=task, epoch=self._owner._epoch)
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for this region."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "inflight": len(self._inflight),
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+    async def _load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        ttl: float | None,
+        tags: tuple[str, ...],
+    ) -> T:
+        this = asyncio.current_task()
+        try:
+            value = await loader()
+            load = self._inflight.get(key)
+            if load is not None and load.task is this and load.epoch == self._owner._epoch:
+                self.set(key, value, ttl, tags)
+            return value
+        finally:
+            load = self._inflight.get(key)
+            if load is not None and load.task is this:
+                del self._inflight[key]
+
+    def _lookup(self, key: str) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._owner._timer():
+            self._remove(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remove(self, key: str) -> _Entry | None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._owner._unindex(self.name, key, entry.tags)
+        return entry
+
 
 class Cache:
-    """In-memory cache with TTL support.
+    """In-memory cache with per-entry TTLs, tags and named regions.
 
-    Wraps cachetools.TTLCache with additional features:
-    - Hit/miss statistics tracking
-    - Pattern-based invalidation
+    Features:
+    - Per-region hit/miss statistics
+    - Tag-based invalidation in O(entries tagged)
+    - Pattern-based invalidation (scans keys; prefer tags)
     - Multiple named cache regions
     """
 
-    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, default_ttl: int = DEFAULT_TTL) -> None:
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        default_ttl: int = DEFAULT_TTL,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
         """Initialize cache with configuration.
 
         Args:
-            maxsize: Maximum number of entries in the cache.
+            maxsize: Maximum number of entries per region.
             default_ttl: Default TTL in seconds for cached entries.
+            timer: Clock used for expiry (monotonic seconds).
         """
         self._maxsize = maxsize
         self._default_ttl = default_ttl
-        self._cache: TTLCache[str, Any] = TTLCache(maxsize=maxsize, ttl=default_ttl)
-        self._hits = 0
-        self._misses = 0
-        self._decorator_caches: dict[str, TTLCache[str, Any]] = {}
+        self._timer = timer
+        self._regions: dict[str, CacheRegion] = {}
+        # tag -> {(region name, key)}
+        self._tag_index: dict[str, set[tuple[str, str]]] = {}
+        # Bumped by bulk invalidations so in-flight loads don't store stale values
+        self._epoch = 0
+        self._cache = self.region(DEFAULT_REGION)
 
     @property
     def maxsize(self) -> int:
@@ -61,19 +302,35 @@ class Cache:
 
     @property
     def hits(self) -> int:
-        """Return the number of cache hits."""
-        return self._hits
+        """Return the number of cache hits across all regions."""
+        return sum(region.hits for region in self._regions.values())
 
     @property
     def misses(self) -> int:
-        """Return the number of cache misses."""
-        return self._misses
+        """Return the number of cache misses across all regions."""
+        return sum(region.misses for region in self._regions.values())
 
     @property
     def size(self) -> int:
-        """Return the current number of cached entries."""
+        """Return the current number of entries in the default region."""
         return len(self._cache)
 
+    def region(self, name: str, maxsize: int | None = None) -> CacheRegion:
+        """Get or create a named cache region.
+
+        Args:
+            name: Region name.
+            maxsize: Entry limit for a new region; the cache maxsize if None.
+
+        Returns:
+            The CacheRegion for ``name``.
+        """
+        region = self._regions.get(name)
+        if region is None:
+            region = CacheRegion(name, self, maxsize or self._maxsize, self._default_ttl)
+            self._regions[name] = region
+        return region
+
     def get(self, key: str) -> tuple[Any, bool]:
         """Get a value from the cache.
 
@@ -83,28 +340,24 @@ class Cache:
         Returns:
             Tuple of (value, found) where found indicates if the key exists.
         """
-        try:
-            value = self._cache[key]
-            self._hits += 1
-            return value, True
-        except KeyError:
-            self._misses += 1
-            return None, False
-
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        return self._cache.get(key)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        tags: Iterable[str] = (),
+    ) -> None:
         """Set a value in the cache.
 
         Args:
             key: The cache key.
             value: The value to cache.
             ttl: Optional TTL override in seconds.
+            tags: Tags the entry can be invalidated by.
         """
-        if ttl is not None:
-            # For per-entry TTL, we need to use the cache's timer
-            # TTLCache handles this internally when TTL is set on the cache
-            self._cache[key] = value
-        else:
-            self._cache[key] = value
+        self._cache.set(key, value, ttl, tags)
 
     def delete(self, key: str) -> bool:
         """Delete a key from the cache.
@@ -115,75 +368,80 @@ class Cache:
         Returns:
             True if the key was deleted, False if it didn't exist.
         """
-        try:
-            del self._cache[key]
-            return True
-        except KeyError:
-            return False
+        return self._cache.delete(key)
 
     def clear(self) -> None:
-        """Clear all entries from the cache."""
-        self._cache.clear()
-        self._decorator_caches.clear()
+        """Clear all entries from every region."""
+        self._epoch += 1
+        for region in self._regions.values():
+            region.clear()
+        self._tag_index.clear()
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
         Returns:
-            Dict with hits, misses, size, maxsize.
+            Dict with global hits, misses, size, maxsize, hit_rate and a
+            ``regions`` dict of per-region counters.
         """
+        hits = self.hits
+        misses = self.misses
         return {
-            "hits": self._hits,
-            "misses": self._misses,
+            "hits": hits,
+            "misses": misses,
             "size": len(self._cache),
             "maxsize": self._maxsize,
-            "hit_rate": self._hits / (self._hits + self._misses)
-            if (self._hits + self._misses) > 0
-            else 0.0,
+            "hit_rate": hits / (hits + misses) if (hits + misses) > 0 else 0.0,
+            "tags": len(self._tag_index),
+            "regions": {name: region.stats() for name, region in self._regions.items()},
         }
 
-    def get_or_create_decorator_cache(
-        self, func_name: str, ttl: int
-    ) -> TTLCache[str, Any]:
-        """Get or create a cache for a specific decorated function.
+    def invalidate_tags(self, *tags: str) -> int:
+        """Invalidate every entry carrying any of ``tags``, in any region.
 
         Args:
-            func_name: The name of the decorated function.
-            ttl: TTL for this function's cache.
+            tags: Tags to invalidate, e.g. ``f"user:{user_id}"``.
 
         Returns:
-            TTLCache instance for this function.
+            Number of entries invalidated.
         """
-        cache_key = f"{func_name}:{ttl}"
-        if cache_key not in self._decorator_caches:
-            self._decorator_caches[cache_key] = TTLCache(maxsize=self._maxsize, ttl=ttl)
-        return self._decorator_caches[cache_key]
+        self._epoch += 1
+        count = 0
+        for tag in tags:
+            for region_name, key in self._tag_index.pop(tag, set()):
+                region = self._regions[region_name]
+                if region._remove(key) is not None:
+                    region.invalidations += 1
+                    count += 1
+        if count > 0:
+            logger.debug("Invalidated %d cache entries tagged: %s", count, ", ".join(tags))
+        return count
 
-    def invalidate_by_pattern(self, pattern: str) -> int:
+    def invalidate_by_pattern(self, pattern: str, region: str | None = None) -> int:
         """Invalidate cache entries matching a pattern.
 
+        This scans keys; use tags for invalidation on hot paths.
+
         Args:
             pattern: Glob-style pattern to match keys against.
+            region: Only scan this region; all regions if None.
 
         Returns:
             Number of entries invalidated.
         """
-        # Convert glob pattern to regex
-        regex_pattern = pattern.replace("*", ".*").replace("?", ".")
-        regex = re.compile(f"^{regex_pattern}$")
-
-        keys_to_delete = [key for key in self._cache if regex.match(key)]
-        for key in keys_to_delete:
-            del self._cache[key]
-
-        # Also check decorator caches
-        for decorator_cache in self._decorator_caches.values():
-            decorator_keys = [key for key in decorator_cache if regex.match(key)]
-            for key in decorator_keys:
-                del decorator_cache[key]
-            keys_to_delete.extend(decorator_keys)
-
-        count = len(keys_to_delete)
+        self._epoch += 1
+        if region is not None:
+            regions = [self._regions[region]] if region in self._regions else []
+        else:
+            regions = list(self._regions.values())
+
+        count = 0
+        for cache_region in regions:
+            for key in list(cache_region._entries):
+                if fnmatchcase(key, pattern) and cache_region._remove(key) is not None:
+                    cache_region.invalidations += 1
+                    count += 1
+
         if count > 0:
             logger.debug("Invalidated %d cache entries matching pattern: %s", count, pattern)
         return count
@@ -193,33 +451,29 @@ class Cache:
 
         Args:
             func_name: Name of the decorated function.
-            key: Specific key to invalidate (without func_name prefix), or None for all.
+            key: Specific key to invalidate (as returned by its key_func), or None for all.
 
         Returns:
             Number of entries invalidated.
         """
-        count = 0
-        for cache_key, decorator_cache in list(self._decorator_caches.items()):
-            if cache_key.startswith(f"{func_name}:"):
-                if key is None:
-                    count += len(decorator_cache)
-                    decorator_cache.clear()
-                else:
-                    # The key stored in cache includes func_name prefix
-                    # e.g., "get_data:test-key" when key_func returns "test-key"
-                    # but when user calls invalidate_cache("get_data", key="test-key")
-                    # we need to find keys that end with the provided key
-                    keys_to_delete = [
-                        k for k in decorator_cache
-                        if k == f"{func_name}:{key}" or k.endswith(f":{key}")
-                    ]
-                    for k in keys_to_delete:
-                        try:
-                            del decorator_cache[k]
-                            count += 1
-                        except KeyError:
-                            pass
-        return count
+        region = self._regions.get(func_name)
+        if region is None:
+            return 0
+        if key is None:
+            return region.clear()
+        return int(region.delete(f"{func_name}:{key}"))
+
+    def _index(self, region: str, key: str, tags: tuple[str, ...]) -> None:
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add((region, key))
+
+    def _unindex(self, region: str, key: str, tags: tuple[str, ...]) -> None:
+        for tag in tags:
+            members = self._tag_index.get(tag)
+            if members is not None:
+                members.discard((region, key))
+                if not members:
+                    del self._tag_index[tag]
 
 
 # Global cache instance (singleton)
@@ -242,15 +496,21 @@ def cached(
     ttl: int = DEFAULT_TTL,
     key_func: Callable[..., str] | None = None,
     cache_instance: Cache | None = None,
+    tags: Callable[..., Iterable[str]] | None = None,
 ) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]]:
     """Decorator to cache async function results.
 
+    Each decorated function gets its own cache region. Concurrent calls
+    that miss on the same key share a single execution.
+
     Args:
         ttl: Time-to-live in seconds for cached entries.
         key_func: Optional function to generate cache key from args.
                   Receives all positional and keyword arguments.
                   If None, uses string representation of args.
         cache_instance: Optional Cache instance to use. Defaults to global cache.
+        tags: Optional function returning tags for an entry. Receives the
+              same arguments as key_func.
 
     Returns:
         Decorated async function with caching.
@@ -260,13 +520,16 @@ def cached(
         async def get_user(user_id: str) -> dict:
             return await db.fetch_user(user_id)
 
-        @cached(ttl=300, key_func=lambda user_id, **_: f"user:{user_id}")
+        @cached(
+            ttl=300,
+            key_func=lambda user_id, **_: f"user:{user_id}",
+            tags=lambda user_id, **_: [f"user:{user_id}"],
+        )
         async def get_user_data(user_id: str, extra: str = "") -> dict:
             return {"user_id": user_id}
     """
 
     def decorator(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Coroutine[Any, Any, T]]:
-        cache = cache_instance or get_cache()
         func_name = func.__name__
 
         @functools.wraps(func)
@@ -281,33 +544,22 @@ def cached(
                 all_args = ", ".join(filter(None, [args_repr, kwargs_repr]))
                 cache_key = f"{func_name}({all_args})"
 
-            # Get the decorator-specific cache
-            decorator_cache = cache.get_or_create_decorator_cache(func_name, ttl)
-
-            # Try to get from cache
-            try:
-                value = decorator_cache[cache_key]
-                cache._hits += 1  # Track global hits
-                logger.debug("Cache hit for key: %s", cache_key)
-                return value
-            except KeyError:
-                pass
-
-            # Cache miss - execute function
-            cache._misses += 1  # Track global misses
-            logger.debug("Cache miss for key: %s", cache_key)
-            result = await func(*args, **kwargs)
-
-            # Only cache non-exception results
-            decorator_cache[cache_key] = result
-            return result
+            region = (cache_instance or get_cache()).region(func_name)
+            return await region.get_or_load(
+                cache_key,
+                lambda: func(*args, **kwargs),
+                ttl=ttl,
+                tags=tags(*args, **kwargs) if tags is not None else (),
+            )
 
         # Add cache management methods to the wrapper
-        wrapper.cache_clear = lambda: cache.invalidate_decorator_cache(func_name)  # type: ignore
+        wrapper.cache_clear = lambda: (  # type: ignore
+            (cache_instance or get_cache()).invalidate_decorator_cache(func_name)
+        )
         wrapper.cache_info = lambda: {  # type: ignore
             "func_name": func_name,
             "ttl": ttl,
-            "size": len(cache.get_or_create_decorator_cache(func_name, ttl)),
+            **(cache_instance or get_cache()).region(func_name).stats(),
         }
 
         return wrapper
@@ -336,8 +588,8 @@ def invalidate_cache(func_name: str, key: str | None = None, pattern: str | None
     cache = get_cache()
 
     if pattern is not None:
-        # Pattern-based invalidation
-        return cache.invalidate_by_pattern(f"{func_name}:{pattern}")
+        # Pattern-based invalidation, limited to the function's region
+        return cache.invalidate_by_pattern(f"{func_name}:{pattern}", region=func_name)
     elif key is not None:
         # Specific key invalidation
         return cache.invalidate_decorator_cache(func_name, key)
@@ -346,6 +598,30 @@ def invalidate_cache(func_name: str, key: str | None = None, pattern: str | None
         return cache.invalidate_decorator_cache(func_name)
 
 
+def invalidate_tags(*tags: str) -> int:
+    """Invalidate every cached entry carrying any of ``tags``.
+
+    Example:
+        # Drop everything cached for a user
+        invalidate_tags(user_tag(user_id))
+
+    Returns:
+        Number of entries invalidated.
+    """
+    return get_cache().invalidate_tags(*tags)
+
+
+def user_tag(user_id: Any) -> str:
+    """Tag for entries derived from one user's data."""
+    return f"user:{user_id}"
+
+
+def user_method_tags(*args: Any, **kwargs: Any) -> list[str]:
+    """``tags`` function for methods taking ``user_id`` right after ``self``."""
+    user_id = args[1] if len(args) > 1 else kwargs.get("user_id", "")
+    return [user_tag(user_id)]
+
+
 def clear_all_caches() -> None:
     """Clear all caches globally."""
     cache = get_cache()
@@ -0,0 +1,442 @@
+"""Cross-worker fan-out for the in-process event buses.
+
+``EventBus`` (goal SSE streams) and ``ConnectionManager`` (WebSockets)
+deliver to subscribers in their own process. With several uvicorn workers,
+an event raised in one worker must also reach subscribers connected to
+the others. ``ClusterBus`` relays copies of such events through a
+pluggable ``BrokerBackend``:
+
+- ``InProcessBroker``: the default. On its own it has no peers, so
+  relaying is switched off and a single worker pays nothing for it.
+  Brokers that share a hub deliver to each other, which stands in for a
+  real broker in tests and local multi-bus setups.
+- ``SupabaseRealtimeBroker``: a private Supabase Realtime broadcast
+  channel. It needs nothing beyond the project URL and service key we
+  already have (no Redis, no direct Postgres connection for LISTEN/NOTIFY).
+  A restrictive RLS policy on ``realtime.messages`` keeps anon and
+  authenticated clients off the topic.
+
+Relay messages carry user data and drive WebSocket delivery, so a bus
+given a ``secret`` signs every envelope with HMAC-SHA256 and drops
+incoming messages that are unsigned, forged, or stale. Production buses
+are keyed with ``APP_SECRET_KEY``; without it the Supabase broker is not
+used at all.
+
+Local delivery always happens first and directly in the caller; the
+broker only carries copies for other workers. Outgoing and incoming
+messages pass through bounded queues drained by background tasks, so
+publishing never blocks the caller, works from sync code, and a slow
+broker drops (and counts) messages instead of growing memory.
+
+Usage:
+    # In FastAPI startup
+    await get_cluster_bus().start()
+
+    # Anywhere
+    cluster.subscribe("goal_events", handler)  # async handler(payload, origin)
+    cluster.publish("goal_events", {...})
+
+    # In FastAPI shutdown
+    await get_cluster_bus().stop()
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Called with (payload, origin worker id) for each message from another worker
+MessageHandler = Callable[[dict[str, Any], str], Awaitable[None]]
+
+# Broadcast event name used on the Supabase Realtime channel
+_REALTIME_EVENT = "relay"
+
+# Signed messages older (or further in the future) than this are dropped
+_MAX_MESSAGE_AGE_SECONDS = 60.0
+
+
+class BrokerBackend(ABC):
+    """Transport that carries relay messages between workers."""
+
+    @property
+    def distributed(self) -> bool:
+        """Whether other workers can receive what this broker publishes."""
+        return True
+
+    @abstractmethod
+    async def start(self, on_message: Callable[[dict[str, Any]], None]) -> None:
+        """Connect and start calling ``on_message`` for every message received."""
+
+    @abstractmethod
+    async def publish(self, message: dict[str, Any]) -> None:
+        """Send a JSON-serializable message to every other worker."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Disconnect."""
+
+
+class InProcessBroker(BrokerBackend):
+    """Broker between buses in the same process.
+
+    Without a hub there are no peers and the broker is not distributed.
+    Brokers created with the same ``hub`` set deliver to each other.
+    """
+
+    def __init__(self, hub: set["InProcessBroker"] | None = None) -> None:
+        """Initialize the broker.
+
+        Args:
+            hub: Shared set of peer brokers, or None for a standalone broker.
+        """
+        self._hub = hub
+        self._on_message: Callable[[dict[str, Any]], None] | None = None
+
+    @property
+    def distributed(self) -> bool:
+        """Whether the broker has a hub to publish to."""
+        return self._hub is not None
+
+    async def start(self, on_message: Callable[[dict[str, Any]], None]) -> None:
+        """Join the hub."""
+        self._on_message = on_message
+        if self._hub is not None:
+            self._hub.add(self)
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        """Hand the message to every other broker in the hub."""
+        for peer in list(self._hub or ()):
+            if peer is not self and peer._on_message is not None:
+                peer._on_message(message)
+
+    async def close(self) -> None:
+        """Leave the hub."""
+        if self._hub is not None:
+            self._hub.discard(self)
+        self._on_message = None
+
+
+class SupabaseRealtimeBroker(BrokerBackend):
+    """Broker over a private Supabase Realtime broadcast channel.
+
+    Joining a private channel is authorized by RLS on ``realtime.messages``
+    (see the ``realtime_cluster_relay`` migration), which only the service
+    role passes for the relay topic.
+    """
+
+    def __init__(self, supabase_url: str, api_key: str, topic: str = "aria-cluster") -> None:
+        """Initialize the broker.
+
+        Args:
+            supabase_url: Project URL (``https://<ref>.supabase.co``).
+            api_key: Key used to join the channel.
+            topic: Realtime channel shared by all workers.
+        """
+        self._url = f"{supabase_url.rstrip('/')}/realtime/v1"
+        self._api_key = api_key
+        self._topic = topic
+        self._client: Any = None
+        self._channel: Any = None
+
+    async def start(self, on_message: Callable[[dict[str, Any]], None]) -> None:
+        """Connect to Realtime and join the broadcast channel."""
+        from realtime import AsyncRealtimeClient
+
+        self._client = AsyncRealtimeClient(self._url, token=self._api_key, auto_reconnect=True)
+        await self._client.connect()
+        self._channel = self._client.channel(
+            self._topic,
+            {"config": {"broadcast": {"self": False, "ack": False}, "private": True}},
+        )
+        self._channel.on_broadcast(_REALTIME_EVENT, lambda message: on_message(message["payload"]))
+        await self._channel.subscribe()
+
+    async def publish(self, message: dict[str, Any]) -> None:
+        """Broadcast the message on the channel."""
+        await self._channel.send_broadcast(_REALTIME_EVENT, message)
+
+    async def close(self) -> None:
+        """Leave the channel and disconnect."""
+        if self._client is not None:
+            with contextlib.suppress(Exception):
+                await self._client.remove_all_channels()
+            with contextlib.suppress(Exception):
+                await self._client.close()
+        self._client = None
+        self._channel = None
+
+
+class ClusterBus:
+    """Relays named-channel messages between workers through a broker.
+
+    Messages a worker publishes are never handed back to its own
+    handlers; callers deliver locally themselves. With a ``secret``,
+    outgoing messages are signed and incoming ones are only dispatched if
+    their signature checks out.
+    """
+
+    def __init__(
+        self,
+        backend: BrokerBackend | None = None,
+        queue_size: int = 10_000,
+        secret: str | None = None,
+    ) -> None:
+        """Initialize the bus (call ``start`` to begin relaying).
+
+        Args:
+            backend: Broker transport; a standalone InProcessBroker if None.
+            queue_size: Bound on each of the outgoing and incoming queues.
+            secret: Key shared by all workers for signing relay messages,
+                or None to relay unsigned (in-process hubs only).
+        """
+        self.worker_id = uuid.uuid4().hex
+        self._backend = backend or InProcessBroker()
+        self._queue_size = queue_size
+        self._key = secret.encode() if secret else None
+        self._handlers: dict[str, list[MessageHandler]] = {}
+        self._outbox: asyncio.Queue[dict[str, Any]] | None = None
+        self._inbox: asyncio.Queue[dict[str, Any]] | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+        self._running = False
+        self.dropped_outgoing = 0
+        self.dropped_incoming = 0
+        self.rejected_incoming = 0
+
+    @property
+    def distributed(self) -> bool:
+        """Whether published messages can reach other workers."""
+        return self._running and self._backend.distributed
+
+    def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        """Register a handler for messages other workers publish on ``channel``."""
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def unsubscribe(self, channel: str, handler: MessageHandler) -> None:
+        """Remove a handler registered with ``subscribe``."""
+        handlers = self._handlers.get(channel, [])
+        with contextlib.suppress(ValueError):
+            handlers.remove(handler)
+        if not handlers:
+            self._handlers.pop(channel, None)
+
+    def publish(self, channel: str, payload: dict[str, Any]) -> bool:
+        """Queue a message for the other workers without waiting.
+
+        Args:
+            channel: Channel name the receiving handlers are registered on.
+            payload: JSON-serializable message body.
+
+        Returns:
+            True if queued; False if relaying is off or the outbox is full.
+        """
+        if not self.distributed or self._outbox is None:
+            return False
+        message: dict[str, Any] = {
+            "origin": self.worker_id,
+            "channel": channel,
+            "payload": payload,
+        }
+        if self._key is not None:
+            message = self._seal(message)
+        try:
+            self._outbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped_outgoing += 1
+            if self.dropped_outgoing % 1000 == 1:
+                logger.warning(
+                    "Cluster outbox full, dropping relay messages",
+                    extra={"channel": channel, "dropped": self.dropped_outgoing},
+                )
+            return False
+        return True
+
+    async def start(self) -> None:
+        """Connect the broker and start the relay tasks.
+
+        If the broker can't connect, the bus stays local-only and the
+        failure is logged; startup carries on.
+        """
+        if self._running:
+            return
+        self._outbox = asyncio.Queue(maxsize=self._queue_size)
+        self._inbox = asyncio.Queue(maxsize=self._queue_size)
+        try:
+            await self._backend.start(self._receive)
+        except Exception:
+            logger.exception("Cluster broker failed to start; events stay within this worker")
+            return
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._send_loop()),
+            asyncio.create_task(self._dispatch_loop()),
+        ]
+        logger.info(
+            "Cluster bus started",
+            extra={
+                "worker_id": self.worker_id,
+                "backend": type(self._backend).__name__,
+                "distributed": self._backend.distributed,
+            },
+        )
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Flush queued outgoing messages (up to ``timeout``) and disconnect."""
+        if not self._running:
+            return
+        self._running = False
+        if self._outbox is not None:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._outbox.join(), timeout=timeout)
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+        await self._backend.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Relay counters for health checks."""
+        return {
+            "worker_id": self.worker_id,
+            "distributed": self.distributed,
+            "outbox_pending": self._outbox.qsize() if self._outbox is not None else 0,
+            "inbox_pending": self._inbox.qsize() if self._inbox is not None else 0,
+            "dropped_outgoing": self.dropped_outgoing,
+            "dropped_incoming": self.dropped_incoming,
+            "rejected_incoming": self.rejected_incoming,
+        }
+
+    def _sign(self, body: str) -> str:
+        assert self._key is not None
+        return hmac.new(self._key, body.encode(), hashlib.sha256).hexdigest()
+
+    def _seal(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Wrap a message as a signed JSON string with a send timestamp.
+
+        The signature covers the exact string sent, so brokers that
+        re-encode JSON in transit cannot break it.
+        """
+        body = json.dumps({**message, "sent_at": time.time()}, default=str)
+        return {"signed": body, "sig": self._sign(body)}
+
+    def _open(self, message: dict[str, Any]) -> dict[str, Any] | None:
+        """Unwrap a received message, or None if unsigned, forged or stale."""
+        if self._key is None:
+            return message
+        body, sig = message.get("signed"), message.get("sig")
+        if not isinstance(body, str) or not isinstance(sig, str):
+            return None
+        if not hmac.compare_digest(sig, self._sign(body)):
+            return None
+        try:
+            opened = json.loads(body)
+            sent_at = float(opened["sent_at"])
+        except (ValueError, KeyError, TypeError):
+            return None
+        if abs(time.time() - sent_at) > _MAX_MESSAGE_AGE_SECONDS:
+            return None
+        return opened
+
+    def _receive(self, raw: dict[str, Any]) -> None:
+        """Broker callback: queue a message from another worker for dispatch."""
+        if self._inbox is None:
+            return
+        message = self._open(raw)
+        if message is None:
+            self.rejected_incoming += 1
+            if self.rejected_incoming % 100 == 1:
+                logger.warning(
+                    "Dropping unsigned or invalid relay message",
+                    extra={"rejected": self.rejected_incoming},
+                )
+            return
+        if message.get("origin") == self.worker_id:
+            return
+        try:
+            self._inbox.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped_incoming += 1
+            if self.dropped_incoming % 1000 == 1:
+                logger.warning(
+                    "Cluster inbox full, dropping relay messages",
+                    extra={"dropped": self.dropped_incoming},
+                )
+
+    async def _send_loop(self) -> None:
+        assert self._outbox is not None
+        while True:
+            message = await self._outbox.get()
+            try:
+                await self._backend.publish(message)
+            except Exception:
+                logger.warning(
+                    "Failed to relay message to other workers",
+                    extra={"channel": message.get("channel")},
+                    exc_info=True,
+                )
+            finally:
+                self._outbox.task_done()
+
+    async def _dispatch_loop(self) -> None:
+        assert self._inbox is not None
+        while True:
+            message = await self._inbox.get()
+            origin = str(message.get("origin", ""))
+            for handler in list(self._handlers.get(message.get("channel", ""), ())):
+                try:
+                    await handler(message.get("payload") or {}, origin)
+                except Exception:
+                    logger.warning(
+                        "Relay handler failed",
+                        extra={"channel": message.get("channel")},
+                        exc_info=True,
+                    )
+            self._inbox.task_done()
+
+
+# Singleton instance
+_cluster_bus: ClusterBus | None = None
+
+
+def get_cluster_bus() -> ClusterBus:
+    """Get or create the worker's cluster bus.
+
+    ``EVENT_BROKER`` selects the backend: ``"local"`` (single worker) or
+    ``"supabase"`` (Realtime broadcast between workers). The Supabase
+    broker requires ``APP_SECRET_KEY`` to sign relay messages; without it
+    the bus stays local.
+
+    Returns:
+        The process-wide ClusterBus instance.
+    """
+    global _cluster_bus
+    if _cluster_bus is None:
+        from src.core.config import settings
+
+        secret = settings.APP_SECRET_KEY.get_secret_value() or None
+        backend: BrokerBackend
+        if settings.EVENT_BROKER == "supabase" and secret:
+            backend = SupabaseRealtimeBroker(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_SERVICE_ROLE_KEY.get_secret_value(),
+            )
+        else:
+            if settings.EVENT_BROKER == "supabase":
+                logger.error("EVENT_BROKER=supabase needs APP_SECRET_KEY; events stay local")
+            backend = InProcessBroker()
+        _cluster_bus = ClusterBus(
+            backend,
+            queue_size=settings.EVENT_BROKER_QUEUE_SIZE,
+            secret=secret,
+        )
+    return _cluster_bus
@@ -25,6 +25,14 @@ class Settings(BaseSettings):
     SUPABASE_ANON_KEY: SecretStr = SecretStr("")
     SUPABASE_SERVICE_ROLE_KEY: SecretStr = SecretStr("")
 
+    # Supabase async data-access pool
+    SUPABASE_HTTP2: bool = True  # Multiplex PostgREST calls over HTTP/2 keepalive connections
+    SUPABASE_POOL_MAX_CONNECTIONS: int = 100
+    SUPABASE_POOL_MAX_KEEPALIVE: int = 20
+    SUPABASE_POOL_KEEPALIVE_EXPIRY: float = 30.0  # seconds
+    SUPABASE_REQUEST_TIMEOUT: float = 30.0  # seconds
+    SUPABASE_SYNC_OFFLOAD_WORKERS: int = 32  # Threads for legacy sync .execute() chains
+
     # Anthropic Claude API
     ANTHROPIC_API_KEY: SecretStr = SecretStr("")
 
@@ -35,6 +43,17 @@ class Settings(BaseSettings):
     NEO4J_URI: str = "bolt://localhost:7687"
     NEO4J_USER: str = "neo4j"
     NEO4J_PASSWORD: SecretStr = SecretStr("")
+    GRAPHITI_SEARCH_CACHE_TTL_SECONDS: float = 30.0  # Reuse identical scoped search results for this long
+    GRAPHITI_EMBEDDING_CACHE_SIZE: int = 2048  # LRU bound on cached query/entity embeddings
+    GRAPHITI_SEARCH_LEGACY_GROUP: bool = True  # Also search the default group written before per-user partitioning
+
+    # Graphiti episode write queue (graphiti_episode_queue table, drained by every API worker)
+    GRAPHITI_QUEUE_ENABLED: bool = True  # Queue memory writes instead of running extraction inline
+    GRAPHITI_QUEUE_CONCURRENCY: int = 4  # Groups (users) ingested at once per worker
+    GRAPHITI_QUEUE_BATCH_SIZE: int = 20  # Max episodes per add_episode_bulk call
+    GRAPHITI_QUEUE_POLL_SECONDS: float = 2.0  # Claim interval while idle
+    GRAPHITI_QUEUE_LEASE_SECONDS: int = 600  # A claimed batch is retried elsewhere after this
+    GRAPHITI_QUEUE_MAX_ATTEMPTS: int = 5  # Then the episode is dead-lettered (status 'failed')
 
     # Tavus (Phase 6)
     TAVUS_API_KEY: SecretStr | None = None
@@ -61,6 +80,7 @@ class Settings(BaseSettings):
     SKILLS_SH_GITHUB_URL: str = "https://raw.githubusercontent.com/skills-sh/skills/main"
     SKILLS_SYNC_INTERVAL_HOURS: int = 24
     SKILLS_MAX_CONTEXT_SUMMARIES: int = 50
+    SKILL_PLAN_MAX_CONCURRENT_STEPS: int = 4  # Plan steps executing at once
 
     # Exa API (web research for enrichment — optional)
     EXA_API_KEY: str = ""
@@ -84,6 +104,7 @@ class Settings(BaseSettings):
     APP_ENV: Literal["development", "staging", "production"] = "development"
     APP_URL: str = "http://localhost:3000"  # Base URL for webhook callbacks
     BACKEND_URL: str = "http://localhost:8000"  # Backend API base URL (for Tavus LLM endpoint)
+    SERVER_TIMING_HEADER: bool = False  # Send Server-Timing to every client (always sent in development and to admins)
 
     # Stripe Configuration (US-928)
     STRIPE_SECRET_KEY: SecretStr = SecretStr("")
@@ -104,6 +125,9 @@ class Settings(BaseSettings):
     # Rate Limiting Configuration (US-930)
     RATE_LIMIT_ENABLED: bool = True  # Global rate limiting toggle
     RATE_LIMIT_REQUESTS_PER_MINUTE: int = 100  # Default limit for all endpoints
+    RATE_LIMIT_BACKEND: str = "memory"  # "memory" (per worker) or "supabase" (shared counters, rate_limit_hit RPC)
+    RATE_LIMIT_MAX_KEYS: int = 100_000  # LRU bound on in-memory (endpoint, client) counters
+    RATE_LIMIT_SWEEP_SECONDS: float = 60.0  # Evict idle in-memory counters this often
 
     # Logging
     LOG_FORMAT: Literal["text", "json"] = "text"
@@ -123,6 +147,33 @@ class Settings(BaseSettings):
     SALIENCE_HALF_LIFE_DAYS: int = 30  # Days for salience to decay to 50%
     SALIENCE_ACCESS_BOOST: float = 0.1  # Boost per memory retrieval
     SALIENCE_MIN: float = 0.01  # Minimum salience (never zero)
+    SALIENCE_DECAY_PAGE_SIZE: int = 1000  # Rows read and written back per request
+    SALIENCE_DECAY_USERS_PER_QUERY: int = 50  # Users batched into one decay query
+
+    # Working memory session store (per worker)
+    WORKING_MEMORY_MAX_SESSIONS: int = 2000  # LRU bound on resident conversations
+    WORKING_MEMORY_MAX_BYTES: int = 256 * 1024 * 1024  # Approximate serialized size bound
+    WORKING_MEMORY_IDLE_SECONDS: float = 1800.0  # Evict (after persisting) when untouched this long
+    WORKING_MEMORY_SYNC_BATCH_SIZE: int = 100  # Dirty sessions written per bulk RPC
+
+    # Document ingestion pipeline (onboarding uploads)
+    DOCUMENT_PARSE_PROCESSES: int = 4  # Process pool for parsing/OCR; 0 parses in a thread
+    DOCUMENT_EMBEDDING_BATCH_SIZE: int = 100  # Chunks per embeddings request
+    DOCUMENT_ENTITY_CONCURRENCY: int = 8  # Entity-extraction LLM calls in flight per document
+    DOCUMENT_CHUNK_INSERT_BATCH: int = 50  # Chunk rows per bulk insert
+
+    # Inbox scan pipeline (EmailAnalyzer.scan_inbox)
+    EMAIL_SCAN_LLM_BATCH_SIZE: int = 10  # Emails per classification call; 1 = one call per email
+    EMAIL_SCAN_LLM_CONCURRENCY: int = 4  # Classification calls in flight per scan
+    EMAIL_SCAN_LOOKUP_CONCURRENCY: int = 8  # Sender / thread lookups in flight per scan
+
+    # Periodic email check fan-out (src/jobs/periodic_email_check.py)
+    PERIODIC_EMAIL_CHECK_CONCURRENCY: int = 8  # Users scanned at once
+    PERIODIC_EMAIL_CHECK_USER_TIMEOUT_SECONDS: float = 180.0  # Per-user inbox scan limit
+
+    # Onboarding email bootstrap (src/onboarding/email_bootstrap.py)
+    EMAIL_BOOTSTRAP_BUFFER_MAX_BYTES: int = 16 * 1024 * 1024  # Sent-email text kept for style analysis
+    EMAIL_BOOTSTRAP_UPSERT_BATCH_SIZE: int = 100  # memory_semantic rows per bulk upsert
 
     # MCP Server Configuration
     MCP_SERVERS_ENABLED: bool = True
@@ -151,6 +202,40 @@ class Settings(BaseSettings):
     COST_GOVERNOR_INPUT_TOKEN_COST_PER_M: float = 3.00
     COST_GOVERNOR_OUTPUT_TOKEN_COST_PER_M: float = 15.00
     COST_GOVERNOR_THINKING_TOKEN_COST_PER_M: float = 15.00
+    COST_GOVERNOR_LEDGER_ENABLED: bool = True  # Answer check_budget from in-memory ledger
+    COST_GOVERNOR_LEDGER_MAX_STALENESS_SECONDS: float = 30.0  # Reconcile with DB after this
+    COST_GOVERNOR_LEDGER_RECONCILE_TOKENS: int = 100_000  # ...or after this many local tokens
+
+    # Usage write-behind buffer (llm_usage rows + usage_tracking deltas)
+    USAGE_WRITE_BATCH_SIZE: int = 200  # Events that trigger an early flush
+    USAGE_WRITE_FLUSH_INTERVAL: float = 2.0  # Max seconds between flushes
+    USAGE_WRITE_MAX_PENDING: int = 10_000  # Rows queued before new rows are dropped
+
+    # OODA goal sweep (scheduler ooda_goal_monitoring job, every 30 min)
+    OODA_SWEEP_MAX_CONCURRENCY: int = 8  # Goals iterated at once across all users
+    OODA_SWEEP_PER_USER_CONCURRENCY: int = 2  # ...and at most this many per user
+    OODA_SWEEP_DEADLINE_SECONDS: float = 1500.0  # Cancel stragglers before the next sweep
+
+    # Signal Radar shared fetch cache (RSS feeds + FDA / ClinicalTrials / SEC lookups)
+    SIGNAL_FEED_CACHE_TTL_SECONDS: float = 600.0  # Revalidate RSS feeds (conditional GET) after this
+    SIGNAL_SOURCE_CACHE_TTL_SECONDS: float = 3000.0  # Refetch per-entity API lookups after this
+    SIGNAL_SOURCE_CACHE_MAX_ENTRIES: int = 5000  # LRU bound on cached responses
+
+    # Cross-worker fan-out for EventBus (goal SSE) and WebSocket events
+    EVENT_BROKER: str = "local"  # "local" (single worker) or "supabase" (private Realtime broadcast between workers, needs APP_SECRET_KEY)
+    EVENT_BROKER_QUEUE_SIZE: int = 10_000  # Relay outbox/inbox bound; overflow is dropped and counted
+    EVENT_BUS_QUEUE_SIZE: int = 256  # Per-SSE-subscriber queue bound; when full the oldest events are dropped and counted
+    WS_PRESENCE_INTERVAL_SECONDS: float = 15.0  # Presence snapshot period; peers silent for 3x this are forgotten
+
+    # Notification unread counters (per worker, pushed to clients over WebSocket)
+    NOTIFICATION_UNREAD_TTL_SECONDS: float = 30.0  # Reseed from the DB after this (backstop if a cross-worker invalidation is lost)
+    NOTIFICATION_UNREAD_MAX_USERS: int = 10_000  # LRU bound on cached counters
+
+    # Life Sciences MCP tools (PubMed / ClinicalTrials.gov / FDA / ChEMBL / patents)
+    LIFESCI_CACHE_TTL_SECONDS: float = 3600.0  # Reuse identical tool results for this long
+    LIFESCI_CACHE_MAX_ENTRIES: int = 2000  # LRU bound on cached results
+    LIFESCI_PUBMED_REQUESTS_PER_SECOND: float = 3.0  # NCBI E-utilities limit without an API key
+    LIFESCI_DEFAULT_REQUESTS_PER_SECOND: float = 5.0  # Per-host limit for the other public APIs
 
     # Tenant Monthly Budget Configuration (SaaS billing limits)
     LLM_MONTHLY_BUDGET_PER_SEAT: float = 250.0  # $250/month per seat
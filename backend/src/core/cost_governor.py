@@ -3,9 +3,16 @@
 Sits transparently inside LLMClient. Checks budgets before and records
 usage after every call. Soft degradation handles 95% of cases by reducing
 thinking effort silently; hard stops only fire at 100% budget exhaustion.
+
+The shared governor used by LLMClient keeps an in-memory budget ledger:
+each user's daily totals are seeded from ``usage_tracking`` once, updated
+locally by ``record_usage`` and reconciled with the DB when the entry is
+older than the staleness limit or has absorbed too many local tokens.
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from datetime import date
 from typing import Any
@@ -89,6 +96,24 @@ class LLMUsage:
         )
 
 
+def _empty_usage_row() -> dict[str, Any]:
+    """Zeroed daily usage totals, keyed like the usage_tracking columns."""
+    # Column names match deployed usage_tracking table schema
+    return {
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "extended_thinking_tokens": 0,
+        "estimated_cost_cents": 0.0,
+        "request_count": 0,
+    }
+
+
+def _add_usage(row: dict[str, Any], other: dict[str, Any]) -> None:
+    """Add ``other``'s usage totals into ``row`` in place."""
+    for key, value in other.items():
+        row[key] += value
+
+
 class BudgetStatus(BaseModel):
     """Current budget state for a user."""
 
@@ -105,11 +130,41 @@ class BudgetStatus(BaseModel):
     llm_calls_today: int = 0
 
 
-class CostGovernor:
-    """Per-user token budget enforcement and cost tracking."""
+@dataclass
+class _LedgerEntry:
+    """In-memory usage totals for one user on one day."""
+
+    day: str
+    totals: dict[str, Any]
+    reconciled_at: float
+    tokens_since_reconcile: int = 0
+
 
-    def __init__(self) -> None:
+class CostGovernor:
+    """Per-user token budget enforcement and cost tracking.
+
+    Args:
+        ledger_max_staleness: Seconds a ledger entry may serve ``check_budget``
+            before it is reconciled with the DB. ``None`` disables the ledger
+            and reads ``usage_tracking`` on every check.
+        ledger_reconcile_tokens: Locally recorded tokens after which an entry
+            is reconciled early, regardless of age.
+    """
+
+    def __init__(
+        self,
+        *,
+        ledger_max_staleness: float | None = None,
+        ledger_reconcile_tokens: int = 100_000,
+    ) -> None:
         self._retry_counts: dict[str, int] = {}
+        self._ledger_max_staleness = ledger_max_staleness
+        self._ledger_reconcile_tokens = ledger_reconcile_tokens
+        self._ledger: dict[str, _LedgerEntry] = {}
+        self._reconciling: dict[str, asyncio.Task[_LedgerEntry]] = {}
+        # Usage recorded while a reconcile read is in flight — neither the
+        # read nor the pending snapshot taken before it may include it.
+        self._reconcile_carry: dict[str, dict[str, Any]] = {}
 
     async def check_budget(self, user_id: str) -> BudgetStatus:
         """Check whether a user can make another LLM call.
@@ -131,7 +186,7 @@ class CostGovernor:
                 thinking_tokens_remaining=s.COST_GOVERNOR_DAILY_THINKING_BUDGET,
             )
 
-        row = await self._get_today_usage(user_id)
+        row = await self._get_usage_for_budget(user_id)
 
         total_used = (
             row["input_tokens"]
@@ -163,6 +218,10 @@ class CostGovernor:
     async def record_usage(self, user_id: str, usage: LLMUsage) -> None:
         """Record token usage for a user. Fail-open on errors.
 
+        While the usage write-behind buffer is running the increment is
+        coalesced there and flushed in batches; otherwise it is written
+        immediately via the ``increment_usage_tracking`` RPC.
+
         Args:
             user_id: The user to record usage for.
             usage: The token usage from the LLM call.
@@ -172,22 +231,31 @@ class CostGovernor:
             return
 
         try:
-            from src.db.supabase import SupabaseClient
+            from src.core.usage_writer import get_usage_write_buffer
+
+            buffered = get_usage_write_buffer().enqueue_usage_delta(user_id, usage)
+            self._ledger_record(user_id, usage)
+            if buffered:
+                return
+
+            from src.db.supabase import SupabaseClient, execute_async
 
             client = SupabaseClient.get_client()
-            client.rpc(
-                "increment_usage_tracking",
-                {
-                    "p_user_id": user_id,
-                    "p_date": date.today().isoformat(),
-                    "p_input_tokens": usage.input_tokens,
-                    "p_output_tokens": usage.output_tokens,
-                    "p_thinking_tokens": usage.thinking_tokens,
-                    "p_cache_read_tokens": usage.cache_read_tokens,
-                    "p_cache_creation_tokens": usage.cache_creation_tokens,
-                    "p_estimated_cost": usage.estimated_cost_usd,
-                },
-            ).execute()
+            await execute_async(
+                client.rpc(
+                    "increment_usage_tracking",
+                    {
+                        "p_user_id": user_id,
+                        "p_date": date.today().isoformat(),
+                        "p_input_tokens": usage.input_tokens,
+                        "p_output_tokens": usage.output_tokens,
+                        "p_thinking_tokens": usage.thinking_tokens,
+                        "p_cache_read_tokens": usage.cache_read_tokens,
+                        "p_cache_creation_tokens": usage.cache_creation_tokens,
+                        "p_estimated_cost": usage.estimated_cost_usd,
+                    },
+                )
+            )
         except Exception:
             # Fail-open: never block a response because tracking failed
             logger.exception("Failed to record usage for user %s", user_id)
@@ -252,6 +320,124 @@ class CostGovernor:
         """
         self._retry_counts.pop(goal_id, None)
 
+    # -- Budget ledger -------------------------------------------------------
+
+    async def _get_usage_for_budget(self, user_id: str) -> dict[str, Any]:
+        """Today's usage totals for ``check_budget``, from the ledger if enabled.
+
+        Args:
+            user_id: The user to check.
+
+        Returns:
+            Dict shaped like ``_get_today_usage``'s result.
+        """
+        if self._ledger_max_staleness is None:
+            pending = self._pending_usage(user_id)
+            row = await self._get_today_usage(user_id)
+            _add_usage(row, pending)
+            return row
+
+        entry = self._ledger.get(user_id)
+        if entry is None or self._needs_reconcile(entry):
+            entry = await self._reconcile(user_id)
+        return dict(entry.totals)
+
+    def _needs_reconcile(self, entry: _LedgerEntry) -> bool:
+        """Whether a ledger entry is too old, too drifted, or from another day."""
+        assert self._ledger_max_staleness is not None
+        return (
+            entry.day != date.today().isoformat()
+            or time.monotonic() - entry.reconciled_at >= self._ledger_max_staleness
+            or entry.tokens_since_reconcile >= self._ledger_reconcile_tokens
+        )
+
+    async def _reconcile(self, user_id: str) -> _LedgerEntry:
+        """Reload a user's ledger entry from the DB, single-flight per user.
+
+        Concurrent callers for the same user share one DB read.
+        """
+        task = self._reconciling.get(user_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_ledger_entry(user_id))
+            self._reconciling[user_id] = task
+            self._reconcile_carry[user_id] = _empty_usage_row()
+            task.add_done_callback(lambda _t: self._finish_reconcile(user_id))
+        return await asyncio.shield(task)
+
+    def _finish_reconcile(self, user_id: str) -> None:
+        self._reconciling.pop(user_id, None)
+        self._reconcile_carry.pop(user_id, None)
+
+    async def _load_ledger_entry(self, user_id: str) -> _LedgerEntry:
+        """Seed an entry from ``usage_tracking`` plus not-yet-persisted usage."""
+        day = date.today().isoformat()
+        # Snapshot the buffer before reading: a flush that lands during the
+        # read is then counted by the snapshot, the read, or both.
+        pending = self._pending_usage(user_id)
+        totals = dict(await self._get_today_usage(user_id))
+        _add_usage(totals, pending)
+
+        # Writes that raced the read may be counted twice here; the next
+        # reconcile corrects it, and over-counting errs on the safe side.
+        carry = self._reconcile_carry.get(user_id)
+        if carry:
+            _add_usage(totals, carry)
+
+        entry = _LedgerEntry(day=day, totals=totals, reconciled_at=time.monotonic())
+        self._ledger[user_id] = entry
+        return entry
+
+    def _ledger_record(self, user_id: str, usage: LLMUsage) -> None:
+        """Apply one LLM call's usage to the in-memory ledger.
+
+        Args:
+            user_id: The user the usage belongs to.
+            usage: Token usage from the call.
+        """
+        if self._ledger_max_staleness is None:
+            return
+
+        delta = {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "extended_thinking_tokens": usage.thinking_tokens,
+            "estimated_cost_cents": usage.estimated_cost_usd * 100,
+            "request_count": 1,
+        }
+
+        entry = self._ledger.get(user_id)
+        if entry is not None and entry.day == date.today().isoformat():
+            _add_usage(entry.totals, delta)
+            entry.tokens_since_reconcile += usage.total_tokens
+
+        carry = self._reconcile_carry.get(user_id)
+        if carry is not None:
+            _add_usage(carry, delta)
+
+    @staticmethod
+    def _pending_usage(user_id: str) -> dict[str, Any]:
+        """Usage the write-behind buffer has not persisted yet.
+
+        Includes any batch whose flush is still in flight.
+
+        Args:
+            user_id: The user being checked.
+
+        Returns:
+            A copy shaped like ``_get_today_usage``'s result.
+        """
+        from src.core.usage_writer import get_usage_write_buffer
+
+        row = _empty_usage_row()
+        pending = get_usage_write_buffer().pending_delta(user_id)
+        if pending is not None:
+            row["input_tokens"] = pending.input_tokens
+            row["output_tokens"] = pending.output_tokens
+            row["extended_thinking_tokens"] = pending.thinking_tokens
+            row["estimated_cost_cents"] = pending.estimated_cost * 100
+            row["request_count"] = pending.request_count
+        return row
+
     async def _get_today_usage(self, user_id: str) -> dict[str, Any]:
         """Fetch today's usage row for a user.
 
@@ -261,25 +447,17 @@ class CostGovernor:
         Returns:
             Dict with token counts, defaulting to zeros if no row exists.
         """
-        # Column names match deployed usage_tracking table schema
-        defaults: dict[str, Any] = {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "extended_thinking_tokens": 0,
-            "estimated_cost_cents": 0.0,
-            "request_count": 0,
-        }
+        defaults = _empty_usage_row()
 
         try:
-            from src.db.supabase import SupabaseClient
+            from src.db.supabase import SupabaseClient, execute_async
 
             client = SupabaseClient.get_client()
-            response = (
+            response = await execute_async(
                 client.table("usage_tracking")
                 .select("*")
                 .eq("user_id", user_id)
                 .eq("date", date.today().isoformat())
-                .execute()
             )
 
             if response.data:
@@ -310,16 +488,15 @@ class CostGovernor:
             List of daily usage rows ordered by date DESC.
         """
         try:
-            from src.db.supabase import SupabaseClient
+            from src.db.supabase import SupabaseClient, execute_async
 
             client = SupabaseClient.get_client()
-            response = (
+            response = await execute_async(
                 client.table("usage_tracking")
                 .select("*")
                 .eq("user_id", user_id)
                 .order("date", desc=True)
                 .limit(days)
-                .execute()
             )
             return response.data or []
         except Exception:
@@ -333,15 +510,14 @@ class CostGovernor:
             List of today's usage rows for all users.
         """
         try:
-            from src.db.supabase import SupabaseClient
+            from src.db.supabase import SupabaseClient, execute_async
 
             client = SupabaseClient.get_client()
-            response = (
+            response = await execute_async(
                 client.table("usage_tracking")
                 .select("*")
                 .eq("date", date.today().isoformat())
                 .order("estimated_cost_usd", desc=True)
-                .execute()
             )
             return response.data or []
         except Exception:
@@ -1,8 +1,14 @@
 """In-process pub/sub event bus for goal execution events.
 
 Enables SSE endpoints to stream real-time events from background
-agent execution. Each subscriber gets an asyncio.Queue that receives
-events for a specific goal_id.
+agent execution. Each subscriber gets a bounded queue that receives
+events for a specific goal_id. A subscriber that falls a full queue
+behind loses events according to its ``OverflowPolicy``.
+
+Events are delivered to local subscribers directly. When a
+``ClusterBus`` is attached (see ``src.core.cluster``), a copy is relayed
+to the other workers, so an SSE stream served by one worker sees a goal
+executing in another.
 """
 
 import asyncio
@@ -10,10 +16,19 @@ import contextlib
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, ClassVar
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from src.core.cluster import ClusterBus
 
 logger = logging.getLogger(__name__)
 
+# ClusterBus channel carrying GoalEvent dicts between workers
+_CLUSTER_CHANNEL = "goal_events"
+
+DEFAULT_QUEUE_SIZE = 256
+
 
 @dataclass
 class GoalEvent:
@@ -34,27 +49,122 @@ class GoalEvent:
             "timestamp": self.timestamp.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "GoalEvent":
+        return cls(
+            goal_id=data["goal_id"],
+            user_id=data["user_id"],
+            event_type=data["event_type"],
+            data=data.get("data") or {},
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
+
+
+class OverflowPolicy(StrEnum):
+    """What a full subscriber queue does with a new event.
+
+    Every policy loses events once a subscriber falls ``maxsize`` behind;
+    the loss is counted in ``SubscriberQueue.dropped`` and logged. Only
+    ``DROP_OLDEST`` (the default) and ``DROP_NEWEST`` keep the remaining
+    events in publish order.
+    """
+
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued event to make room
+    DROP_NEWEST = "drop_newest"  # Discard the new event
+    # Remove the latest queued event of the same type and append the new one
+    # (it moves behind events published after the one it replaced), else drop
+    # oldest. Suits progress-only streams where just the newest state matters.
+    COALESCE = "coalesce"
+
+
+class SubscriberQueue(asyncio.Queue[GoalEvent]):
+    """Bounded subscriber queue with an explicit overflow policy."""
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        super().__init__(maxsize=maxsize)
+        self.policy = policy
+        self.dropped = 0
+
+    def offer(self, event: GoalEvent) -> bool:
+        """Enqueue without blocking, applying the overflow policy when full.
+
+        Returns:
+            False if the new event itself was dropped.
+        """
+        if not self.full():
+            self.put_nowait(event)
+            return True
+
+        self.dropped += 1
+        if self.policy is OverflowPolicy.DROP_NEWEST:
+            return False
+
+        if self.policy is OverflowPolicy.COALESCE:
+            # A full queue has no waiting getters, so the underlying deque
+            # can be edited in place.
+            pending = self._queue  # type: ignore[attr-defined]
+            for i in range(len(pending) - 1, -1, -1):
+                if pending[i].event_type == event.event_type:
+                    del pending[i]
+                    pending.append(event)
+                    return True
+
+        self.get_nowait()
+        self.task_done()
+        self.put_nowait(event)
+        return True
+
 
 class EventBus:
     """In-process pub/sub for goal execution events."""
 
     _instance: ClassVar["EventBus | None"] = None
 
-    def __init__(self) -> None:
-        self._subscribers: dict[str, list[asyncio.Queue[GoalEvent]]] = {}
+    def __init__(
+        self,
+        cluster: "ClusterBus | None" = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        self._subscribers: dict[str, list[SubscriberQueue]] = {}
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._cluster = cluster
+        if cluster is not None:
+            cluster.subscribe(_CLUSTER_CHANNEL, self._on_remote_event)
 
     @classmethod
     def get_instance(cls) -> "EventBus":
         if cls._instance is None:
-            cls._instance = cls()
+            from src.core.cluster import get_cluster_bus
+            from src.core.config import settings
+
+            cls._instance = cls(
+                cluster=get_cluster_bus(),
+                queue_size=settings.EVENT_BUS_QUEUE_SIZE,
+            )
         return cls._instance
 
     @classmethod
     def reset(cls) -> None:
+        if cls._instance is not None and cls._instance._cluster is not None:
+            cls._instance._cluster.unsubscribe(_CLUSTER_CHANNEL, cls._instance._on_remote_event)
         cls._instance = None
 
-    def subscribe(self, goal_id: str) -> asyncio.Queue[GoalEvent]:
-        queue: asyncio.Queue[GoalEvent] = asyncio.Queue()
+    def subscribe(
+        self,
+        goal_id: str,
+        maxsize: int | None = None,
+        policy: OverflowPolicy | None = None,
+    ) -> SubscriberQueue:
+        queue = SubscriberQueue(
+            maxsize=self._queue_size if maxsize is None else maxsize,
+            policy=policy or self._overflow,
+        )
         if goal_id not in self._subscribers:
             self._subscribers[goal_id] = []
         self._subscribers[goal_id].append(queue)
@@ -63,14 +173,27 @@ class EventBus:
     def unsubscribe(self, goal_id: str, queue: asyncio.Queue[GoalEvent]) -> None:
         if goal_id in self._subscribers:
             with contextlib.suppress(ValueError):
-                self._subscribers[goal_id].remove(queue)
+                self._subscribers[goal_id].remove(queue)  # type: ignore[arg-type]
             if not self._subscribers[goal_id]:
                 del self._subscribers[goal_id]
 
     async def publish(self, event: GoalEvent) -> None:
-        subscribers = self._subscribers.get(event.goal_id, [])
-        for queue in subscribers:
-            try:
-                queue.put_nowait(event)
-            except asyncio.QueueFull:
-                logger.warning("Event queue full for goal %s", event.goal_id)
+        self._deliver(event)
+        if self._cluster is not None:
+            self._cluster.publish(_CLUSTER_CHANNEL, event.to_dict())
+
+    def _deliver(self, event: GoalEvent) -> None:
+        for queue in self._subscribers.get(event.goal_id, []):
+            dropped = queue.dropped
+            queue.offer(event)
+            if queue.dropped != dropped and queue.dropped % 100 == 1:
+                logger.warning(
+                    "Event queue full for goal %s (%s, %d dropped)",
+                    event.goal_id,
+                    queue.policy.value,
+                    queue.dropped,
+                )
+
+    async def _on_remote_event(self, payload: dict[str, Any], _origin: str) -> None:
+        if payload.get("goal_id") in self._subscribers:
+            self._deliver(GoalEvent.from_dict(payload))
@@ -40,6 +40,7 @@ from src.core.model_config import DEFAULT_CONFIG, MODEL_ROUTES
 from src.core.resilience import claude_api_circuit_breaker
 from src.core.task_characteristics import THINKING_BUDGETS
 from src.core.task_types import TaskType
+from src.core.timing import LLM, track_dependency
 
 if TYPE_CHECKING:
     from src.core.cost_governor import CostGovernor, LLMUsage
@@ -128,7 +129,14 @@ def get_cost_governor() -> CostGovernor:
     if _cost_governor is None:
         from src.core.cost_governor import CostGovernor
 
-        _cost_governor = CostGovernor()
+        _cost_governor = CostGovernor(
+            ledger_max_staleness=(
+                settings.COST_GOVERNOR_LEDGER_MAX_STALENESS_SECONDS
+                if settings.COST_GOVERNOR_LEDGER_ENABLED
+                else None
+            ),
+            ledger_reconcile_tokens=settings.COST_GOVERNOR_LEDGER_RECONCILE_TOKENS,
+        )
     return _cost_governor
 
 
@@ -379,10 +387,18 @@ class LLMClient:
             return None
 
     def _fire_usage_log(self, **kwargs: Any) -> None:
-        """Fire-and-forget usage logging. Errors are suppressed."""
+        """Fire-and-forget usage logging. Errors are suppressed.
+
+        Hands the event to the write-behind buffer when it is running;
+        only falls back to a per-call task when it is not.
+        """
         usage_logger = getattr(self, "_usage_logger", None)
         if not usage_logger:
             return
+        from src.core.usage_logger import UsageLogger as _UL
+
+        if isinstance(usage_logger, _UL) and usage_logger.log_nowait(**kwargs):
+            return
         task = asyncio.create_task(usage_logger.log(**kwargs))
         task.add_done_callback(lambda t: t.exception() if not t.cancelled() else None)
 
@@ -474,14 +490,15 @@ class LLMClient:
                 )
                 start = time.time()
                 try:
-                    response = await acompletion(
-                        model=config.fallback,
-                        messages=litellm_messages,
-                        max_tokens=effective_max_tokens,
-                        temperature=effective_temperature,
-                        api_key=self._api_key,
-                        metadata=metadata,
-                    )
+                    with track_dependency(LLM, config.fallback):
+                        response = await acompletion(
+                            model=config.fallback,
+                            messages=litellm_messages,
+                            max_tokens=effective_max_tokens,
+                            temperature=effective_temperature,
+                            api_key=self._api_key,
+                            metadata=metadata,
+                        )
                 except Exception as fallback_exc:
                     latency_ms = int((time.time() - start) * 1000)
                     self._fire_usage_log(
@@ -1029,16 +1046,18 @@ class LLMClient:
         _llm_circuit_breaker.check()
         start = time.time()
         try:
-            response = await acompletion(
-                model=self._litellm_model,
-                messages=litellm_messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                stream=True,
-                stream_options={"include_usage": True},
-                api_key=self._api_key,
-                metadata=metadata,
-            )
+            # Times opening the stream; consuming it is paced by the caller
+            with track_dependency(LLM, self._litellm_model):
+                response = await acompletion(
+                    model=self._litellm_model,
+                    messages=litellm_messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    api_key=self._api_key,
+                    metadata=metadata,
+                )
 
             stream_usage: Any = None
             async for chunk in response:
@@ -22,7 +22,7 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
-from src.core.cache import cached, invalidate_cache
+from src.core.cache import cached, invalidate_cache, user_method_tags
 
 logger = logging.getLogger(__name__)
 
@@ -463,7 +463,11 @@ Your voice guidelines are authoritative. Your conversation history is not a styl
         # We approximate: if build_time is very low, it was cached.
         return result, False  # The decorator tracks hits internally
 
-    @cached(ttl=300, key_func=lambda self, user_id: f"persona_l4_v2:{user_id}")
+    @cached(
+        ttl=300,
+        key_func=lambda self, user_id: f"persona_l4_v2:{user_id}",
+        tags=user_method_tags,
+    )
     async def _cached_user_context(self, user_id: str) -> str:
         """Cached inner method for L4 context assembly.
 
@@ -1,11 +1,26 @@
 """Rate limiting middleware for ARIA API (US-930).
 
-This module provides in-memory rate limiting using a sliding window algorithm.
-It supports per-endpoint configuration and tracks requests by user_id or IP address.
+This module provides rate limiting using a sliding window counter. It
+supports per-endpoint configuration and tracks requests by user_id or IP
+address. Decorated endpoints share one budget per identifier unless the
+decorator is given its own ``scope``.
+
+Each (scope, identifier) pair keeps two counters: hits in the current
+fixed window and hits in the previous one. The sliding-window estimate
+weights the previous window by how much of it still overlaps the last
+``window_seconds``. A check is O(1) time and memory, whatever the limit.
+
+Idle keys are evicted periodically and the number of tracked keys is
+capped, so a scan from many IPs cannot grow memory without bound. With
+``RATE_LIMIT_BACKEND=supabase`` the counters live in Postgres (the
+``rate_limit_hit`` RPC), so limits hold across workers. The in-memory
+counters are the fallback while that backend is unreachable.
 """
 
+import logging
+import math
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 from functools import wraps
@@ -16,6 +31,11 @@ from fastapi import Request
 from src.core.config import get_settings
 from src.core.exceptions import RateLimitError
 
+logger = logging.getLogger(__name__)
+
+# Seconds to stay on the in-memory counters after the shared backend fails
+_BACKEND_RETRY_SECONDS = 300.0
+
 
 @dataclass(frozen=True)
 class RateLimitConfig:
@@ -30,73 +50,236 @@ class RateLimitConfig:
     window_seconds: int = 60
 
 
+class _WindowCounter:
+    """Hit counts for one key in the current and previous fixed windows."""
+
+    __slots__ = ("window", "current", "previous")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.current = 0
+        self.previous = 0
+
+    def advance(self, window: int) -> None:
+        """Roll the counters forward to ``window``."""
+        if window == self.window:
+            return
+        self.previous = self.current if window == self.window + 1 else 0
+        self.current = 0
+        self.window = window
+
+
+def _estimate(previous: int, current: int, elapsed_fraction: float) -> float:
+    """Sliding-window hit estimate for the last full window."""
+    return previous * (1.0 - elapsed_fraction) + current
+
+
+def _seconds_until_allowed(
+    previous: int,
+    current: int,
+    limit: int,
+    window_start: float,
+    window_seconds: int,
+    now: float,
+) -> int:
+    """Seconds until the estimate drops below ``limit`` (no new hits assumed)."""
+    if current < limit:
+        # Wait for enough of the previous window to slide out
+        fraction = 1.0 - (limit - current) / previous if previous else 0.0
+        allowed_at = window_start + window_seconds * fraction
+    else:
+        # Wait for the next window, then for the current hits to slide out
+        fraction = max(0.0, 1.0 - limit / current)
+        allowed_at = window_start + window_seconds * (1.0 + fraction)
+    return max(0, math.ceil(allowed_at - now))
+
+
 class RateLimitTracker:
-    """Tracks rate limits using an in-memory sliding window.
+    """Tracks rate limits with sliding window counters.
 
-    This implementation is simple and fast but not distributed.
-    For production deployments with multiple workers, consider using Redis.
+    Counters are kept in memory per worker. When a shared backend is
+    configured, ``acheck_rate_limit`` uses it instead and falls back to
+    the in-memory counters while it is unavailable.
     """
 
-    def __init__(self) -> None:
-        """Initialize the rate limit tracker."""
-        # Maps user_id/IP to list of request timestamps
-        self._requests: dict[str, list[float]] = defaultdict(list)
+    def __init__(
+        self,
+        max_keys: int = 100_000,
+        sweep_interval: float = 60.0,
+        shared_backend: bool = False,
+    ) -> None:
+        """Initialize the rate limit tracker.
+
+        Args:
+            max_keys: Most (endpoint, identifier, window) counters kept;
+                the least recently used are evicted beyond this.
+            sweep_interval: Seconds between idle-key sweeps.
+            shared_backend: Use the ``rate_limit_hit`` RPC so limits
+                hold across workers.
+        """
+        # Maps (scope, identifier, window_seconds) to its window counters,
+        # least recently used first
+        self._requests: OrderedDict[tuple[str, str, int], _WindowCounter] = OrderedDict()
+        self._max_keys = max_keys
+        self._sweep_interval = sweep_interval
+        self._next_sweep = time.monotonic() + sweep_interval
+        self._shared_backend = shared_backend
+        self._backend_unavailable_until = 0.0
+        self._allowed: dict[str, int] = defaultdict(int)
+        self._rejected: dict[str, int] = defaultdict(int)
+        self._evicted = 0
 
     def check_rate_limit(
         self,
         identifier: str,
         config: RateLimitConfig,
+        scope: str = "",
+        endpoint: str | None = None,
     ) -> bool:
         """Check if a request is allowed under the rate limit.
 
+        Allowed requests are counted; rejected ones are not.
+
         Args:
             identifier: Unique identifier (user_id or IP address).
             config: Rate limit configuration.
+            scope: Budget the request counts against; each scope is counted separately.
+            endpoint: Name the request is reported under in ``stats``
+                (defaults to ``scope``).
 
         Returns:
             True if request is allowed, False if rate limit exceeded.
         """
-        current_time = time.time()
-        window_start = current_time - config.window_seconds
+        now = time.time()
+        if time.monotonic() >= self._next_sweep:
+            self._sweep(now)
+
+        window = int(now // config.window_seconds)
+        key = (scope, identifier, config.window_seconds)
+        counter = self._requests.get(key)
+        if counter is None:
+            counter = _WindowCounter(window)
+            self._requests[key] = counter
+            if len(self._requests) > self._max_keys:
+                self._requests.popitem(last=False)
+                self._evicted += 1
+        else:
+            self._requests.move_to_end(key)
+            counter.advance(window)
+
+        label = scope if endpoint is None else endpoint
+        elapsed = now / config.window_seconds - window
+        if _estimate(counter.previous, counter.current, elapsed) < config.requests:
+            counter.current += 1
+            self._allowed[label] += 1
+            return True
 
-        # Get existing requests for this identifier
-        request_timestamps = self._requests[identifier]
+        self._rejected[label] += 1
+        return False
 
-        # Remove old requests outside the time window
-        # Filter in-place to maintain memory efficiency
-        self._requests[identifier] = [ts for ts in request_timestamps if ts > window_start]
+    async def acheck_rate_limit(
+        self,
+        identifier: str,
+        config: RateLimitConfig,
+        scope: str = "",
+        endpoint: str | None = None,
+    ) -> tuple[bool, int]:
+        """Check a request against the shared backend, or in memory without one.
 
-        # Check if under limit
-        if len(self._requests[identifier]) < config.requests:
-            # Add current request
-            self._requests[identifier].append(current_time)
-            return True
+        Args:
+            identifier: Unique identifier (user_id or IP address).
+            config: Rate limit configuration.
+            scope: Budget the request counts against.
+            endpoint: Name the request is reported under in ``stats``
+                (defaults to ``scope``).
 
-        return False
+        Returns:
+            ``(allowed, retry_after_seconds)``; retry_after is 0 when allowed.
+        """
+        if self._shared_backend and time.monotonic() >= self._backend_unavailable_until:
+            try:
+                allowed, retry_after = await self._check_shared(identifier, config, scope)
+            except Exception:
+                self._backend_unavailable_until = time.monotonic() + _BACKEND_RETRY_SECONDS
+                logger.warning(
+                    "Shared rate limit backend unavailable, using in-memory counters",
+                    exc_info=True,
+                )
+            else:
+                label = scope if endpoint is None else endpoint
+                if allowed:
+                    self._allowed[label] += 1
+                else:
+                    self._rejected[label] += 1
+                return allowed, retry_after
+
+        if self.check_rate_limit(identifier, config, scope, endpoint):
+            return True, 0
+        return False, self.get_retry_after(identifier, config, scope)
+
+    async def _check_shared(
+        self,
+        identifier: str,
+        config: RateLimitConfig,
+        scope: str,
+    ) -> tuple[bool, int]:
+        from src.db.supabase import SupabaseClient, execute_async
+
+        result = await execute_async(
+            SupabaseClient.get_client().rpc(
+                "rate_limit_hit",
+                {
+                    "p_key": f"{scope}:{identifier}",
+                    "p_limit": config.requests,
+                    "p_window_seconds": config.window_seconds,
+                },
+            )
+        )
+        row = result.data[0] if isinstance(result.data, list) else result.data
+        if not isinstance(row, dict):
+            raise ValueError(f"Unexpected rate_limit_hit result: {result.data!r}")
+        if row["allowed"]:
+            return True, 0
+        retry_after = _seconds_until_allowed(
+            int(row["previous_hits"]),
+            int(row["current_hits"]),
+            config.requests,
+            float(row["window_start"]),
+            config.window_seconds,
+            time.time(),
+        )
+        return False, retry_after
 
     def get_retry_after(
         self,
         identifier: str,
         config: RateLimitConfig,
+        scope: str = "",
     ) -> int:
         """Get seconds until the next request will be allowed.
 
         Args:
             identifier: Unique identifier (user_id or IP address).
             config: Rate limit configuration.
+            scope: Budget the request counted against.
 
         Returns:
             Number of seconds until retry is allowed.
         """
-        if not self._requests[identifier]:
+        counter = self._requests.get((scope, identifier, config.window_seconds))
+        if counter is None:
             return 0
 
-        # Get the oldest request timestamp
-        oldest_timestamp = min(self._requests[identifier])
-        window_expiry = oldest_timestamp + config.window_seconds
-        retry_after = int(window_expiry - time.time())
-
-        return max(0, retry_after)
+        now = time.time()
+        counter.advance(int(now // config.window_seconds))
+        return _seconds_until_allowed(
+            counter.previous,
+            counter.current,
+            config.requests,
+            counter.window * config.window_seconds,
+            config.window_seconds,
+            now,
+        )
 
     def reset_for_user(self, identifier: str) -> None:
         """Reset rate limit for a specific user.
@@ -104,7 +287,8 @@ class RateLimitTracker:
         Args:
             identifier: Unique identifier (user_id or IP address).
         """
-        self._requests.pop(identifier, None)
+        for key in [key for key in self._requests if key[1] == identifier]:
+            del self._requests[key]
 
     def reset_all(self) -> None:
         """Reset all rate limits.
@@ -112,10 +296,52 @@ class RateLimitTracker:
         Useful for testing or manual intervention.
         """
         self._requests.clear()
+        self._allowed.clear()
+        self._rejected.clear()
+        self._evicted = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return tracked key count and per-endpoint allow/reject counts.
+
+        Returns:
+            Dict with tracked_keys, evicted_keys, and per-endpoint
+            allowed/rejected counts since startup (or the last reset).
+        """
+        return {
+            "tracked_keys": len(self._requests),
+            "evicted_keys": self._evicted,
+            "shared_backend": self._shared_backend
+            and time.monotonic() >= self._backend_unavailable_until,
+            "endpoints": {
+                scope: {"allowed": self._allowed[scope], "rejected": self._rejected[scope]}
+                for scope in sorted(set(self._allowed) | set(self._rejected))
+            },
+        }
+
+    def _sweep(self, now: float) -> None:
+        """Drop counters with no hits in the current or previous window."""
+        self._next_sweep = time.monotonic() + self._sweep_interval
+        idle = [
+            key
+            for key, counter in self._requests.items()
+            if int(now // key[2]) > counter.window + 1
+        ]
+        for key in idle:
+            del self._requests[key]
+        self._evicted += len(idle)
+
+
+def _create_global_tracker() -> RateLimitTracker:
+    settings = get_settings()
+    return RateLimitTracker(
+        max_keys=settings.RATE_LIMIT_MAX_KEYS,
+        sweep_interval=settings.RATE_LIMIT_SWEEP_SECONDS,
+        shared_backend=settings.RATE_LIMIT_BACKEND == "supabase",
+    )
 
 
 # Global rate limit tracker instance
-_global_tracker = RateLimitTracker()
+_global_tracker = _create_global_tracker()
 
 
 def get_rate_limit_config(path: str) -> RateLimitConfig:
@@ -181,15 +407,25 @@ def get_rate_limit_config(path: str) -> RateLimitConfig:
 def rate_limit(
     config: RateLimitConfig,
     tracker: RateLimitTracker | None = None,
+    scope: str | None = None,
 ) -> Callable[
     [Callable[..., Any]],
     Callable[..., Any],
 ]:
     """Decorator to apply rate limiting to an endpoint.
 
+    By default all decorated endpoints with the same window draw on one
+    budget per user or IP, so spreading requests over several endpoints
+    (e.g. login, signup and password reset) does not multiply the limit.
+    Pass ``scope`` to give an endpoint, or a group of endpoints sharing
+    the name, a budget of its own. Requests are reported in ``stats``
+    per endpoint, as ``<module>.<function>``, either way.
+
     Args:
         config: Rate limit configuration.
         tracker: Optional custom tracker (defaults to global tracker).
+        scope: Separate budget for this endpoint, or None to share the
+            per-identifier budget.
 
     Returns:
         Decorator function.
@@ -203,6 +439,9 @@ def rate_limit(
     def decorator(
         func: Callable[..., Any],
     ) -> Callable[..., Any]:
+        endpoint = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+        budget = scope or ""
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Extract request from args (first argument for route handlers)
@@ -234,10 +473,10 @@ def rate_limit(
                 identifier = client[0] if client else "unknown"
 
             # Check rate limit
-            if not active_tracker.check_rate_limit(identifier, config):
-                # Get retry_after value
-                retry_after = active_tracker.get_retry_after(identifier, config)
-
+            allowed, retry_after = await active_tracker.acheck_rate_limit(
+                identifier, config, budget, endpoint
+            )
+            if not allowed:
                 # Create limit string for error message
                 limit_str = f"{config.requests}/{config.window_seconds} seconds"
 
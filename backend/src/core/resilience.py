@@ -21,6 +21,8 @@ from typing import Any, ParamSpec, TypeVar
 
 import httpx
 
+from src.core.timing import GRAPHITI, LLM, track_dependency
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -73,6 +75,8 @@ class CircuitBreaker:
         failure_threshold: Consecutive failures before opening the circuit.
         recovery_timeout: Seconds to wait in OPEN before moving to HALF_OPEN.
         success_threshold: Consecutive successes in HALF_OPEN needed to close.
+        dependency: Dependency name ``call()`` timings are recorded under
+            (see ``src.core.timing``), or None to not time calls.
     """
 
     def __init__(
@@ -81,8 +85,10 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 60.0,
         success_threshold: int = 3,
+        dependency: str | None = None,
     ) -> None:
         self.service_name = service_name
+        self.dependency = dependency
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.success_threshold = success_threshold
@@ -203,10 +209,11 @@ class CircuitBreaker:
         """
         self.check()
         try:
-            result = await asyncio.wait_for(
-                func(*args, **kwargs),
-                timeout=timeout,
-            )
+            if self.dependency is None:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
+            else:
+                with track_dependency(self.dependency, getattr(func, "__qualname__", None)):
+                    result = await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
         except asyncio.TimeoutError:
             logger.warning(
                 "Circuit breaker call to %s timed out after %.1fs",
@@ -268,12 +275,19 @@ composio_crm_circuit_breaker = CircuitBreaker(
 )
 claude_api_circuit_breaker = CircuitBreaker(
     "claude_api", failure_threshold=5, recovery_timeout=60.0, success_threshold=3,
+    dependency=LLM,
 )
 supabase_circuit_breaker = CircuitBreaker(
     "supabase", failure_threshold=10, recovery_timeout=30.0, success_threshold=3,
 )
 graphiti_circuit_breaker = CircuitBreaker(
     "graphiti_neo4j", failure_threshold=3, recovery_timeout=60.0, success_threshold=3,
+    dependency=GRAPHITI,
+)
+# Background episode ingestion (src/db/graphiti_queue.py): slow bulk batches
+# failing must not open the breaker interactive memory reads go through
+graphiti_queue_circuit_breaker = CircuitBreaker(
+    "graphiti_queue", failure_threshold=3, recovery_timeout=120.0, success_threshold=1,
 )
 thesys_circuit_breaker = CircuitBreaker(
     "thesys_c1", failure_threshold=5, recovery_timeout=60.0, success_threshold=3,
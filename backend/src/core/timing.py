@@ -0,0 +1,346 @@
+"""Latency histograms and per-dependency timing.
+
+Provides:
+- LogHistogram: fixed-memory, log-bucketed latency histogram. Percentiles
+  are accurate to within the bucket growth factor (about 4%) no matter
+  how many samples are recorded.
+- RollingHistogram: a cumulative LogHistogram plus a recent window.
+- track_dependency: context manager timing a call to an external
+  dependency (Supabase, LLM, Graphiti, Composio, Exa). Each call is
+  recorded in ``dependency_stats``, attributed to the current request
+  through a contextvar, and logged with ``[SLOW_QUERY]`` when it takes
+  longer than SLOW_QUERY_THRESHOLD_MS.
+- httpx_timing_hooks: httpx event hooks that time every request a client
+  sends as one dependency.
+
+``RequestTimingMiddleware`` (src/middleware/performance.py) opens a
+``RequestTimings`` scope per request and reports the per-dependency
+breakdown in its stats and a ``Server-Timing`` response header.
+"""
+
+import logging
+import math
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_THRESHOLD_MS = 500.0
+
+# Histogram range and resolution. Samples outside the range are clamped
+# into the first/last bucket, which caps memory at ~530 buckets.
+_HIST_MIN_MS = 0.01
+_HIST_MAX_MS = 10_000_000.0  # ~2.8 hours
+_HIST_GROWTH = 1.04
+_LOG_GROWTH = math.log(_HIST_GROWTH)
+_MAX_INDEX = math.ceil(math.log(_HIST_MAX_MS / _HIST_MIN_MS) / _LOG_GROWTH)
+
+# Known dependency names
+SUPABASE = "supabase"
+LLM = "llm"
+GRAPHITI = "graphiti"
+COMPOSIO = "composio"
+EXA = "exa"
+
+
+def _bucket_index(value_ms: float) -> int:
+    if value_ms <= _HIST_MIN_MS:
+        return 0
+    return min(_MAX_INDEX, math.ceil(math.log(value_ms / _HIST_MIN_MS) / _LOG_GROWTH))
+
+
+def _bucket_upper_bound(index: int) -> float:
+    return _HIST_MIN_MS * _HIST_GROWTH**index
+
+
+class LogHistogram:
+    """Log-bucketed histogram of millisecond durations.
+
+    Bucket ``i`` holds samples in ``(min * g**(i-1), min * g**i]``. Only
+    non-empty buckets are stored.
+    """
+
+    __slots__ = ("_buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Add one sample."""
+        index = _bucket_index(value_ms)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value_ms
+        if value_ms > self.max:
+            self.max = value_ms
+
+    def merge(self, other: "LogHistogram") -> None:
+        """Add every sample of ``other`` to this histogram."""
+        for index, n in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, pct: float) -> float:
+        """Return the *pct*-th percentile (upper bound of its bucket, capped at max)."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(_bucket_upper_bound(index), self.max)
+        return self.max
+
+    def count_at_or_below(self, bound_ms: float) -> int:
+        """Number of samples ``<= bound_ms``, to bucket resolution."""
+        limit = _bucket_index(bound_ms)
+        return sum(n for index, n in self._buckets.items() if index <= limit)
+
+    def summary(self) -> dict[str, Any]:
+        """Count, mean and p50/p95/p99/max in milliseconds."""
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 2) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 2),
+            "p95_ms": round(self.percentile(95), 2),
+            "p99_ms": round(self.percentile(99), 2),
+            "max_ms": round(self.max, 2),
+        }
+
+
+class RollingHistogram:
+    """Cumulative histogram plus a window covering the last one to two intervals.
+
+    The cumulative histogram feeds counters that must never go down
+    (Prometheus); the window keeps percentiles current.
+    """
+
+    __slots__ = ("_clock", "_current", "_interval", "_previous", "_rotated_at", "total")
+
+    def __init__(
+        self,
+        interval_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.total = LogHistogram()
+        self._interval = interval_seconds
+        self._clock = clock
+        self._current = LogHistogram()
+        self._previous = LogHistogram()
+        self._rotated_at = clock()
+
+    def record(self, value_ms: float) -> None:
+        """Add one sample."""
+        self._rotate()
+        self.total.record(value_ms)
+        self._current.record(value_ms)
+
+    def recent(self) -> LogHistogram:
+        """Samples from the current and previous intervals."""
+        self._rotate()
+        merged = LogHistogram()
+        merged.merge(self._previous)
+        merged.merge(self._current)
+        return merged
+
+    def _rotate(self) -> None:
+        now = self._clock()
+        elapsed = now - self._rotated_at
+        if elapsed < self._interval:
+            return
+        # After two idle intervals the previous window is stale too
+        self._previous = self._current if elapsed < 2 * self._interval else LogHistogram()
+        self._current = LogHistogram()
+        self._rotated_at = now
+
+
+class DependencyStats:
+    """Thread-safe latency histograms per dependency."""
+
+    def __init__(self, interval_seconds: float = 300.0) -> None:
+        self._interval = interval_seconds
+        self._histograms: dict[str, RollingHistogram] = {}
+        self._errors: dict[str, int] = {}
+        self._slow: dict[str, int] = {}
+        self._lock = Lock()
+
+    def record(self, dependency: str, duration_ms: float, error: bool = False) -> None:
+        """Record one call."""
+        with self._lock:
+            histogram = self._histograms.get(dependency)
+            if histogram is None:
+                histogram = self._histograms[dependency] = RollingHistogram(self._interval)
+            histogram.record(duration_ms)
+            if error:
+                self._errors[dependency] = self._errors.get(dependency, 0) + 1
+            if duration_ms >= SLOW_QUERY_THRESHOLD_MS:
+                self._slow[dependency] = self._slow.get(dependency, 0) + 1
+
+    def summarize(self) -> dict[str, dict[str, Any]]:
+        """Recent percentiles plus lifetime call, error and slow counts per dependency."""
+        with self._lock:
+            return {
+                name: {
+                    **histogram.recent().summary(),
+                    "total_calls": histogram.total.count,
+                    "errors": self._errors.get(name, 0),
+                    "slow_calls": self._slow.get(name, 0),
+                }
+                for name, histogram in sorted(self._histograms.items())
+            }
+
+    def cumulative(self) -> dict[str, LogHistogram]:
+        """Copies of the lifetime histograms, for export."""
+        with self._lock:
+            copies: dict[str, LogHistogram] = {}
+            for name, histogram in self._histograms.items():
+                copies[name] = LogHistogram()
+                copies[name].merge(histogram.total)
+            return copies
+
+    def errors(self) -> dict[str, int]:
+        """Lifetime error counts per dependency."""
+        with self._lock:
+            return dict(self._errors)
+
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+            self._slow.clear()
+
+
+# Module-level singleton shared by the instrumentation points and the stats endpoint.
+dependency_stats = DependencyStats()
+
+
+@dataclass
+class RequestTimings:
+    """Dependency time spent inside one request."""
+
+    request_id: str = "unknown"
+    durations_ms: dict[str, float] = field(default_factory=dict)
+    calls: dict[str, int] = field(default_factory=dict)
+
+    def add(self, dependency: str, duration_ms: float) -> None:
+        self.durations_ms[dependency] = self.durations_ms.get(dependency, 0.0) + duration_ms
+        self.calls[dependency] = self.calls.get(dependency, 0) + 1
+
+    def server_timing(self) -> str:
+        """Format as a ``Server-Timing`` header value."""
+        return ", ".join(
+            f'{name};dur={duration:.2f};desc="{self.calls[name]} calls"'
+            for name, duration in sorted(self.durations_ms.items())
+        )
+
+
+_request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_request_timings() -> RequestTimings | None:
+    """Return the timings of the request being served, if any."""
+    return _request_timings.get()
+
+
+@contextmanager
+def request_timing_scope(request_id: str) -> Iterator[RequestTimings]:
+    """Attribute dependency calls made inside the block to one request."""
+    timings = RequestTimings(request_id=request_id)
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def record_dependency(
+    dependency: str,
+    duration_ms: float,
+    operation: str | None = None,
+    error: bool = False,
+) -> None:
+    """Record a finished dependency call.
+
+    Args:
+        dependency: Dependency name, e.g. ``SUPABASE``.
+        duration_ms: Call duration in milliseconds.
+        operation: What was called (table, model, endpoint), for slow-query logs.
+        error: Whether the call raised.
+    """
+    dependency_stats.record(dependency, duration_ms, error=error)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(dependency, duration_ms)
+
+    if duration_ms >= SLOW_QUERY_THRESHOLD_MS:
+        logger.warning(
+            "[SLOW_QUERY] %s %s took %.2f ms [request_id=%s]",
+            dependency,
+            operation or "-",
+            duration_ms,
+            timings.request_id if timings is not None else "none",
+        )
+
+
+@contextmanager
+def track_dependency(dependency: str, operation: str | None = None) -> Iterator[None]:
+    """Time the enclosed call to an external dependency.
+
+    Usage:
+        with track_dependency(SUPABASE, "goals"):
+            result = await execute_async(query)
+    """
+    start = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        record_dependency(
+            dependency, (time.perf_counter() - start) * 1000.0, operation, error=error
+        )
+
+
+def httpx_timing_hooks(
+    dependency: str,
+) -> dict[str, list[Callable[[Any], Awaitable[None]]]]:
+    """Event hooks for an ``httpx.AsyncClient`` that time each request.
+
+    Time is measured until the response headers arrive. Requests that
+    fail without a response are not recorded.
+
+    Usage:
+        httpx.AsyncClient(event_hooks=httpx_timing_hooks(EXA))
+    """
+
+    async def on_request(request: httpx.Request) -> None:
+        request.extensions["timing_start"] = time.perf_counter()
+
+    async def on_response(response: httpx.Response) -> None:
+        start = response.request.extensions.get("timing_start")
+        if start is None:
+            return
+        record_dependency(
+            dependency,
+            (time.perf_counter() - start) * 1000.0,
+            operation=response.request.url.path,
+            error=response.status_code >= 500,
+        )
+
+    return {"request": [on_request], "response": [on_response]}
@@ -1,7 +1,7 @@
 """LLM usage logging to Supabase for cost tracking and analytics."""
 
 import logging
-from typing import Optional
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +17,23 @@ class UsageLogger:
     def __init__(self, supabase_client):
         self.db = supabase_client
 
+    def log_nowait(self, **kwargs: Any) -> bool:
+        """Hand a usage event to the write-behind buffer without awaiting.
+
+        Accepts the same keyword arguments as :meth:`log`.
+
+        Returns:
+            True if the buffer accepted the event, False if it is not
+            running and the caller should fall back to :meth:`log`.
+        """
+        from src.core.usage_writer import get_usage_write_buffer
+
+        try:
+            return get_usage_write_buffer().enqueue_llm_usage(build_usage_row(**kwargs))
+        except Exception as e:
+            logger.warning(f"Failed to buffer LLM usage: {e}")
+            return False
+
     async def log(
         self,
         tenant_id: str = "",
@@ -34,6 +51,9 @@ class UsageLogger:
     ):
         """Log an LLM usage event to the database.
 
+        Goes through the write-behind buffer when it is running, otherwise
+        inserts the row directly.
+
         Args:
             tenant_id: Tenant/company UUID for multi-tenant isolation.
             user_id: User UUID who initiated the request.
@@ -49,29 +69,67 @@ class UsageLogger:
             cached_tokens: Number of tokens served from cache (if applicable).
         """
         try:
-            provider = model.split("/")[0] if "/" in model else "anthropic"
-            rates = PRICING.get(model, {"input": 3.00, "output": 15.00})
-            input_cost = (input_tokens / 1_000_000) * rates["input"]
-            output_cost = (output_tokens / 1_000_000) * rates["output"]
-
-            self.db.table("llm_usage").insert({
-                "tenant_id": tenant_id or None,
-                "user_id": user_id or None,
-                "agent_id": agent_id,
-                "task_type": task_type,
-                "goal_id": goal_id or None,
-                "model": model,
-                "provider": provider,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "total_tokens": input_tokens + output_tokens,
-                "cached_tokens": cached_tokens,
-                "input_cost_usd": float(input_cost),
-                "output_cost_usd": float(output_cost),
-                "total_cost_usd": float(input_cost + output_cost),
-                "latency_ms": latency_ms,
-                "status": status,
-                "error_message": error_message,
-            }).execute()
+            from src.core.usage_writer import get_usage_write_buffer
+            from src.db.supabase import execute_async
+
+            row = build_usage_row(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                agent_id=agent_id,
+                task_type=task_type,
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                latency_ms=latency_ms,
+                status=status,
+                error_message=error_message,
+                goal_id=goal_id,
+                cached_tokens=cached_tokens,
+            )
+            if get_usage_write_buffer().enqueue_llm_usage(row):
+                return
+
+            await execute_async(self.db.table("llm_usage").insert(row))
         except Exception as e:
             logger.warning(f"Failed to log LLM usage: {e}")
+
+
+def build_usage_row(
+    tenant_id: str = "",
+    user_id: str = "",
+    agent_id: str = "general",
+    task_type: str = "general",
+    model: str = "",
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    latency_ms: int = 0,
+    status: str = "success",
+    error_message: str = None,
+    goal_id: str = None,
+    cached_tokens: int = 0,
+) -> dict[str, Any]:
+    """Build an ``llm_usage`` row with computed provider and cost columns."""
+    provider = model.split("/")[0] if "/" in model else "anthropic"
+    rates = PRICING.get(model, {"input": 3.00, "output": 15.00})
+    input_cost = (input_tokens / 1_000_000) * rates["input"]
+    output_cost = (output_tokens / 1_000_000) * rates["output"]
+
+    return {
+        "tenant_id": tenant_id or None,
+        "user_id": user_id or None,
+        "agent_id": agent_id,
+        "task_type": task_type,
+        "goal_id": goal_id or None,
+        "model": model,
+        "provider": provider,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+        "cached_tokens": cached_tokens,
+        "input_cost_usd": float(input_cost),
+        "output_cost_usd": float(output_cost),
+        "total_cost_usd": float(input_cost + output_cost),
+        "latency_ms": latency_ms,
+        "status": status,
+        "error_message": error_message,
+    }
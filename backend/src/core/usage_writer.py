@@ -0,0 +1,381 @@
+"""Write-behind buffer for LLM usage accounting.
+
+Every LLM call produces two writes: an ``llm_usage`` analytics row
+(UsageLogger) and a ``usage_tracking`` increment (CostGovernor). Doing both
+inline doubles DB round trips on the hottest path, so while the buffer is
+running both are queued here instead:
+
+- ``llm_usage`` rows are flushed as chunked bulk inserts.
+- ``usage_tracking`` deltas are coalesced per (user_id, date) and flushed
+  with one ``increment_usage_tracking_batch`` RPC.
+
+A flush fires when ``batch_size`` events are pending or every
+``flush_interval`` seconds, whichever comes first. The buffer is bounded:
+once ``max_pending`` rows are queued, new rows are dropped and counted.
+When the buffer is not running (scripts, tests, shutdown), ``enqueue_*``
+returns False and callers write directly.
+
+Usage:
+    # In FastAPI startup
+    await get_usage_write_buffer().start()
+
+    # In FastAPI shutdown (drains pending writes)
+    await get_usage_write_buffer().stop()
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from src.core.cost_governor import LLMUsage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UsageDelta:
+    """Coalesced usage_tracking increment for one user on one day."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    thinking_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    estimated_cost: float = 0.0
+    request_count: int = 0
+
+    def add(self, usage: LLMUsage, request_count: int = 1) -> None:
+        """Fold one LLM call's usage into this delta."""
+        self.input_tokens += usage.input_tokens
+        self.output_tokens += usage.output_tokens
+        self.thinking_tokens += usage.thinking_tokens
+        self.cache_read_tokens += usage.cache_read_tokens
+        self.cache_creation_tokens += usage.cache_creation_tokens
+        self.estimated_cost += usage.estimated_cost_usd
+        self.request_count += request_count
+
+    def merge(self, other: "UsageDelta") -> None:
+        """Fold another delta (e.g. a failed flush) into this one."""
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.thinking_tokens += other.thinking_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        self.estimated_cost += other.estimated_cost
+        self.request_count += other.request_count
+
+
+class UsageWriteBuffer:
+    """Bounded in-process write-behind buffer for usage writes."""
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        flush_interval: float = 2.0,
+        max_pending: int = 10_000,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            batch_size: Pending events that trigger an early flush; also the
+                chunk size for bulk ``llm_usage`` inserts.
+            flush_interval: Maximum seconds between flushes.
+            max_pending: Maximum queued ``llm_usage`` rows before dropping.
+        """
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+
+        self._rows: list[dict[str, Any]] = []
+        self._deltas: dict[tuple[str, str], UsageDelta] = {}
+        # Deltas taken by the flush in progress, until its RPC succeeds
+        self._flushing: dict[tuple[str, str], UsageDelta] = {}
+        self._pending_events = 0
+
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._flush_lock: asyncio.Lock | None = None
+
+        # Metrics
+        self._flush_count = 0
+        self._rows_written = 0
+        self._deltas_written = 0
+        self._dropped = 0
+        self._failed_flushes = 0
+        self._last_flush_ms = 0.0
+        self._max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background flusher is accepting events."""
+        return self._running
+
+    @property
+    def queue_depth(self) -> int:
+        """Rows plus coalesced deltas waiting to be written."""
+        return len(self._rows) + len(self._deltas)
+
+    # -- Lifecycle -------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background flush loop. No-op if already running."""
+        if self._running:
+            return
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+        logger.info(
+            "Usage write buffer started (batch=%d, interval=%.1fs, max_pending=%d)",
+            self._batch_size,
+            self._flush_interval,
+            self._max_pending,
+        )
+
+    async def stop(self) -> None:
+        """Stop accepting events and drain everything still pending."""
+        if not self._running:
+            return
+        self._running = False
+
+        if self._task:
+            # Wake the loop and let any in-flight flush finish instead of
+            # cancelling it mid-write; the loop exits once it sees the flag.
+            if self._wakeup is not None:
+                self._wakeup.set()
+            await self._task
+            self._task = None
+
+        await self.flush()
+        if self.queue_depth:
+            logger.warning("Usage write buffer stopped with %d unwritten events", self.queue_depth)
+        logger.info("Usage write buffer stopped")
+
+    # -- Producers -------------------------------------------------------------
+
+    def enqueue_llm_usage(self, row: dict[str, Any]) -> bool:
+        """Queue one ``llm_usage`` row.
+
+        Returns:
+            True if the buffer took ownership of the row, False if the
+            caller should write it directly (buffer not running).
+        """
+        if not self._running:
+            return False
+        if len(self._rows) >= self._max_pending:
+            # Accepted but discarded — falling back to a direct write here
+            # would reintroduce the per-call round trip under exactly the
+            # load that filled the buffer.
+            self._dropped += 1
+            if self._dropped % 1000 == 1:
+                logger.warning("Usage write buffer full; dropped %d llm_usage rows", self._dropped)
+            return True
+        self._rows.append(row)
+        self._note_event()
+        return True
+
+    def enqueue_usage_delta(self, user_id: str, usage: LLMUsage) -> bool:
+        """Coalesce one LLM call into the user's usage_tracking delta for today.
+
+        Returns:
+            True if the buffer took ownership of the delta, False if the
+            caller should write it directly (buffer not running).
+        """
+        if not self._running:
+            return False
+        key = (user_id, date.today().isoformat())
+        delta = self._deltas.get(key)
+        if delta is None:
+            delta = self._deltas[key] = UsageDelta()
+        delta.add(usage)
+        self._note_event()
+        return True
+
+    def pending_delta(self, user_id: str) -> UsageDelta | None:
+        """Return today's not-yet-persisted delta for a user, if any.
+
+        Includes usage taken by a flush whose RPC has not succeeded yet.
+        """
+        key = (user_id, date.today().isoformat())
+        queued = self._deltas.get(key)
+        flushing = self._flushing.get(key)
+        if flushing is None:
+            return queued
+        total = UsageDelta()
+        total.merge(flushing)
+        if queued is not None:
+            total.merge(queued)
+        return total
+
+    def _note_event(self) -> None:
+        self._pending_events += 1
+        if self._pending_events >= self._batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    # -- Flushing --------------------------------------------------------------
+
+    async def _flush_loop(self) -> None:
+        """Flush on the size trigger or every ``flush_interval`` seconds."""
+        assert self._wakeup is not None
+        while self._running:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Usage write buffer flush loop error")
+
+    async def flush(self) -> None:
+        """Write all pending rows and deltas. Failed batches are re-queued."""
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            rows, self._rows = self._rows, []
+            deltas, self._deltas = self._deltas, {}
+            self._pending_events = 0
+            if not rows and not deltas:
+                return
+
+            self._flushing = deltas
+            start = time.perf_counter()
+            try:
+                ok = await self._write(rows, deltas)
+            finally:
+                # Whatever did not land goes back, including when the flush
+                # is cancelled mid-write, so the next flush still has it.
+                self._flushing = {}
+                self._requeue(rows, deltas)
+
+            elapsed_ms = (time.perf_counter() - start) * 1000.0
+            self._flush_count += 1
+            self._failed_flushes += int(not ok)
+            self._last_flush_ms = elapsed_ms
+            self._max_flush_ms = max(self._max_flush_ms, elapsed_ms)
+            self._total_flush_ms += elapsed_ms
+
+    async def _write(
+        self,
+        rows: list[dict[str, Any]],
+        deltas: dict[tuple[str, str], UsageDelta],
+    ) -> bool:
+        """Write ``rows`` and ``deltas``, removing each from its container once written.
+
+        Returns:
+            True if everything was written.
+        """
+        try:
+            from src.db.supabase import SupabaseClient
+
+            client = await SupabaseClient.get_async_client()
+        except Exception:
+            logger.exception("Usage write buffer could not get a database client")
+            return False
+
+        ok = True
+        while rows:
+            chunk = rows[: self._batch_size]
+            try:
+                await client.table("llm_usage").insert(chunk).execute()
+            except Exception:
+                logger.exception("Bulk llm_usage insert failed (%d rows)", len(chunk))
+                ok = False
+                break
+            del rows[: len(chunk)]
+            self._rows_written += len(chunk)
+
+        if deltas:
+            try:
+                await client.rpc(
+                    "increment_usage_tracking_batch",
+                    {"p_rows": _delta_payload(deltas)},
+                ).execute()
+            except Exception:
+                logger.exception("Batched usage_tracking increment failed (%d users)", len(deltas))
+                return False
+            self._deltas_written += len(deltas)
+            deltas.clear()
+        return ok
+
+    def _requeue(
+        self,
+        rows: list[dict[str, Any]],
+        deltas: dict[tuple[str, str], UsageDelta],
+    ) -> None:
+        """Put unwritten work back, respecting the row bound."""
+        room = max(0, self._max_pending - len(self._rows))
+        self._rows[:0] = rows[:room]
+        self._dropped += max(0, len(rows) - room)
+        for key, delta in deltas.items():
+            existing = self._deltas.get(key)
+            if existing is None:
+                self._deltas[key] = delta
+            else:
+                existing.merge(delta)
+
+    # -- Metrics ---------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of queue depth and flush latency for the perf stats endpoint."""
+        return {
+            "running": self._running,
+            "queue_depth": self.queue_depth,
+            "pending_rows": len(self._rows),
+            "pending_deltas": len(self._deltas),
+            "flushes": self._flush_count,
+            "failed_flushes": self._failed_flushes,
+            "rows_written": self._rows_written,
+            "deltas_written": self._deltas_written,
+            "dropped": self._dropped,
+            "last_flush_ms": round(self._last_flush_ms, 2),
+            "max_flush_ms": round(self._max_flush_ms, 2),
+            "avg_flush_ms": round(self._total_flush_ms / self._flush_count, 2)
+            if self._flush_count
+            else 0.0,
+        }
+
+
+def _delta_payload(deltas: dict[tuple[str, str], UsageDelta]) -> list[dict[str, Any]]:
+    """Serialize coalesced deltas for ``increment_usage_tracking_batch``."""
+    return [
+        {
+            "user_id": user_id,
+            "date": day,
+            "input_tokens": d.input_tokens,
+            "output_tokens": d.output_tokens,
+            "thinking_tokens": d.thinking_tokens,
+            "cache_read_tokens": d.cache_read_tokens,
+            "cache_creation_tokens": d.cache_creation_tokens,
+            "estimated_cost": d.estimated_cost,
+            "request_count": d.request_count,
+        }
+        for (user_id, day), d in deltas.items()
+    ]
+
+
+# Singleton instance
+_usage_write_buffer: UsageWriteBuffer | None = None
+
+
+def get_usage_write_buffer() -> UsageWriteBuffer:
+    """Get or create the usage write-behind buffer singleton.
+
+    Returns:
+        The shared UsageWriteBuffer instance.
+    """
+    global _usage_write_buffer
+    if _usage_write_buffer is None:
+        from src.core.config import get_settings
+
+        s = get_settings()
+        _usage_write_buffer = UsageWriteBuffer(
+            batch_size=s.USAGE_WRITE_BATCH_SIZE,
+            flush_interval=s.USAGE_WRITE_FLUSH_INTERVAL,
+            max_pending=s.USAGE_WRITE_MAX_PENDING,
+        )
+    return _usage_write_buffer
@@ -1,11 +1,19 @@
 """WebSocket ConnectionManager for ARIA real-time communication.
 
 Per-user connection tracking. No global broadcast — multi-tenant isolation.
+
+With several workers, a user's sockets may live in another process. Once
+a ``ClusterBus`` is attached, each worker publishes which users it holds
+connections for (presence), so ``is_connected`` answers for the whole
+cluster, and events for users connected elsewhere are relayed there.
 """
 
+import asyncio
+import contextlib
 import logging
+import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import WebSocket
 
@@ -13,9 +21,11 @@ from src.models.ws_events import (
     ActionExecutedEvent,
     ActionPendingEvent,
     ActionUndoneEvent,
+    ActivityEvent,
     AriaMessageEvent,
     ExecutionCompleteEvent,
     IntegrationConnectedEvent,
+    NotificationEvent,
     ProgressUpdateEvent,
     RecommendationEvent,
     SignalEvent,
@@ -23,11 +33,22 @@ from src.models.ws_events import (
     StepRetryingEvent,
     StepStartedEvent,
     ThinkingEvent,
+    UnreadCountEvent,
     WSEvent,
 )
 
+if TYPE_CHECKING:
+    from src.core.cluster import ClusterBus
+
 logger = logging.getLogger(__name__)
 
+# ClusterBus channels: events for a user's sockets, and per-worker presence
+_DELIVER_CHANNEL = "ws.deliver"
+_PRESENCE_CHANNEL = "ws.presence"
+
+# A peer whose presence hasn't been refreshed for this many intervals is gone
+_PRESENCE_EXPIRY_INTERVALS = 3
+
 
 class ConnectionManager:
     """Manages active WebSocket connections per user.
@@ -41,6 +62,12 @@ class ConnectionManager:
         """Initialize with empty connection registry."""
         self._connections: dict[str, set[WebSocket]] = {}
         self._last_disconnect: dict[str, datetime] = {}
+        # Cross-worker state (empty until attach_cluster)
+        self._cluster: ClusterBus | None = None
+        self._presence_task: asyncio.Task[None] | None = None
+        self._peer_users: dict[str, set[str]] = {}  # worker id -> user ids
+        self._peer_seen: dict[str, float] = {}  # worker id -> monotonic time
+        self._remote_users: dict[str, set[str]] = {}  # user id -> worker ids
 
     async def connect(
         self,
@@ -58,6 +85,7 @@ class ConnectionManager:
         was_offline = not self.is_connected(user_id)
         if user_id not in self._connections:
             self._connections[user_id] = set()
+            self._publish_presence(user_id, online=True)
         self._connections[user_id].add(websocket)
         logger.info(
             "WebSocket connected",
@@ -83,6 +111,7 @@ class ConnectionManager:
         if not connections and user_id in self._connections:
             del self._connections[user_id]
             self._last_disconnect[user_id] = datetime.now(UTC)
+            self._publish_presence(user_id, online=False)
         logger.info(
             "WebSocket disconnected",
             extra={
@@ -92,7 +121,7 @@ class ConnectionManager:
         )
 
     def is_connected(self, user_id: str) -> bool:
-        """Check if a user has any active connections.
+        """Check if a user has any active connections, on any worker.
 
         Args:
             user_id: The user's ID.
@@ -100,7 +129,7 @@ class ConnectionManager:
         Returns:
             True if user has at least one active connection.
         """
-        return len(self._connections.get(user_id, set())) > 0
+        return bool(self._connections.get(user_id)) or user_id in self._remote_users
 
     def get_absence_duration_seconds(self, user_id: str) -> float | None:
         """Get how long a user has been disconnected, in seconds.
@@ -126,25 +155,9 @@ class ConnectionManager:
             user_id: The user to send to.
             event: The WSEvent to serialize and send.
         """
-        connections = self._connections.get(user_id, set())
-        if not connections:
+        if not self.is_connected(user_id):
             return
-
-        dead: list[WebSocket] = []
-        data = event.to_ws_dict()
-
-        for ws in connections:
-            try:
-                await ws.send_json(data)
-            except Exception:
-                logger.warning(
-                    "Failed to send WebSocket event, removing dead connection",
-                    extra={"user_id": user_id, "event_type": event.type},
-                )
-                dead.append(ws)
-
-        for ws in dead:
-            self.disconnect(user_id, ws)
+        await self.send_raw_to_user(user_id, event.to_ws_dict())
 
     async def send_raw_to_user(self, user_id: str, data: dict[str, Any]) -> None:
         """Send a raw dict payload to all of a user's active connections.
@@ -157,17 +170,23 @@ class ConnectionManager:
             user_id: The user to send to.
             data: Raw dict payload to send as JSON.
         """
-        connections = self._connections.get(user_id, set())
+        if user_id in self._remote_users and self._cluster is not None:
+            self._cluster.publish(_DELIVER_CHANNEL, {"user_id": user_id, "data": data})
+        await self._send_local(user_id, data)
+
+    async def _send_local(self, user_id: str, data: dict[str, Any]) -> None:
+        """Send a payload to the user's connections on this worker."""
+        connections = self._connections.get(user_id)
         if not connections:
             return
 
         dead: list[WebSocket] = []
-        for ws in connections:
+        for ws in list(connections):
             try:
                 await ws.send_json(data)
             except Exception:
                 logger.warning(
-                    "Failed to send raw WebSocket event, removing dead connection",
+                    "Failed to send WebSocket event, removing dead connection",
                     extra={"user_id": user_id, "event_type": data.get("type", "unknown")},
                 )
                 dead.append(ws)
@@ -221,8 +240,102 @@ class ConnectionManager:
             "total_users": len(self._connections),
             "total_connections": sum(per_user.values()),
             "per_user": per_user,
+            "remote_users": len(self._remote_users),
+            "peer_workers": len(self._peer_seen),
         }
 
+    # --- Cross-worker presence and relay ---
+
+    def attach_cluster(self, cluster: "ClusterBus", presence_interval: float = 15.0) -> None:
+        """Share presence and relay events with the other workers.
+
+        Does nothing useful until the cluster bus is distributed; calling
+        it with a local-only bus is harmless.
+
+        Args:
+            cluster: The worker's ClusterBus.
+            presence_interval: Seconds between full presence snapshots.
+        """
+        if self._cluster is not None:
+            return
+        self._cluster = cluster
+        cluster.subscribe(_DELIVER_CHANNEL, self._on_remote_deliver)
+        cluster.subscribe(_PRESENCE_CHANNEL, self._on_remote_presence)
+        if cluster.distributed:
+            self._presence_task = asyncio.create_task(self._presence_loop(presence_interval))
+
+    async def detach_cluster(self) -> None:
+        """Stop sharing presence and forget every peer."""
+        if self._presence_task is not None:
+            self._presence_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._presence_task
+            self._presence_task = None
+        if self._cluster is not None:
+            self._cluster.publish(_PRESENCE_CHANNEL, {"users": [], "leaving": True})
+            self._cluster.unsubscribe(_DELIVER_CHANNEL, self._on_remote_deliver)
+            self._cluster.unsubscribe(_PRESENCE_CHANNEL, self._on_remote_presence)
+            self._cluster = None
+        self._peer_users.clear()
+        self._peer_seen.clear()
+        self._remote_users.clear()
+
+    def _publish_presence(self, user_id: str, online: bool) -> None:
+        if self._cluster is not None:
+            self._cluster.publish(_PRESENCE_CHANNEL, {"user_id": user_id, "online": online})
+
+    async def _presence_loop(self, interval: float) -> None:
+        while True:
+            if self._cluster is not None:
+                self._cluster.publish(_PRESENCE_CHANNEL, {"users": list(self._connections)})
+            self._expire_peers(time.monotonic() - interval * _PRESENCE_EXPIRY_INTERVALS)
+            await asyncio.sleep(interval)
+
+    def _expire_peers(self, cutoff: float) -> None:
+        for worker_id, seen_at in list(self._peer_seen.items()):
+            if seen_at < cutoff:
+                self._set_peer_users(worker_id, set())
+                del self._peer_seen[worker_id]
+
+    def _set_peer_users(self, worker_id: str, users: set[str]) -> None:
+        previous = self._peer_users.get(worker_id, set())
+        for user_id in previous - users:
+            workers = self._remote_users.get(user_id)
+            if workers is not None:
+                workers.discard(worker_id)
+                if not workers:
+                    del self._remote_users[user_id]
+        for user_id in users - previous:
+            self._remote_users.setdefault(user_id, set()).add(worker_id)
+        if users:
+            self._peer_users[worker_id] = users
+        else:
+            self._peer_users.pop(worker_id, None)
+
+    async def _on_remote_presence(self, payload: dict[str, Any], origin: str) -> None:
+        if payload.get("leaving"):
+            self._set_peer_users(origin, set())
+            self._peer_seen.pop(origin, None)
+            return
+        if origin not in self._peer_seen and self._cluster is not None:
+            # New peer: send our snapshot now rather than at the next tick
+            self._cluster.publish(_PRESENCE_CHANNEL, {"users": list(self._connections)})
+        self._peer_seen[origin] = time.monotonic()
+        if "users" in payload:
+            self._set_peer_users(origin, set(payload["users"]))
+            return
+        users = set(self._peer_users.get(origin, set()))
+        if payload.get("online"):
+            users.add(payload["user_id"])
+        else:
+            users.discard(payload["user_id"])
+        self._set_peer_users(origin, users)
+
+    async def _on_remote_deliver(self, payload: dict[str, Any], _origin: str) -> None:
+        user_id, data = payload.get("user_id"), payload.get("data")
+        if isinstance(user_id, str) and isinstance(data, dict):
+            await self._send_local(user_id, data)
+
     # --- Typed send helpers ---
 
     async def send_aria_message(
@@ -451,6 +564,27 @@ class ConnectionManager:
         )
         await self.send_to_user(user_id, event)
 
+    async def send_activity(self, user_id: str, activity: dict[str, Any]) -> None:
+        """Send a new activity feed entry."""
+        if self.is_connected(user_id):
+            await self.send_to_user(user_id, ActivityEvent(activity=activity))
+
+    async def send_notification(
+        self,
+        user_id: str,
+        notification: dict[str, Any],
+        unread_count: int | None = None,
+    ) -> None:
+        """Send a new notification with the user's unread count, if known."""
+        if self.is_connected(user_id):
+            event = NotificationEvent(notification=notification, unread_count=unread_count)
+            await self.send_to_user(user_id, event)
+
+    async def send_unread_count(self, user_id: str, count: int) -> None:
+        """Send the user's current unread notification count."""
+        if self.is_connected(user_id):
+            await self.send_to_user(user_id, UnreadCountEvent(count=count))
+
 
 # Module-level singleton
 ws_manager = ConnectionManager()
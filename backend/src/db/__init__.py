@@ -1,6 +1,6 @@
 """Database clients for ARIA."""
 
 from src.db.graphiti import GraphitiClient
-from src.db.supabase import SupabaseClient, get_supabase_client
+from src.db.supabase import SupabaseClient, execute_async, get_supabase_client
 
-__all__ = ["GraphitiClient", "SupabaseClient", "get_supabase_client"]
+__all__ = ["GraphitiClient", "SupabaseClient", "execute_async", "get_supabase_client"]
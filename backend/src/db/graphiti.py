@@ -1,12 +1,21 @@
-"""Graphiti client module for temporal knowledge graph operations."""
+"""Graphiti client module for temporal knowledge graph operations.
+
+The graph is partitioned by Graphiti group ID: episodes are written to
+the owning user's (``user_group_id``) or company's (``company_group_id``)
+group, and searches are scoped to the groups from ``search_group_ids``.
+Scoped search results are cached briefly and invalidated whenever an
+episode is written to one of their groups (see src/db/graphiti_cache.py).
+"""
 
 import asyncio
 import json
 import logging
 import os
+import re
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from src.core.cache import get_cache
 from src.core.resilience import graphiti_circuit_breaker
 from src.core.config import settings
 from src.core.exceptions import GraphitiConnectionError
@@ -21,6 +30,73 @@ _graphiti_circuit_breaker = graphiti_circuit_breaker
 # Maximum seconds to wait for Neo4j connection during initialization
 _NEO4J_INIT_TIMEOUT = 10.0
 
+# Graphiti's default Neo4j group. Holds every episode written before the
+# graph was partitioned per user/company.
+LEGACY_GROUP_ID = ""
+
+# Cache region holding search results
+SEARCH_CACHE_REGION = "graphiti_search"
+
+# Search-cache tag of unscoped searches, which span every group
+_ALL_GROUPS = "*"
+
+# Graphiti only accepts these characters in group IDs
+_UNSAFE_GROUP_CHARS = re.compile(r"[^A-Za-z0-9_-]")
+
+
+def user_group_id(user_id: str) -> str:
+    """Graph partition holding one user's memories."""
+    return "user_" + _UNSAFE_GROUP_CHARS.sub("_", str(user_id))
+
+
+def company_group_id(company_id: str) -> str:
+    """Graph partition holding one company's shared memories."""
+    return "company_" + _UNSAFE_GROUP_CHARS.sub("_", str(company_id))
+
+
+def search_group_ids(user_id: str | None = None, company_id: str | None = None) -> list[str]:
+    """Groups a search on behalf of a user and/or company should cover.
+
+    Includes the legacy default group while GRAPHITI_SEARCH_LEGACY_GROUP
+    is on, so memories written before partitioning stay retrievable.
+    """
+    groups = []
+    if user_id:
+        groups.append(user_group_id(user_id))
+    if company_id:
+        groups.append(company_group_id(company_id))
+    if settings.GRAPHITI_SEARCH_LEGACY_GROUP:
+        groups.append(LEGACY_GROUP_ID)
+    return groups
+
+
+def _search_cache_tag(group_id: str) -> str:
+    return f"graphiti_group:{group_id}"
+
+
+def search_cache_tags(group_ids: list[str] | None) -> list[str]:
+    """Tags of a cached search over ``group_ids`` (every group if empty)."""
+    if not group_ids:
+        return [_search_cache_tag(_ALL_GROUPS)]
+    return [_search_cache_tag(g) for g in sorted(set(group_ids))]
+
+
+def invalidate_search_cache(group_id: str | None = None) -> int:
+    """Drop cached search results that may include ``group_id``.
+
+    Call after changing a group's graph data outside ``add_episode``,
+    e.g. with a raw Cypher query.
+
+    Args:
+        group_id: The group that changed; the legacy group if None.
+
+    Returns:
+        Number of cached searches dropped.
+    """
+    return get_cache().invalidate_tags(
+        _search_cache_tag(group_id or LEGACY_GROUP_ID), _search_cache_tag(_ALL_GROUPS)
+    )
+
 
 class GraphitiClient:
     """Singleton Graphiti client for Neo4j operations.
@@ -123,11 +199,12 @@ class GraphitiClient:
     @classmethod
     async def _do_initialize(cls, openai_key: str) -> None:
         """Inner initialization logic, called with a timeout wrapper."""
-        from graphiti_core import Graphiti
         from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
         from graphiti_core.llm_client import LLMConfig
         from graphiti_core.llm_client.anthropic_client import AnthropicClient
 
+        from src.db.graphiti_cache import CachingEmbedder, CachingGraphiti
+
         llm_client = AnthropicClient(
             config=LLMConfig(
                 api_key=settings.ANTHROPIC_API_KEY.get_secret_value(),
@@ -136,14 +213,17 @@ class GraphitiClient:
             )
         )
 
-        embedder = OpenAIEmbedder(
-            config=OpenAIEmbedderConfig(
-                api_key=openai_key,
-                embedding_model="text-embedding-3-small",
-            )
+        embedder = CachingEmbedder(
+            OpenAIEmbedder(
+                config=OpenAIEmbedderConfig(
+                    api_key=openai_key,
+                    embedding_model="text-embedding-3-small",
+                )
+            ),
+            maxsize=settings.GRAPHITI_EMBEDDING_CACHE_SIZE,
         )
 
-        cls._instance = Graphiti(
+        cls._instance = CachingGraphiti(
             uri=settings.NEO4J_URI,
             user=settings.NEO4J_USER,
             password=settings.NEO4J_PASSWORD.get_secret_value(),
@@ -212,6 +292,7 @@ class GraphitiClient:
         episode_body: str,
         source_description: str,
         reference_time: datetime,
+        group_id: str | None = None,
     ) -> object:
         """Add an episode to the knowledge graph.
 
@@ -220,6 +301,7 @@ class GraphitiClient:
             episode_body: Content of the episode.
             source_description: Description of the data source.
             reference_time: When this episode occurred.
+            group_id: Graph partition to write to; the legacy default group if None.
 
         Returns:
             The created episode object.
@@ -237,6 +319,7 @@ class GraphitiClient:
             source=EpisodeType.text,
             source_description=source_description,
             reference_time=reference_time,
+            group_id=group_id,
         )
         return result
 
@@ -257,26 +340,35 @@ class GraphitiClient:
             name: Entity name (e.g. person name, company name).
             entity_type: Entity type (e.g. 'person', 'company', 'product').
             metadata: Additional properties for the entity.
-            **_kwargs: Additional keyword args (e.g. user_id) for future use.
+            **_kwargs: ``user_id`` selects the user's graph partition.
 
         Returns:
-            The created episode object.
+            The created episode object, or None if the episode was queued
+            for background ingestion.
         """
+        from src.db.graphiti_queue import get_episode_write_queue
+
         props = json.dumps(metadata) if metadata else "{}"
-        episode_body = f"Entity discovered: {name} ({entity_type}). Properties: {props}"
-        return await cls.add_episode(
-            name=f"entity_{entity_type}_{name}",
-            episode_body=episode_body,
-            source_description="onboarding_entity_extraction",
-            reference_time=datetime.now(UTC),
-        )
+        episode = {
+            "name": f"entity_{entity_type}_{name}",
+            "episode_body": f"Entity discovered: {name} ({entity_type}). Properties: {props}",
+            "source_description": "onboarding_entity_extraction",
+            "reference_time": datetime.now(UTC),
+            "group_id": user_group_id(_kwargs["user_id"]) if _kwargs.get("user_id") else None,
+        }
+        # Onboarding extracts entities in bursts; queue them when possible
+        if await get_episode_write_queue().enqueue(**episode):
+            return None
+        return await cls.add_episode(**episode)
 
     @classmethod
-    async def search(cls, query: str) -> list[object]:
+    async def search(cls, query: str, group_ids: list[str] | None = None) -> list[object]:
         """Search the knowledge graph.
 
         Args:
             query: Search query string.
+            group_ids: Graph partitions to search, e.g. from
+                ``search_group_ids``; every group if None.
 
         Returns:
             List of matching edges/facts.
@@ -285,5 +377,10 @@ class GraphitiClient:
             GraphitiConnectionError: If client is not initialized.
         """
         client = await cls.get_instance()
-        results = await _graphiti_circuit_breaker.call(client.search, query)
+        if group_ids is None:
+            results = await _graphiti_circuit_breaker.call(client.search, query)
+        else:
+            results = await _graphiti_circuit_breaker.call(
+                client.search, query, group_ids=group_ids
+            )
         return list(results)
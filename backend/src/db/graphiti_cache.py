@@ -0,0 +1,155 @@
+"""Graphiti with search-result and embedding caches.
+
+- CachingGraphiti: caches plain ``search`` results per (groups, limit,
+  query) for GRAPHITI_SEARCH_CACHE_TTL_SECONDS. Concurrent identical
+  searches share one graph query. Writing an episode to a group drops
+  the cached searches covering that group.
+- CachingEmbedder: LRU cache of single-text embeddings, so repeated
+  queries and entity names are embedded once.
+
+Imported lazily by ``GraphitiClient._do_initialize`` so graphiti_core is
+only loaded when the graph is configured.
+"""
+
+import json
+from array import array
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from graphiti_core import Graphiti
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.edges import EntityEdge
+from graphiti_core.embedder.client import EmbedderClient
+from graphiti_core.nodes import EpisodeType
+from graphiti_core.search.search_config import DEFAULT_SEARCH_LIMIT
+from graphiti_core.search.search_filters import SearchFilters
+
+from src.core.cache import get_cache
+from src.core.config import settings
+from src.db.graphiti import SEARCH_CACHE_REGION, invalidate_search_cache, search_cache_tags
+
+# Cache region holding embeddings
+EMBEDDING_CACHE_REGION = "graphiti_embeddings"
+
+# Embeddings of a text never change for a given model; the TTL only
+# bounds how long an unused entry can outlive a model switch.
+_EMBEDDING_TTL_SECONDS = 24 * 3600.0
+
+
+def _single_text(input_data: Any) -> str | None:
+    """The text to embed if ``input_data`` is one string, else None."""
+    if isinstance(input_data, str):
+        return input_data
+    if isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+        return input_data[0]
+    return None
+
+
+class CachingEmbedder(EmbedderClient):
+    """EmbedderClient wrapper with an LRU cache for single-text embeddings.
+
+    Vectors are stored as float64 arrays (a fraction of the size of a
+    list of floats) and returned as fresh lists. Batch calls and token
+    inputs pass through uncached.
+    """
+
+    def __init__(self, inner: EmbedderClient, maxsize: int) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            inner: The embedder doing the actual work.
+            maxsize: Maximum number of cached embeddings.
+        """
+        self._inner = inner
+        self._region = get_cache().region(EMBEDDING_CACHE_REGION, maxsize=maxsize)
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        text = _single_text(input_data)
+        if text is None:
+            return await self._inner.create(input_data)
+
+        vector, found = self._region.get(text)
+        if found:
+            return vector.tolist()  # type: ignore[no-any-return]
+
+        embedding = await self._inner.create(input_data)
+        self._region.set(text, array("d", embedding), ttl=_EMBEDDING_TTL_SECONDS)
+        return embedding
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        return await self._inner.create_batch(input_data_list)
+
+
+class CachingGraphiti(Graphiti):
+    """Graphiti whose plain searches are cached and invalidated per group."""
+
+    async def search(
+        self,
+        query: str,
+        center_node_uuid: str | None = None,
+        group_ids: list[str] | None = None,
+        num_results: int = DEFAULT_SEARCH_LIMIT,
+        search_filter: SearchFilters | None = None,
+        driver: GraphDriver | None = None,
+    ) -> list[EntityEdge]:
+        # Reranked, filtered or redirected searches are not cached
+        if center_node_uuid is not None or search_filter is not None or driver is not None:
+            return await super().search(
+                query, center_node_uuid, group_ids, num_results, search_filter, driver
+            )
+
+        key = json.dumps([sorted(set(group_ids or ())), num_results, query])
+
+        async def load() -> list[EntityEdge]:
+            return await super(CachingGraphiti, self).search(
+                query, group_ids=group_ids, num_results=num_results
+            )
+
+        results = await get_cache().region(SEARCH_CACHE_REGION).get_or_load(
+            key,
+            load,
+            ttl=settings.GRAPHITI_SEARCH_CACHE_TTL_SECONDS,
+            tags=search_cache_tags(group_ids),
+        )
+        return list(results)
+
+    async def add_episode(  # type: ignore[override]
+        self,
+        name: str,
+        episode_body: str,
+        source_description: str,
+        reference_time: datetime,
+        source: EpisodeType = EpisodeType.message,
+        group_id: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        try:
+            return await super().add_episode(
+                name,
+                episode_body,
+                source_description,
+                reference_time,
+                source=source,
+                group_id=group_id,
+                **kwargs,
+            )
+        finally:
+            # Also after a failure: part of the episode may have been written
+            invalidate_search_cache(group_id)
+
+    async def add_episode_bulk(  # type: ignore[override]
+        self, bulk_episodes: list[Any], group_id: str | None = None, **kwargs: Any
+    ) -> Any:
+        try:
+            return await super().add_episode_bulk(bulk_episodes, group_id=group_id, **kwargs)
+        finally:
+            invalidate_search_cache(group_id)
+
+    async def remove_episode(self, episode_uuid: str) -> None:
+        try:
+            await super().remove_episode(episode_uuid)
+        finally:
+            get_cache().invalidate_by_pattern("*", region=SEARCH_CACHE_REGION)
@@ -0,0 +1,509 @@
+"""Durable background write queue for Graphiti episodes.
+
+``add_episode`` runs Graphiti's LLM entity and edge extraction before it
+returns, which takes seconds per episode. While the queue is running,
+memory writes call ``enqueue`` instead: it inserts one row into
+``graphiti_episode_queue`` (migration 20260316000006) and returns. A
+background loop in every API worker then:
+
+- leases due episodes with ``claim_graphiti_episodes``: up to
+  ``batch_size`` oldest episodes from each of up to ``concurrency``
+  groups. A group is never leased to two workers at once, so episodes
+  of one user are ingested in order.
+- ingests each group's batch with ``add_episode_bulk``, or
+  ``add_episode`` for a single episode. Groups run concurrently. Each
+  call is bounded by a timeout that keeps it inside the lease, and goes
+  through the queue's own circuit breaker: failing batches pause
+  claiming without opening the breaker interactive Graphiti calls use.
+- deletes ingested rows. Failed batches are retried with exponential
+  backoff and dead-lettered (status ``failed``) after ``max_attempts``.
+
+A worker that dies mid-batch leaves its rows leased; they are retried
+once the lease expires.
+
+Deleting a memory must also stop its queued write: delete paths call
+``discard`` before removing the episode from the graph. Rows enqueued
+with a ``source_table``/``source_id`` are skipped if that record is gone
+by the time they are claimed, and an episode discarded while its batch
+was in flight is removed from the graph again after ingestion.
+
+When the queue is not running (Graphiti not configured, scripts, tests)
+or the insert fails, ``enqueue`` returns False and callers write inline.
+
+Usage:
+    # In FastAPI startup / shutdown
+    await get_episode_write_queue().start()
+    await get_episode_write_queue().stop()
+
+    # In a memory write path
+    queued = await get_episode_write_queue().enqueue(
+        name=episode_id,
+        episode_body=body,
+        source_description="episodic_memory:...",
+        reference_time=occurred_at,
+        group_id=user_group_id(user_id),
+    )
+    if not queued:
+        await client.add_episode(...)
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from src.core.exceptions import GraphitiConnectionError
+from src.core.resilience import CircuitState, graphiti_queue_circuit_breaker
+from src.core.timing import LogHistogram
+
+logger = logging.getLogger(__name__)
+
+QUEUE_TABLE = "graphiti_episode_queue"
+
+# Retry backoff: base * 2^(attempt - 1) seconds, capped
+_RETRY_BASE_SECONDS = 10
+_RETRY_MAX_SECONDS = 900
+
+# Ingestion must finish inside the lease; keep this share of it as headroom
+_LEASE_HEADROOM = 0.1
+# Floor for a small batch's timeout (one add_episode can take this long)
+_MIN_INGEST_TIMEOUT_SECONDS = 60.0
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class EpisodeWriteQueue:
+    """Supabase-backed queue feeding Graphiti's bulk episode API."""
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        batch_size: int = 20,
+        poll_interval: float = 2.0,
+        lease_seconds: int = 600,
+        max_attempts: int = 5,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            concurrency: Groups ingested at once by this worker.
+            batch_size: Maximum episodes per ``add_episode_bulk`` call.
+            poll_interval: Seconds between claims while idle.
+            lease_seconds: How long a claimed batch stays leased before
+                another worker may retry it.
+            max_attempts: Attempts before an episode is dead-lettered.
+        """
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+
+        # Metrics
+        self._enqueued = 0
+        self._enqueue_failures = 0
+        self._ingested = 0
+        self._batches = 0
+        self._failed_batches = 0
+        self._dead_lettered = 0
+        self._discarded = 0
+        self._skipped = 0
+        self._lag_ms = LogHistogram()  # enqueue -> ingested
+        self._batch_ms = LogHistogram()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether ``enqueue`` accepts episodes."""
+        return self._running
+
+    # -- Lifecycle -------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background worker. No-op if already started.
+
+        The queue accepts episodes once Graphiti has initialized; if it
+        cannot, the worker exits and episode writes stay inline.
+        """
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop accepting episodes and cancel the worker.
+
+        Batches in flight stay leased and are retried after the lease expires.
+        """
+        self._running = False
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            logger.info("Graphiti episode queue stopped")
+
+    # -- Producers -------------------------------------------------------------
+
+    async def enqueue(
+        self,
+        name: str,
+        episode_body: str,
+        source_description: str,
+        reference_time: datetime,
+        group_id: str | None = None,
+        source: str = "text",
+        source_table: str | None = None,
+        source_id: str | None = None,
+    ) -> bool:
+        """Queue one episode for background ingestion.
+
+        Args:
+            name: Unique name for the episode.
+            episode_body: Content of the episode.
+            source_description: Description of the data source.
+            reference_time: When this episode occurred.
+            group_id: Graph partition to write to; the default group if None.
+            source: graphiti_core ``EpisodeType`` value.
+            source_table: Supabase table holding the record the episode
+                mirrors; the episode is skipped if the record is gone.
+            source_id: ``id`` of that record.
+
+        Returns:
+            True if the episode was queued, False if the caller should
+            write it inline.
+        """
+        if not self._running:
+            return False
+        row = {
+            "group_id": group_id or "",
+            "name": name,
+            "episode_body": episode_body,
+            "source_description": source_description,
+            "source": source,
+            "reference_time": reference_time.isoformat(),
+            "source_table": source_table,
+            "source_id": source_id,
+        }
+        try:
+            from src.db.supabase import SupabaseClient
+
+            client = await SupabaseClient.get_async_client()
+            await client.table(QUEUE_TABLE).insert(row).execute()
+        except Exception as e:
+            self._enqueue_failures += 1
+            logger.warning("Graphiti episode enqueue failed, writing inline: %s", e)
+            return False
+        self._enqueued += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    async def discard(self, name: str, group_id: str | None = None) -> int:
+        """Remove queued writes of an episode that is being deleted.
+
+        Works whether or not this worker's queue is running, since other
+        workers may have queued the episode. Failures are logged.
+
+        Args:
+            name: Episode name passed to ``enqueue``.
+            group_id: Graph partition passed to ``enqueue``.
+
+        Returns:
+            Number of queue rows removed.
+        """
+        try:
+            from src.db.supabase import SupabaseClient
+
+            client = await SupabaseClient.get_async_client()
+            response = await (
+                client.table(QUEUE_TABLE)
+                .delete()
+                .eq("name", name)
+                .eq("group_id", group_id or "")
+                .execute()
+            )
+        except Exception as e:
+            logger.warning("Could not discard queued Graphiti episode %r: %s", name, e)
+            return 0
+        removed = len(response.data or [])
+        self._discarded += removed
+        return removed
+
+    # -- Worker ----------------------------------------------------------------
+
+    async def _run(self) -> None:
+        from src.db.graphiti import GraphitiClient
+
+        try:
+            await GraphitiClient.get_instance()
+        except GraphitiConnectionError:
+            logger.info("Graphiti unavailable; episode writes stay inline")
+            return
+        except Exception:
+            logger.exception("Graphiti initialization failed; episode writes stay inline")
+            return
+
+        self._running = True
+        logger.info(
+            "Graphiti episode queue started (concurrency=%d, batch=%d)",
+            self._concurrency,
+            self._batch_size,
+        )
+        assert self._wakeup is not None
+        while True:
+            try:
+                claimed = await self.drain_once()
+            except Exception:
+                logger.exception("Graphiti episode queue drain failed")
+                claimed = 0
+            if claimed:
+                continue  # More may be due; claim again right away
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+            self._wakeup.clear()
+
+    async def drain_once(self) -> int:
+        """Claim one round of due episodes and ingest them.
+
+        Returns:
+            Number of episodes claimed.
+        """
+        from src.db.supabase import SupabaseClient
+
+        if graphiti_queue_circuit_breaker.state is CircuitState.OPEN:
+            return 0  # Leave episodes unclaimed until Graphiti recovers
+
+        client = await SupabaseClient.get_async_client()
+        response = await client.rpc(
+            "claim_graphiti_episodes",
+            {
+                "p_max_groups": self._concurrency,
+                "p_batch_size": self._batch_size,
+                "p_lease_seconds": self._lease_seconds,
+            },
+        ).execute()
+        rows: list[dict[str, Any]] = response.data or []
+        if not rows:
+            return 0
+
+        by_group: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        for row in sorted(rows, key=lambda r: r["id"]):
+            by_group.setdefault(row["group_id"], []).append(row)
+        await asyncio.gather(
+            *(self._ingest(client, group_id, batch) for group_id, batch in by_group.items())
+        )
+        return len(rows)
+
+    async def _ingest(self, db: Any, group_id: str, rows: list[dict[str, Any]]) -> None:
+        """Write one group's batch to Graphiti, then ack or fail it."""
+        from graphiti_core.nodes import EpisodeType
+        from graphiti_core.utils.bulk_utils import RawEpisode
+
+        from src.db.graphiti import GraphitiClient
+
+        rows = await self._drop_orphans(db, rows)
+        if not rows:
+            return
+        ids = [row["id"] for row in rows]
+        start = time.perf_counter()
+        try:
+            graphiti = await GraphitiClient.get_instance()
+            if len(rows) == 1:
+                row = rows[0]
+                await graphiti_queue_circuit_breaker.call(
+                    graphiti.add_episode,
+                    timeout=self._ingest_timeout(1),
+                    name=row["name"],
+                    episode_body=row["episode_body"],
+                    source_description=row["source_description"],
+                    reference_time=_parse_time(row["reference_time"]),
+                    source=EpisodeType(row["source"]),
+                    group_id=group_id or None,
+                )
+            else:
+                episodes = [
+                    RawEpisode(
+                        name=row["name"],
+                        content=row["episode_body"],
+                        source_description=row["source_description"],
+                        source=EpisodeType(row["source"]),
+                        reference_time=_parse_time(row["reference_time"]),
+                    )
+                    for row in rows
+                ]
+                await graphiti_queue_circuit_breaker.call(
+                    graphiti.add_episode_bulk,
+                    episodes,
+                    timeout=self._ingest_timeout(len(episodes)),
+                    group_id=group_id or None,
+                )
+        except Exception as e:
+            self._failed_batches += 1
+            logger.warning(
+                "Graphiti episode batch failed (group=%r, %d episodes): %s",
+                group_id,
+                len(rows),
+                e,
+            )
+            try:
+                result = await db.rpc(
+                    "fail_graphiti_episodes",
+                    {
+                        "p_ids": ids,
+                        "p_error": str(e) or type(e).__name__,
+                        "p_max_attempts": self._max_attempts,
+                        "p_base_delay_seconds": _RETRY_BASE_SECONDS,
+                        "p_max_delay_seconds": _RETRY_MAX_SECONDS,
+                    },
+                ).execute()
+                self._dead_lettered += int(result.data or 0)
+            except Exception:
+                logger.exception("Could not release failed Graphiti episodes %s", ids)
+            return
+
+        self._batch_ms.record((time.perf_counter() - start) * 1000.0)
+        self._batches += 1
+        self._ingested += len(rows)
+        now = time.time()
+        for row in rows:
+            self._lag_ms.record(max(0.0, now - _parse_time(row["created_at"]).timestamp()) * 1000.0)
+        try:
+            result = await db.table(QUEUE_TABLE).delete().in_("id", ids).execute()
+        except Exception:
+            # Rows stay leased and are ingested again after the lease expires
+            logger.exception("Could not ack ingested Graphiti episodes %s", ids)
+            return
+
+        # Rows no longer there were discarded while the batch was in flight
+        acked = {row["id"] for row in result.data or []}
+        discarded = [row["name"] for row in rows if row["id"] not in acked]
+        if discarded:
+            await self._remove_from_graph(graphiti, discarded)
+
+    def _ingest_timeout(self, episodes: int) -> float:
+        """Seconds one ingest call may take for a batch of ``episodes``.
+
+        The lease (less headroom) is shared evenly across a full batch,
+        so a batch times out and is released before the lease expires
+        and another worker claims it again.
+        """
+        budget = self._lease_seconds * (1 - _LEASE_HEADROOM)
+        per_episode = budget / max(self._batch_size, 1)
+        return min(budget, max(_MIN_INGEST_TIMEOUT_SECONDS, per_episode * episodes))
+
+    async def _drop_orphans(self, db: Any, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Ack and drop rows whose source record has been deleted.
+
+        Returns:
+            The rows to ingest. If a lookup fails, its rows are kept.
+        """
+        by_table: dict[str, set[str]] = {}
+        for row in rows:
+            if row.get("source_table") and row.get("source_id"):
+                by_table.setdefault(row["source_table"], set()).add(row["source_id"])
+        if not by_table:
+            return rows
+
+        missing: set[tuple[str, str]] = set()
+        for table, source_ids in by_table.items():
+            try:
+                response = (
+                    await db.table(table).select("id").in_("id", sorted(source_ids)).execute()
+                )
+            except Exception as e:
+                logger.warning("Could not check %s for queued Graphiti episodes: %s", table, e)
+                continue
+            found = {str(record["id"]) for record in response.data or []}
+            missing.update((table, source_id) for source_id in source_ids - found)
+        if not missing:
+            return rows
+
+        orphans = [
+            row for row in rows if (row.get("source_table"), row.get("source_id")) in missing
+        ]
+        try:
+            await db.table(QUEUE_TABLE).delete().in_("id", [row["id"] for row in orphans]).execute()
+        except Exception:
+            logger.exception("Could not drop orphaned Graphiti episodes")
+        self._skipped += len(orphans)
+        return [row for row in rows if row not in orphans]
+
+    async def _remove_from_graph(self, graphiti: Any, names: list[str]) -> None:
+        """Delete episodes that were discarded after being claimed."""
+        try:
+            await graphiti.driver.execute_query(
+                """
+                MATCH (e:Episode)
+                WHERE e.name IN $names
+                DETACH DELETE e
+                """,
+                names=names,
+            )
+        except Exception:
+            logger.exception("Could not remove discarded Graphiti episodes %s", names)
+
+    # -- Metrics ---------------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        """This worker's counters and enqueue-to-graph lag percentiles."""
+        return {
+            "running": self._running,
+            "enqueued": self._enqueued,
+            "enqueue_failures": self._enqueue_failures,
+            "ingested": self._ingested,
+            "batches": self._batches,
+            "failed_batches": self._failed_batches,
+            "dead_lettered": self._dead_lettered,
+            "discarded": self._discarded,
+            "skipped": self._skipped,
+            "lag": self._lag_ms.summary(),
+            "batch": self._batch_ms.summary(),
+        }
+
+    async def backlog(self) -> dict[str, Any]:
+        """Queue-wide backlog and the age of the oldest unprocessed episode.
+
+        Returns:
+            Pending, processing and dead-lettered counts, groups with
+            pending work and ``oldest_pending_age_seconds``.
+        """
+        from src.db.supabase import SupabaseClient
+
+        client = await SupabaseClient.get_async_client()
+        response = await client.rpc("graphiti_episode_queue_stats", {}).execute()
+        rows = response.data or []
+        return rows[0] if rows else {}
+
+
+# Singleton instance
+_episode_write_queue: EpisodeWriteQueue | None = None
+
+
+def get_episode_write_queue() -> EpisodeWriteQueue:
+    """Get or create the Graphiti episode write queue singleton.
+
+    Returns:
+        The shared EpisodeWriteQueue instance.
+    """
+    global _episode_write_queue
+    if _episode_write_queue is None:
+        from src.core.config import get_settings
+
+        s = get_settings()
+        _episode_write_queue = EpisodeWriteQueue(
+            concurrency=s.GRAPHITI_QUEUE_CONCURRENCY,
+            batch_size=s.GRAPHITI_QUEUE_BATCH_SIZE,
+            poll_interval=s.GRAPHITI_QUEUE_POLL_SECONDS,
+            lease_seconds=s.GRAPHITI_QUEUE_LEASE_SECONDS,
+            max_attempts=s.GRAPHITI_QUEUE_MAX_ATTEMPTS,
+        )
+    return _episode_write_queue
@@ -1,22 +1,120 @@
-"""Supabase client module for database operations."""
-
+"""Supabase client module for database operations.
+
+Two clients live behind the ``SupabaseClient`` facade:
+
+- ``get_client()`` returns the synchronous supabase-py ``Client`` that most
+  services still use. Its ``.execute()`` blocks the calling thread, so async
+  code should await it through :func:`execute_async` rather than calling it
+  inline on the event loop.
+- ``get_async_client()`` returns a native ``AsyncClient`` backed by a pooled,
+  HTTP/2 keepalive ``httpx.AsyncClient``. New code should prefer it.
+"""
+
+import asyncio
+import contextvars
+import functools
+import inspect
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast
 
+import httpx
+
 from src.core.resilience import CircuitBreakerOpen, supabase_circuit_breaker
 from src.core.config import settings
 from src.core.exceptions import DatabaseError, NotFoundError
-from supabase import Client, create_client
+from src.core.timing import SUPABASE, track_dependency
+from supabase import AsyncClient, AsyncClientOptions, Client, acreate_client, create_client
 
 logger = logging.getLogger(__name__)
 
 _supabase_circuit_breaker = supabase_circuit_breaker
 
+# Dedicated pool for legacy synchronous ``.execute()`` calls so they never
+# compete with the default executor used by other ``asyncio.to_thread`` work.
+_offload_executor: ThreadPoolExecutor | None = None
+
+
+def _get_offload_executor() -> ThreadPoolExecutor:
+    """Lazily create the thread pool used to offload sync PostgREST calls."""
+    global _offload_executor
+    if _offload_executor is None:
+        _offload_executor = ThreadPoolExecutor(
+            max_workers=settings.SUPABASE_SYNC_OFFLOAD_WORKERS,
+            thread_name_prefix="supabase-sync",
+        )
+    return _offload_executor
+
+
+async def execute_async(query: Any) -> Any:
+    """Await a supabase-py query builder without blocking the event loop.
+
+    Migration shim for existing ``.table().select().execute()`` chains:
+    wrap the chain *without* its final ``.execute()`` call and await it::
+
+        result = await execute_async(
+            client.table("goals").select("*").eq("user_id", user_id)
+        )
+
+    Builders from the native ``AsyncClient`` are awaited directly. Builders
+    from the synchronous ``Client`` run on a dedicated thread pool, with the
+    caller's contextvars preserved. Each call is timed as a Supabase
+    dependency call.
+
+    Args:
+        query: A supabase-py request builder (sync or async) exposing ``execute``.
+
+    Returns:
+        The ``APIResponse`` returned by ``execute()``.
+    """
+    execute = query.execute
+    with track_dependency(SUPABASE, _query_operation(query)):
+        if inspect.iscoroutinefunction(execute):
+            return await execute()
+
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            _get_offload_executor(), functools.partial(ctx.run, execute)
+        )
+
+
+def _query_operation(query: Any) -> str | None:
+    """Table or RPC a query targets (``goals``, ``rpc/foo``), for slow-query logs."""
+    path = getattr(getattr(query, "request", None), "path", None)
+    if not isinstance(path, str):
+        return None
+    _, _, operation = path.partition("/rest/v1/")
+    return operation or path
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Build the pooled keepalive transport shared by the async client."""
+    http2 = settings.SUPABASE_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("h2 not installed — Supabase async client falling back to HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.SUPABASE_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SUPABASE_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=settings.SUPABASE_POOL_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(settings.SUPABASE_REQUEST_TIMEOUT),
+    )
+
 
 class SupabaseClient:
     """Singleton Supabase client for backend operations."""
 
     _client: Client | None = None
+    _async_client: AsyncClient | None = None
+    _async_http: httpx.AsyncClient | None = None
 
     @classmethod
     def get_client(cls) -> Client:
@@ -52,10 +150,61 @@ class SupabaseClient:
 
         return cls._client
 
+    @classmethod
+    async def get_async_client(cls) -> AsyncClient:
+        """Get or create the native async Supabase client singleton.
+
+        All requests share one pooled ``httpx.AsyncClient`` (HTTP/2 when
+        available), so concurrent queries multiplex over warm connections
+        instead of stalling the event loop.
+
+        Returns:
+            Initialized async Supabase client.
+
+        Raises:
+            DatabaseError: If client initialization fails.
+        """
+        if cls._async_client is not None:
+            return cls._async_client
+
+        http_client = _build_http_client()
+        try:
+            client = await acreate_client(
+                settings.SUPABASE_URL,
+                settings.SUPABASE_SERVICE_ROLE_KEY.get_secret_value(),
+                options=AsyncClientOptions(httpx_client=http_client),
+            )
+        except Exception as e:
+            await http_client.aclose()
+            logger.exception("Failed to initialize async Supabase client")
+            raise DatabaseError(f"Failed to initialize database connection: {e}") from e
+
+        # Another coroutine may have won the race while we were awaiting.
+        if cls._async_client is not None:
+            await http_client.aclose()
+            return cls._async_client
+
+        cls._async_client = client
+        cls._async_http = http_client
+        logger.info("Async Supabase client initialized (http2=%s)", settings.SUPABASE_HTTP2)
+        return client
+
+    @classmethod
+    async def close_async_client(cls) -> None:
+        """Close the pooled async transport. Called from the app lifespan."""
+        http_client = cls._async_http
+        cls._async_client = None
+        cls._async_http = None
+        if http_client is not None:
+            await http_client.aclose()
+            logger.info("Async Supabase client closed")
+
     @classmethod
     def reset_client(cls) -> None:
-        """Reset the client singleton (useful for testing)."""
+        """Reset the client singletons (useful for testing)."""
         cls._client = None
+        cls._async_client = None
+        cls._async_http = None
 
     @classmethod
     async def get_user_by_id(cls, user_id: str) -> dict[str, Any]:
@@ -73,9 +222,9 @@ class SupabaseClient:
         """
         try:
             _supabase_circuit_breaker.check()
-            client = cls.get_client()
+            client = await cls.get_async_client()
             response = (
-                client.table("user_profiles").select("*").eq("id", user_id).single().execute()
+                await client.table("user_profiles").select("*").eq("id", user_id).single().execute()
             )
             if response.data is None:
                 raise NotFoundError("User", user_id)
@@ -113,8 +262,10 @@ class SupabaseClient:
         """
         try:
             _supabase_circuit_breaker.check()
-            client = cls.get_client()
-            response = client.table("companies").select("*").eq("id", company_id).single().execute()
+            client = await cls.get_async_client()
+            response = (
+                await client.table("companies").select("*").eq("id", company_id).single().execute()
+            )
             if response.data is None:
                 raise NotFoundError("Company", company_id)
             _supabase_circuit_breaker.record_success()
@@ -144,9 +295,13 @@ class SupabaseClient:
         """
         try:
             _supabase_circuit_breaker.check()
-            client = cls.get_client()
+            client = await cls.get_async_client()
             response = (
-                client.table("user_settings").select("*").eq("user_id", user_id).single().execute()
+                await client.table("user_settings")
+                .select("*")
+                .eq("user_id", user_id)
+                .single()
+                .execute()
             )
             if response.data is None:
                 raise NotFoundError("User settings", user_id)
@@ -188,7 +343,7 @@ class SupabaseClient:
         """
         try:
             _supabase_circuit_breaker.check()
-            client = cls.get_client()
+            client = await cls.get_async_client()
             data: dict[str, Any] = {
                 "id": user_id,
                 "full_name": full_name,
@@ -197,7 +352,7 @@ class SupabaseClient:
             }
             # Use upsert to handle pre-existing profile from auth trigger
             response = (
-                client.table("user_profiles")
+                await client.table("user_profiles")
                 .upsert(data, on_conflict="id")
                 .execute()
             )
@@ -231,7 +386,7 @@ class SupabaseClient:
         """
         try:
             _supabase_circuit_breaker.check()
-            client = cls.get_client()
+            client = await cls.get_async_client()
             data: dict[str, Any] = {
                 "user_id": user_id,
                 "preferences": {},
@@ -239,7 +394,7 @@ class SupabaseClient:
             }
             # Use upsert to handle pre-existing settings
             response = (
-                client.table("user_settings")
+                await client.table("user_settings")
                 .upsert(data, on_conflict="user_id")
                 .execute()
             )
@@ -273,7 +428,7 @@ class SupabaseClient:
         """
         try:
             _supabase_circuit_breaker.check()
-            client = cls.get_client()
+            client = await cls.get_async_client()
             data: dict[str, Any] = {
                 "user_id": user_id,
                 "current_step": "company_discovery",
@@ -290,7 +445,7 @@ class SupabaseClient:
             }
             # Use upsert to handle pre-existing onboarding state
             response = (
-                client.table("onboarding_state")
+                await client.table("onboarding_state")
                 .upsert(data, on_conflict="user_id")
                 .execute()
             )
@@ -323,9 +478,9 @@ class SupabaseClient:
         """
         try:
             _supabase_circuit_breaker.check()
-            client = cls.get_client()
+            client = await cls.get_async_client()
             data: dict[str, Any] = {"name": name, "domain": domain, "settings": {}}
-            response = client.table("companies").insert(data).execute()
+            response = await client.table("companies").insert(data).execute()
             if response.data and len(response.data) > 0:
                 _supabase_circuit_breaker.record_success()
                 return cast(dict[str, Any], response.data[0])
@@ -20,6 +20,7 @@ from composio import Composio
 
 from src.core.config import settings
 from src.core.resilience import composio_circuit_breaker
+from src.core.timing import COMPOSIO, track_dependency
 
 if TYPE_CHECKING:
     from composio.core.models.tool_router import ToolRouterSession
@@ -273,10 +274,11 @@ class ComposioSessionManager:
             }
 
         try:
-            result = await asyncio.wait_for(
-                asyncio.to_thread(_execute),
-                timeout=30.0,
-            )
+            with track_dependency(COMPOSIO, tool_name):
+                result = await asyncio.wait_for(
+                    asyncio.to_thread(_execute),
+                    timeout=30.0,
+                )
         except asyncio.TimeoutError:
             composio_circuit_breaker.record_failure()
             logger.error(
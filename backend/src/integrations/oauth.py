@@ -8,6 +8,7 @@ from composio import Composio
 
 from src.core.config import settings
 from src.core.resilience import CircuitBreaker, composio_circuit_breaker
+from src.core.timing import COMPOSIO, track_dependency
 
 logger = logging.getLogger(__name__)
 
@@ -455,7 +456,8 @@ class ComposioOAuthClient:
             )
 
         try:
-            result = await asyncio.to_thread(_execute)
+            with track_dependency(COMPOSIO, resolved_action):
+                result = await asyncio.to_thread(_execute)
         except Exception:
             cb.record_failure()
             raise
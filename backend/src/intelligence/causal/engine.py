@@ -354,7 +354,7 @@ Return ONLY a valid JSON array, no other text:
 
     async def _get_graphiti_relationships(
         self,
-        _user_id: str,
+        user_id: str,
         entity_name: str,
     ) -> list[dict[str, Any]]:
         """Query Graphiti for existing causal relationships from an entity.
@@ -371,7 +371,7 @@ Return ONLY a valid JSON array, no other text:
         """
         try:
             # Check if Graphiti is initialized
-            from src.db.graphiti import GraphitiClient
+            from src.db.graphiti import GraphitiClient, search_group_ids
 
             if not GraphitiClient.is_initialized():
                 logger.debug("Graphiti not initialized, skipping relationship search")
@@ -382,7 +382,7 @@ Return ONLY a valid JSON array, no other text:
             # Search for causal relationships involving this entity
             # The search query looks for causal patterns
             query = f"causes effects implications {entity_name}"
-            results = await graphiti.search(query)
+            results = await graphiti.search(query, group_ids=search_group_ids(user_id))
 
             relationships: list[dict[str, Any]] = []
 
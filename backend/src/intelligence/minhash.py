@@ -0,0 +1,183 @@
+"""MinHash signatures and banded LSH index for near-duplicate text.
+
+MinHash estimates Jaccard similarity between token sets: the probability
+that two signatures agree at any position equals the sets' Jaccard
+similarity. Splitting the signature into ``bands`` bands of ``rows`` rows
+and bucketing on each band makes two sets candidates when any band agrees,
+which happens with probability ``1 - (1 - s**rows) ** bands`` — a steep
+S-curve around the threshold. Candidates are cheap to generate in
+near-linear time; callers verify them with exact Jaccard.
+
+Token hashes use CRC32 (not Python's salted ``hash``) and permutations come
+from a fixed seed, so signatures are stable across processes and can be
+persisted and compared later.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections import defaultdict
+from collections.abc import Hashable, Iterable, Sequence
+
+import numpy as np
+
+# Mersenne prime 2**31 - 1: hash values fit in a Postgres INTEGER column and
+# a * h stays below 2**62, so the universal hash never overflows uint64.
+MERSENNE_PRIME = (1 << 31) - 1
+
+DEFAULT_NUM_PERM = 128
+# 64 bands x 2 rows: candidate probability is 0.99998 at Jaccard 0.4, so
+# virtually every true pair at the dedup threshold is found.
+DEFAULT_BANDS = 64
+
+
+def tokenize(text: str | None) -> frozenset[str]:
+    """Lower-cased whitespace tokens, the word set used for headline Jaccard."""
+    return frozenset((text or "").lower().split())
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    """Exact Jaccard similarity of two token sets (0.0 if either is empty)."""
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures for token sets."""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1) -> None:
+        """Initialize the hash family.
+
+        Args:
+            num_perm: Signature length (number of hash permutations).
+            seed: RNG seed for the permutations. Signatures are only
+                comparable between hashers with the same num_perm and seed.
+        """
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def _token_hashes(tokens: Iterable[str]) -> np.ndarray:
+        return np.fromiter(
+            (zlib.crc32(t.encode("utf-8")) % MERSENNE_PRIME for t in tokens),
+            dtype=np.uint64,
+        )
+
+    def signature(self, tokens: Iterable[str]) -> np.ndarray | None:
+        """MinHash signature of one token set.
+
+        Args:
+            tokens: The set's tokens.
+
+        Returns:
+            uint64 array of length num_perm, or None for an empty set.
+        """
+        hashes = self._token_hashes(tokens)
+        if hashes.size == 0:
+            return None
+        return ((np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME).min(axis=0)
+
+    def signatures(
+        self,
+        token_sets: Sequence[Iterable[str]],
+        chunk_size: int = 4096,
+    ) -> list[np.ndarray | None]:
+        """Vectorized signatures for many token sets.
+
+        Hashes every token of a chunk in one matrix operation and reduces
+        per set with ``np.minimum.reduceat``.
+
+        Args:
+            token_sets: Token sets to sign.
+            chunk_size: Sets processed per matrix operation (bounds memory).
+
+        Returns:
+            One signature per input set, None for empty sets.
+        """
+        out: list[np.ndarray | None] = []
+        for start in range(0, len(token_sets), chunk_size):
+            chunk = [list(ts) for ts in token_sets[start : start + chunk_size]]
+            lengths = np.fromiter((len(ts) for ts in chunk), dtype=np.int64)
+            hashes = self._token_hashes(t for ts in chunk for t in ts)
+            if hashes.size == 0:
+                out.extend(None for _ in chunk)
+                continue
+            permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME
+            nonempty = lengths > 0
+            offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))[nonempty]
+            mins = np.minimum.reduceat(permuted, offsets, axis=0)
+            rows = iter(mins)
+            out.extend(next(rows) if ne else None for ne in nonempty)
+        return out
+
+
+class LSHIndex:
+    """Banded LSH buckets over MinHash signatures, partitioned by block key.
+
+    Items only become candidates for queries with the same block key (e.g.
+    company name), so unrelated partitions never share buckets.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS) -> None:
+        """Initialize an empty index.
+
+        Args:
+            num_perm: Signature length; must be divisible by bands.
+            bands: Number of bands. More bands raise recall at a given
+                similarity at the cost of more false candidates.
+
+        Raises:
+            ValueError: If num_perm is not a multiple of bands.
+        """
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self._bands = bands
+        self._rows = num_perm // bands
+        # block -> one {band key: items} table per band
+        self._tables: dict[Hashable, list[defaultdict[int, list[Hashable]]]] = {}
+
+    def _band_keys(self, signature: np.ndarray) -> list[int]:
+        """Fold each band's rows into one integer key (exact for 2 rows)."""
+        bands = signature.reshape(self._bands, self._rows)
+        keys = bands[:, 0].copy()
+        for row in range(1, self._rows):
+            keys = keys * np.uint64(MERSENNE_PRIME) + bands[:, row]
+        return keys.tolist()
+
+    def insert(self, item: Hashable, signature: np.ndarray, block: Hashable = None) -> None:
+        """Add an item's signature to the index.
+
+        Args:
+            item: Identifier returned by later queries.
+            signature: The item's MinHash signature.
+            block: Partition key; only same-block items are candidates.
+        """
+        tables = self._tables.get(block)
+        if tables is None:
+            tables = self._tables[block] = [defaultdict(list) for _ in range(self._bands)]
+        for table, key in zip(tables, self._band_keys(signature), strict=True):
+            table[key].append(item)
+
+    def query(self, signature: np.ndarray, block: Hashable = None) -> set[Hashable]:
+        """Items sharing at least one band bucket with the signature.
+
+        Args:
+            signature: MinHash signature to look up.
+            block: Partition key to search within.
+
+        Returns:
+            Candidate item identifiers (unverified).
+        """
+        found: set[Hashable] = set()
+        tables = self._tables.get(block)
+        if tables is None:
+            return found
+        for table, key in zip(tables, self._band_keys(signature), strict=True):
+            bucket = table.get(key)
+            if bucket:
+                found.update(bucket)
+        return found
@@ -308,7 +308,7 @@ class ProactiveMemoryService:
 
         try:
             # Import Graphiti client (only when needed to avoid circular imports)
-            from src.db.graphiti import GraphitiClient
+            from src.db.graphiti import GraphitiClient, search_group_ids
 
             # Check if Graphiti is initialized
             if not GraphitiClient.is_initialized():
@@ -326,7 +326,7 @@ class ProactiveMemoryService:
             results = await graphiti.search(
                 query=current_message,
                 num_results=5,
-                group_ids=[user_id],  # Scope to user's memories
+                group_ids=search_group_ids(user_id),  # Scope to user's memories
             )
 
             # Convert results to ProactiveInsight objects
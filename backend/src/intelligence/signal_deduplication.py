@@ -3,6 +3,14 @@
 Groups near-duplicate signals (same event from multiple news sources)
 into clusters. The primary signal in each cluster is displayed;
 others are accessible as "additional sources."
+
+Candidate pairs come from a MinHash/LSH index blocked by company name
+instead of comparing every signal with every other, and are verified with
+exact Jaccard similarity on headline words, so cluster assignment matches
+the all-pairs comparison. Each clustered signal's MinHash signature is
+persisted in ``market_signals.minhash_signature``; in incremental mode new
+signals are first matched against the signatures of existing clusters and
+join them rather than forming duplicate clusters.
 """
 
 from __future__ import annotations
@@ -12,8 +20,78 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import numpy as np
+
+from src.db.supabase import execute_async
+from src.intelligence.minhash import LSHIndex, MinHasher, jaccard, tokenize
+
 logger = logging.getLogger(__name__)
 
+SIMILARITY_THRESHOLD = 0.4  # 40% word overlap = likely same event
+
+_hasher: MinHasher | None = None
+
+
+def _get_hasher() -> MinHasher:
+    global _hasher
+    if _hasher is None:
+        _hasher = MinHasher()
+    return _hasher
+
+
+def cluster_signals(
+    signals: list[dict[str, Any]],
+    signatures: list[np.ndarray | None] | None = None,
+    threshold: float = SIMILARITY_THRESHOLD,
+) -> list[list[dict[str, Any]]]:
+    """Greedily cluster signals whose headlines overlap with a seed signal.
+
+    Walks signals in order; each unclustered signal seeds a cluster of every
+    later-or-earlier unclustered signal from the same company whose headline
+    Jaccard similarity with the seed is at least ``threshold``. Candidates
+    come from LSH buckets, so the cost is near-linear in the number of
+    signals rather than quadratic.
+
+    Args:
+        signals: Rows with ``id``, ``headline`` and ``company_name``.
+        signatures: Precomputed MinHash signatures aligned with ``signals``.
+        threshold: Minimum Jaccard similarity to join the seed's cluster.
+
+    Returns:
+        Clusters of two or more signals, each sorted primary-first (longest
+        headline).
+    """
+    tokens = [tokenize(s.get("headline")) for s in signals]
+    if signatures is None:
+        signatures = _get_hasher().signatures(tokens)
+
+    index = LSHIndex()
+    for i, sig in enumerate(signatures):
+        if sig is not None:
+            index.insert(i, sig, signals[i].get("company_name"))
+
+    clusters: list[list[dict[str, Any]]] = []
+    processed: set[str] = set()
+
+    for i, sig_a in enumerate(signals):
+        if sig_a["id"] in processed or signatures[i] is None:
+            continue
+
+        cluster: list[dict[str, Any]] = [sig_a]
+        for j in sorted(index.query(signatures[i], sig_a.get("company_name"))):
+            if i == j or signals[j]["id"] in processed:
+                continue
+            if jaccard(tokens[i], tokens[j]) >= threshold:
+                cluster.append(signals[j])
+
+        if len(cluster) > 1:
+            # Primary = the one with longest headline (most detail)
+            cluster.sort(key=lambda s: len(s.get("headline") or ""), reverse=True)
+            processed.update(s["id"] for s in cluster)
+            clusters.append(cluster)
+
+    return clusters
+
 
 class SignalDeduplicator:
     """Groups near-duplicate market signals into clusters."""
@@ -21,89 +99,186 @@ class SignalDeduplicator:
     def __init__(self, supabase_client: Any) -> None:
         self._db = supabase_client
 
-    async def deduplicate_signals(self, window_hours: int = 48) -> int:
+    async def deduplicate_signals(self, window_hours: int = 48, incremental: bool = True) -> int:
         """Find and cluster near-duplicate signals from the last N hours.
 
         Uses headline similarity (Jaccard on word sets) + same company + time window.
 
         Args:
             window_hours: How far back to look for duplicates.
+            incremental: Match unclustered signals against existing clusters'
+                persisted signatures before clustering the remainder.
 
         Returns:
             Number of clusters created.
         """
         cutoff = (datetime.now(timezone.utc) - timedelta(hours=window_hours)).isoformat()
 
-        signals = (
+        signals = await execute_async(
             self._db.table("market_signals")
             .select("id, headline, company_name, detected_at, cluster_id")
             .gte("detected_at", cutoff)
             .is_("cluster_id", "null")
             .order("detected_at", desc=True)
-            .execute()
         )
 
-        if not signals.data or len(signals.data) < 2:
+        rows: list[dict[str, Any]] = signals.data or []
+        if not rows:
             return 0
 
+        hasher = _get_hasher()
+        signatures = hasher.signatures([tokenize(s.get("headline")) for s in rows])
+
+        if incremental:
+            attached = await self._attach_to_existing_clusters(rows, signatures, cutoff)
+            if attached:
+                keep = [i for i, s in enumerate(rows) if s["id"] not in attached]
+                rows = [rows[i] for i in keep]
+                signatures = [signatures[i] for i in keep]
+
+        if len(rows) < 2:
+            return 0
+
+        sig_by_id = {s["id"]: sig for s, sig in zip(rows, signatures, strict=True)}
         clusters_created = 0
-        processed: set[str] = set()
 
-        for i, sig_a in enumerate(signals.data):
-            if sig_a["id"] in processed:
-                continue
+        for cluster in cluster_signals(rows, signatures):
+            cluster_uuid = str(uuid.uuid4())
+            primary_id = cluster[0]["id"]
 
-            cluster: list[dict[str, Any]] = [sig_a]
-            words_a = set((sig_a.get("headline") or "").lower().split())
-
-            for j, sig_b in enumerate(signals.data):
-                if i == j or sig_b["id"] in processed:
-                    continue
-
-                # Must be same company
-                if sig_a.get("company_name") != sig_b.get("company_name"):
-                    continue
-
-                # Jaccard similarity on headline words
-                words_b = set((sig_b.get("headline") or "").lower().split())
-                if not words_a or not words_b:
-                    continue
-
-                intersection = words_a & words_b
-                union = words_a | words_b
-                similarity = len(intersection) / len(union) if union else 0
-
-                if similarity >= 0.4:  # 40% word overlap = likely same event
-                    cluster.append(sig_b)
-
-            if len(cluster) > 1:
-                cluster_uuid = str(uuid.uuid4())
-
-                # Primary = the one with longest headline (most detail)
-                cluster.sort(key=lambda s: len(s.get("headline") or ""), reverse=True)
-                primary_id = cluster[0]["id"]
-
-                for sig in cluster:
-                    try:
-                        self._db.table("market_signals").update(
-                            {
-                                "cluster_id": cluster_uuid,
-                                "is_cluster_primary": sig["id"] == primary_id,
-                            }
-                        ).eq("id", sig["id"]).execute()
-                    except Exception as e:
-                        logger.warning(
-                            "[SignalDedup] Failed to update signal %s: %s",
-                            sig["id"],
-                            e,
-                        )
-                    processed.add(sig["id"])
-
-                clusters_created += 1
-                logger.info(
-                    "[SignalDedup] Created cluster with %d signals for %s",
-                    len(cluster),
-                    sig_a.get("company_name", "unknown"),
+            for sig in cluster:
+                await self._assign(
+                    sig["id"], cluster_uuid, sig["id"] == primary_id, sig_by_id[sig["id"]]
                 )
 
+            clusters_created += 1
+            logger.info(
+                "[SignalDedup] Created cluster with %d signals for %s",
+                len(cluster),
+                cluster[0].get("company_name", "unknown"),
+            )
+
         return clusters_created
+
+    async def _attach_to_existing_clusters(
+        self,
+        rows: list[dict[str, Any]],
+        signatures: list[np.ndarray | None],
+        cutoff: str,
+    ) -> set[str]:
+        """Join unclustered signals to matching clusters already in the window.
+
+        Existing cluster members are indexed by their persisted signature
+        (recomputed from the headline for rows clustered before signatures
+        were stored). A new signal joins the cluster of its most similar
+        member at or above the threshold, and becomes primary if its
+        headline is longer than the current primary's.
+
+        Args:
+            rows: Unclustered signals.
+            signatures: MinHash signatures aligned with ``rows``.
+            cutoff: ISO timestamp lower bound for existing clusters.
+
+        Returns:
+            IDs of signals that joined an existing cluster.
+        """
+        try:
+            result = await execute_async(
+                self._db.table("market_signals")
+                .select(
+                    "id, headline, company_name, cluster_id, is_cluster_primary, minhash_signature"
+                )
+                .gte("detected_at", cutoff)
+                .not_.is_("cluster_id", "null")
+            )
+        except Exception as e:
+            logger.warning("[SignalDedup] Failed to load existing clusters: %s", e)
+            return set()
+
+        members: list[dict[str, Any]] = result.data or []
+        if not members:
+            return set()
+
+        hasher = _get_hasher()
+        member_tokens = [tokenize(m.get("headline")) for m in members]
+        index = LSHIndex(num_perm=hasher.num_perm)
+        primaries: dict[str, dict[str, Any]] = {}
+        for i, member in enumerate(members):
+            if member.get("is_cluster_primary"):
+                primaries[member["cluster_id"]] = member
+            stored = member.get("minhash_signature")
+            if stored and len(stored) == hasher.num_perm:
+                sig = np.asarray(stored, dtype=np.uint64)
+            else:
+                sig = hasher.signature(member_tokens[i])
+            if sig is not None:
+                index.insert(i, sig, member.get("company_name"))
+
+        attached: set[str] = set()
+        for row, sig in zip(rows, signatures, strict=True):
+            if sig is None:
+                continue
+            row_tokens = tokenize(row.get("headline"))
+            best: tuple[float, int] | None = None
+            for j in sorted(index.query(sig, row.get("company_name"))):
+                similarity = jaccard(row_tokens, member_tokens[j])
+                if similarity >= SIMILARITY_THRESHOLD and (best is None or similarity > best[0]):
+                    best = (similarity, j)
+            if best is None:
+                continue
+
+            cluster_id = members[best[1]]["cluster_id"]
+            primary = primaries.get(cluster_id)
+            headline_len = len(row.get("headline") or "")
+            becomes_primary = primary is None or headline_len > len(primary.get("headline") or "")
+            if becomes_primary and primary is not None:
+                await self._set_primary(primary["id"], False)
+            await self._assign(row["id"], cluster_id, becomes_primary, sig)
+
+            # Later new signals can match this one too
+            new_member = {**row, "cluster_id": cluster_id, "is_cluster_primary": becomes_primary}
+            members.append(new_member)
+            member_tokens.append(row_tokens)
+            index.insert(len(members) - 1, sig, row.get("company_name"))
+            if becomes_primary:
+                primaries[cluster_id] = new_member
+            attached.add(row["id"])
+
+        if attached:
+            logger.info("[SignalDedup] Attached %d signals to existing clusters", len(attached))
+        return attached
+
+    async def _assign(
+        self,
+        signal_id: str,
+        cluster_id: str,
+        is_primary: bool,
+        signature: np.ndarray | None,
+    ) -> None:
+        """Persist a signal's cluster membership and MinHash signature."""
+        update: dict[str, Any] = {"cluster_id": cluster_id, "is_cluster_primary": is_primary}
+        if signature is not None:
+            update["minhash_signature"] = signature.tolist()
+        try:
+            await execute_async(self._db.table("market_signals").update(update).eq("id", signal_id))
+        except Exception as e:
+            logger.warning(
+                "[SignalDedup] Failed to update signal %s: %s",
+                signal_id,
+                e,
+            )
+
+    async def _set_primary(self, signal_id: str, is_primary: bool) -> None:
+        """Flip the primary flag on an existing cluster member."""
+        try:
+            await execute_async(
+                self._db.table("market_signals")
+                .update({"is_cluster_primary": is_primary})
+                .eq("id", signal_id)
+            )
+        except Exception as e:
+            logger.warning(
+                "[SignalDedup] Failed to update signal %s: %s",
+                signal_id,
+                e,
+            )
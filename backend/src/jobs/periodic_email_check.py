@@ -1,17 +1,30 @@
 """Periodic email inbox check job for urgent email detection.
 
-This job runs every 30 minutes during business hours to check for
+This job runs every 15 minutes during business hours to check for
 new urgent emails and trigger real-time notifications.
 
 Used by the scheduler to proactively surface urgent emails without
 waiting for the user to manually scan or the morning briefing.
+
+Users are checked concurrently, at most PERIODIC_EMAIL_CHECK_CONCURRENCY
+at a time, so one slow mailbox or Composio timeout does not hold up
+everyone after it. Each inbox scan is cut off after
+PERIODIC_EMAIL_CHECK_USER_TIMEOUT_SECONDS. Users whose last scan is the
+oldest start first; among equals, the user with the fewest business
+hours left in their day goes first. Scan latency per user is kept by
+``EmailCheckLatency`` and reported on the admin perf-stats endpoint.
 """
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from src.db.supabase import SupabaseClient
+from src.core.config import settings
+from src.core.timing import LogHistogram
+from src.db.supabase import SupabaseClient, execute_async
 from src.services.email_analyzer import EmailAnalyzer
 from src.services.realtime_email_notifier import get_realtime_email_notifier
 
@@ -22,25 +35,109 @@ logger = logging.getLogger(__name__)
 DEFAULT_BUSINESS_START_HOUR = 8  # 8 AM
 DEFAULT_BUSINESS_END_HOUR = 19  # 7 PM
 
+# Skip users whose last completed run is more recent than this
+MIN_HOURS_BETWEEN_RUNS = 0.5
+
+# Users listed as the slowest in job and latency stats
+SLOWEST_USERS_REPORTED = 5
+
+
+@dataclass
+class _UserCheck:
+    """A user due for an inbox check, with the state the scan needs."""
+
+    user_id: str
+    since_hours: float
+    watermark_ts: str | None
+    business_hours_left: float
+
+
+@dataclass
+class _UserLatency:
+    scans: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    timeouts: int = 0
+
+
+class EmailCheckLatency:
+    """Inbox scan latency of the periodic email check, overall and per user.
+
+    The histogram covers every scan; the per-user record keeps each user's
+    last and worst scan time and timeout count, so the users behind the
+    tail can be named.
+    """
+
+    def __init__(self) -> None:
+        self.scans = LogHistogram()
+        self.timeouts = 0
+        self._users: dict[str, _UserLatency] = {}
+
+    def record(self, user_id: str, duration_ms: float, *, timed_out: bool = False) -> None:
+        """Record one user's scan."""
+        self.scans.record(duration_ms)
+        user = self._users.setdefault(user_id, _UserLatency())
+        user.scans += 1
+        user.last_ms = duration_ms
+        user.max_ms = max(user.max_ms, duration_ms)
+        if timed_out:
+            self.timeouts += 1
+            user.timeouts += 1
+
+    def slowest(self, limit: int = SLOWEST_USERS_REPORTED) -> list[dict[str, Any]]:
+        """Users with the slowest most recent scan, slowest first."""
+        ranked = sorted(self._users.items(), key=lambda item: item[1].last_ms, reverse=True)
+        return [
+            {
+                "user_id": user_id,
+                "scans": user.scans,
+                "last_ms": round(user.last_ms, 2),
+                "max_ms": round(user.max_ms, 2),
+                "timeouts": user.timeouts,
+            }
+            for user_id, user in ranked[:limit]
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Scan latency summary, timeout count and slowest users."""
+        return {
+            "scan": self.scans.summary(),
+            "timeouts": self.timeouts,
+            "users": len(self._users),
+            "slowest_users": self.slowest(),
+        }
+
+
+_email_check_latency: EmailCheckLatency | None = None
+
+
+def get_email_check_latency() -> EmailCheckLatency:
+    """Get the process-wide EmailCheckLatency."""
+    global _email_check_latency
+    if _email_check_latency is None:
+        _email_check_latency = EmailCheckLatency()
+    return _email_check_latency
+
 
 async def run_periodic_email_check() -> dict[str, Any]:
     """Run periodic inbox check for all users with email integrations.
 
-    For each user with email connected:
-    1. Check if within business hours (8 AM - 7 PM user timezone)
-    2. Get last processing run watermark from email_processing_runs.completed_at
-    3. Scan inbox for emails since watermark
-    4. If urgent emails found: trigger RealtimeEmailNotifier
+    1. Keep users within business hours (8 AM - 7 PM user timezone)
+    2. Load every user's last completed run and watermark in one query
+    3. Drop users scanned less than 30 minutes ago and order the rest
+    4. Scan each user's inbox since the watermark, several users at once
+    5. If urgent emails found: trigger RealtimeEmailNotifier
 
     Returns:
         Dict with statistics about the check run.
     """
-    stats = {
+    stats: dict[str, Any] = {
         "users_checked": 0,
         "users_skipped_off_hours": 0,
         "users_with_urgent": 0,
         "total_urgent_emails": 0,
         "notifications_sent": 0,
+        "timeouts": 0,
         "errors": 0,
     }
 
@@ -62,88 +159,40 @@ async def run_periodic_email_check() -> dict[str, Any]:
             len(users),
         )
 
+        due = await _load_due_users(db, users, stats)
+
         analyzer = EmailAnalyzer()
         notifier = get_realtime_email_notifier()
-
-        for user_record in users:
-            user_id = user_record["user_id"]
-
-            try:
-                # Check if within business hours
-                if not _is_business_hours(user_id, user_record.get("metadata")):
-                    stats["users_skipped_off_hours"] += 1
-                    continue
-
-                stats["users_checked"] += 1
-
-                # Get last processing run watermark
-                since_hours = _calculate_hours_since_last_run(db, user_id)
-
-                if since_hours < 0.5:  # Skip if last run was less than 30 min ago
-                    logger.debug(
-                        "PERIODIC_EMAIL_CHECK: Skipping user %s - last run %0.1f hours ago",
-                        user_id,
-                        since_hours,
-                    )
-                    continue
-
-                # Get watermark timestamp for dedup filtering
-                watermark_ts = _get_watermark_timestamp(db, user_id)
-
-                # Scan inbox for new emails
-                logger.info(
-                    "PERIODIC_EMAIL_CHECK: Scanning inbox for user %s (since %0.1f hours, watermark=%s)",
-                    user_id,
-                    since_hours,
-                    watermark_ts or "none",
-                )
-
-                scan_result = await analyzer.scan_inbox(
-                    user_id,
-                    since_hours=since_hours,
-                    since_timestamp=watermark_ts,
-                )
-
-                if scan_result.urgent:
-                    stats["users_with_urgent"] += 1
-                    stats["total_urgent_emails"] += len(scan_result.urgent)
-
-                    # Process and notify
-                    notifications = await notifier.process_and_notify(
-                        user_id=user_id,
-                        urgent_emails=scan_result.urgent,
-                        generate_drafts=True,
-                    )
-                    stats["notifications_sent"] += len(notifications)
-
-                    logger.info(
-                        "PERIODIC_EMAIL_CHECK: User %s has %d urgent emails, sent %d notifications",
-                        user_id,
-                        len(scan_result.urgent),
-                        len(notifications),
-                    )
-                else:
-                    logger.debug(
-                        "PERIODIC_EMAIL_CHECK: No urgent emails for user %s",
-                        user_id,
-                    )
-
-            except Exception as e:
-                logger.warning(
-                    "PERIODIC_EMAIL_CHECK: Failed for user %s: %s",
-                    user_id,
-                    e,
-                    exc_info=True,
-                )
-                stats["errors"] += 1
+        slots = asyncio.Semaphore(max(1, settings.PERIODIC_EMAIL_CHECK_CONCURRENCY))
+        durations: dict[str, float] = {}
+
+        async def check_one(check: _UserCheck) -> None:
+            async with slots:
+                await _check_user(analyzer, notifier, check, stats, durations)
+
+        # Semaphore waiters are served in order, so users start by priority
+        await asyncio.gather(*(check_one(check) for check in due))
+
+        if durations:
+            run_latency = LogHistogram()
+            for duration_ms in durations.values():
+                run_latency.record(duration_ms)
+            stats["scan_latency"] = run_latency.summary()
+            stats["slowest_users"] = [
+                {"user_id": user_id, "duration_ms": round(duration_ms, 2)}
+                for user_id, duration_ms in sorted(
+                    durations.items(), key=lambda item: item[1], reverse=True
+                )[:SLOWEST_USERS_REPORTED]
+            ]
 
         logger.info(
             "PERIODIC_EMAIL_CHECK: Complete. Checked %d users, %d with urgent emails, "
-            "%d total urgent, %d notifications sent, %d errors",
+            "%d total urgent, %d notifications sent, %d timeouts, %d errors",
             stats["users_checked"],
             stats["users_with_urgent"],
             stats["total_urgent_emails"],
             stats["notifications_sent"],
+            stats["timeouts"],
             stats["errors"],
         )
 
@@ -158,6 +207,214 @@ async def run_periodic_email_check() -> dict[str, Any]:
     return stats
 
 
+async def _load_due_users(
+    db: Any,
+    users: list[dict[str, Any]],
+    stats: dict[str, Any],
+) -> list[_UserCheck]:
+    """Pick the users to scan this run, in the order they should start.
+
+    Args:
+        db: Supabase client.
+        users: user_integrations rows; a user may have several.
+        stats: Job statistics, updated with business-hours counts.
+
+    Returns:
+        Users within business hours whose last run is at least
+        MIN_HOURS_BETWEEN_RUNS old, longest since their last run first,
+        then fewest business hours left.
+    """
+    # One check per user, using the first integration that has metadata
+    metadata_by_user: dict[str, dict[str, Any] | None] = {}
+    for record in users:
+        user_id = record["user_id"]
+        if not metadata_by_user.get(user_id):
+            metadata_by_user[user_id] = record.get("metadata")
+
+    in_hours: dict[str, float] = {}
+    for user_id, metadata in metadata_by_user.items():
+        if not _is_business_hours(user_id, metadata):
+            stats["users_skipped_off_hours"] += 1
+            continue
+        stats["users_checked"] += 1
+        local_now = _local_now(metadata)
+        in_hours[user_id] = max(
+            0.0, DEFAULT_BUSINESS_END_HOUR - (local_now.hour + local_now.minute / 60)
+        )
+
+    if not in_hours:
+        return []
+
+    state = await _load_check_state(db, list(in_hours))
+
+    due: list[_UserCheck] = []
+    for user_id, business_hours_left in in_hours.items():
+        watermark_ts: str | None = None
+        if state is not None:
+            row = state.get(user_id, {})
+            since_hours = _hours_since(row.get("last_completed_at"))
+            watermark_ts = row.get("watermark_timestamp")
+        else:
+            since_hours = _calculate_hours_since_last_run(db, user_id)
+
+        if since_hours < MIN_HOURS_BETWEEN_RUNS:
+            logger.debug(
+                "PERIODIC_EMAIL_CHECK: Skipping user %s - last run %0.1f hours ago",
+                user_id,
+                since_hours,
+            )
+            continue
+
+        if state is None:
+            watermark_ts = _get_watermark_timestamp(db, user_id)
+        due.append(_UserCheck(user_id, since_hours, watermark_ts, business_hours_left))
+
+    due.sort(key=lambda check: (-check.since_hours, check.business_hours_left))
+    return due
+
+
+async def _load_check_state(db: Any, user_ids: list[str]) -> dict[str, dict[str, Any]] | None:
+    """Load last completed run and watermark for many users in one call.
+
+    Args:
+        db: Supabase client.
+        user_ids: Users to load.
+
+    Returns:
+        Mapping of user ID to its ``get_email_check_state`` row (users with
+        no completed run are absent), or None if the RPC failed and the
+        per-user queries should be used instead.
+    """
+    try:
+        result = await execute_async(db.rpc("get_email_check_state", {"p_user_ids": user_ids}))
+    except Exception as e:
+        logger.warning(
+            "PERIODIC_EMAIL_CHECK: Batched state load failed, querying users one by one: %s",
+            e,
+        )
+        return None
+    return {str(row["user_id"]): row for row in result.data or []}
+
+
+async def _check_user(
+    analyzer: EmailAnalyzer,
+    notifier: Any,
+    check: _UserCheck,
+    stats: dict[str, Any],
+    durations: dict[str, float],
+) -> None:
+    """Scan one user's inbox and notify on urgent emails.
+
+    Only the scan is bounded by the per-user timeout, so notifications for
+    urgent emails already found are never cut off halfway.
+
+    Args:
+        analyzer: Shared EmailAnalyzer.
+        notifier: Shared RealtimeEmailNotifier.
+        check: The user to check.
+        stats: Job statistics, updated in place.
+        durations: Scan time per user for this run, in milliseconds.
+    """
+    user_id = check.user_id
+    logger.info(
+        "PERIODIC_EMAIL_CHECK: Scanning inbox for user %s (since %0.1f hours, watermark=%s)",
+        user_id,
+        check.since_hours,
+        check.watermark_ts or "none",
+    )
+
+    timeout = settings.PERIODIC_EMAIL_CHECK_USER_TIMEOUT_SECONDS
+    timed_out = False
+    start = time.perf_counter()
+    try:
+        scan_result = await asyncio.wait_for(
+            analyzer.scan_inbox(
+                user_id,
+                since_hours=check.since_hours,
+                since_timestamp=check.watermark_ts,
+            ),
+            timeout=timeout,
+        )
+    except TimeoutError:
+        timed_out = True
+        stats["timeouts"] += 1
+        logger.warning(
+            "PERIODIC_EMAIL_CHECK: Scan for user %s timed out after %.0fs",
+            user_id,
+            timeout,
+        )
+        return
+    except Exception as e:
+        logger.warning(
+            "PERIODIC_EMAIL_CHECK: Failed for user %s: %s",
+            user_id,
+            e,
+            exc_info=True,
+        )
+        stats["errors"] += 1
+        return
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000.0
+        durations[user_id] = duration_ms
+        get_email_check_latency().record(user_id, duration_ms, timed_out=timed_out)
+
+    if not scan_result.urgent:
+        logger.debug(
+            "PERIODIC_EMAIL_CHECK: No urgent emails for user %s",
+            user_id,
+        )
+        return
+
+    stats["users_with_urgent"] += 1
+    stats["total_urgent_emails"] += len(scan_result.urgent)
+
+    try:
+        notifications = await notifier.process_and_notify(
+            user_id=user_id,
+            urgent_emails=scan_result.urgent,
+            generate_drafts=True,
+        )
+    except Exception as e:
+        logger.warning(
+            "PERIODIC_EMAIL_CHECK: Failed for user %s: %s",
+            user_id,
+            e,
+            exc_info=True,
+        )
+        stats["errors"] += 1
+        return
+    stats["notifications_sent"] += len(notifications)
+
+    logger.info(
+        "PERIODIC_EMAIL_CHECK: User %s has %d urgent emails, sent %d notifications",
+        user_id,
+        len(scan_result.urgent),
+        len(notifications),
+    )
+
+
+def _local_now(metadata: dict[str, Any] | None = None) -> datetime:
+    """Current time in the user's timezone, or UTC if it is unknown.
+
+    Args:
+        metadata: Optional user integration metadata with timezone info.
+
+    Returns:
+        Timezone-aware current time.
+    """
+    # In production, this should query user_settings for timezone
+    now = datetime.now(UTC)
+    user_timezone = metadata.get("timezone") if isinstance(metadata, dict) else None
+    if not user_timezone:
+        return now
+    try:
+        import zoneinfo
+
+        return now.astimezone(zoneinfo.ZoneInfo(user_timezone))
+    except Exception:
+        return now
+
+
 def _is_business_hours(
     user_id: str,
     metadata: dict[str, Any] | None = None,
@@ -174,27 +431,7 @@ def _is_business_hours(
         True if within business hours, False otherwise.
     """
     try:
-        # Get user timezone from metadata or use UTC default
-        # In production, this should query user_settings for timezone
-        user_timezone = None
-        if metadata and isinstance(metadata, dict):
-            user_timezone = metadata.get("timezone")
-
-        now = datetime.now(UTC)
-
-        # If we have a timezone, convert to local time
-        if user_timezone:
-            try:
-                import zoneinfo
-
-                tz = zoneinfo.ZoneInfo(user_timezone)
-                local_now = now.astimezone(tz)
-            except Exception:
-                local_now = now
-        else:
-            local_now = now
-
-        current_hour = local_now.hour
+        current_hour = _local_now(metadata).hour
 
         # Check if within business hours (8 AM - 7 PM)
         is_business = DEFAULT_BUSINESS_START_HOUR <= current_hour < DEFAULT_BUSINESS_END_HOUR
@@ -247,18 +484,8 @@ def _calculate_hours_since_last_run(db: Any, user_id: str) -> float:
                 "PERIODIC_EMAIL_CHECK: No previous run for user %s, using default 24h",
                 user_id,
             )
-            return 24.0
 
-        completed_at_str = record["completed_at"]
-        completed_at = datetime.fromisoformat(
-            completed_at_str.replace("Z", "+00:00")
-        )
-
-        delta = datetime.now(UTC) - completed_at
-        hours = delta.total_seconds() / 3600
-
-        # Cap at 24 hours max
-        return min(hours, 24.0)
+        return _hours_since(record.get("completed_at") if record else None)
 
     except Exception as e:
         logger.warning(
@@ -269,6 +496,15 @@ def _calculate_hours_since_last_run(db: Any, user_id: str) -> float:
         return 24.0
 
 
+def _hours_since(completed_at: str | None) -> float:
+    """Hours since a run's completed_at, capped at 24 (24 if there is none)."""
+    if not completed_at:
+        return 24.0
+    completed_at_dt = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
+    hours = (datetime.now(UTC) - completed_at_dt).total_seconds() / 3600
+    return min(hours, 24.0)
+
+
 def _get_watermark_timestamp(db: Any, user_id: str) -> str | None:
     """Get the watermark timestamp from the last completed processing run.
 
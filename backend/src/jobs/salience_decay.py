@@ -3,17 +3,50 @@
 This job should be scheduled to run once per day (e.g., via cron or
 a task scheduler). It recalculates salience for all user memories
 based on time elapsed since last access.
+
+Users are processed in batches of ``SALIENCE_DECAY_USERS_PER_QUERY`` that
+share each salience query; a batch that fails is retried user by user so
+one bad user doesn't stop the rest.
 """
 
 import logging
 from typing import Any, cast
 
+from src.core.config import settings
 from src.db.supabase import SupabaseClient
 from src.memory.salience import SalienceService
 
 logger = logging.getLogger(__name__)
 
 
+async def _decay_users_individually(
+    salience_service: SalienceService,
+    user_ids: list[str],
+) -> tuple[int, int]:
+    """Fallback for a failed batch: update each user on their own.
+
+    Returns:
+        Tuple of (records updated, users that failed).
+    """
+    updated_total = 0
+    errors = 0
+    for user_id in user_ids:
+        try:
+            updated = await salience_service.update_all_salience(user_id)
+            updated_total += updated
+            logger.info(
+                f"Updated salience for user {user_id}",
+                extra={"user_id": user_id, "records_updated": updated},
+            )
+        except Exception as e:
+            errors += 1
+            logger.error(
+                f"Failed to update salience for user {user_id}",
+                extra={"user_id": user_id, "error": str(e)},
+            )
+    return updated_total, errors
+
+
 async def run_salience_decay_job() -> dict[str, Any]:
     """Run the daily salience decay update for all users.
 
@@ -29,25 +62,32 @@ async def run_salience_decay_job() -> dict[str, Any]:
     # Get all user IDs
     users_result = db.table("user_profiles").select("id").execute()
     users = cast(list[dict[str, Any]], users_result.data or [])
+    user_ids = [cast(str, user["id"]) for user in users]
 
     total_updated = 0
     errors = 0
+    batch_size = max(1, settings.SALIENCE_DECAY_USERS_PER_QUERY)
 
-    for user in users:
-        user_id = cast(str, user["id"])
+    for i in range(0, len(user_ids), batch_size):
+        batch = user_ids[i : i + batch_size]
         try:
-            updated = await salience_service.update_all_salience(user_id)
-            total_updated += updated
-            logger.info(
-                f"Updated salience for user {user_id}",
-                extra={"user_id": user_id, "records_updated": updated},
-            )
+            per_user = await salience_service.update_salience_for_users(batch)
         except Exception as e:
-            errors += 1
-            logger.error(
-                f"Failed to update salience for user {user_id}",
-                extra={"user_id": user_id, "error": str(e)},
+            logger.warning(
+                "Batched salience update failed, retrying users individually",
+                extra={"users": len(batch), "error": str(e)},
             )
+            updated, failed = await _decay_users_individually(salience_service, batch)
+            total_updated += updated
+            errors += failed
+            continue
+
+        batch_updated = sum(per_user.values())
+        total_updated += batch_updated
+        logger.info(
+            f"Updated salience for {len(batch)} users",
+            extra={"users": len(batch), "records_updated": batch_updated},
+        )
 
     result = {
         "users_processed": len(users),
@@ -244,6 +244,29 @@ async def lifespan(_app: FastAPI) -> Any:
     except Exception:
         logger.exception("Failed to backfill integration_sync_state (non-fatal)")
 
+    # Usage write-behind buffer (llm_usage rows + usage_tracking deltas)
+    from src.core.usage_writer import get_usage_write_buffer
+
+    await get_usage_write_buffer().start()
+
+    # Background Graphiti episode ingestion (graphiti_episode_queue)
+    from src.db.graphiti_queue import get_episode_write_queue
+
+    if settings.GRAPHITI_QUEUE_ENABLED:
+        await get_episode_write_queue().start()
+
+    # Cross-worker fan-out for goal SSE streams and WebSocket events
+    from src.core.cluster import get_cluster_bus
+    from src.core.event_bus import EventBus
+    from src.core.ws import ws_manager
+    from src.services.notification_service import get_unread_counter
+
+    cluster_bus = get_cluster_bus()
+    await cluster_bus.start()
+    ws_manager.attach_cluster(cluster_bus, settings.WS_PRESENCE_INTERVAL_SECONDS)
+    get_unread_counter().attach_cluster(cluster_bus)
+    EventBus.get_instance()
+
     # US-942: Start the sync scheduler
     scheduler = get_sync_scheduler()
     await scheduler.start()
@@ -383,9 +406,37 @@ async def lifespan(_app: FastAPI) -> Any:
         await get_session_manager().close()
     except Exception:
         logger.debug("Composio session cleanup skipped")
+    # Leave unfinished batches leased; another worker retries them
+    await get_episode_write_queue().stop()
     if GraphitiClient.is_initialized():
         await GraphitiClient.close()
         logger.info("Graphiti connection closed")
+    # Tell other workers we're gone, flush relayed events and disconnect
+    try:
+        await ws_manager.detach_cluster()
+        get_unread_counter().detach_cluster()
+        await cluster_bus.stop()
+    except Exception:
+        logger.exception("Error stopping cluster bus")
+    # Stop document parsing worker processes
+    try:
+        from src.onboarding.document_ingestion import shutdown_parse_pool
+
+        shutdown_parse_pool()
+    except Exception:
+        logger.exception("Error shutting down document parse pool")
+    # Drain pending usage writes before the DB transport goes away
+    try:
+        await get_usage_write_buffer().stop()
+    except Exception:
+        logger.exception("Error draining usage write buffer")
+    # Close the pooled async Supabase transport
+    try:
+        from src.db.supabase import SupabaseClient
+
+        await SupabaseClient.close_async_client()
+    except Exception:
+        logger.exception("Error closing async Supabase client")
 
 
 app = FastAPI(
@@ -1,23 +1,23 @@
 """Standalone implementation functions for Life Sciences API calls.
 
 Extracted from AnalystAgent so they can be exposed as MCP tools.
-Each function is a module-level async function that uses a shared
-lazy-initialized httpx.AsyncClient, a module-level cache, and
-PubMed rate limiting (3 req/sec without API key).
+Each function is a module-level async function. Requests go through a
+shared ``LifesciRequestEngine`` (see ``engine.py``) that reuses one pooled
+httpx.AsyncClient, rate limits each host with a token bucket (PubMed:
+3 req/sec without API key), caches results with a TTL and LRU bound, and
+coalesces identical in-flight queries.
 """
 
 from __future__ import annotations
 
 import asyncio
-import json as _json_mod
 import logging
-import subprocess
-import time
 from typing import Any
-from urllib.parse import urlencode
 
 import httpx
 
+from src.mcp_servers.lifesci.engine import LifesciRequestEngine
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -34,80 +34,47 @@ CHEMBL_API_URL = "https://www.ebi.ac.uk/chembl/api/data"
 GOOGLE_PATENTS_XHR_URL = "https://patents.google.com/xhr/query"
 USPTO_USER_AGENT = "ARIA-Intelligence/1.0 (support@aria-intel.com)"
 
+# esummary accepts at most this many IDs per request
+_PUBMED_SUMMARY_BATCH = 200
+
 # ---------------------------------------------------------------------------
 # Module-level shared state
 # ---------------------------------------------------------------------------
 _http_client: httpx.AsyncClient | None = None
-_research_cache: dict[str, Any] = {}
-
-# PubMed rate limiting: 3 requests per second
-_PUBMED_RATE_LIMIT = 3
-_pubmed_last_call_time: float = 0.0
+_engine: LifesciRequestEngine | None = None
 
 
 def _get_client() -> httpx.AsyncClient:
     """Return a lazy-initialized module-level httpx.AsyncClient."""
     global _http_client
     if _http_client is None or _http_client.is_closed:
-        _http_client = httpx.AsyncClient(timeout=30.0)
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
     return _http_client
 
 
-async def _curl_get_json(
-    url: str,
-    params: dict[str, Any] | None = None,
-    timeout: int = 30,
-) -> dict[str, Any]:
-    """Fetch JSON via curl subprocess as a fallback for TLS-fingerprint blocks.
-
-    Some government APIs (e.g. ClinicalTrials.gov) block Python HTTP clients
-    via bot-detection / TLS fingerprinting while allowing curl.  This function
-    shells out to curl as a reliable fallback.
-
-    Args:
-        url: The URL to GET.
-        params: Optional query parameters.
-        timeout: Curl timeout in seconds.
-
-    Returns:
-        Parsed JSON dict.
-
-    Raises:
-        RuntimeError: If curl fails or returns non-JSON.
-    """
-    if params:
-        url = f"{url}?{urlencode(params, doseq=True)}"
-
-    result = await asyncio.to_thread(
-        subprocess.run,
-        ["curl", "-s", "-f", "--max-time", str(timeout), url],
-        capture_output=True,
-        text=True,
-        timeout=timeout + 5,
-    )
-
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"curl failed (exit {result.returncode}): {result.stderr[:200]}"
+def _get_engine() -> LifesciRequestEngine:
+    """Return the lazy-initialized request engine shared by all tools."""
+    global _engine
+    if _engine is None:
+        from src.core.config import settings
+
+        _engine = LifesciRequestEngine(
+            # Resolved per request so the client can be replaced (or patched)
+            lambda: _get_client(),
+            host_rates={
+                "eutils.ncbi.nlm.nih.gov": settings.LIFESCI_PUBMED_REQUESTS_PER_SECOND,
+                "clinicaltrials.gov": settings.LIFESCI_DEFAULT_REQUESTS_PER_SECOND,
+                "api.fda.gov": settings.LIFESCI_DEFAULT_REQUESTS_PER_SECOND,
+                "www.ebi.ac.uk": settings.LIFESCI_DEFAULT_REQUESTS_PER_SECOND,
+                "patents.google.com": settings.LIFESCI_DEFAULT_REQUESTS_PER_SECOND,
+            },
+            ttl=settings.LIFESCI_CACHE_TTL_SECONDS,
+            max_entries=settings.LIFESCI_CACHE_MAX_ENTRIES,
         )
-
-    return _json_mod.loads(result.stdout)
-
-
-async def _pubmed_rate_limit() -> None:
-    """Enforce PubMed's 3 req/sec rate limit, sleeping if needed."""
-    global _pubmed_last_call_time
-    current_time = time.time()
-    time_since_last = current_time - _pubmed_last_call_time
-    min_interval = 1.0 / _PUBMED_RATE_LIMIT
-    if time_since_last < min_interval:
-        await asyncio.sleep(min_interval - time_since_last)
-
-
-def _update_pubmed_timestamp() -> None:
-    """Record the timestamp of the most recent PubMed call."""
-    global _pubmed_last_call_time
-    _pubmed_last_call_time = time.time()
+    return _engine
 
 
 # ---------------------------------------------------------------------------
@@ -128,16 +95,10 @@ async def pubmed_search_impl(
     Returns:
         Dict with ``query``, ``count``, ``pmids``, and ``retmax``.
     """
-    await _pubmed_rate_limit()
-
+    engine = _get_engine()
     cache_key = f"pubmed:{query}:{max_results}:{days_back}"
-    if cache_key in _research_cache:
-        logger.info("PubMed cache hit for query: %s", query)
-        return _research_cache[cache_key]
-
-    try:
-        client = _get_client()
 
+    async def load() -> dict[str, Any]:
         params: dict[str, Any] = {
             "db": "pubmed",
             "term": query,
@@ -150,10 +111,7 @@ async def pubmed_search_impl(
             params["datetype"] = "edat"
             params["reldate"] = days_back
 
-        response = await client.get(PUBMED_ESEARCH_URL, params=params)
-        response.raise_for_status()
-
-        data = response.json()
+        data = await engine.get_json(PUBMED_ESEARCH_URL, params)
         search_result = data.get("esearchresult", {})
 
         result: dict[str, Any] = {
@@ -163,9 +121,6 @@ async def pubmed_search_impl(
             "retmax": int(search_result.get("retmax", 0)),
         }
 
-        _research_cache[cache_key] = result
-        _update_pubmed_timestamp()
-
         logger.info(
             "PubMed search found %d articles for: %s",
             result["count"],
@@ -174,6 +129,8 @@ async def pubmed_search_impl(
 
         return result
 
+    try:
+        return await engine.cached(cache_key, load)
     except httpx.HTTPStatusError as e:
         logger.error("PubMed API error: %s", e)
         return {"error": str(e), "pmids": [], "count": 0}
@@ -185,11 +142,38 @@ async def pubmed_search_impl(
 # ---------------------------------------------------------------------------
 # PubMed fetch details
 # ---------------------------------------------------------------------------
+async def _fetch_pubmed_summaries(
+    engine: LifesciRequestEngine,
+    pmids: list[str],
+) -> dict[str, Any]:
+    """Fetch one esummary batch and cache each article individually."""
+    params: dict[str, str] = {
+        "db": "pubmed",
+        "id": ",".join(pmids),
+        "retmode": "json",
+        "rettype": "abstract",
+    }
+
+    data = await engine.get_json(PUBMED_ESUMMARY_URL, params)
+    result_data: dict[str, Any] = data.get("result", {})
+
+    # Remove the "uids" key which contains the list, not the details
+    result_data.pop("uids", None)
+
+    for pmid, details in result_data.items():
+        engine.put(f"pubmed_details:{pmid}", details)
+    return result_data
+
+
 async def pubmed_fetch_details_impl(
     pmids: list[str],
 ) -> dict[str, Any]:
     """Fetch detailed metadata for PubMed articles.
 
+    Articles are cached per PMID, so overlapping requests only fetch the
+    IDs not seen recently. The rest are fetched in esummary batches of up
+    to 200 IDs, concurrently (the PubMed rate limit still applies).
+
     Args:
         pmids: List of PubMed IDs to fetch details for.
 
@@ -199,46 +183,53 @@ async def pubmed_fetch_details_impl(
     if not pmids:
         return {}
 
-    await _pubmed_rate_limit()
-
-    cache_key = f"pubmed_details:{','.join(sorted(pmids))}"
-    if cache_key in _research_cache:
-        logger.info("PubMed details cache hit for %d PMIDs", len(pmids))
-        return _research_cache[cache_key]
-
-    try:
-        client = _get_client()
-
-        params: dict[str, str] = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "json",
-            "rettype": "abstract",
-        }
-
-        response = await client.get(PUBMED_ESUMMARY_URL, params=params)
-        response.raise_for_status()
-
-        data = response.json()
-        result_data: dict[str, Any] = data.get("result", {})
-
-        # Remove the "uids" key which contains the list, not the details
-        if "uids" in result_data:
-            del result_data["uids"]
-
-        _research_cache[cache_key] = result_data
-        _update_pubmed_timestamp()
+    engine = _get_engine()
+    found: dict[str, Any] = {}
+    missing: list[str] = []
+    for pmid in dict.fromkeys(pmids):
+        details = engine.get(f"pubmed_details:{pmid}")
+        if details is None:
+            missing.append(pmid)
+        else:
+            found[pmid] = details
+
+    if not missing:
+        logger.info("PubMed details cache hit for %d PMIDs", len(found))
+        return found
+
+    batches = [
+        missing[i : i + _PUBMED_SUMMARY_BATCH]
+        for i in range(0, len(missing), _PUBMED_SUMMARY_BATCH)
+    ]
+    results = await asyncio.gather(
+        *(
+            engine.coalesce(
+                f"pubmed_details:{','.join(batch)}",
+                lambda batch=batch: _fetch_pubmed_summaries(engine, batch),
+            )
+            for batch in batches
+        ),
+        return_exceptions=True,
+    )
 
-        logger.info("Fetched details for %d articles", len(result_data))
+    fetched: dict[str, Any] = {}
+    for result in results:
+        if isinstance(result, httpx.HTTPStatusError):
+            logger.error("PubMed details API error: %s", result)
+        elif isinstance(result, BaseException):
+            logger.error("PubMed details fetch failed: %s", result)
+        else:
+            fetched.update(result)
 
-        return result_data
+    logger.info(
+        "Fetched details for %d articles (%d cached)",
+        len(fetched),
+        len(found),
+    )
 
-    except httpx.HTTPStatusError as e:
-        logger.error("PubMed details API error: %s", e)
-        return {}
-    except Exception as e:
-        logger.error("PubMed details fetch failed: %s", e)
-        return {}
+    # Keep the caller's PMID order
+    articles = {**fetched, **found}
+    return {pmid: articles[pmid] for pmid in dict.fromkeys(pmids) if pmid in articles}
 
 
 # ---------------------------------------------------------------------------
@@ -259,10 +250,8 @@ async def clinical_trials_search_impl(
     Returns:
         Dict with ``query``, ``total_count``, and ``studies`` list.
     """
+    engine = _get_engine()
     cache_key = f"clinicaltrials:{query}:{max_results}:{status}"
-    if cache_key in _research_cache:
-        logger.info("ClinicalTrials cache hit for query: %s", query)
-        return _research_cache[cache_key]
 
     params: dict[str, str | int] = {
         "query.term": query,
@@ -272,54 +261,43 @@ async def clinical_trials_search_impl(
     if status:
         params["filter.oversightStatus"] = status
 
-    # ClinicalTrials.gov blocks Python HTTP clients via TLS fingerprinting,
-    # returning 403 for httpx/requests while allowing curl.  Try httpx first
-    # for speed, then fall back to curl subprocess.
-    data: dict[str, Any] | None = None
-
-    try:
-        client = _get_client()
-        response = await client.get(CLINICALTRIALS_API_URL, params=params)
-        response.raise_for_status()
-        data = response.json()
-    except (httpx.HTTPStatusError, httpx.RequestError) as exc:
-        logger.info(
-            "ClinicalTrials.gov httpx request failed (%s), falling back to curl",
-            exc,
-        )
-
-    if data is None:
+    async def load() -> dict[str, Any]:
+        # ClinicalTrials.gov blocks Python HTTP clients via TLS fingerprinting,
+        # returning 403 for httpx/requests while allowing curl.  The engine
+        # tries httpx first for speed, then falls back to a curl subprocess
+        # (and stays on curl for a while once the host has refused httpx).
         try:
-            data = await _curl_get_json(CLINICALTRIALS_API_URL, params)
+            data = await engine.get_json(CLINICALTRIALS_API_URL, params, curl_fallback=True)
         except Exception as curl_exc:
             logger.error("ClinicalTrials.gov curl fallback also failed: %s", curl_exc)
-            return {"error": str(curl_exc), "studies": [], "total_count": 0}
-
-    try:
-        studies: list[dict[str, Any]] = []
-        for study in data.get("studies", []):
-            proto = study.get("protocolSection", {})
-            id_module = proto.get("identificationModule", {})
-            status_module = proto.get("statusModule", {})
-            conditions_module = proto.get("conditionsModule", {})
-
-            studies.append(
-                {
-                    "nct_id": id_module.get("nctId"),
-                    "title": id_module.get("briefTitle"),
-                    "status": status_module.get("overallStatus"),
-                    "start_date": status_module.get("startDate"),
-                    "conditions": conditions_module.get("conditions", []),
-                }
-            )
+            raise
 
-        result: dict[str, Any] = {
-            "query": query,
-            "total_count": data.get("totalCount", 0),
-            "studies": studies,
-        }
+        try:
+            studies: list[dict[str, Any]] = []
+            for study in data.get("studies", []):
+                proto = study.get("protocolSection", {})
+                id_module = proto.get("identificationModule", {})
+                status_module = proto.get("statusModule", {})
+                conditions_module = proto.get("conditionsModule", {})
+
+                studies.append(
+                    {
+                        "nct_id": id_module.get("nctId"),
+                        "title": id_module.get("briefTitle"),
+                        "status": status_module.get("overallStatus"),
+                        "start_date": status_module.get("startDate"),
+                        "conditions": conditions_module.get("conditions", []),
+                    }
+                )
 
-        _research_cache[cache_key] = result
+            result: dict[str, Any] = {
+                "query": query,
+                "total_count": data.get("totalCount", 0),
+                "studies": studies,
+            }
+        except Exception as e:
+            logger.error("ClinicalTrials response parsing failed: %s", e)
+            raise
 
         logger.info(
             "ClinicalTrials search found %d studies for: %s",
@@ -329,8 +307,9 @@ async def clinical_trials_search_impl(
 
         return result
 
+    try:
+        return await engine.cached(cache_key, load)
     except Exception as e:
-        logger.error("ClinicalTrials response parsing failed: %s", e)
         return {"error": str(e), "studies": [], "total_count": 0}
 
 
@@ -352,14 +331,10 @@ async def fda_drug_search_impl(
     Returns:
         Dict with ``query``, ``search_type``, ``total``, and ``products``.
     """
+    engine = _get_engine()
     cache_key = f"fda:{drug_name}:{search_type}:{max_results}"
-    if cache_key in _research_cache:
-        logger.info("FDA cache hit for: %s", drug_name)
-        return _research_cache[cache_key]
-
-    try:
-        client = _get_client()
 
+    async def load() -> dict[str, Any]:
         if search_type == "device":
             url = FDA_DEVICE_API_URL
             search_field = "device_name"
@@ -374,10 +349,7 @@ async def fda_drug_search_impl(
             "limit": max_results,
         }
 
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-
-        data = response.json()
+        data = await engine.get_json(url, params)
 
         results = data.get("results", [])
         products: list[dict[str, Any]] = []
@@ -422,8 +394,6 @@ async def fda_drug_search_impl(
             "products": products,
         }
 
-        _research_cache[cache_key] = result
-
         logger.info(
             "FDA search found %d %s results for: %s",
             result["total"],
@@ -433,6 +403,8 @@ async def fda_drug_search_impl(
 
         return result
 
+    try:
+        return await engine.cached(cache_key, load)
     except httpx.HTTPStatusError as e:
         logger.error("FDA API error: %s", e)
         return {"error": str(e), "products": [], "total": 0}
@@ -459,14 +431,10 @@ async def chembl_search_impl(
     Returns:
         Dict with ``query``, ``search_type``, ``total_count``, and ``molecules``.
     """
+    engine = _get_engine()
     cache_key = f"chembl:{query}:{search_type}:{max_results}"
-    if cache_key in _research_cache:
-        logger.info("ChEMBL cache hit for: %s", query)
-        return _research_cache[cache_key]
-
-    try:
-        client = _get_client()
 
+    async def load() -> dict[str, Any]:
         if search_type == "target":
             endpoint = f"{CHEMBL_API_URL}/target"
         elif search_type == "drug":
@@ -480,10 +448,7 @@ async def chembl_search_impl(
             "limit": max_results,
         }
 
-        response = await client.get(endpoint, params=params)
-        response.raise_for_status()
-
-        data = response.json()
+        data = await engine.get_json(endpoint, params)
 
         # ChEMBL API returns various formats
         molecules = data.get("molecules", {})
@@ -514,8 +479,6 @@ async def chembl_search_impl(
             "molecules": results,
         }
 
-        _research_cache[cache_key] = result
-
         logger.info(
             "ChEMBL search found %d molecules for: %s",
             result["total_count"],
@@ -524,6 +487,8 @@ async def chembl_search_impl(
 
         return result
 
+    try:
+        return await engine.cached(cache_key, load)
     except httpx.HTTPStatusError as e:
         logger.error("ChEMBL API error: %s", e)
         return {"error": str(e), "molecules": [], "total_count": 0}
@@ -558,8 +523,9 @@ async def _search_google_patents(
         List of patent dicts.
     """
     try:
-        async with httpx.AsyncClient(
-            timeout=20.0,
+        data = await _get_engine().get_json(
+            GOOGLE_PATENTS_XHR_URL,
+            {"url": f"q={query}&oq={query}&num={min(max_results, 100)}"},
             headers={
                 "User-Agent": (
                     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -568,17 +534,10 @@ async def _search_google_patents(
                 ),
                 "Accept": "application/json",
             },
-        ) as client:
-            resp = await client.get(
-                GOOGLE_PATENTS_XHR_URL,
-                params={
-                    "url": f"q={query}&oq={query}&num={min(max_results, 100)}",
-                },
-            )
-            if resp.status_code != 200:
-                logger.info("Google Patents returned %d", resp.status_code)
-                return []
-            data = resp.json()
+        )
+    except httpx.HTTPStatusError as exc:
+        logger.info("Google Patents returned %d", exc.response.status_code)
+        return []
     except Exception as exc:
         logger.info("Google Patents request failed: %s", exc)
         return []
@@ -697,46 +656,44 @@ async def uspto_patent_search_impl(
         Dict with ``query``, ``total_count``, and ``patents`` list.
     """
     cache_key = f"uspto:{query}:{max_results}"
-    if cache_key in _research_cache:
-        logger.info("USPTO cache hit for query: %s", query)
-        return _research_cache[cache_key]
 
-    patents: list[dict[str, Any]] = []
-    source = "none"
-
-    # Strategy 1: Google Patents XHR
-    patents = await _search_google_patents(query, max_results)
-    if patents:
-        source = "google_patents"
+    async def load() -> dict[str, Any]:
+        patents: list[dict[str, Any]] = []
+        source = "none"
 
-    # Strategy 2: Exa domain-filtered search
-    if not patents:
-        patents = await _search_exa_patents(query, max_results)
+        # Strategy 1: Google Patents XHR
+        patents = await _search_google_patents(query, max_results)
         if patents:
-            source = "exa"
+            source = "google_patents"
+
+        # Strategy 2: Exa domain-filtered search
+        if not patents:
+            patents = await _search_exa_patents(query, max_results)
+            if patents:
+                source = "exa"
+
+        if not patents:
+            logger.warning(
+                "No patent results for '%s' from any source. "
+                "USPTO IBD API is retired; PatentsView requires an API key.",
+                query,
+            )
+
+        result: dict[str, Any] = {
+            "query": query,
+            "total_count": len(patents),
+            "patents": patents,
+            "source": source,
+        }
 
-    if not patents:
-        logger.warning(
-            "No patent results for '%s' from any source. "
-            "USPTO IBD API is retired; PatentsView requires an API key.",
+        logger.info(
+            "Patent search found %d results for '%s' via %s",
+            len(patents),
             query,
+            source,
         )
 
-    result: dict[str, Any] = {
-        "query": query,
-        "total_count": len(patents),
-        "patents": patents,
-        "source": source,
-    }
-
-    if patents:
-        _research_cache[cache_key] = result
-
-    logger.info(
-        "Patent search found %d results for '%s' via %s",
-        len(patents),
-        query,
-        source,
-    )
+        return result
 
-    return result
+    # Only cache successful lookups so a transient block is retried
+    return await _get_engine().cached(cache_key, load, cache_if=lambda r: bool(r["patents"]))
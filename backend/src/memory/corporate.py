@@ -19,6 +19,7 @@ from src.core.exceptions import (
     CorporateFactNotFoundError,
     CorporateMemoryError,
 )
+from src.db.graphiti import company_group_id, invalidate_search_cache, search_group_ids
 from src.db.supabase import SupabaseClient
 from src.memory.audit import MemoryOperation, MemoryType, log_memory_operation
 
@@ -213,6 +214,7 @@ class CorporateMemory:
                     source=EpisodeType.text,
                     source_description=f"corporate_memory:{fact.company_id}:{fact.predicate}",
                     reference_time=fact.created_at,
+                    group_id=company_group_id(fact.company_id),
                 )
 
             # Store metadata in Supabase
@@ -371,7 +373,9 @@ class CorporateMemory:
 
             # Search with company namespace prefix
             search_query = f"company:{company_id} {query}"
-            results = await client.search(search_query)
+            results = await client.search(
+                search_query, group_ids=search_group_ids(company_id=company_id)
+            )
 
             # Get fact IDs from Graphiti results
             fact_ids: list[str] = []
@@ -513,6 +517,7 @@ class CorporateMemory:
                     query,
                     episode_name=fact.graphiti_episode_name,
                 )
+                invalidate_search_cache(company_group_id(company_id))
 
             # Delete from Supabase
             supabase = SupabaseClient.get_client()
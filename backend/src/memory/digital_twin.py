@@ -22,6 +22,7 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from src.core.exceptions import DigitalTwinError
+from src.db.graphiti import search_group_ids, user_group_id
 
 if TYPE_CHECKING:
     from graphiti_core import Graphiti
@@ -941,6 +942,7 @@ class DigitalTwin:
                 source=EpisodeType.text,
                 source_description=f"digital_twin:{user_id}:{text_type}",
                 reference_time=now,
+                group_id=user_group_id(user_id),
             )
 
             logger.info(
@@ -971,7 +973,7 @@ class DigitalTwin:
 
             # Search for fingerprint
             query = f"fingerprint for user {user_id}"
-            results = await client.search(query)
+            results = await client.search(query, group_ids=search_group_ids(user_id))
 
             if not results:
                 return None
@@ -1372,6 +1374,7 @@ class DigitalTwin:
                 source=EpisodeType.text,
                 source_description=f"digital_twin:{user_id}:{text_type}",
                 reference_time=now,
+                group_id=user_group_id(user_id),
             )
 
             logger.info(
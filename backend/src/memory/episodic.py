@@ -19,6 +19,8 @@ from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from src.core.exceptions import EpisodeNotFoundError, EpisodicMemoryError
+from src.db.graphiti import invalidate_search_cache, search_group_ids, user_group_id
+from src.db.graphiti_queue import get_episode_write_queue
 from src.memory.audit import MemoryOperation, MemoryType, log_memory_operation
 
 if TYPE_CHECKING:
@@ -375,9 +377,10 @@ class EpisodicMemory:
     async def store_episode(self, episode: Episode) -> str:
         """Store an episode in memory.
 
-        Always writes to Supabase first (durable), then attempts
-        Graphiti for semantic search capabilities. If Graphiti fails
-        the episode is still safely persisted in Supabase.
+        Always writes to Supabase first (durable), then queues the
+        Graphiti write (or, when the episode write queue is not running,
+        attempts it inline) for semantic search capabilities. If Graphiti
+        fails the episode is still safely persisted in Supabase.
 
         Args:
             episode: The Episode instance to store.
@@ -404,31 +407,43 @@ class EpisodicMemory:
                     extra={"episode_id": episode_id, "error": str(sb_err)},
                 )
 
-            # ── Step 2: Try to also store in Graphiti ──
-            graphiti_ok = False
-            try:
-                client = await self._get_graphiti_client()
-                episode_body = self._build_episode_body(episode)
+            # ── Step 2: Queue the Graphiti write, or store it inline ──
+            episode_body = self._build_episode_body(episode)
+            source_description = f"episodic_memory:{episode.user_id}"
+            group_id = user_group_id(episode.user_id)
+            graphiti_ok = supabase_ok and await get_episode_write_queue().enqueue(
+                name=episode_id,
+                episode_body=episode_body,
+                source_description=source_description,
+                reference_time=episode.occurred_at,
+                group_id=group_id,
+                source_table="episodic_memories",
+                source_id=episode_id,
+            )
+            if not graphiti_ok:
+                try:
+                    client = await self._get_graphiti_client()
 
-                from graphiti_core.nodes import EpisodeType
+                    from graphiti_core.nodes import EpisodeType
 
-                await client.add_episode(
-                    name=episode_id,
-                    episode_body=episode_body,
-                    source=EpisodeType.text,
-                    source_description=f"episodic_memory:{episode.user_id}",
-                    reference_time=episode.occurred_at,
-                )
-                graphiti_ok = True
-            except Exception as graphiti_err:
-                logger.warning(
-                    "Graphiti store failed for episode",
-                    extra={
-                        "episode_id": episode_id,
-                        "user_id": episode.user_id,
-                        "error": str(graphiti_err),
-                    },
-                )
+                    await client.add_episode(
+                        name=episode_id,
+                        episode_body=episode_body,
+                        source=EpisodeType.text,
+                        source_description=source_description,
+                        reference_time=episode.occurred_at,
+                        group_id=group_id,
+                    )
+                    graphiti_ok = True
+                except Exception as graphiti_err:
+                    logger.warning(
+                        "Graphiti store failed for episode",
+                        extra={
+                            "episode_id": episode_id,
+                            "user_id": episode.user_id,
+                            "error": str(graphiti_err),
+                        },
+                    )
 
             if not supabase_ok and not graphiti_ok:
                 raise EpisodicMemoryError(
@@ -592,7 +607,7 @@ class EpisodicMemory:
         try:
             client = await self._get_graphiti_client()
             query = f"episodes for user {user_id} between {start.isoformat()} and {end.isoformat()}"
-            results = await client.search(query)
+            results = await client.search(query, group_ids=search_group_ids(user_id))
 
             episodes = []
             for edge in results[:limit]:
@@ -652,7 +667,7 @@ class EpisodicMemory:
         try:
             client = await self._get_graphiti_client()
             query = f"{event_type} events for user {user_id}"
-            results = await client.search(query)
+            results = await client.search(query, group_ids=search_group_ids(user_id))
 
             episodes = []
             for edge in results[:limit]:
@@ -709,7 +724,7 @@ class EpisodicMemory:
         try:
             client = await self._get_graphiti_client()
             query = f"interactions with {participant} for user {user_id}"
-            results = await client.search(query)
+            results = await client.search(query, group_ids=search_group_ids(user_id))
 
             episodes = []
             participant_lower = participant.lower()
@@ -774,7 +789,7 @@ class EpisodicMemory:
         try:
             client = await self._get_graphiti_client()
             search_query = f"{query} (user: {user_id})"
-            results = await client.search(search_query)
+            results = await client.search(search_query, group_ids=search_group_ids(user_id))
 
             episodes = []
             for edge in results[:limit]:
@@ -848,7 +863,8 @@ class EpisodicMemory:
                 extra={"episode_id": episode_id, "error": str(sb_err)},
             )
 
-        # ── Try to delete from Graphiti too ──
+        # ── Drop any queued write, then delete from Graphiti too ──
+        await get_episode_write_queue().discard(episode_id, user_group_id(user_id))
         try:
             client = await self._get_graphiti_client()
 
@@ -870,6 +886,7 @@ class EpisodicMemory:
             deleted_count = records[0]["deleted"] if records else 0
             if deleted_count > 0:
                 graphiti_deleted = True
+                invalidate_search_cache(user_group_id(user_id))
         except Exception as graphiti_err:
             logger.warning(
                 "Graphiti delete_episode failed",
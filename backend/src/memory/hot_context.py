@@ -21,6 +21,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from src.core.cache import get_cache
+from src.db.supabase import execute_async
 from src.memory.working import count_tokens
 
 if TYPE_CHECKING:
@@ -109,7 +110,8 @@ class HotContextBuilder:
         """Build hot context for a user.
 
         Checks cache first (60s TTL), then fetches all sections
-        in parallel on cache miss.
+        in parallel on cache miss. Concurrent builds for the same user
+        share a single fetch.
 
         Args:
             user_id: The user to build context for.
@@ -119,17 +121,21 @@ class HotContextBuilder:
         Returns:
             HotContext with all available sections.
         """
-        cache = get_cache()
-        cache_store = cache.get_or_create_decorator_cache("hot_context", CACHE_TTL)
-        cache_key = f"hot_context:{user_id}"
-
-        try:
-            cached = cache_store[cache_key]
-            cache._hits += 1
-            return cached
-        except KeyError:
-            cache._misses += 1
+        region = get_cache().region("hot_context")
+        return await region.get_or_load(
+            f"hot_context:{user_id}",
+            lambda: self._assemble(user_id, working_memory, active_goal),
+            ttl=CACHE_TTL,
+            tags=[f"user:{user_id}"],
+        )
 
+    async def _assemble(
+        self,
+        user_id: str,
+        working_memory: WorkingMemory | None,
+        active_goal: dict[str, Any] | None,
+    ) -> HotContext:
+        """Fetch all sections in parallel and assemble them within budget."""
         start_ms = int(time.time() * 1000)
 
         # Fetch all sections in parallel
@@ -165,8 +171,6 @@ class HotContextBuilder:
             assembled_at_ms=assembled_at_ms,
         )
 
-        cache_store[cache_key] = ctx
-
         elapsed = assembled_at_ms - start_ms
         logger.debug(
             "Built hot context for user %s: %d tokens in %dms",
@@ -183,13 +187,7 @@ class HotContextBuilder:
         Args:
             user_id: The user whose cache to invalidate.
         """
-        import contextlib
-
-        cache = get_cache()
-        cache_store = cache.get_or_create_decorator_cache("hot_context", CACHE_TTL)
-        cache_key = f"hot_context:{user_id}"
-        with contextlib.suppress(KeyError):
-            del cache_store[cache_key]
+        get_cache().region("hot_context").delete(f"hot_context:{user_id}")
 
     def _truncate(self, text: str, budget: int) -> tuple[str, int]:
         """Truncate text to fit within a token budget.
@@ -214,12 +212,11 @@ class HotContextBuilder:
     async def _fetch_user_identity(self, user_id: str) -> HotContextSection | None:
         """Fetch user identity from user_profiles and companies."""
         try:
-            result = (
+            result = await execute_async(
                 self.db.table("user_profiles")
                 .select("full_name, role, company_id, companies(name)")
                 .eq("id", user_id)
                 .limit(1)
-                .execute()
             )
             data = result.data[0] if result and result.data else None
             if not data:
@@ -254,14 +251,13 @@ class HotContextBuilder:
             if preloaded:
                 data = preloaded
             else:
-                result = (
+                result = await execute_async(
                     self.db.table("goals")
                     .select("id, objective, status, context")
                     .eq("user_id", user_id)
                     .eq("status", "active")
                     .order("created_at", desc=True)
                     .limit(1)
-                    .execute()
                 )
                 rows = result.data if result else []
                 if not rows:
@@ -319,7 +315,7 @@ class HotContextBuilder:
     async def _fetch_priorities(self, user_id: str) -> HotContextSection | None:
         """Fetch top 3 high/urgent pending prospective memories."""
         try:
-            result = (
+            result = await execute_async(
                 self.db.table("prospective_memories")
                 .select("description, priority")
                 .eq("user_id", user_id)
@@ -327,7 +323,6 @@ class HotContextBuilder:
                 .in_("priority", ["high", "urgent"])
                 .order("created_at", desc=True)
                 .limit(3)
-                .execute()
             )
             rows = result.data if result else []
             if not rows:
@@ -351,7 +346,7 @@ class HotContextBuilder:
     async def _fetch_schedule(self, user_id: str) -> HotContextSection | None:
         """Fetch time-triggered prospective memories as today's schedule."""
         try:
-            result = (
+            result = await execute_async(
                 self.db.table("prospective_memories")
                 .select("description, due_date, trigger_config")
                 .eq("user_id", user_id)
@@ -359,7 +354,6 @@ class HotContextBuilder:
                 .eq("trigger_type", "time")
                 .order("due_date", desc=False)
                 .limit(5)
-                .execute()
             )
             rows = result.data if result else []
             if not rows:
@@ -384,14 +378,13 @@ class HotContextBuilder:
         """Fetch high-salience semantic facts."""
         try:
             # Get salient fact IDs from salience table
-            salience_result = (
+            salience_result = await execute_async(
                 self.db.table("semantic_fact_salience")
                 .select("graphiti_episode_id, current_salience")
                 .eq("user_id", user_id)
                 .gte("current_salience", 0.3)
                 .order("current_salience", desc=True)
                 .limit(5)
-                .execute()
             )
             salience_rows = salience_result.data if salience_result else []
             if not salience_rows:
@@ -400,12 +393,11 @@ class HotContextBuilder:
             fact_ids = [r["graphiti_episode_id"] for r in salience_rows]
 
             # Fetch fact details
-            facts_result = (
+            facts_result = await execute_async(
                 self.db.table("memory_semantic")
                 .select("id, fact, confidence")
                 .eq("user_id", user_id)
                 .in_("id", fact_ids)
-                .execute()
             )
             fact_rows = facts_result.data if facts_result else []
             if not fact_rows:
@@ -20,6 +20,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from src.core.exceptions import LeadMemoryGraphError, LeadMemoryNotFoundError
+from src.db.graphiti import search_group_ids, user_group_id
+from src.db.graphiti_queue import get_episode_write_queue
 from src.memory.audit import MemoryOperation, MemoryType, log_memory_operation
 
 if TYPE_CHECKING:
@@ -343,6 +345,7 @@ class LeadMemoryGraph:
                 source=EpisodeType.text,
                 source_description=f"lead_memory:{lead.user_id}:{lead.lifecycle_stage}",
                 reference_time=lead.created_at,
+                group_id=user_group_id(lead.user_id),
             )
 
             logger.info(
@@ -483,6 +486,7 @@ class LeadMemoryGraph:
                 source=EpisodeType.text,
                 source_description=f"lead_memory:{lead.user_id}:{lead.lifecycle_stage}:updated",
                 reference_time=lead.updated_at or datetime.now(UTC),
+                group_id=user_group_id(lead.user_id),
             )
 
             logger.info(
@@ -590,8 +594,6 @@ class LeadMemoryGraph:
         try:
             import uuid as uuid_module
 
-            client = await self._get_graphiti_client()
-
             parts = [
                 f"HAS_COMMUNICATION: {lead_id}",
                 f"Event Type: {event_type}",
@@ -604,16 +606,28 @@ class LeadMemoryGraph:
 
             comm_body = "\n".join(parts)
 
-            from graphiti_core.nodes import EpisodeType
-
             comm_id = str(uuid_module.uuid4())
-            await client.add_episode(
-                name=f"comm:{lead_id}:{comm_id}",
+            name = f"comm:{lead_id}:{comm_id}"
+            source_description = f"lead_communication:{lead_id}:{event_type}"
+
+            # Queue the write (CRM syncs add these in bursts); inline if the queue is not running
+            queued = await get_episode_write_queue().enqueue(
+                name=name,
                 episode_body=comm_body,
-                source=EpisodeType.text,
-                source_description=f"lead_communication:{lead_id}:{event_type}",
+                source_description=source_description,
                 reference_time=occurred_at,
             )
+            if not queued:
+                from graphiti_core.nodes import EpisodeType
+
+                client = await self._get_graphiti_client()
+                await client.add_episode(
+                    name=name,
+                    episode_body=comm_body,
+                    source=EpisodeType.text,
+                    source_description=source_description,
+                    reference_time=occurred_at,
+                )
 
             logger.info(
                 "Added communication to lead",
@@ -704,7 +718,7 @@ class LeadMemoryGraph:
             client = await self._get_graphiti_client()
 
             search_query = f"lead memory for user {user_id}: {query}"
-            results = await client.search(search_query)
+            results = await client.search(search_query, group_ids=search_group_ids(user_id))
 
             leads = []
             for edge in results[:limit]:
@@ -743,7 +757,7 @@ class LeadMemoryGraph:
             client = await self._get_graphiti_client()
 
             search_query = f"lead communication discussing {topic}"
-            results = await client.search(search_query)
+            results = await client.search(search_query, group_ids=search_group_ids(user_id))
 
             lead_ids: set[str] = set()
             for edge in results:
@@ -798,7 +812,7 @@ class LeadMemoryGraph:
             search_query = (
                 f"lead memory for user {user_id} active status silent inactive no recent activity"
             )
-            results = await client.search(search_query)
+            results = await client.search(search_query, group_ids=search_group_ids(user_id))
 
             leads = []
             for edge in results[: limit * 2]:
@@ -843,7 +857,7 @@ class LeadMemoryGraph:
             client = await self._get_graphiti_client()
 
             search_query = f"lead memory ABOUT_COMPANY {company_id} for user {user_id}"
-            results = await client.search(search_query)
+            results = await client.search(search_query, group_ids=search_group_ids(user_id))
 
             leads = []
             for edge in results[:limit]:
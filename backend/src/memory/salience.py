@@ -6,14 +6,23 @@ Implements salience decay for memory prioritization:
 - All memories have a minimum salience (never truly forgotten)
 
 Formula: salience = (base + access_boost) x 0.5^(days_since_access / half_life)
+
+The daily decay job reads salience rows a page at a time as columnar
+arrays, decays them with NumPy, and writes changed rows back through one
+set-based RPC per page. Several users can share each query.
 """
 
+import asyncio
 import logging
 import math
+from collections import Counter
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
+
 from src.core.config import settings
+from src.db.supabase import execute_async
 
 if TYPE_CHECKING:
     from supabase import Client
@@ -23,6 +32,18 @@ logger = logging.getLogger(__name__)
 # Type alias for memory types
 MemoryType = Literal["episodic", "semantic", "lead"]
 
+SALIENCE_TABLES = ("episodic_memory_salience", "semantic_fact_salience")
+
+# Rows whose salience moved less than this are not written back
+_CHANGE_THRESHOLD = 0.01
+
+
+def _to_epoch_seconds(timestamp: str | None, default: float) -> float:
+    """Parse an ISO timestamp to epoch seconds (``default`` if missing)."""
+    if not timestamp:
+        return default
+    return datetime.fromisoformat(timestamp).timestamp()
+
 
 class SalienceService:
     """Service for calculating and managing memory salience.
@@ -90,6 +111,25 @@ class SalienceService:
         # Enforce minimum salience (memories never truly forgotten)
         return max(current_salience, self.min_salience)
 
+    def calculate_decay_batch(
+        self,
+        access_counts: np.ndarray,
+        days_since_last_access: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized ``calculate_decay`` over arrays of rows.
+
+        Args:
+            access_counts: Access count per row.
+            days_since_last_access: Days since last access per row.
+
+        Returns:
+            Current salience per row, same formula and floor as calculate_decay.
+        """
+        base_salience = 1.0 + access_counts * self.access_boost
+        # 0.5^(days / half_life), with no decay for days <= 0
+        decay_factor = np.exp2(-np.maximum(days_since_last_access, 0.0) / self.half_life_days)
+        return np.maximum(base_salience * decay_factor, self.min_salience)
+
     def calculate_decay_from_timestamp(
         self,
         access_count: int,
@@ -231,9 +271,9 @@ class SalienceService:
         """
         updated_count = 0
 
-        for table_name in ["episodic_memory_salience", "semantic_fact_salience"]:
+        for table_name in SALIENCE_TABLES:
             try:
-                updated_count += self._update_table_salience(table_name, user_id)
+                updated_count += sum((await self._decay_table(table_name, [user_id])).values())
             except Exception as e:
                 logger.error(
                     f"Failed to update salience for {table_name}",
@@ -242,42 +282,123 @@ class SalienceService:
 
         return updated_count
 
-    def _update_table_salience(self, table_name: str, user_id: str) -> int:
-        """Update salience for all records in a specific table."""
-        # Fetch all salience records for this user
-        result = (
-            self.db.table(table_name)
-            .select("id, current_salience, access_count, last_accessed_at")
-            .eq("user_id", user_id)
-            .execute()
-        )
+    async def update_salience_for_users(self, user_ids: list[str]) -> dict[str, int]:
+        """Decay salience for several users, sharing each query between them.
+
+        Unlike update_all_salience, failures propagate so the caller can
+        retry the users individually.
+
+        Args:
+            user_ids: Users whose memories to update.
 
-        if not result.data:
-            return 0
+        Returns:
+            Updated record count per user (users with no updates omitted).
+        """
+        if not user_ids:
+            return {}
+        updated: Counter[str] = Counter()
+        for table_name in SALIENCE_TABLES:
+            updated.update(await self._decay_table(table_name, user_ids))
+        return dict(updated)
 
-        updated = 0
-        now = datetime.now(UTC)
+    async def _decay_table(self, table_name: str, user_ids: list[str]) -> Counter[str]:
+        """Decay every salience row of ``user_ids`` in one table.
 
-        for record in result.data:
-            # Parse the last_accessed_at timestamp
-            last_accessed = datetime.fromisoformat(record["last_accessed_at"])
-            days_since = (now - last_accessed).total_seconds() / 86400
+        Pages through the rows in id order; each page is decayed as arrays
+        and its changed rows are written with one RPC while the next page
+        is read.
 
-            # Calculate new salience
-            new_salience = self.calculate_decay(
-                access_count=record["access_count"],
-                days_since_last_access=days_since,
-            )
+        Args:
+            table_name: One of SALIENCE_TABLES.
+            user_ids: Users whose rows to decay.
 
-            # Only update if salience changed significantly (> 0.01)
-            if abs(new_salience - record["current_salience"]) > 0.01:
-                self.db.table(table_name).update({"current_salience": new_salience}).eq(
-                    "id", record["id"]
-                ).execute()
-                updated += 1
+        Returns:
+            Updated record count per user.
+        """
+        page_size = settings.SALIENCE_DECAY_PAGE_SIZE
+        now_ts = datetime.now(UTC).timestamp()
+        updated: Counter[str] = Counter()
+        pending_write: asyncio.Task[Any] | None = None
+        last_id: str | None = None
+
+        try:
+            while True:
+                query = self.db.table(table_name).select(
+                    "id, user_id, current_salience, access_count, last_accessed_at"
+                )
+                if len(user_ids) == 1:
+                    query = query.eq("user_id", user_ids[0])
+                else:
+                    query = query.in_("user_id", user_ids)
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                result = await execute_async(query.order("id").limit(page_size))
+                rows = result.data or []
+                if not rows:
+                    break
+
+                changed = self._decay_rows(rows, now_ts)
+                if pending_write is not None:
+                    await pending_write
+                    pending_write = None
+                if changed:
+                    pending_write = asyncio.create_task(
+                        execute_async(
+                            self.db.rpc(
+                                "bulk_update_memory_salience",
+                                {"p_table": table_name, "p_rows": changed},
+                            )
+                        )
+                    )
+                    updated.update(row["user_id"] for row in changed)
+
+                if len(rows) < page_size:
+                    break
+                last_id = rows[-1]["id"]
+
+            if pending_write is not None:
+                await pending_write
+        finally:
+            if pending_write is not None and not pending_write.done():
+                pending_write.cancel()
 
         return updated
 
+    def _decay_rows(self, rows: list[dict[str, Any]], now_ts: float) -> list[dict[str, Any]]:
+        """Decay one page of rows; return those that changed significantly.
+
+        Args:
+            rows: Salience rows with id, user_id, current_salience,
+                access_count and last_accessed_at.
+            now_ts: Epoch seconds to decay to.
+
+        Returns:
+            ``{"id", "user_id", "current_salience"}`` for each changed row.
+        """
+        n = len(rows)
+        current = np.fromiter(
+            (r.get("current_salience") or 0.0 for r in rows), dtype=np.float64, count=n
+        )
+        access_counts = np.fromiter(
+            (r.get("access_count") or 0 for r in rows), dtype=np.float64, count=n
+        )
+        accessed_at = np.fromiter(
+            (_to_epoch_seconds(r.get("last_accessed_at"), now_ts) for r in rows),
+            dtype=np.float64,
+            count=n,
+        )
+
+        new_salience = self.calculate_decay_batch(access_counts, (now_ts - accessed_at) / 86400)
+        changed = np.flatnonzero(np.abs(new_salience - current) > _CHANGE_THRESHOLD)
+        return [
+            {
+                "id": rows[i]["id"],
+                "user_id": rows[i]["user_id"],
+                "current_salience": float(new_salience[i]),
+            }
+            for i in changed.tolist()
+        ]
+
     async def get_by_salience(
         self,
         user_id: str,
@@ -22,6 +22,8 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from src.core.exceptions import FactNotFoundError, SemanticMemoryError  # noqa: F401
+from src.db.graphiti import invalidate_search_cache, search_group_ids, user_group_id
+from src.db.graphiti_queue import get_episode_write_queue
 from src.memory.audit import MemoryOperation, MemoryType, log_memory_operation
 from src.memory.confidence import ConfidenceScorer
 
@@ -351,7 +353,7 @@ class SemanticMemory:
         try:
             # Search for existing facts about the same subject-predicate
             query = f"facts about {new_fact.subject} {new_fact.predicate}"
-            results = await client.search(query)
+            results = await client.search(query, group_ids=search_group_ids(new_fact.user_id))
 
             for edge in results:
                 existing_fact = self._parse_edge_to_fact(edge, new_fact.user_id)
@@ -373,6 +375,7 @@ class SemanticMemory:
                         existing_fact.id,
                         f"superseded by fact:{new_fact.id}",
                     )
+                    invalidate_search_cache(user_group_id(new_fact.user_id))
 
         except Exception as e:
             logger.warning(f"Failed to check contradictions: {e}")
@@ -538,8 +541,9 @@ class SemanticMemory:
     async def add_fact(self, fact: SemanticFact) -> str:
         """Add a new fact to semantic memory.
 
-        Always writes to Supabase first (durable), then attempts
-        Graphiti for semantic search and contradiction detection.
+        Always writes to Supabase first (durable), then checks Graphiti
+        for contradictions and queues the Graphiti write (inline when the
+        episode write queue is not running) for semantic search.
         If Graphiti fails the fact is still safely persisted in Supabase.
 
         Args:
@@ -577,17 +581,29 @@ class SemanticMemory:
 
                 # Build fact body
                 fact_body = self._build_fact_body(fact)
+                source_description = f"semantic_memory:{fact.user_id}:{fact.predicate}"
 
-                # Store in Graphiti
-                from graphiti_core.nodes import EpisodeType
-
-                await client.add_episode(
+                # Queue the extraction-heavy write; store inline if the queue is not running
+                queued = supabase_ok and await get_episode_write_queue().enqueue(
                     name=f"fact:{fact_id}",
                     episode_body=fact_body,
-                    source=EpisodeType.text,
-                    source_description=f"semantic_memory:{fact.user_id}:{fact.predicate}",
+                    source_description=source_description,
                     reference_time=fact.valid_from,
+                    group_id=user_group_id(fact.user_id),
+                    source_table="memory_semantic",
+                    source_id=fact_id,
                 )
+                if not queued:
+                    from graphiti_core.nodes import EpisodeType
+
+                    await client.add_episode(
+                        name=f"fact:{fact_id}",
+                        episode_body=fact_body,
+                        source=EpisodeType.text,
+                        source_description=source_description,
+                        reference_time=fact.valid_from,
+                        group_id=user_group_id(fact.user_id),
+                    )
                 graphiti_ok = True
             except Exception as graphiti_err:
                 logger.warning(
@@ -763,7 +779,7 @@ class SemanticMemory:
             client = await self._get_graphiti_client()
 
             query = f"facts about {subject} for user {user_id}"
-            results = await client.search(query)
+            results = await client.search(query, group_ids=search_group_ids(user_id))
 
             check_time = as_of or datetime.now(UTC)
             facts = []
@@ -837,7 +853,7 @@ class SemanticMemory:
             client = await self._get_graphiti_client()
 
             search_query = f"{query} (user: {user_id})"
-            results = await client.search(search_query)
+            results = await client.search(search_query, group_ids=search_group_ids(user_id))
 
             facts = []
             for edge in results[: limit * 2]:  # Get extra to account for filtering
@@ -946,7 +962,8 @@ class SemanticMemory:
                 extra={"fact_id": fact_id, "error": str(sb_err)},
             )
 
-        # ── Try Graphiti too ──
+        # ── Drop any queued write, then update Graphiti too ──
+        await get_episode_write_queue().discard(f"fact:{fact_id}", user_group_id(user_id))
         try:
             client = await self._get_graphiti_client()
 
@@ -971,6 +988,7 @@ class SemanticMemory:
             updated_count = records[0]["updated"] if records else 0
             if updated_count > 0:
                 graphiti_updated = True
+                invalidate_search_cache(user_group_id(user_id))
         except Exception as graphiti_err:
             logger.warning(
                 "Graphiti invalidate_fact failed",
@@ -1032,7 +1050,8 @@ class SemanticMemory:
                 extra={"fact_id": fact_id, "error": str(sb_err)},
             )
 
-        # ── Try to delete from Graphiti too ──
+        # ── Drop any queued write, then delete from Graphiti too ──
+        await get_episode_write_queue().discard(f"fact:{fact_id}", user_group_id(user_id))
         try:
             client = await self._get_graphiti_client()
 
@@ -1054,6 +1073,7 @@ class SemanticMemory:
             deleted_count = records[0]["deleted"] if records else 0
             if deleted_count > 0:
                 graphiti_deleted = True
+                invalidate_search_cache(user_group_id(user_id))
         except Exception as graphiti_err:
             logger.warning(
                 "Graphiti delete_fact failed",
@@ -1138,6 +1158,7 @@ class SemanticMemory:
                     source=EpisodeType.text,
                     source_description=f"semantic_memory:{user_id}:{fact.predicate}:confirmed",
                     reference_time=fact.valid_from,
+                    group_id=user_group_id(user_id),
                 )
             except Exception as graphiti_err:
                 logger.warning(
@@ -5,14 +5,31 @@ Working memory stores current conversation context in-memory, including:
 - Recent messages in the conversation
 - Active entities mentioned in the conversation
 - Token count for context window management
+
+Each message caches its token count (``token_count``), which is persisted
+with it, so truncation and restores never re-tokenize. Truncation pops the
+oldest non-system message from a deque in O(1).
+
+``WorkingMemoryManager`` keeps sessions in a process-wide LRU bounded by
+session count and approximate size. Every mutation bumps a session's
+revision, so the periodic sync writes only sessions changed since they
+were last persisted, batched into one RPC per chunk. Idle sessions and
+sessions over the bounds are evicted (after persisting them the same way)
+and restored from Supabase on next access. All database calls go through
+``execute_async`` so none of this blocks the event loop.
 """
 
+import json
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
 import tiktoken
 
+from src.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 # Use cl100k_base encoding (used by Claude and GPT-4)
@@ -31,6 +48,18 @@ def count_tokens(text: str) -> int:
     return len(_ENCODING.encode(text))
 
 
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (about four characters per token), no tokenizer.
+
+    Args:
+        text: The text to estimate tokens for.
+
+    Returns:
+        Estimated number of tokens in the text.
+    """
+    return (len(text) + 3) // 4
+
+
 @dataclass
 class WorkingMemory:
     """In-memory storage for current conversation context.
@@ -46,6 +75,39 @@ class WorkingMemory:
     active_entities: dict[str, Any] = field(default_factory=dict)
     context_tokens: int = 0
     max_tokens: int = 100000
+    # Count tokens with estimate_tokens instead of tiktoken. Enough for
+    # callers that only send the get_context_for_llm window.
+    estimate: bool = False
+
+    # Oldest-first (position, message) for non-system messages, where
+    # position is the message's append sequence number. Every removed
+    # message is older than every queued one, so a queued message's list
+    # index is its position minus the number of messages removed so far.
+    _truncatable: deque[tuple[int, dict[str, Any]]] = field(
+        default_factory=deque, init=False, repr=False, compare=False
+    )
+    _appended: int = field(default=0, init=False, repr=False, compare=False)
+    _removed: int = field(default=0, init=False, repr=False, compare=False)
+    # Bumped on every mutation; WorkingMemoryManager persists a session only
+    # when this differs from the revision it last wrote.
+    _revision: int = field(default=0, init=False, repr=False, compare=False)
+    _persisted_revision: int = field(default=0, init=False, repr=False, compare=False)
+    # Manager bookkeeping: last access (monotonic) and serialized size
+    _last_access: float = field(default=0.0, init=False, repr=False, compare=False)
+    _size_bytes: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether the session changed since it was last persisted."""
+        return self._revision != self._persisted_revision
+
+    def mark_dirty(self) -> None:
+        """Flag the session for the next sync.
+
+        The mutating methods call this themselves; callers that change
+        ``messages`` or ``active_entities`` directly must call it too.
+        """
+        self._revision += 1
 
     def add_message(
         self,
@@ -70,26 +132,73 @@ class WorkingMemory:
         if metadata:
             message["metadata"] = metadata
 
-        message_tokens = count_tokens(content)
-        self.messages.append(message)
-        self.context_tokens += message_tokens
+        message["token_count"] = self._count(content)
+        self._append(message)
+        self.mark_dirty()
 
         # Truncate old messages if exceeding max tokens
         self._truncate_if_needed()
 
+    def _count(self, text: str) -> int:
+        return estimate_tokens(text) if self.estimate else count_tokens(text)
+
+    def _message_tokens(self, message: dict[str, Any]) -> int:
+        """Cached token count of a message, computed once if missing."""
+        tokens = message.get("token_count")
+        if tokens is None:
+            tokens = message["token_count"] = self._count(message.get("content", ""))
+        return int(tokens)
+
+    def _append(self, message: dict[str, Any]) -> None:
+        self.messages.append(message)
+        self.context_tokens += self._message_tokens(message)
+        if message.get("role") != "system":
+            self._truncatable.append((self._appended, message))
+        self._appended += 1
+
+    def _reindex(self) -> None:
+        """Rebuild token totals and the truncation queue from ``messages``."""
+        messages = self.messages
+        self.messages = []
+        self.context_tokens = 0
+        self._truncatable = deque()
+        self._appended = 0
+        self._removed = 0
+        for message in messages:
+            self._append(message)
+
     def _truncate_if_needed(self) -> None:
         """Remove oldest non-system messages until under token limit."""
         while self.context_tokens > self.max_tokens and len(self.messages) > 1:
-            # Find first non-system message to remove
-            for i, msg in enumerate(self.messages):
-                if msg["role"] != "system":
-                    removed_tokens = count_tokens(msg["content"])
-                    self.messages.pop(i)
-                    self.context_tokens -= removed_tokens
-                    break
-            else:
+            if not self._truncatable:
                 # All messages are system messages, can't truncate further
                 break
+            position, message = self._truncatable[0]
+            index = position - self._removed
+            if not (0 <= index < len(self.messages) and self.messages[index] is message):
+                # messages was changed behind our back; rebuild and retry
+                self._reindex()
+                continue
+            self._truncatable.popleft()
+            del self.messages[index]
+            self._removed += 1
+            self.context_tokens -= self._message_tokens(message)
+
+    def pop_message(self) -> dict[str, Any] | None:
+        """Remove and return the most recent message.
+
+        Returns:
+            The removed message, or None if there are no messages.
+        """
+        if not self.messages:
+            return None
+        message = self.messages.pop()
+        if self._truncatable and self._truncatable[-1][1] is message:
+            self._truncatable.pop()
+        self._appended -= 1
+        self.context_tokens -= self._message_tokens(message)
+        self.mark_dirty()
+        return message
 
     # Maximum messages to send verbatim to LLM (sliding window)
     # Older messages are consolidated into episodic/semantic memory, not dumped chronologically
@@ -126,6 +235,7 @@ class WorkingMemory:
             value: The entity data to store.
         """
         self.active_entities[key] = value
+        self.mark_dirty()
 
     def get_entity(self, key: str) -> Any | None:
         """Retrieve an active entity from working memory.
@@ -144,7 +254,9 @@ class WorkingMemory:
         Args:
             key: The entity identifier to remove.
         """
-        self.active_entities.pop(key, None)
+        if key in self.active_entities:
+            del self.active_entities[key]
+            self.mark_dirty()
 
     def set_goal(
         self,
@@ -161,10 +273,13 @@ class WorkingMemory:
             "objective": objective,
             "context": context or {},
         }
+        self.mark_dirty()
 
     def clear_goal(self) -> None:
         """Clear the current goal."""
-        self.current_goal = None
+        if self.current_goal is not None:
+            self.current_goal = None
+            self.mark_dirty()
 
     def clear(self) -> None:
         """Clear all working memory state.
@@ -175,7 +290,8 @@ class WorkingMemory:
         self.messages = []
         self.active_entities = {}
         self.current_goal = None
-        self.context_tokens = 0
+        self._reindex()
+        self.mark_dirty()
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize working memory to a dictionary.
@@ -191,12 +307,16 @@ class WorkingMemory:
             "current_goal": self.current_goal,
             "context_tokens": self.context_tokens,
             "max_tokens": self.max_tokens,
+            "estimate": self.estimate,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "WorkingMemory":
         """Create a WorkingMemory instance from a dictionary.
 
+        Cached per-message token counts are reused; messages saved before
+        they were cached are counted once here.
+
         Args:
             data: Dictionary containing working memory state.
 
@@ -207,29 +327,55 @@ class WorkingMemory:
             conversation_id=data["conversation_id"],
             user_id=data["user_id"],
             max_tokens=data.get("max_tokens", 100000),
+            estimate=data.get("estimate", False),
         )
         memory.messages = data.get("messages", [])
         memory.active_entities = data.get("active_entities", {})
         memory.current_goal = data.get("current_goal")
-        memory.context_tokens = data.get("context_tokens", 0)
+        memory._reindex()
         return memory
 
 
+def _serialized_size(data: dict[str, Any]) -> int:
+    """Approximate resident size of a session: its JSON length in bytes."""
+    return len(json.dumps(data, default=str))
+
+
 class WorkingMemoryManager:
     """Manages multiple working memory sessions.
 
     Singleton that tracks all active conversation sessions.
     Sessions are keyed by conversation_id. Supports Supabase persistence
     so sessions survive server restarts.
+
+    The session store is an LRU (dict insertion order, most recent last)
+    bounded by ``WORKING_MEMORY_MAX_SESSIONS`` and
+    ``WORKING_MEMORY_MAX_BYTES``; sessions idle for longer than
+    ``WORKING_MEMORY_IDLE_SECONDS`` are evicted by the sync job. A dirty
+    session is always persisted before it is evicted.
     """
 
     _sessions: dict[str, WorkingMemory] = {}
 
+    # Process-wide counters reported by stats()
+    _metrics: dict[str, float] = {
+        "evictions": 0,
+        "last_sync_seconds": 0.0,
+        "last_sync_written": 0,
+    }
+
+    def _touch(self, conversation_id: str, memory: WorkingMemory) -> None:
+        """Mark a session most recently used."""
+        self._sessions.pop(conversation_id, None)
+        self._sessions[conversation_id] = memory
+        memory._last_access = time.monotonic()
+
     async def get_or_create(
         self,
         conversation_id: str,
         user_id: str,
         max_tokens: int = 100000,
+        estimate: bool = False,
     ) -> WorkingMemory:
         """Get existing session or create a new one.
 
@@ -240,46 +386,178 @@ class WorkingMemoryManager:
             conversation_id: Unique conversation identifier.
             user_id: The user who owns this conversation.
             max_tokens: Maximum tokens for context window.
+            estimate: For a new session, estimate token counts instead of
+                running tiktoken (see ``WorkingMemory.estimate``).
 
         Returns:
             WorkingMemory instance for the conversation.
         """
-        if conversation_id not in self._sessions:
+        memory = self._sessions.get(conversation_id)
+        if memory is None:
             # Try to restore from Supabase
             restored = await self._load_from_db(conversation_id)
-            if restored:
-                self._sessions[conversation_id] = restored
-            else:
-                self._sessions[conversation_id] = WorkingMemory(
+            # Another request may have created the session while we loaded
+            memory = self._sessions.get(conversation_id)
+            if memory is None:
+                memory = restored or WorkingMemory(
                     conversation_id=conversation_id,
                     user_id=user_id,
                     max_tokens=max_tokens,
+                    estimate=estimate,
                 )
-        return self._sessions[conversation_id]
+                memory._size_bytes = _serialized_size(memory.to_dict())
+                self._touch(conversation_id, memory)
+                await self._evict(keep=conversation_id)
+                return memory
+        self._touch(conversation_id, memory)
+        return memory
 
     async def persist_session(self, conversation_id: str) -> None:
         """Persist a working memory session to Supabase.
 
         Serializes the session via ``to_dict()`` and stores it in the
-        ``conversations`` table's ``working_memory`` JSONB column.
+        ``conversations`` table's ``working_memory`` JSONB column. Does
+        nothing if the session is unchanged since it was last persisted.
 
         Args:
             conversation_id: The conversation to persist.
         """
         memory = self._sessions.get(conversation_id)
-        if not memory:
+        if not memory or not memory.is_dirty:
             return
+        await self._write_one(conversation_id, memory)
+
+    async def _write_one(self, conversation_id: str, memory: WorkingMemory) -> bool:
+        """Write one session with a single-row update.
+
+        Returns:
+            True if the write succeeded.
+        """
+        revision = memory._revision
+        data = memory.to_dict()
         try:
-            from src.db.supabase import get_supabase_client
+            from src.db.supabase import execute_async, get_supabase_client
 
             db = get_supabase_client()
-            db.table("conversations").update(
-                {
-                    "working_memory": memory.to_dict(),
-                }
-            ).eq("id", conversation_id).execute()
+            await execute_async(
+                db.table("conversations")
+                .update(
+                    {
+                        "working_memory": data,
+                    }
+                )
+                .eq("id", conversation_id)
+            )
         except Exception as e:
             logger.warning("Working memory persist failed: %s", e)
+            return False
+        memory._persisted_revision = revision
+        memory._size_bytes = _serialized_size(data)
+        return True
+
+    async def _write_batch(self, sessions: list[tuple[str, WorkingMemory]]) -> int:
+        """Write dirty sessions in one ``bulk_update_working_memory`` RPC.
+
+        Falls back to single-row updates if the RPC fails.
+
+        Returns:
+            Number of sessions written.
+        """
+        # Snapshot revisions with the payload so a mutation made while the
+        # write is in flight keeps the session dirty for the next sync
+        snapshots = [(cid, memory, memory._revision, memory.to_dict()) for cid, memory in sessions]
+        try:
+            from src.db.supabase import execute_async, get_supabase_client
+
+            db = get_supabase_client()
+            await execute_async(
+                db.rpc(
+                    "bulk_update_working_memory",
+                    {"p_rows": [{"id": cid, "working_memory": data} for cid, _, _, data in snapshots]},
+                )
+            )
+        except Exception as e:
+            logger.warning(
+                "Batched working memory persist failed, writing sessions individually: %s", e
+            )
+            written = 0
+            for cid, memory, _, _ in snapshots:
+                written += await self._write_one(cid, memory)
+            return written
+
+        for _, memory, revision, data in snapshots:
+            memory._persisted_revision = revision
+            memory._size_bytes = _serialized_size(data)
+        return len(snapshots)
+
+    async def _write_dirty(self, sessions: list[tuple[str, WorkingMemory]]) -> int:
+        """Write sessions in ``WORKING_MEMORY_SYNC_BATCH_SIZE`` batches.
+
+        Returns:
+            Number of sessions written.
+        """
+        batch_size = max(1, settings.WORKING_MEMORY_SYNC_BATCH_SIZE)
+        written = 0
+        for i in range(0, len(sessions), batch_size):
+            written += await self._write_batch(sessions[i : i + batch_size])
+        return written
+
+    async def _evict(self, keep: str | None = None, idle_seconds: float | None = None) -> int:
+        """Evict idle sessions and least recently used sessions over the bounds.
+
+        Dirty sessions are persisted first, in batches; one that fails to
+        persist, or is used again while the write is in flight, is kept
+        so no changes are lost.
+
+        Args:
+            keep: Conversation that must stay resident (the one being opened).
+            idle_seconds: Also evict sessions not accessed for this long.
+
+        Returns:
+            Number of sessions evicted.
+        """
+        max_sessions = max(1, settings.WORKING_MEMORY_MAX_SESSIONS)
+        max_bytes = settings.WORKING_MEMORY_MAX_BYTES
+        now = time.monotonic()
+
+        candidates: dict[str, None] = {}
+        if idle_seconds is not None:
+            candidates = {
+                cid: None
+                for cid, memory in self._sessions.items()
+                if cid != keep and now - memory._last_access > idle_seconds
+            }
+
+        resident_bytes = sum(m._size_bytes for m in self._sessions.values())
+        excess = len(self._sessions) - len(candidates) - max_sessions
+        # LRU order: oldest first
+        for cid, memory in self._sessions.items():
+            if excess <= 0 and resident_bytes <= max_bytes:
+                break
+            if cid == keep or cid in candidates:
+                continue
+            candidates[cid] = None
+            excess -= 1
+            resident_bytes -= memory._size_bytes
+
+        dirty = [
+            (cid, memory)
+            for cid in candidates
+            if (memory := self._sessions.get(cid)) is not None and memory.is_dirty
+        ]
+        if dirty:
+            await self._write_dirty(dirty)
+
+        evicted = 0
+        for cid in candidates:
+            memory = self._sessions.get(cid)
+            if memory is None or memory.is_dirty or memory._last_access > now:
+                continue
+            del self._sessions[cid]
+            evicted += 1
+
+        self._metrics["evictions"] += evicted
+        return evicted
 
     async def _load_from_db(self, conversation_id: str) -> WorkingMemory | None:
         """Attempt to restore a session from Supabase.
@@ -291,15 +569,14 @@ class WorkingMemoryManager:
             WorkingMemory if found in DB, None otherwise.
         """
         try:
-            from src.db.supabase import get_supabase_client
+            from src.db.supabase import execute_async, get_supabase_client
 
             db = get_supabase_client()
-            result = (
+            result = await execute_async(
                 db.table("conversations")
                 .select("working_memory")
                 .eq("id", conversation_id)
                 .limit(1)
-                .execute()
             )
             record = result.data[0] if result and result.data else None
             if record and record.get("working_memory"):
@@ -317,7 +594,10 @@ class WorkingMemoryManager:
         Returns:
             WorkingMemory if found, None otherwise.
         """
-        return self._sessions.get(conversation_id)
+        memory = self._sessions.get(conversation_id)
+        if memory is not None:
+            self._touch(conversation_id, memory)
+        return memory
 
     def delete(self, conversation_id: str) -> None:
         """Delete a session.
@@ -332,23 +612,24 @@ class WorkingMemoryManager:
         self._sessions.clear()
 
     async def persist_all_sessions(self) -> int:
-        """Persist all active working memory sessions to Supabase.
+        """Persist changed working memory sessions to Supabase.
 
-        Iterates over every in-memory session and calls ``persist_session()``
-        for each. Used by the 30-second sync scheduler job to ensure working
-        memory survives server restarts.
+        Writes only sessions modified since they were last persisted, in
+        batches of ``WORKING_MEMORY_SYNC_BATCH_SIZE``, then evicts idle and
+        over-bound sessions. Used by the 30-second sync scheduler job to
+        ensure working memory survives server restarts.
 
         Returns:
             Number of sessions successfully persisted.
         """
-        session_ids = list(self._sessions.keys())
-        persisted = 0
-        for conversation_id in session_ids:
-            try:
-                await self.persist_session(conversation_id)
-                persisted += 1
-            except Exception as e:
-                logger.warning("Failed to persist session %s: %s", conversation_id, e)
+        start = time.perf_counter()
+        dirty = [(cid, memory) for cid, memory in list(self._sessions.items()) if memory.is_dirty]
+        persisted = await self._write_dirty(dirty)
+
+        await self._evict(idle_seconds=settings.WORKING_MEMORY_IDLE_SECONDS)
+
+        self._metrics["last_sync_seconds"] = time.perf_counter() - start
+        self._metrics["last_sync_written"] = persisted
         return persisted
 
     def list_sessions(self) -> list[str]:
@@ -358,3 +639,14 @@ class WorkingMemoryManager:
             List of conversation IDs.
         """
         return list(self._sessions.keys())
+
+    def stats(self) -> dict[str, Any]:
+        """Resident session count and size, dirty count, and sync metrics."""
+        return {
+            "resident_sessions": len(self._sessions),
+            "resident_bytes": sum(m._size_bytes for m in self._sessions.values()),
+            "dirty_sessions": sum(1 for m in self._sessions.values() if m.is_dirty),
+            "evictions": int(self._metrics["evictions"]),
+            "last_sync_seconds": round(self._metrics["last_sync_seconds"], 4),
+            "last_sync_written": int(self._metrics["last_sync_written"]),
+        }
@@ -2,14 +2,16 @@
 
 Provides:
 - RequestIDMiddleware: Assigns a UUID to every request for log traceability.
-- RequestTimingMiddleware: Measures and logs request duration, warns on slow requests.
-- perf_stats: In-memory ring buffer of recent request timings for the stats endpoint.
+- RequestTimingMiddleware: Measures and logs request duration, warns on slow
+  requests, and attributes dependency time (see ``src.core.timing``) to the
+  request.
+- perf_stats: Streaming latency histograms per route template for the stats
+  endpoint and the Prometheus export.
 """
 
 import logging
 import time
 import uuid
-from collections import deque
 from dataclasses import dataclass, field
 from threading import Lock
 from typing import Any
@@ -18,90 +20,182 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
+from src.core.config import settings
+from src.core.timing import (
+    SLOW_QUERY_THRESHOLD_MS,
+    LogHistogram,
+    RollingHistogram,
+    dependency_stats,
+    request_timing_scope,
+)
+
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "SLOW_QUERY_THRESHOLD_MS",
+    "SLOW_REQUEST_THRESHOLD_MS",
+    "PerfStats",
+    "RequestIDMiddleware",
+    "RequestRecord",
+    "RequestTimingMiddleware",
+    "perf_stats",
+]
+
 SLOW_REQUEST_THRESHOLD_MS = 1000.0
-SLOW_QUERY_THRESHOLD_MS = 500.0
-MAX_STATS_ENTRIES = 1000
+# Percentiles in summarize() cover the last one to two windows
+STATS_WINDOW_SECONDS = 300.0
+# Route label for requests that matched no route (keeps label cardinality bounded)
+UNMATCHED_ROUTE = "<unmatched>"
+# Prometheus histogram bucket bounds, in seconds
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
 
 
 # ---------------------------------------------------------------------------
 # In-memory stats store
 # ---------------------------------------------------------------------------
 
+
 @dataclass
 class RequestRecord:
     """Single request timing record."""
 
     method: str
-    path: str
+    path: str  # Route template, e.g. /api/v1/goals/{goal_id}
     status_code: int
     duration_ms: float
     request_id: str
     timestamp: float = field(default_factory=time.time)
+    dependency_ms: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class _RouteStats:
+    latency: RollingHistogram
+    dependency_ms: dict[str, float] = field(default_factory=dict)
+    status_classes: dict[str, int] = field(default_factory=dict)
 
 
 class PerfStats:
-    """Thread-safe ring buffer holding the last N request records."""
+    """Thread-safe latency histograms per ``METHOD route-template``.
+
+    Memory is fixed per route regardless of traffic: each route keeps
+    log-bucketed histograms instead of raw samples.
+    """
 
-    def __init__(self, maxlen: int = MAX_STATS_ENTRIES) -> None:
-        self._records: deque[RequestRecord] = deque(maxlen=maxlen)
+    def __init__(self, window_seconds: float = STATS_WINDOW_SECONDS) -> None:
+        self._window_seconds = window_seconds
+        self._routes: dict[tuple[str, str], _RouteStats] = {}
+        self._global = RollingHistogram(window_seconds)
         self._lock = Lock()
 
     def record(self, rec: RequestRecord) -> None:
+        key = (rec.method, rec.path)
         with self._lock:
-            self._records.append(rec)
-
-    def snapshot(self) -> list[RequestRecord]:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = _RouteStats(RollingHistogram(self._window_seconds))
+            stats.latency.record(rec.duration_ms)
+            status_class = f"{rec.status_code // 100}xx"
+            stats.status_classes[status_class] = stats.status_classes.get(status_class, 0) + 1
+            for name, duration in rec.dependency_ms.items():
+                stats.dependency_ms[name] = stats.dependency_ms.get(name, 0.0) + duration
+            self._global.record(rec.duration_ms)
+
+    def reset(self) -> None:
+        """Drop all recorded request data."""
         with self._lock:
-            return list(self._records)
+            self._routes.clear()
+            self._global = RollingHistogram(self._window_seconds)
 
     def summarize(self) -> dict[str, Any]:
-        """Return p50/p95/p99 response times grouped by endpoint."""
-        records = self.snapshot()
-        if not records:
-            return {"total_requests": 0, "endpoints": {}}
-
-        # Group by "METHOD path"
-        by_endpoint: dict[str, list[float]] = {}
-        for r in records:
-            key = f"{r.method} {r.path}"
-            by_endpoint.setdefault(key, []).append(r.duration_ms)
-
-        endpoints: dict[str, dict[str, Any]] = {}
-        for key, durations in sorted(by_endpoint.items()):
-            durations_sorted = sorted(durations)
-            endpoints[key] = {
-                "count": len(durations_sorted),
-                "p50_ms": round(_percentile(durations_sorted, 50), 2),
-                "p95_ms": round(_percentile(durations_sorted, 95), 2),
-                "p99_ms": round(_percentile(durations_sorted, 99), 2),
-                "max_ms": round(durations_sorted[-1], 2),
+        """Return p50/p95/p99 response times grouped by endpoint.
+
+        Percentiles cover the recent window; counts and the per-request
+        dependency breakdown cover the process lifetime.
+        """
+        with self._lock:
+            total_requests = self._global.total.count
+            summary: dict[str, Any] = {
+                "total_requests": total_requests,
+                "window_seconds": self._window_seconds,
+                "endpoints": {},
             }
+            if total_requests:
+                summary["global"] = self._global.recent().summary()
+            for (method, route), stats in sorted(self._routes.items()):
+                count = stats.latency.total.count
+                summary["endpoints"][f"{method} {route}"] = {
+                    **stats.latency.recent().summary(),
+                    "total_count": count,
+                    "status": dict(sorted(stats.status_classes.items())),
+                    "dependency_ms_per_request": {
+                        name: round(total / count, 2)
+                        for name, total in sorted(stats.dependency_ms.items())
+                    },
+                }
+        summary["dependencies"] = dependency_stats.summarize()
+        return summary
+
+    def to_prometheus(self) -> str:
+        """Render request and dependency histograms in Prometheus text format."""
+        lines = [
+            "# HELP aria_http_request_duration_seconds HTTP request latency by route template.",
+            "# TYPE aria_http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            routes = sorted(self._routes.items())
+            for (method, route), stats in routes:
+                labels = f'method="{_escape_label(method)}",route="{_escape_label(route)}"'
+                lines.extend(
+                    _prometheus_histogram(
+                        "aria_http_request_duration_seconds", labels, stats.latency.total
+                    )
+                )
+
+        lines += [
+            "# HELP aria_dependency_duration_seconds Latency of calls to external dependencies.",
+            "# TYPE aria_dependency_duration_seconds histogram",
+        ]
+        for name, histogram in sorted(dependency_stats.cumulative().items()):
+            lines.extend(
+                _prometheus_histogram(
+                    "aria_dependency_duration_seconds",
+                    f'dependency="{_escape_label(name)}"',
+                    histogram,
+                )
+            )
+
+        lines += [
+            "# HELP aria_dependency_errors_total Calls to external dependencies that failed.",
+            "# TYPE aria_dependency_errors_total counter",
+        ]
+        for name, errors in sorted(dependency_stats.errors().items()):
+            lines.append(
+                f'aria_dependency_errors_total{{dependency="{_escape_label(name)}"}} {errors}'
+            )
+        return "\n".join(lines) + "\n"
+
 
-        all_durations = sorted(r.duration_ms for r in records)
-        return {
-            "total_requests": len(records),
-            "global": {
-                "p50_ms": round(_percentile(all_durations, 50), 2),
-                "p95_ms": round(_percentile(all_durations, 95), 2),
-                "p99_ms": round(_percentile(all_durations, 99), 2),
-                "max_ms": round(all_durations[-1], 2),
-            },
-            "endpoints": endpoints,
-        }
-
-
-def _percentile(sorted_data: list[float], pct: float) -> float:
-    """Compute the *pct*-th percentile from pre-sorted data."""
-    if not sorted_data:
-        return 0.0
-    k = (len(sorted_data) - 1) * (pct / 100.0)
-    f = int(k)
-    c = f + 1
-    if c >= len(sorted_data):
-        return sorted_data[f]
-    return sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_histogram(name: str, labels: str, histogram: LogHistogram) -> list[str]:
+    lines = [
+        f'{name}_bucket{{{labels},le="{bound}"}} {histogram.count_at_or_below(bound * 1000.0)}'
+        for bound in PROMETHEUS_BUCKETS
+    ]
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.total / 1000.0:.6f}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def _route_template(request: Request) -> str:
+    """Return the matched route's path template, not the raw path."""
+    route = request.scope.get("route")
+    template = getattr(route, "path_format", None) or getattr(route, "path", None)
+    return template or UNMATCHED_ROUTE
 
 
 # Module-level singleton used by both middleware and the stats endpoint.
@@ -112,6 +206,7 @@ perf_stats = PerfStats()
 # Middleware
 # ---------------------------------------------------------------------------
 
+
 class RequestIDMiddleware(BaseHTTPMiddleware):
     """Assign a unique request ID to every request.
 
@@ -130,58 +225,64 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         return response
 
 
+def _expose_server_timing(request: Request) -> bool:
+    """Whether this response may carry the dependency breakdown."""
+    if settings.SERVER_TIMING_HEADER or settings.is_development:
+        return True
+    # Set by require_role (src.api.deps) once the caller is known to be an admin
+    return getattr(request.state, "is_admin", False) is True
+
+
 class RequestTimingMiddleware(BaseHTTPMiddleware):
     """Measure request duration and log performance data.
 
     - Adds ``X-Response-Time`` header (in milliseconds).
-    - Logs a WARNING for any request exceeding 1 s.
-    - Logs an INFO-level line with ``[SLOW_QUERY]`` tag for requests > 500 ms.
-    - Pushes a ``RequestRecord`` into the shared ``perf_stats`` ring buffer.
+    - Adds a ``Server-Timing`` header with time spent per dependency, but
+      only in development, with ``SERVER_TIMING_HEADER`` set, or for
+      requests an admin role check has passed: it reveals which backends
+      a request touched and how long they took.
+    - Logs a WARNING, with the dependency breakdown, for any request exceeding 1 s.
+    - Records the duration in the shared ``perf_stats`` histograms under the
+      route template.
     """
 
     async def dispatch(self, request: Request, call_next: Any) -> Response:
+        request_id = getattr(request.state, "request_id", "unknown")
         start = time.perf_counter()
 
-        response: Response = await call_next(request)
+        with request_timing_scope(request_id) as timings:
+            response: Response = await call_next(request)
 
         duration_ms = (time.perf_counter() - start) * 1000.0
         response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
+        if timings.durations_ms and _expose_server_timing(request):
+            response.headers["Server-Timing"] = timings.server_timing()
 
-        request_id = getattr(request.state, "request_id", "unknown")
         method = request.method
-        path = request.url.path
+        route = _route_template(request)
         status_code = response.status_code
 
-        # Record into ring buffer
         perf_stats.record(
             RequestRecord(
                 method=method,
-                path=path,
+                path=route,
                 status_code=status_code,
                 duration_ms=duration_ms,
                 request_id=request_id,
+                dependency_ms=dict(timings.durations_ms),
             )
         )
 
         # Warn on slow requests (>1 s)
         if duration_ms >= SLOW_REQUEST_THRESHOLD_MS:
             logger.warning(
-                "Slow request: %s %s completed in %.2f ms [request_id=%s, status=%d]",
-                method,
-                path,
-                duration_ms,
-                request_id,
-                status_code,
-            )
-        # Log slow-query-level requests (>500 ms)
-        elif duration_ms >= SLOW_QUERY_THRESHOLD_MS:
-            logger.info(
-                "[SLOW_QUERY] %s %s completed in %.2f ms [request_id=%s, status=%d]",
+                "Slow request: %s %s completed in %.2f ms [request_id=%s, status=%d, dependencies=%s]",
                 method,
-                path,
+                request.url.path,
                 duration_ms,
                 request_id,
                 status_code,
+                timings.server_timing() or "none",
             )
 
         return response
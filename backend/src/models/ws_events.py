@@ -24,6 +24,9 @@ class WSEventType(str, Enum):
     EXECUTION_COMPLETE = "execution.complete"
     RECOMMENDATION_NEW = "recommendation.new"
     INTEGRATION_CONNECTED = "integration.connected"
+    ACTIVITY_NEW = "activity.new"
+    NOTIFICATION_NEW = "notification.new"
+    NOTIFICATION_UNREAD_COUNT = "notification.unread_count"
     CONNECTED = "connected"
     PONG = "pong"
     C1_RENDER = "aria.c1_render"
@@ -201,6 +204,28 @@ class IntegrationConnectedEvent(WSEvent):
     account_email: str | None = None
 
 
+class ActivityEvent(WSEvent):
+    """New activity feed entry (replaces polling /activity/poll)."""
+
+    type: WSEventType = WSEventType.ACTIVITY_NEW
+    activity: dict[str, Any]
+
+
+class NotificationEvent(WSEvent):
+    """New notification, with the user's unread count after it."""
+
+    type: WSEventType = WSEventType.NOTIFICATION_NEW
+    notification: dict[str, Any]
+    unread_count: int | None = None
+
+
+class UnreadCountEvent(WSEvent):
+    """Unread notification count changed (e.g. marked read in another tab)."""
+
+    type: WSEventType = WSEventType.NOTIFICATION_UNREAD_COUNT
+    count: int
+
+
 class PongEvent(WSEvent):
     """Heartbeat pong response."""
 
@@ -12,16 +12,25 @@ Pipeline:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import multiprocessing
 import uuid
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import UTC, datetime
-from io import BytesIO
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from src.core.config import settings
 from src.core.llm import LLMClient
 from src.core.task_types import TaskType
-from src.db.supabase import SupabaseClient
+from src.db.supabase import SupabaseClient, execute_async
+from src.onboarding import document_parsing
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +51,71 @@ SUPPORTED_TYPES: dict[str, str] = {
     "image/webp": "image",
 }
 
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_EMBEDDING_DIMENSIONS = 1536
+# Embedding requests in flight at once per document
+_EMBEDDING_CONCURRENCY = 4
+# PDFs longer than this are split into page ranges parsed in parallel
+_PDF_PAGES_PER_TASK = 8
+# Document ids and content hashes per chunk-cache lookup query (bounds URL length)
+_CACHE_LOOKUP_CHUNK = 100
+
+_parse_pool: ProcessPoolExecutor | None = None
+_embedding_client: "AsyncOpenAI | None" = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor | None:
+    """Return the shared parsing process pool, or None to parse in a thread."""
+    global _parse_pool
+    if settings.DOCUMENT_PARSE_PROCESSES <= 0:
+        return None
+    if _parse_pool is None:
+        # spawn: workers only import the lightweight document_parsing module
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=settings.DOCUMENT_PARSE_PROCESSES,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the parsing worker processes (called on app shutdown)."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+async def _run_parser(parser: Callable[..., str], *args: Any) -> str:
+    """Run a CPU-bound parser off the event loop, in the process pool if enabled."""
+    global _parse_pool
+    pool = _get_parse_pool()
+    if pool is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, parser, *args)
+        except BrokenProcessPool:
+            logger.warning("Document parse pool died, recreating it and parsing in a thread")
+            _parse_pool = None
+    return await asyncio.to_thread(parser, *args)
+
+
+def _get_embedding_client() -> "AsyncOpenAI | None":
+    """Return the shared OpenAI client, or None if no API key is configured."""
+    global _embedding_client
+    if _embedding_client is None:
+        api_key = settings.OPENAI_API_KEY.get_secret_value()
+        if not api_key:
+            return None
+        from openai import AsyncOpenAI
+
+        _embedding_client = AsyncOpenAI(api_key=api_key)
+    return _embedding_client
+
+
+def _content_hash(text: str) -> str:
+    """Hash identifying a chunk's content (and the embedding model used for it)."""
+    return hashlib.sha256(f"{_EMBEDDING_MODEL}:{text}".encode()).hexdigest()
+
 
 class DocumentIngestionService:
     """Handles document upload, parsing, chunking, and knowledge extraction.
@@ -213,25 +287,9 @@ class DocumentIngestionService:
             await self._update_progress(doc_id, 30, "processing")
             chunks = self._semantic_chunk(text)
 
-            # Step 3: Entity extraction + embedding for each chunk
+            # Step 3: Entity extraction + embedding, then bulk insert
             await self._update_progress(doc_id, 50, "processing")
-            total_entities: list[dict[str, str]] = []
-            for i, chunk in enumerate(chunks):
-                entities = await self._extract_entities(chunk["content"])
-                embedding = await self._generate_embedding(chunk["content"])
-
-                self._db.table("document_chunks").insert(
-                    {
-                        "document_id": doc_id,
-                        "chunk_index": i,
-                        "content": chunk["content"],
-                        "chunk_type": chunk["type"],
-                        "embedding": embedding,
-                        "entities": entities,
-                        "metadata": chunk.get("metadata", {}),
-                    }
-                ).execute()
-                total_entities.extend(entities)
+            total_entities = await self._store_chunks(doc_id, company_id, chunks)
 
             # Step 4: Quality scoring
             await self._update_progress(doc_id, 80, "processing")
@@ -314,6 +372,10 @@ class DocumentIngestionService:
     async def _extract_text(self, content: bytes, file_type: str) -> str:
         """Extract text from document based on file type.
 
+        Plain text is decoded inline. Everything else is parsed in the
+        process pool; large PDFs are split into page ranges parsed (and
+        OCR'd) in parallel.
+
         Args:
             content: Raw file bytes.
             file_type: Detected file type string.
@@ -324,173 +386,31 @@ class DocumentIngestionService:
         if file_type in ("txt", "md", "csv"):
             return content.decode("utf-8", errors="replace")
 
-        if file_type == "pdf":
-            return self._extract_pdf(content)
-
-        if file_type == "docx":
-            return self._extract_docx(content)
-
-        if file_type == "pptx":
-            return self._extract_pptx(content)
-
-        if file_type == "xlsx":
-            return self._extract_xlsx(content)
-
-        if file_type == "image":
-            return self._extract_image_ocr(content)
-
-        return ""
-
-    @staticmethod
-    def _extract_pdf(content: bytes) -> str:
-        """Extract text from a PDF using PyMuPDF, with OCR fallback for scanned pages.
-
-        For each page, tries native text extraction first. If a page yields
-        minimal text (< 50 chars), falls back to OCR via pytesseract on a
-        rendered pixmap of the page.
-
-        Args:
-            content: Raw PDF bytes.
-
-        Returns:
-            Extracted text, or empty string if parser unavailable.
-        """
-        try:
-            import fitz  # PyMuPDF
-        except ImportError:
-            logger.warning("PyMuPDF not installed — PDF text extraction unavailable")
-            return ""
-
-        doc = fitz.open(stream=content, filetype="pdf")
-        text = ""
-        for page in doc:
-            page_text = page.get_text()
-            if len(page_text.strip()) < 50:
-                # Scanned/image-based page — try OCR
-                page_text = DocumentIngestionService._ocr_pdf_page(page)
-            text += page_text + "\n\n"
-        doc.close()
-        return text
-
-    @staticmethod
-    def _ocr_pdf_page(page: "Any") -> str:
-        """Run OCR on a single PDF page rendered as an image.
-
-        Args:
-            page: A PyMuPDF page object.
-
-        Returns:
-            OCR'd text, or empty string if Tesseract is unavailable.
-        """
-        try:
-            import pytesseract
-            from PIL import Image
-
-            pix = page.get_pixmap(dpi=300)
-            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-            return pytesseract.image_to_string(img)
-        except ImportError:
-            logger.warning(
-                "pytesseract/Pillow not installed — OCR unavailable for scanned PDF page"
-            )
-            return ""
-        except Exception as e:
-            logger.warning("OCR failed for PDF page: %s", e)
+        if file_type not in ("pdf", "docx", "pptx", "xlsx", "image"):
             return ""
 
-    @staticmethod
-    def _extract_image_ocr(content: bytes) -> str:
-        """Extract text from a standalone image file via OCR.
-
-        Args:
-            content: Raw image bytes (PNG, JPG, WebP).
-
-        Returns:
-            OCR'd text, or empty string if Tesseract is unavailable.
-        """
-        try:
-            import pytesseract
-            from PIL import Image
-
-            img = Image.open(BytesIO(content))
-            return pytesseract.image_to_string(img)
-        except ImportError:
-            logger.warning("pytesseract/Pillow not installed — image OCR unavailable")
-            return ""
-        except Exception as e:
-            logger.warning("Image OCR failed: %s", e)
-            return ""
-
-    @staticmethod
-    def _extract_docx(content: bytes) -> str:
-        """Extract text from a DOCX file.
-
-        Args:
-            content: Raw DOCX bytes.
-
-        Returns:
-            Extracted text, or empty string if parser unavailable.
-        """
-        try:
-            import docx
-
-            doc = docx.Document(BytesIO(content))
-            return "\n\n".join(p.text for p in doc.paragraphs if p.text.strip())
-        except ImportError:
-            logger.warning("python-docx not installed — DOCX text extraction unavailable")
-            return ""
-
-    @staticmethod
-    def _extract_pptx(content: bytes) -> str:
-        """Extract text from a PPTX file.
-
-        Args:
-            content: Raw PPTX bytes.
-
-        Returns:
-            Extracted text, or empty string if parser unavailable.
-        """
-        try:
-            from pptx import Presentation
-
-            prs = Presentation(BytesIO(content))
-            text = ""
-            for slide in prs.slides:
-                for shape in slide.shapes:
-                    if hasattr(shape, "text"):
-                        text += shape.text + "\n"
-                text += "\n\n"
-            return text
-        except ImportError:
-            logger.warning("python-pptx not installed — PPTX text extraction unavailable")
-            return ""
-
-    @staticmethod
-    def _extract_xlsx(content: bytes) -> str:
-        """Extract text from an XLSX file.
+        if file_type == "pdf":
+            page_count = await asyncio.to_thread(document_parsing.pdf_page_count, content)
+            workers = max(1, settings.DOCUMENT_PARSE_PROCESSES)
+            if page_count > _PDF_PAGES_PER_TASK and workers > 1:
+                step = max(_PDF_PAGES_PER_TASK, -(-page_count // workers))
+                parts = await asyncio.gather(
+                    *(
+                        _run_parser(document_parsing.extract_pdf_pages, content, start, start + step)
+                        for start in range(0, page_count, step)
+                    )
+                )
+                return "".join(parts)
 
-        Args:
-            content: Raw XLSX bytes.
+        return await _run_parser(document_parsing.extract_text_sync, content, file_type)
 
-        Returns:
-            Extracted text, or empty string if parser unavailable.
-        """
-        try:
-            import openpyxl
-
-            wb = openpyxl.load_workbook(BytesIO(content), read_only=True)
-            text = ""
-            for sheet in wb.worksheets:
-                for row in sheet.iter_rows(values_only=True):
-                    row_text = " | ".join(str(cell) for cell in row if cell)
-                    if row_text:
-                        text += row_text + "\n"
-                text += "\n\n"
-            wb.close()
-            return text
-        except ImportError:
-            logger.warning("openpyxl not installed — XLSX text extraction unavailable")
-            return ""
+    # Synchronous parsers, also used directly by the onboarding routes
+    _extract_pdf = staticmethod(document_parsing.extract_pdf)
+    _ocr_pdf_page = staticmethod(document_parsing.ocr_pdf_page)
+    _extract_image_ocr = staticmethod(document_parsing.extract_image_ocr)
+    _extract_docx = staticmethod(document_parsing.extract_docx)
+    _extract_pptx = staticmethod(document_parsing.extract_pptx)
+    _extract_xlsx = staticmethod(document_parsing.extract_xlsx)
 
     @staticmethod
     def _semantic_chunk(text: str, max_chunk_size: int = 1500) -> list[dict[str, Any]]:
@@ -572,38 +492,187 @@ class DocumentIngestionService:
             logger.debug("Entity extraction parse error: %s", e)
             return []
 
-    async def _generate_embedding(self, text: str) -> list[float]:
-        """Generate embedding vector for a text chunk using OpenAI.
+    async def _store_chunks(
+        self,
+        doc_id: str,
+        company_id: str,
+        chunks: list[dict[str, Any]],
+    ) -> list[dict[str, str]]:
+        """Embed, extract entities for, and bulk-insert a document's chunks.
 
-        Uses the text-embedding-3-small model (same as Graphiti) to produce
-        1536-dimensional vectors stored in pgvector for semantic search.
+        Chunks whose content was already ingested for this company (same
+        content hash, e.g. a re-upload) reuse the stored embedding and
+        entities. The rest are embedded in batches while entity extraction
+        runs with bounded concurrency.
 
         Args:
-            text: Text to embed.
+            doc_id: Document UUID.
+            company_id: Company UUID.
+            chunks: Output of ``_semantic_chunk``.
 
         Returns:
-            1536-dimensional float vector. Returns zeros if the embedding
-            API is not configured or the call fails.
+            All extracted entities, in chunk order.
         """
-        try:
-            from openai import AsyncOpenAI
+        hashes = [_content_hash(chunk["content"]) for chunk in chunks]
+        known = await self._lookup_chunk_cache(company_id, set(hashes))
 
-            from src.core.config import get_settings
+        fresh = [i for i, h in enumerate(hashes) if h not in known]
+        slots = asyncio.Semaphore(max(1, settings.DOCUMENT_ENTITY_CONCURRENCY))
 
-            api_key = get_settings().OPENAI_API_KEY.get_secret_value()
-            if not api_key:
-                logger.debug("OpenAI API key not configured, returning zero vector")
-                return [0.0] * 1536
+        async def extract(text: str) -> list[dict[str, str]]:
+            async with slots:
+                return await self._extract_entities(text)
+
+        fresh_embeddings, fresh_entities = await asyncio.gather(
+            self._generate_embeddings([chunks[i]["content"] for i in fresh]),
+            asyncio.gather(*(extract(chunks[i]["content"]) for i in fresh)),
+        )
+        computed = {
+            i: (embedding, entities)
+            for i, embedding, entities in zip(fresh, fresh_embeddings, fresh_entities, strict=True)
+        }
 
-            client = AsyncOpenAI(api_key=api_key)
-            response = await client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text[:8000],  # Limit input to stay within token bounds
+        rows: list[dict[str, Any]] = []
+        total_entities: list[dict[str, str]] = []
+        for i, chunk in enumerate(chunks):
+            embedding, entities = known.get(hashes[i]) or computed[i]
+            rows.append(
+                {
+                    "document_id": doc_id,
+                    "chunk_index": i,
+                    "content": chunk["content"],
+                    "content_hash": hashes[i],
+                    "chunk_type": chunk["type"],
+                    "embedding": embedding,
+                    "entities": entities,
+                    "metadata": chunk.get("metadata", {}),
+                }
             )
-            return response.data[0].embedding
+            total_entities.extend(entities)
+
+        batch_size = max(1, settings.DOCUMENT_CHUNK_INSERT_BATCH)
+        for start in range(0, len(rows), batch_size):
+            await execute_async(
+                self._db.table("document_chunks").insert(rows[start : start + batch_size])
+            )
+
+        logger.info(
+            "Stored document chunks",
+            extra={"document_id": doc_id, "chunks": len(rows), "reused": len(rows) - len(fresh)},
+        )
+        return total_entities
+
+    async def _lookup_chunk_cache(
+        self,
+        company_id: str,
+        hashes: set[str],
+    ) -> dict[str, tuple[list[float], list[dict[str, str]]]]:
+        """Find embeddings and entities already stored for these chunk hashes.
+
+        Only chunks of the company's own documents are considered, and
+        zero-vector embeddings (from an unconfigured or failed embedding
+        call) are never reused. Lookup errors just mean nothing is reused.
+
+        Args:
+            company_id: Company UUID.
+            hashes: Content hashes of the chunks being ingested.
+
+        Returns:
+            Mapping of content hash to (embedding, entities).
+        """
+        if not hashes:
+            return {}
+        try:
+            docs = await execute_async(
+                self._db.table("company_documents").select("id").eq("company_id", company_id)
+            )
+            doc_ids = [row["id"] for row in (docs.data or [])]
+            if not doc_ids:
+                return {}
+
+            found: dict[str, tuple[list[float], list[dict[str, str]]]] = {}
+            wanted = sorted(hashes)
+            for doc_start in range(0, len(doc_ids), _CACHE_LOOKUP_CHUNK):
+                doc_chunk = doc_ids[doc_start : doc_start + _CACHE_LOOKUP_CHUNK]
+                for start in range(0, len(wanted), _CACHE_LOOKUP_CHUNK):
+                    hash_chunk = wanted[start : start + _CACHE_LOOKUP_CHUNK]
+                    pending = [h for h in hash_chunk if h not in found]
+                    if not pending:
+                        continue
+                    result = await execute_async(
+                        self._db.table("document_chunks")
+                        .select("content_hash, embedding, entities")
+                        .in_("document_id", doc_chunk)
+                        .in_("content_hash", pending)
+                    )
+                    for row in result.data or []:
+                        embedding = row.get("embedding")
+                        if isinstance(embedding, str):
+                            # PostgREST returns pgvector values as "[0.1,...]"
+                            embedding = json.loads(embedding)
+                        if not embedding or not any(embedding):
+                            continue
+                        found.setdefault(
+                            row["content_hash"], (embedding, row.get("entities") or [])
+                        )
+            return found
         except Exception as e:
-            logger.warning("Embedding generation failed, returning zero vector: %s", e)
-            return [0.0] * 1536
+            logger.warning("Chunk cache lookup failed, embedding all chunks: %s", e)
+            return {}
+
+    async def _generate_embedding(self, text: str) -> list[float]:
+        """Generate embedding vector for a text chunk using OpenAI.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            1536-dimensional float vector (zeros if unavailable).
+        """
+        return (await self._generate_embeddings([text]))[0]
+
+    async def _generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for many chunks using OpenAI.
+
+        Uses the text-embedding-3-small model (same as Graphiti) to produce
+        1536-dimensional vectors stored in pgvector for semantic search.
+        Inputs are sent ``DOCUMENT_EMBEDDING_BATCH_SIZE`` per request over
+        one shared client, a few requests at a time.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One 1536-dimensional vector per text, in order. A batch whose
+            call fails (or all of them, if the embedding API is not
+            configured) gets zero vectors.
+        """
+        zero = [0.0] * _EMBEDDING_DIMENSIONS
+        client = _get_embedding_client()
+        if client is None:
+            logger.debug("OpenAI API key not configured, returning zero vectors")
+            return [list(zero) for _ in texts]
+
+        batch_size = max(1, settings.DOCUMENT_EMBEDDING_BATCH_SIZE)
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        slots = asyncio.Semaphore(_EMBEDDING_CONCURRENCY)
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            async with slots:
+                try:
+                    response = await client.embeddings.create(
+                        model=_EMBEDDING_MODEL,
+                        # Limit input to stay within token bounds
+                        input=[text[:8000] for text in batch],
+                    )
+                    ordered = sorted(response.data, key=lambda item: item.index)
+                    return [list(item.embedding) for item in ordered]
+                except Exception as e:
+                    logger.warning("Embedding generation failed, returning zero vectors: %s", e)
+                    return [list(zero) for _ in batch]
+
+        results = await asyncio.gather(*(embed(batch) for batch in batches))
+        return [vector for batch in results for vector in batch]
 
     async def _score_quality(self, text: str, file_type: str) -> float:
         """Score document source quality.
@@ -0,0 +1,229 @@
+"""Text extraction for uploaded documents (US-904).
+
+Synchronous, CPU-bound parsers for PDF / DOCX / PPTX / XLSX and OCR for
+images and scanned PDF pages. ``DocumentIngestionService`` runs them in a
+process pool so parsing never blocks the event loop; this module keeps
+its imports light (parsers are imported lazily) so pool workers start
+quickly.
+"""
+
+import logging
+from io import BytesIO
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Pages with less native text than this are treated as scanned and OCR'd
+_MIN_PAGE_TEXT = 50
+
+
+def extract_text_sync(content: bytes, file_type: str) -> str:
+    """Extract text from document bytes based on file type.
+
+    Args:
+        content: Raw file bytes.
+        file_type: Detected file type string.
+
+    Returns:
+        Extracted plain text, or empty string for unknown types.
+    """
+    if file_type in ("txt", "md", "csv"):
+        return content.decode("utf-8", errors="replace")
+    if file_type == "pdf":
+        return extract_pdf(content)
+    if file_type == "docx":
+        return extract_docx(content)
+    if file_type == "pptx":
+        return extract_pptx(content)
+    if file_type == "xlsx":
+        return extract_xlsx(content)
+    if file_type == "image":
+        return extract_image_ocr(content)
+    return ""
+
+
+def pdf_page_count(content: bytes) -> int:
+    """Number of pages in a PDF, or 0 if it can't be opened.
+
+    Args:
+        content: Raw PDF bytes.
+
+    Returns:
+        Page count.
+    """
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        return 0
+
+    try:
+        with fitz.open(stream=content, filetype="pdf") as doc:
+            return int(doc.page_count)
+    except Exception as e:
+        logger.warning("Could not open PDF: %s", e)
+        return 0
+
+
+def extract_pdf_pages(content: bytes, start: int = 0, stop: int | None = None) -> str:
+    """Extract text from a range of PDF pages, with OCR fallback for scanned pages.
+
+    For each page, tries native text extraction first. If a page yields
+    minimal text (< 50 chars), falls back to OCR via pytesseract on a
+    rendered pixmap of the page.
+
+    Args:
+        content: Raw PDF bytes.
+        start: First page index (inclusive).
+        stop: Last page index (exclusive); None for the end of the document.
+
+    Returns:
+        Extracted text, each page followed by a blank line, or empty
+        string if the parser is unavailable.
+    """
+    try:
+        import fitz  # PyMuPDF
+    except ImportError:
+        logger.warning("PyMuPDF not installed — PDF text extraction unavailable")
+        return ""
+
+    doc = fitz.open(stream=content, filetype="pdf")
+    parts: list[str] = []
+    for page_index in range(start, doc.page_count if stop is None else min(stop, doc.page_count)):
+        page = doc[page_index]
+        page_text = page.get_text()
+        if len(page_text.strip()) < _MIN_PAGE_TEXT:
+            # Scanned/image-based page — try OCR
+            page_text = ocr_pdf_page(page)
+        parts.append(page_text + "\n\n")
+    doc.close()
+    return "".join(parts)
+
+
+def extract_pdf(content: bytes) -> str:
+    """Extract text from a whole PDF (see ``extract_pdf_pages``).
+
+    Args:
+        content: Raw PDF bytes.
+
+    Returns:
+        Extracted text, or empty string if parser unavailable.
+    """
+    return extract_pdf_pages(content)
+
+
+def ocr_pdf_page(page: Any) -> str:
+    """Run OCR on a single PDF page rendered as an image.
+
+    Args:
+        page: A PyMuPDF page object.
+
+    Returns:
+        OCR'd text, or empty string if Tesseract is unavailable.
+    """
+    try:
+        import pytesseract
+        from PIL import Image
+
+        pix = page.get_pixmap(dpi=300)
+        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+        return str(pytesseract.image_to_string(img))
+    except ImportError:
+        logger.warning("pytesseract/Pillow not installed — OCR unavailable for scanned PDF page")
+        return ""
+    except Exception as e:
+        logger.warning("OCR failed for PDF page: %s", e)
+        return ""
+
+
+def extract_image_ocr(content: bytes) -> str:
+    """Extract text from a standalone image file via OCR.
+
+    Args:
+        content: Raw image bytes (PNG, JPG, WebP).
+
+    Returns:
+        OCR'd text, or empty string if Tesseract is unavailable.
+    """
+    try:
+        import pytesseract
+        from PIL import Image
+
+        img = Image.open(BytesIO(content))
+        return str(pytesseract.image_to_string(img))
+    except ImportError:
+        logger.warning("pytesseract/Pillow not installed — image OCR unavailable")
+        return ""
+    except Exception as e:
+        logger.warning("Image OCR failed: %s", e)
+        return ""
+
+
+def extract_docx(content: bytes) -> str:
+    """Extract text from a DOCX file.
+
+    Args:
+        content: Raw DOCX bytes.
+
+    Returns:
+        Extracted text, or empty string if parser unavailable.
+    """
+    try:
+        import docx
+
+        doc = docx.Document(BytesIO(content))
+        return "\n\n".join(p.text for p in doc.paragraphs if p.text.strip())
+    except ImportError:
+        logger.warning("python-docx not installed — DOCX text extraction unavailable")
+        return ""
+
+
+def extract_pptx(content: bytes) -> str:
+    """Extract text from a PPTX file.
+
+    Args:
+        content: Raw PPTX bytes.
+
+    Returns:
+        Extracted text, or empty string if parser unavailable.
+    """
+    try:
+        from pptx import Presentation
+
+        prs = Presentation(BytesIO(content))
+        parts: list[str] = []
+        for slide in prs.slides:
+            for shape in slide.shapes:
+                if hasattr(shape, "text"):
+                    parts.append(shape.text + "\n")
+            parts.append("\n\n")
+        return "".join(parts)
+    except ImportError:
+        logger.warning("python-pptx not installed — PPTX text extraction unavailable")
+        return ""
+
+
+def extract_xlsx(content: bytes) -> str:
+    """Extract text from an XLSX file.
+
+    Args:
+        content: Raw XLSX bytes.
+
+    Returns:
+        Extracted text, or empty string if parser unavailable.
+    """
+    try:
+        import openpyxl
+
+        wb = openpyxl.load_workbook(BytesIO(content), read_only=True)
+        parts: list[str] = []
+        for sheet in wb.worksheets:
+            for row in sheet.iter_rows(values_only=True):
+                row_text = " | ".join(str(cell) for cell in row if cell)
+                if row_text:
+                    parts.append(row_text + "\n")
+            parts.append("\n\n")
+        wb.close()
+        return "".join(parts)
+    except ImportError:
+        logger.warning("openpyxl not installed — XLSX text extraction unavailable")
+        return ""
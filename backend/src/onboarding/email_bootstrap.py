@@ -5,21 +5,30 @@ to rapidly seed the relationship graph, refine the Digital Twin writing
 style fingerprint, detect active deals, and identify follow-up commitments.
 
 Full 1-year archive is queued for nightly batch processing.
+
+Sent mail is streamed a page at a time: each page is filtered and counted
+into contacts, threads and send-time patterns while the next page is being
+fetched, and progress is published as pages complete. Only the most recent
+email text that fits in EMAIL_BOOTSTRAP_BUFFER_MAX_BYTES is kept for the
+style and commitment analysis.
 """
 
+import asyncio
 import json
 import logging
 import uuid
 from collections import Counter
-from collections.abc import Callable, Coroutine
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import aclosing
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from src.core.config import settings
 from src.core.llm import LLMClient
 from src.core.task_types import TaskType
-from src.db.supabase import SupabaseClient
+from src.db.supabase import SupabaseClient, execute_async
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +59,7 @@ class ActiveThread(BaseModel):
     last_activity: str
     thread_type: str = "unknown"  # deal, project, routine, personal
     commitments: list[str] = Field(default_factory=list)
+    key: str = ""  # Provider thread id (subject if the provider has none)
 
 
 class CommunicationPatterns(BaseModel):
@@ -78,6 +88,135 @@ class EmailBootstrapResult(BaseModel):
 ProgressCallback = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
 
 
+def _bootstrap_fact_id(user_id: str, kind: str, key: str) -> str:
+    """Stable memory_semantic ID for a fact the bootstrap writes."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"email_bootstrap/{user_id}/{kind}/{key.lower()}"))
+
+
+class _ThreadTally:
+    """Running counts for one thread while sent mail streams in."""
+
+    __slots__ = ("last_activity", "message_count", "participants", "subject")
+
+    def __init__(self, subject: str) -> None:
+        self.subject = subject
+        self.participants: set[str] = set()
+        self.message_count = 0
+        self.last_activity = ""
+
+
+class _SentMailAggregate:
+    """Contacts, threads and send-time counts built up one page at a time.
+
+    Every email is counted, but only the most recent emails whose text fits
+    in ``max_retained_bytes`` are kept. Writing samples, formatting
+    patterns, commitments and recipient profiles are drawn from those.
+    """
+
+    def __init__(self, max_retained_bytes: int = 0) -> None:
+        self.pages = 0
+        self.fetched = 0  # Before exclusions
+        self.emails_seen = 0  # After exclusions
+        self.contacts: dict[str, EmailContact] = {}
+        self.threads: dict[str, _ThreadTally] = {}
+        self.send_hours: Counter[int] = Counter()
+        self.send_days: Counter[str] = Counter()
+        self.send_dates: set[str] = set()
+        self.retained: list[dict[str, Any]] = []
+        self.retained_bytes = 0
+        self.max_retained_bytes = max_retained_bytes
+        self.buffer_full = False
+
+    def add(self, emails: list[dict[str, Any]]) -> None:
+        """Count a page of (already filtered) emails."""
+        for email in emails:
+            self.emails_seen += 1
+            self._count_contacts(email)
+            self._count_thread(email)
+            self._count_send_time(email)
+            self._retain(email)
+
+    def _count_contacts(self, email: dict[str, Any]) -> None:
+        for r in list(email.get("to", [])) + list(email.get("cc", [])):
+            addr = r.lower() if isinstance(r, str) else r.get("email", "").lower()
+            name = r.get("name", "") if isinstance(r, dict) else ""
+
+            contact = self.contacts.get(addr)
+            if contact is None:
+                contact = self.contacts[addr] = EmailContact(
+                    email=addr,
+                    name=name or None,
+                    interaction_count=0,
+                    last_interaction=email.get("date"),
+                )
+            contact.interaction_count += 1
+            if email.get("date"):
+                contact.last_interaction = email["date"]
+
+    def _count_thread(self, email: dict[str, Any]) -> None:
+        thread_key = email.get("thread_id") or email.get("subject", "")
+        tally = self.threads.get(thread_key)
+        if tally is None:
+            tally = self.threads[thread_key] = _ThreadTally(email.get("subject", ""))
+        tally.message_count += 1
+        tally.last_activity = email.get("date", "")
+        for r in list(email.get("to", [])) + list(email.get("cc", [])):
+            addr = r if isinstance(r, str) else r.get("email", "")
+            if addr:
+                tally.participants.add(addr)
+
+    def _count_send_time(self, email: dict[str, Any]) -> None:
+        date_str = email.get("date", "")
+        if not date_str:
+            return
+        try:
+            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except (ValueError, TypeError):
+            return
+        self.send_hours[dt.hour] += 1
+        self.send_days[dt.strftime("%A")] += 1
+        self.send_dates.add(date_str[:10])
+
+    def _retain(self, email: dict[str, Any]) -> None:
+        if self.buffer_full:
+            return
+        body = email.get("body", "")
+        size = (len(body) if isinstance(body, str) else 0) + len(email.get("subject") or "")
+        if self.retained_bytes + size > self.max_retained_bytes:
+            # Pages arrive newest first, so everything kept is more recent
+            # than everything dropped.
+            self.buffer_full = True
+            return
+        self.retained.append(email)
+        self.retained_bytes += size
+
+    def ranked_contacts(self) -> list[EmailContact]:
+        """All contacts, most interactions first."""
+        return sorted(self.contacts.values(), key=lambda c: c.interaction_count, reverse=True)
+
+    def active_threads(self) -> list[ActiveThread]:
+        """Threads with 3+ messages, in the order they were first seen."""
+        return [
+            ActiveThread(
+                subject=tally.subject,
+                participants=list(tally.participants),
+                message_count=tally.message_count,
+                last_activity=tally.last_activity,
+                key=key,
+            )
+            for key, tally in self.threads.items()
+            if tally.message_count >= 3
+        ]
+
+    def patterns(self) -> CommunicationPatterns:
+        """Peak send hours and days, and average emails per day."""
+        return CommunicationPatterns(
+            peak_send_hours=[h for h, _ in self.send_hours.most_common(3)],
+            peak_send_days=[d for d, _ in self.send_days.most_common(3)],
+            emails_per_day_avg=round(self.emails_seen / max(1, len(self.send_dates)), 1),
+        )
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -137,7 +276,8 @@ class PriorityEmailIngestion:
                 user_id,
             )
 
-            # 2. Fetch sent emails (last 60 days)
+            # 2-3. Stream sent emails (last 60 days). Each page is filtered
+            # and counted while the next one is being fetched.
             if progress_callback:
                 await progress_callback(
                     {"stage": "fetching", "message": "Fetching recent emails..."}
@@ -147,77 +287,49 @@ class PriorityEmailIngestion:
                 "EMAIL_BOOTSTRAP: Fetching sent emails (last 60 days) for user %s",
                 user_id,
             )
-            emails = await self._fetch_sent_emails(user_id, days=60)
-            result.emails_processed = len(emails)
+            aggregate = await self._ingest_sent_emails(user_id, exclusions, progress_callback)
+            result.emails_processed = aggregate.fetched
             logger.info(
-                "EMAIL_BOOTSTRAP: Fetched %d sent emails from last 60 days for user %s",
-                len(emails),
+                "EMAIL_BOOTSTRAP: Fetched %d sent emails in %d pages for user %s, "
+                "%d remaining after %d exclusions, %d kept for style analysis",
+                aggregate.fetched,
+                aggregate.pages,
                 user_id,
+                aggregate.emails_seen,
+                len(exclusions),
+                len(aggregate.retained),
             )
 
-            if not emails:
+            if not aggregate.fetched:
                 logger.info("EMAIL_BOOTSTRAP: No emails found for user %s", user_id)
                 return result
 
-            # 3. Filter out excluded senders/domains
-            logger.info(
-                "EMAIL_BOOTSTRAP: Applying %d exclusions to %d emails for user %s",
-                len(exclusions),
-                len(emails),
-                user_id,
-            )
-            emails = self._apply_exclusions(emails, exclusions)
-            logger.info(
-                "EMAIL_BOOTSTRAP: %d emails remaining after exclusions for user %s",
-                len(emails),
-                user_id,
-            )
+            emails = aggregate.retained
 
-            # 4. Extract contacts
-            if progress_callback:
-                await progress_callback(
-                    {
-                        "stage": "contacts",
-                        "message": f"Analyzing {len(emails)} emails for contacts...",
-                    }
-                )
-            logger.info("EMAIL_BOOTSTRAP: Extracting contacts for user %s", user_id)
-            contacts = await self._extract_contacts(emails)
-            result.contacts_discovered = len(contacts)
-            logger.info(
-                "EMAIL_BOOTSTRAP: Extracted %d contacts for user %s",
-                len(contacts),
-                user_id,
-            )
-
-            # 5. Identify active threads
+            # 4-6. Classify contacts and threads, detect commitments
             if progress_callback:
                 await progress_callback(
                     {
                         "stage": "threads",
                         "message": (
-                            f"Found {len(contacts)} contacts. Identifying active conversations..."
+                            f"Found {len(aggregate.contacts)} contacts. "
+                            "Identifying active conversations..."
                         ),
                     }
                 )
-            logger.info(
-                "EMAIL_BOOTSTRAP: Identifying active threads for user %s",
-                user_id,
+            contacts, threads, commitments = await asyncio.gather(
+                self._classify_ranked_contacts(aggregate.ranked_contacts(), emails),
+                self._classify_active_threads(aggregate.active_threads()),
+                self._detect_commitments(emails),
             )
-            threads = await self._identify_active_threads(emails)
+            result.contacts_discovered = len(contacts)
             result.active_threads = len(threads)
-            logger.info(
-                "EMAIL_BOOTSTRAP: Detected %d active deal threads for user %s",
-                len([t for t in threads if t.thread_type == "deal"]),
-                user_id,
-            )
-
-            # 6. Detect commitments
-            logger.info("EMAIL_BOOTSTRAP: Detecting commitments for user %s", user_id)
-            commitments = await self._detect_commitments(emails)
             result.commitments_detected = len(commitments)
             logger.info(
-                "EMAIL_BOOTSTRAP: Detected %d commitments for user %s",
+                "EMAIL_BOOTSTRAP: Extracted %d contacts, %d active deal threads and "
+                "%d commitments for user %s",
+                len(contacts),
+                len([t for t in threads if t.thread_type == "deal"]),
                 len(commitments),
                 user_id,
             )
@@ -235,7 +347,7 @@ class PriorityEmailIngestion:
             formatting_patterns = self._extract_formatting_patterns(emails)
 
             # 8. Analyze communication patterns
-            result.communication_patterns = self._analyze_patterns(emails)
+            result.communication_patterns = aggregate.patterns()
             logger.info(
                 "EMAIL_BOOTSTRAP: Analyzed communication patterns for user %s",
                 user_id,
@@ -378,10 +490,73 @@ class PriorityEmailIngestion:
     # Email fetching
     # ------------------------------------------------------------------
 
-    async def _fetch_sent_emails(
+    async def _ingest_sent_emails(
+        self,
+        user_id: str,
+        exclusions: list[dict[str, Any]],
+        progress_callback: ProgressCallback | None = None,
+    ) -> _SentMailAggregate:
+        """Stream sent emails into a running aggregate, one page at a time.
+
+        The next page is requested before the current one is processed, so
+        exclusion filtering, counting and progress updates overlap the
+        Composio round trip. Raw pages are dropped once counted; only the
+        text that fits in EMAIL_BOOTSTRAP_BUFFER_MAX_BYTES is kept.
+
+        Args:
+            user_id: The user whose emails to fetch.
+            exclusions: Privacy exclusion rules applied to every page.
+            progress_callback: Optional async callback, called after each page.
+
+        Returns:
+            The aggregate over every fetched page.
+        """
+        aggregate = _SentMailAggregate(settings.EMAIL_BOOTSTRAP_BUFFER_MAX_BYTES)
+        pages = self._stream_sent_emails(user_id, days=60)
+        next_page = asyncio.ensure_future(anext(pages, None))
+        try:
+            while (page := await next_page) is not None:
+                next_page = asyncio.ensure_future(anext(pages, None))
+                aggregate.pages += 1
+                aggregate.fetched += len(page)
+                aggregate.add(self._apply_exclusions(page, exclusions))
+                await self._publish_progress(user_id, aggregate, progress_callback)
+        finally:
+            next_page.cancel()
+            await asyncio.gather(next_page, return_exceptions=True)
+            await pages.aclose()
+        return aggregate
+
+    async def _publish_progress(
+        self,
+        user_id: str,
+        aggregate: _SentMailAggregate,
+        progress_callback: ProgressCallback | None,
+    ) -> None:
+        """Report counts so far to the callback and the polled bootstrap status."""
+        progress = {
+            "pages": aggregate.pages,
+            "emails_fetched": aggregate.fetched,
+            "contacts_found": len(aggregate.contacts),
+            "threads_found": len(aggregate.threads),
+        }
+        if progress_callback:
+            await progress_callback(
+                {
+                    "stage": "fetching",
+                    "message": (
+                        f"Read {aggregate.fetched} emails, "
+                        f"found {len(aggregate.contacts)} contacts so far..."
+                    ),
+                    **progress,
+                }
+            )
+        await self._store_bootstrap_status(user_id, "processing", progress=progress)
+
+    async def _stream_sent_emails(
         self, user_id: str, days: int = 60, max_emails: int = 5000
-    ) -> list[dict[str, Any]]:
-        """Fetch sent emails via Composio with full pagination.
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch sent emails via Composio, one page at a time.
 
         Detects the user's email provider (Gmail or Outlook) from user_integrations
         and uses the appropriate Composio action. Paginates through ALL results
@@ -392,9 +567,11 @@ class PriorityEmailIngestion:
             days: How many days of history to fetch.
             max_emails: Maximum total emails to fetch (safety limit).
 
-        Returns:
-            List of email dicts with: to, cc, subject, body, date, thread_id.
+        Yields:
+            Pages of email dicts with: to, cc, subject, body, date, thread_id.
+            A failed fetch ends the stream after the pages already yielded.
         """
+        fetched = 0
         try:
             # Get provider and connection_id from user_integrations
             # Prefer Outlook as it's more commonly working in enterprise
@@ -426,7 +603,7 @@ class PriorityEmailIngestion:
                     "EMAIL_BOOTSTRAP: No email integration found for user %s",
                     user_id,
                 )
-                return []
+                return
 
             integration = result.data[0]
             provider = integration.get("integration_type", "").lower()
@@ -439,7 +616,7 @@ class PriorityEmailIngestion:
                     user_id,
                     provider,
                 )
-                return []
+                return
 
             logger.info(
                 "EMAIL_BOOTSTRAP: Detected email provider '%s' for user %s, fetching %d days",
@@ -453,11 +630,12 @@ class PriorityEmailIngestion:
             oauth_client = get_oauth_client()
             since_date = (datetime.now(UTC) - timedelta(days=days)).isoformat()
 
-            all_emails: list[dict[str, Any]] = []
-
-            # Use appropriate Composio action based on provider with pagination
+            # Use appropriate Composio action based on provider with pagination.
+            # Pages are normalized to the canonical keys expected by the rest
+            # of the pipeline as they arrive.
             if provider == "outlook":
-                all_emails = await self._fetch_outlook_with_pagination(
+                normalize = self._normalize_outlook_email
+                raw_pages = self._fetch_outlook_with_pagination(
                     oauth_client=oauth_client,
                     connection_id=connection_id,
                     user_id=user_id,
@@ -468,7 +646,8 @@ class PriorityEmailIngestion:
                 )
             else:
                 # Default to Gmail
-                all_emails = await self._fetch_gmail_with_pagination(
+                normalize = self._normalize_gmail_email
+                raw_pages = self._fetch_gmail_with_pagination(
                     oauth_client=oauth_client,
                     connection_id=connection_id,
                     user_id=user_id,
@@ -477,30 +656,26 @@ class PriorityEmailIngestion:
                     integration_type=provider,
                 )
 
+            async with aclosing(raw_pages):
+                async for raw_page in raw_pages:
+                    fetched += len(raw_page)
+                    yield [normalize(e) for e in raw_page]
+
             logger.info(
                 "EMAIL_BOOTSTRAP: Fetched %d total emails from %d days for user %s",
-                len(all_emails),
+                fetched,
                 days,
                 user_id,
             )
 
-            # Normalize raw provider data to canonical keys expected by
-            # _extract_contacts, _detect_commitments, _identify_active_threads, etc.
-            if provider == "outlook":
-                all_emails = [self._normalize_outlook_email(e) for e in all_emails]
-            else:
-                all_emails = [self._normalize_gmail_email(e) for e in all_emails]
-
-            return all_emails
-
         except Exception as e:
             logger.error(
-                "EMAIL_BOOTSTRAP: Email fetch failed for user %s: %s",
+                "EMAIL_BOOTSTRAP: Email fetch failed for user %s after %d emails: %s",
                 user_id,
+                fetched,
                 e,
                 exc_info=True,
             )
-            return []
 
     async def _fetch_outlook_with_pagination(
         self,
@@ -512,8 +687,8 @@ class PriorityEmailIngestion:
         page_size: int = 200,
         integration_id: str = "",
         integration_type: str = "outlook",
-    ) -> list[dict[str, Any]]:
-        """Fetch Outlook sent emails with OData pagination ($skip).
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch Outlook sent emails with OData pagination ($skip), a page at a time.
 
         Args:
             oauth_client: The OAuth client for Composio calls.
@@ -525,10 +700,10 @@ class PriorityEmailIngestion:
             integration_id: The user_integrations row ID for resilience wrapper.
             integration_type: The provider type for resilience wrapper.
 
-        Returns:
-            List of raw Outlook email dicts.
+        Yields:
+            Pages of raw Outlook email dicts, max_emails in total at most.
         """
-        all_emails: list[dict[str, Any]] = []
+        fetched = 0
         skip = 0
         page_num = 0
 
@@ -538,13 +713,13 @@ class PriorityEmailIngestion:
             since_date,
         )
 
-        while len(all_emails) < max_emails:
+        while fetched < max_emails:
             page_num += 1
             logger.info(
                 "EMAIL_BOOTSTRAP: Outlook page %d, skip=%d, fetched so far=%d",
                 page_num,
                 skip,
-                len(all_emails),
+                fetched,
             )
 
             action_params = {
@@ -600,16 +775,19 @@ class PriorityEmailIngestion:
                 )
                 break
 
-            all_emails.extend(page_emails)
+            last_page = len(page_emails) < page_size
+            page_emails = page_emails[: max_emails - fetched]
+            fetched += len(page_emails)
             logger.info(
                 "EMAIL_BOOTSTRAP: Outlook page %d returned %d emails, total now %d",
                 page_num,
                 len(page_emails),
-                len(all_emails),
+                fetched,
             )
+            yield page_emails
 
             # Check if we got fewer than page_size (last page)
-            if len(page_emails) < page_size:
+            if last_page:
                 logger.info(
                     "EMAIL_BOOTSTRAP: Outlook pagination complete - partial page %d",
                     page_num,
@@ -626,8 +804,6 @@ class PriorityEmailIngestion:
                 )
                 break
 
-        return all_emails[:max_emails]
-
     async def _fetch_gmail_with_pagination(
         self,
         oauth_client: Any,
@@ -637,8 +813,8 @@ class PriorityEmailIngestion:
         page_size: int = 200,
         integration_id: str = "",
         integration_type: str = "gmail",
-    ) -> list[dict[str, Any]]:
-        """Fetch Gmail sent emails with pageToken pagination.
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Fetch Gmail sent emails with pageToken pagination, a page at a time.
 
         Args:
             oauth_client: The OAuth client for Composio calls.
@@ -649,10 +825,10 @@ class PriorityEmailIngestion:
             integration_id: The user_integrations row ID for resilience wrapper.
             integration_type: The provider type for resilience wrapper.
 
-        Returns:
-            List of raw Gmail email dicts.
+        Yields:
+            Pages of raw Gmail email dicts, max_emails in total at most.
         """
-        all_emails: list[dict[str, Any]] = []
+        fetched = 0
         page_token: str | None = None
         page_num = 0
 
@@ -661,12 +837,12 @@ class PriorityEmailIngestion:
             user_id,
         )
 
-        while len(all_emails) < max_emails:
+        while fetched < max_emails:
             page_num += 1
             logger.info(
                 "EMAIL_BOOTSTRAP: Gmail page %d, fetched so far=%d",
                 page_num,
-                len(all_emails),
+                fetched,
             )
 
             params: dict[str, Any] = {
@@ -720,13 +896,15 @@ class PriorityEmailIngestion:
                 )
                 break
 
-            all_emails.extend(page_emails)
+            page_emails = page_emails[: max_emails - fetched]
+            fetched += len(page_emails)
             logger.info(
                 "EMAIL_BOOTSTRAP: Gmail page %d returned %d emails, total now %d",
                 page_num,
                 len(page_emails),
-                len(all_emails),
+                fetched,
             )
+            yield page_emails
 
             # Get next page token
             page_token = data.get("nextPageToken")
@@ -745,8 +923,6 @@ class PriorityEmailIngestion:
                 )
                 break
 
-        return all_emails[:max_emails]
-
     # ------------------------------------------------------------------
     # Provider-specific email normalization
     # ------------------------------------------------------------------
@@ -884,32 +1060,28 @@ class PriorityEmailIngestion:
         Returns:
             Up to max_contacts contacts sorted by interaction count (descending).
         """
-        contact_map: dict[str, EmailContact] = {}
-
-        for email in emails:
-            recipients = list(email.get("to", [])) + list(email.get("cc", []))
-            for r in recipients:
-                addr = r.lower() if isinstance(r, str) else r.get("email", "").lower()
-                name = r.get("name", "") if isinstance(r, dict) else ""
-
-                if addr not in contact_map:
-                    contact_map[addr] = EmailContact(
-                        email=addr,
-                        name=name or None,
-                        interaction_count=0,
-                        last_interaction=email.get("date"),
-                    )
+        aggregate = _SentMailAggregate()
+        aggregate.add(emails)
+        return await self._classify_ranked_contacts(
+            aggregate.ranked_contacts(), emails, max_contacts
+        )
 
-                contact_map[addr].interaction_count += 1
-                if email.get("date"):
-                    contact_map[addr].last_interaction = email["date"]
+    async def _classify_ranked_contacts(
+        self,
+        contacts: list[EmailContact],
+        emails: list[dict[str, Any]],
+        max_contacts: int = 100,
+    ) -> list[EmailContact]:
+        """Classify the top contacts and trim the list to max_contacts.
 
-        contacts = sorted(
-            contact_map.values(),
-            key=lambda c: c.interaction_count,
-            reverse=True,
-        )
+        Args:
+            contacts: Contacts sorted by interaction count (descending).
+            emails: Email corpus passed through to classification.
+            max_contacts: Maximum contacts to return.
 
+        Returns:
+            Up to max_contacts contacts, in the given order.
+        """
         # Classify top 30 contacts via LLM (increased for better coverage)
         top_contacts = contacts[:30]
         if top_contacts:
@@ -980,35 +1152,19 @@ class PriorityEmailIngestion:
         Returns:
             List of ActiveThread objects for threads with >= 3 messages.
         """
-        threads: dict[str, list[dict[str, Any]]] = {}
-        for email in emails:
-            thread_key = email.get("thread_id") or email.get("subject", "")
-            if not thread_key:
-                thread_key = email.get("subject", "")
-            if thread_key not in threads:
-                threads[thread_key] = []
-            threads[thread_key].append(email)
-
-        active: list[ActiveThread] = []
-        for _key, msgs in threads.items():
-            if len(msgs) >= 3:
-                participants: set[str] = set()
-                for m in msgs:
-                    for r in list(m.get("to", [])) + list(m.get("cc", [])):
-                        addr = r if isinstance(r, str) else r.get("email", "")
-                        if addr:
-                            participants.add(addr)
-
-                active.append(
-                    ActiveThread(
-                        subject=msgs[0].get("subject", ""),
-                        participants=list(participants),
-                        message_count=len(msgs),
-                        last_activity=msgs[-1].get("date", ""),
-                    )
-                )
+        aggregate = _SentMailAggregate()
+        aggregate.add(emails)
+        return await self._classify_active_threads(aggregate.active_threads())
 
-        # Classify top threads via LLM
+    async def _classify_active_threads(self, active: list[ActiveThread]) -> list[ActiveThread]:
+        """Classify the first 10 active threads via LLM.
+
+        Args:
+            active: Active threads, in the order they were first seen.
+
+        Returns:
+            The same threads, with thread_type set on the classified ones.
+        """
         if active[:10]:
             await self._classify_threads(active[:10])
 
@@ -1300,35 +1456,9 @@ class PriorityEmailIngestion:
         Returns:
             CommunicationPatterns with peak hours, days, and volume.
         """
-        hours: list[int] = []
-        days: list[str] = []
-        unique_dates: set[str] = set()
-
-        for email in emails:
-            date_str = email.get("date", "")
-            if not date_str:
-                continue
-            try:
-                dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                hours.append(dt.hour)
-                days.append(dt.strftime("%A"))
-                unique_dates.add(date_str[:10])
-            except (ValueError, TypeError):
-                pass
-
-        hour_counts = Counter(hours)
-        day_counts = Counter(days)
-
-        peak_hours = [h for h, _ in hour_counts.most_common(3)]
-        peak_days = [d for d, _ in day_counts.most_common(3)]
-
-        total_days = max(1, len(unique_dates))
-
-        return CommunicationPatterns(
-            peak_send_hours=peak_hours,
-            peak_send_days=peak_days,
-            emails_per_day_avg=round(len(emails) / total_days, 1),
-        )
+        aggregate = _SentMailAggregate()
+        aggregate.add(emails)
+        return aggregate.patterns()
 
     # ------------------------------------------------------------------
     # Storage helpers
@@ -1345,54 +1475,37 @@ class PriorityEmailIngestion:
             max_contacts: Maximum contacts to store.
         """
         contacts_to_store = contacts[:max_contacts]
-        stored_count = 0
-        failed_count = 0
-
-        for contact in contacts_to_store:
-            try:
-                result = self._db.table("memory_semantic").insert(
-                    {
-                        "user_id": user_id,
-                        "fact": (
-                            f"Contact: {contact.name or contact.email} "
-                            f"({contact.relationship_type}) - "
-                            f"{contact.interaction_count} interactions"
-                        ),
-                        "confidence": 0.85,
-                        "source": "email_bootstrap",
-                        "metadata": {
-                            "type": "contact",
-                            "email": contact.email,
-                            "name": contact.name,
-                            "company": contact.company,
-                            "title": contact.title,
-                            "relationship_type": contact.relationship_type,
-                            "interaction_count": contact.interaction_count,
-                        },
-                    }
-                ).execute()
-                if result.data:
-                    stored_count += 1
-                else:
-                    failed_count += 1
-                    logger.warning(
-                        "EMAIL_BOOTSTRAP: Contact insert returned no data for %s",
-                        contact.email,
-                    )
-            except Exception as e:
-                failed_count += 1
-                logger.warning(
-                    "EMAIL_BOOTSTRAP: Failed to store contact %s: %s",
-                    contact.email,
-                    e,
-                )
+        rows = [
+            {
+                "id": _bootstrap_fact_id(user_id, "contact", contact.email),
+                "user_id": user_id,
+                "fact": (
+                    f"Contact: {contact.name or contact.email} "
+                    f"({contact.relationship_type}) - "
+                    f"{contact.interaction_count} interactions"
+                ),
+                "confidence": 0.85,
+                "source": "email_bootstrap",
+                "metadata": {
+                    "type": "contact",
+                    "email": contact.email,
+                    "name": contact.name,
+                    "company": contact.company,
+                    "title": contact.title,
+                    "relationship_type": contact.relationship_type,
+                    "interaction_count": contact.interaction_count,
+                },
+            }
+            for contact in contacts_to_store
+        ]
+        stored_count = await self._upsert_semantic_facts(rows)
 
         logger.info(
             "EMAIL_BOOTSTRAP: Stored %d/%d contacts for user %s (%d failed)",
             stored_count,
             len(contacts_to_store),
             user_id,
-            failed_count,
+            len(contacts_to_store) - stored_count,
         )
 
     async def _store_threads(self, user_id: str, threads: list[ActiveThread]) -> None:
@@ -1405,29 +1518,68 @@ class PriorityEmailIngestion:
             user_id: Owner of the threads.
             threads: Active threads to filter and store.
         """
-        deal_threads = [t for t in threads if t.thread_type == "deal"]
-        for thread in deal_threads:
+        rows = [
+            {
+                "id": _bootstrap_fact_id(user_id, "active_deal", thread.key or thread.subject),
+                "user_id": user_id,
+                "fact": (
+                    f"Active deal thread: {thread.subject} "
+                    f"({thread.message_count} messages, "
+                    f"{len(thread.participants)} participants)"
+                ),
+                "confidence": 0.7,
+                "source": "email_bootstrap",
+                "metadata": {
+                    "type": "active_deal",
+                    "subject": thread.subject,
+                    "participants": thread.participants,
+                    "needs_user_confirmation": True,
+                },
+            }
+            for thread in threads
+            if thread.thread_type == "deal"
+        ]
+        await self._upsert_semantic_facts(rows)
+
+    async def _upsert_semantic_facts(self, rows: list[dict[str, Any]]) -> int:
+        """Upsert memory_semantic rows in chunks of EMAIL_BOOTSTRAP_UPSERT_BATCH_SIZE.
+
+        Rows carry a deterministic ``id``, so running the bootstrap again
+        updates the facts from the previous run instead of duplicating
+        them. A chunk that fails is retried row by row.
+
+        Args:
+            rows: memory_semantic rows, each with an ``id``.
+
+        Returns:
+            Number of rows stored.
+        """
+        stored = 0
+        batch_size = max(1, settings.EMAIL_BOOTSTRAP_UPSERT_BATCH_SIZE)
+        for i in range(0, len(rows), batch_size):
+            chunk = rows[i : i + batch_size]
             try:
-                self._db.table("memory_semantic").insert(
-                    {
-                        "user_id": user_id,
-                        "fact": (
-                            f"Active deal thread: {thread.subject} "
-                            f"({thread.message_count} messages, "
-                            f"{len(thread.participants)} participants)"
-                        ),
-                        "confidence": 0.7,
-                        "source": "email_bootstrap",
-                        "metadata": {
-                            "type": "active_deal",
-                            "subject": thread.subject,
-                            "participants": thread.participants,
-                            "needs_user_confirmation": True,
-                        },
-                    }
-                ).execute()
+                await execute_async(self._db.table("memory_semantic").upsert(chunk))
+                stored += len(chunk)
+                continue
             except Exception as e:
-                logger.warning("Failed to store thread: %s", e)
+                logger.warning(
+                    "EMAIL_BOOTSTRAP: Bulk upsert of %d facts failed, retrying one by one: %s",
+                    len(chunk),
+                    e,
+                )
+            for row in chunk:
+                try:
+                    await execute_async(self._db.table("memory_semantic").upsert(row))
+                    stored += 1
+                except Exception as e:
+                    logger.warning(
+                        "EMAIL_BOOTSTRAP: Failed to store %s fact %s: %s",
+                        row["metadata"].get("type"),
+                        row["id"],
+                        e,
+                    )
+        return stored
 
     async def _store_commitments(self, user_id: str, commitments: list[dict[str, Any]]) -> None:
         """Store detected commitments in Prospective Memory.
@@ -1676,6 +1828,7 @@ class PriorityEmailIngestion:
         status: str,
         result: EmailBootstrapResult | None = None,
         error_message: str | None = None,
+        progress: dict[str, Any] | None = None,
     ) -> None:
         """Store bootstrap status in onboarding_state metadata.
 
@@ -1686,6 +1839,7 @@ class PriorityEmailIngestion:
             status: Current status ("processing", "complete", "error").
             result: Bootstrap result (required when status is "complete").
             error_message: Error message (required when status is "error").
+            progress: Running counts while status is "processing".
         """
         try:
             # Build the status object
@@ -1708,14 +1862,15 @@ class PriorityEmailIngestion:
                 )
             elif status == "error" and error_message:
                 status_data["error_message"] = error_message
+            elif status == "processing" and progress:
+                status_data["progress"] = progress
 
             # Fetch current metadata
-            current = (
+            current = await execute_async(
                 self._db.table("onboarding_state")
                 .select("metadata")
                 .eq("user_id", user_id)
                 .limit(1)
-                .execute()
             )
 
             # Merge with existing metadata
@@ -1727,9 +1882,11 @@ class PriorityEmailIngestion:
             existing_metadata["email_bootstrap"] = status_data
 
             # Update the metadata
-            self._db.table("onboarding_state").update(
-                {"metadata": existing_metadata}
-            ).eq("user_id", user_id).execute()
+            await execute_async(
+                self._db.table("onboarding_state")
+                .update({"metadata": existing_metadata})
+                .eq("user_id", user_id)
+            )
 
             logger.info(
                 "EMAIL_BOOTSTRAP: Stored status '%s' for user %s", status, user_id
@@ -1369,7 +1369,7 @@ Respond ONLY with the JSON array, no additional text."""
 
             # Also store in Graphiti for temporal knowledge graph traversal
             try:
-                from src.db.graphiti import GraphitiClient
+                from src.db.graphiti import GraphitiClient, user_group_id
 
                 await GraphitiClient.add_episode(
                     name=f"causal_{hyp.premise[:40]}",
@@ -1379,6 +1379,7 @@ Respond ONLY with the JSON array, no additional text."""
                     ),
                     source_description="inferred_during_onboarding_enrichment",
                     reference_time=datetime.now(UTC),
+                    group_id=user_group_id(user_id),
                 )
             except Exception as e:
                 logger.warning(f"Failed to store hypothesis in Graphiti: {e}")
@@ -5,11 +5,14 @@ what skills can access it. Skills are treated as untrusted code
 until proven otherwise.
 """
 
+import functools
 import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from src.security.pattern_scanner import DIGIT, PatternScanner, ScanMatch
+
 
 class DataClass(Enum):
     """Data classification levels - determines what skills can access.
@@ -45,6 +48,65 @@ class ClassifiedData:
     retention_days: int | None = None
 
 
+@dataclass(frozen=True)
+class PatternRule:
+    """Handling rule for one sensitive-data pattern.
+
+    Attributes:
+        pattern: The regex from ``DataClassifier.PATTERNS``.
+        classification: The level the pattern belongs to.
+        data_type: Inferred data type (see ``DataClassifier._infer_data_type``).
+        can_be_tokenized: False for patterns that must always be redacted.
+    """
+
+    pattern: str
+    classification: DataClass
+    data_type: str
+    can_be_tokenized: bool
+
+
+# Most to least sensitive; the order classification and sanitization apply
+_SCAN_ORDER = (DataClass.REGULATED, DataClass.RESTRICTED, DataClass.CONFIDENTIAL)
+
+# Literals every match of each pattern must contain (see PatternScanner).
+# Patterns without an entry always run. Keep in sync with PATTERNS.
+_PATTERN_ANCHORS: dict[str, tuple[str, ...]] = {
+    r"\b\d{3}-\d{2}-\d{4}\b": (DIGIT,),
+    r"\b\d{9}\b": (DIGIT,),
+    r"\b(?:\d{4}[-\s]?){3}\d{4}\b": (DIGIT,),
+    r"\b\d{16}\b": (DIGIT,),
+    r"\bDOB\s*[:\-]?\s*\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}\b": ("dob",),
+    r"\b(?:diagnosis|prognosis|medication|prescription)\b": (
+        "diagnosis",
+        "prognosis",
+        "medication",
+        "prescription",
+    ),
+    r"\bpatient\s+(?:id|ID|number|#)\b": ("patient",),
+    r"\bmedical\s+record\b": ("medical",),
+    r"\bHIPAA\b": ("hipaa",),
+    r"\b(?:blood\s+type|HIV|AIDS|cancer\s+diagnosis)\b": ("blood", "hiv", "aids", "cancer"),
+    r"\$\s*[\d,]+\.?\d*\s*(?:M|K|million|thousand|B|billion)?": ("$",),
+    r"\brevenue\b": ("revenue",),
+    r"\bprofit(?:s|ability)?\b": ("profit",),
+    r"\bmargin\b": ("margin",),
+    r"\bcontract\s+value\b": ("contract",),
+    r"\bdeal\s+(?:size|value|amount)\b": ("deal",),
+    r"\bcompetitor\s+pricing\b": ("competitor",),
+    r"\bour\s+pricing\b": ("pricing",),
+    r"\bconfidential\b": ("confidential",),
+    r"\bproprietary\b": ("proprietary",),
+    r"\bNDA\b": ("nda",),
+    r"\btrade\s+secret\b": ("secret",),
+    r"\b[\w.+-]+@[\w-]+\.[\w.-]+\b": ("@",),
+    r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b": (DIGIT,),
+    r"\b\+\d{1,3}[-.\s]?\d{1,14}\b": ("+",),
+    r"\bcontact\s+(?:info|information|details)\b": ("contact",),
+    r"\bpersonal\s+(?:email|phone|address)\b": ("personal",),
+    r"\bextension\s*[:\-]?\s*\d+\b": ("extension",),
+}
+
+
 class DataClassifier:
     """Automatically classifies data based on content and context.
 
@@ -99,6 +161,32 @@ class DataClassifier:
         ],
     }
 
+    def __init__(self) -> None:
+        """Resolve a handling rule per pattern and compile the scanner."""
+        self._rules = [
+            PatternRule(
+                pattern=pattern,
+                classification=classification,
+                data_type=self._infer_data_type(pattern),
+                can_be_tokenized=self._can_be_tokenized(pattern),
+            )
+            for classification in _SCAN_ORDER
+            for pattern in self.PATTERNS.get(classification, [])
+        ]
+        self._scanner = _compile_scanner(tuple(rule.pattern for rule in self._rules))
+
+    def scan(self, text: str) -> list[tuple[PatternRule, ScanMatch]]:
+        """Every sensitive-pattern match in ``text``.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            ``(rule, match)`` pairs ordered from most to least sensitive
+            pattern, then by position. Matches may overlap.
+        """
+        return [(self._rules[m.index], m) for m in self._scanner.scan(text)]
+
     async def classify(self, data: Any, context: dict[str, Any]) -> ClassifiedData:
         """Classify data based on content patterns and context.
 
@@ -111,28 +199,35 @@ class DataClassifier:
             context: Context about the data source and type.
                 - source: Where this data came from (e.g., "crm", "user_input").
 
+        Returns:
+            ClassifiedData with appropriate classification and metadata.
+        """
+        return self.classify_value(data, context)
+
+    def classify_value(self, data: Any, context: dict[str, Any]) -> ClassifiedData:
+        """Synchronous ``classify`` for callers that walk large payloads.
+
+        Args:
+            data: The data to classify.
+            context: Context about the data source and type.
+
         Returns:
             ClassifiedData with appropriate classification and metadata.
         """
         # Convert data to string for pattern matching
         text = str(data) if data is not None else ""
 
-        # Check patterns from most to least sensitive
-        for classification in [
-            DataClass.REGULATED,
-            DataClass.RESTRICTED,
-            DataClass.CONFIDENTIAL,
-        ]:
-            patterns = self.PATTERNS.get(classification, [])
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    return ClassifiedData(
-                        data=data,
-                        classification=classification,
-                        data_type=self._infer_data_type(pattern),
-                        source=context.get("source", "unknown"),
-                        can_be_tokenized=self._can_be_tokenized(pattern),
-                    )
+        # Patterns are ordered from most to least sensitive
+        match = self._scanner.first(text)
+        if match is not None:
+            rule = self._rules[match.index]
+            return ClassifiedData(
+                data=data,
+                classification=rule.classification,
+                data_type=rule.data_type,
+                source=context.get("source", "unknown"),
+                can_be_tokenized=rule.can_be_tokenized,
+            )
 
         # Context-based classification fallback
         source = context.get("source", "unknown")
@@ -227,3 +322,12 @@ class DataClassifier:
             True if data can be tokenized, False if it must be redacted.
         """
         return pattern not in self.NON_TOKENIZABLE_PATTERNS
+
+
+@functools.cache
+def _compile_scanner(patterns: tuple[str, ...]) -> PatternScanner:
+    """Compile a pattern list once per process, not per classifier."""
+    return PatternScanner(
+        [(pattern, _PATTERN_ANCHORS.get(pattern, ())) for pattern in patterns],
+        flags=re.IGNORECASE,
+    )
@@ -17,6 +17,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
+from src.security.pattern_scanner import PatternScanner, splice
+
 logger = logging.getLogger(__name__)
 
 
@@ -143,6 +145,40 @@ INJECTION_PATTERNS: list[tuple[str, str]] = [
 ]
 
 
+# Literals every match of each pattern must contain (see PatternScanner).
+# Keep in sync when editing INJECTION_PATTERNS.
+_INJECTION_ANCHORS: dict[str, tuple[str, ...]] = {
+    "direct_instruction_override": ("ignore", "disregard", "forget"),
+    "identity_manipulation": ("you are now", "act as", "pretend to be", "switch to"),
+    "privilege_escalation": ("system", "admin", "root", "override"),
+    "data_exfiltration_command": ("export", "send", "transmit", "share"),
+    "security_bypass": ("disable", "turn off", "bypass"),
+    "injected_instruction": ("new ",),
+    "social_engineering_admin": ("administrator",),
+    "social_engineering_urgency": ("this is ",),
+    "social_engineering_authority": ("authorized by", "approved by"),
+    "social_engineering_compliance": ("purposes", "reasons"),
+    "data_exfiltration_append": ("append", "include", "add", "attach"),
+    "data_exfiltration_email": ("@",),
+    "data_exfiltration_url": ("http",),
+    "encoding_evasion": ("base64", "rot13", "hex", "unicode"),
+    "code_execution": ("(",),
+    "system_override": ("override",),
+    "privilege_escalation_grant": ("grant",),
+    "audit_disable": ("audit",),
+}
+
+_INJECTION_SCANNER = PatternScanner(
+    [(pattern, _INJECTION_ANCHORS[category]) for pattern, category in INJECTION_PATTERNS]
+)
+
+
+def _quarantine_marker(matched_text: str) -> str:
+    if len(matched_text) > 50:
+        return f"[SECURITY_QUARANTINED: {matched_text[:50]}...]"
+    return f"[SECURITY_QUARANTINED: {matched_text}]"
+
+
 @dataclass
 class DetectionResult:
     """Result of instruction detection scan.
@@ -219,7 +255,9 @@ class InstructionDetector:
     def detect_patterns(self, text: str) -> list[DetectionResult]:
         """Layer 1: Fast regex-based injection detection.
 
-        Scans text against all 18 known injection patterns.
+        Scans text against all 18 known injection patterns. Patterns are
+        compiled once, and a pattern only runs if one of its anchor
+        keywords appears in the text.
 
         Args:
             text: The text to scan for embedded instructions.
@@ -228,22 +266,23 @@ class InstructionDetector:
             List of DetectionResult for each pattern match found.
             Empty list if no patterns matched.
         """
-        results: list[DetectionResult] = []
+        matched_texts: dict[int, list[str]] = {}
+        for match in _INJECTION_SCANNER.scan(text):
+            matched_texts.setdefault(match.index, []).append(match.text)
 
-        for pattern, category in INJECTION_PATTERNS:
-            matches = list(re.finditer(pattern, text))
-            if matches:
-                matched_texts = [m.group() for m in matches]
-                results.append(
-                    DetectionResult(
-                        detected=True,
-                        patterns_matched=[category],
-                        matched_texts=matched_texts,
-                        confidence=0.7,
-                        scan_method="pattern",
-                        reason=f"Pattern match: {category} ({len(matches)} occurrence(s))",
-                    )
+        results: list[DetectionResult] = []
+        for index, texts in matched_texts.items():
+            category = INJECTION_PATTERNS[index][1]
+            results.append(
+                DetectionResult(
+                    detected=True,
+                    patterns_matched=[category],
+                    matched_texts=texts,
+                    confidence=0.7,
+                    scan_method="pattern",
+                    reason=f"Pattern match: {category} ({len(texts)} occurrence(s))",
                 )
+            )
 
         return results
 
@@ -401,13 +440,17 @@ class InstructionDetector:
         Returns:
             QuarantineRecord with sanitized text and audit information.
         """
+        # One pass over the text; longest fragments win where they overlap
+        fragments = sorted(set(detection_result.matched_texts), key=len, reverse=True)
         sanitized = text
-        for matched_text in detection_result.matched_texts:
-            sanitized = sanitized.replace(
-                matched_text,
-                f"[SECURITY_QUARANTINED: {matched_text[:50]}...]"
-                if len(matched_text) > 50
-                else f"[SECURITY_QUARANTINED: {matched_text}]",
+        if fragments:
+            needle = re.compile("|".join(re.escape(fragment) for fragment in fragments))
+            sanitized = splice(
+                text,
+                (
+                    (m.start(), m.end(), _quarantine_marker(m.group()))
+                    for m in needle.finditer(text)
+                ),
             )
 
         # If LLM detected but no specific text matches, flag the entire content
@@ -0,0 +1,160 @@
+"""Precompiled multi-pattern scanner for the security pipeline.
+
+Injection detection (``InstructionDetector``) and data classification
+(``DataClassifier`` / ``DataSanitizer``) both run a fixed list of regexes
+over every piece of external text on every tool call. ``PatternScanner``
+compiles such a list once and scans text in three steps:
+
+1. Fold the text once for case-insensitive keyword checks.
+2. Keep only the patterns whose anchors appear in it. An anchor is a
+   literal that every match of the pattern must contain, e.g. ``"@"`` for
+   an email address. Clean text usually rules out almost every pattern
+   this way, for the cost of a few substring searches.
+3. Run only the remaining compiled patterns.
+
+A single alternation of every pattern would be the textbook approach.
+Python's backtracking ``re`` engine, however, tries each alternative at
+every position, so a combined pattern is slower than the separate ones.
+The anchor prefilter gives the one-pass behaviour without that cost.
+
+``resolve_overlaps`` and ``splice`` then apply replacements in one pass
+instead of rebuilding the string once per match.
+"""
+
+import bisect
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+# Anchor meaning "any Unicode decimal digit" (what ``\d`` matches)
+DIGIT = r"\d"
+
+_ANY_DIGIT = re.compile(r"\d")
+
+# Non-ASCII characters that ``re.IGNORECASE`` matches against ASCII
+# letters (İ, ı, ſ, Kelvin sign). Folding them keeps the prefilter from
+# skipping a pattern that the regex itself would match.
+_IGNORECASE_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+
+@dataclass(frozen=True)
+class ScanMatch:
+    """One pattern match.
+
+    Attributes:
+        index: Position of the pattern in the scanner's pattern list
+            (lower is higher priority).
+        start: Match start offset in the scanned text.
+        end: Match end offset in the scanned text.
+        text: The matched text.
+    """
+
+    index: int
+    start: int
+    end: int
+    text: str
+
+
+class PatternScanner:
+    """A fixed, ordered set of regexes compiled once and prefiltered by anchors."""
+
+    def __init__(
+        self,
+        patterns: Sequence[tuple[str, Sequence[str]]],
+        flags: int = 0,
+    ) -> None:
+        """Compile the patterns.
+
+        Args:
+            patterns: ``(regex, anchors)`` pairs in priority order. Anchors
+                are literals (or ``DIGIT``), and every match of the regex
+                must contain at least one of them. Write letter anchors in
+                lowercase; they are compared case-insensitively. An empty
+                anchor list means the pattern always runs.
+            flags: ``re`` flags applied to every pattern.
+        """
+        self._compiled = [re.compile(pattern, flags) for pattern, _ in patterns]
+        self._anchors = [tuple(anchors) for _, anchors in patterns]
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def candidates(self, text: str) -> list[int]:
+        """Indexes of the patterns that could match ``text``, in priority order."""
+        folded = text.lower() if text.isascii() else text.translate(_IGNORECASE_FOLD).lower()
+        has_digit: bool | None = None
+        selected: list[int] = []
+        for index, anchors in enumerate(self._anchors):
+            if not anchors:
+                selected.append(index)
+                continue
+            for anchor in anchors:
+                if anchor == DIGIT:
+                    if has_digit is None:
+                        has_digit = _ANY_DIGIT.search(text) is not None
+                    if has_digit:
+                        break
+                elif anchor in folded:
+                    break
+            else:
+                continue
+            selected.append(index)
+        return selected
+
+    def scan(self, text: str) -> list[ScanMatch]:
+        """Every match of every pattern.
+
+        Matches are ordered by pattern priority, then by position. Matches
+        of different patterns may overlap.
+        """
+        return [
+            ScanMatch(index, m.start(), m.end(), m.group())
+            for index in self.candidates(text)
+            for m in self._compiled[index].finditer(text)
+        ]
+
+    def first(self, text: str) -> ScanMatch | None:
+        """The first match of the highest-priority pattern that matches at all."""
+        for index in self.candidates(text):
+            m = self._compiled[index].search(text)
+            if m is not None:
+                return ScanMatch(index, m.start(), m.end(), m.group())
+        return None
+
+
+def resolve_overlaps(matches: Iterable[ScanMatch]) -> list[ScanMatch]:
+    """Drop matches that overlap a higher-priority match.
+
+    Matches are considered in the order given (priority order for
+    ``PatternScanner.scan``). The first claim on a stretch of text wins,
+    as when each pattern's replacements were applied before the next
+    pattern ran.
+
+    Returns:
+        The kept matches, in the order given.
+    """
+    starts: list[int] = []
+    ends: list[int] = []
+    kept: list[ScanMatch] = []
+    for match in matches:
+        i = bisect.bisect_right(starts, match.start)
+        if i > 0 and ends[i - 1] > match.start:
+            continue
+        if i < len(starts) and starts[i] < match.end:
+            continue
+        starts.insert(i, match.start)
+        ends.insert(i, match.end)
+        kept.append(match)
+    return kept
+
+
+def splice(text: str, replacements: Iterable[tuple[int, int, str]]) -> str:
+    """Apply non-overlapping ``(start, end, replacement)`` edits in one pass."""
+    parts: list[str] = []
+    position = 0
+    for start, end, replacement in sorted(replacements):
+        parts.append(text[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
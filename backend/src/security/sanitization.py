@@ -2,13 +2,18 @@
 
 Tokenizes, redacts, and validates data based on skill trust levels
 before any data reaches external skills.
+
+Strings are scanned once by the classifier's precompiled pattern scanner
+and rewritten in a single splice pass. Nested payloads are walked
+iteratively, with no await per node.
 """
 
-import re
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
 from src.security.data_classification import ClassifiedData, DataClass, DataClassifier
+from src.security.pattern_scanner import resolve_overlaps, splice
 from src.security.trust_levels import SkillTrustLevel, can_access_data
 
 
@@ -73,9 +78,9 @@ class LeakageReport:
 class DataSanitizer:
     """Sanitizes data for skill execution based on trust levels."""
 
-    def __init__(self, classifier: DataClassifier) -> None:
-        """Initialize DataSanitizer with a classifier."""
-        self.classifier = classifier
+    def __init__(self, classifier: DataClassifier | None = None) -> None:
+        """Initialize DataSanitizer with a classifier (default: ``DataClassifier()``)."""
+        self.classifier = classifier or DataClassifier()
 
     async def classify_all(
         self, data: Any, context: dict[str, Any] | None = None
@@ -94,45 +99,29 @@ class DataSanitizer:
         """
         if context is None:
             context = {}
+        source = context.get("source", "unknown")
         results: list[ClassifiedData] = []
-        await self._classify_all_recursive(data, context, results)
-        return results
 
-    async def _classify_all_recursive(
-        self,
-        data: Any,
-        context: dict[str, Any],
-        results: list[ClassifiedData],
-    ) -> None:
-        """Recursively find all sensitive fragments."""
-        if isinstance(data, str):
-            for classification in [
-                DataClass.REGULATED,
-                DataClass.RESTRICTED,
-                DataClass.CONFIDENTIAL,
-            ]:
-                patterns = self.classifier.PATTERNS.get(classification, [])
-                for pattern in patterns:
-                    for match in re.finditer(pattern, data, re.IGNORECASE):
-                        results.append(
-                            ClassifiedData(
-                                data=match.group(),
-                                classification=classification,
-                                data_type=self.classifier._infer_data_type(pattern),
-                                source=context.get("source", "unknown"),
-                                can_be_tokenized=self.classifier._can_be_tokenized(pattern),
-                            )
-                        )
-        elif isinstance(data, dict):
-            for value in data.values():
-                await self._classify_all_recursive(value, context, results)
-        elif isinstance(data, list):
-            for item in data:
-                await self._classify_all_recursive(item, context, results)
-        elif data is not None:
-            classified = await self.classifier.classify(data, context)
-            if classified.classification not in (DataClass.PUBLIC, DataClass.INTERNAL):
-                results.append(classified)
+        def visit(value: Any) -> Any:
+            if isinstance(value, str):
+                results.extend(
+                    ClassifiedData(
+                        data=match.text,
+                        classification=rule.classification,
+                        data_type=rule.data_type,
+                        source=source,
+                        can_be_tokenized=rule.can_be_tokenized,
+                    )
+                    for rule, match in self.classifier.scan(value)
+                )
+            elif value is not None:
+                classified = self.classifier.classify_value(value, context)
+                if classified.classification not in (DataClass.PUBLIC, DataClass.INTERNAL):
+                    results.append(classified)
+            return value
+
+        _walk(data, visit)
+        return results
 
     def tokenize_value(self, value: Any, data_type: str, token_map: TokenMap) -> str:
         """Replace a sensitive value with a token."""
@@ -172,7 +161,7 @@ class DataSanitizer:
         context: dict[str, Any],
         token_map: TokenMap,
     ) -> Any:
-        """Recursively sanitize data structures.
+        """Sanitize a (possibly nested) data structure.
 
         Args:
             data: The data to sanitize.
@@ -183,28 +172,17 @@ class DataSanitizer:
         Returns:
             The sanitized data.
         """
-        if isinstance(data, str):
-            result, _ = await self._sanitize_string(data, skill_trust_level, context, token_map)
-            return result
-
-        if isinstance(data, dict):
-            return {
-                key: await self._sanitize_recursive(value, skill_trust_level, context, token_map)
-                for key, value in data.items()
-            }
-
-        if isinstance(data, list):
-            return [
-                await self._sanitize_recursive(item, skill_trust_level, context, token_map)
-                for item in data
-            ]
 
-        if data is None:
-            return None
+        def visit(value: Any) -> Any:
+            if isinstance(value, str):
+                return self._sanitize_text(value, skill_trust_level, context, token_map)
+            if value is None:
+                return None
+            classified = self.classifier.classify_value(value, context)
+            result, _ = self._handle_classified_data(classified, skill_trust_level, token_map)
+            return result
 
-        classified = await self.classifier.classify(data, context)
-        result, _ = self._handle_classified_data(classified, skill_trust_level, token_map)
-        return result
+        return _walk(data, visit)
 
     async def _sanitize_string(
         self,
@@ -224,36 +202,48 @@ class DataSanitizer:
         Returns:
             Tuple of (sanitized_string, token_map).
         """
-        result = text
-
-        # Check all patterns from most to least sensitive
-        for classification in [DataClass.REGULATED, DataClass.RESTRICTED, DataClass.CONFIDENTIAL]:
-            patterns = self.classifier.PATTERNS.get(classification, [])
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, result, re.IGNORECASE))
-                for match in reversed(matches):  # Reverse to preserve positions
-                    matched_text = match.group()
-                    data_type = self.classifier._infer_data_type(pattern)
-                    can_tokenize = self.classifier._can_be_tokenized(pattern)
-
-                    classified = ClassifiedData(
-                        data=matched_text,
-                        classification=classification,
-                        data_type=data_type,
-                        source=context.get("source", "unknown"),
-                        can_be_tokenized=can_tokenize,
-                    )
+        return self._sanitize_text(text, skill_trust_level, context, token_map), token_map
 
-                    has_access = can_access_data(skill_trust_level, classification)
-
-                    if has_access and can_tokenize:
-                        replacement = self.tokenize_value(matched_text, data_type, token_map)
-                    else:
-                        replacement = self.redact_value(classified)
+    def _sanitize_text(
+        self,
+        text: str,
+        skill_trust_level: SkillTrustLevel,
+        context: dict[str, Any],
+        token_map: TokenMap,
+    ) -> str:
+        """Replace every sensitive fragment of ``text`` in one pass.
 
-                    result = result[: match.start()] + replacement + result[match.end() :]
+        Where matches overlap, the more sensitive pattern wins. Tokens are
+        numbered pattern by pattern, last occurrence first, matching the
+        order replacements were historically applied in.
+        """
+        matches = self.classifier.scan(text)
+        if not matches:
+            return text
+
+        rules = {match.index: rule for rule, match in matches}
+        kept = resolve_overlaps(match for _, match in matches)
+        kept.sort(key=lambda match: (match.index, -match.start))
+
+        source = context.get("source", "unknown")
+        replacements: list[tuple[int, int, str]] = []
+        for match in kept:
+            rule = rules[match.index]
+            if rule.can_be_tokenized and can_access_data(skill_trust_level, rule.classification):
+                replacement = self.tokenize_value(match.text, rule.data_type, token_map)
+            else:
+                replacement = self.redact_value(
+                    ClassifiedData(
+                        data=match.text,
+                        classification=rule.classification,
+                        data_type=rule.data_type,
+                        source=source,
+                        can_be_tokenized=rule.can_be_tokenized,
+                    )
+                )
+            replacements.append((match.start, match.end, replacement))
 
-        return result, token_map
+        return splice(text, replacements)
 
     def _handle_classified_data(
         self,
@@ -375,3 +365,37 @@ class DataSanitizer:
             return " ".join(parts)
 
         return str(data) if data is not None else ""
+
+
+def _walk(data: Any, visit: Callable[[Any], Any]) -> Any:
+    """Rebuild nested dicts/lists with ``visit`` applied to every leaf.
+
+    Iterative (no recursion limit on deep payloads). Leaves are visited in
+    the same depth-first order as a recursive walk, so token numbering is
+    stable.
+    """
+    if not isinstance(data, (dict, list)):
+        return visit(data)
+
+    def children(container: dict[Any, Any] | list[Any]) -> Iterator[tuple[Any, Any]]:
+        return iter(container.items()) if isinstance(container, dict) else enumerate(container)
+
+    root: dict[Any, Any] | list[Any] = {} if isinstance(data, dict) else []
+    stack = [(children(data), root)]
+    while stack:
+        items, out = stack[-1]
+        entry = next(items, None)
+        if entry is None:
+            stack.pop()
+            continue
+        key, value = entry
+        if isinstance(value, (dict, list)):
+            child: Any = {} if isinstance(value, dict) else []
+            stack.append((children(value), child))
+        else:
+            child = visit(value)
+        if isinstance(out, dict):
+            out[key] = child
+        else:
+            out.append(child)
+    return root
@@ -18,6 +18,7 @@ from typing import Any
 import pyotp
 import qrcode
 
+from src.core.cache import invalidate_tags, user_tag
 from src.core.config import settings
 from src.core.exceptions import ARIAException, NotFoundError
 from src.db.supabase import SupabaseClient
@@ -592,6 +593,7 @@ class AccountService:
 
             # Delete user from Supabase Auth (cascades to user_profiles via ON DELETE CASCADE)
             self.client.auth.admin.delete_user(user_id)
+            invalidate_tags(user_tag(user_id))
 
             logger.info("Account deleted successfully", extra={"user_id": user_id})
 
@@ -10,6 +10,7 @@ from collections import Counter
 from datetime import UTC, datetime, timedelta
 from typing import Any, cast
 
+from src.core.ws import ws_manager
 from src.db.supabase import SupabaseClient
 
 logger = logging.getLogger(__name__)
@@ -128,7 +129,8 @@ class ActivityFeedService:
     ) -> list[dict[str, Any]]:
         """Get new activities since the given timestamp.
 
-        Designed for polling-based real-time updates (every 10s).
+        Fallback for clients without a WebSocket connection; connected
+        clients receive new activities as ``activity.new`` events.
 
         Args:
             user_id: The user's ID.
@@ -214,6 +216,15 @@ class ActivityFeedService:
                 "type": activity_type,
             },
         )
+
+        # Push to open feeds; /activity/poll remains the fallback
+        try:
+            await ws_manager.send_activity(user_id, activity)
+        except Exception:
+            logger.warning(
+                "Failed to push activity over WebSocket",
+                extra={"user_id": user_id, "activity_id": activity["id"]},
+            )
         return activity
 
     async def get_activity_stats(
@@ -7,6 +7,7 @@ filtering, pagination, and agent status overview.
 import logging
 from typing import Any, cast
 
+from src.core.ws import ws_manager
 from src.db.supabase import SupabaseClient
 
 logger = logging.getLogger(__name__)
@@ -75,6 +76,15 @@ class ActivityService:
                 "type": activity_type,
             },
         )
+
+        # Push to open feeds; /activity/poll remains the fallback
+        try:
+            await ws_manager.send_activity(user_id, activity)
+        except Exception:
+            logger.warning(
+                "Failed to push activity over WebSocket",
+                extra={"user_id": user_id, "activity_id": activity["id"]},
+            )
         return activity
 
     async def get_feed(
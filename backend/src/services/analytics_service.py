@@ -9,7 +9,7 @@ from collections import defaultdict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from src.core.cache import cached
+from src.core.cache import cached, user_method_tags
 from src.core.exceptions import DatabaseError
 from src.db.supabase import SupabaseClient
 
@@ -53,7 +53,7 @@ class AnalyticsService:
             self._client = SupabaseClient.get_client()
         return self._client
 
-    @cached(ttl=300, key_func=_analytics_cache_key)  # 5 minute TTL
+    @cached(ttl=300, key_func=_analytics_cache_key, tags=user_method_tags)  # 5 minute TTL
     async def get_overview_metrics(
         self,
         user_id: str,
@@ -190,7 +190,7 @@ class AnalyticsService:
             )
             raise DatabaseError(f"Failed to calculate overview metrics: {e}") from e
 
-    @cached(ttl=300, key_func=_analytics_cache_key)  # 5 minute TTL
+    @cached(ttl=300, key_func=_analytics_cache_key, tags=user_method_tags)  # 5 minute TTL
     async def get_conversion_funnel(
         self,
         user_id: str,
@@ -310,7 +310,7 @@ class AnalyticsService:
 
         return f"activity_trends:{user_id}:{start_str}:{end_str}:{granularity}"
 
-    @cached(ttl=300, key_func=_activity_trends_cache_key)  # 5 minute TTL
+    @cached(ttl=300, key_func=_activity_trends_cache_key, tags=user_method_tags)  # 5 minute TTL
     async def get_activity_trends(
         self,
         user_id: str,
@@ -416,7 +416,7 @@ class AnalyticsService:
             )
             raise DatabaseError(f"Failed to calculate activity trends: {e}") from e
 
-    @cached(ttl=300, key_func=_analytics_cache_key)  # 5 minute TTL
+    @cached(ttl=300, key_func=_analytics_cache_key, tags=user_method_tags)  # 5 minute TTL
     async def get_response_time_metrics(
         self,
         user_id: str,
@@ -520,7 +520,7 @@ class AnalyticsService:
                 f"Failed to calculate response time metrics: {e}"
             ) from e
 
-    @cached(ttl=300, key_func=_analytics_cache_key)  # 5 minute TTL
+    @cached(ttl=300, key_func=_analytics_cache_key, tags=user_method_tags)  # 5 minute TTL
     async def get_aria_impact_summary(
         self,
         user_id: str,
@@ -680,7 +680,7 @@ class AnalyticsService:
                 extra={"user_id": user_id},
             )
 
-    @cached(ttl=300, key_func=lambda *args, **kwargs: f"comms_analytics:{args[1] if len(args) > 1 else kwargs.get('user_id', '')}:{args[2] if len(args) > 2 else kwargs.get('days_back', 7)}")
+    @cached(ttl=300, key_func=lambda *args, **kwargs: f"comms_analytics:{args[1] if len(args) > 1 else kwargs.get('user_id', '')}:{args[2] if len(args) > 2 else kwargs.get('days_back', 7)}", tags=user_method_tags)
     async def get_communications_analytics(
         self,
         user_id: str,
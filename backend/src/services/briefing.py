@@ -17,7 +17,7 @@ from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel
 
-from src.core.cache import cached
+from src.core.cache import cached, user_method_tags
 from src.core.llm import LLMClient
 from src.core.task_types import TaskType
 from src.core.persona import PersonaBuilder, PersonaRequest
@@ -744,7 +744,7 @@ class BriefingService:
         date_str = briefing_date.isoformat() if briefing_date else date.today().isoformat()
         return f"briefing:{user_id}:{date_str}"
 
-    @cached(ttl=3600, key_func=_briefing_cache_key)  # 1 hour TTL
+    @cached(ttl=3600, key_func=_briefing_cache_key, tags=user_method_tags)  # 1 hour TTL
     async def get_or_generate_briefing(
         self, user_id: str, briefing_date: date | None = None
     ) -> dict[str, Any]:
@@ -13,6 +13,7 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+from src.core.cache import invalidate_tags, user_tag
 from src.core.exceptions import NotFoundError
 from src.db.supabase import SupabaseClient
 from src.services.account_service import AccountService
@@ -419,6 +420,9 @@ class ComplianceService:
                 metadata=summary["summary"],
             )
 
+            # Drop everything cached from the deleted data
+            invalidate_tags(user_tag(user_id))
+
             logger.info("User data deleted for %s", user_id, extra=summary["summary"])
             return summary
 
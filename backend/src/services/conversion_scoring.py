@@ -2,18 +2,26 @@
 
 This service calculates conversion probability for leads using a weighted
 logistic regression on nine normalized features extracted from lead memory data.
+
+Batch scoring loads each source table once for all of a user's active leads,
+groups the rows per lead in memory, and scores the leads as arrays. The
+per-feature math is shared with the single-lead path, so both give the same
+results.
 """
 
+import asyncio
 import logging
-import math
+from collections import defaultdict
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from src.core.cache import cached
-from src.db.supabase import SupabaseClient
+from src.db.supabase import SupabaseClient, execute_async
 from src.models.lead_memory import LeadStatus
 from src.services.activity_service import ActivityService
 
@@ -43,6 +51,169 @@ STAGE_EXPECTED_DAYS: dict[str, int] = {
 # Staleness threshold in hours
 STALENESS_THRESHOLD_HOURS = 24
 
+# Stakeholder roles that count toward stakeholder depth
+_DEPTH_ROLES = ("decision_maker", "champion", "influencer")
+
+# Batch scoring: lead IDs per in_() filter (URL length) and rows per page
+_BATCH_LEAD_CHUNK = 200
+_BATCH_PAGE_SIZE = 1000
+# Rows per bulk score write-back / prediction insert
+_BATCH_WRITE_CHUNK = 500
+
+
+def _weighted_scores(features: np.ndarray) -> np.ndarray:
+    """Raw weighted score per row of a (leads x FEATURE_WEIGHTS) matrix.
+
+    Accumulates column by column in FEATURE_WEIGHTS order so every row sums
+    in the same order as a scalar ``sum`` would.
+    """
+    raw = np.zeros(features.shape[0])
+    for column, weight in enumerate(FEATURE_WEIGHTS.values()):
+        raw = raw + features[:, column] * weight
+    return raw
+
+
+def _logistic(raw_scores: np.ndarray) -> np.ndarray:
+    """Logistic transform to a 0-100 probability, centered at 0.5, steepness 10."""
+    return 100 / (1 + np.exp(-10 * (raw_scores - 0.5)))
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _sort_key(column: str) -> Callable[[dict[str, Any]], datetime]:
+    """Sort key on a timestamp column; rows without one sort first."""
+    floor = datetime.min.replace(tzinfo=UTC)
+    return lambda row: _parse_timestamp(row[column]) if row.get(column) else floor
+
+
+def _stakeholder_depth(stakeholders: list[dict[str, Any]]) -> float:
+    """Normalized stakeholder depth from decision_maker/champion/influencer rows."""
+    if not stakeholders:
+        return 0.0
+
+    # Sum of influence levels
+    total_influence = sum(s.get("influence_level", 5) for s in stakeholders)
+    max_possible = len(stakeholders) * 10
+
+    return min(total_influence / max_possible, 1.0) if max_possible > 0 else 0.0
+
+
+def _avg_response_time(events: list[dict[str, Any]]) -> float:
+    """Normalized average reply time from email events in time order."""
+    if len(events) < 2:
+        # No data - return neutral, but this affects confidence
+        return 0.5
+
+    # Calculate response times (inbound after outbound)
+    response_times: list[float] = []
+    last_outbound: datetime | None = None
+
+    for event in events:
+        occurred_at = _parse_timestamp(event["occurred_at"])
+
+        if event["event_type"] == "email_sent" and event.get("direction") == "outbound":
+            last_outbound = occurred_at
+        elif (
+            event["event_type"] == "email_received"
+            and event.get("direction") == "inbound"
+            and last_outbound
+        ):
+            delta_hours = (occurred_at - last_outbound).total_seconds() / 3600
+            if delta_hours > 0:
+                response_times.append(delta_hours)
+            last_outbound = None
+
+    if not response_times:
+        return 0.5
+
+    avg_hours = sum(response_times) / len(response_times)
+    # Normalize: under 72 hours = positive, instant = 1.0
+    return max(0.0, 1.0 - min(avg_hours / 72, 1.0))
+
+
+def _sentiment(stakeholders: list[dict[str, Any]], video_sessions: list[dict[str, Any]]) -> float:
+    """Stakeholder sentiment blended 70/30 with recent video engagement."""
+    if not stakeholders:
+        stakeholder_score = 0.5
+    else:
+        positive = sum(1 for s in stakeholders if s.get("sentiment") == "positive")
+        negative = sum(1 for s in stakeholders if s.get("sentiment") == "negative")
+        total = len(stakeholders)
+
+        # Net sentiment score (-1 to +1), then normalize to 0-1
+        net_sentiment = (positive - negative) / total if total > 0 else 0
+        stakeholder_score = (net_sentiment + 1) / 2
+
+    engagement_scores = [
+        session["perception_analysis"]["engagement_score"]
+        for session in video_sessions
+        if isinstance(session.get("perception_analysis"), dict)
+        and isinstance(session["perception_analysis"].get("engagement_score"), (int, float))
+    ]
+
+    if engagement_scores:
+        avg_video_engagement = sum(engagement_scores) / len(engagement_scores)
+        return stakeholder_score * 0.7 + avg_video_engagement * 0.3
+
+    return stakeholder_score
+
+
+def _health_trend(history: list[dict[str, Any]]) -> float:
+    """Normalized slope of health scores in time order."""
+    if len(history) < 2:
+        return 0.5
+
+    # Simple linear regression for slope
+    scores = [h["score"] for h in history]
+    n = len(scores)
+
+    # Calculate slope: sum((x - x_mean) * (y - y_mean)) / sum((x - x_mean)^2)
+    x_mean = (n - 1) / 2
+    y_mean = sum(scores) / n
+
+    numerator = sum((i - x_mean) * (scores[i] - y_mean) for i in range(n))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+
+    if denominator == 0:
+        return 0.5
+
+    slope = numerator / denominator
+
+    # Normalize: slope of ~2 points per day = improving fast
+    # 0.5 + (slope * 0.05) with slope in points per day
+    normalized = 0.5 + (slope * 0.05)
+    return max(0.0, min(1.0, normalized))
+
+
+def _commitment_rates(insights: list[dict[str, Any]]) -> tuple[float, float]:
+    """(theirs, ours) fulfillment rates from commitment insights, 0.5 if none."""
+    theirs_total = 0
+    theirs_fulfilled = 0
+    ours_total = 0
+    ours_fulfilled = 0
+
+    for insight in insights:
+        metadata = insight.get("metadata") or {}
+        direction = metadata.get("direction", "theirs")
+        addressed = insight.get("addressed_at") is not None
+
+        if direction == "theirs":
+            theirs_total += 1
+            if addressed:
+                theirs_fulfilled += 1
+        else:
+            ours_total += 1
+            if addressed:
+                ours_fulfilled += 1
+
+    # Default to 0.5 (neutral) if no commitments
+    theirs_rate = theirs_fulfilled / theirs_total if theirs_total > 0 else 0.5
+    ours_rate = ours_fulfilled / ours_total if ours_total > 0 else 0.5
+
+    return theirs_rate, ours_rate
+
 
 def _conversion_score_cache_key(*args: Any, **kwargs: Any) -> str:
     """Generate cache key for conversion scoring.
@@ -285,7 +456,9 @@ class ConversionScoringService:
         """Score all active leads for a user.
 
         Updates lead_memories.metadata['conversion_score'] for each lead
-        and creates prediction records for accuracy tracking.
+        and creates prediction records for accuracy tracking. Source tables
+        are read once for all leads and scores are written back in bulk;
+        if the batch load fails, leads are scored one at a time instead.
 
         Args:
             user_id: The user's ID.
@@ -296,34 +469,23 @@ class ConversionScoringService:
         start_time = datetime.now(UTC)
 
         # Fetch all active leads
-        result = (
+        result = await execute_async(
             self._db.table("lead_memories")
-            .select("id")
+            .select("*")
             .eq("user_id", str(user_id))
             .eq("status", LeadStatus.ACTIVE.value)
-            .execute()
         )
 
         leads = result.data or []
-        scored = 0
-        errors: list[dict[str, Any]] = []
 
-        for lead in leads:
-            try:
-                await self.calculate_conversion_score(lead["id"], force_refresh=True)
-                scored += 1
-            except ScoringError as e:
-                errors.append({"lead_id": lead["id"], "error": str(e)})
-                logger.warning(
-                    "Failed to score lead in batch",
-                    extra={"lead_id": lead["id"], "error": str(e)},
-                )
-            except Exception as e:
-                errors.append({"lead_id": lead["id"], "error": f"Unexpected error: {e}"})
-                logger.exception(
-                    "Unexpected error scoring lead",
-                    extra={"lead_id": lead["id"]},
-                )
+        try:
+            scored, errors = await self._score_leads_batch(leads)
+        except Exception:
+            logger.exception(
+                "Batch feature load failed, scoring leads individually",
+                extra={"user_id": str(user_id), "leads": len(leads)},
+            )
+            scored, errors = await self._score_leads_individually(leads)
 
         duration = (datetime.now(UTC) - start_time).total_seconds()
 
@@ -357,6 +519,88 @@ class ConversionScoringService:
 
         return BatchScoreResult(scored=scored, errors=errors, duration_seconds=duration)
 
+    async def _score_leads_individually(
+        self, leads: list[dict[str, Any]]
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Score leads one at a time through calculate_conversion_score."""
+        scored = 0
+        errors: list[dict[str, Any]] = []
+
+        for lead in leads:
+            try:
+                await self.calculate_conversion_score(lead["id"], force_refresh=True)
+                scored += 1
+            except ScoringError as e:
+                errors.append({"lead_id": lead["id"], "error": str(e)})
+                logger.warning(
+                    "Failed to score lead in batch",
+                    extra={"lead_id": lead["id"], "error": str(e)},
+                )
+            except Exception as e:
+                errors.append({"lead_id": lead["id"], "error": f"Unexpected error: {e}"})
+                logger.exception(
+                    "Unexpected error scoring lead",
+                    extra={"lead_id": lead["id"]},
+                )
+
+        return scored, errors
+
+    async def _score_leads_batch(
+        self, leads: list[dict[str, Any]]
+    ) -> tuple[int, list[dict[str, Any]]]:
+        """Score leads from one load per source table, with bulk write-back.
+
+        Args:
+            leads: Full lead_memories rows.
+
+        Returns:
+            Tuple of (number scored, per-lead errors).
+        """
+        if not leads:
+            return 0, []
+
+        features_by_lead, errors = await self._calculate_features_batch(leads, datetime.now(UTC))
+        scored_leads = [lead for lead in leads if lead["id"] in features_by_lead]
+        if not scored_leads:
+            return 0, errors
+
+        matrix = np.array(
+            [[features_by_lead[lead["id"]][name] for name in FEATURE_WEIGHTS] for lead in scored_leads],
+            dtype=np.float64,
+        )
+        probabilities = _logistic(_weighted_scores(matrix))
+
+        calculated_at = datetime.now(UTC)
+        scores: list[ConversionScore] = []
+        for lead, probability in zip(scored_leads, probabilities.tolist(), strict=True):
+            feature_values = features_by_lead[lead["id"]]
+            confidence = self._calculate_confidence(feature_values, lead)
+            if self._is_new_lead(lead):
+                confidence *= 0.5
+            scores.append(
+                ConversionScore(
+                    lead_memory_id=UUID(str(lead["id"])),
+                    conversion_probability=round(probability, 1),
+                    confidence=round(confidence, 3),
+                    feature_values=feature_values,
+                    feature_importance={
+                        name: value * FEATURE_WEIGHTS[name]
+                        for name, value in feature_values.items()
+                        if name in FEATURE_WEIGHTS
+                    },
+                    calculated_at=calculated_at,
+                )
+            )
+
+        await self._cache_scores_bulk(scores)
+        await self._create_prediction_records_bulk(scored_leads, scores)
+
+        logger.info(
+            "Calculated conversion scores in batch",
+            extra={"leads": len(leads), "scored": len(scores), "errors": len(errors)},
+        )
+        return len(scores), errors
+
     # === Feature Calculation Methods ===
 
     async def _calculate_all_features(self, lead: dict[str, Any]) -> dict[str, float]:
@@ -386,6 +630,147 @@ class ConversionScoringService:
             "commitment_fulfillment_ours": commit_ours,
         }
 
+    async def _calculate_features_batch(
+        self, leads: list[dict[str, Any]], now: datetime
+    ) -> tuple[dict[str, dict[str, float]], list[dict[str, Any]]]:
+        """Calculate all nine features for many leads from one load per table.
+
+        Each source table is read once (``in_`` on the lead IDs, paged) and
+        grouped per lead; per-lead values use the same helpers as the
+        single-lead methods, and count-based features are computed as arrays.
+
+        Returns:
+            Tuple of (lead ID -> feature values, per-lead errors).
+        """
+        lead_ids = [str(lead["id"]) for lead in leads]
+        thirty_days_ago = (now - timedelta(days=30)).isoformat()
+        sixty_days_ago = (now - timedelta(days=60)).isoformat()
+
+        events, stakeholders, videos, history, debriefs, insights = await asyncio.gather(
+            self._fetch_grouped(
+                "lead_memory_events",
+                "id, lead_memory_id, event_type, direction, occurred_at",
+                lead_ids,
+                lambda q: q.gte("occurred_at", thirty_days_ago),
+            ),
+            self._fetch_grouped(
+                "lead_memory_stakeholders",
+                "id, lead_memory_id, role, influence_level, sentiment",
+                lead_ids,
+            ),
+            self._fetch_grouped(
+                "video_sessions",
+                "id, lead_id, perception_analysis, created_at",
+                lead_ids,
+                lambda q: q.eq("status", "ended"),
+                lead_column="lead_id",
+            ),
+            self._fetch_grouped(
+                "health_score_history",
+                "id, lead_memory_id, score, calculated_at",
+                lead_ids,
+                lambda q: q.gte("calculated_at", thirty_days_ago),
+            ),
+            self._fetch_grouped(
+                "debriefs",
+                "id, lead_memory_id",
+                lead_ids,
+                lambda q: q.gte("created_at", sixty_days_ago),
+            ),
+            self._fetch_grouped(
+                "lead_memory_insights",
+                "id, lead_memory_id, metadata, addressed_at",
+                lead_ids,
+                lambda q: q.eq("insight_type", "commitment"),
+            ),
+        )
+
+        # Count-based features as arrays (20+ interactions / 4+ meetings = 1.0)
+        engagement = np.minimum(
+            np.array([len(events.get(i, [])) for i in lead_ids], dtype=np.float64) / 20, 1.0
+        )
+        meetings = np.minimum(
+            np.array([len(debriefs.get(i, [])) for i in lead_ids], dtype=np.float64) / 4, 1.0
+        )
+
+        features_by_lead: dict[str, dict[str, float]] = {}
+        errors: list[dict[str, Any]] = []
+        for index, (lead_id, lead) in enumerate(zip(lead_ids, leads, strict=True)):
+            try:
+                lead_events = sorted(
+                    (
+                        e
+                        for e in events.get(lead_id, [])
+                        if e["event_type"] in ("email_sent", "email_received")
+                    ),
+                    key=_sort_key("occurred_at"),
+                )
+                lead_stakeholders = stakeholders.get(lead_id, [])
+                recent_videos = sorted(
+                    videos.get(lead_id, []),
+                    key=_sort_key("created_at"),
+                    reverse=True,
+                )[:5]
+                lead_history = sorted(
+                    history.get(lead_id, []),
+                    key=_sort_key("calculated_at"),
+                )
+                commit_theirs, commit_ours = _commitment_rates(insights.get(lead_id, []))
+
+                features_by_lead[lead_id] = {
+                    "engagement_frequency": float(engagement[index]),
+                    "stakeholder_depth": _stakeholder_depth(
+                        [s for s in lead_stakeholders if s.get("role") in _DEPTH_ROLES]
+                    ),
+                    "avg_response_time": _avg_response_time(lead_events),
+                    "sentiment_trend": _sentiment(lead_stakeholders, recent_videos),
+                    "stage_velocity": self._calculate_stage_velocity(lead),
+                    "health_score_trend": _health_trend(lead_history),
+                    "meeting_frequency": float(meetings[index]),
+                    "commitment_fulfillment_theirs": commit_theirs,
+                    "commitment_fulfillment_ours": commit_ours,
+                }
+            except Exception as e:
+                logger.warning(
+                    "Error calculating features",
+                    extra={"lead_id": lead_id, "error": str(e)},
+                )
+                errors.append({"lead_id": lead_id, "error": f"Feature calculation failed: {e}"})
+
+        return features_by_lead, errors
+
+    async def _fetch_grouped(
+        self,
+        table: str,
+        columns: str,
+        lead_ids: list[str],
+        apply_filters: Callable[[Any], Any] | None = None,
+        lead_column: str = "lead_memory_id",
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Read every matching row for the given leads and group it by lead.
+
+        Lead IDs go into ``in_`` filters in chunks, and each chunk is paged
+        in id order so no rows are dropped at the PostgREST row limit.
+        """
+        grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for start in range(0, len(lead_ids), _BATCH_LEAD_CHUNK):
+            chunk = lead_ids[start : start + _BATCH_LEAD_CHUNK]
+            offset = 0
+            while True:
+                query = self._db.table(table).select(columns).in_(lead_column, chunk)
+                if apply_filters is not None:
+                    query = apply_filters(query)
+                result = await execute_async(
+                    query.order("id").range(offset, offset + _BATCH_PAGE_SIZE - 1)
+                )
+                rows = result.data or []
+                for row in rows:
+                    grouped[str(row[lead_column])].append(row)
+                if len(rows) < _BATCH_PAGE_SIZE:
+                    break
+                offset += _BATCH_PAGE_SIZE
+        return grouped
+
     async def _calculate_engagement_frequency(self, lead_id: str, now: datetime) -> float:
         """Calculate normalized engagement frequency (events in last 30 days)."""
         thirty_days_ago = (now - timedelta(days=30)).isoformat()
@@ -408,20 +793,11 @@ class ConversionScoringService:
             self._db.table("lead_memory_stakeholders")
             .select("role, influence_level")
             .eq("lead_memory_id", lead_id)
-            .in_("role", ["decision_maker", "champion", "influencer"])
+            .in_("role", list(_DEPTH_ROLES))
             .execute()
         )
 
-        stakeholders = result.data or []
-
-        if not stakeholders:
-            return 0.0
-
-        # Sum of influence levels
-        total_influence = sum(s.get("influence_level", 5) for s in stakeholders)
-        max_possible = len(stakeholders) * 10
-
-        return min(total_influence / max_possible, 1.0) if max_possible > 0 else 0.0
+        return _stakeholder_depth(result.data or [])
 
     async def _calculate_avg_response_time(self, lead_id: str, now: datetime) -> float:
         """Calculate normalized average response time for email replies."""
@@ -438,37 +814,7 @@ class ConversionScoringService:
             .execute()
         )
 
-        events = result.data or []
-
-        if len(events) < 2:
-            # No data - return neutral, but this affects confidence
-            return 0.5
-
-        # Calculate response times (inbound after outbound)
-        response_times: list[float] = []
-        last_outbound: datetime | None = None
-
-        for event in events:
-            occurred_at = datetime.fromisoformat(event["occurred_at"].replace("Z", "+00:00"))
-
-            if event["event_type"] == "email_sent" and event.get("direction") == "outbound":
-                last_outbound = occurred_at
-            elif (
-                event["event_type"] == "email_received"
-                and event.get("direction") == "inbound"
-                and last_outbound
-            ):
-                delta_hours = (occurred_at - last_outbound).total_seconds() / 3600
-                if delta_hours > 0:
-                    response_times.append(delta_hours)
-                last_outbound = None
-
-        if not response_times:
-            return 0.5
-
-        avg_hours = sum(response_times) / len(response_times)
-        # Normalize: under 72 hours = positive, instant = 1.0
-        return max(0.0, 1.0 - min(avg_hours / 72, 1.0))
+        return _avg_response_time(result.data or [])
 
     async def _calculate_sentiment_trend(self, lead_id: str, _now: datetime) -> float:
         """Calculate normalized sentiment trend over 30 days.
@@ -490,18 +836,6 @@ class ConversionScoringService:
 
         # For trend, we'd need historical sentiment data
         # Since we don't have a sentiment history table, calculate current state
-        stakeholders = current_result.data or []
-
-        if not stakeholders:
-            stakeholder_score = 0.5
-        else:
-            positive = sum(1 for s in stakeholders if s.get("sentiment") == "positive")
-            negative = sum(1 for s in stakeholders if s.get("sentiment") == "negative")
-            total = len(stakeholders)
-
-            # Net sentiment score (-1 to +1), then normalize to 0-1
-            net_sentiment = (positive - negative) / total if total > 0 else 0
-            stakeholder_score = (net_sentiment + 1) / 2
 
         # Fetch recent video session engagement for this lead
         video_result = (
@@ -514,21 +848,7 @@ class ConversionScoringService:
             .execute()
         )
 
-        video_sessions = video_result.data or []
-        engagement_scores = [
-            session["perception_analysis"]["engagement_score"]
-            for session in video_sessions
-            if isinstance(session.get("perception_analysis"), dict)
-            and isinstance(
-                session["perception_analysis"].get("engagement_score"), (int, float)
-            )
-        ]
-
-        if engagement_scores:
-            avg_video_engagement = sum(engagement_scores) / len(engagement_scores)
-            return stakeholder_score * 0.7 + avg_video_engagement * 0.3
-
-        return stakeholder_score
+        return _sentiment(current_result.data or [], video_result.data or [])
 
     def _calculate_stage_velocity(self, lead: dict[str, Any]) -> float:
         """Calculate normalized stage velocity (time in stage vs expected)."""
@@ -564,34 +884,7 @@ class ConversionScoringService:
             .execute()
         )
 
-        history = result.data or []
-
-        if len(history) < 2:
-            return 0.5
-
-        # Simple linear regression for slope
-        scores = [h["score"] for h in history]
-        n = len(scores)
-
-        if n < 2:
-            return 0.5
-
-        # Calculate slope: sum((x - x_mean) * (y - y_mean)) / sum((x - x_mean)^2)
-        x_mean = (n - 1) / 2
-        y_mean = sum(scores) / n
-
-        numerator = sum((i - x_mean) * (scores[i] - y_mean) for i in range(n))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
-            return 0.5
-
-        slope = numerator / denominator
-
-        # Normalize: slope of ~2 points per day = improving fast
-        # 0.5 + (slope * 0.05) with slope in points per day
-        normalized = 0.5 + (slope * 0.05)
-        return max(0.0, min(1.0, normalized))
+        return _health_trend(result.data or [])
 
     async def _calculate_meeting_frequency(self, lead_id: str, now: datetime) -> float:
         """Calculate normalized meeting frequency (debriefs in last 60 days)."""
@@ -623,45 +916,19 @@ class ConversionScoringService:
             .execute()
         )
 
-        insights = result.data or []
-
-        theirs_total = 0
-        theirs_fulfilled = 0
-        ours_total = 0
-        ours_fulfilled = 0
-
-        for insight in insights:
-            metadata = insight.get("metadata") or {}
-            direction = metadata.get("direction", "theirs")
-            addressed = insight.get("addressed_at") is not None
-
-            if direction == "theirs":
-                theirs_total += 1
-                if addressed:
-                    theirs_fulfilled += 1
-            else:
-                ours_total += 1
-                if addressed:
-                    ours_fulfilled += 1
-
-        # Default to 0.5 (neutral) if no commitments
-        theirs_rate = theirs_fulfilled / theirs_total if theirs_total > 0 else 0.5
-        ours_rate = ours_fulfilled / ours_total if ours_total > 0 else 0.5
-
-        return theirs_rate, ours_rate
+        return _commitment_rates(result.data or [])
 
     # === Helper Methods ===
 
     def _calculate_weighted_score(self, feature_values: dict[str, float]) -> float:
         """Calculate raw weighted score from normalized features."""
-        return sum(
-            feature_values.get(name, 0.5) * weight for name, weight in FEATURE_WEIGHTS.items()
-        )
+        row = [feature_values.get(name, 0.5) for name in FEATURE_WEIGHTS]
+        return float(_weighted_scores(np.array([row], dtype=np.float64))[0])
 
     def _logistic_transform(self, raw_score: float) -> float:
         """Apply logistic transformation to get probability."""
-        # Centered at 0.5, steepness factor of 10
-        return 100 / (1 + math.exp(-10 * (raw_score - 0.5)))
+        # Same array code as batch scoring, so both paths round identically
+        return float(_logistic(np.array([raw_score], dtype=np.float64))[0])
 
     def _calculate_confidence(
         self, feature_values: dict[str, float], _lead: dict[str, Any]
@@ -768,27 +1035,68 @@ class ConversionScoringService:
 
         self._db.table("lead_memories").update({"metadata": metadata}).eq("id", lead_id).execute()
 
+    async def _cache_scores_bulk(self, scores: list[ConversionScore]) -> None:
+        """Write many scores into lead metadata with set-based RPC calls.
+
+        The RPC merges ``conversion_score`` into the existing metadata
+        server-side, so other metadata keys are never overwritten.
+        """
+        rows = []
+        for score in scores:
+            payload = score.model_dump(mode="json")
+            payload["calculated_at"] = score.calculated_at.isoformat()
+            rows.append({"id": str(score.lead_memory_id), "conversion_score": payload})
+
+        for start in range(0, len(rows), _BATCH_WRITE_CHUNK):
+            await execute_async(
+                self._db.rpc(
+                    "bulk_set_lead_conversion_scores",
+                    {"p_rows": rows[start : start + _BATCH_WRITE_CHUNK]},
+                )
+            )
+
+    @staticmethod
+    def _prediction_record(lead: dict[str, Any], score: ConversionScore) -> dict[str, Any]:
+        """Build the predictions row tracking a score's accuracy."""
+        return {
+            "user_id": lead.get("user_id"),
+            "prediction_type": "deal_outcome",
+            "prediction_text": f"{lead.get('company_name', 'Lead')} will convert",
+            "predicted_outcome": "won",
+            "confidence": score.confidence,
+            "context": {
+                "lead_memory_id": str(score.lead_memory_id),
+                "conversion_probability": score.conversion_probability,
+                "feature_values": score.feature_values,
+            },
+            "expected_resolution_date": (datetime.now(UTC) + timedelta(days=90))
+            .date()
+            .isoformat(),
+            "status": "pending",
+        }
+
+    async def _create_prediction_records_bulk(
+        self, leads: list[dict[str, Any]], scores: list[ConversionScore]
+    ) -> None:
+        """Insert prediction records for many scores in chunked bulk inserts."""
+        records = [
+            self._prediction_record(lead, score) for lead, score in zip(leads, scores, strict=True)
+        ]
+        for start in range(0, len(records), _BATCH_WRITE_CHUNK):
+            chunk = records[start : start + _BATCH_WRITE_CHUNK]
+            try:
+                await execute_async(self._db.table("predictions").insert(chunk))
+            except Exception as e:
+                # Don't fail scoring if prediction creation fails
+                logger.warning(
+                    "Failed to create prediction records",
+                    extra={"count": len(chunk), "error": str(e)},
+                )
+
     async def _create_prediction_record(self, lead: dict[str, Any], score: ConversionScore) -> None:
         """Create prediction record for accuracy tracking."""
         try:
-            self._db.table("predictions").insert(
-                {
-                    "user_id": lead.get("user_id"),
-                    "prediction_type": "deal_outcome",
-                    "prediction_text": f"{lead.get('company_name', 'Lead')} will convert",
-                    "predicted_outcome": "won",
-                    "confidence": score.confidence,
-                    "context": {
-                        "lead_memory_id": str(score.lead_memory_id),
-                        "conversion_probability": score.conversion_probability,
-                        "feature_values": score.feature_values,
-                    },
-                    "expected_resolution_date": (datetime.now(UTC) + timedelta(days=90))
-                    .date()
-                    .isoformat(),
-                    "status": "pending",
-                }
-            ).execute()
+            self._db.table("predictions").insert(self._prediction_record(lead, score)).execute()
         except Exception as e:
             # Don't fail scoring if prediction creation fails
             logger.warning(
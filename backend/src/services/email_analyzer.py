@@ -10,18 +10,21 @@ Callable as a service from:
 - User request ("ARIA, check my email")
 """
 
+import asyncio
 import json
 import logging
 import re
 import uuid
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from src.core.config import settings
 from src.core.llm import LLMClient
 from src.core.task_types import TaskType
-from src.db.supabase import SupabaseClient
+from src.db.supabase import SupabaseClient, execute_async
 from src.services.email_intelligence import EmailIntelligenceService
 from src.utils.reply_detector import (
     get_user_emails,
@@ -30,8 +33,10 @@ from src.utils.reply_detector import (
 )
 from src.utils.sender_context import (
     SenderContext,
+    SenderLookup,
     format_context_for_prompt,
     get_sender_context,
+    load_sender_lookup,
 )
 
 logger = logging.getLogger(__name__)
@@ -150,6 +155,97 @@ _RECEIPT_PATTERNS = [
     "read:", "read receipt:", "delivery receipt:", "disposition-notification",
 ]
 
+# Keyword urgency signals
+_URGENT_KEYWORDS = [
+    "urgent",
+    "asap",
+    "by eod",
+    "end of day",
+    "deadline",
+    "immediately",
+    "time-sensitive",
+    "time sensitive",
+    "critical",
+    "action required",
+    "action needed",
+    "response needed",
+    "please respond",
+    "by tomorrow",
+    "by end of week",
+    "within the hour",
+    "right away",
+]
+
+_URGENCY_RANK = {"URGENT": 3, "NORMAL": 2, "LOW": 1}
+
+# Classification fields and guidelines shared by single and batched prompts
+_CLASSIFICATION_FIELDS = (
+    '  "category": "NEEDS_REPLY" | "FYI" | "SKIP",\n'
+    '  "urgency": "URGENT" | "NORMAL" | "LOW",\n'
+    '  "topic_summary": "1-sentence summary of what this email is about",\n'
+    '  "needs_draft": true/false (should ARIA draft a reply?),\n'
+    '  "reason": "1-sentence explanation of why this classification"\n'
+)
+_CLASSIFICATION_GUIDELINES = (
+    "Classification guidelines:\n"
+    "- NEEDS_REPLY: Direct question, action requested, from a real person, "
+    "part of active thread, meeting follow-up, deal discussion\n"
+    "- FYI: Informational, no action needed, internal announcements, "
+    "status updates, newsletters\n"
+    "- SKIP: Spam, automated notifications, promotional, "
+    "system-generated alerts\n"
+    "- needs_draft=true only if NEEDS_REPLY and a substantive response is expected\n"
+    "- URGENT only for time-sensitive items with explicit deadlines or critical asks\n\n"
+)
+
+# Response token budget per email in a batched classification call
+_BATCH_TOKENS_PER_EMAIL = 300
+
+# email_scan_log rows per bulk lookup / insert
+_SCAN_LOG_BATCH = 100
+
+
+@dataclass
+class _EmailFields:
+    """Fields of a raw email used for classification and logging."""
+
+    email_id: str
+    thread_id: str
+    sender_email: str
+    sender_name: str
+    subject: str
+    body: str
+    cleaned_body: str | None
+    snippet: str
+
+
+@dataclass
+class _ScanContext:
+    """Lookups shared by every email of one inbox scan.
+
+    Per-user data is loaded once per scan and sender / thread data once
+    per distinct sender / thread, instead of once per email. ``None``
+    marks a lookup that failed; the checks using it then fail closed,
+    as they do when the per-email query fails.
+    """
+
+    user_id: str
+    exclusions: list[dict[str, Any]]
+    user_email: str | None = None
+    self_emails: set[str] | None = None
+    reply_user_emails: set[str] | None = None
+    vip_contacts: list[Any] | None = None
+    upcoming_meetings: list[dict[str, Any]] | None = None
+    oldest_user_sent: datetime | None = None
+    # sender_email -> (semantic memory relationship, strategic context)
+    senders: dict[str, tuple[dict[str, Any] | None, SenderContext | None]] = field(
+        default_factory=dict
+    )
+    # sender_email -> context lookup, for senders whose lookup succeeded
+    sender_lookups: dict[str, SenderLookup] = field(default_factory=dict)
+    # thread_id -> recent email_scan_log rows
+    thread_rows: dict[str, list[dict[str, Any]] | None] = field(default_factory=dict)
+
 
 # ---------------------------------------------------------------------------
 # Service
@@ -277,37 +373,29 @@ class EmailAnalyzer:
             # Track newest email for watermark
             newest_timestamp: str | None = None
             newest_email_id: str | None = None
-
-            # 3. Categorize each email
             for email in emails:
-                # Track newest email for watermark
                 email_date = email.get("date") or email.get("receivedDateTime")
                 if email_date:
                     if newest_timestamp is None or email_date > newest_timestamp:
                         newest_timestamp = email_date
                         newest_email_id = email.get("id") or email.get("message_id")
-                try:
-                    categorized = await self.categorize_email(email, user_id, exclusions)
-
-                    # Route to appropriate bucket
-                    if categorized.category == "NEEDS_REPLY":
-                        result.needs_reply.append(categorized)
-                        if categorized.urgency == "URGENT":
-                            result.urgent.append(categorized)
-                    elif categorized.category == "FYI":
-                        result.fyi.append(categorized)
-                    else:
-                        result.skipped.append(categorized)
 
-                    # 4. Log decision to email_scan_log
-                    await self._log_scan_decision(user_id, categorized)
+            # 3. Categorize all emails (rules first, then batched LLM classification)
+            categorized_emails = await self._categorize_emails(emails, user_id, exclusions)
+
+            # Route to appropriate bucket
+            for categorized in categorized_emails:
+                if categorized.category == "NEEDS_REPLY":
+                    result.needs_reply.append(categorized)
+                    if categorized.urgency == "URGENT":
+                        result.urgent.append(categorized)
+                elif categorized.category == "FYI":
+                    result.fyi.append(categorized)
+                else:
+                    result.skipped.append(categorized)
 
-                except Exception as e:
-                    logger.warning(
-                        "EMAIL_ANALYZER: Failed to categorize email %s: %s",
-                        email.get("id", "unknown"),
-                        e,
-                    )
+            # 4. Log decisions to email_scan_log
+            await self._log_scan_decisions(user_id, categorized_emails)
 
             logger.info(
                 "EMAIL_ANALYZER: Scan complete for user %s — "
@@ -413,6 +501,9 @@ class EmailAnalyzer:
     ) -> EmailCategory:
         """Categorize a single email using rules + LLM.
 
+        ``scan_inbox`` categorizes whole inboxes with ``_categorize_emails``,
+        which applies the same rules and checks in batches.
+
         Args:
             email: Raw email dict from Composio.
             user_id: The user's ID.
@@ -421,6 +512,466 @@ class EmailAnalyzer:
         Returns:
             EmailCategory with classification and reasoning.
         """
+        f = self._email_fields(email)
+
+        # Load exclusions if not provided
+        if exclusions is None:
+            exclusions = await self._load_exclusions(user_id)
+
+        # ---- Rule-based fast path (no LLM needed) ----
+        user_email = await self._get_user_email(user_id)
+        rule_result = self._early_rule_category(f, email, exclusions, user_email)
+        if rule_result is None and await self._is_self_sent(email, user_id):
+            rule_result = self._self_sent_category(f)
+        if rule_result is None:
+            rule_result = self._late_rule_category(f, email)
+        if rule_result is not None:
+            return rule_result
+
+        # ---- LLM classification for remaining emails ----
+
+        # Look up sender in semantic memory
+        sender_relationship = await self._lookup_sender_relationship(
+            user_id, f.sender_email
+        )
+
+        # Get strategic relationship context for this sender
+        sender_context = await get_sender_context(
+            db=self._db,
+            user_id=user_id,
+            sender_email=f.sender_email,
+        )
+
+        classification = await self._llm_classify(
+            email=email,
+            sender_email=f.sender_email,
+            sender_name=f.sender_name,
+            subject=f.subject,
+            body=f.body,
+            sender_relationship=sender_relationship,
+            sender_context=sender_context,
+        )
+
+        # Reply detection: if classified as NEEDS_REPLY, check if user already replied
+        replied = False
+        if classification.get("category", "FYI") == "NEEDS_REPLY" and f.thread_id:
+            reply_user_emails = await self._load_reply_user_emails(user_id, user_email)
+            replied = await self._user_replied(user_id, f, email, reply_user_emails)
+
+        # Signal-based urgency detection
+        urgency = await self.detect_urgency(email, user_id)
+
+        return self._classified_category(
+            f, classification, replied, urgency, sender_relationship, sender_context
+        )
+
+    # ------------------------------------------------------------------
+    # Batched categorization (scan_inbox)
+    # ------------------------------------------------------------------
+
+    async def _categorize_emails(
+        self,
+        emails: list[dict[str, Any]],
+        user_id: str,
+        exclusions: list[dict[str, Any]],
+    ) -> list[EmailCategory]:
+        """Categorize a scan's emails with the same rules and checks as ``categorize_email``.
+
+        Pipelined so a large inbox costs a few round trips per sender
+        rather than a dozen per email:
+
+        1. Per-user lookups (the user's addresses, VIP list, upcoming
+           meetings, last sent email) load once per scan.
+        2. Rule-based filters run first; only the remaining emails go on.
+        3. Sender relationship and strategic context resolve once per
+           distinct sender.
+        4. The LLM classifies EMAIL_SCAN_LLM_BATCH_SIZE emails per call,
+           EMAIL_SCAN_LLM_CONCURRENCY calls at a time.
+        5. Reply detection and urgency signals run thread by thread, in
+           scan order within a thread and concurrently across threads.
+
+        Lookups see email_scan_log and memory_semantic as they were when
+        the scan started. The rows logged for earlier emails of the scan
+        still count towards a thread's rapid-activity signal and a
+        sender's interaction history, as they did when emails were
+        categorized one by one.
+
+        Args:
+            emails: Raw email dicts from Composio.
+            user_id: The user's ID.
+            exclusions: The user's privacy exclusions.
+
+        Returns:
+            Categorized emails in input order. Emails that fail to
+            categorize are logged and left out.
+        """
+        slots = asyncio.Semaphore(max(1, settings.EMAIL_SCAN_LOOKUP_CONCURRENCY))
+        ctx = await self._load_scan_context(user_id, exclusions)
+
+        fields: dict[int, _EmailFields] = {}
+        results: dict[int, EmailCategory] = {}
+        pending: list[int] = []
+        for i, email in enumerate(emails):
+            try:
+                f = self._email_fields(email)
+                rule_result = self._early_rule_category(f, email, exclusions, ctx.user_email)
+                if (
+                    rule_result is None
+                    and ctx.self_emails is not None
+                    and self._sender_is_self(email, ctx.self_emails)
+                ):
+                    rule_result = self._self_sent_category(f)
+                if rule_result is None:
+                    rule_result = self._late_rule_category(f, email)
+            except Exception as e:
+                self._log_categorize_failure(email, e)
+                continue
+            fields[i] = f
+            if rule_result is not None:
+                results[i] = rule_result
+            else:
+                pending.append(i)
+
+        if pending:
+            logger.info(
+                "EMAIL_ANALYZER: %d of %d emails need LLM classification for user %s",
+                len(pending),
+                len(emails),
+                user_id,
+            )
+
+            async def classify() -> dict[int, dict[str, Any]]:
+                await self._resolve_senders(
+                    ctx, {fields[i].sender_email for i in pending}, slots
+                )
+                resolved = []
+                for i in pending:
+                    if fields[i].sender_email in ctx.senders:
+                        resolved.append(i)
+                    else:
+                        self._log_categorize_failure(
+                            emails[i], RuntimeError("sender lookup failed")
+                        )
+                return await self._classify_batched(ctx, emails, fields, resolved)
+
+            verdicts, _ = await asyncio.gather(classify(), self._load_signal_context(ctx))
+
+            # Thread members in scan order, including rule-categorized emails,
+            # whose log rows count towards rapid thread activity
+            threads: dict[str, list[int]] = {}
+            for i in fields:
+                threads.setdefault(fields[i].thread_id, []).append(i)
+
+            async def finish_thread(members: list[int]) -> None:
+                async with slots:
+                    senders_before: list[str] = []
+                    for i in members:
+                        if i in verdicts:
+                            try:
+                                results[i] = await self._finish_classification(
+                                    ctx, emails[i], fields[i], verdicts[i], senders_before
+                                )
+                            except Exception as e:
+                                self._log_categorize_failure(emails[i], e)
+                        if i in results:
+                            senders_before.append(fields[i].sender_email)
+
+            await asyncio.gather(
+                *(
+                    finish_thread(members)
+                    for members in threads.values()
+                    if any(i in verdicts for i in members)
+                )
+            )
+            self._count_scan_history(ctx, results, set(verdicts))
+
+        return [results[i] for i in sorted(results)]
+
+    @staticmethod
+    def _count_scan_history(
+        ctx: _ScanContext,
+        results: dict[int, EmailCategory],
+        classified: set[int],
+    ) -> None:
+        """Count a sender's earlier emails of this scan in its interaction history.
+
+        ``categorize_email`` sees the email_scan_log rows of emails logged
+        before it, which can make a frequent sender a known contact. The
+        history never makes a sender strategic, so only the reported
+        ``sender_context`` changes, not the classification.
+        """
+        history: dict[str, list[str | None]] = {}
+        for i in sorted(results):
+            categorized = results[i]
+            earlier = history.setdefault(categorized.sender_email, [])
+            lookup = ctx.sender_lookups.get(categorized.sender_email)
+            if i in classified and earlier and lookup is not None:
+                sender_context = lookup.resolve(earlier)
+                if sender_context != categorized.sender_context:
+                    results[i] = categorized.model_copy(update={"sender_context": sender_context})
+            earlier.append(categorized.category)
+
+    async def _load_scan_context(
+        self,
+        user_id: str,
+        exclusions: list[dict[str, Any]],
+    ) -> _ScanContext:
+        """Load the per-user lookups the rule-based filters need."""
+        ctx = _ScanContext(user_id=user_id, exclusions=exclusions)
+        ctx.user_email = await self._get_user_email(user_id)
+        try:
+            ctx.self_emails = await self._load_self_emails(user_id, ctx.user_email)
+        except Exception:
+            logger.debug(
+                "EMAIL_ANALYZER: Self-sent check could not resolve for user %s", user_id
+            )
+        return ctx
+
+    async def _load_signal_context(self, ctx: _ScanContext) -> None:
+        """Load the per-user lookups behind reply detection and urgency signals."""
+
+        async def vip_contacts() -> None:
+            try:
+                ctx.vip_contacts = await self._load_vip_contacts(ctx.user_id)
+            except Exception as e:
+                logger.warning(
+                    "EMAIL_ANALYZER: VIP list lookup failed for user %s: %s", ctx.user_id, e
+                )
+
+        async def upcoming_meetings() -> None:
+            try:
+                ctx.upcoming_meetings = await self._load_upcoming_meetings(ctx.user_id)
+            except Exception as e:
+                logger.warning(
+                    "EMAIL_ANALYZER: Calendar proximity lookup failed for user %s: %s",
+                    ctx.user_id,
+                    e,
+                )
+
+        async def oldest_user_sent() -> None:
+            if not ctx.user_email:
+                return
+            try:
+                ctx.oldest_user_sent = await self._load_oldest_user_sent(
+                    ctx.user_id, ctx.user_email
+                )
+            except Exception as e:
+                logger.warning("EMAIL_ANALYZER: Overdue response lookup failed: %s", e)
+
+        async def reply_user_emails() -> None:
+            ctx.reply_user_emails = await self._load_reply_user_emails(
+                ctx.user_id, ctx.user_email
+            )
+
+        await asyncio.gather(
+            vip_contacts(), upcoming_meetings(), oldest_user_sent(), reply_user_emails()
+        )
+
+    async def _resolve_senders(
+        self,
+        ctx: _ScanContext,
+        senders: set[str],
+        slots: asyncio.Semaphore,
+    ) -> None:
+        """Resolve relationship and strategic context once per distinct sender."""
+
+        async def resolve(sender_email: str) -> None:
+            async with slots:
+                try:
+                    relationship = await self._lookup_sender_relationship(
+                        ctx.user_id, sender_email
+                    )
+                    lookup = await load_sender_lookup(
+                        db=self._db,
+                        user_id=ctx.user_id,
+                        sender_email=sender_email,
+                    )
+                    sender_context = lookup.resolve() if lookup is not None else None
+                except Exception as e:
+                    logger.warning(
+                        "EMAIL_ANALYZER: Sender context failed for %s: %s", sender_email, e
+                    )
+                    return
+            ctx.senders[sender_email] = (relationship, sender_context)
+            if lookup is not None:
+                ctx.sender_lookups[sender_email] = lookup
+
+        await asyncio.gather(*(resolve(sender_email) for sender_email in senders))
+
+    async def _classify_batched(
+        self,
+        ctx: _ScanContext,
+        emails: list[dict[str, Any]],
+        fields: dict[int, _EmailFields],
+        pending: list[int],
+    ) -> dict[int, dict[str, Any]]:
+        """LLM-classify the emails at ``pending`` in batches with bounded concurrency.
+
+        Emails missing from a batch response are classified on their own.
+
+        Returns:
+            Classification per email index; failed emails are left out.
+        """
+        batch_size = max(1, settings.EMAIL_SCAN_LLM_BATCH_SIZE)
+        llm_slots = asyncio.Semaphore(max(1, settings.EMAIL_SCAN_LLM_CONCURRENCY))
+        verdicts: dict[int, dict[str, Any]] = {}
+
+        def llm_input(i: int) -> dict[str, Any]:
+            f = fields[i]
+            relationship, sender_context = ctx.senders[f.sender_email]
+            return {
+                "email": emails[i],
+                "sender_email": f.sender_email,
+                "sender_name": f.sender_name,
+                "subject": f.subject,
+                "body": f.body,
+                "sender_relationship": relationship,
+                "sender_context": sender_context,
+            }
+
+        async def classify(batch: list[int]) -> None:
+            inputs = [llm_input(i) for i in batch]
+            async with llm_slots:
+                if len(batch) > 1:
+                    batch_verdicts = await self._llm_classify_batch(inputs)
+                else:
+                    batch_verdicts = [None]
+                missing = [n for n, verdict in enumerate(batch_verdicts) if verdict is None]
+                singles = await asyncio.gather(
+                    *(self._llm_classify(**inputs[n]) for n in missing),
+                    return_exceptions=True,
+                )
+            for n, single in zip(missing, singles, strict=True):
+                batch_verdicts[n] = single
+            for i, verdict in zip(batch, batch_verdicts, strict=True):
+                if isinstance(verdict, BaseException):
+                    self._log_categorize_failure(emails[i], verdict)
+                elif verdict is not None:
+                    verdicts[i] = verdict
+
+        await asyncio.gather(
+            *(
+                classify(pending[start : start + batch_size])
+                for start in range(0, len(pending), batch_size)
+            )
+        )
+        return verdicts
+
+    async def _finish_classification(
+        self,
+        ctx: _ScanContext,
+        email: dict[str, Any],
+        f: _EmailFields,
+        classification: dict[str, Any],
+        senders_before: list[str],
+    ) -> EmailCategory:
+        """Apply reply detection and urgency signals to an LLM classification.
+
+        Args:
+            ctx: The scan's lookups.
+            email: Raw email dict.
+            f: Extracted email fields.
+            classification: Validated LLM classification.
+            senders_before: Senders of the emails of this thread categorized
+                earlier in the scan.
+
+        Returns:
+            The final EmailCategory.
+        """
+        relationship, sender_context = ctx.senders[f.sender_email]
+
+        replied = False
+        if classification.get("category", "FYI") == "NEEDS_REPLY" and f.thread_id:
+            replied = await self._user_replied(ctx.user_id, f, email, ctx.reply_user_emails)
+
+        urgency = await self._scan_urgency(ctx, email, relationship, senders_before)
+
+        return self._classified_category(
+            f, classification, replied, urgency, relationship, sender_context
+        )
+
+    async def _scan_urgency(
+        self,
+        ctx: _ScanContext,
+        email: dict[str, Any],
+        sender_relationship: dict[str, Any] | None,
+        senders_before: list[str],
+    ) -> str:
+        """``detect_urgency`` against the scan's preloaded lookups."""
+        if self._has_urgent_keyword(email):
+            return "URGENT"
+
+        sender_email = self._extract_sender_email(email)
+
+        if ctx.vip_contacts is not None:
+            try:
+                if self._in_vip_list(sender_email, ctx.vip_contacts) or (
+                    self._is_frequent_contact(sender_relationship)
+                ):
+                    return "URGENT"
+            except Exception as e:
+                logger.warning("EMAIL_ANALYZER: VIP check failed for %s: %s", sender_email, e)
+
+        if ctx.upcoming_meetings is not None:
+            try:
+                if self._sender_in_meetings(sender_email, ctx.upcoming_meetings):
+                    return "URGENT"
+            except Exception as e:
+                logger.warning(
+                    "EMAIL_ANALYZER: Calendar proximity check failed for %s: %s",
+                    sender_email,
+                    e,
+                )
+
+        if ctx.user_email:
+            cutoff = self._overdue_cutoff(email)
+            if cutoff is not None and self._is_overdue(cutoff, ctx.oldest_user_sent):
+                return "URGENT"
+
+        thread_id = email.get("thread_id", email.get("conversationId", ""))
+        if thread_id:
+            if thread_id not in ctx.thread_rows:
+                try:
+                    ctx.thread_rows[thread_id] = await self._load_thread_activity(
+                        ctx.user_id, thread_id
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "EMAIL_ANALYZER: Rapid thread check failed for thread %s: %s",
+                        thread_id,
+                        e,
+                    )
+                    ctx.thread_rows[thread_id] = None
+            rows = ctx.thread_rows[thread_id]
+            if rows is not None:
+                # Plus the rows logged for this thread earlier in the scan
+                rows = rows + [{"sender_email": sender} for sender in senders_before]
+                try:
+                    if self._is_rapid_activity(rows):
+                        return "URGENT"
+                except Exception as e:
+                    logger.warning(
+                        "EMAIL_ANALYZER: Rapid thread check failed for thread %s: %s",
+                        thread_id,
+                        e,
+                    )
+
+        return "NORMAL"
+
+    @staticmethod
+    def _log_categorize_failure(email: dict[str, Any], error: BaseException) -> None:
+        logger.warning(
+            "EMAIL_ANALYZER: Failed to categorize email %s: %s",
+            email.get("id", "unknown"),
+            error,
+        )
+
+    # ------------------------------------------------------------------
+    # Categorization steps shared by single and batched paths
+    # ------------------------------------------------------------------
+
+    def _email_fields(self, email: dict[str, Any]) -> _EmailFields:
+        """Extract the fields used for classification from a raw email."""
         sender_email = self._extract_sender_email(email)
         sender_name = self._extract_sender_name(email)
         subject = email.get("subject", "(no subject)")
@@ -441,45 +992,68 @@ class EmailAnalyzer:
             snippet = subject[:200] if subject else ""
         email_id = email.get("id", email.get("message_id", str(uuid.uuid4())))
         thread_id = email.get("thread_id", email.get("conversationId", email_id))
+        return _EmailFields(
+            email_id=email_id,
+            thread_id=thread_id,
+            sender_email=sender_email,
+            sender_name=sender_name,
+            subject=subject,
+            body=body,
+            cleaned_body=cleaned_body,
+            snippet=snippet,
+        )
 
-        # Load exclusions if not provided
-        if exclusions is None:
-            exclusions = await self._load_exclusions(user_id)
+    @staticmethod
+    def _rule_category(
+        f: _EmailFields,
+        category: str,
+        topic_summary: str,
+        reason: str,
+    ) -> EmailCategory:
+        """Build the result of a rule-based filter."""
+        return EmailCategory(
+            email_id=f.email_id,
+            thread_id=f.thread_id,
+            sender_email=f.sender_email,
+            sender_name=f.sender_name,
+            subject=f.subject,
+            snippet=f.snippet,
+            body=f.cleaned_body,
+            category=category,
+            urgency="LOW",
+            topic_summary=topic_summary,
+            needs_draft=False,
+            reason=reason,
+        )
 
-        # ---- Rule-based fast path (no LLM needed) ----
+    def _early_rule_category(
+        self,
+        f: _EmailFields,
+        email: dict[str, Any],
+        exclusions: list[dict[str, Any]],
+        user_email: str | None,
+    ) -> EmailCategory | None:
+        """Filters 1-4: privacy exclusions, no-reply senders, mailing lists, CC-only.
 
+        Returns:
+            The rule-based category, or None if no filter matched.
+        """
         # Privacy exclusion check
-        if self._is_excluded(sender_email, exclusions):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="Privacy-excluded sender",
-                needs_draft=False,
-                reason=f"Sender {sender_email} matches privacy exclusion rules",
+        if self._is_excluded(f.sender_email, exclusions):
+            return self._rule_category(
+                f,
+                "SKIP",
+                "Privacy-excluded sender",
+                f"Sender {f.sender_email} matches privacy exclusion rules",
             )
 
         # No-reply / automated sender check
-        if self._is_noreply(sender_email):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="Automated / no-reply sender",
-                needs_draft=False,
-                reason=f"Sender {sender_email} is an automated no-reply address",
+        if self._is_noreply(f.sender_email):
+            return self._rule_category(
+                f,
+                "SKIP",
+                "Automated / no-reply sender",
+                f"Sender {f.sender_email} is an automated no-reply address",
             )
 
         # Newsletter / mailing list check
@@ -487,212 +1061,164 @@ class EmailAnalyzer:
         if isinstance(headers, dict) and any(
             h in {k.lower() for k in headers} for h in _LIST_HEADERS
         ):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="FYI",
-                urgency="LOW",
-                topic_summary="Newsletter / mailing list",
-                needs_draft=False,
-                reason="Email contains mailing list headers (List-Unsubscribe or similar)",
+            return self._rule_category(
+                f,
+                "FYI",
+                "Newsletter / mailing list",
+                "Email contains mailing list headers (List-Unsubscribe or similar)",
             )
 
         # User is only CC'd check
-        user_email = await self._get_user_email(user_id)
         if user_email and self._is_only_cc(email, user_email):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="FYI",
-                urgency="LOW",
-                topic_summary="CC'd — not directly addressed",
-                needs_draft=False,
-                reason="User is only CC'd, not a direct recipient",
+            return self._rule_category(
+                f,
+                "FYI",
+                "CC'd — not directly addressed",
+                "User is only CC'd, not a direct recipient",
             )
 
-        # ---- Additional rule-based filters (Filters 5-10) ----
-
-        # Filter 5: Self-sent detection
-        if await self._is_self_sent(email, user_id):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="Self-sent email",
-                needs_draft=False,
-                reason="Email sent by user to themselves",
-            )
+        return None
+
+    def _self_sent_category(self, f: _EmailFields) -> EmailCategory:
+        """Filter 5: email sent by the user to themselves."""
+        return self._rule_category(
+            f, "SKIP", "Self-sent email", "Email sent by user to themselves"
+        )
+
+    def _late_rule_category(
+        self,
+        f: _EmailFields,
+        email: dict[str, Any],
+    ) -> EmailCategory | None:
+        """Filters 6-10: calendar, junk, bounce, receipt and auto-generated mail.
 
+        Returns:
+            The rule-based category, or None if no filter matched.
+        """
         # Filter 6: Calendar responses
         if self._is_calendar_response(email):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="Calendar notification",
-                needs_draft=False,
-                reason="Automated calendar response/notification",
+            return self._rule_category(
+                f,
+                "SKIP",
+                "Calendar notification",
+                "Automated calendar response/notification",
             )
 
         # Filter 7: Junk/spam notifications
         if self._is_system_junk_notification(email):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="System junk notification",
-                needs_draft=False,
-                reason="System junk/spam notification",
+            return self._rule_category(
+                f, "SKIP", "System junk notification", "System junk/spam notification"
             )
 
         # Filter 8: Bounce/undeliverable
         if self._is_bounce(email):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="Bounce/delivery failure",
-                needs_draft=False,
-                reason="Delivery failure notification",
+            return self._rule_category(
+                f, "SKIP", "Bounce/delivery failure", "Delivery failure notification"
             )
 
         # Filter 9: Read receipts
         if self._is_read_receipt(email):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="Read/delivery receipt",
-                needs_draft=False,
-                reason="Automated read/delivery receipt",
+            return self._rule_category(
+                f, "SKIP", "Read/delivery receipt", "Automated read/delivery receipt"
             )
 
         # Filter 10: Auto-generated messages
         if self._is_auto_generated(email):
-            return EmailCategory(
-                email_id=email_id,
-                thread_id=thread_id,
-                sender_email=sender_email,
-                sender_name=sender_name,
-                subject=subject,
-                snippet=snippet,
-                body=cleaned_body,
-                category="SKIP",
-                urgency="LOW",
-                topic_summary="Auto-generated message",
-                needs_draft=False,
-                reason="Auto-generated message (rules, forwards, notifications)",
+            return self._rule_category(
+                f,
+                "SKIP",
+                "Auto-generated message",
+                "Auto-generated message (rules, forwards, notifications)",
             )
 
-        # ---- LLM classification for remaining emails ----
+        return None
 
-        # Look up sender in semantic memory
-        sender_relationship = await self._lookup_sender_relationship(
-            user_id, sender_email
-        )
+    async def _load_reply_user_emails(
+        self,
+        user_id: str,
+        user_email: str | None,
+    ) -> set[str] | None:
+        """All of the user's addresses for reply matching, or None on failure."""
+        try:
+            reply_user_emails = await get_user_emails(self._db, user_id)
+        except Exception as e:
+            logger.warning(
+                "EMAIL_ANALYZER: Reply detection failed for user %s: %s", user_id, e
+            )
+            return None
+        if user_email and user_email.lower() not in reply_user_emails:
+            reply_user_emails.add(user_email.lower())
+        return reply_user_emails
 
-        # Get strategic relationship context for this sender
-        sender_context = await get_sender_context(
-            db=self._db,
-            user_id=user_id,
-            sender_email=sender_email,
-        )
+    async def _user_replied(
+        self,
+        user_id: str,
+        f: _EmailFields,
+        email: dict[str, Any],
+        user_emails: set[str] | None,
+    ) -> bool:
+        """Check whether the user already replied to the email's thread."""
+        if user_emails is None:
+            return False
+        try:
+            return await has_user_replied(
+                db=self._db,
+                user_id=user_id,
+                thread_id=f.thread_id,
+                email_timestamp=email.get("date") or email.get("receivedDateTime"),
+                user_emails=user_emails,
+            )
+        except Exception as reply_e:
+            logger.warning(
+                "EMAIL_ANALYZER: Reply detection failed for thread %s: %s",
+                f.thread_id,
+                reply_e,
+            )
+            return False
 
-        classification = await self._llm_classify(
-            email=email,
-            sender_email=sender_email,
-            sender_name=sender_name,
-            subject=subject,
-            body=body,
-            sender_relationship=sender_relationship,
-            sender_context=sender_context,
-        )
+    def _classified_category(
+        self,
+        f: _EmailFields,
+        classification: dict[str, Any],
+        replied: bool,
+        signal_urgency: str,
+        sender_relationship: dict[str, Any] | None,
+        sender_context: SenderContext | None,
+    ) -> EmailCategory:
+        """Combine an LLM classification with reply detection and urgency signals.
+
+        Args:
+            f: Extracted email fields.
+            classification: Validated LLM classification.
+            replied: Whether the user already replied to a NEEDS_REPLY thread.
+            signal_urgency: Urgency from ``detect_urgency`` signals.
+            sender_relationship: Known relationship context (or None).
+            sender_context: Strategic relationship context (or None).
 
+        Returns:
+            The final EmailCategory.
+        """
         category = classification.get("category", "FYI")
         urgency_from_llm = classification.get("urgency", "NORMAL")
-        topic_summary = classification.get("topic_summary", subject)
+        topic_summary = classification.get("topic_summary", f.subject)
         needs_draft = classification.get("needs_draft", False)
         reason = classification.get("reason", "LLM classification")
 
-        # Reply detection: if classified as NEEDS_REPLY, check if user already replied
-        if category == "NEEDS_REPLY" and thread_id:
-            try:
-                # Get all user email addresses for thorough reply matching
-                reply_user_emails = await get_user_emails(self._db, user_id)
-                if user_email and user_email.lower() not in reply_user_emails:
-                    reply_user_emails.add(user_email.lower())
-
-                email_date = email.get("date") or email.get("receivedDateTime")
-                replied = await has_user_replied(
-                    db=self._db,
-                    user_id=user_id,
-                    thread_id=thread_id,
-                    email_timestamp=email_date,
-                    user_emails=reply_user_emails,
-                )
-                if replied:
-                    logger.info(
-                        "EMAIL_ANALYZER: Overriding NEEDS_REPLY to FYI — "
-                        "user already replied to thread %s (email %s)",
-                        thread_id,
-                        email_id,
-                    )
-                    category = "FYI"
-                    urgency_from_llm = "LOW"
-                    needs_draft = False
-                    reason = "User has already replied to this thread"
-            except Exception as reply_e:
-                logger.warning(
-                    "EMAIL_ANALYZER: Reply detection failed for thread %s: %s",
-                    thread_id,
-                    reply_e,
-                )
+        if replied:
+            logger.info(
+                "EMAIL_ANALYZER: Overriding NEEDS_REPLY to FYI — "
+                "user already replied to thread %s (email %s)",
+                f.thread_id,
+                f.email_id,
+            )
+            category = "FYI"
+            urgency_from_llm = "LOW"
+            needs_draft = False
+            reason = "User has already replied to this thread"
 
-        # Override urgency with signal-based detection
-        urgency = await self.detect_urgency(email, user_id)
         # Take the more urgent of LLM vs signal-based
-        urgency_rank = {"URGENT": 3, "NORMAL": 2, "LOW": 1}
-        if urgency_rank.get(urgency, 0) < urgency_rank.get(urgency_from_llm, 0):
+        urgency = signal_urgency
+        if _URGENCY_RANK.get(urgency, 0) < _URGENCY_RANK.get(urgency_from_llm, 0):
             urgency = urgency_from_llm
 
         # Enforce category-urgency consistency rules
@@ -701,13 +1227,13 @@ class EmailAnalyzer:
         )
 
         return EmailCategory(
-            email_id=email_id,
-            thread_id=thread_id,
-            sender_email=sender_email,
-            sender_name=sender_name,
-            subject=subject,
-            snippet=snippet,
-            body=cleaned_body,
+            email_id=f.email_id,
+            thread_id=f.thread_id,
+            sender_email=f.sender_email,
+            sender_name=f.sender_name,
+            subject=f.subject,
+            snippet=f.snippet,
+            body=f.cleaned_body,
             category=category,
             urgency=urgency,
             topic_summary=topic_summary,
@@ -799,33 +1325,10 @@ class EmailAnalyzer:
         Returns:
             Urgency level: URGENT, NORMAL, or LOW.
         """
-        subject = email.get("subject", "")
-        body = email.get("body", email.get("snippet", ""))
-        text = f"{subject} {body}".lower()
         sender_email = self._extract_sender_email(email)
 
         # Keyword urgency signals
-        urgent_keywords = [
-            "urgent",
-            "asap",
-            "by eod",
-            "end of day",
-            "deadline",
-            "immediately",
-            "time-sensitive",
-            "time sensitive",
-            "critical",
-            "action required",
-            "action needed",
-            "response needed",
-            "please respond",
-            "by tomorrow",
-            "by end of week",
-            "within the hour",
-            "right away",
-        ]
-
-        if any(kw in text for kw in urgent_keywords):
+        if self._has_urgent_keyword(email):
             return "URGENT"
 
         # VIP sender check
@@ -847,6 +1350,14 @@ class EmailAnalyzer:
 
         return "NORMAL"
 
+    @staticmethod
+    def _has_urgent_keyword(email: dict[str, Any]) -> bool:
+        """Check the subject and body for explicit urgency keywords."""
+        subject = email.get("subject", "")
+        body = email.get("body", email.get("snippet", ""))
+        text = f"{subject} {body}".lower()
+        return any(kw in text for kw in _URGENT_KEYWORDS)
+
     async def _is_sender_in_upcoming_meeting(
         self,
         user_id: str,
@@ -862,45 +1373,8 @@ class EmailAnalyzer:
             True if sender is in an upcoming meeting within 2 hours.
         """
         try:
-            from datetime import timedelta
-
-            now = datetime.now(UTC)
-            two_hours_from_now = now + timedelta(hours=2)
-
-            # Query calendar_events for upcoming meetings
-            result = (
-                self._db.table("calendar_events")
-                .select("attendees, start_time")
-                .eq("user_id", user_id)
-                .gte("start_time", now.isoformat())
-                .lte("start_time", two_hours_from_now.isoformat())
-                .execute()
-            )
-
-            if not result.data:
-                return False
-
-            sender_lower = sender_email.lower()
-
-            for event in result.data:
-                attendees = event.get("attendees", [])
-                if isinstance(attendees, list):
-                    for attendee in attendees:
-                        if isinstance(attendee, dict):
-                            attendee_email = attendee.get("email", "").lower()
-                        elif isinstance(attendee, str):
-                            attendee_email = attendee.lower()
-                        else:
-                            continue
-                        if sender_lower in attendee_email or attendee_email in sender_lower:
-                            logger.info(
-                                "EMAIL_ANALYZER: Urgency detected - sender %s in upcoming meeting",
-                                sender_email,
-                            )
-                            return True
-
-            return False
-
+            events = await self._load_upcoming_meetings(user_id)
+            return self._sender_in_meetings(sender_email, events)
         except Exception as e:
             logger.warning(
                 "EMAIL_ANALYZER: Calendar proximity check failed for %s: %s",
@@ -909,6 +1383,44 @@ class EmailAnalyzer:
             )
             return False
 
+    async def _load_upcoming_meetings(self, user_id: str) -> list[dict[str, Any]]:
+        """Load the user's calendar events starting in the next 2 hours."""
+        now = datetime.now(UTC)
+        two_hours_from_now = now + timedelta(hours=2)
+
+        result = await execute_async(
+            self._db.table("calendar_events")
+            .select("attendees, start_time")
+            .eq("user_id", user_id)
+            .gte("start_time", now.isoformat())
+            .lte("start_time", two_hours_from_now.isoformat())
+        )
+        return result.data or []
+
+    @staticmethod
+    def _sender_in_meetings(sender_email: str, events: list[dict[str, Any]]) -> bool:
+        """Check if the sender is an attendee of any of ``events``."""
+        sender_lower = sender_email.lower()
+
+        for event in events:
+            attendees = event.get("attendees", [])
+            if isinstance(attendees, list):
+                for attendee in attendees:
+                    if isinstance(attendee, dict):
+                        attendee_email = attendee.get("email", "").lower()
+                    elif isinstance(attendee, str):
+                        attendee_email = attendee.lower()
+                    else:
+                        continue
+                    if sender_lower in attendee_email or attendee_email in sender_lower:
+                        logger.info(
+                            "EMAIL_ANALYZER: Urgency detected - sender %s in upcoming meeting",
+                            sender_email,
+                        )
+                        return True
+
+        return False
+
     async def _is_overdue_response(
         self,
         user_id: str,
@@ -924,59 +1436,16 @@ class EmailAnalyzer:
             True if this is an overdue response to user's email.
         """
         try:
-            from datetime import timedelta
-
-            # Check if this email is a reply (has In-Reply-To or References header)
-            headers = email.get("headers", {})
-            if isinstance(headers, dict):
-                in_reply_to = headers.get("In-Reply-To", "") or headers.get("References", "")
-                if not in_reply_to:
-                    return False
+            cutoff = self._overdue_cutoff(email)
+            if cutoff is None:
+                return False
 
-            # Look up the original email in email_scan_log
-            # Find emails FROM user that this might be a reply to
             user_email = await self._get_user_email(user_id)
             if not user_email:
                 return False
 
-            # Check email date
-            email_date_str = email.get("date", email.get("received_at", ""))
-            if not email_date_str:
-                return False
-
-            try:
-                # Parse the incoming email date
-                if isinstance(email_date_str, str):
-                    # Handle ISO format or RFC 2822
-                    email_date = datetime.fromisoformat(
-                        email_date_str.replace("Z", "+00:00")
-                    )
-                else:
-                    return False
-            except (ValueError, TypeError):
-                return False
-
-            # Look for a sent email from user >48 hours before this reply
-            cutoff_date = email_date - timedelta(hours=48)
-
-            result = (
-                self._db.table("email_scan_log")
-                .select("created_at, sender_email")
-                .eq("user_id", user_id)
-                .eq("sender_email", user_email.lower())
-                .lte("created_at", cutoff_date.isoformat())
-                .order("created_at", desc=True)
-                .limit(5)
-                .execute()
-            )
-
-            if result.data:
-                logger.info(
-                    "EMAIL_ANALYZER: Urgency detected - overdue response to user's email"
-                )
-                return True
-
-            return False
+            oldest = await self._load_oldest_user_sent(user_id, user_email)
+            return self._is_overdue(cutoff, oldest)
 
         except Exception as e:
             logger.warning(
@@ -985,6 +1454,66 @@ class EmailAnalyzer:
             )
             return False
 
+    @staticmethod
+    def _overdue_cutoff(email: dict[str, Any]) -> datetime | None:
+        """Latest send time of the user's email for this reply to be overdue.
+
+        Returns:
+            The reply's date minus 48 hours, or None if the email is not a
+            reply or has no parseable date.
+        """
+        # Check if this email is a reply (has In-Reply-To or References header)
+        headers = email.get("headers", {})
+        if isinstance(headers, dict):
+            in_reply_to = headers.get("In-Reply-To", "") or headers.get("References", "")
+            if not in_reply_to:
+                return None
+
+        email_date_str = email.get("date", email.get("received_at", ""))
+        if not email_date_str or not isinstance(email_date_str, str):
+            return None
+
+        try:
+            # Handle ISO format or RFC 2822
+            email_date = datetime.fromisoformat(email_date_str.replace("Z", "+00:00"))
+        except (ValueError, TypeError):
+            return None
+
+        return email_date - timedelta(hours=48)
+
+    async def _load_oldest_user_sent(self, user_id: str, user_email: str) -> datetime | None:
+        """Load when the user's oldest email in email_scan_log was logged.
+
+        A reply is overdue if any email from the user was logged before its
+        cutoff, i.e. if the oldest one was.
+        """
+        result = await execute_async(
+            self._db.table("email_scan_log")
+            .select("created_at")
+            .eq("user_id", user_id)
+            .eq("sender_email", user_email.lower())
+            .order("created_at")
+            .limit(1)
+        )
+        if not result.data:
+            return None
+        oldest = datetime.fromisoformat(str(result.data[0]["created_at"]).replace("Z", "+00:00"))
+        return oldest if oldest.tzinfo else oldest.replace(tzinfo=UTC)
+
+    @staticmethod
+    def _is_overdue(cutoff: datetime, oldest_user_sent: datetime | None) -> bool:
+        """Check if the user sent an email before ``cutoff``."""
+        if oldest_user_sent is None:
+            return False
+        if cutoff.tzinfo is None:
+            cutoff = cutoff.replace(tzinfo=UTC)
+        if oldest_user_sent <= cutoff:
+            logger.info(
+                "EMAIL_ANALYZER: Urgency detected - overdue response to user's email"
+            )
+            return True
+        return False
+
     async def _is_rapid_thread(
         self,
         user_id: str,
@@ -1000,44 +1529,52 @@ class EmailAnalyzer:
             True if 3+ messages in the last hour with different senders.
         """
         try:
-            from datetime import timedelta
-
-            one_hour_ago = datetime.now(UTC) - timedelta(hours=1)
-
-            # Query email_scan_log for messages in this thread
-            result = (
-                self._db.table("email_scan_log")
-                .select("sender_email, scanned_at")
-                .eq("user_id", user_id)
-                .eq("thread_id", thread_id)
-                .gte("scanned_at", one_hour_ago.isoformat())
-                .order("scanned_at", desc=True)
-                .execute()
+            rows = await self._load_thread_activity(user_id, thread_id)
+            return self._is_rapid_activity(rows)
+        except Exception as e:
+            logger.warning(
+                "EMAIL_ANALYZER: Rapid thread check failed for thread %s: %s",
+                thread_id,
+                e,
             )
+            return False
 
-            if not result.data or len(result.data) < 3:
-                return False
-
-            # Check if there are at least 2 different senders (back-and-forth)
-            unique_senders = {msg["sender_email"].lower() for msg in result.data}
+    async def _load_thread_activity(
+        self,
+        user_id: str,
+        thread_id: str,
+    ) -> list[dict[str, Any]]:
+        """Load the thread's email_scan_log rows from the last hour."""
+        one_hour_ago = datetime.now(UTC) - timedelta(hours=1)
 
-            if len(unique_senders) >= 2 and len(result.data) >= 3:
-                logger.info(
-                    "EMAIL_ANALYZER: Urgency detected - rapid thread activity (%d messages, %d senders)",
-                    len(result.data),
-                    len(unique_senders),
-                )
-                return True
+        result = await execute_async(
+            self._db.table("email_scan_log")
+            .select("sender_email, scanned_at")
+            .eq("user_id", user_id)
+            .eq("thread_id", thread_id)
+            .gte("scanned_at", one_hour_ago.isoformat())
+            .order("scanned_at", desc=True)
+        )
+        return result.data or []
 
+    @staticmethod
+    def _is_rapid_activity(rows: list[dict[str, Any]]) -> bool:
+        """Check for 3+ recent messages from at least 2 different senders."""
+        if len(rows) < 3:
             return False
 
-        except Exception as e:
-            logger.warning(
-                "EMAIL_ANALYZER: Rapid thread check failed for thread %s: %s",
-                thread_id,
-                e,
+        # Check if there are at least 2 different senders (back-and-forth)
+        unique_senders = {msg["sender_email"].lower() for msg in rows}
+
+        if len(unique_senders) >= 2:
+            logger.info(
+                "EMAIL_ANALYZER: Urgency detected - rapid thread activity (%d messages, %d senders)",
+                len(rows),
+                len(unique_senders),
             )
-            return False
+            return True
+
+        return False
 
     # ------------------------------------------------------------------
     # Email fetching
@@ -1693,47 +2230,10 @@ class EmailAnalyzer:
         if not sender:
             return False
 
-        # Get user's own email addresses from user_integrations
         try:
-            integrations = (
-                self._db.table("user_integrations")
-                .select("account_email")
-                .eq("user_id", user_id)
-                .eq("status", "active")
-                .execute()
-            )
-            user_emails = {
-                i["account_email"].lower()
-                for i in integrations.data
-                if i.get("account_email")
-            }
-
-            # Also check the user_profiles table for primary email
-            # NOTE: Use limit(1) instead of single() to avoid postgrest-py 204 APIError
-            # on empty results. This is normal for senders that aren't the user.
-            profiles = (
-                self._db.table("user_profiles")
-                .select("email")
-                .eq("user_id", user_id)
-                .limit(1)
-                .execute()
+            user_emails = await self._load_self_emails(
+                user_id, await self._get_user_email(user_id)
             )
-            if profiles.data and profiles.data[0].get("email"):
-                user_emails.add(profiles.data[0]["email"].lower())
-
-            # Also check auth email
-            auth_email = await self._get_user_email(user_id)
-            if auth_email:
-                user_emails.add(auth_email.lower())
-
-            if sender in user_emails:
-                logger.info(
-                    "SKIP_SELF_SENT: %s from %s",
-                    email.get("id", "unknown"),
-                    sender,
-                )
-                return True
-
         except Exception:
             # A failure here just means we couldn't confirm the sender is
             # the user — default to treating the email as *not* self-sent,
@@ -1743,7 +2243,61 @@ class EmailAnalyzer:
                 "EMAIL_ANALYZER: Self-sent check could not resolve for %s",
                 sender,
             )
+            return False
+
+        return self._sender_is_self(email, user_emails)
+
+    async def _load_self_emails(self, user_id: str, auth_email: str | None) -> set[str]:
+        """Load the user's own email addresses.
+
+        Args:
+            user_id: The user's ID.
+            auth_email: The user's Supabase Auth email, if known.
+
+        Returns:
+            Lowercased addresses from active integrations, the profile and auth.
+        """
+        # Get user's own email addresses from user_integrations
+        integrations = await execute_async(
+            self._db.table("user_integrations")
+            .select("account_email")
+            .eq("user_id", user_id)
+            .eq("status", "active")
+        )
+        user_emails = {
+            i["account_email"].lower()
+            for i in integrations.data
+            if i.get("account_email")
+        }
+
+        # Also check the user_profiles table for primary email
+        # NOTE: Use limit(1) instead of single() to avoid postgrest-py 204 APIError
+        # on empty results. This is normal for senders that aren't the user.
+        profiles = await execute_async(
+            self._db.table("user_profiles")
+            .select("email")
+            .eq("user_id", user_id)
+            .limit(1)
+        )
+        if profiles.data and profiles.data[0].get("email"):
+            user_emails.add(profiles.data[0]["email"].lower())
+
+        # Also check auth email
+        if auth_email:
+            user_emails.add(auth_email.lower())
 
+        return user_emails
+
+    def _sender_is_self(self, email: dict[str, Any], user_emails: set[str]) -> bool:
+        """Check if the email's sender is one of the user's own addresses."""
+        sender = self._extract_sender_email(email)
+        if sender and sender in user_emails:
+            logger.info(
+                "SKIP_SELF_SENT: %s from %s",
+                email.get("id", "unknown"),
+                sender,
+            )
+            return True
         return False
 
     def _is_calendar_response(self, email: dict[str, Any]) -> bool:
@@ -1980,13 +2534,12 @@ class EmailAnalyzer:
             Relationship dict if found, None otherwise.
         """
         try:
-            result = (
+            result = await execute_async(
                 self._db.table("memory_semantic")
                 .select("fact, confidence, metadata")
                 .eq("user_id", user_id)
                 .ilike("fact", f"%{sender_email}%")
                 .limit(5)
-                .execute()
             )
 
             if result and result.data:
@@ -2039,27 +2592,15 @@ class EmailAnalyzer:
         """
         try:
             # Check user_settings for VIP list
-            result = (
-                self._db.table("user_settings")
-                .select("preferences")
-                .eq("user_id", user_id)
-                .limit(1)
-                .execute()
-            )
-            if result.data:
-                prefs = result.data[0].get("preferences", {})
-                if isinstance(prefs, dict):
-                    vip_contacts = prefs.get("vip_contacts", [])
-                    if sender_email.lower() in [
-                        v.lower() for v in vip_contacts if isinstance(v, str)
-                    ]:
-                        return True
+            vip_contacts = await self._load_vip_contacts(user_id)
+            if self._in_vip_list(sender_email, vip_contacts):
+                return True
 
             # Check if sender is a high-interaction contact from semantic memory
             relationship = await self._lookup_sender_relationship(
                 user_id, sender_email
             )
-            if relationship and relationship.get("interaction_count", 0) >= 10:
+            if self._is_frequent_contact(relationship):
                 return True
 
         except Exception as e:
@@ -2069,6 +2610,33 @@ class EmailAnalyzer:
 
         return False
 
+    async def _load_vip_contacts(self, user_id: str) -> list[Any]:
+        """Load the VIP contact list from the user's preferences."""
+        result = await execute_async(
+            self._db.table("user_settings")
+            .select("preferences")
+            .eq("user_id", user_id)
+            .limit(1)
+        )
+        if not result.data:
+            return []
+        prefs = result.data[0].get("preferences", {})
+        if not isinstance(prefs, dict):
+            return []
+        return prefs.get("vip_contacts", [])  # type: ignore[no-any-return]
+
+    @staticmethod
+    def _in_vip_list(sender_email: str, vip_contacts: list[Any]) -> bool:
+        """Check if the sender is on the user's VIP list."""
+        return sender_email.lower() in [
+            v.lower() for v in vip_contacts if isinstance(v, str)
+        ]
+
+    @staticmethod
+    def _is_frequent_contact(relationship: dict[str, Any] | None) -> bool:
+        """Check if a semantic memory relationship has 10+ interactions."""
+        return bool(relationship and relationship.get("interaction_count", 0) >= 10)
+
     # ------------------------------------------------------------------
     # LLM classification
     # ------------------------------------------------------------------
@@ -2097,55 +2665,17 @@ class EmailAnalyzer:
         Returns:
             Dict with category, urgency, topic_summary, needs_draft, reason.
         """
-        # Truncate body for prompt efficiency
-        body_truncated = body[:2000] if body else "(empty body)"
-
-        relationship_context = ""
-        if sender_relationship:
-            rel_type = sender_relationship.get("relationship_type", "unknown")
-            company = sender_relationship.get("company", "unknown")
-            interactions = sender_relationship.get("interaction_count", 0)
-            relationship_context = (
-                f"\nKnown relationship: {rel_type} at {company}, "
-                f"{interactions} prior interactions."
-            )
-
-        # Add strategic sender context if available
-        strategic_context = ""
-        if sender_context and sender_context.is_strategic:
-            strategic_context = format_context_for_prompt(
-                sender_context, sender_name, sender_email
-            )
-
-        # Check if user is in To or CC
-        to_list = email.get("to", [])
-        cc_list = email.get("cc", [])
-        recipient_context = f"To: {to_list}, CC: {cc_list}"
-
+        email_text = self._classification_input(
+            email, sender_email, sender_name, subject, body, sender_relationship, sender_context
+        )
         prompt = (
             "Classify this email for a life sciences commercial professional.\n\n"
-            f"From: {sender_name} <{sender_email}>\n"
-            f"Subject: {subject}\n"
-            f"Recipients: {recipient_context}\n"
-            f"{relationship_context}{strategic_context}\n\n"
-            f"Body:\n{body_truncated}\n\n"
+            f"{email_text}\n\n"
             "Classify as exactly one JSON object with these fields:\n"
             "{\n"
-            '  "category": "NEEDS_REPLY" | "FYI" | "SKIP",\n'
-            '  "urgency": "URGENT" | "NORMAL" | "LOW",\n'
-            '  "topic_summary": "1-sentence summary of what this email is about",\n'
-            '  "needs_draft": true/false (should ARIA draft a reply?),\n'
-            '  "reason": "1-sentence explanation of why this classification"\n'
+            f"{_CLASSIFICATION_FIELDS}"
             "}\n\n"
-            "Classification guidelines:\n"
-            "- NEEDS_REPLY: Direct question, action requested, from a real person, "
-            "part of active thread, meeting follow-up, deal discussion\n"
-            "- FYI: Informational, no action needed, internal announcements, "
-            "status updates, newsletters\n"
-            "- SKIP: Spam, automated notifications, promotional, "
-            "system-generated alerts\n"
-            "- needs_draft=true only if NEEDS_REPLY and a substantive response is expected\n"
-            "- URGENT only for time-sensitive items with explicit deadlines or critical asks\n\n"
+            f"{_CLASSIFICATION_GUIDELINES}"
             "Return ONLY the JSON object, no other text."
         )
 
@@ -2158,33 +2688,8 @@ class EmailAnalyzer:
                 agent_id="email_analyzer",
             )
 
-            # Parse JSON from response (handle markdown code blocks)
-            cleaned = response.strip()
-            if cleaned.startswith("```"):
-                # Strip markdown code fences
-                lines = cleaned.split("\n")
-                lines = [l for l in lines if not l.strip().startswith("```")]
-                cleaned = "\n".join(lines)
-
-            classification: dict[str, Any] = json.loads(cleaned)
-
-            # Validate required fields
-            if "category" not in classification:
-                classification["category"] = "FYI"
-            if classification["category"] not in ("NEEDS_REPLY", "FYI", "SKIP"):
-                classification["category"] = "FYI"
-            if "urgency" not in classification:
-                classification["urgency"] = "NORMAL"
-            if classification["urgency"] not in ("URGENT", "NORMAL", "LOW"):
-                classification["urgency"] = "NORMAL"
-            if "topic_summary" not in classification:
-                classification["topic_summary"] = subject
-            if "needs_draft" not in classification:
-                classification["needs_draft"] = False
-            if "reason" not in classification:
-                classification["reason"] = "LLM classification"
-
-            return classification
+            classification: dict[str, Any] = self._parse_llm_json(response)
+            return self._normalize_classification(classification, subject)
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.warning(
@@ -2201,6 +2706,148 @@ class EmailAnalyzer:
                 "reason": f"LLM response parse failed ({e}), defaulting to FYI",
             }
 
+    async def _llm_classify_batch(
+        self,
+        items: list[dict[str, Any]],
+    ) -> list[dict[str, Any] | None]:
+        """Use one LLM call to classify several emails.
+
+        Args:
+            items: Keyword arguments of ``_llm_classify``, one dict per email.
+
+        Returns:
+            One classification per item, validated like ``_llm_classify``'s,
+            or None where the response has no usable entry for that email.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        sections = "".join(
+            f"=== Email {n} ===\n{self._classification_input(**item)}\n\n"
+            for n, item in enumerate(items, start=1)
+        )
+        prompt = (
+            f"Classify each of these {len(items)} emails for a life sciences "
+            "commercial professional.\n\n"
+            f"{sections}"
+            f"Return a JSON array of exactly {len(items)} objects, one per email, "
+            "each with these fields:\n"
+            "{\n"
+            '  "index": the email number above,\n'
+            f"{_CLASSIFICATION_FIELDS}"
+            "}\n\n"
+            f"{_CLASSIFICATION_GUIDELINES}"
+            "Return ONLY the JSON array, no other text."
+        )
+
+        try:
+            response = await self._llm.generate_response(
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=min(4096, _BATCH_TOKENS_PER_EMAIL * len(items)),
+                temperature=0.0,
+                task=TaskType.SCRIBE_CLASSIFY_EMAIL,
+                agent_id="email_analyzer",
+            )
+            parsed = self._parse_llm_json(response)
+        except Exception as e:
+            logger.warning(
+                "EMAIL_ANALYZER: Batch classification of %d emails failed: %s",
+                len(items),
+                e,
+            )
+            return results
+
+        if not isinstance(parsed, list):
+            logger.warning("EMAIL_ANALYZER: Batch classification did not return a list")
+            return results
+
+        for position, entry in enumerate(parsed, start=1):
+            if not isinstance(entry, dict):
+                continue
+            index = entry.pop("index", position)
+            if not isinstance(index, int) or not 1 <= index <= len(items):
+                continue
+            if results[index - 1] is None:
+                results[index - 1] = self._normalize_classification(
+                    entry, items[index - 1]["subject"]
+                )
+        return results
+
+    @staticmethod
+    def _classification_input(
+        email: dict[str, Any],
+        sender_email: str,
+        sender_name: str,
+        subject: str,
+        body: str,
+        sender_relationship: dict[str, Any] | None,
+        sender_context: SenderContext | None = None,
+    ) -> str:
+        """Describe one email for a classification prompt."""
+        # Truncate body for prompt efficiency
+        body_truncated = body[:2000] if body else "(empty body)"
+
+        relationship_context = ""
+        if sender_relationship:
+            rel_type = sender_relationship.get("relationship_type", "unknown")
+            company = sender_relationship.get("company", "unknown")
+            interactions = sender_relationship.get("interaction_count", 0)
+            relationship_context = (
+                f"\nKnown relationship: {rel_type} at {company}, "
+                f"{interactions} prior interactions."
+            )
+
+        # Add strategic sender context if available
+        strategic_context = ""
+        if sender_context and sender_context.is_strategic:
+            strategic_context = format_context_for_prompt(
+                sender_context, sender_name, sender_email
+            )
+
+        # Check if user is in To or CC
+        to_list = email.get("to", [])
+        cc_list = email.get("cc", [])
+        recipient_context = f"To: {to_list}, CC: {cc_list}"
+
+        return (
+            f"From: {sender_name} <{sender_email}>\n"
+            f"Subject: {subject}\n"
+            f"Recipients: {recipient_context}\n"
+            f"{relationship_context}{strategic_context}\n\n"
+            f"Body:\n{body_truncated}"
+        )
+
+    @staticmethod
+    def _parse_llm_json(response: str) -> Any:
+        """Parse JSON from an LLM response (handles markdown code blocks)."""
+        cleaned = response.strip()
+        if cleaned.startswith("```"):
+            # Strip markdown code fences
+            lines = cleaned.split("\n")
+            lines = [l for l in lines if not l.strip().startswith("```")]
+            cleaned = "\n".join(lines)
+        return json.loads(cleaned)
+
+    @staticmethod
+    def _normalize_classification(
+        classification: dict[str, Any],
+        subject: str,
+    ) -> dict[str, Any]:
+        """Fill in missing or invalid classification fields."""
+        if "category" not in classification:
+            classification["category"] = "FYI"
+        if classification["category"] not in ("NEEDS_REPLY", "FYI", "SKIP"):
+            classification["category"] = "FYI"
+        if "urgency" not in classification:
+            classification["urgency"] = "NORMAL"
+        if classification["urgency"] not in ("URGENT", "NORMAL", "LOW"):
+            classification["urgency"] = "NORMAL"
+        if "topic_summary" not in classification:
+            classification["topic_summary"] = subject
+        if "needs_draft" not in classification:
+            classification["needs_draft"] = False
+        if "reason" not in classification:
+            classification["reason"] = "LLM classification"
+        return classification
+
     # ------------------------------------------------------------------
     # Deduplication
     # ------------------------------------------------------------------
@@ -2280,10 +2927,7 @@ class EmailAnalyzer:
             categorized: The categorized email.
         """
         try:
-            snippet_text = categorized.snippet[:500] if categorized.snippet else None
-            # Fallback: use subject as minimal snippet to avoid NULL
-            if not snippet_text:
-                snippet_text = categorized.subject[:500] if categorized.subject else None
+            snippet_text = self._scan_log_snippet(categorized)
 
             # Check for existing entry
             existing = (
@@ -2309,13 +2953,7 @@ class EmailAnalyzer:
                 if snippet_text:
                     # Existing entry with NULL snippet — update it
                     self._db.table("email_scan_log").update(
-                        {
-                            "snippet": snippet_text,
-                            "category": categorized.category,
-                            "urgency": categorized.urgency,
-                            "needs_draft": categorized.needs_draft,
-                            "reason": categorized.reason,
-                        }
+                        self._scan_log_update(categorized, snippet_text)
                     ).eq("id", row["id"]).execute()
                     logger.info(
                         "EMAIL_ANALYZER: Updated NULL snippet for email %s",
@@ -2325,42 +2963,10 @@ class EmailAnalyzer:
 
             # No existing entry — insert new row
             self._db.table("email_scan_log").insert(
-                {
-                    "id": str(uuid.uuid4()),
-                    "user_id": user_id,
-                    "email_id": categorized.email_id,
-                    "thread_id": categorized.thread_id,
-                    "sender_email": categorized.sender_email,
-                    "sender_name": categorized.sender_name,
-                    "subject": categorized.subject[:500],
-                    "snippet": snippet_text,
-                    "category": categorized.category,
-                    "urgency": categorized.urgency,
-                    "needs_draft": categorized.needs_draft,
-                    "reason": categorized.reason,
-                    "scanned_at": datetime.now(UTC).isoformat(),
-                }
+                self._scan_log_row(user_id, categorized, snippet_text)
             ).execute()
 
-            # Route to universal memory writer
-            try:
-                from src.services.memory_writer import write_memory
-
-                await write_memory(self._db, user_id, "email_scanned", {
-                    "email_id": categorized.email_id,
-                    "sender_email": categorized.sender_email,
-                    "sender_name": categorized.sender_name,
-                    "subject": categorized.subject,
-                    "snippet": snippet_text,
-                    "category": categorized.category,
-                    "urgency": categorized.urgency,
-                    "scanned_at": datetime.now(UTC).isoformat(),
-                    "confidence": 0.7,
-                })
-            except Exception:
-                logger.exception(
-                    "EMAIL_ANALYZER: Failed to route email_scanned via memory_writer"
-                )
+            await self._route_scanned_email(user_id, categorized, snippet_text)
 
         except Exception as e:
             logger.warning(
@@ -2369,6 +2975,198 @@ class EmailAnalyzer:
                 e,
             )
 
+    async def _log_scan_decisions(
+        self,
+        user_id: str,
+        categorized_emails: list[EmailCategory],
+    ) -> None:
+        """Log a scan's decisions to email_scan_log in bulk.
+
+        Same outcome as ``_log_scan_decision`` for each email in order,
+        with one lookup and one insert per _SCAN_LOG_BATCH emails.
+
+        Args:
+            user_id: The user's ID.
+            categorized_emails: The scan's categorized emails.
+        """
+        if not categorized_emails:
+            return
+
+        try:
+            latest = await self._latest_scan_log_rows(
+                user_id, [c.email_id for c in categorized_emails]
+            )
+        except Exception as e:
+            logger.warning(
+                "EMAIL_ANALYZER: Bulk scan log lookup failed for user %s, "
+                "logging one by one: %s",
+                user_id,
+                e,
+            )
+            for categorized in categorized_emails:
+                await self._log_scan_decision(user_id, categorized)
+            return
+
+        inserts: list[tuple[EmailCategory, dict[str, Any]]] = []
+        queued_ids: set[str] = set()
+        for categorized in categorized_emails:
+            snippet_text = self._scan_log_snippet(categorized)
+            row = latest.get(categorized.email_id)
+            if row is not None:
+                if row.get("snippet"):
+                    # Already has snippet — skip to avoid duplicates
+                    logger.debug(
+                        "EMAIL_ANALYZER: Skipping duplicate scan for email %s (already has snippet)",
+                        categorized.email_id,
+                    )
+                    continue
+
+                if snippet_text:
+                    # Existing entry with NULL snippet — update it
+                    update = self._scan_log_update(categorized, snippet_text)
+                    if row["id"] in queued_ids:
+                        row.update(update)  # Same email earlier in this scan
+                    else:
+                        try:
+                            await execute_async(
+                                self._db.table("email_scan_log")
+                                .update(update)
+                                .eq("id", row["id"])
+                            )
+                        except Exception as e:
+                            logger.warning(
+                                "EMAIL_ANALYZER: Failed to log scan decision for email %s: %s",
+                                categorized.email_id,
+                                e,
+                            )
+                            continue
+                    logger.info(
+                        "EMAIL_ANALYZER: Updated NULL snippet for email %s",
+                        categorized.email_id,
+                    )
+                    continue
+
+            new_row = self._scan_log_row(user_id, categorized, snippet_text)
+            inserts.append((categorized, new_row))
+            queued_ids.add(new_row["id"])
+            latest[categorized.email_id] = new_row
+
+        for start in range(0, len(inserts), _SCAN_LOG_BATCH):
+            chunk = inserts[start : start + _SCAN_LOG_BATCH]
+            try:
+                await execute_async(
+                    self._db.table("email_scan_log").insert([row for _, row in chunk])
+                )
+                written = chunk
+            except Exception as e:
+                # Retry one by one so one bad row does not drop the others
+                logger.warning(
+                    "EMAIL_ANALYZER: Bulk scan log insert failed for user %s: %s", user_id, e
+                )
+                written = []
+                for categorized, row in chunk:
+                    try:
+                        await execute_async(self._db.table("email_scan_log").insert(row))
+                        written.append((categorized, row))
+                    except Exception as row_e:
+                        logger.warning(
+                            "EMAIL_ANALYZER: Failed to log scan decision for email %s: %s",
+                            categorized.email_id,
+                            row_e,
+                        )
+
+            for categorized, row in written:
+                await self._route_scanned_email(user_id, categorized, row["snippet"])
+
+    async def _latest_scan_log_rows(
+        self,
+        user_id: str,
+        email_ids: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Load the most recent email_scan_log row of each email ID."""
+        latest: dict[str, dict[str, Any]] = {}
+        unique_ids = list(dict.fromkeys(email_ids))
+        for i in range(0, len(unique_ids), _SCAN_LOG_BATCH):
+            result = await execute_async(
+                self._db.table("email_scan_log")
+                .select("id, email_id, snippet")
+                .eq("user_id", user_id)
+                .in_("email_id", unique_ids[i : i + _SCAN_LOG_BATCH])
+                .order("scanned_at", desc=True)
+            )
+            for row in result.data or []:
+                latest.setdefault(row["email_id"], row)
+        return latest
+
+    @staticmethod
+    def _scan_log_snippet(categorized: EmailCategory) -> str | None:
+        """Snippet stored in email_scan_log, falling back to the subject."""
+        snippet_text = categorized.snippet[:500] if categorized.snippet else None
+        # Fallback: use subject as minimal snippet to avoid NULL
+        if not snippet_text:
+            snippet_text = categorized.subject[:500] if categorized.subject else None
+        return snippet_text
+
+    @staticmethod
+    def _scan_log_update(categorized: EmailCategory, snippet_text: str) -> dict[str, Any]:
+        """Columns updated on an existing email_scan_log row with a NULL snippet."""
+        return {
+            "snippet": snippet_text,
+            "category": categorized.category,
+            "urgency": categorized.urgency,
+            "needs_draft": categorized.needs_draft,
+            "reason": categorized.reason,
+        }
+
+    @staticmethod
+    def _scan_log_row(
+        user_id: str,
+        categorized: EmailCategory,
+        snippet_text: str | None,
+    ) -> dict[str, Any]:
+        """New email_scan_log row for a categorized email."""
+        return {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "email_id": categorized.email_id,
+            "thread_id": categorized.thread_id,
+            "sender_email": categorized.sender_email,
+            "sender_name": categorized.sender_name,
+            "subject": categorized.subject[:500],
+            "snippet": snippet_text,
+            "category": categorized.category,
+            "urgency": categorized.urgency,
+            "needs_draft": categorized.needs_draft,
+            "reason": categorized.reason,
+            "scanned_at": datetime.now(UTC).isoformat(),
+        }
+
+    async def _route_scanned_email(
+        self,
+        user_id: str,
+        categorized: EmailCategory,
+        snippet_text: str | None,
+    ) -> None:
+        """Route a newly logged email to the universal memory writer."""
+        try:
+            from src.services.memory_writer import write_memory
+
+            await write_memory(self._db, user_id, "email_scanned", {
+                "email_id": categorized.email_id,
+                "sender_email": categorized.sender_email,
+                "sender_name": categorized.sender_name,
+                "subject": categorized.subject,
+                "snippet": snippet_text,
+                "category": categorized.category,
+                "urgency": categorized.urgency,
+                "scanned_at": datetime.now(UTC).isoformat(),
+                "confidence": 0.7,
+            })
+        except Exception:
+            logger.exception(
+                "EMAIL_ANALYZER: Failed to route email_scanned via memory_writer"
+            )
+
     # ------------------------------------------------------------------
     # Email field extraction helpers
     # ------------------------------------------------------------------
@@ -0,0 +1,229 @@
+"""Bounded, per-user-fair executor for periodic goal sweeps.
+
+The OODA monitoring job runs one iteration per active goal. Running them in
+a plain ``for`` loop makes the sweep take longer than its own interval once
+there are a few hundred goals; running them all at once would flood the LLM
+and the database. ``GoalSweepExecutor`` sits in between:
+
+- A global semaphore caps how many goals run at once.
+- A per-user semaphore caps how many of those slots one user can hold, so a
+  user with 40 goals cannot starve everyone else. Goals are also dispatched
+  round-robin across users, so every user gets their first goal started
+  before anyone gets their second.
+- Goals whose previous iteration is still running (from an earlier sweep
+  that overran, or a concurrent trigger) are skipped rather than stacked.
+- A sweep deadline stops new goals from starting and cancels the ones
+  still running, so a sweep never overlaps the next scheduled one.
+- Every goal's outcome and wall-clock time is recorded in a ``SweepReport``.
+
+Usage:
+    executor = GoalSweepExecutor(max_concurrency=8, per_user_concurrency=2)
+    report = await executor.run(goals, run_one_goal)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Goal IDs with an iteration in progress, shared by every executor in the
+# process so overlapping sweeps never run the same goal twice.
+_in_flight: set[str] = set()
+
+# Outcome labels for GoalRunResult.status
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+STATUS_SKIPPED_RUNNING = "skipped_running"
+STATUS_SKIPPED_DEADLINE = "skipped_deadline"
+
+
+@dataclass
+class GoalRunResult:
+    """Outcome of one goal within a sweep."""
+
+    goal_id: str
+    user_id: str
+    status: str
+    duration_ms: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class SweepReport:
+    """Summary of a full sweep, with per-goal timing."""
+
+    results: list[GoalRunResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    deadline_hit: bool = False
+
+    def count(self, status: str) -> int:
+        """Number of goals that ended with the given status."""
+        return sum(1 for r in self.results if r.status == status)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for logging and admin endpoints.
+
+        Returns:
+            Dict with status counts, latency figures, and per-goal timings.
+        """
+        ran = sorted(
+            r.duration_ms for r in self.results if r.status in (STATUS_OK, STATUS_FAILED)
+        )
+        return {
+            "goals": len(self.results),
+            "ok": self.count(STATUS_OK),
+            "failed": self.count(STATUS_FAILED),
+            "cancelled": self.count(STATUS_CANCELLED),
+            "skipped_running": self.count(STATUS_SKIPPED_RUNNING),
+            "skipped_deadline": self.count(STATUS_SKIPPED_DEADLINE),
+            "deadline_hit": self.deadline_hit,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "p50_goal_ms": round(ran[len(ran) // 2], 1) if ran else 0.0,
+            "max_goal_ms": round(ran[-1], 1) if ran else 0.0,
+            "per_goal": [
+                {
+                    "goal_id": r.goal_id,
+                    "user_id": r.user_id,
+                    "status": r.status,
+                    "duration_ms": round(r.duration_ms, 1),
+                }
+                for r in self.results
+            ],
+        }
+
+
+def interleave_by_user(goals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Order goals round-robin across users, preserving each user's own order.
+
+    Args:
+        goals: Goal rows with ``user_id`` keys.
+
+    Returns:
+        The same goals, reordered so consecutive goals belong to different
+        users wherever possible.
+    """
+    queues: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+    for goal in goals:
+        queues.setdefault(goal.get("user_id", ""), []).append(goal)
+
+    ordered: list[dict[str, Any]] = []
+    depth = 0
+    while len(ordered) < len(goals):
+        for user_goals in queues.values():
+            if depth < len(user_goals):
+                ordered.append(user_goals[depth])
+        depth += 1
+    return ordered
+
+
+class GoalSweepExecutor:
+    """Run one coroutine per goal with global and per-user concurrency caps."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        per_user_concurrency: int = 2,
+        deadline_seconds: float | None = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Args:
+            max_concurrency: Maximum goals running at once across all users.
+            per_user_concurrency: Maximum goals running at once for one user.
+            deadline_seconds: Wall-clock budget for the whole sweep. Goals
+                not yet started are skipped and running ones cancelled when
+                it expires. ``None`` means no deadline.
+        """
+        self._max_concurrency = max(1, max_concurrency)
+        self._per_user_concurrency = max(1, per_user_concurrency)
+        self._deadline_seconds = deadline_seconds
+
+    async def run(
+        self,
+        goals: list[dict[str, Any]],
+        worker: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> SweepReport:
+        """Run ``worker(goal)`` for every goal under the configured limits.
+
+        Worker exceptions are caught and recorded per goal; they never abort
+        the sweep.
+
+        Args:
+            goals: Goal rows with ``id`` and ``user_id`` keys.
+            worker: Coroutine function that processes a single goal.
+
+        Returns:
+            SweepReport with one GoalRunResult per input goal.
+        """
+        start = time.perf_counter()
+        report = SweepReport()
+        global_slots = asyncio.Semaphore(self._max_concurrency)
+        user_slots: dict[str, asyncio.Semaphore] = {}
+
+        async def run_one(goal: dict[str, Any], result: GoalRunResult) -> None:
+            user_sem = user_slots.setdefault(
+                result.user_id, asyncio.Semaphore(self._per_user_concurrency)
+            )
+            # Take the per-user slot first so a user's surplus goals queue
+            # behind each other instead of occupying global slots.
+            async with user_sem, global_slots:
+                goal_start = time.perf_counter()
+                try:
+                    await worker(goal)
+                    result.status = STATUS_OK
+                except asyncio.CancelledError:
+                    result.status = STATUS_CANCELLED
+                    raise
+                except Exception as exc:
+                    result.status = STATUS_FAILED
+                    result.error = str(exc)
+                    logger.warning(
+                        "Goal sweep worker failed for goal %s",
+                        result.goal_id,
+                        exc_info=True,
+                    )
+                finally:
+                    result.duration_ms = (time.perf_counter() - goal_start) * 1000.0
+                    _in_flight.discard(result.goal_id)
+
+        tasks: list[asyncio.Task[None]] = []
+        for goal in interleave_by_user(goals):
+            goal_id = str(goal.get("id", ""))
+            result = GoalRunResult(
+                goal_id=goal_id,
+                user_id=str(goal.get("user_id", "")),
+                status=STATUS_SKIPPED_DEADLINE,
+            )
+            report.results.append(result)
+            if goal_id in _in_flight:
+                result.status = STATUS_SKIPPED_RUNNING
+                continue
+            _in_flight.add(goal_id)
+            task = asyncio.create_task(run_one(goal, result))
+            # Release goals that are cancelled before they ever start.
+            task.add_done_callback(lambda _t, gid=goal_id: _in_flight.discard(gid))
+            tasks.append(task)
+
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self._deadline_seconds)
+            if pending:
+                report.deadline_hit = True
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        report.elapsed_ms = (time.perf_counter() - start) * 1000.0
+        if report.deadline_hit:
+            logger.warning(
+                "Goal sweep hit %.0fs deadline: %d cancelled, %d not started",
+                self._deadline_seconds,
+                report.count(STATUS_CANCELLED),
+                report.count(STATUS_SKIPPED_DEADLINE),
+            )
+        return report
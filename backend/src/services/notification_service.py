@@ -2,13 +2,23 @@
 
 This service handles creating, retrieving, and managing user notifications.
 It also handles sending email notifications when user preferences allow.
+
+New notifications and unread count changes are pushed to the user's open
+WebSocket connections. Unread counts are kept per worker in
+``UnreadCounter``: seeded once with a head-only count query, then moved
+on create / mark-read / delete, so badge refreshes don't touch the DB.
+Every change is announced over the ``ClusterBus`` so the other workers
+drop their copy and reseed on the next read.
 """
 
 import logging
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.core.exceptions import DatabaseError, NotFoundError
+from src.core.ws import ws_manager
 from src.db.supabase import SupabaseClient
 from src.models.notification import (
     NotificationListResponse,
@@ -17,8 +27,142 @@ from src.models.notification import (
     UnreadCountResponse,
 )
 
+if TYPE_CHECKING:
+    from src.core.cluster import ClusterBus
+
 logger = logging.getLogger(__name__)
 
+# ClusterBus channel announcing that a user's unread count changed
+_UNREAD_CHANNEL = "notifications.unread"
+
+
+class UnreadCounter:
+    """Per-user unread notification counts for this worker.
+
+    Entries are seeded from the DB and then adjusted in place. With a
+    cluster attached, every local change tells the other workers to drop
+    their entry for that user. ``ttl_seconds`` is the backstop for relay
+    messages that never arrive. At most ``max_users`` entries are kept (LRU).
+    """
+
+    def __init__(self, ttl_seconds: float, max_users: int) -> None:
+        """Initialize an empty counter.
+
+        Args:
+            ttl_seconds: Reseed an entry from the DB after this long.
+            max_users: Maximum number of users with a cached count.
+        """
+        self._ttl = ttl_seconds
+        self._max_users = max_users
+        self._counts: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._cluster: ClusterBus | None = None
+
+    def get(self, user_id: str) -> int | None:
+        """Return the cached count, or None if missing or expired."""
+        entry = self._counts.get(user_id)
+        if entry is None:
+            return None
+        count, seeded_at = entry
+        if time.monotonic() - seeded_at > self._ttl:
+            del self._counts[user_id]
+            return None
+        self._counts.move_to_end(user_id)
+        return count
+
+    def seed(self, user_id: str, count: int) -> None:
+        """Store a count freshly read from the DB."""
+        self._counts[user_id] = (max(count, 0), time.monotonic())
+        self._counts.move_to_end(user_id)
+        while len(self._counts) > self._max_users:
+            self._counts.popitem(last=False)
+
+    def adjust(self, user_id: str, delta: int) -> int | None:
+        """Move a cached count by ``delta``.
+
+        Returns:
+            The new count, or None if the user has no cached count (the
+            next read seeds it from the DB, which already includes the change).
+        """
+        self._announce(user_id)
+        if self.get(user_id) is None:
+            return None
+        count, seeded_at = self._counts[user_id]
+        count = max(count + delta, 0)
+        self._counts[user_id] = (count, seeded_at)
+        return count
+
+    def reset(self, user_id: str, count: int) -> None:
+        """Store a count a write has just made known (e.g. mark-all-read)."""
+        self._announce(user_id)
+        self.seed(user_id, count)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached count."""
+        self._announce(user_id)
+        self._counts.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached count."""
+        self._counts.clear()
+
+    def attach_cluster(self, cluster: "ClusterBus") -> None:
+        """Exchange count changes with the other workers.
+
+        Args:
+            cluster: The worker's ClusterBus.
+        """
+        if self._cluster is not None:
+            return
+        self._cluster = cluster
+        cluster.subscribe(_UNREAD_CHANNEL, self._on_remote_change)
+
+    def detach_cluster(self) -> None:
+        """Stop exchanging count changes."""
+        if self._cluster is not None:
+            self._cluster.unsubscribe(_UNREAD_CHANNEL, self._on_remote_change)
+            self._cluster = None
+
+    def _announce(self, user_id: str) -> None:
+        if self._cluster is not None:
+            self._cluster.publish(_UNREAD_CHANNEL, {"user_id": user_id})
+
+    async def _on_remote_change(self, payload: dict[str, Any], _origin: str) -> None:
+        user_id = payload.get("user_id")
+        if isinstance(user_id, str):
+            self._counts.pop(user_id, None)
+
+
+_unread_counter: UnreadCounter | None = None
+
+
+def get_unread_counter() -> UnreadCounter:
+    """Get or create the worker's unread notification counter.
+
+    Returns:
+        The process-wide UnreadCounter instance.
+    """
+    global _unread_counter
+    if _unread_counter is None:
+        from src.core.config import settings
+
+        _unread_counter = UnreadCounter(
+            ttl_seconds=settings.NOTIFICATION_UNREAD_TTL_SECONDS,
+            max_users=settings.NOTIFICATION_UNREAD_MAX_USERS,
+        )
+    return _unread_counter
+
+
+def _count_unread(client: Any, user_id: str) -> int:
+    """Count a user's unread notifications without fetching any rows."""
+    response = (
+        client.table("notifications")
+        .select("id", count="exact", head=True)
+        .eq("user_id", user_id)
+        .is_("read_at", "null")
+        .execute()
+    )
+    return response.count or 0
+
 
 class NotificationService:
     """Service for managing user notifications."""
@@ -68,7 +212,10 @@ class NotificationService:
                         "notification_id": response.data[0]["id"],
                     },
                 )
-                return NotificationResponse(**response.data[0])
+                notification = NotificationResponse(**response.data[0])
+                unread_count = get_unread_counter().adjust(user_id, 1)
+                await NotificationService._publish_notification(notification, unread_count)
+                return notification
             raise DatabaseError("Failed to create notification")
         except DatabaseError:
             raise
@@ -109,15 +256,11 @@ class NotificationService:
             query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
             response = query.execute()
 
-            # Get unread count
-            count_response = (
-                client.table("notifications")
-                .select("*", count="exact")
-                .eq("user_id", user_id)
-                .is_("read_at", "null")
-                .execute()
-            )
-            unread_count = count_response.count or 0
+            counter = get_unread_counter()
+            unread_count = counter.get(user_id)
+            if unread_count is None:
+                unread_count = _count_unread(client, user_id)
+                counter.seed(user_id, unread_count)
 
             notifications = [NotificationResponse(**item) for item in response.data or []]
 
@@ -134,6 +277,9 @@ class NotificationService:
     async def get_unread_count(user_id: str) -> UnreadCountResponse:
         """Get the count of unread notifications for a user.
 
+        Served from the worker's ``UnreadCounter``; only a missing or
+        expired entry runs a (head-only) count query.
+
         Args:
             user_id: The user's UUID.
 
@@ -143,16 +289,14 @@ class NotificationService:
         Raises:
             DatabaseError: If query fails.
         """
+        counter = get_unread_counter()
+        count = counter.get(user_id)
+        if count is not None:
+            return UnreadCountResponse(count=count)
         try:
-            client = SupabaseClient.get_client()
-            response = (
-                client.table("notifications")
-                .select("*", count="exact")
-                .eq("user_id", user_id)
-                .is_("read_at", "null")
-                .execute()
-            )
-            return UnreadCountResponse(count=response.count or 0)
+            count = _count_unread(SupabaseClient.get_client(), user_id)
+            counter.seed(user_id, count)
+            return UnreadCountResponse(count=count)
         except Exception as e:
             logger.exception("Error fetching unread count", extra={"user_id": user_id})
             raise DatabaseError(f"Failed to fetch unread count: {e}") from e
@@ -182,6 +326,10 @@ class NotificationService:
                 .execute()
             )
             if response.data and len(response.data) > 0:
+                # The update doesn't say whether the row was unread before,
+                # so reseed rather than guess.
+                get_unread_counter().invalidate(user_id)
+                await NotificationService._publish_unread_count(user_id)
                 return NotificationResponse(**response.data[0])
             raise NotFoundError("Notification", notification_id)
         except NotFoundError:
@@ -218,6 +366,8 @@ class NotificationService:
             logger.info(
                 "Marked all notifications as read", extra={"user_id": user_id, "count": count}
             )
+            get_unread_counter().reset(user_id, 0)
+            await NotificationService._publish_unread_count(user_id)
             return count
         except Exception as e:
             logger.exception("Error marking all as read", extra={"user_id": user_id})
@@ -250,6 +400,9 @@ class NotificationService:
                 "Notification deleted",
                 extra={"notification_id": notification_id, "user_id": user_id},
             )
+            if response.data[0].get("read_at") is None:
+                get_unread_counter().adjust(user_id, -1)
+                await NotificationService._publish_unread_count(user_id)
         except NotFoundError:
             raise
         except Exception as e:
@@ -257,3 +410,38 @@ class NotificationService:
                 "Error deleting notification", extra={"notification_id": notification_id}
             )
             raise DatabaseError(f"Failed to delete notification: {e}") from e
+
+    @staticmethod
+    async def _publish_notification(
+        notification: NotificationResponse, unread_count: int | None
+    ) -> None:
+        """Push a new notification to the user's open WebSocket connections.
+
+        Best-effort: clients that miss it pick it up on their next fetch.
+        """
+        if not ws_manager.is_connected(notification.user_id):
+            return
+        try:
+            if unread_count is None:
+                unread_count = (
+                    await NotificationService.get_unread_count(notification.user_id)
+                ).count
+            await ws_manager.send_notification(
+                notification.user_id, notification.model_dump(mode="json"), unread_count
+            )
+        except Exception:
+            logger.warning(
+                "Failed to push notification over WebSocket",
+                extra={"user_id": notification.user_id, "notification_id": notification.id},
+            )
+
+    @staticmethod
+    async def _publish_unread_count(user_id: str) -> None:
+        """Push the user's current unread count to their open WebSocket connections."""
+        if not ws_manager.is_connected(user_id):
+            return
+        try:
+            count = (await NotificationService.get_unread_count(user_id)).count
+            await ws_manager.send_unread_count(user_id, count)
+        except Exception:
+            logger.warning("Failed to push unread count over WebSocket", extra={"user_id": user_id})
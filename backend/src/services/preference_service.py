@@ -11,7 +11,7 @@ import logging
 from datetime import UTC, datetime
 from typing import Any, cast
 
-from src.core.cache import cached, invalidate_cache
+from src.core.cache import cached, invalidate_cache, user_method_tags
 from src.db.supabase import SupabaseClient
 from src.models.preferences import PreferenceUpdate
 
@@ -31,7 +31,7 @@ class PreferenceService:
         user_id = args[1] if len(args) > 1 else kwargs.get("user_id", "")
         return f"preferences:{user_id}"
 
-    @cached(ttl=300, key_func=_preference_cache_key)  # 5 minute TTL
+    @cached(ttl=300, key_func=_preference_cache_key, tags=user_method_tags)  # 5 minute TTL
     async def get_preferences(self, user_id: str) -> dict[str, Any]:
         """Get user preferences, creating defaults if not found.
 
@@ -110,7 +110,7 @@ class PreferenceService:
         )
 
         # Invalidate the cache for this user's preferences
-        invalidate_cache("get_preferences", key=user_id)
+        invalidate_cache("get_preferences", key=f"preferences:{user_id}")
 
         logger.info(
             "Preferences updated",
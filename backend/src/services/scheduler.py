@@ -187,16 +187,23 @@ async def _run_ooda_goal_checks() -> None:
     Queries all goals with status='active', creates an OODALoop for each,
     and runs one monitoring iteration. If the OODA decides 'complete',
     triggers goal completion with retrospective.
+
+    Goals run through GoalSweepExecutor: concurrently up to
+    OODA_SWEEP_MAX_CONCURRENCY, at most OODA_SWEEP_PER_USER_CONCURRENCY per
+    user, and within OODA_SWEEP_DEADLINE_SECONDS so a sweep never overlaps
+    the next one. Shared services are built once per sweep.
     """
     try:
+        from src.core.config import settings
         from src.core.llm import LLMClient
         from src.core.ooda import OODAConfig, OODALoop, OODAState
         from src.core.ws import ws_manager
-        from src.db.supabase import SupabaseClient
+        from src.db.supabase import SupabaseClient, execute_async
         from src.memory.episodic import EpisodicMemory
         from src.memory.semantic import SemanticMemory
         from src.memory.working import WorkingMemory
         from src.services.goal_execution import GoalExecutionService
+        from src.services.goal_sweep import GoalSweepExecutor
 
         db = SupabaseClient.get_client()
 
@@ -249,146 +256,150 @@ async def _run_ooda_goal_checks() -> None:
 
         cost_governor = None
         try:
-            from src.core.cost_governor import CostGovernor
+            from src.core.llm import get_cost_governor
 
-            cost_governor = CostGovernor()
+            # Shared governor so OODA budget checks hit the in-memory ledger
+            cost_governor = get_cost_governor()
         except Exception:
             logger.warning("CostGovernor unavailable for scheduler OODA checks")
 
-        for goal in goals:
+        # Memory services are stateless and shared across goals
+        episodic = EpisodicMemory()
+        semantic = SemanticMemory()
+
+        # Create agent executor callback to bridge OODA → GoalExecutionService
+        # OODALoop.act() calls: agent_executor(action=, agent=, parameters=, goal=,
+        #   capability_token=, approval_level=)
+        def _make_executor(uid: str):  # noqa: E301
+            async def _executor(
+                action: str,
+                agent: str,
+                parameters: dict,
+                goal: dict,
+                **kwargs: Any,  # absorbs capability_token, approval_level
+            ) -> dict:
+                try:
+                    result = await execution_service._execute_agent(
+                        user_id=uid,
+                        goal=goal,
+                        agent_type=agent or "analyst",
+                        context={"action": action, **parameters},
+                    )
+                    return (
+                        result
+                        if isinstance(result, dict)
+                        else {"success": True, "result": result}
+                    )
+                except Exception as exc:
+                    logger.error(
+                        "Agent executor failed",
+                        extra={
+                            "user_id": uid,
+                            "agent": agent,
+                            "action": action,
+                            "error": str(exc),
+                        },
+                        exc_info=True,
+                    )
+                    return {"success": False, "error": str(exc)}
+
+            return _executor
+
+        async def _check_goal(goal: dict[str, Any]) -> None:
+            user_id = goal["user_id"]
+            goal_id = goal["id"]
+
+            # Working memory is per goal; episodic/semantic are shared
+            working = WorkingMemory(
+                conversation_id=f"ooda-{goal_id}",
+                user_id=user_id,
+            )
+
+            agent_executor = _make_executor(user_id)
+
+            # Create OODA loop with single-iteration config
+            ooda_config = OODAConfig(max_iterations=1)
+            ooda = OODALoop(
+                llm_client=llm,
+                episodic_memory=episodic,
+                semantic_memory=semantic,
+                working_memory=working,
+                config=ooda_config,
+                agent_executor=agent_executor,
+                ooda_logger=ooda_logger,
+                user_id=user_id,
+                persona_builder=persona_builder,
+                trust_service=trust_service,
+                dct_minter=dct_minter,
+                cost_governor=cost_governor,
+            )
+
+            state = OODAState(goal_id=goal_id)
+            state = await ooda.run_single_iteration(state, goal)
+
+            decision_action = state.decision.get("action") if state.decision else None
+
+            # Emit WebSocket progress event after OODA iteration
             try:
-                user_id = goal["user_id"]
-                goal_id = goal["id"]
-
-                # Create memory services for this user
-                episodic = EpisodicMemory()
-                semantic = SemanticMemory()
-                working = WorkingMemory(
-                    conversation_id=f"ooda-{goal_id}",
-                    user_id=user_id,
+                agent_name = (
+                    state.decision.get("agent") if state.decision else None
                 )
-
-                # Create agent executor callback to bridge OODA → GoalExecutionService
-                # OODALoop.act() calls: agent_executor(action=, agent=, parameters=, goal=,
-                #   capability_token=, approval_level=)
-                def _make_executor(uid: str):  # noqa: E301
-                    async def _executor(
-                        action: str,
-                        agent: str,
-                        parameters: dict,
-                        goal: dict,
-                        **kwargs: Any,  # absorbs capability_token, approval_level
-                    ) -> dict:
-                        try:
-                            result = await execution_service._execute_agent(
-                                user_id=uid,
-                                goal=goal,
-                                agent_type=agent or "analyst",
-                                context={"action": action, **parameters},
-                            )
-                            return (
-                                result
-                                if isinstance(result, dict)
-                                else {"success": True, "result": result}
-                            )
-                        except Exception as exc:
-                            logger.error(
-                                "Agent executor failed",
-                                extra={
-                                    "user_id": uid,
-                                    "agent": agent,
-                                    "action": action,
-                                    "error": str(exc),
-                                },
-                                exc_info=True,
-                            )
-                            return {"success": False, "error": str(exc)}
-
-                    return _executor
-
-                agent_executor = _make_executor(user_id)
-
-                # Create OODA loop with single-iteration config
-                ooda_config = OODAConfig(max_iterations=1)
-                ooda = OODALoop(
-                    llm_client=llm,
-                    episodic_memory=episodic,
-                    semantic_memory=semantic,
-                    working_memory=working,
-                    config=ooda_config,
-                    agent_executor=agent_executor,
-                    ooda_logger=ooda_logger,
+                await ws_manager.send_progress_update(
                     user_id=user_id,
-                    persona_builder=persona_builder,
-                    trust_service=trust_service,
-                    dct_minter=dct_minter,
-                    cost_governor=cost_governor,
+                    goal_id=goal_id,
+                    progress=goal.get("progress", 0),
+                    status="active",
+                    agent_name=agent_name,
+                    message=f"OODA iteration complete for: {goal.get('title', '')}",
                 )
+            except Exception:
+                pass  # User may not be connected
 
-                state = OODAState(goal_id=goal_id)
-                state = await ooda.run_single_iteration(state, goal)
-
-                decision_action = state.decision.get("action") if state.decision else None
+            if state.is_complete or decision_action == "complete":
+                await execution_service.complete_goal_with_retro(goal_id, user_id)
+                logger.info(
+                    "OODA decided goal complete",
+                    extra={"goal_id": goal_id},
+                )
 
-                # Emit WebSocket progress event after OODA iteration
+                # Emit WebSocket completion event
                 try:
-                    agent_name = (
-                        state.decision.get("agent") if state.decision else None
-                    )
-                    await ws_manager.send_progress_update(
+                    await ws_manager.send_execution_complete(
                         user_id=user_id,
                         goal_id=goal_id,
-                        progress=goal.get("progress", 0),
-                        status="active",
-                        agent_name=agent_name,
-                        message=f"OODA iteration complete for: {goal.get('title', '')}",
+                        title=goal.get("title", ""),
+                        success=True,
+                        steps_completed=1,
+                        steps_total=1,
+                        summary=f"Goal '{goal.get('title', '')}' completed",
                     )
                 except Exception:
                     pass  # User may not be connected
 
-                if state.is_complete or decision_action == "complete":
-                    await execution_service.complete_goal_with_retro(goal_id, user_id)
-                    logger.info(
-                        "OODA decided goal complete",
-                        extra={"goal_id": goal_id},
-                    )
-
-                    # Emit WebSocket completion event
-                    try:
-                        await ws_manager.send_execution_complete(
-                            user_id=user_id,
-                            goal_id=goal_id,
-                            title=goal.get("title", ""),
-                            success=True,
-                            steps_completed=1,
-                            steps_total=1,
-                            summary=f"Goal '{goal.get('title', '')}' completed",
-                        )
-                    except Exception:
-                        pass  # User may not be connected
-
-                    # Route OODA completion signal through Pulse Engine
-                    try:
-                        from src.services.intelligence_pulse import get_pulse_engine
+                # Route OODA completion signal through Pulse Engine
+                try:
+                    from src.services.intelligence_pulse import get_pulse_engine
 
-                        pulse_engine = get_pulse_engine()
-                        await pulse_engine.process_signal(
-                            user_id=user_id,
-                            signal={
-                                "source": "ooda",
-                                "title": f"Goal completed: {goal.get('title', '')}",
-                                "content": f"OODA loop determined goal '{goal.get('title', '')}' is complete",
-                                "signal_category": "goal",
-                                "pulse_type": "intelligent",
-                                "related_goal_id": goal_id,
-                                "raw_data": {"goal_id": goal_id, "action": "complete"},
-                            },
-                        )
-                    except Exception:
-                        logger.debug("Pulse engine failed for OODA completion signal")
+                    pulse_engine = get_pulse_engine()
+                    await pulse_engine.process_signal(
+                        user_id=user_id,
+                        signal={
+                            "source": "ooda",
+                            "title": f"Goal completed: {goal.get('title', '')}",
+                            "content": f"OODA loop determined goal '{goal.get('title', '')}' is complete",
+                            "signal_category": "goal",
+                            "pulse_type": "intelligent",
+                            "related_goal_id": goal_id,
+                            "raw_data": {"goal_id": goal_id, "action": "complete"},
+                        },
+                    )
+                except Exception:
+                    logger.debug("Pulse engine failed for OODA completion signal")
 
-                elif state.is_blocked:
-                    db.table("goals").update(
+            elif state.is_blocked:
+                await execute_async(
+                    db.table("goals")
+                    .update(
                         {
                             "config": {
                                 **goal.get("config", {}),
@@ -396,53 +407,69 @@ async def _run_ooda_goal_checks() -> None:
                                 "blocked_reason": state.blocked_reason,
                             }
                         }
-                    ).eq("id", goal_id).execute()
-                    logger.warning(
-                        "OODA detected blocked goal",
-                        extra={
-                            "goal_id": goal_id,
-                            "reason": state.blocked_reason,
-                        },
                     )
+                    .eq("id", goal_id)
+                )
+                logger.warning(
+                    "OODA detected blocked goal",
+                    extra={
+                        "goal_id": goal_id,
+                        "reason": state.blocked_reason,
+                    },
+                )
 
-                    # Emit WebSocket blocked event
-                    try:
-                        await ws_manager.send_progress_update(
-                            user_id=user_id,
-                            goal_id=goal_id,
-                            progress=goal.get("progress", 0),
-                            status="blocked",
-                            message=f"Blocked: {state.blocked_reason or 'Unknown reason'}",
-                        )
-                    except Exception:
-                        pass  # User may not be connected
+                # Emit WebSocket blocked event
+                try:
+                    await ws_manager.send_progress_update(
+                        user_id=user_id,
+                        goal_id=goal_id,
+                        progress=goal.get("progress", 0),
+                        status="blocked",
+                        message=f"Blocked: {state.blocked_reason or 'Unknown reason'}",
+                    )
+                except Exception:
+                    pass  # User may not be connected
 
-                    # Route OODA blocked signal through Pulse Engine
-                    try:
-                        from src.services.intelligence_pulse import get_pulse_engine
+                # Route OODA blocked signal through Pulse Engine
+                try:
+                    from src.services.intelligence_pulse import get_pulse_engine
 
-                        pulse_engine = get_pulse_engine()
-                        await pulse_engine.process_signal(
-                            user_id=user_id,
-                            signal={
-                                "source": "ooda",
-                                "title": f"Goal blocked: {goal.get('title', '')}",
-                                "content": f"Blocked reason: {state.blocked_reason or 'Unknown'}",
-                                "signal_category": "goal",
-                                "pulse_type": "intelligent",
-                                "related_goal_id": goal_id,
-                                "raw_data": {"goal_id": goal_id, "action": "blocked", "reason": state.blocked_reason},
-                            },
-                        )
-                    except Exception:
-                        logger.debug("Pulse engine failed for OODA blocked signal")
+                    pulse_engine = get_pulse_engine()
+                    await pulse_engine.process_signal(
+                        user_id=user_id,
+                        signal={
+                            "source": "ooda",
+                            "title": f"Goal blocked: {goal.get('title', '')}",
+                            "content": f"Blocked reason: {state.blocked_reason or 'Unknown'}",
+                            "signal_category": "goal",
+                            "pulse_type": "intelligent",
+                            "related_goal_id": goal_id,
+                            "raw_data": {"goal_id": goal_id, "action": "blocked", "reason": state.blocked_reason},
+                        },
+                    )
+                except Exception:
+                    logger.debug("Pulse engine failed for OODA blocked signal")
 
-            except Exception:
-                logger.warning(
-                    "OODA goal check failed for goal %s",
-                    goal.get("id"),
-                    exc_info=True,
-                )
+        sweep = GoalSweepExecutor(
+            max_concurrency=settings.OODA_SWEEP_MAX_CONCURRENCY,
+            per_user_concurrency=settings.OODA_SWEEP_PER_USER_CONCURRENCY,
+            deadline_seconds=settings.OODA_SWEEP_DEADLINE_SECONDS,
+        )
+        report = await sweep.run(goals, _check_goal)
+        summary = report.to_dict()
+        logger.info(
+            "OODA goal check finished in %.0fms: %d ok, %d failed, %d skipped (running), "
+            "%d cancelled, %d skipped (deadline); p50 %.0fms, max %.0fms",
+            summary["elapsed_ms"],
+            summary["ok"],
+            summary["failed"],
+            summary["skipped_running"],
+            summary["cancelled"],
+            summary["skipped_deadline"],
+            summary["p50_goal_ms"],
+            summary["max_goal_ms"],
+            extra={"ooda_sweep": summary},
+        )
 
     except Exception:
         logger.exception("OODA goal checks scheduler run failed")
@@ -549,7 +576,11 @@ async def _run_working_memory_sync() -> None:
         manager = WorkingMemoryManager()
         count = await manager.persist_all_sessions()
         if count > 0:
-            logger.info("Working memory sync: persisted %d sessions", count)
+            logger.info(
+                "Working memory sync: persisted %d sessions",
+                count,
+                extra=manager.stats(),
+            )
     except Exception:
         logger.exception("Working memory sync failed")
 
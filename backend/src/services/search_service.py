@@ -4,17 +4,56 @@ This service handles:
 - Global search across all memory types (leads, goals, conversations, documents, etc.)
 - Recent items tracking and retrieval
 - Recording item access for quick re-access
+
+Global search reads the ``search_index`` table, which triggers on the
+source tables keep up to date. The table is queried through the
+``search_items`` RPC, one call per type, and the calls run concurrently.
+That RPC does prefix matching for as-you-type queries and trigram typo
+tolerance, and ranks by relevance and recency together (see migration
+20260316000004_search_index.sql). If the index is not available, the
+service falls back to the legacy per-table ILIKE scans.
 """
 
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from src.db.supabase import SupabaseClient
+from src.db.supabase import SupabaseClient, execute_async
 
 logger = logging.getLogger(__name__)
 
+# Search type (API filter name) -> search_index item_type
+_INDEX_TYPES: dict[str, str] = {
+    "memory_semantic": "memory",
+    "leads": "lead",
+    "goals": "goal",
+    "conversations": "conversation",
+    "documents": "document",
+    "briefings": "briefing",
+}
+
+_URL_PREFIXES: dict[str, str] = {
+    "memory": "/memory",
+    "lead": "/leads",
+    "goal": "/goals",
+    "conversation": "/chat",
+    "document": "/documents",
+    "briefing": "/briefings",
+}
+
+# After the index RPC fails (e.g. migration not applied yet), use the
+# ILIKE fallback for this long before trying the index again
+_INDEX_RETRY_SECONDS = 300.0
+_index_unavailable_until = 0.0
+
+
+def _truncate(text: str | None, length: int) -> str:
+    text = text or ""
+    return text[:length] + "..." if len(text) > length else text
+
 
 @dataclass
 class SearchResult:
@@ -94,7 +133,7 @@ class SearchService:
             limit: Maximum results per type.
 
         Returns:
-            List of SearchResult objects, ranked by relevance.
+            List of SearchResult objects, ranked by relevance and recency.
         """
         if not query or not query.strip():
             return []
@@ -104,45 +143,17 @@ class SearchService:
             extra={"user_id": user_id, "query": query, "types": types},
         )
 
-        results: list[SearchResult] = []
-        search_types = types or [
-            "memory_semantic",
-            "leads",
-            "goals",
-            "conversations",
-            "documents",
-            "briefings",
-        ]
-
-        # Search semantic memory (facts)
-        if "memory_semantic" in search_types:
-            semantic_results = await self._search_semantic_memory(user_id, query, limit)
-            results.extend(semantic_results)
-
-        # Search lead memories
-        if "leads" in search_types:
-            lead_results = await self._search_leads(user_id, query, limit)
-            results.extend(lead_results)
-
-        # Search goals
-        if "goals" in search_types:
-            goal_results = await self._search_goals(user_id, query, limit)
-            results.extend(goal_results)
-
-        # Search conversations
-        if "conversations" in search_types:
-            conversation_results = await self._search_conversations(user_id, query, limit)
-            results.extend(conversation_results)
-
-        # Search company documents
-        if "documents" in search_types:
-            document_results = await self._search_documents(user_id, query, limit)
-            results.extend(document_results)
-
-        # Search daily briefings
-        if "briefings" in search_types:
-            briefing_results = await self._search_briefings(user_id, query, limit)
-            results.extend(briefing_results)
+        search_types = [t for t in (types or list(_INDEX_TYPES)) if t in _INDEX_TYPES]
+
+        per_type = await self._search_index(user_id, query, search_types, limit)
+        if per_type is None:
+            per_type = await asyncio.gather(
+                *(
+                    self._search_legacy(search_type, user_id, query, limit)
+                    for search_type in search_types
+                )
+            )
+        results = [result for type_results in per_type for result in type_results]
 
         # Sort by score descending and deduplicate
         seen_ids: set[tuple[str, str]] = set()
@@ -161,17 +172,107 @@ class SearchService:
 
         return unique_results[:limit]
 
+    async def _search_index(
+        self, user_id: str, query: str, search_types: list[str], limit: int
+    ) -> list[list[SearchResult]] | None:
+        """Query the full-text index for each type concurrently.
+
+        Returns:
+            One result list per type, or None if the index is unavailable
+            and the caller should fall back to the ILIKE scans.
+        """
+        global _index_unavailable_until
+        if time.monotonic() < _index_unavailable_until:
+            return None
+
+        async def search_type(search_type: str) -> list[SearchResult]:
+            result = await execute_async(
+                self._db.rpc(
+                    "search_items",
+                    {
+                        "p_user_id": user_id,
+                        "p_query": query,
+                        "p_item_type": _INDEX_TYPES[search_type],
+                        "p_limit": limit,
+                    },
+                )
+            )
+            if not isinstance(result.data, list):
+                raise TypeError(f"unexpected search_items response: {type(result.data).__name__}")
+            return [self._index_row_to_result(row) for row in result.data]
+
+        try:
+            return list(await asyncio.gather(*(search_type(t) for t in search_types)))
+        except Exception as e:
+            _index_unavailable_until = time.monotonic() + _INDEX_RETRY_SECONDS
+            logger.warning(
+                "Search index unavailable, falling back to ILIKE scans",
+                extra={"error": str(e)},
+            )
+            return None
+
+    @staticmethod
+    def _index_row_to_result(row: dict[str, Any]) -> SearchResult:
+        """Format a ``search_items`` row like the per-type results."""
+        item_type = row["item_type"]
+        item_id = str(row["item_id"])
+        metadata = row.get("metadata") or {}
+        title = row.get("title") or ""
+        body = row.get("body") or ""
+
+        if item_type == "memory":
+            title, snippet = "Memory", _truncate(body, 200)
+        elif item_type == "lead":
+            snippet = (
+                f"Stage: {metadata.get('stage') or 'unknown'} | "
+                f"Health: {metadata.get('health_score') or 0}/100"
+            )
+        elif item_type == "document":
+            file_type = str(metadata.get("file_type") or "unknown").upper()
+            quality = float(metadata.get("quality_score") or 0)
+            snippet = f"{file_type} document | Quality: {quality:.0%}"
+        elif item_type == "goal":
+            snippet = _truncate(body, 150) or "No description"
+        elif item_type == "conversation":
+            title = title or "Untitled Conversation"
+            snippet = _truncate(body, 150) or "No messages yet"
+        else:
+            title = f"Daily Briefing - {metadata.get('briefing_date', '')}"
+            snippet = _truncate(body, 150) or "No summary available"
+
+        return SearchResult(
+            type=item_type,
+            id=item_id,
+            title=title,
+            snippet=snippet,
+            score=float(row.get("score") or 0.0),
+            url=f"{_URL_PREFIXES.get(item_type, '')}/{item_id}",
+        )
+
+    async def _search_legacy(
+        self, search_type: str, user_id: str, query: str, limit: int
+    ) -> list[SearchResult]:
+        """ILIKE scan of one type's source table (fallback path)."""
+        searchers = {
+            "memory_semantic": self._search_semantic_memory,
+            "leads": self._search_leads,
+            "goals": self._search_goals,
+            "conversations": self._search_conversations,
+            "documents": self._search_documents,
+            "briefings": self._search_briefings,
+        }
+        return await searchers[search_type](user_id, query, limit)
+
     async def _search_semantic_memory(
         self, _user_id: str, query: str, limit: int
     ) -> list[SearchResult]:
         """Search semantic memory (facts)."""
         try:
-            result = (
+            result = await execute_async(
                 self._db.table("memory_semantic")
                 .select("id, fact, confidence")
                 .ilike("fact", f"%{query}%")
                 .limit(limit)
-                .execute()
             )
 
             results = []
@@ -198,13 +299,12 @@ class SearchService:
     async def _search_leads(self, user_id: str, query: str, limit: int) -> list[SearchResult]:
         """Search lead memories."""
         try:
-            result = (
+            result = await execute_async(
                 self._db.table("lead_memories")
                 .select("id, company_name, stage, health_score")
                 .eq("user_id", user_id)
                 .ilike("company_name", f"%{query}%")
                 .limit(limit)
-                .execute()
             )
 
             results = []
@@ -231,13 +331,12 @@ class SearchService:
     async def _search_goals(self, user_id: str, query: str, limit: int) -> list[SearchResult]:
         """Search goals."""
         try:
-            result = (
+            result = await execute_async(
                 self._db.table("goals")
                 .select("id, title, description, status, progress")
                 .eq("user_id", user_id)
                 .ilike("title", f"%{query}%")
                 .limit(limit)
-                .execute()
             )
 
             results = []
@@ -266,14 +365,13 @@ class SearchService:
     ) -> list[SearchResult]:
         """Search conversations."""
         try:
-            result = (
+            result = await execute_async(
                 self._db.table("conversations")
                 .select("id, title, last_message_preview, updated_at")
                 .eq("user_id", user_id)
                 .ilike("title", f"%{query}%")
                 .order("updated_at", desc=True)
                 .limit(limit)
-                .execute()
             )
 
             results = []
@@ -301,12 +399,8 @@ class SearchService:
         """Search company documents."""
         try:
             # Get user's company
-            user_result = (
-                self._db.table("user_profiles")
-                .select("company_id")
-                .eq("id", user_id)
-                .single()
-                .execute()
+            user_result = await execute_async(
+                self._db.table("user_profiles").select("company_id").eq("id", user_id).single()
             )
 
             if not user_result.data:
@@ -314,13 +408,12 @@ class SearchService:
 
             company_id = user_result.data.get("company_id")
 
-            result = (
+            result = await execute_async(
                 self._db.table("company_documents")
                 .select("id, filename, file_type, quality_score")
                 .eq("company_id", company_id)
                 .ilike("filename", f"%{query}%")
                 .limit(limit)
-                .execute()
             )
 
             results = []
@@ -346,14 +439,13 @@ class SearchService:
     async def _search_briefings(self, user_id: str, query: str, limit: int) -> list[SearchResult]:
         """Search daily briefings."""
         try:
-            result = (
+            result = await execute_async(
                 self._db.table("daily_briefings")
                 .select("id, briefing_date, summary, key_insights")
                 .eq("user_id", user_id)
                 .ilike("summary", f"%{query}%")
                 .order("briefing_date", desc=True)
                 .limit(limit)
-                .execute()
             )
 
             results = []
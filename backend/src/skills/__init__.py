@@ -56,6 +56,7 @@ from src.skills.orchestrator import (
     ExecutionStep,
     PlanResult,
     SkillOrchestrator,
+    StepTiming,
     WorkingMemoryEntry,
 )
 from src.skills.registry import (
@@ -104,6 +105,7 @@ __all__ = [
     "ExecutionPlan",
     "ExecutionStep",
     "PlanResult",
+    "StepTiming",
     "WorkingMemoryEntry",
     # Discovery
     "SkillDiscoveryAgent",
@@ -2,7 +2,8 @@
 
 Coordinates execution of multiple skills with:
 - Dependency-aware execution ordering (DAG)
-- Parallel execution of independent steps
+- Ready-queue execution: each step starts as soon as its dependencies
+  finish, up to a concurrency cap, with critical-path timing per plan
 - Working memory for inter-step context passing
 - Progress callbacks for real-time updates
 - Autonomy integration for approval checks
@@ -22,6 +23,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from src.agents.skill_aware_agent import AGENT_SKILLS
+from src.core.config import settings
 from src.core.llm import LLMClient
 from src.core.task_types import TaskType
 from src.db.supabase import SupabaseClient
@@ -114,6 +116,33 @@ class WorkingMemoryEntry:
     next_step_hints: list[str]
 
 
+@dataclass
+class StepTiming:
+    """Wall-clock timing of one executed step, relative to plan start.
+
+    Attributes:
+        step_number: Which step this times.
+        ready_ms: When all dependencies had finished.
+        started_ms: When the step got a concurrency slot and began running.
+        finished_ms: When the step finished.
+    """
+
+    step_number: int
+    ready_ms: int
+    started_ms: int
+    finished_ms: int
+
+    @property
+    def duration_ms(self) -> int:
+        """Time spent executing the step."""
+        return self.finished_ms - self.started_ms
+
+    @property
+    def queued_ms(self) -> int:
+        """Time spent ready but waiting for a concurrency slot."""
+        return self.started_ms - self.ready_ms
+
+
 @dataclass
 class PlanResult:
     """Aggregate result from executing a full plan.
@@ -126,6 +155,10 @@ class PlanResult:
         steps_skipped: Number of steps skipped (approval required or dep failed).
         total_execution_ms: Total wall-clock time in milliseconds.
         working_memory: Full list of WorkingMemoryEntry from all steps.
+        step_timings: StepTiming for every step that ran, keyed by step number.
+        critical_path: Step numbers of the dependency chain that finished
+            last, in execution order.
+        critical_path_ms: Summed execution time of the critical path steps.
     """
 
     plan_id: str
@@ -135,6 +168,16 @@ class PlanResult:
     steps_skipped: int
     total_execution_ms: int
     working_memory: list[WorkingMemoryEntry]
+    step_timings: dict[int, StepTiming] = field(default_factory=dict)
+    critical_path: list[int] = field(default_factory=list)
+    critical_path_ms: int = 0
+
+    @property
+    def bottleneck_step(self) -> int | None:
+        """The slowest step on the critical path, or None if nothing ran."""
+        if not self.critical_path:
+            return None
+        return max(self.critical_path, key=lambda n: self.step_timings[n].duration_ms)
 
 
 # Type alias for progress callbacks
@@ -165,6 +208,8 @@ class SkillOrchestrator:
         index: SkillIndex,
         autonomy: SkillAutonomyService,
         audit: SkillAuditService | None = None,
+        *,
+        max_concurrent_steps: int | None = None,
     ) -> None:
         """Initialize the orchestrator.
 
@@ -173,11 +218,16 @@ class SkillOrchestrator:
             index: SkillIndex for skill metadata and summaries.
             autonomy: SkillAutonomyService for approval checks.
             audit: Optional SkillAuditService for audit logging.
+            max_concurrent_steps: Maximum plan steps running at once.
+                Defaults to SKILL_PLAN_MAX_CONCURRENT_STEPS.
         """
         self._executor = executor
         self._index = index
         self._autonomy = autonomy
         self._audit = audit
+        self._max_concurrent_steps = max(
+            1, max_concurrent_steps or settings.SKILL_PLAN_MAX_CONCURRENT_STEPS
+        )
         self._llm = LLMClient()
 
     def _get_db(self) -> Any:
@@ -621,9 +671,12 @@ class SkillOrchestrator:
     ) -> PlanResult:
         """Execute a full plan respecting dependency order and parallelism.
 
-        Iterates through parallel_groups in order. Within each group,
-        executes all steps concurrently via asyncio.gather. Persists
-        working memory entries and plan status to the database.
+        Runs the steps listed in parallel_groups as a ready queue: each step
+        starts as soon as every step in its depends_on has completed, rather
+        than waiting for the whole previous group. At most
+        max_concurrent_steps run at once. Steps depending on a failed step
+        are skipped. Persists working memory entries and plan status to the
+        database, and records per-step timing and the critical path.
 
         Args:
             user_id: ID of the user requesting execution.
@@ -662,35 +715,26 @@ class SkillOrchestrator:
         working_memory: list[WorkingMemoryEntry] = []
         completed_steps: dict[int, bool] = {}
         failed_steps: set[int] = set()
+        timings: dict[int, StepTiming] = {}
 
+        # Only steps placed in parallel_groups run. Group order is kept as
+        # the tie-break when several steps are ready at once.
+        pending: dict[int, ExecutionStep] = {}
         for group in plan.parallel_groups:
-            # Filter to steps whose dependencies are satisfied
-            # Skip steps that depend on a failed step
-            group_steps: list[ExecutionStep] = []
             for num in group:
-                if num not in step_map:
-                    continue
-                step = step_map[num]
-                if self._depends_on_failed(step, failed_steps):
-                    # Skip — a dependency failed
-                    step.status = "skipped"
-                    entry = WorkingMemoryEntry(
-                        step_number=step.step_number,
-                        skill_id=step.skill_id,
-                        status="skipped",
-                        summary="Skipped: dependency failed.",
-                        artifacts=[],
-                        extracted_facts={},
-                        next_step_hints=[],
-                    )
-                    working_memory.append(entry)
-                    await self._persist_working_memory(plan.plan_id, entry, 0)
-                    continue
-                if self._can_execute(step, completed_steps):
-                    group_steps.append(step)
+                if num in step_map:
+                    pending.setdefault(num, step_map[num])
+
+        slots = asyncio.Semaphore(self._max_concurrent_steps)
 
-            if len(group_steps) == 1:
-                step = group_steps[0]
+        def _elapsed_ms() -> int:
+            return int((time.perf_counter() - plan_start) * 1000)
+
+        async def _run_step(
+            step: ExecutionStep, ready_ms: int
+        ) -> tuple[WorkingMemoryEntry, StepTiming]:
+            async with slots:
+                started_ms = _elapsed_ms()
                 entry = await self._execute_step(
                     user_id=user_id,
                     step=step,
@@ -698,33 +742,66 @@ class SkillOrchestrator:
                     risk_level=plan.risk_level,
                     progress_callback=progress_callback,
                 )
-                working_memory.append(entry)
-                exec_ms = self._step_duration_ms(step)
-                await self._persist_working_memory(plan.plan_id, entry, exec_ms)
-                if entry.status == "completed":
-                    completed_steps[step.step_number] = True
-                elif entry.status == "failed":
-                    failed_steps.add(step.step_number)
-            elif len(group_steps) > 1:
-                tasks = [
-                    self._execute_step(
-                        user_id=user_id,
-                        step=step,
-                        working_memory=working_memory,
-                        risk_level=plan.risk_level,
-                        progress_callback=progress_callback,
-                    )
-                    for step in group_steps
-                ]
-                entries = await asyncio.gather(*tasks)
-                for i, entry in enumerate(entries):
+                return entry, StepTiming(step.step_number, ready_ms, started_ms, _elapsed_ms())
+
+        running: dict[asyncio.Task[tuple[WorkingMemoryEntry, StepTiming]], int] = {}
+
+        try:
+            while pending or running:
+                # Start every step whose dependencies are now satisfied;
+                # skip steps that depend on a failed step.
+                for num, step in list(pending.items()):
+                    if self._depends_on_failed(step, failed_steps):
+                        del pending[num]
+                        step.status = "skipped"
+                        entry = WorkingMemoryEntry(
+                            step_number=step.step_number,
+                            skill_id=step.skill_id,
+                            status="skipped",
+                            summary="Skipped: dependency failed.",
+                            artifacts=[],
+                            extracted_facts={},
+                            next_step_hints=[],
+                        )
+                        working_memory.append(entry)
+                        await self._persist_working_memory(plan.plan_id, entry, 0)
+                    elif self._can_execute(step, completed_steps):
+                        del pending[num]
+                        task = asyncio.create_task(_run_step(step, _elapsed_ms()))
+                        running[task] = num
+
+                if not running:
+                    # Remaining steps wait on dependencies that will never
+                    # complete (skipped for approval, or not in the plan).
+                    if pending:
+                        logger.info(
+                            "Plan %s: %d steps not run, dependencies unsatisfied: %s",
+                            plan.plan_id,
+                            len(pending),
+                            sorted(pending),
+                            extra={"plan_id": plan.plan_id},
+                        )
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: running[t]):
+                    del running[task]
+                    entry, timing = task.result()
+                    timings[timing.step_number] = timing
                     working_memory.append(entry)
-                    exec_ms = self._step_duration_ms(group_steps[i])
+                    exec_ms = self._step_duration_ms(step_map[timing.step_number])
                     await self._persist_working_memory(plan.plan_id, entry, exec_ms)
                     if entry.status == "completed":
                         completed_steps[entry.step_number] = True
                     elif entry.status == "failed":
                         failed_steps.add(entry.step_number)
+        finally:
+            # Don't leave steps running if persistence or a step raised
+            for task in running:
+                task.cancel()
+
+        critical_path = self._critical_path(step_map, timings)
+        critical_path_ms = sum(timings[n].duration_ms for n in critical_path)
 
         total_ms = int((time.perf_counter() - plan_start) * 1000)
 
@@ -749,13 +826,16 @@ class SkillOrchestrator:
         )
 
         logger.info(
-            "Plan %s finished: %s (%d completed, %d failed, %d skipped) in %dms",
+            "Plan %s finished: %s (%d completed, %d failed, %d skipped) in %dms; "
+            "critical path %s (%dms)",
             plan.plan_id,
             plan_status,
             steps_completed,
             steps_failed,
             steps_skipped,
             total_ms,
+            critical_path,
+            critical_path_ms,
             extra={"plan_id": plan.plan_id},
         )
 
@@ -767,6 +847,9 @@ class SkillOrchestrator:
             steps_skipped=steps_skipped,
             total_execution_ms=total_ms,
             working_memory=working_memory,
+            step_timings=timings,
+            critical_path=critical_path,
+            critical_path_ms=critical_path_ms,
         )
 
     # -------------------------------------------------------------------------
@@ -1505,6 +1588,37 @@ class SkillOrchestrator:
 
         return total_seconds * 1000
 
+    @staticmethod
+    def _critical_path(
+        step_map: dict[int, ExecutionStep],
+        timings: dict[int, StepTiming],
+    ) -> list[int]:
+        """Trace the dependency chain that determined when the plan finished.
+
+        Starts from the last step to finish and repeatedly follows the
+        dependency that finished last (the one that gated the step's start).
+
+        Args:
+            step_map: Map of step_number -> ExecutionStep.
+            timings: StepTiming for every step that ran.
+
+        Returns:
+            Step numbers on the critical path in execution order, or an
+            empty list if no step ran.
+        """
+        if not timings:
+            return []
+        current = max(timings.values(), key=lambda t: t.finished_ms).step_number
+        path = [current]
+        while True:
+            deps = [d for d in step_map[current].depends_on if d in timings]
+            if not deps:
+                break
+            current = max(deps, key=lambda d: timings[d].finished_ms)
+            path.append(current)
+        path.reverse()
+        return path
+
     @staticmethod
     def _step_duration_ms(step: ExecutionStep) -> int:
         """Calculate execution duration for a step from timestamps.
@@ -9,7 +9,7 @@ Everything derived from each user's live data at classification time.
 """
 
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from supabase import Client
@@ -18,6 +18,9 @@ from src.utils.email_pipeline_linker import get_pipeline_context_for_email
 
 logger = logging.getLogger(__name__)
 
+# email_scan_log rows counted for a sender's interaction history
+_SCAN_LOG_HISTORY_LIMIT = 100
+
 
 # Entity types that indicate a strategic relationship
 # These are dynamically matched from monitored_entities.entity_type
@@ -65,6 +68,54 @@ class SenderContext:
     pipeline_context: dict[str, Any] | None = None
 
 
+@dataclass
+class SenderLookup:
+    """A sender's context from sources 1-3 plus their email_scan_log history.
+
+    Source 4 (interaction history) is applied by ``resolve``, so a caller
+    that logs further emails from the sender, such as a batched inbox
+    scan, can count them without repeating the lookup.
+    """
+
+    context: SenderContext
+    # Category of each of the sender's email_scan_log rows (up to the query limit)
+    logged_categories: list[str | None] = field(default_factory=list)
+
+    def resolve(self, more_categories: list[str | None] | None = None) -> SenderContext | None:
+        """Apply the interaction history and return the final context.
+
+        Args:
+            more_categories: Categories of the sender's emails logged since
+                the lookup, oldest first.
+
+        Returns:
+            SenderContext if any relationship info found, None if completely unknown
+        """
+        context = replace(self.context)
+        categories = (self.logged_categories + (more_categories or []))[:_SCAN_LOG_HISTORY_LIMIT]
+
+        # 4. Check email_scan_log for interaction history
+        if categories:
+            # Count total and NEEDS_REPLY emails from this sender
+            total_count = len(categories)
+            needs_reply_count = sum(1 for c in categories if c == "NEEDS_REPLY")
+
+            # Frequent NEEDS_REPLY indicates important contact
+            if needs_reply_count >= 3 and context.relationship_type == "unknown":
+                context.relationship_type = "known_contact"
+                context.context_summary = (
+                    f"Frequent contact ({total_count} emails, "
+                    f"{needs_reply_count} requiring reply)"
+                )
+                context.confidence = max(context.confidence, 0.5)
+
+        # Return None if completely unknown (no relationship info found)
+        if context.relationship_type == "unknown" and not context.has_prior_drafts:
+            return None
+
+        return context
+
+
 def _extract_domain(email: str) -> str:
     """Extract domain from email address.
 
@@ -105,14 +156,46 @@ async def get_sender_context(
     if not sender_email:
         return None
 
-    sender_email_lower = sender_email.lower().strip()
-    sender_domain = _extract_domain(sender_email_lower)
-
     # Check cache first
-    cache_key = (user_id, sender_email_lower)
+    cache_key = (user_id, sender_email.lower().strip())
     if cache is not None and cache_key in cache:
         return cache[cache_key]
 
+    lookup = await load_sender_lookup(db, user_id, sender_email)
+    if lookup is None:
+        return None
+    context = lookup.resolve()
+    if context is None:
+        return None
+
+    # Cache the result
+    if cache is not None:
+        cache[cache_key] = context
+
+    return context
+
+
+async def load_sender_lookup(
+    db: Client,
+    user_id: str,
+    sender_email: str,
+) -> SenderLookup | None:
+    """Query the data sources behind ``get_sender_context``.
+
+    Args:
+        db: Supabase client instance
+        user_id: The user's UUID
+        sender_email: The sender's email address
+
+    Returns:
+        The unresolved SenderLookup, or None on an unexpected error
+    """
+    if not sender_email:
+        return None
+
+    sender_email_lower = sender_email.lower().strip()
+    sender_domain = _extract_domain(sender_email_lower)
+
     # Default unknown context
     context = SenderContext(
         is_strategic=False,
@@ -122,6 +205,7 @@ async def get_sender_context(
         has_prior_drafts=False,
         confidence=0.0,
     )
+    lookup = SenderLookup(context=context)
 
     try:
         # 1. Check monitored_entities via domain match
@@ -279,29 +363,16 @@ async def get_sender_context(
                 .select("category")
                 .eq("user_id", user_id)
                 .eq("sender_email", sender_email_lower)
-                .limit(100)  # Reasonable limit for interaction counting
+                .limit(_SCAN_LOG_HISTORY_LIMIT)  # Reasonable limit for interaction counting
                 .execute()
             )
 
             if result.data:
-                # Count total and NEEDS_REPLY emails from this sender
-                total_count = len(result.data)
-                needs_reply_count = sum(
-                    1 for r in result.data
-                    if isinstance(r, dict) and r.get("category") == "NEEDS_REPLY"
-                )
-
-                # Frequent NEEDS_REPLY indicates important contact
-                if needs_reply_count >= 3 and context.relationship_type == "unknown":
-                    context.relationship_type = "known_contact"
-                    context.context_summary = (
-                        f"Frequent contact ({total_count} emails, "
-                        f"{needs_reply_count} requiring reply)"
-                    )
-                    context.confidence = max(context.confidence, 0.5)
-
+                lookup.logged_categories = [
+                    r.get("category") if isinstance(r, dict) else None for r in result.data
+                ]
                 logger.debug(
-                    f"SENDER_CONTEXT: Found {total_count} scan log entries for {sender_email}"
+                    f"SENDER_CONTEXT: Found {len(result.data)} scan log entries for {sender_email}"
                 )
 
         except Exception as e:
@@ -315,15 +386,7 @@ async def get_sender_context(
         )
         return None
 
-    # Return None if completely unknown (no relationship info found)
-    if context.relationship_type == "unknown" and not context.has_prior_drafts:
-        return None
-
-    # Cache the result
-    if cache is not None:
-        cache[cache_key] = context
-
-    return context
+    return lookup
 
 
 def format_context_for_prompt(
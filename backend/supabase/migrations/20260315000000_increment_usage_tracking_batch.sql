@@ -0,0 +1,53 @@
+-- Batched variant of increment_usage_tracking for the usage write-behind buffer.
+--
+-- The Python buffer (src/core/usage_writer.py) coalesces LLM usage per
+-- (user_id, date) and flushes all pending deltas in one call instead of one
+-- RPC per LLM call. Column mapping matches 20260223000000_fix_increment_usage_tracking.sql.
+--
+-- p_rows is a JSON array of objects:
+--   {user_id, date, input_tokens, output_tokens, thinking_tokens,
+--    cache_read_tokens, cache_creation_tokens, estimated_cost, request_count}
+-- Each (user_id, date) pair must appear at most once per call.
+
+CREATE OR REPLACE FUNCTION increment_usage_tracking_batch(p_rows JSONB)
+RETURNS VOID
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    INSERT INTO usage_tracking (
+        user_id, date,
+        input_tokens, output_tokens, extended_thinking_tokens,
+        estimated_cost_cents, request_count, metadata
+    )
+    SELECT
+        r.user_id, r.date,
+        r.input_tokens::int, r.output_tokens::int, r.thinking_tokens::int,
+        (r.estimated_cost * 100)::numeric,
+        r.request_count,
+        jsonb_build_object(
+            'cache_read_tokens', r.cache_read_tokens,
+            'cache_creation_tokens', r.cache_creation_tokens
+        )
+    FROM jsonb_to_recordset(p_rows) AS r(
+        user_id               UUID,
+        date                  DATE,
+        input_tokens          BIGINT,
+        output_tokens         BIGINT,
+        thinking_tokens       BIGINT,
+        cache_read_tokens     BIGINT,
+        cache_creation_tokens BIGINT,
+        estimated_cost        NUMERIC,
+        request_count         INTEGER
+    )
+    ON CONFLICT (user_id, date, agent) DO UPDATE SET
+        input_tokens = usage_tracking.input_tokens + EXCLUDED.input_tokens,
+        output_tokens = usage_tracking.output_tokens + EXCLUDED.output_tokens,
+        extended_thinking_tokens = usage_tracking.extended_thinking_tokens + EXCLUDED.extended_thinking_tokens,
+        estimated_cost_cents = usage_tracking.estimated_cost_cents + EXCLUDED.estimated_cost_cents,
+        request_count = usage_tracking.request_count + EXCLUDED.request_count,
+        metadata = usage_tracking.metadata || EXCLUDED.metadata,
+        updated_at = now();
+END;
+$$;
@@ -0,0 +1,18 @@
+-- Migration: Persist MinHash signatures for incremental signal deduplication
+--
+-- SignalDeduplicator (src/intelligence/signal_deduplication.py) stores each
+-- clustered signal's 128-value MinHash signature of its headline words so
+-- later runs can match new signals against existing clusters through an LSH
+-- index instead of re-clustering the whole window. Values are < 2^31 - 1.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'market_signals' AND column_name = 'minhash_signature'
+    ) THEN
+        ALTER TABLE market_signals ADD COLUMN minhash_signature INTEGER[];
+    END IF;
+END $$;
+
+COMMENT ON COLUMN market_signals.minhash_signature IS 'MinHash signature of headline words (128 x int), set when the signal is clustered';
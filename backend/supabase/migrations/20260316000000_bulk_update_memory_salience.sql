@@ -0,0 +1,38 @@
+-- Set-based salience write-back for the daily decay job.
+--
+-- SalienceService (src/memory/salience.py) decays a page of salience rows in
+-- NumPy and writes every changed row in one call instead of one
+-- UPDATE ... WHERE id = ? per row.
+--
+-- p_table must be episodic_memory_salience or semantic_fact_salience.
+-- p_rows is a JSON array of objects: {id, user_id, current_salience}.
+-- Returns the number of rows updated.
+
+CREATE OR REPLACE FUNCTION bulk_update_memory_salience(p_table TEXT, p_rows JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    IF p_table NOT IN ('episodic_memory_salience', 'semantic_fact_salience') THEN
+        RAISE EXCEPTION 'bulk_update_memory_salience: unsupported table %', p_table;
+    END IF;
+
+    EXECUTE format(
+        'UPDATE %I AS t
+            SET current_salience = r.current_salience,
+                updated_at = now()
+           FROM jsonb_to_recordset($1) AS r(id UUID, user_id UUID, current_salience FLOAT)
+          WHERE t.id = r.id AND t.user_id = r.user_id',
+        p_table
+    ) USING p_rows;
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION bulk_update_memory_salience(TEXT, JSONB) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,31 @@
+-- Set-based conversion score write-back for batch lead scoring.
+--
+-- ConversionScoringService.batch_score_all_leads (src/services/conversion_scoring.py)
+-- scores all of a user's active leads at once and writes every score in one
+-- call instead of a read + UPDATE per lead. conversion_score is merged into
+-- the existing metadata, so other metadata keys are preserved.
+--
+-- p_rows is a JSON array of objects: {id, conversion_score}.
+-- Returns the number of leads updated.
+
+CREATE OR REPLACE FUNCTION bulk_set_lead_conversion_scores(p_rows JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    UPDATE lead_memories AS lm
+       SET metadata = COALESCE(lm.metadata, '{}'::jsonb)
+                      || jsonb_build_object('conversion_score', r.conversion_score)
+      FROM jsonb_to_recordset(p_rows) AS r(id UUID, conversion_score JSONB)
+     WHERE lm.id = r.id;
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION bulk_set_lead_conversion_scores(JSONB) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,29 @@
+-- Batched working memory sync.
+--
+-- WorkingMemoryManager.persist_all_sessions (src/memory/working.py) writes
+-- only the sessions changed since their last sync, and sends them in one
+-- call per batch instead of one UPDATE per resident session.
+--
+-- p_rows is a JSON array of objects: {id, working_memory}.
+-- Returns the number of conversations updated.
+
+CREATE OR REPLACE FUNCTION bulk_update_working_memory(p_rows JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_updated INTEGER;
+BEGIN
+    UPDATE conversations AS c
+       SET working_memory = r.working_memory
+      FROM jsonb_to_recordset(p_rows) AS r(id UUID, working_memory JSONB)
+     WHERE c.id = r.id;
+
+    GET DIAGNOSTICS v_updated = ROW_COUNT;
+    RETURN v_updated;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION bulk_update_working_memory(JSONB) FROM PUBLIC, anon, authenticated;
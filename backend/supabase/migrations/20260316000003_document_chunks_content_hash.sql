@@ -0,0 +1,11 @@
+-- Content hashes for document chunks.
+--
+-- DocumentIngestionService (src/onboarding/document_ingestion.py) hashes
+-- each chunk's content and reuses the stored embedding and entities for
+-- chunks the company has already ingested, so re-uploading a document
+-- doesn't re-embed unchanged chunks.
+
+ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_doc_chunks_content_hash
+    ON document_chunks(content_hash, document_id);
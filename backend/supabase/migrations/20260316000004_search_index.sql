@@ -0,0 +1,395 @@
+-- Unified full-text search index for SearchService.global_search.
+--
+-- global_search (src/services/search_service.py) used to run one
+-- ILIKE '%query%' scan per item type, one after another. Every searchable
+-- item now has a row in search_index. Triggers on the source tables keep
+-- that row in sync on every write.
+--
+-- Each row stores:
+--   owner_id  -- the user; for company documents, the company
+--   title     -- weight A in search_vector, also trigram-indexed
+--   body      -- weight B in search_vector
+--   metadata  -- the display fields the service formats snippets from
+--   boost     -- per-item prior in 0..1 (confidence, health, progress,
+--                quality)
+--
+-- search_items() answers one item type for one user:
+--   * Matching: every query word is a prefix match
+--     ('pfi' finds 'pfizer'), OR the title passes trigram word similarity
+--     (typo tolerance, e.g. 'pfzier').
+--   * Ranking: text rank, fuzzy similarity and recency are combined.
+-- The service runs one call per type, concurrently.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS btree_gin;
+
+CREATE TABLE IF NOT EXISTS search_index (
+    item_type   TEXT NOT NULL,  -- memory, lead, goal, conversation, document, briefing
+    item_id     UUID NOT NULL,
+    owner_id    UUID NOT NULL,
+    title       TEXT NOT NULL DEFAULT '',
+    body        TEXT NOT NULL DEFAULT '',
+    metadata    JSONB NOT NULL DEFAULT '{}'::jsonb,
+    boost       REAL NOT NULL DEFAULT 0,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', title), 'A')
+        || setweight(to_tsvector('simple', left(body, 100000)), 'B')
+    ) STORED,
+    PRIMARY KEY (item_type, item_id)
+);
+
+-- Only reachable through the SECURITY DEFINER functions below
+ALTER TABLE search_index ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY search_index_service_role
+    ON search_index FOR ALL TO service_role
+    USING (true);
+
+CREATE INDEX IF NOT EXISTS idx_search_index_owner_vector
+    ON search_index USING GIN (owner_id, item_type, search_vector);
+
+CREATE INDEX IF NOT EXISTS idx_search_index_owner_title_trgm
+    ON search_index USING GIN (owner_id, item_type, title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_search_index_owner_recent
+    ON search_index (owner_id, item_type, updated_at DESC);
+
+
+-- ---------------------------------------------------------------------------
+-- Index maintenance
+-- ---------------------------------------------------------------------------
+
+CREATE OR REPLACE FUNCTION search_index_upsert(
+    p_item_type TEXT,
+    p_item_id UUID,
+    p_owner_id UUID,
+    p_title TEXT,
+    p_body TEXT,
+    p_metadata JSONB,
+    p_boost REAL,
+    p_updated_at TIMESTAMPTZ
+)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    INSERT INTO search_index (item_type, item_id, owner_id, title, body, metadata, boost, updated_at)
+    VALUES (
+        p_item_type,
+        p_item_id,
+        p_owner_id,
+        COALESCE(p_title, ''),
+        COALESCE(p_body, ''),
+        COALESCE(p_metadata, '{}'::jsonb),
+        LEAST(GREATEST(COALESCE(p_boost, 0), 0), 1),
+        COALESCE(p_updated_at, now())
+    )
+    ON CONFLICT (item_type, item_id) DO UPDATE
+       SET owner_id = EXCLUDED.owner_id,
+           title = EXCLUDED.title,
+           body = EXCLUDED.body,
+           metadata = EXCLUDED.metadata,
+           boost = EXCLUDED.boost,
+           updated_at = EXCLUDED.updated_at;
+$$;
+
+CREATE OR REPLACE FUNCTION search_index_sync_memory_semantic()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM search_index WHERE item_type = 'memory' AND item_id = OLD.id;
+        RETURN OLD;
+    END IF;
+    PERFORM search_index_upsert(
+        'memory', NEW.id, NEW.user_id, left(NEW.fact, 200), NEW.fact,
+        '{}'::jsonb, NEW.confidence::REAL, NEW.updated_at
+    );
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION search_index_sync_lead_memories()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM search_index WHERE item_type = 'lead' AND item_id = OLD.id;
+        RETURN OLD;
+    END IF;
+    PERFORM search_index_upsert(
+        'lead', NEW.id, NEW.user_id, NEW.company_name,
+        array_to_string(NEW.tags, ' '),
+        jsonb_build_object('stage', NEW.lifecycle_stage, 'health_score', NEW.health_score),
+        COALESCE(NEW.health_score, 0) / 100.0, NEW.updated_at
+    );
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION search_index_sync_goals()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM search_index WHERE item_type = 'goal' AND item_id = OLD.id;
+        RETURN OLD;
+    END IF;
+    PERFORM search_index_upsert(
+        'goal', NEW.id, NEW.user_id, NEW.title, NEW.description,
+        jsonb_build_object('status', NEW.status, 'progress', NEW.progress),
+        COALESCE(NEW.progress, 0) / 100.0, NEW.updated_at
+    );
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION search_index_sync_conversations()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM search_index WHERE item_type = 'conversation' AND item_id = OLD.id;
+        RETURN OLD;
+    END IF;
+    PERFORM search_index_upsert(
+        'conversation', NEW.id, NEW.user_id, NEW.title, NEW.last_message_preview,
+        '{}'::jsonb, 0, COALESCE(NEW.last_message_at, NEW.updated_at)
+    );
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION search_index_sync_company_documents()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM search_index WHERE item_type = 'document' AND item_id = OLD.id;
+        RETURN OLD;
+    END IF;
+    -- Split "Capabilities_Deck-2026.pdf" into words so they are searchable
+    PERFORM search_index_upsert(
+        'document', NEW.id, NEW.company_id, NEW.filename,
+        regexp_replace(NEW.filename, '[^[:alnum:]]+', ' ', 'g'),
+        jsonb_build_object('file_type', NEW.file_type, 'quality_score', NEW.quality_score),
+        NEW.quality_score::REAL, NEW.updated_at
+    );
+    RETURN NEW;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION search_index_sync_daily_briefings()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        DELETE FROM search_index WHERE item_type = 'briefing' AND item_id = OLD.id;
+        RETURN OLD;
+    END IF;
+    PERFORM search_index_upsert(
+        'briefing', NEW.id, NEW.user_id, 'Daily Briefing ' || NEW.briefing_date::TEXT,
+        NEW.content->>'summary',
+        jsonb_build_object('briefing_date', NEW.briefing_date),
+        0, NEW.generated_at
+    );
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_search_index_memory_semantic ON memory_semantic;
+CREATE TRIGGER trg_search_index_memory_semantic
+    AFTER INSERT OR UPDATE OF fact, confidence, user_id OR DELETE ON memory_semantic
+    FOR EACH ROW EXECUTE FUNCTION search_index_sync_memory_semantic();
+
+DROP TRIGGER IF EXISTS trg_search_index_lead_memories ON lead_memories;
+CREATE TRIGGER trg_search_index_lead_memories
+    AFTER INSERT OR UPDATE OF company_name, tags, lifecycle_stage, health_score, user_id
+    OR DELETE ON lead_memories
+    FOR EACH ROW EXECUTE FUNCTION search_index_sync_lead_memories();
+
+DROP TRIGGER IF EXISTS trg_search_index_goals ON goals;
+CREATE TRIGGER trg_search_index_goals
+    AFTER INSERT OR UPDATE OF title, description, status, progress, user_id OR DELETE ON goals
+    FOR EACH ROW EXECUTE FUNCTION search_index_sync_goals();
+
+DROP TRIGGER IF EXISTS trg_search_index_conversations ON conversations;
+CREATE TRIGGER trg_search_index_conversations
+    AFTER INSERT OR UPDATE OF title, last_message_preview, last_message_at, user_id
+    OR DELETE ON conversations
+    FOR EACH ROW EXECUTE FUNCTION search_index_sync_conversations();
+
+DROP TRIGGER IF EXISTS trg_search_index_company_documents ON company_documents;
+CREATE TRIGGER trg_search_index_company_documents
+    AFTER INSERT OR UPDATE OF filename, file_type, quality_score, company_id
+    OR DELETE ON company_documents
+    FOR EACH ROW EXECUTE FUNCTION search_index_sync_company_documents();
+
+DROP TRIGGER IF EXISTS trg_search_index_daily_briefings ON daily_briefings;
+CREATE TRIGGER trg_search_index_daily_briefings
+    AFTER INSERT OR UPDATE OF content, user_id OR DELETE ON daily_briefings
+    FOR EACH ROW EXECUTE FUNCTION search_index_sync_daily_briefings();
+
+
+-- ---------------------------------------------------------------------------
+-- Backfill existing rows
+-- ---------------------------------------------------------------------------
+
+INSERT INTO search_index (item_type, item_id, owner_id, title, body, metadata, boost, updated_at)
+SELECT 'memory', id, user_id, left(fact, 200), fact, '{}'::jsonb, confidence, updated_at
+  FROM memory_semantic
+ON CONFLICT (item_type, item_id) DO NOTHING;
+
+INSERT INTO search_index (item_type, item_id, owner_id, title, body, metadata, boost, updated_at)
+SELECT 'lead', id, user_id, company_name, COALESCE(array_to_string(tags, ' '), ''),
+       jsonb_build_object('stage', lifecycle_stage, 'health_score', health_score),
+       COALESCE(health_score, 0) / 100.0, COALESCE(updated_at, now())
+  FROM lead_memories
+ON CONFLICT (item_type, item_id) DO NOTHING;
+
+INSERT INTO search_index (item_type, item_id, owner_id, title, body, metadata, boost, updated_at)
+SELECT 'goal', id, user_id, title, COALESCE(description, ''),
+       jsonb_build_object('status', status, 'progress', progress),
+       COALESCE(progress, 0) / 100.0, COALESCE(updated_at, now())
+  FROM goals
+ON CONFLICT (item_type, item_id) DO NOTHING;
+
+INSERT INTO search_index (item_type, item_id, owner_id, title, body, metadata, boost, updated_at)
+SELECT 'conversation', id, user_id, COALESCE(title, ''), COALESCE(last_message_preview, ''),
+       '{}'::jsonb, 0, COALESCE(last_message_at, updated_at, now())
+  FROM conversations
+ON CONFLICT (item_type, item_id) DO NOTHING;
+
+INSERT INTO search_index (item_type, item_id, owner_id, title, body, metadata, boost, updated_at)
+SELECT 'document', id, company_id, filename,
+       regexp_replace(filename, '[^[:alnum:]]+', ' ', 'g'),
+       jsonb_build_object('file_type', file_type, 'quality_score', quality_score),
+       LEAST(GREATEST(COALESCE(quality_score, 0), 0), 1), COALESCE(updated_at, now())
+  FROM company_documents
+ON CONFLICT (item_type, item_id) DO NOTHING;
+
+INSERT INTO search_index (item_type, item_id, owner_id, title, body, metadata, boost, updated_at)
+SELECT 'briefing', id, user_id, 'Daily Briefing ' || briefing_date::TEXT,
+       COALESCE(content->>'summary', ''),
+       jsonb_build_object('briefing_date', briefing_date), 0, generated_at
+  FROM daily_briefings
+ON CONFLICT (item_type, item_id) DO NOTHING;
+
+
+-- ---------------------------------------------------------------------------
+-- Query
+-- ---------------------------------------------------------------------------
+
+-- Every word of the query becomes a prefix term: 'pfizer onc' ->
+-- 'pfizer':* & 'onc':*. Returns NULL when the query has no words.
+CREATE OR REPLACE FUNCTION search_prefix_tsquery(p_query TEXT)
+RETURNS TSQUERY
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT to_tsquery('simple', string_agg(quote_literal(word) || ':*', ' & '))
+      FROM regexp_split_to_table(lower(p_query), '[^[:alnum:]]+') AS word
+     WHERE word <> '';
+$$;
+
+-- Ranked matches of one item type for one user.
+--
+-- score = relevance * recency_factor + 0.1 * boost, where
+--   relevance      = 0.7 * ts_rank_cd (normalised to 0..1)
+--                    + 0.3 * trigram word similarity of the title
+--   recency_factor = 0.7 + 0.3 * exp(-age_days / p_recency_days)
+--
+-- Documents belong to the user's company, not to the user.
+-- p_candidates caps how many matches are ranked, most recent first. This
+-- keeps one-letter prefixes cheap for users with very large indexes.
+CREATE OR REPLACE FUNCTION search_items(
+    p_user_id UUID,
+    p_query TEXT,
+    p_item_type TEXT,
+    p_limit INTEGER DEFAULT 10,
+    p_recency_days REAL DEFAULT 30,
+    p_candidates INTEGER DEFAULT 2000
+)
+RETURNS TABLE (
+    item_type TEXT,
+    item_id UUID,
+    title TEXT,
+    body TEXT,
+    metadata JSONB,
+    updated_at TIMESTAMPTZ,
+    score REAL
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+SET pg_trgm.word_similarity_threshold = 0.4
+AS $$
+DECLARE
+    v_tsquery TSQUERY := search_prefix_tsquery(p_query);
+    v_query TEXT := lower(trim(p_query));
+    v_owner UUID := p_user_id;
+BEGIN
+    IF p_item_type = 'document' THEN
+        SELECT up.company_id INTO v_owner FROM user_profiles up WHERE up.id = p_user_id;
+        IF v_owner IS NULL THEN
+            RETURN;
+        END IF;
+    END IF;
+
+    RETURN QUERY
+    WITH candidates AS (
+        SELECT si.item_type, si.item_id, si.title, si.body, si.metadata,
+               si.updated_at, si.boost, si.search_vector
+          FROM search_index si
+         WHERE si.owner_id = v_owner
+           AND si.item_type = p_item_type
+           AND (
+                si.search_vector @@ v_tsquery
+                -- Trigrams need at least three characters to mean anything
+                OR (length(v_query) >= 3 AND v_query <% si.title)
+           )
+         ORDER BY si.updated_at DESC
+         LIMIT p_candidates
+    )
+    SELECT c.item_type, c.item_id, c.title, c.body, c.metadata, c.updated_at,
+           (
+               (
+                   0.7 * COALESCE(ts_rank_cd(c.search_vector, v_tsquery, 32), 0)
+                   + 0.3 * word_similarity(v_query, c.title)
+               )
+               * (0.7 + 0.3 * exp(-LEAST(
+                   extract(epoch FROM now() - c.updated_at) / 86400.0 / p_recency_days, 50
+               )))
+               + 0.1 * c.boost
+           )::REAL AS score
+      FROM candidates c
+     ORDER BY score DESC
+     LIMIT p_limit;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION search_index_upsert(TEXT, UUID, UUID, TEXT, TEXT, JSONB, REAL, TIMESTAMPTZ)
+    FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION search_items(UUID, TEXT, TEXT, INTEGER, REAL, INTEGER)
+    FROM PUBLIC, anon, authenticated;
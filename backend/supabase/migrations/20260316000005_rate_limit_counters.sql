@@ -0,0 +1,89 @@
+-- Shared rate limit counters.
+--
+-- With RATE_LIMIT_BACKEND=supabase, RateLimitTracker
+-- (src/core/rate_limiter.py) checks requests through rate_limit_hit()
+-- instead of per-worker memory, so a limit holds across all API workers.
+--
+-- Same sliding window counter as the in-memory tracker: one row per key
+-- per fixed window. The estimate is
+--     previous_hits * (1 - elapsed fraction of current window) + current_hits
+-- A hit is counted only if that estimate is under the limit.
+--
+-- The table is UNLOGGED: counters are cheap to lose on a crash, and
+-- skipping WAL keeps the per-request write light. Rows expire two
+-- windows after their window starts; rate_limit_hit deletes a key's
+-- expired rows as it goes and occasionally sweeps the whole table.
+
+CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_counters (
+    key          TEXT NOT NULL,    -- '<endpoint>:<user id or IP>'
+    window_start BIGINT NOT NULL,  -- epoch seconds
+    hits         INTEGER NOT NULL DEFAULT 0,
+    expires_at   TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (key, window_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_counters_expires_at
+    ON rate_limit_counters (expires_at);
+
+-- Service role only
+ALTER TABLE rate_limit_counters ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION rate_limit_hit(
+    p_key TEXT,
+    p_limit INTEGER,
+    p_window_seconds INTEGER
+)
+RETURNS TABLE (
+    allowed BOOLEAN,
+    previous_hits INTEGER,
+    current_hits INTEGER,
+    window_start BIGINT
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_now DOUBLE PRECISION := extract(epoch FROM clock_timestamp());
+    v_window BIGINT := floor(v_now / p_window_seconds)::BIGINT * p_window_seconds;
+    v_elapsed DOUBLE PRECISION := (v_now - v_window) / p_window_seconds;
+    v_previous INTEGER;
+    v_current INTEGER;
+BEGIN
+    -- Serialize concurrent hits on the same key so check-and-count is atomic
+    PERFORM pg_advisory_xact_lock(hashtext('rate_limit:' || p_key));
+
+    SELECT coalesce(max(c.hits) FILTER (WHERE c.window_start = v_window - p_window_seconds), 0),
+           coalesce(max(c.hits) FILTER (WHERE c.window_start = v_window), 0)
+      INTO v_previous, v_current
+      FROM rate_limit_counters c
+     WHERE c.key = p_key
+       AND c.window_start >= v_window - p_window_seconds;
+
+    IF v_previous * (1 - v_elapsed) + v_current < p_limit THEN
+        INSERT INTO rate_limit_counters AS c (key, window_start, hits, expires_at)
+        VALUES (p_key, v_window, 1, to_timestamp(v_window + 2 * p_window_seconds))
+        ON CONFLICT ON CONSTRAINT rate_limit_counters_pkey DO UPDATE SET hits = c.hits + 1;
+        v_current := v_current + 1;
+        allowed := TRUE;
+    ELSE
+        allowed := FALSE;
+    END IF;
+
+    DELETE FROM rate_limit_counters c
+     WHERE c.key = p_key
+       AND c.window_start < v_window - p_window_seconds;
+
+    -- Keys that stopped sending requests are swept by later calls
+    IF random() < 0.01 THEN
+        DELETE FROM rate_limit_counters c WHERE c.expires_at < now();
+    END IF;
+
+    previous_hits := v_previous;
+    current_hits := v_current;
+    window_start := v_window;
+    RETURN NEXT;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION rate_limit_hit(TEXT, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,164 @@
+-- Durable write queue for Graphiti episodes.
+--
+-- Adding an episode to Graphiti runs LLM entity/edge extraction and takes
+-- seconds. While EpisodeWriteQueue (src/db/graphiti_queue.py) is running,
+-- memory writes insert a row here and return; API workers drain the
+-- table in the background through Graphiti's bulk episode API.
+--
+-- Ordering: episodes of one group (user / company graph partition) are
+-- ingested in id order. claim_graphiti_episodes only hands out a group
+-- when none of its rows is being processed and its oldest live row is
+-- due, so a failed batch blocks later episodes of that group until it
+-- is retried. Other groups are unaffected.
+--
+-- Lifecycle: pending -> processing (leased to one worker) -> deleted on
+-- success, or back to pending with exponential backoff on failure, or
+-- failed (dead letter, kept for inspection) after max attempts. A lease
+-- that expires (worker died mid-batch) puts its rows back to pending.
+
+CREATE TABLE IF NOT EXISTS graphiti_episode_queue (
+    id                 BIGSERIAL PRIMARY KEY,
+    group_id           TEXT NOT NULL DEFAULT '',  -- '' = Graphiti's default group
+    name               TEXT NOT NULL,
+    episode_body       TEXT NOT NULL,
+    source_description TEXT NOT NULL,
+    source             TEXT NOT NULL DEFAULT 'text',  -- graphiti_core EpisodeType value
+    reference_time     TIMESTAMPTZ NOT NULL,
+    status             TEXT NOT NULL DEFAULT 'pending'
+                       CHECK (status IN ('pending', 'processing', 'failed')),
+    attempts           INTEGER NOT NULL DEFAULT 0,
+    available_at       TIMESTAMPTZ NOT NULL DEFAULT now(),
+    locked_until       TIMESTAMPTZ,
+    last_error         TEXT,
+    created_at         TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Live rows per group in ingestion order
+CREATE INDEX IF NOT EXISTS idx_graphiti_episode_queue_live
+    ON graphiti_episode_queue (group_id, id)
+    WHERE status IN ('pending', 'processing');
+
+-- Service role only
+ALTER TABLE graphiti_episode_queue ENABLE ROW LEVEL SECURITY;
+
+-- Lease up to p_batch_size due episodes from each of up to p_max_groups
+-- groups. A group whose oldest row failed before is handed out one row
+-- at a time, so one bad episode cannot sink a whole batch.
+CREATE OR REPLACE FUNCTION claim_graphiti_episodes(
+    p_max_groups INTEGER,
+    p_batch_size INTEGER,
+    p_lease_seconds INTEGER
+)
+RETURNS SETOF graphiti_episode_queue
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    -- One claimer at a time, so two workers never lease the same group
+    PERFORM pg_advisory_xact_lock(hashtext('graphiti_episode_queue'));
+
+    UPDATE graphiti_episode_queue
+       SET status = 'pending', locked_until = NULL
+     WHERE status = 'processing' AND locked_until < now();
+
+    RETURN QUERY
+    WITH heads AS (
+        SELECT DISTINCT ON (q.group_id) q.group_id, q.id, q.status, q.attempts, q.available_at
+          FROM graphiti_episode_queue q
+         WHERE q.status IN ('pending', 'processing')
+         ORDER BY q.group_id, q.id
+    ),
+    due_groups AS (
+        SELECT h.group_id, h.attempts
+          FROM heads h
+         WHERE h.status = 'pending'
+           AND h.available_at <= now()
+           AND NOT EXISTS (
+               SELECT 1 FROM graphiti_episode_queue p
+                WHERE p.group_id = h.group_id AND p.status = 'processing'
+           )
+         ORDER BY h.id
+         LIMIT p_max_groups
+    ),
+    picked AS (
+        SELECT r.id
+          FROM due_groups g
+         CROSS JOIN LATERAL (
+             SELECT q.id
+               FROM graphiti_episode_queue q
+              WHERE q.group_id = g.group_id AND q.status = 'pending'
+              ORDER BY q.id
+              LIMIT CASE WHEN g.attempts > 0 THEN 1 ELSE p_batch_size END
+         ) r
+    )
+    UPDATE graphiti_episode_queue q
+       SET status = 'processing',
+           attempts = q.attempts + 1,
+           locked_until = now() + make_interval(secs => p_lease_seconds)
+      FROM picked
+     WHERE q.id = picked.id
+    RETURNING q.*;
+END;
+$$;
+
+-- Release a failed batch: retry after base * 2^(attempts - 1) seconds
+-- (capped at p_max_delay_seconds), or dead-letter after p_max_attempts.
+CREATE OR REPLACE FUNCTION fail_graphiti_episodes(
+    p_ids BIGINT[],
+    p_error TEXT,
+    p_max_attempts INTEGER,
+    p_base_delay_seconds INTEGER,
+    p_max_delay_seconds INTEGER
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_dead INTEGER;
+BEGIN
+    UPDATE graphiti_episode_queue
+       SET status = CASE WHEN attempts >= p_max_attempts THEN 'failed' ELSE 'pending' END,
+           available_at = now() + make_interval(
+               secs => least(p_max_delay_seconds, p_base_delay_seconds * power(2, greatest(attempts - 1, 0)))
+           ),
+           locked_until = NULL,
+           last_error = left(p_error, 2000)
+     WHERE id = ANY(p_ids);
+
+    SELECT count(*) INTO v_dead
+      FROM graphiti_episode_queue
+     WHERE id = ANY(p_ids) AND status = 'failed';
+    RETURN v_dead;
+END;
+$$;
+
+-- Backlog and lag: how far the graph is behind the queue.
+CREATE OR REPLACE FUNCTION graphiti_episode_queue_stats()
+RETURNS TABLE (
+    pending BIGINT,
+    processing BIGINT,
+    failed BIGINT,
+    pending_groups BIGINT,
+    oldest_pending_age_seconds DOUBLE PRECISION
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT count(*) FILTER (WHERE status = 'pending'),
+           count(*) FILTER (WHERE status = 'processing'),
+           count(*) FILTER (WHERE status = 'failed'),
+           count(DISTINCT group_id) FILTER (WHERE status IN ('pending', 'processing')),
+           coalesce(extract(epoch FROM now() - min(created_at) FILTER (
+               WHERE status IN ('pending', 'processing')
+           )), 0)::DOUBLE PRECISION
+      FROM graphiti_episode_queue;
+$$;
+
+REVOKE EXECUTE ON FUNCTION claim_graphiti_episodes(INTEGER, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION fail_graphiti_episodes(BIGINT[], TEXT, INTEGER, INTEGER, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION graphiti_episode_queue_stats() FROM PUBLIC, anon, authenticated;
@@ -0,0 +1,30 @@
+-- Batched scan state for the periodic email check.
+--
+-- run_periodic_email_check (src/jobs/periodic_email_check.py) loads every
+-- user's last completed run and watermark in one call, instead of two
+-- queries per user before each scan.
+--
+-- Returns one row per user in p_user_ids that has a completed run. Users
+-- with no completed run are omitted.
+
+CREATE OR REPLACE FUNCTION get_email_check_state(p_user_ids UUID[])
+RETURNS TABLE (
+    user_id UUID,
+    last_completed_at TIMESTAMPTZ,
+    watermark_timestamp TIMESTAMPTZ
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT r.user_id,
+           max(r.completed_at),
+           max(r.watermark_timestamp)
+      FROM email_processing_runs AS r
+     WHERE r.user_id = ANY(p_user_ids)
+       AND r.status = 'completed'
+     GROUP BY r.user_id;
+$$;
+
+REVOKE EXECUTE ON FUNCTION get_email_check_state(UUID[]) FROM PUBLIC, anon, authenticated;
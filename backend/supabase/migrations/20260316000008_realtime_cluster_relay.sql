@@ -0,0 +1,21 @@
+-- Lock down the Realtime topic used to relay events between API workers.
+--
+-- ClusterBus (src/core/cluster.py) joins "aria-cluster" as a private
+-- broadcast channel with the service role key. Private channels are
+-- authorized by RLS on realtime.messages; the service role bypasses RLS,
+-- and this restrictive policy keeps anon and authenticated clients from
+-- reading or sending on the relay topic even if a permissive policy for
+-- other topics is added later. Relay messages are additionally signed with
+-- APP_SECRET_KEY and unsigned ones are dropped by the workers.
+
+ALTER TABLE realtime.messages ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "cluster relay is service role only" ON realtime.messages;
+
+CREATE POLICY "cluster relay is service role only"
+    ON realtime.messages
+    AS RESTRICTIVE
+    FOR ALL
+    TO anon, authenticated
+    USING (realtime.topic() <> 'aria-cluster')
+    WITH CHECK (realtime.topic() <> 'aria-cluster');
@@ -0,0 +1,14 @@
+-- Let deletes reach queued Graphiti episode writes.
+--
+-- delete_episode / delete_fact / invalidate_fact call
+-- EpisodeWriteQueue.discard (src/db/graphiti_queue.py), which removes the
+-- queued rows of an episode by (name, group_id) before deleting it from
+-- the graph. The source columns name the Supabase record an episode
+-- mirrors; the worker skips episodes whose record no longer exists.
+
+ALTER TABLE graphiti_episode_queue
+    ADD COLUMN IF NOT EXISTS source_table TEXT,  -- e.g. 'episodic_memories'; NULL = not tied to a record
+    ADD COLUMN IF NOT EXISTS source_id    TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_graphiti_episode_queue_name
+    ON graphiti_episode_queue (name, group_id);
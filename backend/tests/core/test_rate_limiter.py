@@ -146,6 +146,107 @@ class TestRateLimitTracker:
         assert tracker.check_rate_limit("sliding_user", config) is True
 
 
+class TestSlidingWindowCounter:
+    """Tests for the O(1) sliding window counter, eviction and metrics."""
+
+    def test_previous_window_is_weighted_by_overlap(self) -> None:
+        """Test hits from the previous window count in proportion to their overlap."""
+        tracker = RateLimitTracker()
+        config = RateLimitConfig(requests=10, window_seconds=60)
+
+        with patch("src.core.rate_limiter.time.time", return_value=6000.0):
+            for _ in range(10):
+                assert tracker.check_rate_limit("u", config) is True
+            assert tracker.check_rate_limit("u", config) is False
+
+        # 15s into the next window: 10 * 0.75 = 7.5 estimated, room for 3 more
+        with patch("src.core.rate_limiter.time.time", return_value=6075.0):
+            assert tracker.get_retry_after("u", config) == 0
+            for _ in range(3):
+                assert tracker.check_rate_limit("u", config) is True
+            assert tracker.check_rate_limit("u", config) is False
+            # 10 * (1 - f) + 3 < 10 once f > 0.3, i.e. at 6078s
+            assert tracker.get_retry_after("u", config) == 3
+
+    def test_state_per_key_is_constant_size(self) -> None:
+        """Test a key keeps two counters no matter how many hits it gets."""
+        tracker = RateLimitTracker()
+        config = RateLimitConfig(requests=10_000, window_seconds=60)
+        for _ in range(5000):
+            tracker.check_rate_limit("busy", config)
+        assert len(tracker._requests) == 1
+        counter = next(iter(tracker._requests.values()))
+        assert counter.current + counter.previous == 5000
+
+    def test_endpoints_are_limited_separately(self) -> None:
+        """Test each scope has its own budget and its own metrics."""
+        tracker = RateLimitTracker()
+        config = RateLimitConfig(requests=1, window_seconds=60)
+
+        assert tracker.check_rate_limit("u", config, scope="auth.login") is True
+        assert tracker.check_rate_limit("u", config, scope="auth.login") is False
+        assert tracker.check_rate_limit("u", config, scope="account.reset") is True
+
+        assert tracker.stats()["endpoints"] == {
+            "account.reset": {"allowed": 1, "rejected": 0},
+            "auth.login": {"allowed": 1, "rejected": 1},
+        }
+
+    def test_idle_keys_are_swept(self) -> None:
+        """Test keys with no hits in the last two windows are evicted."""
+        tracker = RateLimitTracker(sweep_interval=0)
+        config = RateLimitConfig(requests=5, window_seconds=60)
+
+        with patch("src.core.rate_limiter.time.time", return_value=6000.0):
+            for n in range(100):
+                tracker.check_rate_limit(f"10.0.0.{n}", config)
+        with patch("src.core.rate_limiter.time.time", return_value=6000.0 + 121):
+            tracker.check_rate_limit("10.0.1.1", config)
+
+        assert len(tracker._requests) == 1
+        assert tracker.stats()["evicted_keys"] == 100
+
+    def test_key_count_is_capped(self) -> None:
+        """Test the least recently used keys are evicted beyond max_keys."""
+        tracker = RateLimitTracker(max_keys=3)
+        config = RateLimitConfig(requests=5, window_seconds=60)
+        for ip in ("a", "b", "c", "a", "d"):
+            tracker.check_rate_limit(ip, config)
+        assert [key[1] for key in tracker._requests] == ["c", "a", "d"]
+
+    async def test_shared_backend_failure_falls_back_to_memory(self) -> None:
+        """Test an unavailable shared backend degrades to in-memory counters."""
+        tracker = RateLimitTracker(shared_backend=True)
+        config = RateLimitConfig(requests=1, window_seconds=60)
+
+        with patch("src.db.supabase.SupabaseClient.get_client", side_effect=RuntimeError("down")):
+            assert await tracker.acheck_rate_limit("u", config) == (True, 0)
+            allowed, retry_after = await tracker.acheck_rate_limit("u", config)
+
+        assert allowed is False
+        assert retry_after > 0
+        assert tracker.stats()["shared_backend"] is False
+
+    async def test_shared_backend_result_is_used(self) -> None:
+        """Test the rate_limit_hit RPC result decides the request."""
+        tracker = RateLimitTracker(shared_backend=True)
+        config = RateLimitConfig(requests=2, window_seconds=60)
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = MagicMock(
+            data=[{"allowed": False, "previous_hits": 0, "current_hits": 2, "window_start": 6000}]
+        )
+
+        with (
+            patch("src.db.supabase.SupabaseClient.get_client", return_value=client),
+            patch("src.core.rate_limiter.time.time", return_value=6030.0),
+        ):
+            result = await tracker.acheck_rate_limit("u", config, scope="auth.login")
+
+        assert result == (False, 30)
+        assert client.rpc.call_args.args[1]["p_key"] == "auth.login:u"
+        assert tracker.stats()["endpoints"]["auth.login"]["rejected"] == 1
+
+
 class TestGetRateLimitConfig:
     """Tests for get_rate_limit_config function."""
 
@@ -294,6 +395,43 @@ class TestRateLimitDecorator:
         assert exc_info.value.status_code == 429
         assert "retry_after" in exc_info.value.details
 
+    @patch("src.core.rate_limiter.get_settings")
+    async def test_endpoints_share_a_budget_unless_scoped(
+        self,
+        mock_get_settings: MagicMock,
+    ) -> None:
+        """Test spreading requests over endpoints does not raise the limit."""
+        mock_settings = MagicMock()
+        mock_settings.RATE_LIMIT_ENABLED = True
+        mock_get_settings.return_value = mock_settings
+
+        config = RateLimitConfig(requests=2, window_seconds=60)
+
+        async def login(_request: Request) -> JSONResponse:
+            return JSONResponse(content={})
+
+        async def signup(_request: Request) -> JSONResponse:
+            return JSONResponse(content={})
+
+        async def export(_request: Request) -> JSONResponse:
+            return JSONResponse(content={})
+
+        login_limited = rate_limit(config, tracker=self.tracker)(login)
+        signup_limited = rate_limit(config, tracker=self.tracker)(signup)
+        export_limited = rate_limit(config, tracker=self.tracker, scope="export")(export)
+
+        await login_limited(self.create_mock_request())
+        await signup_limited(self.create_mock_request())
+        with pytest.raises(RateLimitError):
+            await login_limited(self.create_mock_request())
+        # An opted-in scope keeps its own budget
+        response = await export_limited(self.create_mock_request())
+        assert response.status_code == 200
+
+        endpoints = self.tracker.stats()["endpoints"]
+        assert endpoints["test_rate_limiter.login"] == {"allowed": 1, "rejected": 1}
+        assert endpoints["test_rate_limiter.signup"] == {"allowed": 1, "rejected": 0}
+
     @patch("src.core.rate_limiter.get_settings")
     async def test_rate_limit_disabled(
         self,
@@ -0,0 +1,168 @@
+"""Tests for the Life Sciences request engine."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.mcp_servers.lifesci.engine import LifesciRequestEngine, TokenBucket
+
+
+def _engine_with(handler: Any, **kwargs: Any) -> LifesciRequestEngine:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return LifesciRequestEngine(lambda: client, **kwargs)
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_concurrent_acquires_are_spaced_by_rate(self) -> None:
+        bucket = TokenBucket(rate=50.0)
+        admitted: list[float] = []
+
+        async def take() -> None:
+            await bucket.acquire()
+            admitted.append(time.monotonic())
+
+        await asyncio.gather(*(take() for _ in range(6)))
+
+        gaps = [b - a for a, b in zip(admitted, admitted[1:], strict=False)]
+        # 50/s -> one admission every 20ms; allow scheduler jitter below
+        assert len(admitted) == 6
+        assert min(gaps) >= 0.015
+
+
+class TestLifesciRequestEngine:
+    @pytest.mark.asyncio
+    async def test_identical_inflight_queries_share_one_fetch(self) -> None:
+        calls = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"ok": True})
+
+        engine = _engine_with(handler)
+
+        async def load() -> Any:
+            return await engine.get_json("https://api.test/x", {"q": "egfr"})
+
+        results = await asyncio.gather(*(engine.cached("k", load) for _ in range(5)))
+
+        assert calls == 1
+        assert results == [{"ok": True}] * 5
+        assert engine.stats()["coalesced"] == 4
+        assert await engine.cached("k", load) == {"ok": True}
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self) -> None:
+        release = asyncio.Event()
+
+        async def load() -> Any:
+            await release.wait()
+            return {"ok": True}
+
+        engine = LifesciRequestEngine(MagicMock())
+        leader = asyncio.create_task(engine.coalesce("k", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(engine.coalesce("k", load))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        release.set()
+
+        assert await follower == {"ok": True}
+        assert engine.stats()["coalesced"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self) -> None:
+        loader = AsyncMock(side_effect=[RuntimeError("down"), {"ok": True}])
+        engine = LifesciRequestEngine(MagicMock())
+
+        with pytest.raises(RuntimeError):
+            await engine.cached("k", loader)
+        assert await engine.cached("k", loader) == {"ok": True}
+
+    def test_lru_bound_and_ttl(self) -> None:
+        engine = LifesciRequestEngine(MagicMock(), max_entries=2)
+        engine.put("a", 1)
+        engine.put("b", 2)
+        engine.get("a")
+        engine.put("c", 3)
+
+        assert engine.get("b") is None
+        assert engine.get("a") == 1
+        engine.put("d", 4, ttl=0.0)
+        assert engine.get("d") is None
+
+    @pytest.mark.asyncio
+    async def test_curl_fallback_is_remembered_per_host(self) -> None:
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(403)
+
+        engine = _engine_with(handler)
+        with patch(
+            "src.mcp_servers.lifesci.engine.curl_get_json",
+            AsyncMock(return_value={"studies": []}),
+        ) as curl:
+            for _ in range(3):
+                assert await engine.get_json("https://ct.test/api", curl_fallback=True) == {"studies": []}
+
+        assert calls == 1
+        assert curl.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises_without_fallback(self) -> None:
+        engine = _engine_with(lambda _request: httpx.Response(500))
+        with pytest.raises(httpx.HTTPStatusError):
+            await engine.get_json("https://api.test/x")
+
+
+class TestPubmedDetailsBatching:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self) -> None:
+        from src.mcp_servers.lifesci import tools as lifesci_tools
+
+        lifesci_tools._get_engine().clear()
+
+    @pytest.mark.asyncio
+    async def test_fetches_in_batches_and_caches_per_pmid(self) -> None:
+        from src.mcp_servers.lifesci import tools as lifesci_tools
+
+        requested: list[list[str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            ids = request.url.params["id"].split(",")
+            requested.append(ids)
+            return httpx.Response(
+                200,
+                json={"result": {"uids": ids, **{pmid: {"uid": pmid} for pmid in ids}}},
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        pmids = [str(i) for i in range(450)]
+
+        with (
+            patch.object(lifesci_tools, "_get_client", return_value=client),
+            patch.object(lifesci_tools._get_engine(), "_buckets", {}),
+        ):
+            first = await lifesci_tools.pubmed_fetch_details_impl(pmids)
+            second = await lifesci_tools.pubmed_fetch_details_impl(["449", "450", "0"])
+
+        assert sorted(len(batch) for batch in requested) == [1, 50, 200, 200]
+        assert list(first) == pmids
+        # Only the unseen PMID was fetched the second time
+        assert requested[-1] == ["450"]
+        assert list(second) == ["449", "450", "0"]
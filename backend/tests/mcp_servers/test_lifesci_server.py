@@ -35,10 +35,10 @@ def _extract_dict(result: Any) -> dict[str, Any]:
 
 @pytest.fixture(autouse=True)
 def _clear_research_cache() -> None:
-    """Clear the lifesci module-level research cache between tests."""
+    """Clear the lifesci request engine's result cache between tests."""
     from src.mcp_servers.lifesci import tools as lifesci_tools
 
-    lifesci_tools._research_cache.clear()
+    lifesci_tools._get_engine().clear()
 
 
 # ── Tool discovery ────────────────────────────────────────────────────
@@ -5,6 +5,7 @@ sent emails during onboarding to seed relationship graph, refine
 writing style, detect active deals, and identify commitments.
 """
 
+import asyncio
 import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,6 +18,7 @@ from src.onboarding.email_bootstrap import (
     EmailBootstrapResult,
     EmailContact,
     PriorityEmailIngestion,
+    _SentMailAggregate,
 )
 from src.onboarding.email_integration import (
     EmailIntegrationConfig,
@@ -64,6 +66,16 @@ def _make_emails_batch(count: int = 10, base_to: str = "contact@example.com") ->
     ]
 
 
+def _stream(*pages: list[dict]):
+    """Stand-in for ``_stream_sent_emails`` that yields the given pages."""
+
+    async def stream(*_args, **_kwargs):
+        for page in pages:
+            yield page
+
+    return stream
+
+
 @pytest.fixture
 def mock_db():
     """Mock Supabase client."""
@@ -611,16 +623,32 @@ class TestStorageIntegration:
 
         await service._store_threads("user-123", threads)
 
-        # Only deal threads should be stored
-        calls = mock_db.table.return_value.insert.call_args_list
-        # At least one call for the deal thread
-        stored = False
-        for call in calls:
-            data = call[0][0] if call[0] else call[1].get("data", {})
-            if isinstance(data, dict) and data.get("metadata", {}).get("type") == "active_deal":
-                stored = True
-                assert data["metadata"]["needs_user_confirmation"] is True
-        assert stored
+        # Only deal threads should be stored, in one bulk upsert
+        mock_db.table.return_value.upsert.assert_called_once()
+        rows = mock_db.table.return_value.upsert.call_args[0][0]
+        assert [row["metadata"]["subject"] for row in rows] == ["Deal Discussion"]
+        assert rows[0]["metadata"]["type"] == "active_deal"
+        assert rows[0]["metadata"]["needs_user_confirmation"] is True
+
+    @pytest.mark.asyncio
+    async def test_deal_threads_with_same_subject_get_distinct_ids(
+        self, service: PriorityEmailIngestion, mock_db: MagicMock
+    ) -> None:
+        """Fact ids come from the thread key, so same-subject deals don't collide."""
+        aggregate = _SentMailAggregate()
+        aggregate.add(
+            [_make_email(subject="Pricing", thread_id="t-acme") for _ in range(3)]
+            + [_make_email(subject="Pricing", thread_id="t-globex") for _ in range(3)]
+        )
+        threads = aggregate.active_threads()
+        for thread in threads:
+            thread.thread_type = "deal"
+
+        await service._store_threads("user-123", threads)
+
+        rows = mock_db.table.return_value.upsert.call_args[0][0]
+        assert [row["metadata"]["subject"] for row in rows] == ["Pricing", "Pricing"]
+        assert len({row["id"] for row in rows}) == 2
 
     @pytest.mark.asyncio
     async def test_stores_commitments_in_prospective_memory(
@@ -783,7 +811,7 @@ class TestFullBootstrapPipeline:
         mock_llm.generate_response = AsyncMock(return_value="[]")
 
         with (
-            patch.object(service, "_fetch_sent_emails", new_callable=AsyncMock) as mock_fetch,
+            patch.object(service, "_stream_sent_emails", _stream(emails[:3], emails[3:])),
             patch.object(service, "_store_contacts", new_callable=AsyncMock),
             patch.object(service, "_store_threads", new_callable=AsyncMock),
             patch.object(service, "_store_commitments", new_callable=AsyncMock),
@@ -792,7 +820,6 @@ class TestFullBootstrapPipeline:
             patch.object(service, "_update_readiness", new_callable=AsyncMock),
             patch.object(service, "_record_episodic", new_callable=AsyncMock),
         ):
-            mock_fetch.return_value = emails
 
             result = await service.run_bootstrap("user-123")
 
@@ -803,9 +830,7 @@ class TestFullBootstrapPipeline:
     @pytest.mark.asyncio
     async def test_pipeline_handles_no_emails(self, service: PriorityEmailIngestion) -> None:
         """Pipeline handles case where no emails are found."""
-        with patch.object(service, "_fetch_sent_emails", new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.return_value = []
-
+        with patch.object(service, "_stream_sent_emails", _stream()):
             result = await service.run_bootstrap("user-123")
 
             assert result.emails_processed == 0
@@ -816,9 +841,11 @@ class TestFullBootstrapPipeline:
         self, service: PriorityEmailIngestion
     ) -> None:
         """Pipeline catches exceptions and returns partial result."""
-        with patch.object(service, "_fetch_sent_emails", new_callable=AsyncMock) as mock_fetch:
-            mock_fetch.side_effect = Exception("Composio unavailable")
+        async def failing_stream(*_args, **_kwargs):
+            raise Exception("Composio unavailable")
+            yield []
 
+        with patch.object(service, "_stream_sent_emails", failing_stream):
             result = await service.run_bootstrap("user-123")
 
             # Should not raise, returns empty result
@@ -833,7 +860,7 @@ class TestFullBootstrapPipeline:
             progress_updates.append(update)
 
         with (
-            patch.object(service, "_fetch_sent_emails", new_callable=AsyncMock) as mock_fetch,
+            patch.object(service, "_stream_sent_emails", _stream(_make_emails_batch(3))),
             patch.object(service, "_store_contacts", new_callable=AsyncMock),
             patch.object(service, "_store_threads", new_callable=AsyncMock),
             patch.object(service, "_store_commitments", new_callable=AsyncMock),
@@ -842,7 +869,6 @@ class TestFullBootstrapPipeline:
             patch.object(service, "_update_readiness", new_callable=AsyncMock),
             patch.object(service, "_record_episodic", new_callable=AsyncMock),
         ):
-            mock_fetch.return_value = _make_emails_batch(3)
 
             await service.run_bootstrap("user-123", progress_callback=track_progress)
 
@@ -851,6 +877,114 @@ class TestFullBootstrapPipeline:
             assert "complete" in stages
 
 
+# ---------------------------------------------------------------------------
+# Streaming ingestion tests
+# ---------------------------------------------------------------------------
+
+
+class TestStreamingIngestion:
+    """Tests for page-by-page ingestion and bulk storage."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_is_fetched_while_current_page_is_processed(
+        self, service: PriorityEmailIngestion
+    ) -> None:
+        """Progress for page 1 can wait on the page 2 fetch without deadlocking."""
+        emails = _make_emails_batch(4)
+        page_2_requested = asyncio.Event()
+
+        async def stream(*_args, **_kwargs):
+            yield emails[:2]
+            page_2_requested.set()
+            yield emails[2:]
+
+        progress: list[dict] = []
+
+        async def on_progress(update: dict) -> None:
+            progress.append(update)
+            if update.get("pages") == 1:
+                await asyncio.wait_for(page_2_requested.wait(), timeout=1)
+
+        with (
+            patch.object(service, "_stream_sent_emails", stream),
+            patch.object(service, "_store_bootstrap_status", new_callable=AsyncMock) as status,
+        ):
+            aggregate = await service._ingest_sent_emails("user-123", [], on_progress)
+
+        assert aggregate.pages == 2
+        assert aggregate.fetched == 4
+        assert [u["emails_fetched"] for u in progress] == [2, 4]
+        assert [c.kwargs["progress"]["pages"] for c in status.await_args_list] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_counts_every_email_but_keeps_only_recent_text_under_cap(
+        self, service: PriorityEmailIngestion
+    ) -> None:
+        """Contacts and threads cover every page; bodies stop at the memory cap."""
+        emails = [
+            _make_email(
+                to=[f"c{i}@example.com"],
+                subject=f"S{i}",
+                body="x" * 98,
+                thread_id="deal",
+            )
+            for i in range(6)
+        ]
+        excluded = _make_email(to=["private@family.com"], body="y" * 98)
+
+        with (
+            patch.object(service, "_stream_sent_emails", _stream(emails[:3], [excluded, *emails[3:]])),
+            patch.object(service, "_store_bootstrap_status", new_callable=AsyncMock),
+            patch("src.onboarding.email_bootstrap.settings.EMAIL_BOOTSTRAP_BUFFER_MAX_BYTES", 400),
+        ):
+            aggregate = await service._ingest_sent_emails(
+                "user-123", [{"type": "domain", "value": "family.com"}]
+            )
+
+        assert aggregate.fetched == 7
+        assert aggregate.emails_seen == 6
+        assert len(aggregate.contacts) == 6
+        assert aggregate.active_threads()[0].message_count == 6
+        # 100 bytes per email: the four most recent fit
+        assert aggregate.retained == emails[:4]
+
+    @pytest.mark.asyncio
+    async def test_contacts_upserted_in_chunks_with_stable_ids(
+        self, service: PriorityEmailIngestion, mock_db: MagicMock
+    ) -> None:
+        """Contacts go out in bulk upserts keyed by an ID that is stable across runs."""
+        contacts = [EmailContact(email=f"c{i}@example.com") for i in range(5)]
+        upsert = mock_db.table.return_value.upsert
+
+        with patch("src.onboarding.email_bootstrap.settings.EMAIL_BOOTSTRAP_UPSERT_BATCH_SIZE", 2):
+            await service._store_contacts("user-123", contacts)
+            first_ids = [row["id"] for c in upsert.call_args_list for row in c.args[0]]
+            upsert.reset_mock()
+            await service._store_contacts("user-123", contacts)
+
+        assert [len(c.args[0]) for c in upsert.call_args_list] == [2, 2, 1]
+        assert [row["id"] for c in upsert.call_args_list for row in c.args[0]] == first_ids
+        assert len(set(first_ids)) == 5
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_is_retried_row_by_row(
+        self, service: PriorityEmailIngestion, mock_db: MagicMock
+    ) -> None:
+        """A chunk the database rejects is written one row at a time."""
+        contacts = [EmailContact(email=f"c{i}@example.com") for i in range(3)]
+        upsert = mock_db.table.return_value.upsert
+        upsert.return_value.execute.side_effect = [Exception("payload too large"), None, None, None]
+
+        await service._store_contacts("user-123", contacts)
+
+        assert [type(c.args[0]).__name__ for c in upsert.call_args_list] == [
+            "list",
+            "dict",
+            "dict",
+            "dict",
+        ]
+
+
 # ---------------------------------------------------------------------------
 # Bootstrap result model tests
 # ---------------------------------------------------------------------------
@@ -931,7 +1065,7 @@ class TestBootstrapTrigger:
 
     @pytest.mark.asyncio
     async def test_fetch_emails_detects_provider(self) -> None:
-        """PriorityEmailIngestion._fetch_sent_emails detects provider from user_integrations."""
+        """PriorityEmailIngestion._stream_sent_emails detects provider from user_integrations."""
         mock_db = MagicMock()
         # Mock the provider lookup
         mock_result = MagicMock()
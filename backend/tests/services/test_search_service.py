@@ -339,6 +339,106 @@ class TestGlobalSearch:
             assert call[0][0] <= 5
 
 
+class TestIndexedSearch:
+    """Tests for global_search over the full-text search index."""
+
+    @pytest.fixture(autouse=True)
+    def _index_available(self, monkeypatch):
+        monkeypatch.setattr("src.services.search_service._index_unavailable_until", 0.0)
+
+    @staticmethod
+    def _rpc_client(rows_by_type):
+        mock_client = MagicMock()
+
+        def rpc(name, params):
+            assert name == "search_items"
+            builder = MagicMock()
+            builder.execute.return_value = MagicMock(data=rows_by_type.get(params["p_item_type"], []))
+            return builder
+
+        mock_client.rpc.side_effect = rpc
+        return mock_client
+
+    @pytest.mark.asyncio
+    @patch("src.db.supabase.SupabaseClient.get_client")
+    async def test_queries_each_type_and_merges_by_score(self, mock_get_client):
+        """One RPC per type; results are merged by the index score."""
+        mock_client = self._rpc_client(
+            {
+                "lead": [
+                    {
+                        "item_type": "lead",
+                        "item_id": "lead_1",
+                        "title": "Pfizer Inc.",
+                        "body": "",
+                        "metadata": {"stage": "opportunity", "health_score": 70},
+                        "score": 0.61,
+                    }
+                ],
+                "memory": [
+                    {
+                        "item_type": "memory",
+                        "item_id": "fact_1",
+                        "title": "Pfizer is expanding ADC manufacturing",
+                        "body": "Pfizer is expanding ADC manufacturing",
+                        "metadata": {},
+                        "score": 0.83,
+                    }
+                ],
+            }
+        )
+        mock_get_client.return_value = mock_client
+
+        service = SearchService()
+        results = await service.global_search(user_id="user_123", query="pfiz", limit=10)
+
+        requested = sorted(call.args[1]["p_item_type"] for call in mock_client.rpc.call_args_list)
+        assert requested == ["briefing", "conversation", "document", "goal", "lead", "memory"]
+        assert all(call.args[1]["p_query"] == "pfiz" for call in mock_client.rpc.call_args_list)
+        mock_client.table.assert_not_called()
+
+        assert [(r.type, r.id) for r in results] == [("memory", "fact_1"), ("lead", "lead_1")]
+        assert results[0].title == "Memory"
+        assert results[0].url == "/memory/fact_1"
+        assert results[1].snippet == "Stage: opportunity | Health: 70/100"
+        assert results[1].url == "/leads/lead_1"
+
+    @pytest.mark.asyncio
+    @patch("src.db.supabase.SupabaseClient.get_client")
+    async def test_type_filter_limits_rpc_calls(self, mock_get_client):
+        """Only the requested types are queried."""
+        mock_client = self._rpc_client({})
+        mock_get_client.return_value = mock_client
+
+        service = SearchService()
+        await service.global_search(user_id="user_123", query="q", types=["goals"], limit=3)
+
+        mock_client.rpc.assert_called_once_with(
+            "search_items",
+            {"p_user_id": "user_123", "p_query": "q", "p_item_type": "goal", "p_limit": 3},
+        )
+
+    @pytest.mark.asyncio
+    @patch("src.db.supabase.SupabaseClient.get_client")
+    async def test_falls_back_to_ilike_when_index_missing(self, mock_get_client):
+        """A failing RPC falls back to the ILIKE scans and is not retried at once."""
+        mock_client = MagicMock()
+        mock_client.rpc.return_value.execute.side_effect = Exception("function search_items does not exist")
+        goals_query = mock_client.table.return_value.select.return_value.eq.return_value.ilike.return_value
+        goals_query.limit.return_value.execute.return_value = MagicMock(
+            data=[{"id": "goal_1", "title": "Close Pfizer", "description": "", "progress": 20}]
+        )
+        mock_get_client.return_value = mock_client
+
+        service = SearchService()
+        first = await service.global_search(user_id="user_123", query="pfizer", types=["goals"])
+        second = await service.global_search(user_id="user_123", query="pfizer", types=["goals"])
+
+        assert [r.id for r in first] == ["goal_1"]
+        assert [r.id for r in second] == ["goal_1"]
+        assert mock_client.rpc.call_count == 1
+
+
 class TestRecentItems:
     """Tests for the recent_items method."""
 
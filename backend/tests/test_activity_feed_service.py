@@ -8,7 +8,7 @@ Tests cover:
 """
 
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -432,6 +432,25 @@ class TestCreateActivity:
         assert result["activity_type"] == "email_drafted"
         mock_table.insert.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_pushes_activity_to_websocket(self) -> None:
+        db = _mock_db()
+        mock_table = MagicMock()
+        created = _make_activity()
+        _chain(mock_table, [created])
+        db.table = lambda _: mock_table
+
+        service = _make_service(db)
+        with patch("src.services.activity_feed_service.ws_manager") as mock_ws:
+            mock_ws.send_activity = AsyncMock()
+            await service.create_activity(
+                user_id=SAMPLE_USER_ID,
+                activity_type="email_drafted",
+                title="Drafted email to John",
+            )
+
+        mock_ws.send_activity.assert_awaited_once_with(SAMPLE_USER_ID, created)
+
     @pytest.mark.asyncio
     async def test_creates_with_related_entity(self) -> None:
         db = _mock_db()
@@ -405,3 +405,153 @@ class TestCacheWithExceptions:
 
         await failing_func(False)  # Cached
         assert call_count == 3
+
+
+class TestPerEntryTTL:
+    """Tests for per-entry TTL overrides."""
+
+    def test_set_respects_ttl_override(self) -> None:
+        """An entry's own TTL should win over the cache default."""
+        now = [0.0]
+        cache = Cache(default_ttl=60, timer=lambda: now[0])
+
+        cache.set("short", 1, ttl=5)
+        cache.set("default", 2)
+
+        now[0] = 6.0
+        assert cache.get("short") == (None, False)
+        assert cache.get("default") == (2, True)
+
+        now[0] = 61.0
+        assert cache.get("default") == (None, False)
+        assert cache.get_stats()["regions"]["default"]["expirations"] == 2
+
+
+class TestTagInvalidation:
+    """Tests for tag-based invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags_spans_regions(self) -> None:
+        """Invalidating a tag should drop tagged entries in every region only."""
+        cache = Cache()
+        calls: list[str] = []
+
+        @cached(
+            ttl=60,
+            key_func=lambda user_id: user_id,
+            tags=lambda user_id: [f"user:{user_id}"],
+            cache_instance=cache,
+        )
+        async def get_profile(user_id: str) -> str:
+            calls.append(f"profile:{user_id}")
+            return user_id
+
+        cache.set("settings:u1", {"theme": "dark"}, tags=["user:u1"])
+        await get_profile("u1")
+        await get_profile("u2")
+
+        assert cache.invalidate_tags("user:u1") == 2
+
+        assert cache.get("settings:u1") == (None, False)
+        await get_profile("u1")
+        await get_profile("u2")
+        assert calls == ["profile:u1", "profile:u2", "profile:u1"]
+
+    def test_overwritten_and_evicted_entries_leave_tag_index(self) -> None:
+        """The tag index should only reference live entries."""
+        cache = Cache(maxsize=1)
+        cache.set("a", 1, tags=["t1"])
+        cache.set("a", 2, tags=["t2"])
+        cache.set("b", 3, tags=["t3"])
+
+        assert cache._tag_index == {"t3": {("default", "b")}}
+        assert cache.invalidate_tags("t1", "t2") == 0
+
+
+class TestSingleFlight:
+    """Tests for single-flight loading in @cached."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_call(self) -> None:
+        """Concurrent calls for the same key should execute the function once."""
+        cache = Cache()
+        call_count = 0
+        release = asyncio.Event()
+
+        @cached(ttl=60, cache_instance=cache)
+        async def slow(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return x * 2
+
+        pending = [asyncio.create_task(slow(1)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*pending) == [2] * 10
+        assert call_count == 1
+        stats = cache.get_stats()["regions"]["slow"]
+        assert (stats["misses"], stats["coalesced"], stats["inflight"]) == (1, 9, 0)
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_exception_and_nothing_is_cached(self) -> None:
+        """A failed load should fail every waiter and not be cached."""
+        cache = Cache()
+        release = asyncio.Event()
+
+        @cached(ttl=60, cache_instance=cache)
+        async def failing() -> int:
+            await release.wait()
+            raise ValueError("boom")
+
+        pending = [asyncio.create_task(failing()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(cache.region("failing")) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_load(self) -> None:
+        """Cancelling the first caller should not fail the others."""
+        cache = Cache()
+        release = asyncio.Event()
+
+        @cached(ttl=60, cache_instance=cache)
+        async def slow() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(slow())
+        second = asyncio.create_task(slow())
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_load_overlapping_invalidation_is_not_stored(self) -> None:
+        """A value loaded across an invalidation should not be cached."""
+        cache = Cache()
+        release = asyncio.Event()
+        call_count = 0
+
+        @cached(ttl=60, cache_instance=cache, tags=lambda: ["user:u1"])
+        async def load() -> int:
+            nonlocal call_count
+            call_count += 1
+            await release.wait()
+            return call_count
+
+        pending = asyncio.create_task(load())
+        await asyncio.sleep(0)
+        cache.invalidate_tags("user:u1")
+        release.set()
+
+        assert await pending == 1
+        assert await load() == 2
+        assert call_count == 2
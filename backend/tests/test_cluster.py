@@ -0,0 +1,162 @@
+"""Tests for cross-worker fan-out (ClusterBus) of EventBus and ConnectionManager."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.cluster import ClusterBus, InProcessBroker
+from src.core.event_bus import EventBus, GoalEvent
+from src.core.ws import ConnectionManager
+from src.models.ws_events import ThinkingEvent
+
+
+async def _settle(*buses: ClusterBus) -> None:
+    """Wait until every relayed message has been sent and handled."""
+    for _ in range(3):
+        for bus in buses:
+            await bus._outbox.join()  # type: ignore[union-attr]
+            await bus._inbox.join()  # type: ignore[union-attr]
+
+
+@pytest.fixture
+async def workers() -> AsyncIterator[tuple[ClusterBus, ClusterBus]]:
+    """Two cluster buses joined through a shared in-process hub."""
+    hub: set[InProcessBroker] = set()
+    a = ClusterBus(InProcessBroker(hub))
+    b = ClusterBus(InProcessBroker(hub))
+    await a.start()
+    await b.start()
+    yield a, b
+    await a.stop()
+    await b.stop()
+
+
+@pytest.mark.asyncio
+async def test_standalone_bus_does_not_relay() -> None:
+    bus = ClusterBus()
+    await bus.start()
+    assert not bus.distributed
+    assert bus.publish("goal_events", {"x": 1}) is False
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_goal_event_reaches_subscriber_on_other_worker(workers) -> None:
+    a, b = workers
+    bus_a, bus_b = EventBus(cluster=a), EventBus(cluster=b)
+    local = bus_a.subscribe("goal-1")
+    remote = bus_b.subscribe("goal-1")
+
+    event = GoalEvent(goal_id="goal-1", user_id="u1", event_type="goal.complete", data={"ok": 1})
+    await bus_a.publish(event)
+    await _settle(a, b)
+
+    assert local.get_nowait() is event
+    relayed = remote.get_nowait()
+    assert relayed.to_dict() == event.to_dict()
+    # The publishing worker does not receive its own relay
+    assert local.empty()
+
+
+@pytest.mark.asyncio
+async def test_websocket_presence_and_delivery_across_workers(workers) -> None:
+    a, b = workers
+    mgr_a, mgr_b = ConnectionManager(), ConnectionManager()
+    mgr_a.attach_cluster(a, presence_interval=60)
+    mgr_b.attach_cluster(b, presence_interval=60)
+    ws = AsyncMock()
+
+    await mgr_b.connect("user-1", ws)
+    await _settle(a, b)
+    assert mgr_a.is_connected("user-1")
+
+    await mgr_a.send_to_user("user-1", ThinkingEvent())
+    await _settle(a, b)
+    ws.send_json.assert_awaited_once()
+    assert ws.send_json.await_args.args[0]["type"] == "aria.thinking"
+
+    mgr_b.disconnect("user-1", ws)
+    await _settle(a, b)
+    assert not mgr_a.is_connected("user-1")
+
+    await mgr_a.detach_cluster()
+    await mgr_b.detach_cluster()
+
+
+@pytest.mark.asyncio
+async def test_silent_peer_presence_expires() -> None:
+    mgr = ConnectionManager()
+    await mgr._on_remote_presence({"users": ["user-1", "user-2"]}, "worker-x")
+    assert mgr.is_connected("user-2")
+
+    mgr._expire_peers(cutoff=float("inf"))
+
+    assert not mgr.is_connected("user-1")
+    assert mgr.get_connection_stats()["peer_workers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_outbox_drops_and_counts() -> None:
+    hub: set[InProcessBroker] = set()
+    bus = ClusterBus(InProcessBroker(hub), queue_size=2)
+    await bus.start()
+    bus._tasks[0].cancel()  # stall the sender
+    await asyncio.sleep(0)
+
+    results = [bus.publish("c", {"n": n}) for n in range(4)]
+
+    assert results == [True, True, False, False]
+    assert bus.stats()["dropped_outgoing"] == 2
+    await bus.stop(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_signed_bus_drops_unsigned_and_forged_messages() -> None:
+    hub: set[InProcessBroker] = set()
+    a = ClusterBus(InProcessBroker(hub), secret="s3cret")
+    b = ClusterBus(InProcessBroker(hub), secret="s3cret")
+    intruder = InProcessBroker(hub)
+    await intruder.start(lambda _message: None)
+    await a.start()
+    await b.start()
+    received: list[dict] = []
+
+    async def handler(payload: dict, _origin: str) -> None:
+        received.append(payload)
+
+    b.subscribe("ws.deliver", handler)
+
+    a.publish("ws.deliver", {"user_id": "u1", "data": {"ok": 1}})
+    await _settle(a, b)
+    assert received == [{"user_id": "u1", "data": {"ok": 1}}]
+
+    forged = {"origin": "x", "channel": "ws.deliver", "payload": {"user_id": "u1", "data": {}}}
+    await intruder.publish(forged)
+    await intruder.publish(ClusterBus(secret="other")._seal(forged))
+    tampered = a._seal(forged)
+    tampered["signed"] = tampered["signed"].replace('"u1"', '"u2"')
+    await intruder.publish(tampered)
+    await _settle(a, b)
+
+    assert len(received) == 1
+    assert b.stats()["rejected_incoming"] == 3
+    await a.stop()
+    await b.stop()
+    await intruder.close()
+
+
+@pytest.mark.asyncio
+async def test_signed_bus_drops_replayed_stale_messages() -> None:
+    bus = ClusterBus(InProcessBroker(set()), secret="s3cret")
+    await bus.start()
+    with patch("src.core.cluster.time.time", return_value=time.time() - 3600):
+        message = bus._seal({"origin": "peer", "channel": "c", "payload": {}})
+
+    bus._receive(message)
+
+    assert bus.stats()["rejected_incoming"] == 1
+    assert bus._inbox.empty()  # type: ignore[union-attr]
+    await bus.stop()
@@ -584,6 +584,216 @@ class TestBatchScoreAllLeads:
         assert result.duration_seconds >= 0
 
 
+class _FakeQuery:
+    """In-memory PostgREST query builder covering the scoring queries."""
+
+    def __init__(self, db: "_FakeScoringDB", table: str) -> None:
+        self._db = db
+        self._table = table
+        self._filters: list = []
+        self._order: tuple[str, bool] | None = None
+        self._slice: tuple[int, int] | None = None
+        self._single = False
+        self._count = False
+        self._update: dict | None = None
+        self._insert: list | None = None
+
+    def select(self, _columns, count=None):
+        self._count = count == "exact"
+        return self
+
+    def eq(self, column, value):
+        self._filters.append(lambda r: r.get(column) == value)
+        return self
+
+    def in_(self, column, values):
+        values = set(values)
+        self._filters.append(lambda r: r.get(column) in values)
+        return self
+
+    def gte(self, column, value):
+        self._filters.append(lambda r: r.get(column) is not None and r[column] >= value)
+        return self
+
+    def order(self, column, desc=False):
+        self._order = (column, desc)
+        return self
+
+    def limit(self, n):
+        self._slice = (0, n)
+        return self
+
+    def range(self, start, end):
+        self._slice = (start, end + 1)
+        return self
+
+    def single(self):
+        self._single = True
+        return self
+
+    def update(self, values):
+        self._update = values
+        return self
+
+    def insert(self, rows):
+        self._insert = rows if isinstance(rows, list) else [rows]
+        return self
+
+    def execute(self):
+        self._db.requests += 1
+        rows = self._db.tables.setdefault(self._table, [])
+        if self._insert is not None:
+            rows.extend(self._insert)
+            return MagicMock(data=self._insert)
+        matched = [r for r in rows if all(f(r) for f in self._filters)]
+        if self._update is not None:
+            for r in matched:
+                r.update(self._update)
+            return MagicMock(data=matched)
+        if self._order:
+            column, desc = self._order
+            matched.sort(key=lambda r: r[column], reverse=desc)
+        if self._slice:
+            matched = matched[self._slice[0] : self._slice[1]]
+        if self._single:
+            return MagicMock(data=dict(matched[0]) if matched else None)
+        return MagicMock(data=[dict(r) for r in matched], count=len(matched))
+
+
+class _FakeScoringDB:
+    def __init__(self, tables: dict) -> None:
+        self.tables = tables
+        self.requests = 0
+
+    def table(self, name):
+        return _FakeQuery(self, name)
+
+    def rpc(self, name, params):
+        assert name == "bulk_set_lead_conversion_scores"
+        leads = {lead["id"]: lead for lead in self.tables["lead_memories"]}
+
+        def execute():
+            self.requests += 1
+            for row in params["p_rows"]:
+                lead = leads[row["id"]]
+                lead["metadata"] = {**(lead.get("metadata") or {}), "conversion_score": row["conversion_score"]}
+            return MagicMock(data=len(params["p_rows"]))
+
+        return MagicMock(execute=execute)
+
+
+def _scoring_tables(user_id: str, n_leads: int) -> dict:
+    """Active leads with varied events, stakeholders, history, meetings and commitments."""
+    import random
+
+    rng = random.Random(5)
+    now = datetime.now(UTC)
+
+    def ts(**delta) -> str:
+        return (now - timedelta(**delta)).isoformat()
+
+    tables: dict = {name: [] for name in (
+        "lead_memories", "lead_memory_events", "lead_memory_stakeholders", "video_sessions",
+        "health_score_history", "debriefs", "lead_memory_insights", "predictions",
+    )}
+    for i in range(n_leads):
+        lead_id = str(uuid4())
+        tables["lead_memories"].append({
+            "id": lead_id, "user_id": user_id, "company_name": f"Lead {i}", "status": "active",
+            "lifecycle_stage": rng.choice(["lead", "opportunity", "account"]),
+            "created_at": ts(days=rng.randint(1, 200)), "updated_at": ts(days=rng.randint(0, 120)),
+            "metadata": {"keep": i},
+        })
+        for _ in range(rng.randint(0, 25)):
+            tables["lead_memory_events"].append({
+                "id": str(uuid4()), "lead_memory_id": lead_id,
+                "event_type": rng.choice(["email_sent", "email_received", "call", "note"]),
+                "direction": rng.choice(["outbound", "inbound"]),
+                "occurred_at": ts(hours=rng.randint(1, 40 * 24)),
+            })
+        for _ in range(rng.randint(0, 4)):
+            tables["lead_memory_stakeholders"].append({
+                "id": str(uuid4()), "lead_memory_id": lead_id,
+                "role": rng.choice(["decision_maker", "champion", "influencer", "user", None]),
+                "influence_level": rng.randint(1, 10),
+                "sentiment": rng.choice(["positive", "negative", "neutral"]),
+            })
+        for _ in range(rng.randint(0, 7)):
+            tables["video_sessions"].append({
+                "id": str(uuid4()), "lead_id": lead_id, "status": rng.choice(["ended", "active"]),
+                "perception_analysis": {"engagement_score": rng.random()},
+                "created_at": ts(hours=rng.randint(1, 2000)),
+            })
+        for _ in range(rng.randint(0, 6)):
+            tables["health_score_history"].append({
+                "id": str(uuid4()), "lead_memory_id": lead_id, "score": rng.randint(20, 95),
+                "calculated_at": ts(hours=rng.randint(1, 45 * 24)),
+            })
+        for _ in range(rng.randint(0, 6)):
+            tables["debriefs"].append({
+                "id": str(uuid4()), "lead_memory_id": lead_id, "created_at": ts(days=rng.randint(0, 90)),
+            })
+        for _ in range(rng.randint(0, 4)):
+            tables["lead_memory_insights"].append({
+                "id": str(uuid4()), "lead_memory_id": lead_id,
+                "insight_type": rng.choice(["commitment", "risk"]),
+                "metadata": {"direction": rng.choice(["theirs", "ours"])},
+                "addressed_at": rng.choice([None, ts(days=1)]),
+            })
+    return tables
+
+
+class TestBatchFeaturePipeline:
+    """The batch pipeline must match the single-lead path exactly."""
+
+    @pytest.mark.asyncio
+    async def test_batch_scores_match_single_lead_path(self):
+        import copy
+
+        user_id = str(uuid4())
+        tables = _scoring_tables(user_id, 40)
+
+        batch_db = _FakeScoringDB(copy.deepcopy(tables))
+        with patch("src.services.conversion_scoring.SupabaseClient.get_client", return_value=batch_db):
+            batch_service = ConversionScoringService()
+        batch_service._activity_service = MagicMock(record=MagicMock(side_effect=Exception("skip")))
+        result = await batch_service.batch_score_all_leads(user_id)
+
+        assert result.scored == 40
+        assert result.errors == []
+        # One leads read, six source-table reads, one score write, one prediction insert
+        assert batch_db.requests == 9
+        assert len(batch_db.tables["predictions"]) == 40
+
+        single_db = _FakeScoringDB(copy.deepcopy(tables))
+        with patch("src.services.conversion_scoring.SupabaseClient.get_client", return_value=single_db):
+            single_service = ConversionScoringService()
+        for lead in batch_db.tables["lead_memories"]:
+            stored = ConversionScore(**lead["metadata"]["conversion_score"])
+            assert lead["metadata"]["keep"] is not None
+            expected = await single_service.calculate_conversion_score(lead["id"], force_refresh=True)
+            assert stored.feature_values == expected.feature_values
+            assert stored.feature_importance == expected.feature_importance
+            assert stored.conversion_probability == expected.conversion_probability
+            assert stored.confidence == expected.confidence
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_to_single_lead_path_on_load_error(self, service):
+        leads = [{"id": str(uuid4())}, {"id": str(uuid4())}]
+        service._db.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=leads
+        )
+
+        with (
+            patch.object(service, "_calculate_features_batch", side_effect=RuntimeError("boom")),
+            patch.object(service, "calculate_conversion_score") as single,
+        ):
+            result = await service.batch_score_all_leads(uuid4())
+
+        assert single.call_count == 2
+        assert result.scored == 2
+
+
 # === Edge Case Tests ===
 
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -439,3 +441,294 @@ class TestLLMClientGovernance:
 
         # Response still returned despite recording failure
         assert result == "Hello"
+
+
+# ---------------------------------------------------------------------------
+# Budget ledger tests
+# ---------------------------------------------------------------------------
+
+
+def _usage_row(input_tokens: int = 0, output_tokens: int = 0) -> dict[str, Any]:
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "extended_thinking_tokens": 0,
+        "estimated_cost_cents": 0.0,
+        "request_count": 0,
+    }
+
+
+class TestBudgetLedger:
+    """Tests for the in-memory budget ledger behind check_budget."""
+
+    @pytest.fixture(autouse=True)
+    def ledger_settings(self) -> Any:
+        with patch(
+            "src.core.cost_governor._get_settings",
+            return_value=SimpleNamespace(
+                COST_GOVERNOR_ENABLED=True,
+                COST_GOVERNOR_DAILY_TOKEN_BUDGET=1_000,
+                COST_GOVERNOR_DAILY_THINKING_BUDGET=500,
+                COST_GOVERNOR_SOFT_LIMIT_PERCENT=0.80,
+                COST_GOVERNOR_INPUT_TOKEN_COST_PER_M=3.0,
+                COST_GOVERNOR_OUTPUT_TOKEN_COST_PER_M=15.0,
+                COST_GOVERNOR_THINKING_TOKEN_COST_PER_M=15.0,
+            ),
+        ):
+            yield
+
+    @pytest.fixture
+    def mock_db(self) -> Any:
+        """Direct-write path for record_usage (buffer not running)."""
+        mock_client = MagicMock()
+        with patch("src.db.supabase.SupabaseClient.get_client", return_value=mock_client):
+            yield mock_client
+
+    @pytest.mark.asyncio
+    async def test_seeds_once_then_answers_from_memory(self) -> None:
+        governor = CostGovernor(ledger_max_staleness=60)
+        governor._get_today_usage = AsyncMock(return_value=_usage_row(100, 50))  # type: ignore[method-assign]
+
+        for _ in range(5):
+            status = await governor.check_budget("user-1")
+            assert status.tokens_used_today == 150
+
+        governor._get_today_usage.assert_awaited_once_with("user-1")
+
+    @pytest.mark.asyncio
+    async def test_matches_uncached_budget_status(self) -> None:
+        row = _usage_row(700, 150)
+        cached = CostGovernor(ledger_max_staleness=60)
+        cached._get_today_usage = AsyncMock(return_value=dict(row))  # type: ignore[method-assign]
+        uncached = CostGovernor()
+        uncached._get_today_usage = AsyncMock(return_value=dict(row))  # type: ignore[method-assign]
+
+        assert await cached.check_budget("user-1") == await uncached.check_budget("user-1")
+
+    @pytest.mark.asyncio
+    async def test_record_usage_updates_ledger_locally(self, mock_db: MagicMock) -> None:
+        governor = CostGovernor(ledger_max_staleness=60)
+        governor._get_today_usage = AsyncMock(return_value=_usage_row(900, 0))  # type: ignore[method-assign]
+        assert (await governor.check_budget("user-1")).can_proceed is True
+
+        await governor.record_usage("user-1", LLMUsage(input_tokens=60, output_tokens=40))
+
+        status = await governor.check_budget("user-1")
+        assert status.tokens_used_today == 1_000
+        assert status.can_proceed is False
+        assert status.llm_calls_today == 1
+        governor._get_today_usage.assert_awaited_once()
+        mock_db.rpc.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reconciles_when_stale(self) -> None:
+        governor = CostGovernor(ledger_max_staleness=30)
+        governor._get_today_usage = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[_usage_row(100), _usage_row(400)]
+        )
+
+        with patch("src.core.cost_governor.time.monotonic", return_value=1_000.0):
+            assert (await governor.check_budget("user-1")).tokens_used_today == 100
+        with patch("src.core.cost_governor.time.monotonic", return_value=1_029.0):
+            assert (await governor.check_budget("user-1")).tokens_used_today == 100
+        with patch("src.core.cost_governor.time.monotonic", return_value=1_031.0):
+            assert (await governor.check_budget("user-1")).tokens_used_today == 400
+
+        assert governor._get_today_usage.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reconciles_after_local_token_threshold(self, mock_db: MagicMock) -> None:  # noqa: ARG002
+        governor = CostGovernor(ledger_max_staleness=3600, ledger_reconcile_tokens=100)
+        governor._get_today_usage = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[_usage_row(0), _usage_row(250)]
+        )
+        await governor.check_budget("user-1")
+
+        await governor.record_usage("user-1", LLMUsage(input_tokens=99))
+        assert (await governor.check_budget("user-1")).tokens_used_today == 99
+
+        await governor.record_usage("user-1", LLMUsage(input_tokens=1))
+        assert (await governor.check_budget("user-1")).tokens_used_today == 250
+        assert governor._get_today_usage.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reconciles_on_day_rollover(self) -> None:
+        governor = CostGovernor(ledger_max_staleness=3600)
+        governor._get_today_usage = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[_usage_row(900), _usage_row(0)]
+        )
+        await governor.check_budget("user-1")
+        governor._ledger["user-1"].day = "2000-01-01"
+
+        status = await governor.check_budget("user-1")
+        assert status.tokens_used_today == 0
+        assert status.can_proceed is True
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_checks_share_one_db_read(self) -> None:
+        governor = CostGovernor(ledger_max_staleness=60)
+
+        async def slow_read(_user_id: str) -> dict[str, Any]:
+            await asyncio.sleep(0.01)
+            return _usage_row(500)
+
+        governor._get_today_usage = AsyncMock(side_effect=slow_read)  # type: ignore[method-assign]
+
+        results = await asyncio.gather(*(governor.check_budget("user-1") for _ in range(20)))
+
+        assert {r.tokens_used_today for r in results} == {500}
+        governor._get_today_usage.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_records_are_not_lost(self, mock_db: MagicMock) -> None:  # noqa: ARG002
+        """Parallel calls near the limit all count; the next check blocks."""
+        governor = CostGovernor(ledger_max_staleness=60, ledger_reconcile_tokens=10_000)
+        governor._get_today_usage = AsyncMock(return_value=_usage_row(900))  # type: ignore[method-assign]
+
+        statuses = await asyncio.gather(*(governor.check_budget("user-1") for _ in range(10)))
+        assert all(s.can_proceed for s in statuses)
+
+        await asyncio.gather(
+            *(governor.record_usage("user-1", LLMUsage(output_tokens=50)) for _ in range(10))
+        )
+
+        status = await governor.check_budget("user-1")
+        assert status.tokens_used_today == 1_400
+        assert status.tokens_remaining == 0
+        assert status.can_proceed is False
+        assert status.llm_calls_today == 10
+
+    @pytest.mark.asyncio
+    async def test_usage_recorded_during_reconcile_is_kept(self, mock_db: MagicMock) -> None:  # noqa: ARG002
+        """A direct write racing the reconcile read is still counted."""
+        governor = CostGovernor(ledger_max_staleness=60)
+        read_started = asyncio.Event()
+        release_read = asyncio.Event()
+
+        async def blocking_read(_user_id: str) -> dict[str, Any]:
+            read_started.set()
+            await release_read.wait()
+            return _usage_row(900)  # snapshot taken before the write landed
+
+        governor._get_today_usage = AsyncMock(side_effect=blocking_read)  # type: ignore[method-assign]
+
+        check = asyncio.create_task(governor.check_budget("user-1"))
+        await read_started.wait()
+        await governor.record_usage("user-1", LLMUsage(input_tokens=200))
+        release_read.set()
+
+        status = await check
+        assert status.tokens_used_today == 1_100
+        assert status.can_proceed is False
+
+    @pytest.mark.asyncio
+    async def test_buffered_usage_counted_once_across_reconcile(self) -> None:
+        """With write-behind on, reconcile reads pending deltas from the buffer."""
+        from src.core.usage_writer import UsageWriteBuffer
+
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        buffer._running = True
+        governor = CostGovernor(ledger_max_staleness=0)
+        governor._get_today_usage = AsyncMock(return_value=_usage_row(100))  # type: ignore[method-assign]
+
+        with patch("src.core.usage_writer.get_usage_write_buffer", return_value=buffer):
+            await governor.check_budget("user-1")
+            await governor.record_usage("user-1", LLMUsage(input_tokens=300))
+            status = await governor.check_budget("user-1")
+
+        assert status.tokens_used_today == 400
+
+    @staticmethod
+    def _flushing_buffer() -> tuple[Any, MagicMock, asyncio.Event, asyncio.Event]:
+        """Running write buffer whose usage_tracking RPC blocks until released."""
+        from src.core.usage_writer import UsageWriteBuffer
+
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        buffer._running = True
+        rpc_started = asyncio.Event()
+        release_rpc = asyncio.Event()
+
+        async def slow_rpc() -> MagicMock:
+            rpc_started.set()
+            await release_rpc.wait()
+            return MagicMock(data=None)
+
+        client = MagicMock()
+        client.rpc.return_value.execute = slow_rpc
+        return buffer, client, rpc_started, release_rpc
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("staleness", [None, 0])
+    async def test_check_budget_counts_usage_in_a_slow_flush(
+        self, staleness: float | None
+    ) -> None:
+        buffer, client, rpc_started, release_rpc = self._flushing_buffer()
+        governor = CostGovernor(ledger_max_staleness=staleness)
+        governor._get_today_usage = AsyncMock(return_value=_usage_row(100))  # type: ignore[method-assign]
+
+        with (
+            patch("src.core.usage_writer.get_usage_write_buffer", return_value=buffer),
+            patch(
+                "src.db.supabase.SupabaseClient.get_async_client",
+                new_callable=AsyncMock,
+                return_value=client,
+            ),
+        ):
+            await governor.record_usage("user-1", LLMUsage(input_tokens=900))
+            flush = asyncio.create_task(buffer.flush())
+            await rpc_started.wait()
+
+            status = await governor.check_budget("user-1")
+            release_rpc.set()
+            await flush
+
+        assert status.tokens_used_today == 1_000
+        assert status.can_proceed is False
+
+    @pytest.mark.asyncio
+    async def test_flush_landing_during_reconcile_read_is_counted(self) -> None:
+        buffer, client, rpc_started, release_rpc = self._flushing_buffer()
+        governor = CostGovernor(ledger_max_staleness=60)
+        read_started = asyncio.Event()
+        release_read = asyncio.Event()
+
+        async def blocking_read(_user_id: str) -> dict[str, Any]:
+            read_started.set()
+            await release_read.wait()
+            return _usage_row(100)  # snapshot taken before the flush committed
+
+        governor._get_today_usage = AsyncMock(side_effect=blocking_read)  # type: ignore[method-assign]
+
+        with (
+            patch("src.core.usage_writer.get_usage_write_buffer", return_value=buffer),
+            patch(
+                "src.db.supabase.SupabaseClient.get_async_client",
+                new_callable=AsyncMock,
+                return_value=client,
+            ),
+        ):
+            await governor.record_usage("user-1", LLMUsage(input_tokens=900))
+            check = asyncio.create_task(governor.check_budget("user-1"))
+            await read_started.wait()
+
+            flush = asyncio.create_task(buffer.flush())
+            await rpc_started.wait()
+            release_rpc.set()
+            await flush
+            assert buffer.pending_delta("user-1") is None
+
+            release_read.set()
+            status = await check
+
+        assert status.tokens_used_today == 1_000
+        assert status.can_proceed is False
+
+    @pytest.mark.asyncio
+    async def test_ledger_disabled_reads_db_every_time(self) -> None:
+        governor = CostGovernor()
+        governor._get_today_usage = AsyncMock(return_value=_usage_row(10))  # type: ignore[method-assign]
+
+        await governor.check_budget("user-1")
+        await governor.check_budget("user-1")
+
+        assert governor._get_today_usage.await_count == 2
@@ -552,3 +552,116 @@ async def test_process_document_marks_failed_on_error(
     # Verify document was marked as failed
     update_calls = progress_chain.update.call_args_list
     assert any(call[0][0].get("processing_status") == "failed" for call in update_calls)
+
+
+# --- Batched pipeline tests ---
+
+
+def _embedding_client(calls: list[list[str]]) -> MagicMock:
+    """Fake OpenAI client: embeds each input as [len(text), index, 0, ...]."""
+
+    async def create(model: str, input: list[str]) -> MagicMock:  # noqa: A002, ARG001
+        calls.append(input)
+        data = [
+            MagicMock(index=i, embedding=[float(len(text)), float(i)] + [0.0] * 1534)
+            for i, text in enumerate(input)
+        ]
+        return MagicMock(data=list(reversed(data)))
+
+    client = MagicMock()
+    client.embeddings.create = create
+    return client
+
+
+@pytest.mark.asyncio()
+async def test_store_chunks_batches_embeddings_and_inserts(
+    service: DocumentIngestionService,
+    mock_db: MagicMock,
+) -> None:
+    """Chunks are embedded in batches and written with bulk inserts."""
+    from src.onboarding.document_ingestion import _content_hash
+
+    chunks = [{"content": f"Chunk number {i} " * 5, "type": "paragraph"} for i in range(250)]
+    reused = chunks[7]["content"]
+
+    docs_chain = _build_chain([{"id": "old-doc"}])
+    chunk_chain = _build_chain(
+        [{"content_hash": _content_hash(reused), "embedding": "[0.5, 0.25]", "entities": [{"name": "Acme"}]}]
+    )
+    chunk_chain.in_.return_value = chunk_chain
+    mock_db.table.side_effect = lambda name: docs_chain if name == "company_documents" else chunk_chain
+
+    calls: list[list[str]] = []
+    with (
+        patch("src.onboarding.document_ingestion._get_embedding_client", return_value=_embedding_client(calls)),
+        patch("src.onboarding.document_ingestion.settings") as mock_settings,
+    ):
+        mock_settings.DOCUMENT_EMBEDDING_BATCH_SIZE = 100
+        mock_settings.DOCUMENT_ENTITY_CONCURRENCY = 4
+        mock_settings.DOCUMENT_CHUNK_INSERT_BATCH = 50
+        entities = await service._store_chunks("doc-1", "comp-1", chunks)
+
+    # 249 fresh chunks -> 3 embedding requests; the cached chunk is skipped
+    assert [len(batch) for batch in calls] == [100, 100, 49]
+    assert reused not in [text for batch in calls for text in batch]
+    assert entities == [{"name": "Acme"}]
+
+    inserted = [call.args[0] for call in chunk_chain.insert.call_args_list]
+    assert [len(batch) for batch in inserted] == [50] * 5
+    rows = [row for batch in inserted for row in batch]
+    assert [row["chunk_index"] for row in rows] == list(range(250))
+    assert rows[7]["embedding"] == [0.5, 0.25]
+    # Embeddings line up with their chunks despite out-of-order API results
+    assert rows[8]["embedding"][0] == float(len(chunks[8]["content"]))
+    assert len(service._llm.generate_response.call_args_list) == 249
+
+
+@pytest.mark.asyncio()
+async def test_chunk_cache_lookup_bounds_ids_per_request(
+    service: DocumentIngestionService,
+    mock_db: MagicMock,
+) -> None:
+    """Document ids and hashes are both sent at most 100 per query."""
+    docs_chain = _build_chain([{"id": f"doc-{i}"} for i in range(250)])
+    chunk_chain = _build_chain([])
+    chunk_chain.in_.return_value = chunk_chain
+    mock_db.table.side_effect = lambda name: docs_chain if name == "company_documents" else chunk_chain
+
+    await service._lookup_chunk_cache("comp-1", {f"hash-{i}" for i in range(150)})
+
+    doc_batches = [c.args[1] for c in chunk_chain.in_.call_args_list if c.args[0] == "document_id"]
+    hash_batches = [c.args[1] for c in chunk_chain.in_.call_args_list if c.args[0] == "content_hash"]
+    assert [len(b) for b in doc_batches] == [100, 100, 100, 100, 50, 50]
+    assert [len(b) for b in hash_batches] == [100, 50] * 3
+    assert {d for b in doc_batches for d in b} == {f"doc-{i}" for i in range(250)}
+
+
+@pytest.mark.asyncio()
+async def test_extract_text_splits_long_pdf_across_workers(
+    service: DocumentIngestionService,
+) -> None:
+    """Long PDFs are parsed in page ranges that join to the serial result."""
+    import fitz
+
+    from src.onboarding import document_parsing
+
+    pdf = fitz.open()
+    for i in range(30):
+        page = pdf.new_page()
+        page.insert_text((72, 72), f"Page {i} of the capabilities deck with enough native text.")
+    content = pdf.tobytes()
+    pdf.close()
+
+    from src.onboarding import document_ingestion
+
+    try:
+        with patch("src.onboarding.document_ingestion.settings") as mock_settings:
+            mock_settings.DOCUMENT_PARSE_PROCESSES = 2
+            text = await service._extract_text(content, "pdf")
+        assert document_ingestion._parse_pool is not None
+    finally:
+        document_ingestion.shutdown_parse_pool()
+    assert document_ingestion._parse_pool is None
+
+    assert text == document_parsing.extract_pdf(content)
+    assert "Page 29 of the capabilities deck" in text
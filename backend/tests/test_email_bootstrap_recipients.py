@@ -38,7 +38,11 @@ class TestEmailBootstrapRecipientProfiles:
 
         # Mock all bootstrap methods to isolate recipient analysis
         service._load_exclusions = AsyncMock(return_value=[])
-        service._fetch_sent_emails = AsyncMock(return_value=emails)
+
+        async def stream_sent_emails(*_args, **_kwargs):
+            yield emails
+
+        service._stream_sent_emails = stream_sent_emails
         service._apply_exclusions = MagicMock(return_value=emails)
         service._extract_contacts = AsyncMock(return_value=[])
         service._identify_active_threads = AsyncMock(return_value=[])
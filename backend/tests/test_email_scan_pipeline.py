@@ -0,0 +1,198 @@
+"""Tests for the batched inbox classification pipeline in EmailAnalyzer."""
+
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.email_analyzer import EmailAnalyzer, EmailCategory, _ScanContext
+from src.utils.sender_context import SenderContext, SenderLookup
+
+_USER_EMAIL = "dana@helixbio.com"
+
+
+def _email(id_: str, sender: str, subject: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "id": id_,
+        "thread_id": f"thr-{id_}",
+        "sender_email": sender,
+        "sender_name": sender.split("@")[0].title(),
+        "subject": subject,
+        "body": f"Body of {subject}",
+        "to": [_USER_EMAIL],
+        "date": "2026-03-16T09:00:00+00:00",
+        **extra,
+    }
+
+
+def _verdict(category: str = "FYI", **extra: Any) -> dict[str, Any]:
+    return {
+        "category": category,
+        "urgency": "NORMAL",
+        "topic_summary": "topic",
+        "needs_draft": False,
+        "reason": "test",
+        **extra,
+    }
+
+
+@pytest.fixture
+def analyzer() -> EmailAnalyzer:
+    a = EmailAnalyzer.__new__(EmailAnalyzer)
+    a._db = MagicMock()
+    a._llm = MagicMock()
+    a._llm.generate_response = AsyncMock(return_value=json.dumps(_verdict()))
+    a._get_user_email = AsyncMock(return_value=_USER_EMAIL)
+    a._load_self_emails = AsyncMock(return_value={_USER_EMAIL})
+    a._load_signal_context = AsyncMock()
+    a._lookup_sender_relationship = AsyncMock(return_value=None)
+    a._load_thread_activity = AsyncMock(return_value=[])
+    return a
+
+
+@pytest.fixture
+def no_sender_context() -> Any:
+    with patch("src.services.email_analyzer.load_sender_lookup", new_callable=AsyncMock) as lookup:
+        lookup.return_value = None
+        yield lookup
+
+
+@pytest.mark.asyncio
+async def test_rules_run_before_llm_and_senders_resolve_once(
+    analyzer: EmailAnalyzer, no_sender_context: AsyncMock
+) -> None:
+    emails = [
+        _email("1", "ana@acme.com", "Pricing"),
+        _email("2", "noreply@vendor.com", "Receipt"),
+        _email("3", "ana@acme.com", "Contract"),
+        _email("4", _USER_EMAIL, "Note to self"),
+        _email("5", "raj@acme.com", "Visit"),
+    ]
+    analyzer._llm.generate_response.return_value = json.dumps(
+        [
+            {"index": 1, **_verdict("NEEDS_REPLY")},
+            {"index": 2, **_verdict("FYI")},
+            {"index": 3, **_verdict("SKIP")},
+        ]
+    )
+
+    results = await analyzer._categorize_emails(emails, "u1", exclusions=[])
+
+    assert [r.email_id for r in results] == ["1", "2", "3", "4", "5"]
+    assert [r.category for r in results] == ["NEEDS_REPLY", "SKIP", "FYI", "SKIP", "SKIP"]
+    assert results[1].reason.startswith("Sender noreply@vendor.com is an automated")
+    assert results[3].topic_summary == "Self-sent email"
+    # One LLM call for the three remaining emails, one lookup per sender
+    analyzer._llm.generate_response.assert_awaited_once()
+    prompt = analyzer._llm.generate_response.await_args.kwargs["messages"][0]["content"]
+    assert prompt.startswith("Classify each of these 3 emails")
+    assert analyzer._lookup_sender_relationship.await_count == 2
+    assert sorted(c.kwargs["sender_email"] for c in no_sender_context.await_args_list) == [
+        "ana@acme.com",
+        "raj@acme.com",
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("no_sender_context")
+async def test_batch_entries_missing_from_response_are_classified_alone(
+    analyzer: EmailAnalyzer,
+) -> None:
+    emails = [_email("1", "ana@acme.com", "Pricing"), _email("2", "raj@acme.com", "Visit")]
+    analyzer._llm.generate_response.side_effect = [
+        json.dumps([{"index": 2, **_verdict("NEEDS_REPLY")}]),
+        json.dumps(_verdict("SKIP")),
+    ]
+
+    results = await analyzer._categorize_emails(emails, "u1", exclusions=[])
+
+    assert [r.category for r in results] == ["SKIP", "NEEDS_REPLY"]
+    assert analyzer._llm.generate_response.await_count == 2
+    single_prompt = analyzer._llm.generate_response.await_args.kwargs["messages"][0]["content"]
+    assert single_prompt.startswith("Classify this email")
+    assert "Subject: Pricing" in single_prompt
+
+
+def test_earlier_emails_of_the_scan_count_in_sender_history() -> None:
+    unknown = SenderContext(
+        is_strategic=False,
+        relationship_type="unknown",
+        entity_name=None,
+        context_summary="",
+        has_prior_drafts=False,
+        confidence=0.0,
+    )
+    ctx = _ScanContext(user_id="u1", exclusions=[])
+    ctx.sender_lookups["ana@acme.com"] = SenderLookup(unknown, ["NEEDS_REPLY"])
+    results = {
+        i: EmailCategory(
+            email_id=str(i),
+            thread_id=str(i),
+            sender_email="ana@acme.com",
+            sender_name="Ana",
+            subject="s",
+            snippet="s",
+            category="NEEDS_REPLY",
+            urgency="NORMAL",
+            topic_summary="t",
+            reason="r",
+        )
+        for i in range(3)
+    }
+
+    EmailAnalyzer._count_scan_history(ctx, results, classified={0, 1, 2})
+
+    # One logged row plus one earlier email of the scan is not yet frequent
+    assert results[0].sender_context is None
+    assert results[1].sender_context is None
+    assert results[2].sender_context is not None
+    assert results[2].sender_context.relationship_type == "known_contact"
+    assert results[2].sender_context.context_summary == (
+        "Frequent contact (3 emails, 3 requiring reply)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_scan_decisions_are_written_in_bulk(analyzer: EmailAnalyzer) -> None:
+    def categorized(id_: str, snippet: str) -> EmailCategory:
+        return EmailCategory(
+            email_id=id_,
+            thread_id=f"thr-{id_}",
+            sender_email="ana@acme.com",
+            sender_name="Ana",
+            subject=f"Subject {id_}",
+            snippet=snippet,
+            category="FYI",
+            urgency="NORMAL",
+            topic_summary="t",
+            reason="r",
+        )
+
+    table = analyzer._db.table.return_value
+    lookup = table.select.return_value.eq.return_value.in_.return_value.order.return_value
+    lookup.execute.return_value = MagicMock(
+        data=[
+            {"id": "row-a", "email_id": "a", "snippet": "already logged"},
+            {"id": "row-b", "email_id": "b", "snippet": None},
+        ]
+    )
+    emails = [
+        categorized("a", "x"),
+        categorized("b", "y"),
+        categorized("c", "z"),
+        categorized("d", ""),
+    ]
+
+    with patch("src.services.memory_writer.write_memory", new_callable=AsyncMock) as write:
+        await analyzer._log_scan_decisions("u1", emails)
+
+    # "a" is skipped, "b" fills in its NULL snippet, "c" and "d" are inserted at once
+    table.update.assert_called_once()
+    assert table.update.call_args.args[0]["snippet"] == "y"
+    table.update.return_value.eq.assert_called_once_with("id", "row-b")
+    table.insert.assert_called_once()
+    inserted = table.insert.call_args.args[0]
+    assert [row["email_id"] for row in inserted] == ["c", "d"]
+    assert inserted[1]["snippet"] == "Subject d"
+    assert [c.args[3]["email_id"] for c in write.await_args_list] == ["c", "d"]
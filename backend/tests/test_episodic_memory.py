@@ -287,6 +287,35 @@ async def test_delete_episode_removes_from_graphiti() -> None:
         mock_driver.execute_query.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_delete_episode_discards_queued_write_before_graph_delete() -> None:
+    """Test deleting a still-queued episode drops its pending Graphiti write."""
+    memory = EpisodicMemory()
+    calls: list[str] = []
+    queue = MagicMock()
+    queue.discard = AsyncMock(side_effect=lambda *_args: calls.append("discard"))
+    mock_client = MagicMock()
+    mock_client.driver.execute_query = AsyncMock(
+        side_effect=lambda *_args, **_kwargs: (
+            calls.append("graph") or ([{"deleted": 0}], None, None)
+        )
+    )
+    db = MagicMock()
+    delete = db.table.return_value.delete.return_value.eq.return_value.eq.return_value
+    delete.execute.return_value = MagicMock(data=[{"id": "ep-123"}])
+
+    with (
+        patch("src.memory.episodic.get_episode_write_queue", return_value=queue),
+        patch("src.db.supabase.SupabaseClient.get_client", return_value=db),
+        patch.object(memory, "_get_graphiti_client", new_callable=AsyncMock) as mock_get,
+    ):
+        mock_get.return_value = mock_client
+        await memory.delete_episode(user_id="user-456", episode_id="ep-123")
+
+    queue.discard.assert_awaited_once_with("ep-123", "user_user-456")
+    assert calls == ["discard", "graph"]
+
+
 @pytest.mark.asyncio
 async def test_get_episode_retrieves_by_id() -> None:
     """Test get_episode retrieves specific episode by ID."""
@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from src.core.event_bus import EventBus, GoalEvent
+from src.core.event_bus import EventBus, GoalEvent, OverflowPolicy
 
 
 @pytest.mark.asyncio
@@ -97,3 +97,43 @@ async def test_goal_event_to_dict():
     assert d["goal_id"] == "g1"
     assert d["event_type"] == "goal.complete"
     assert "timestamp" in d
+
+
+def _progress(n: int, event_type: str = "progress.update") -> GoalEvent:
+    return GoalEvent(goal_id="goal-1", user_id="user-1", event_type=event_type, data={"n": n})
+
+
+@pytest.mark.asyncio
+async def test_subscriber_queue_is_bounded_and_drops_oldest():
+    bus = EventBus(queue_size=2, overflow=OverflowPolicy.DROP_OLDEST)
+    q = bus.subscribe("goal-1")
+    for n in range(4):
+        await bus.publish(_progress(n))
+    assert [q.get_nowait().data["n"] for _ in range(q.qsize())] == [2, 3]
+    assert q.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_subscriber_queue_drop_newest_keeps_backlog():
+    bus = EventBus(queue_size=2)
+    q = bus.subscribe("goal-1", policy=OverflowPolicy.DROP_NEWEST)
+    for n in range(4):
+        await bus.publish(_progress(n))
+    assert [q.get_nowait().data["n"] for _ in range(q.qsize())] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_queue_coalesces_same_event_type():
+    bus = EventBus(queue_size=3, overflow=OverflowPolicy.COALESCE)
+    q = bus.subscribe("goal-1")
+    await bus.publish(_progress(0, "agent.started"))
+    await bus.publish(_progress(1))
+    await bus.publish(_progress(2, "agent.completed"))
+    await bus.publish(_progress(3))  # full: replaces the queued progress.update
+    await bus.publish(_progress(4, "goal.complete"))  # nothing to coalesce: drops oldest
+    events = [q.get_nowait() for _ in range(q.qsize())]
+    assert [(e.event_type, e.data["n"]) for e in events] == [
+        ("agent.completed", 2),
+        ("progress.update", 3),
+        ("goal.complete", 4),
+    ]
@@ -0,0 +1,148 @@
+"""Tests for the bounded, per-user-fair goal sweep executor."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from src.services import goal_sweep
+from src.services.goal_sweep import (
+    STATUS_CANCELLED,
+    STATUS_FAILED,
+    STATUS_OK,
+    STATUS_SKIPPED_DEADLINE,
+    STATUS_SKIPPED_RUNNING,
+    GoalSweepExecutor,
+    interleave_by_user,
+)
+
+
+def _goals(spec: dict[str, int]) -> list[dict[str, Any]]:
+    """Build goal rows: {"u1": 3} -> three goals owned by u1."""
+    return [
+        {"id": f"{user}-g{i}", "user_id": user}
+        for user, count in spec.items()
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _clear_in_flight() -> Any:
+    goal_sweep._in_flight.clear()
+    yield
+    goal_sweep._in_flight.clear()
+
+
+def test_interleave_by_user_round_robins() -> None:
+    ordered = interleave_by_user(_goals({"u1": 3, "u2": 1, "u3": 2}))
+    assert [g["id"] for g in ordered] == [
+        "u1-g0",
+        "u2-g0",
+        "u3-g0",
+        "u1-g1",
+        "u3-g1",
+        "u1-g2",
+    ]
+
+
+async def test_respects_global_and_per_user_limits() -> None:
+    running: dict[str, int] = {}
+    peak_total = 0
+    peak_per_user: dict[str, int] = {}
+
+    async def worker(goal: dict[str, Any]) -> None:
+        nonlocal peak_total
+        uid = goal["user_id"]
+        running[uid] = running.get(uid, 0) + 1
+        peak_total = max(peak_total, sum(running.values()))
+        peak_per_user[uid] = max(peak_per_user.get(uid, 0), running[uid])
+        await asyncio.sleep(0.01)
+        running[uid] -= 1
+
+    executor = GoalSweepExecutor(max_concurrency=4, per_user_concurrency=2)
+    report = await executor.run(_goals({"heavy": 20, "a": 2, "b": 2}), worker)
+
+    assert report.count(STATUS_OK) == 24
+    assert peak_total == 4
+    assert max(peak_per_user.values()) == 2
+
+
+async def test_heavy_user_does_not_starve_others() -> None:
+    order: list[str] = []
+
+    async def worker(goal: dict[str, Any]) -> None:
+        order.append(goal["user_id"])
+        await asyncio.sleep(0.005)
+
+    executor = GoalSweepExecutor(max_concurrency=2, per_user_concurrency=1)
+    await executor.run(_goals({"heavy": 10, "light": 1}), worker)
+
+    # The light user's only goal starts among the first two, not after
+    # all ten of the heavy user's goals.
+    assert "light" in order[:2]
+
+
+async def test_worker_errors_are_recorded_not_raised() -> None:
+    async def worker(goal: dict[str, Any]) -> None:
+        if goal["id"] == "u1-g1":
+            raise RuntimeError("boom")
+
+    report = await GoalSweepExecutor().run(_goals({"u1": 3}), worker)
+
+    by_id = {r.goal_id: r for r in report.results}
+    assert by_id["u1-g1"].status == STATUS_FAILED
+    assert by_id["u1-g1"].error == "boom"
+    assert report.count(STATUS_OK) == 2
+    assert not goal_sweep._in_flight
+
+
+async def test_skips_goals_still_running_from_previous_sweep() -> None:
+    release = asyncio.Event()
+    calls: list[str] = []
+
+    async def slow(goal: dict[str, Any]) -> None:
+        calls.append(goal["id"])
+        await release.wait()
+
+    goals = _goals({"u1": 1})
+    first = asyncio.create_task(GoalSweepExecutor().run(goals, slow))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    second = await GoalSweepExecutor().run(goals, slow)
+    assert second.results[0].status == STATUS_SKIPPED_RUNNING
+
+    release.set()
+    first_report = await first
+    assert first_report.results[0].status == STATUS_OK
+    assert calls == ["u1-g0"]
+
+
+async def test_deadline_cancels_running_and_skips_unstarted() -> None:
+    async def hang(_goal: dict[str, Any]) -> None:
+        await asyncio.sleep(10)
+
+    executor = GoalSweepExecutor(
+        max_concurrency=1, per_user_concurrency=1, deadline_seconds=0.05
+    )
+    report = await executor.run(_goals({"u1": 1, "u2": 1}), hang)
+
+    assert report.deadline_hit is True
+    assert report.count(STATUS_CANCELLED) == 1
+    assert report.count(STATUS_SKIPPED_DEADLINE) == 1
+    assert not goal_sweep._in_flight
+
+
+async def test_report_includes_per_goal_timing() -> None:
+    async def worker(_goal: dict[str, Any]) -> None:
+        await asyncio.sleep(0.02)
+
+    report = await GoalSweepExecutor().run(_goals({"u1": 2}), worker)
+    summary = report.to_dict()
+
+    assert summary["goals"] == 2
+    assert summary["ok"] == 2
+    assert all(entry["duration_ms"] >= 15 for entry in summary["per_goal"])
+    assert summary["max_goal_ms"] >= summary["p50_goal_ms"] > 0
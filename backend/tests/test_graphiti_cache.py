@@ -0,0 +1,96 @@
+"""Tests for Graphiti group partitioning and the search/embedding caches."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from graphiti_core import Graphiti
+
+from src.core.cache import Cache
+from src.db.graphiti import company_group_id, search_group_ids, user_group_id
+from src.db.graphiti_cache import CachingEmbedder, CachingGraphiti
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("src.core.cache._cache_instance", Cache())
+
+
+@pytest.fixture
+def graphiti() -> CachingGraphiti:
+    # Skip Graphiti.__init__: the overrides only delegate to the base class
+    return object.__new__(CachingGraphiti)
+
+
+def test_group_ids_are_sanitized_and_include_legacy_group() -> None:
+    assert user_group_id("a1b2-c3") == "user_a1b2-c3"
+    assert company_group_id("acme.com/x") == "company_acme_com_x"
+    assert search_group_ids("u1", company_id="c1") == ["user_u1", "company_c1", ""]
+
+    with patch("src.db.graphiti.settings.GRAPHITI_SEARCH_LEGACY_GROUP", False):
+        assert search_group_ids("u1") == ["user_u1"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_scoped_search_hits_cache(graphiti: CachingGraphiti) -> None:
+    edge = MagicMock(fact="Alice works at Acme")
+    with patch.object(Graphiti, "search", AsyncMock(return_value=[edge])) as base_search:
+        first = await graphiti.search("alice", group_ids=["user_u1", ""])
+        second = await graphiti.search("alice", group_ids=["", "user_u1"])
+        other_user = await graphiti.search("alice", group_ids=["user_u2"])
+
+    assert first == second == other_user == [edge]
+    assert first is not second
+    assert base_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_add_episode_invalidates_only_its_group(graphiti: CachingGraphiti) -> None:
+    now = datetime.now(UTC)
+    with (
+        patch.object(Graphiti, "search", AsyncMock(return_value=[])) as base_search,
+        patch.object(Graphiti, "add_episode", AsyncMock()),
+    ):
+        await graphiti.search("alice", group_ids=["user_u1"])
+        await graphiti.search("alice", group_ids=["user_u2"])
+        await graphiti.search("alice")
+
+        await graphiti.add_episode("e1", "body", "test", now, group_id="user_u1")
+
+        await graphiti.search("alice", group_ids=["user_u1"])  # reloaded
+        await graphiti.search("alice", group_ids=["user_u2"])  # still cached
+        await graphiti.search("alice")  # unscoped searches span every group
+
+    assert base_search.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_filtered_search_is_not_cached(graphiti: CachingGraphiti) -> None:
+    with patch.object(Graphiti, "search", AsyncMock(return_value=[])) as base_search:
+        await graphiti.search("alice", center_node_uuid="n1")
+        await graphiti.search("alice", center_node_uuid="n1")
+
+    assert base_search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_embedder_caches_single_texts() -> None:
+    inner = MagicMock()
+    inner.create = AsyncMock(return_value=[0.25, -0.5])
+    inner.create_batch = AsyncMock(return_value=[[0.1], [0.2]])
+    embedder = CachingEmbedder(inner, maxsize=2)
+
+    assert await embedder.create(["acme"]) == [0.25, -0.5]
+    assert await embedder.create("acme") == [0.25, -0.5]
+    assert inner.create.await_count == 1
+
+    await embedder.create(["a", "b"])  # multi-text input passes through
+    await embedder.create_batch(["a", "b"])
+    assert inner.create.await_count == 2
+    assert inner.create_batch.await_count == 1
+
+    # LRU bound: "acme" is evicted by two newer texts
+    await embedder.create(["x"])
+    await embedder.create(["y"])
+    await embedder.create(["acme"])
+    assert inner.create.await_count == 5
@@ -0,0 +1,268 @@
+"""Tests for the Graphiti episode write queue."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.resilience import graphiti_circuit_breaker, graphiti_queue_circuit_breaker
+from src.db.graphiti_queue import EpisodeWriteQueue
+
+_NOW = "2026-03-16T12:00:00+00:00"
+
+
+@pytest.fixture(autouse=True)
+def _reset_breakers() -> Any:
+    graphiti_queue_circuit_breaker.reset()
+    yield
+    graphiti_queue_circuit_breaker.reset()
+
+
+def _row(id_: int, group_id: str) -> dict[str, Any]:
+    return {
+        "id": id_,
+        "group_id": group_id,
+        "name": f"ep{id_}",
+        "episode_body": f"body {id_}",
+        "source_description": "test",
+        "source": "text",
+        "reference_time": _NOW,
+        "created_at": _NOW,
+    }
+
+
+def _mock_async_client(
+    claimed: list[dict[str, Any]] | None = None,
+    existing: dict[str, set[str]] | None = None,
+    vanished: set[int] | None = None,
+) -> MagicMock:
+    """Async Supabase client recording inserts, deletes and RPC calls.
+
+    ``existing`` lists the source record ids present per table; ``vanished``
+    are queue ids another worker discarded, so acking them deletes nothing.
+    """
+    client = MagicMock()
+    client.inserted = []
+    client.deleted = []
+    client.discarded = []
+    client.rpc_calls = []
+
+    def query(data: Any) -> MagicMock:
+        q = MagicMock()
+        q.execute = AsyncMock(return_value=MagicMock(data=data))
+        return q
+
+    def table(name: str) -> MagicMock:
+        builder = MagicMock()
+
+        def insert(row: dict[str, Any]) -> MagicMock:
+            client.inserted.append(row)
+            return query([row])
+
+        def delete_in(_column: str, ids: list[int]) -> MagicMock:
+            client.deleted.extend(ids)
+            return query([{"id": i} for i in ids if i not in (vanished or set())])
+
+        def select_in(_column: str, ids: list[str]) -> MagicMock:
+            present = (existing or {}).get(name, set())
+            return query([{"id": i} for i in ids if i in present])
+
+        def delete_eq(_column: str, episode_name: str) -> MagicMock:
+            def by_group(_column: str, group_id: str) -> MagicMock:
+                client.discarded.append((episode_name, group_id))
+                return query([{"id": 1}])
+
+            q = MagicMock()
+            q.eq.side_effect = by_group
+            return q
+
+        builder.insert.side_effect = insert
+        builder.delete.return_value.in_.side_effect = delete_in
+        builder.delete.return_value.eq.side_effect = delete_eq
+        builder.select.return_value.in_.side_effect = select_in
+        return builder
+
+    def rpc(name: str, params: dict[str, Any]) -> MagicMock:
+        client.rpc_calls.append((name, params))
+        data: Any = claimed if name == "claim_graphiti_episodes" else 0
+        query = MagicMock()
+        query.execute = AsyncMock(return_value=MagicMock(data=data))
+        return query
+
+    client.table.side_effect = table
+    client.rpc.side_effect = rpc
+    return client
+
+
+def _patch_client(client: MagicMock) -> Any:
+    return patch(
+        "src.db.supabase.SupabaseClient.get_async_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    )
+
+
+def _patch_graphiti(graphiti: MagicMock) -> Any:
+    return patch(
+        "src.db.graphiti.GraphitiClient.get_instance",
+        new_callable=AsyncMock,
+        return_value=graphiti,
+    )
+
+
+@pytest.mark.asyncio
+async def test_enqueue_returns_false_when_not_running() -> None:
+    queue = EpisodeWriteQueue()
+    client = _mock_async_client()
+
+    with _patch_client(client):
+        queued = await queue.enqueue("ep", "body", "test", datetime.now(UTC))
+
+    assert queued is False
+    assert client.inserted == []
+
+
+@pytest.mark.asyncio
+async def test_enqueue_inserts_row() -> None:
+    queue = EpisodeWriteQueue()
+    queue._running = True
+    client = _mock_async_client()
+
+    with _patch_client(client):
+        queued = await queue.enqueue("ep", "body", "test", datetime.now(UTC), group_id="user_u1")
+
+    assert queued is True
+    assert client.inserted[0]["group_id"] == "user_u1"
+    assert queue.stats()["enqueued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_drain_batches_per_group_and_acks() -> None:
+    queue = EpisodeWriteQueue()
+    client = _mock_async_client([_row(3, "user_u1"), _row(1, "user_u1"), _row(2, "")])
+    graphiti = MagicMock()
+    graphiti.add_episode = AsyncMock()
+    graphiti.add_episode_bulk = AsyncMock()
+
+    with _patch_client(client), _patch_graphiti(graphiti):
+        claimed = await queue.drain_once()
+
+    assert claimed == 3
+    # Two episodes of one user go through the bulk API, in id order
+    episodes = graphiti.add_episode_bulk.await_args.args[0]
+    assert [e.name for e in episodes] == ["ep1", "ep3"]
+    assert graphiti.add_episode_bulk.await_args.kwargs["group_id"] == "user_u1"
+    # A single episode of the default group uses add_episode
+    assert graphiti.add_episode.await_args.kwargs["name"] == "ep2"
+    assert graphiti.add_episode.await_args.kwargs["group_id"] is None
+
+    assert sorted(client.deleted) == [1, 2, 3]
+    stats = queue.stats()
+    assert stats["ingested"] == 3
+    assert stats["lag"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_released_not_acked() -> None:
+    queue = EpisodeWriteQueue(max_attempts=3)
+    client = _mock_async_client([_row(1, "user_u1"), _row(2, "user_u1")])
+    graphiti = MagicMock()
+    graphiti.add_episode_bulk = AsyncMock(side_effect=RuntimeError("llm down"))
+
+    with _patch_client(client), _patch_graphiti(graphiti):
+        await queue.drain_once()
+
+    assert client.deleted == []
+    name, params = client.rpc_calls[-1]
+    assert name == "fail_graphiti_episodes"
+    assert params["p_ids"] == [1, 2]
+    assert params["p_max_attempts"] == 3
+    assert queue.stats()["failed_batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_discard_removes_queued_rows_by_name_and_group() -> None:
+    queue = EpisodeWriteQueue()
+    client = _mock_async_client()
+
+    with _patch_client(client):
+        removed = await queue.discard("fact:f1", "user_u1")
+
+    assert removed == 1
+    assert client.discarded == [("fact:f1", "user_u1")]
+    assert queue.stats()["discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rows_whose_source_record_is_gone_are_skipped() -> None:
+    queue = EpisodeWriteQueue()
+    kept, orphan, untracked = _row(1, "user_u1"), _row(2, "user_u1"), _row(3, "user_u1")
+    kept.update(source_table="episodic_memories", source_id="ep1")
+    orphan.update(source_table="episodic_memories", source_id="ep2")
+    client = _mock_async_client([kept, orphan, untracked], existing={"episodic_memories": {"ep1"}})
+    graphiti = MagicMock()
+    graphiti.add_episode_bulk = AsyncMock()
+
+    with _patch_client(client), _patch_graphiti(graphiti):
+        await queue.drain_once()
+
+    episodes = graphiti.add_episode_bulk.await_args.args[0]
+    assert [e.name for e in episodes] == ["ep1", "ep3"]
+    assert sorted(client.deleted) == [1, 2, 3]
+    assert queue.stats()["skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_episode_discarded_mid_batch_is_removed_from_graph() -> None:
+    queue = EpisodeWriteQueue()
+    client = _mock_async_client([_row(1, "user_u1"), _row(2, "user_u1")], vanished={2})
+    graphiti = MagicMock()
+    graphiti.add_episode_bulk = AsyncMock()
+    graphiti.driver.execute_query = AsyncMock()
+
+    with _patch_client(client), _patch_graphiti(graphiti):
+        await queue.drain_once()
+
+    graphiti.driver.execute_query.assert_awaited_once()
+    assert graphiti.driver.execute_query.await_args.kwargs["names"] == ["ep2"]
+
+
+@pytest.mark.asyncio
+async def test_ingest_timeout_scales_with_batch_and_fits_the_lease() -> None:
+    queue = EpisodeWriteQueue(batch_size=20, lease_seconds=600)
+    client = _mock_async_client([_row(i, "user_u1") for i in range(1, 11)])
+    graphiti = MagicMock()
+    graphiti.add_episode_bulk = AsyncMock()
+
+    with _patch_client(client), _patch_graphiti(graphiti):
+        await queue.drain_once()
+
+    assert graphiti.add_episode_bulk.await_args.kwargs == {"group_id": "user_u1"}
+    assert queue._ingest_timeout(10) == pytest.approx(270)
+    assert queue._ingest_timeout(20) == pytest.approx(540)
+    assert queue._ingest_timeout(1) == 60
+
+
+@pytest.mark.asyncio
+async def test_failing_batches_open_the_queue_breaker_not_the_interactive_one() -> None:
+    graphiti_circuit_breaker.reset()
+    queue = EpisodeWriteQueue()
+    graphiti = MagicMock()
+    graphiti.add_episode = AsyncMock(side_effect=RuntimeError("llm down"))
+
+    for n in range(graphiti_queue_circuit_breaker.failure_threshold):
+        client = _mock_async_client([_row(n + 1, "user_u1")])
+        with _patch_client(client), _patch_graphiti(graphiti):
+            await queue.drain_once()
+
+    assert graphiti_queue_circuit_breaker.state.value == "open"
+    assert graphiti_circuit_breaker.state.value == "closed"
+
+    # While open, nothing is claimed (and so no attempts are burned)
+    client = _mock_async_client([_row(99, "user_u1")])
+    with _patch_client(client), _patch_graphiti(graphiti):
+        assert await queue.drain_once() == 0
+    assert client.rpc_calls == []
@@ -1,12 +1,18 @@
 """Tests for NotificationService."""
 
+from collections.abc import Iterator
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.core.cluster import ClusterBus, InProcessBroker
 from src.models.notification import NotificationType
-from src.services.notification_service import NotificationService
+from src.services.notification_service import (
+    NotificationService,
+    UnreadCounter,
+    get_unread_counter,
+)
 
 
 @pytest.fixture
@@ -16,6 +22,14 @@ def mock_db() -> MagicMock:
     return mock_client
 
 
+@pytest.fixture(autouse=True)
+def reset_unread_counter() -> Iterator[None]:
+    """Start every test without cached unread counts."""
+    get_unread_counter().clear()
+    yield
+    get_unread_counter().clear()
+
+
 @pytest.mark.asyncio
 async def test_create_notification(mock_db: MagicMock) -> None:
     """Test creating a notification."""
@@ -274,3 +288,172 @@ async def test_delete_notification_raises_not_found_when_missing(mock_db: MagicM
 
         with pytest.raises(NotFoundError):
             await NotificationService.delete_notification(notification_id="notif-999", user_id="user-456")
+
+
+def _notification_row(read_at: str | None = None) -> dict:
+    return {
+        "id": "notif-123",
+        "user_id": "user-456",
+        "type": "signal_detected",
+        "title": "New Signal Detected",
+        "message": None,
+        "link": None,
+        "metadata": {},
+        "read_at": read_at,
+        "created_at": "2026-02-03T10:00:00Z",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_unread_count_uses_head_query_once(mock_db: MagicMock) -> None:
+    """Test the unread count is seeded with a head-only query, then served from memory."""
+    with patch("src.services.notification_service.SupabaseClient") as mock_db_class:
+        mock_db.table.return_value.select.return_value.eq.return_value.is_.return_value.execute.return_value = MagicMock(
+            count=4
+        )
+        mock_db_class.get_client.return_value = mock_db
+
+        first = await NotificationService.get_unread_count(user_id="user-456")
+        second = await NotificationService.get_unread_count(user_id="user-456")
+
+        assert first.count == second.count == 4
+        mock_db.table.return_value.select.assert_called_once_with("id", count="exact", head=True)
+
+
+@pytest.mark.asyncio
+async def test_create_notification_updates_counter_and_pushes(mock_db: MagicMock) -> None:
+    """Test creating a notification bumps the cached count and pushes it over WebSocket."""
+    get_unread_counter().seed("user-456", 2)
+    with (
+        patch("src.services.notification_service.SupabaseClient") as mock_db_class,
+        patch("src.services.notification_service.ws_manager") as mock_ws,
+    ):
+        mock_db.table.return_value.insert.return_value.execute.return_value = MagicMock(
+            data=[_notification_row()]
+        )
+        mock_db_class.get_client.return_value = mock_db
+        mock_ws.is_connected.return_value = True
+        mock_ws.send_notification = AsyncMock()
+
+        await NotificationService.create_notification(
+            user_id="user-456",
+            type=NotificationType.SIGNAL_DETECTED,
+            title="New Signal Detected",
+        )
+
+        assert (await NotificationService.get_unread_count(user_id="user-456")).count == 3
+        user_id, payload, unread_count = mock_ws.send_notification.await_args.args
+        assert (user_id, payload["id"], unread_count) == ("user-456", "notif-123", 3)
+
+
+@pytest.mark.asyncio
+async def test_create_notification_succeeds_when_push_fails(mock_db: MagicMock) -> None:
+    """Test a WebSocket failure doesn't fail notification creation."""
+    with (
+        patch("src.services.notification_service.SupabaseClient") as mock_db_class,
+        patch("src.services.notification_service.ws_manager") as mock_ws,
+    ):
+        mock_db.table.return_value.insert.return_value.execute.return_value = MagicMock(
+            data=[_notification_row()]
+        )
+        mock_db_class.get_client.return_value = mock_db
+        mock_ws.is_connected.return_value = True
+        mock_ws.send_notification = AsyncMock(side_effect=RuntimeError("socket gone"))
+
+        result = await NotificationService.create_notification(
+            user_id="user-456",
+            type=NotificationType.SIGNAL_DETECTED,
+            title="New Signal Detected",
+        )
+
+        assert result.id == "notif-123"
+
+
+@pytest.mark.asyncio
+async def test_read_and_delete_keep_counter_in_sync(mock_db: MagicMock) -> None:
+    """Test mark-all-read zeroes the count and deleting an unread notification decrements it."""
+    counter = get_unread_counter()
+    with patch("src.services.notification_service.SupabaseClient") as mock_db_class:
+        mock_db_class.get_client.return_value = mock_db
+        mock_db.table.return_value.update.return_value.eq.return_value.is_.return_value.execute.return_value = MagicMock(
+            data=[{"id": "notif-1"}]
+        )
+        mock_db.table.return_value.delete.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[_notification_row()]
+        )
+        mock_db.table.return_value.update.return_value.eq.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[_notification_row(read_at="2026-02-03T11:00:00Z")]
+        )
+
+        counter.seed("user-456", 5)
+        await NotificationService.mark_all_as_read(user_id="user-456")
+        assert counter.get("user-456") == 0
+
+        counter.seed("user-456", 5)
+        await NotificationService.delete_notification(notification_id="notif-123", user_id="user-456")
+        assert counter.get("user-456") == 4
+
+        await NotificationService.mark_as_read(notification_id="notif-123", user_id="user-456")
+        assert counter.get("user-456") is None
+
+
+def test_unread_counter_expires_and_evicts() -> None:
+    """Test cached counts are reseeded after the TTL and bounded by max_users."""
+    counter = UnreadCounter(ttl_seconds=60, max_users=2)
+    with patch("src.services.notification_service.time.monotonic", return_value=0.0):
+        counter.seed("a", 1)
+        counter.seed("b", 2)
+        assert counter.get("a") == 1
+        counter.seed("c", 3)
+        assert counter.get("b") is None
+        assert counter.adjust("b", 1) is None
+        assert counter.adjust("a", -5) == 0
+    with patch("src.services.notification_service.time.monotonic", return_value=61.0):
+        assert counter.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_unread_count_changes_invalidate_other_workers() -> None:
+    """Test a change on one worker drops the other worker's cached count."""
+    hub: set[InProcessBroker] = set()
+    bus_a, bus_b = ClusterBus(InProcessBroker(hub)), ClusterBus(InProcessBroker(hub))
+    await bus_a.start()
+    await bus_b.start()
+    worker_a = UnreadCounter(ttl_seconds=300, max_users=10)
+    worker_b = UnreadCounter(ttl_seconds=300, max_users=10)
+    worker_a.attach_cluster(bus_a)
+    worker_b.attach_cluster(bus_b)
+
+    async def settle() -> None:
+        for bus in (bus_a, bus_b, bus_a, bus_b):
+            await bus._outbox.join()  # type: ignore[union-attr]
+            await bus._inbox.join()  # type: ignore[union-attr]
+
+    try:
+        # Seeding from the DB is not a change and is not announced
+        worker_a.seed("user-456", 5)
+        worker_b.seed("user-456", 5)
+        await settle()
+        assert worker_b.get("user-456") == 5
+
+        assert worker_a.adjust("user-456", 1) == 6
+        await settle()
+        assert worker_b.get("user-456") is None
+        assert worker_a.get("user-456") == 6
+
+        worker_a.seed("user-456", 6)
+        worker_b.seed("user-456", 6)
+        worker_b.reset("user-456", 0)
+        await settle()
+        assert worker_a.get("user-456") is None
+        assert worker_b.get("user-456") == 0
+
+        worker_a.seed("user-456", 3)
+        worker_b.invalidate("user-456")
+        await settle()
+        assert worker_a.get("user-456") is None
+    finally:
+        worker_a.detach_cluster()
+        worker_b.detach_cluster()
+        await bus_a.stop()
+        await bus_b.stop()
@@ -0,0 +1,163 @@
+"""Tests for streaming latency histograms and per-dependency request timing."""
+
+import asyncio
+import logging
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.core.timing import (
+    SUPABASE,
+    LogHistogram,
+    RollingHistogram,
+    dependency_stats,
+    track_dependency,
+)
+from src.middleware.performance import (
+    UNMATCHED_ROUTE,
+    RequestIDMiddleware,
+    RequestTimingMiddleware,
+    perf_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats() -> None:
+    perf_stats.reset()
+    dependency_stats.reset()
+
+
+class TestLogHistogram:
+    def test_percentiles_within_bucket_precision(self) -> None:
+        hist = LogHistogram()
+        for ms in range(1, 10_001):
+            hist.record(float(ms))
+
+        assert hist.count == 10_000
+        for pct, exact in ((50, 5000), (95, 9500), (99, 9900)):
+            assert abs(hist.percentile(pct) - exact) / exact < 0.04
+        assert hist.percentile(100) == 10_000
+
+    def test_memory_is_bounded_by_bucket_count(self) -> None:
+        hist = LogHistogram()
+        for i in range(200_000):
+            hist.record(0.001 + i * 0.37)
+        hist.record(1e12)  # clamped into the last bucket
+
+        assert len(hist._buckets) < 600
+
+    def test_rolling_window_drops_old_samples(self) -> None:
+        now = [0.0]
+        hist = RollingHistogram(interval_seconds=60, clock=lambda: now[0])
+        hist.record(900.0)
+
+        now[0] = 61.0
+        hist.record(10.0)
+        assert hist.recent().count == 2
+
+        now[0] = 125.0
+        hist.record(10.0)
+        recent = hist.recent()
+        assert recent.count == 2
+        assert recent.max == 10.0
+
+        # Two idle intervals: the previous window is stale too
+        now[0] = 300.0
+        hist.record(20.0)
+        assert hist.recent().count == 1
+        assert hist.total.count == 4
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(RequestTimingMiddleware)
+    app.add_middleware(RequestIDMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        with track_dependency(SUPABASE, "items"):
+            await asyncio.sleep(0)
+        with track_dependency(SUPABASE, "items"):
+            await asyncio.sleep(0)
+        return {"id": item_id}
+
+    return app
+
+
+class TestRequestTimingMiddleware:
+    @pytest.fixture(autouse=True)
+    def timing_settings(self) -> Any:
+        with patch("src.middleware.performance.settings") as mock_settings:
+            mock_settings.SERVER_TIMING_HEADER = False
+            mock_settings.is_development = True
+            yield mock_settings
+
+    def test_server_timing_only_in_development_or_for_admins(self, timing_settings: Any) -> None:
+        app = _app()
+
+        @app.get("/admin-only")
+        async def admin_only(request: Request) -> dict[str, str]:
+            request.state.is_admin = True
+            with track_dependency(SUPABASE, "items"):
+                await asyncio.sleep(0)
+            return {}
+
+        client = TestClient(app)
+        timing_settings.is_development = False
+
+        assert "Server-Timing" not in client.get("/items/a").headers
+        assert client.get("/admin-only").headers["Server-Timing"].startswith("supabase;dur=")
+
+        timing_settings.SERVER_TIMING_HEADER = True
+        assert "Server-Timing" in client.get("/items/a").headers
+
+    def test_records_route_template_and_dependency_breakdown(self) -> None:
+        client = TestClient(_app())
+
+        for item_id in ("a", "b", "c"):
+            response = client.get(f"/items/{item_id}")
+            assert response.status_code == 200
+            assert response.headers["Server-Timing"].startswith("supabase;dur=")
+            assert 'desc="2 calls"' in response.headers["Server-Timing"]
+        client.get("/missing")
+
+        summary = perf_stats.summarize()
+        assert set(summary["endpoints"]) == {"GET /items/{item_id}", f"GET {UNMATCHED_ROUTE}"}
+        endpoint = summary["endpoints"]["GET /items/{item_id}"]
+        assert endpoint["count"] == 3
+        assert endpoint["status"] == {"2xx": 3}
+        assert "supabase" in endpoint["dependency_ms_per_request"]
+        assert summary["dependencies"]["supabase"]["total_calls"] == 6
+
+    def test_prometheus_export(self) -> None:
+        client = TestClient(_app())
+        client.get("/items/a")
+
+        text = perf_stats.to_prometheus()
+
+        assert "# TYPE aria_http_request_duration_seconds histogram" in text
+        assert (
+            'aria_http_request_duration_seconds_count{method="GET",route="/items/{item_id}"} 1'
+            in text
+        )
+        assert 'aria_dependency_duration_seconds_bucket{dependency="supabase",le="+Inf"} 2' in text
+
+
+def test_slow_dependency_call_is_logged(
+    caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("src.core.timing.SLOW_QUERY_THRESHOLD_MS", 0.0)
+
+    with (
+        caplog.at_level(logging.WARNING, logger="src.core.timing"),
+        pytest.raises(RuntimeError),
+        track_dependency(SUPABASE, "goals"),
+    ):
+        raise RuntimeError("boom")
+
+    assert "[SLOW_QUERY] supabase goals" in caplog.text
+    assert dependency_stats.errors() == {"supabase": 1}
+    assert dependency_stats.summarize()["supabase"]["slow_calls"] == 1
@@ -0,0 +1,164 @@
+"""Tests for the periodic email check fan-out."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.jobs import periodic_email_check as job
+from src.jobs.periodic_email_check import EmailCheckLatency, run_periodic_email_check
+
+_NOW = datetime(2026, 3, 16, 12, 0, tzinfo=UTC)
+
+
+def _ago(hours: float) -> str:
+    return (_NOW - timedelta(hours=hours)).isoformat()
+
+
+def _integration(user_id: str, local_hour: float | None, integration: str = "gmail") -> dict:
+    metadata = None if local_hour is None else {"local_hour": local_hour}
+    return {"user_id": user_id, "integration_type": integration, "metadata": metadata}
+
+
+def _fake_local_now(metadata: dict[str, Any] | None = None) -> datetime:
+    # Tests give each user a local time directly instead of a timezone
+    hour = (metadata or {}).get("local_hour", 12.0)
+    return _NOW.replace(hour=int(hour), minute=int(hour % 1 * 60))
+
+
+@pytest.fixture
+def env() -> Any:
+    db = MagicMock()
+    analyzer = MagicMock()
+    analyzer.scan_inbox = AsyncMock(return_value=MagicMock(urgent=[]))
+    notifier = MagicMock()
+    notifier.process_and_notify = AsyncMock(return_value=[])
+    latency = EmailCheckLatency()
+    with (
+        patch.object(job.SupabaseClient, "get_client", return_value=db),
+        patch.object(job, "EmailAnalyzer", return_value=analyzer),
+        patch.object(job, "get_realtime_email_notifier", return_value=notifier),
+        patch.object(job, "execute_async", new_callable=AsyncMock) as execute_async,
+        patch.object(job, "_local_now", side_effect=_fake_local_now),
+        patch.object(job, "get_email_check_latency", return_value=latency),
+    ):
+        yield MagicMock(
+            db=db,
+            analyzer=analyzer,
+            notifier=notifier,
+            execute_async=execute_async,
+            latency=latency,
+        )
+
+
+def _set_users(env: Any, integrations: list[dict], state: list[dict]) -> None:
+    query = env.db.table.return_value.select.return_value.in_.return_value.eq.return_value
+    query.execute.return_value = MagicMock(data=integrations)
+    env.execute_async.return_value = MagicMock(data=state)
+
+
+@pytest.mark.asyncio
+async def test_due_users_load_state_once_and_start_by_priority(env: Any) -> None:
+    _set_users(
+        env,
+        [
+            _integration("recent", 10),
+            _integration("stale", 10),
+            _integration("late-day", 17.5),
+            _integration("late-day", None, "outlook"),
+            _integration("never-run", 9),
+            _integration("night", 23),
+        ],
+        [
+            {"user_id": "recent", "last_completed_at": _ago(0.2), "watermark_timestamp": None},
+            {"user_id": "stale", "last_completed_at": _ago(6), "watermark_timestamp": _ago(6.5)},
+            {"user_id": "late-day", "last_completed_at": _ago(2), "watermark_timestamp": None},
+        ],
+    )
+    with (
+        patch.object(job, "datetime", wraps=datetime) as dt,
+        patch.object(job.settings, "PERIODIC_EMAIL_CHECK_CONCURRENCY", 1),
+    ):
+        dt.now.return_value = _NOW
+        stats = await run_periodic_email_check()
+
+    # One state load for every in-hours user, no per-user run queries
+    env.execute_async.assert_awaited_once()
+    env.db.rpc.assert_called_once()
+    name, params = env.db.rpc.call_args.args
+    assert name == "get_email_check_state"
+    assert sorted(params["p_user_ids"]) == ["late-day", "never-run", "recent", "stale"]
+    env.db.table.assert_called_once_with("user_integrations")
+
+    scanned = [c.args[0] for c in env.analyzer.scan_inbox.await_args_list]
+    assert scanned == ["never-run", "stale", "late-day"]
+    assert env.analyzer.scan_inbox.await_args_list[1].kwargs == {
+        "since_hours": pytest.approx(6),
+        "since_timestamp": _ago(6.5),
+    }
+    assert stats["users_checked"] == 4
+    assert stats["users_skipped_off_hours"] == 1
+    assert stats["scan_latency"]["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_never_run_users_start_with_the_least_business_hours_left(env: Any) -> None:
+    _set_users(env, [_integration("morning", 9), _integration("evening", 18)], [])
+    with patch.object(job.settings, "PERIODIC_EMAIL_CHECK_CONCURRENCY", 1):
+        await run_periodic_email_check()
+
+    scanned = [c.args[0] for c in env.analyzer.scan_inbox.await_args_list]
+    assert scanned == ["evening", "morning"]
+
+
+@pytest.mark.asyncio
+async def test_slow_scan_times_out_without_holding_up_other_users(env: Any) -> None:
+    _set_users(env, [_integration("slow", 10), _integration("fast", 10)], [])
+    urgent = [MagicMock()]
+
+    async def scan_inbox(user_id: str, **_kwargs: Any) -> Any:
+        if user_id == "slow":
+            await asyncio.sleep(10)
+        return MagicMock(urgent=urgent)
+
+    env.analyzer.scan_inbox.side_effect = scan_inbox
+    env.notifier.process_and_notify.return_value = ["n1"]
+
+    with (
+        patch.object(job.settings, "PERIODIC_EMAIL_CHECK_CONCURRENCY", 2),
+        patch.object(job.settings, "PERIODIC_EMAIL_CHECK_USER_TIMEOUT_SECONDS", 0.05),
+    ):
+        stats = await asyncio.wait_for(run_periodic_email_check(), timeout=2)
+
+    assert stats["timeouts"] == 1
+    assert stats["errors"] == 0
+    assert stats["users_with_urgent"] == 1
+    assert stats["notifications_sent"] == 1
+    env.notifier.process_and_notify.assert_awaited_once()
+    assert env.notifier.process_and_notify.await_args.kwargs["user_id"] == "fast"
+    assert stats["slowest_users"][0]["user_id"] == "slow"
+
+    latency = env.latency.stats()
+    assert latency["timeouts"] == 1
+    assert latency["scan"]["count"] == 2
+    assert latency["slowest_users"][0]["user_id"] == "slow"
+    assert latency["slowest_users"][0]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_state_rpc_failure_falls_back_to_per_user_queries(env: Any) -> None:
+    _set_users(env, [_integration("u1", 10)], [])
+    env.execute_async.side_effect = RuntimeError("function does not exist")
+
+    with (
+        patch.object(job, "_calculate_hours_since_last_run", return_value=3.0) as since,
+        patch.object(job, "_get_watermark_timestamp", return_value=_ago(3)) as watermark,
+    ):
+        stats = await run_periodic_email_check()
+
+    since.assert_called_once_with(env.db, "u1")
+    watermark.assert_called_once_with(env.db, "u1")
+    env.analyzer.scan_inbox.assert_awaited_once_with("u1", since_hours=3.0, since_timestamp=_ago(3))
+    assert stats["errors"] == 0
@@ -4,6 +4,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.db.graphiti import search_group_ids
+
 
 class TestPatternMatching:
     """Tests for topic pattern matching."""
@@ -334,7 +336,11 @@ class TestPatternMatching:
 
         with patch.dict(
             "sys.modules",
-            {"src.db.graphiti": MagicMock(GraphitiClient=mock_graphiti_class)},
+            {
+                "src.db.graphiti": MagicMock(
+                    GraphitiClient=mock_graphiti_class, search_group_ids=search_group_ids
+                )
+            },
         ):
             await service._find_pattern_matches(
                 user_id="user-123",
@@ -346,5 +352,5 @@ class TestPatternMatching:
             mock_graphiti_instance.search.assert_called_once_with(
                 query="Budget proposal discussion",
                 num_results=5,
-                group_ids=["user-123"],
+                group_ids=["user_user-123", ""],
             )
@@ -5,33 +5,36 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 
+def _mock_db(user_ids: list[str]) -> MagicMock:
+    mock_db = MagicMock()
+    mock_db.table.return_value.select.return_value.execute.return_value = MagicMock(
+        data=[{"id": user_id} for user_id in user_ids]
+    )
+    return mock_db
+
+
 class TestSalienceDecayJob:
     """Tests for the daily salience decay job."""
 
     @pytest.mark.asyncio
     async def test_job_processes_all_users(self) -> None:
-        """The job should update salience for all users."""
+        """The job should update salience for all users, batched per query."""
         from src.jobs.salience_decay import run_salience_decay_job
 
-        mock_db = MagicMock()
-        mock_db.table.return_value.select.return_value.execute.return_value = MagicMock(
-            data=[
-                {"id": "user-1"},
-                {"id": "user-2"},
-                {"id": "user-3"},
-            ]
-        )
-
         mock_salience_service = MagicMock()
-        mock_salience_service.update_all_salience = AsyncMock(return_value=5)
+        mock_salience_service.update_salience_for_users = AsyncMock(return_value={})
 
         with patch("src.jobs.salience_decay.SupabaseClient") as mock_client:
-            mock_client.get_client.return_value = mock_db
-            with patch("src.jobs.salience_decay.SalienceService", return_value=mock_salience_service):
+            mock_client.get_client.return_value = _mock_db(["user-1", "user-2", "user-3"])
+            with (
+                patch("src.jobs.salience_decay.SalienceService", return_value=mock_salience_service),
+                patch("src.jobs.salience_decay.settings") as mock_settings,
+            ):
+                mock_settings.SALIENCE_DECAY_USERS_PER_QUERY = 2
                 result = await run_salience_decay_job()
 
-        # Should have called update for each user
-        assert mock_salience_service.update_all_salience.call_count == 3
+        batches = [c.args[0] for c in mock_salience_service.update_salience_for_users.call_args_list]
+        assert batches == [["user-1", "user-2"], ["user-3"]]
         assert result["users_processed"] == 3
 
     @pytest.mark.asyncio
@@ -39,16 +42,13 @@ class TestSalienceDecayJob:
         """The job should return total number of updated records."""
         from src.jobs.salience_decay import run_salience_decay_job
 
-        mock_db = MagicMock()
-        mock_db.table.return_value.select.return_value.execute.return_value = MagicMock(
-            data=[{"id": "user-1"}, {"id": "user-2"}]
-        )
-
         mock_salience_service = MagicMock()
-        mock_salience_service.update_all_salience = AsyncMock(side_effect=[10, 5])
+        mock_salience_service.update_salience_for_users = AsyncMock(
+            return_value={"user-1": 10, "user-2": 5}
+        )
 
         with patch("src.jobs.salience_decay.SupabaseClient") as mock_client:
-            mock_client.get_client.return_value = mock_db
+            mock_client.get_client.return_value = _mock_db(["user-1", "user-2"])
             with patch("src.jobs.salience_decay.SalienceService", return_value=mock_salience_service):
                 result = await run_salience_decay_job()
 
@@ -56,24 +56,24 @@ class TestSalienceDecayJob:
 
     @pytest.mark.asyncio
     async def test_job_continues_on_user_error(self) -> None:
-        """If one user fails, job should continue with others."""
+        """A failed batch is retried per user; one failing user doesn't stop the rest."""
         from src.jobs.salience_decay import run_salience_decay_job
 
-        mock_db = MagicMock()
-        mock_db.table.return_value.select.return_value.execute.return_value = MagicMock(
-            data=[{"id": "user-1"}, {"id": "user-2"}]
-        )
-
         mock_salience_service = MagicMock()
+        mock_salience_service.update_salience_for_users = AsyncMock(
+            side_effect=Exception("DB error")
+        )
         mock_salience_service.update_all_salience = AsyncMock(
             side_effect=[Exception("DB error"), 5]
         )
 
         with patch("src.jobs.salience_decay.SupabaseClient") as mock_client:
-            mock_client.get_client.return_value = mock_db
+            mock_client.get_client.return_value = _mock_db(["user-1", "user-2"])
             with patch("src.jobs.salience_decay.SalienceService", return_value=mock_salience_service):
                 result = await run_salience_decay_job()
 
         # Should still process second user
+        assert mock_salience_service.update_all_salience.call_count == 2
         assert result["users_processed"] == 2
+        assert result["records_updated"] == 5
         assert result["errors"] == 1
@@ -264,6 +264,7 @@ class TestUpdateAllSalience:
         episodic_data = [
             {
                 "id": "sal-1",
+                "user_id": "user-123",
                 "graphiti_episode_id": "ep-1",
                 "current_salience": 1.0,
                 "access_count": 5,
@@ -271,6 +272,7 @@ class TestUpdateAllSalience:
             },
             {
                 "id": "sal-2",
+                "user_id": "user-123",
                 "graphiti_episode_id": "ep-2",
                 "current_salience": 0.8,
                 "access_count": 0,
@@ -281,6 +283,7 @@ class TestUpdateAllSalience:
         semantic_data = [
             {
                 "id": "sal-3",
+                "user_id": "user-123",
                 "graphiti_episode_id": "fact-1",
                 "current_salience": 0.5,
                 "access_count": 2,
@@ -290,18 +293,15 @@ class TestUpdateAllSalience:
 
         def table_side_effect(table_name: str) -> MagicMock:
             table_mock = MagicMock()
+            page = table_mock.select.return_value.eq.return_value.order.return_value.limit
             if table_name == "episodic_memory_salience":
-                table_mock.select.return_value.eq.return_value.execute.return_value = MagicMock(
-                    data=episodic_data
-                )
+                page.return_value.execute.return_value = MagicMock(data=episodic_data)
             elif table_name == "semantic_fact_salience":
-                table_mock.select.return_value.eq.return_value.execute.return_value = MagicMock(
-                    data=semantic_data
-                )
-            table_mock.update.return_value.eq.return_value.execute.return_value = MagicMock(data=[{}])
+                page.return_value.execute.return_value = MagicMock(data=semantic_data)
             return table_mock
 
         mock.table.side_effect = table_side_effect
+        mock.rpc.return_value.execute.return_value = MagicMock(data=1)
         return mock
 
     @pytest.mark.asyncio
@@ -317,8 +317,14 @@ class TestUpdateAllSalience:
 
             updated = await service.update_all_salience(user_id="user-123")
 
-        # Should update records where salience changed significantly
-        assert updated >= 0
+        # All three records moved by more than 0.01
+        assert updated == 3
+        rpc_calls = mock_db_with_memories.rpc.call_args_list
+        assert [c.args[0] for c in rpc_calls] == ["bulk_update_memory_salience"] * 2
+        episodic_rows = rpc_calls[0].args[1]["p_rows"]
+        assert rpc_calls[0].args[1]["p_table"] == "episodic_memory_salience"
+        assert [r["id"] for r in episodic_rows] == ["sal-1", "sal-2"]
+        assert episodic_rows[0]["current_salience"] == pytest.approx(0.75)
 
     @pytest.mark.asyncio
     async def test_update_processes_both_tables(self, mock_db_with_memories: MagicMock) -> None:
@@ -338,6 +344,57 @@ class TestUpdateAllSalience:
         assert "episodic_memory_salience" in table_calls
         assert "semantic_fact_salience" in table_calls
 
+    def test_batch_decay_matches_scalar_decay(self) -> None:
+        """calculate_decay_batch should agree with calculate_decay row by row."""
+        import numpy as np
+
+        service = SalienceService(db_client=MagicMock())
+        counts = np.array([0, 1, 5, 20, 0, 3], dtype=np.float64)
+        days = np.array([-1.0, 0.0, 15.0, 30.0, 400.0, 90.5])
+
+        batch = service.calculate_decay_batch(counts, days)
+
+        for i in range(len(counts)):
+            assert batch[i] == pytest.approx(service.calculate_decay(int(counts[i]), days[i]))
+
+    @pytest.mark.asyncio
+    async def test_update_for_users_pages_and_groups_by_user(self) -> None:
+        """Cross-user mode should filter with in_, page by id and count per user."""
+        from unittest.mock import patch
+
+        now = datetime(2026, 2, 2, tzinfo=UTC)
+        old = (now - timedelta(days=60)).isoformat()
+        fresh = now.isoformat()
+        page_1 = [
+            {"id": "a", "user_id": "u1", "current_salience": 1.0, "access_count": 0, "last_accessed_at": old},
+            {"id": "b", "user_id": "u2", "current_salience": 1.0, "access_count": 0, "last_accessed_at": fresh},
+        ]
+        page_2 = [
+            {"id": "c", "user_id": "u2", "current_salience": 1.0, "access_count": 0, "last_accessed_at": old},
+        ]
+
+        mock_db = MagicMock()
+        in_query = mock_db.table.return_value.select.return_value.in_.return_value
+        in_query.order.return_value.limit.return_value.execute.return_value = MagicMock(data=page_1)
+        in_query.gt.return_value.order.return_value.limit.return_value.execute.return_value = (
+            MagicMock(data=page_2)
+        )
+
+        service = SalienceService(db_client=mock_db)
+        with (
+            patch("src.memory.salience.datetime") as mock_datetime,
+            patch("src.memory.salience.settings") as mock_settings,
+        ):
+            mock_datetime.now.return_value = now
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            mock_settings.SALIENCE_DECAY_PAGE_SIZE = 2
+            updated = await service.update_salience_for_users(["u1", "u2"])
+
+        # Each table sees both pages; only the 60-day-old rows changed
+        assert updated == {"u1": 2, "u2": 2}
+        mock_db.table.return_value.select.return_value.in_.assert_called_with("user_id", ["u1", "u2"])
+        in_query.gt.assert_called_with("id", "b")
+
 
 class TestGetBySalience:
     """Tests for querying memories by salience threshold."""
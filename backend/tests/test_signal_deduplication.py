@@ -0,0 +1,213 @@
+"""Tests for MinHash/LSH signal deduplication."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.intelligence.minhash import LSHIndex, MinHasher, tokenize
+from src.intelligence.signal_deduplication import SignalDeduplicator, cluster_signals
+
+
+def _all_pairs_clusters(signals: list[dict[str, Any]]) -> list[list[str]]:
+    """Reference: the original quadratic clustering loop."""
+    clusters: list[list[str]] = []
+    processed: set[str] = set()
+    for i, a in enumerate(signals):
+        if a["id"] in processed:
+            continue
+        cluster = [a]
+        wa = set((a.get("headline") or "").lower().split())
+        for j, b in enumerate(signals):
+            if i == j or b["id"] in processed or a.get("company_name") != b.get("company_name"):
+                continue
+            wb = set((b.get("headline") or "").lower().split())
+            if wa and wb and len(wa & wb) / len(wa | wb) >= 0.4:
+                cluster.append(b)
+        if len(cluster) > 1:
+            cluster.sort(key=lambda s: len(s.get("headline") or ""), reverse=True)
+            processed.update(s["id"] for s in cluster)
+            clusters.append([s["id"] for s in cluster])
+    return clusters
+
+
+def _synthetic_signals(n: int, seed: int = 3) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(300)]
+    signals: list[dict[str, Any]] = []
+    while len(signals) < n:
+        company = rng.choice(["Acme", "Globex", "Initech", None])
+        base = rng.sample(vocab, 8)
+        for _ in range(rng.randint(1, 4)):
+            words = list(base)
+            for _ in range(rng.randint(0, 4)):
+                words[rng.randrange(len(words))] = rng.choice(vocab)
+            signals.append(
+                {"id": f"s{len(signals)}", "headline": " ".join(words), "company_name": company}
+            )
+    signals.append({"id": "empty", "headline": "", "company_name": "Acme"})
+    return signals
+
+
+class _Table:
+    """In-memory market_signals: unclustered rows, clustered rows, updates."""
+
+    def __init__(self, unclustered: list[dict[str, Any]], clustered: list[dict[str, Any]]) -> None:
+        self.unclustered = unclustered
+        self.clustered = clustered
+        self.updates: list[tuple[str, dict[str, Any]]] = []
+
+
+class _Query:
+    """Minimal chainable query builder over a _Table."""
+
+    def __init__(self, table: _Table) -> None:
+        self._table = table
+        self._clustered = False
+        self._update: dict[str, Any] | None = None
+
+    @property
+    def not_(self) -> _Query:
+        # Only used as ``.not_.is_("cluster_id", "null")``
+        self._clustered = True
+        return self
+
+    def select(self, *_a: Any) -> _Query:
+        return self
+
+    def gte(self, *_a: Any) -> _Query:
+        return self
+
+    def is_(self, *_a: Any) -> _Query:
+        return self
+
+    def order(self, *_a: Any, **_k: Any) -> _Query:
+        return self
+
+    def update(self, data: dict[str, Any]) -> _Query:
+        self._update = data
+        return self
+
+    def eq(self, _col: str, value: str) -> _Query:
+        self._table.updates.append((value, self._update or {}))
+        return self
+
+    def execute(self) -> Any:
+        if self._update is not None:
+            return MagicMock(data=[])
+        return MagicMock(data=self._table.clustered if self._clustered else self._table.unclustered)
+
+
+def _db(table: _Table) -> MagicMock:
+    db = MagicMock()
+    db.table.side_effect = lambda _name: _Query(table)
+    return db
+
+
+class TestMinHash:
+    def test_batch_signatures_match_single(self) -> None:
+        hasher = MinHasher()
+        sets = [tokenize("FDA approves new drug"), tokenize(""), tokenize("Merger talks stall")]
+        batch = hasher.signatures(sets)
+        assert batch[1] is None
+        assert np.array_equal(batch[0], hasher.signature(sets[0]))
+        assert np.array_equal(batch[2], hasher.signature(sets[2]))
+
+    def test_signatures_are_stable_across_instances(self) -> None:
+        tokens = tokenize("Acme raises Series B")
+        assert MinHasher().signature(tokens).tolist() == MinHasher().signature(tokens).tolist()
+
+    def test_lsh_candidates_respect_block(self) -> None:
+        hasher = MinHasher()
+        sig = hasher.signature(tokenize("acme wins big contract with hospital"))
+        index = LSHIndex()
+        index.insert("a", sig, "Acme")
+        index.insert("b", sig, "Globex")
+        assert index.query(sig, "Acme") == {"a"}
+        assert index.query(sig, "Initech") == set()
+
+
+class TestClusterSignals:
+    def test_matches_all_pairs_assignment(self) -> None:
+        signals = _synthetic_signals(400)
+        lsh = [[s["id"] for s in c] for c in cluster_signals(signals)]
+        assert lsh == _all_pairs_clusters(signals)
+        assert lsh  # the synthetic set does contain duplicates
+
+    def test_primary_is_longest_headline(self) -> None:
+        signals = [
+            {"id": "1", "headline": "Acme buys Globex", "company_name": "Acme"},
+            {"id": "2", "headline": "Acme buys Globex for $2B", "company_name": "Acme"},
+            {"id": "3", "headline": "Acme buys Globex", "company_name": "Other"},
+        ]
+        assert [[s["id"] for s in c] for c in cluster_signals(signals)] == [["2", "1"]]
+
+
+class TestDeduplicateSignals:
+    async def test_creates_clusters_and_persists_signatures(self) -> None:
+        table = _Table(
+            unclustered=[
+                {"id": "1", "headline": "Acme buys Globex", "company_name": "Acme"},
+                {"id": "2", "headline": "Acme buys Globex for $2B", "company_name": "Acme"},
+            ],
+            clustered=[],
+        )
+        created = await SignalDeduplicator(_db(table)).deduplicate_signals()
+
+        assert created == 1
+        updates = dict(table.updates)
+        assert updates["1"]["cluster_id"] == updates["2"]["cluster_id"]
+        assert updates["2"]["is_cluster_primary"] is True
+        assert len(updates["1"]["minhash_signature"]) == MinHasher().num_perm
+
+    async def test_incremental_attaches_to_existing_cluster(self) -> None:
+        existing_sig = MinHasher().signature(tokenize("Acme buys Globex")).tolist()
+        table = _Table(
+            unclustered=[
+                {
+                    "id": "new",
+                    "headline": "Acme buys Globex in all-stock deal",
+                    "company_name": "Acme",
+                },
+            ],
+            clustered=[
+                {
+                    "id": "old",
+                    "headline": "Acme buys Globex",
+                    "company_name": "Acme",
+                    "cluster_id": "cluster-1",
+                    "is_cluster_primary": True,
+                    "minhash_signature": existing_sig,
+                },
+            ],
+        )
+        created = await SignalDeduplicator(_db(table)).deduplicate_signals()
+
+        assert created == 0
+        updates = dict(table.updates)
+        assert updates["new"]["cluster_id"] == "cluster-1"
+        # Longer headline takes over as primary
+        assert updates["new"]["is_cluster_primary"] is True
+        assert updates["old"] == {"is_cluster_primary": False}
+
+    async def test_non_incremental_ignores_existing_clusters(self) -> None:
+        table = _Table(
+            unclustered=[{"id": "new", "headline": "Acme buys Globex", "company_name": "Acme"}],
+            clustered=[
+                {
+                    "id": "old",
+                    "headline": "Acme buys Globex",
+                    "company_name": "Acme",
+                    "cluster_id": "cluster-1",
+                    "is_cluster_primary": True,
+                    "minhash_signature": None,
+                },
+            ],
+        )
+        created = await SignalDeduplicator(_db(table)).deduplicate_signals(incremental=False)
+
+        assert created == 0
+        assert table.updates == []
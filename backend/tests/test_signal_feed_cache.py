@@ -0,0 +1,236 @@
+"""Tests for the shared Signal Radar fetch cache and Aho-Corasick matcher."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.agents.capabilities.signal_feed_cache import (
+    FeedItem,
+    SignalFeedCache,
+    match_rss_items,
+    parse_feed_items,
+)
+from src.utils.aho_corasick import AhoCorasick
+
+RSS_XML = """<?xml version="1.0"?>
+<rss><channel>
+  <item><title>Pfizer expands Moderna deal</title><description>mRNA</description>
+    <link>https://example.com/1</link><pubDate>Mon, 01 Jan 2026</pubDate></item>
+  <item><title>Lonza opens site</title><description>CDMO capacity</description>
+    <link>https://example.com/2</link></item>
+</channel></rss>"""
+
+
+def _item(text: str) -> FeedItem:
+    return FeedItem(title=text, description="", link="", pub_date="", match_text=text.lower())
+
+
+class TestAhoCorasick:
+    def test_finds_overlapping_and_nested_patterns(self) -> None:
+        matcher = AhoCorasick(["he", "she", "his", "hers", ""])
+        assert matcher.find_all("ushers") == {"she", "he", "hers"}
+        assert matcher.find_all("xyz") == set()
+
+    def test_matches_naive_substring_search(self) -> None:
+        patterns = ["ab", "abc", "bca", "c", "cab", "aaa"]
+        matcher = AhoCorasick(patterns)
+        for text in ["abcabc", "aaaa", "bcab", "", "cccc"]:
+            assert matcher.find_all(text) == {p for p in patterns if p in text}
+
+
+class TestParseFeedItems:
+    def test_parses_rss_items(self) -> None:
+        items = parse_feed_items(RSS_XML, "test")
+        assert [i.title for i in items] == ["Pfizer expands Moderna deal", "Lonza opens site"]
+        assert items[0].link == "https://example.com/1"
+        assert items[0].match_text == "pfizer expands moderna deal mrna"
+
+    def test_malformed_xml_returns_empty(self) -> None:
+        assert parse_feed_items("<rss><channel>", "test") == []
+
+
+class TestMatchRssItems:
+    def test_each_user_gets_only_their_hits(self) -> None:
+        feeds = {"a": [_item("Pfizer and Moderna"), _item("Lonza news")], "b": [_item("Nothing")]}
+        hits = match_rss_items(feeds, {"u1": ["Moderna", "Pfizer"], "u2": ["lonza"], "u3": ["x"]})
+
+        assert [(h.feed_name, h.entity_lower) for h in hits["u1"]] == [("a", "moderna")]
+        assert [h.item.title for h in hits["u2"]] == ["Lonza news"]
+        assert "u3" not in hits
+
+    def test_picks_first_name_in_user_order(self) -> None:
+        feeds = {"a": [_item("Pfizer and Moderna")]}
+        hits = match_rss_items(feeds, {"u1": ["Pfizer", "Moderna"], "u2": ["Moderna", "Pfizer"]})
+        assert hits["u1"][0].entity_lower == "pfizer"
+        assert hits["u2"][0].entity_lower == "moderna"
+
+    def test_no_names_returns_empty(self) -> None:
+        assert match_rss_items({"a": [_item("Pfizer")]}, {"u1": []}) == {}
+
+
+def _cache_with(handler: Any, **kwargs: Any) -> SignalFeedCache:
+    cache = SignalFeedCache(**kwargs)
+    cache._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return cache
+
+
+class TestSignalFeedCache:
+    @pytest.mark.asyncio
+    async def test_feed_fetched_once_within_ttl(self) -> None:
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, text=RSS_XML)
+
+        cache = _cache_with(handler)
+        first = await cache.get_rss_items("feed", "https://feed.test/rss")
+        second = await cache.get_rss_items("feed", "https://feed.test/rss")
+
+        assert calls == 1
+        assert first == second and len(first) == 2
+
+    @pytest.mark.asyncio
+    async def test_conditional_get_reuses_parse_on_304(self) -> None:
+        seen_headers: list[dict[str, str]] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=RSS_XML, headers={"ETag": '"v1"'})
+
+        cache = _cache_with(handler, feed_ttl=0.0)
+        await cache.get_rss_items("feed", "https://feed.test/rss")
+        items = await cache.get_rss_items("feed", "https://feed.test/rss")
+
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert len(items) == 2
+        assert cache.stats()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_fetch(self) -> None:
+        calls = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"results": [1]})
+
+        cache = _cache_with(handler)
+        results = await asyncio.gather(
+            *(cache.get_json("https://api.test/x", {"q": "pfizer"}) for _ in range(5))
+        )
+
+        assert calls == 1
+        assert results == [{"results": [1]}] * 5
+        assert cache.stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_fetch(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(200, json={"results": [1]})
+
+        cache = _cache_with(handler)
+        leader = asyncio.create_task(cache.get_json("https://api.test/x"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.get_json("https://api.test/x"))
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        release.set()
+
+        assert await follower == {"results": [1]}
+        assert cache.stats()["coalesced"] == 1
+        assert await cache.get_json("https://api.test/x") == {"results": [1]}
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_serves_stale(self) -> None:
+        status = 200
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(status, json={"ok": True})
+
+        cache = _cache_with(handler, source_ttl=0.0)
+        assert await cache.get_json("https://api.test/x") == {"ok": True}
+        status = 503
+        assert await cache.get_json("https://api.test/x") == {"ok": True}
+        assert cache.stats()["stale_served"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_status_cached_as_none(self) -> None:
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(404)
+
+        cache = _cache_with(handler)
+        for _ in range(2):
+            assert (
+                await cache.get_json("https://api.test/x", empty_statuses=frozenset({404})) is None
+            )
+        assert calls == 1
+
+
+class TestRadarQueries:
+    """FDA and ClinicalTrials.gov scans send one OR-batched query per endpoint."""
+
+    @staticmethod
+    def _radar() -> Any:
+        from src.agents.capabilities.signal_radar import SignalRadarCapability
+
+        return SignalRadarCapability(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_fda_scan_batches_keywords_and_shares_by_keyword_set(self) -> None:
+        searches: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            searches.append(request.url.params["search"])
+            return httpx.Response(404)
+
+        cache = _cache_with(handler)
+        radar = self._radar()
+        with patch(
+            "src.agents.capabilities.signal_radar.get_signal_feed_cache", return_value=cache
+        ):
+            await radar._scan_fda(["Pfizer", "Moderna", " pfizer "])
+            await radar._scan_fda(["moderna", "PFIZER"])
+
+        assert len(searches) == 3
+        assert all(s.endswith(':"moderna" OR "pfizer"') for s in searches)
+
+    @pytest.mark.asyncio
+    async def test_clinical_trials_scan_sends_one_query(self) -> None:
+        terms: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            terms.append(request.url.params["query.term"])
+            study = {"protocolSection": {"identificationModule": {"nctId": "NCT1"}}}
+            return httpx.Response(200, json={"studies": [study]})
+
+        cache = _cache_with(handler)
+        radar = self._radar()
+        with patch(
+            "src.agents.capabilities.signal_radar.get_signal_feed_cache", return_value=cache
+        ):
+            first = await radar._scan_clinical_trials(["Lonza", "Moderna"])
+            second = await radar._scan_clinical_trials(["moderna", "lonza"])
+
+        assert terms == ["lonza OR moderna"]
+        assert [s.metadata["nct_id"] for s in first + second] == ["NCT1", "NCT1"]
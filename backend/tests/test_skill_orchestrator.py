@@ -1,5 +1,6 @@
 """Tests for skill orchestrator service."""
 
+import asyncio
 import json
 from datetime import UTC, datetime
 from typing import Any
@@ -944,6 +945,115 @@ class TestExecutePlan:
         assert result.steps_skipped == 1
         assert result.status == "failed"  # 0 completed
 
+    def _timed_orchestrator(
+        self,
+        delays: dict[str, float],
+        events: list[tuple[str, str]],
+        max_concurrent_steps: int | None = None,
+    ) -> SkillOrchestrator:
+        """Orchestrator whose executor sleeps per skill and logs start/end."""
+        mock_executor = MagicMock()
+
+        async def mock_execute(**kwargs):
+            skill_id = kwargs.get("skill_id")
+            events.append(("start", skill_id))
+            await asyncio.sleep(delays.get(skill_id, 0))
+            events.append(("end", skill_id))
+            result = MagicMock()
+            result.success = True
+            result.result = {"ok": True}
+            result.execution_time_ms = 1
+            return result
+
+        mock_executor.execute = mock_execute
+        mock_autonomy = MagicMock()
+        mock_autonomy.should_request_approval = AsyncMock(return_value=False)
+        mock_autonomy.record_execution_outcome = AsyncMock(return_value=None)
+
+        orch = SkillOrchestrator(
+            executor=mock_executor,
+            index=MagicMock(),
+            autonomy=mock_autonomy,
+            max_concurrent_steps=max_concurrent_steps,
+        )
+        orch._get_db = lambda: _mock_db()
+        return orch
+
+    async def test_step_starts_when_its_own_dependencies_finish(self) -> None:
+        """A downstream step does not wait for unrelated slow steps in its group."""
+        events: list[tuple[str, str]] = []
+        orch = self._timed_orchestrator({"slow": 0.1, "fast": 0.0, "next": 0.0}, events)
+        plan = ExecutionPlan(
+            task_description="Ready queue",
+            steps=[
+                ExecutionStep(step_number=1, skill_id="slow", skill_path="a", depends_on=[], status="pending", input_data={}),
+                ExecutionStep(step_number=2, skill_id="fast", skill_path="b", depends_on=[], status="pending", input_data={}),
+                ExecutionStep(step_number=3, skill_id="next", skill_path="c", depends_on=[2], status="pending", input_data={}),
+            ],
+            parallel_groups=[[1, 2], [3]],
+            estimated_duration_ms=0,
+            risk_level="low",
+            approval_required=False,
+        )
+
+        result = await orch.execute_plan(user_id="user-123", plan=plan)
+
+        assert result.steps_completed == 3
+        assert events.index(("start", "next")) < events.index(("end", "slow"))
+        assert [e.step_number for e in result.working_memory] == [2, 3, 1]
+
+    async def test_concurrency_cap_limits_running_steps(self) -> None:
+        """No more than max_concurrent_steps run at once."""
+        events: list[tuple[str, str]] = []
+        orch = self._timed_orchestrator(
+            {f"s{i}": 0.01 for i in range(5)}, events, max_concurrent_steps=2
+        )
+        plan = ExecutionPlan(
+            task_description="Wide",
+            steps=[
+                ExecutionStep(step_number=i, skill_id=f"s{i}", skill_path="p", depends_on=[], status="pending", input_data={})
+                for i in range(5)
+            ],
+            parallel_groups=[list(range(5))],
+            estimated_duration_ms=0,
+            risk_level="low",
+            approval_required=False,
+        )
+
+        result = await orch.execute_plan(user_id="user-123", plan=plan)
+
+        assert result.steps_completed == 5
+        running = peak = 0
+        for kind, _ in events:
+            running += 1 if kind == "start" else -1
+            peak = max(peak, running)
+        assert peak == 2
+
+    async def test_critical_path_recorded_in_result(self) -> None:
+        """PlanResult reports the gating dependency chain and its bottleneck."""
+        events: list[tuple[str, str]] = []
+        orch = self._timed_orchestrator({"a": 0.08, "b": 0.01, "c": 0.01}, events)
+        plan = ExecutionPlan(
+            task_description="Critical path",
+            steps=[
+                ExecutionStep(step_number=1, skill_id="a", skill_path="a", depends_on=[], status="pending", input_data={}),
+                ExecutionStep(step_number=2, skill_id="b", skill_path="b", depends_on=[], status="pending", input_data={}),
+                ExecutionStep(step_number=3, skill_id="c", skill_path="c", depends_on=[1, 2], status="pending", input_data={}),
+            ],
+            parallel_groups=[[1, 2], [3]],
+            estimated_duration_ms=0,
+            risk_level="low",
+            approval_required=False,
+        )
+
+        result = await orch.execute_plan(user_id="user-123", plan=plan)
+
+        assert result.critical_path == [1, 3]
+        assert result.bottleneck_step == 1
+        assert set(result.step_timings) == {1, 2, 3}
+        assert result.step_timings[3].started_ms >= result.step_timings[1].finished_ms
+        assert result.critical_path_ms >= 80
+
 
 @pytest.mark.asyncio
 class TestCreateExecutionPlan:
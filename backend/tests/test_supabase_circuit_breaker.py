@@ -1,7 +1,7 @@
 """Tests for Supabase client circuit breaker integration."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.core.resilience import CircuitBreakerOpen
 
@@ -14,10 +14,12 @@ async def test_supabase_get_user_opens_circuit_after_failures() -> None:
     # Reset circuit state
     _supabase_circuit_breaker.reset()
 
-    with patch.object(SupabaseClient, "get_client") as mock_get_client:
+    with patch.object(
+        SupabaseClient, "get_async_client", new_callable=AsyncMock
+    ) as mock_get_client:
         mock_client = MagicMock()
-        mock_client.table.return_value.select.return_value.eq.return_value.single.return_value.execute.side_effect = (
-            Exception("connection refused")
+        mock_client.table.return_value.select.return_value.eq.return_value.single.return_value.execute = AsyncMock(
+            side_effect=Exception("connection refused")
         )
         mock_get_client.return_value = mock_client
 
@@ -40,12 +42,14 @@ async def test_supabase_circuit_resets_on_success() -> None:
     # Reset circuit state
     _supabase_circuit_breaker.reset()
 
-    with patch.object(SupabaseClient, "get_client") as mock_get_client:
+    with patch.object(
+        SupabaseClient, "get_async_client", new_callable=AsyncMock
+    ) as mock_get_client:
         mock_client = MagicMock()
 
         call_count = 0
 
-        def side_effect() -> MagicMock:
+        async def side_effect() -> MagicMock:
             nonlocal call_count
             call_count += 1
             if call_count <= 3:
@@ -68,3 +72,56 @@ async def test_supabase_circuit_resets_on_success() -> None:
         assert _supabase_circuit_breaker._failure_count == 0
 
     _supabase_circuit_breaker.reset()
+
+
+@pytest.mark.asyncio
+async def test_execute_async_offloads_sync_builder() -> None:
+    """Sync builders run off the event loop and return their response."""
+    import threading
+
+    from src.db.supabase import execute_async
+
+    loop_thread = threading.get_ident()
+    seen: dict[str, int] = {}
+
+    def execute() -> MagicMock:
+        seen["thread"] = threading.get_ident()
+        result = MagicMock()
+        result.data = [{"id": "row-1"}]
+        return result
+
+    query = MagicMock()
+    query.execute = execute
+
+    result = await execute_async(query)
+
+    assert result.data == [{"id": "row-1"}]
+    assert seen["thread"] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_execute_async_awaits_native_async_builder() -> None:
+    """Async builders are awaited directly instead of being offloaded."""
+    from src.db.supabase import execute_async
+
+    response = MagicMock()
+    response.data = [{"id": "row-2"}]
+    query = MagicMock()
+    query.execute = AsyncMock(return_value=response)
+
+    result = await execute_async(query)
+
+    assert result is response
+    query.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_async_propagates_errors() -> None:
+    """Errors raised by the sync builder surface to the awaiting caller."""
+    from src.db.supabase import execute_async
+
+    query = MagicMock()
+    query.execute.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await execute_async(query)
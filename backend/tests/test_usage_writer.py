@@ -0,0 +1,296 @@
+"""Tests for the usage write-behind buffer."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.cost_governor import LLMUsage
+from src.core.usage_writer import UsageWriteBuffer
+
+
+def _mock_async_client() -> MagicMock:
+    """Async Supabase client whose insert/rpc builders record payloads."""
+    client = MagicMock()
+    client.inserted = []
+    client.rpc_calls = []
+
+    def table(_name: str) -> MagicMock:
+        builder = MagicMock()
+
+        def insert(rows: list[dict[str, Any]]) -> MagicMock:
+            client.inserted.append(rows)
+            query = MagicMock()
+            query.execute = AsyncMock(return_value=MagicMock(data=rows))
+            return query
+
+        builder.insert.side_effect = insert
+        return builder
+
+    def rpc(name: str, params: dict[str, Any]) -> MagicMock:
+        client.rpc_calls.append((name, params))
+        query = MagicMock()
+        query.execute = AsyncMock(return_value=MagicMock(data=None))
+        return query
+
+    client.table.side_effect = table
+    client.rpc.side_effect = rpc
+    return client
+
+
+@pytest.fixture
+def mock_client() -> Any:
+    client = _mock_async_client()
+    with patch(
+        "src.db.supabase.SupabaseClient.get_async_client",
+        new_callable=AsyncMock,
+        return_value=client,
+    ):
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _cheap_cost() -> Any:
+    with patch.object(LLMUsage, "estimated_cost_usd", new=0.01):
+        yield
+
+
+class TestUsageWriteBuffer:
+    """Tests for UsageWriteBuffer."""
+
+    def test_enqueue_rejected_when_not_running(self) -> None:
+        buffer = UsageWriteBuffer()
+        assert buffer.enqueue_llm_usage({"model": "m"}) is False
+        assert buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=1)) is False
+        assert buffer.queue_depth == 0
+
+    async def test_deltas_coalesce_per_user_into_one_rpc(self, mock_client: MagicMock) -> None:
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        await buffer.start()
+        for _ in range(5):
+            buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=10, output_tokens=5))
+        buffer.enqueue_usage_delta("user-2", LLMUsage(thinking_tokens=7))
+        assert buffer.queue_depth == 2
+
+        await buffer.flush()
+        await buffer.stop()
+
+        assert len(mock_client.rpc_calls) == 1
+        name, params = mock_client.rpc_calls[0]
+        assert name == "increment_usage_tracking_batch"
+        by_user = {r["user_id"]: r for r in params["p_rows"]}
+        assert by_user["user-1"]["input_tokens"] == 50
+        assert by_user["user-1"]["output_tokens"] == 25
+        assert by_user["user-1"]["request_count"] == 5
+        assert by_user["user-2"]["thinking_tokens"] == 7
+        assert buffer.stats()["deltas_written"] == 2
+
+    async def test_rows_are_bulk_inserted_in_chunks(self, mock_client: MagicMock) -> None:
+        buffer = UsageWriteBuffer(batch_size=3, flush_interval=60)
+        await buffer.start()
+        for i in range(7):
+            buffer.enqueue_llm_usage({"model": f"m{i}"})
+        await buffer.stop()
+
+        assert [len(chunk) for chunk in mock_client.inserted] == [3, 3, 1]
+        assert buffer.stats()["rows_written"] == 7
+
+    async def test_size_trigger_flushes_without_waiting_for_interval(
+        self, mock_client: MagicMock
+    ) -> None:
+        buffer = UsageWriteBuffer(batch_size=2, flush_interval=60)
+        await buffer.start()
+        buffer.enqueue_llm_usage({"model": "a"})
+        buffer.enqueue_llm_usage({"model": "b"})
+
+        for _ in range(50):
+            if mock_client.inserted:
+                break
+            await asyncio.sleep(0.01)
+
+        assert mock_client.inserted == [[{"model": "a"}, {"model": "b"}]]
+        await buffer.stop()
+
+    async def test_stop_drains_pending_writes(self, mock_client: MagicMock) -> None:
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        await buffer.start()
+        buffer.enqueue_llm_usage({"model": "a"})
+        buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=1))
+
+        await buffer.stop()
+
+        assert buffer.queue_depth == 0
+        assert mock_client.inserted == [[{"model": "a"}]]
+        assert len(mock_client.rpc_calls) == 1
+        assert buffer.enqueue_llm_usage({"model": "late"}) is False
+
+    async def test_failed_flush_requeues_work(self, mock_client: MagicMock) -> None:
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        await buffer.start()
+        buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=10))
+
+        failing = MagicMock()
+        failing.execute = AsyncMock(side_effect=Exception("db down"))
+        mock_client.rpc.side_effect = lambda *_a, **_k: failing
+        await buffer.flush()
+
+        assert buffer.queue_depth == 1
+        assert buffer.stats()["failed_flushes"] == 1
+
+        # Further usage coalesces into the re-queued delta
+        buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=5))
+        pending = buffer.pending_delta("user-1")
+        assert pending is not None
+        assert pending.input_tokens == 15
+        assert pending.request_count == 2
+
+        await buffer.stop()
+
+    async def test_stop_waits_for_in_flight_flush(self, mock_client: MagicMock) -> None:
+        buffer = UsageWriteBuffer(batch_size=2, flush_interval=60)
+        await buffer.start()
+        release = asyncio.Event()
+
+        async def slow_insert(*_args: Any, **_kwargs: Any) -> MagicMock:
+            await release.wait()
+            return MagicMock(data=None)
+
+        mock_client.table.side_effect = None
+        mock_client.table.return_value.insert.return_value.execute = slow_insert
+        buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=3))
+        buffer.enqueue_llm_usage({"model": "a"})
+        for _ in range(50):
+            if mock_client.table.called:
+                break
+            await asyncio.sleep(0.01)
+        assert mock_client.table.called
+
+        stopping = asyncio.create_task(buffer.stop())
+        await asyncio.sleep(0.05)
+        assert not stopping.done()
+        release.set()
+        await stopping
+
+        assert buffer.queue_depth == 0
+        assert len(mock_client.rpc_calls) == 1
+        assert mock_client.rpc_calls[0][1]["p_rows"][0]["input_tokens"] == 3
+        assert buffer.stats()["rows_written"] == 1
+
+    async def test_cancelled_flush_requeues_unwritten_work(self, mock_client: MagicMock) -> None:
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        await buffer.start()
+        started = asyncio.Event()
+
+        async def hanging_rpc(*_args: Any, **_kwargs: Any) -> MagicMock:
+            started.set()
+            await asyncio.Event().wait()
+            raise AssertionError("unreachable")
+
+        mock_client.rpc.side_effect = lambda *_a, **_k: MagicMock(execute=hanging_rpc)
+        buffer.enqueue_llm_usage({"model": "a"})
+        buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=4))
+
+        flushing = asyncio.create_task(buffer.flush())
+        await started.wait()
+        # Taken by the flush but not yet persisted: still counted
+        pending = buffer.pending_delta("user-1")
+        assert pending is not None
+        assert pending.input_tokens == 4
+
+        flushing.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flushing
+
+        # The inserted row is not re-queued; the unwritten delta is
+        assert buffer.stats()["pending_rows"] == 0
+        pending = buffer.pending_delta("user-1")
+        assert pending is not None
+        assert pending.input_tokens == 4
+
+        mock_client.rpc.side_effect = None
+        mock_client.rpc.return_value.execute = AsyncMock(return_value=MagicMock(data=None))
+        await buffer.stop()
+        assert buffer.queue_depth == 0
+        assert mock_client.inserted == [[{"model": "a"}]]
+
+    async def test_rows_beyond_max_pending_are_dropped(self, mock_client: MagicMock) -> None:
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60, max_pending=2)
+        await buffer.start()
+        for i in range(5):
+            assert buffer.enqueue_llm_usage({"model": f"m{i}"}) is True
+
+        stats = buffer.stats()
+        assert stats["pending_rows"] == 2
+        assert stats["dropped"] == 3
+
+        await buffer.stop()
+        assert sum(len(c) for c in mock_client.inserted) == 2
+
+
+class TestCostGovernorWriteBehind:
+    """CostGovernor routes increments through the buffer when it is running."""
+
+    @pytest.fixture
+    def governor_settings(self) -> Any:
+        from types import SimpleNamespace
+
+        with patch(
+            "src.core.cost_governor._get_settings",
+            return_value=SimpleNamespace(
+                COST_GOVERNOR_ENABLED=True,
+                COST_GOVERNOR_DAILY_TOKEN_BUDGET=1000,
+                COST_GOVERNOR_DAILY_THINKING_BUDGET=500,
+                COST_GOVERNOR_SOFT_LIMIT_PERCENT=0.8,
+            ),
+        ):
+            yield
+
+    @pytest.mark.usefixtures("governor_settings")
+    async def test_record_usage_buffers_instead_of_rpc(self) -> None:
+        from src.core.cost_governor import CostGovernor
+
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        buffer._running = True
+        with (
+            patch("src.core.usage_writer.get_usage_write_buffer", return_value=buffer),
+            patch("src.db.supabase.SupabaseClient.get_client") as mock_get_client,
+        ):
+            await CostGovernor().record_usage("user-1", LLMUsage(input_tokens=40))
+
+        mock_get_client.assert_not_called()
+        pending = buffer.pending_delta("user-1")
+        assert pending is not None
+        assert pending.input_tokens == 40
+
+    @pytest.mark.usefixtures("governor_settings")
+    async def test_check_budget_counts_unflushed_usage(self) -> None:
+        from src.core.cost_governor import CostGovernor
+
+        buffer = UsageWriteBuffer(batch_size=1000, flush_interval=60)
+        buffer._running = True
+        buffer.enqueue_usage_delta("user-1", LLMUsage(input_tokens=600, output_tokens=400))
+
+        governor = CostGovernor()
+        with (
+            patch("src.core.usage_writer.get_usage_write_buffer", return_value=buffer),
+            patch.object(
+                governor,
+                "_get_today_usage",
+                new_callable=AsyncMock,
+                return_value={
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "extended_thinking_tokens": 0,
+                    "estimated_cost_cents": 0.0,
+                    "request_count": 0,
+                },
+            ),
+        ):
+            status = await governor.check_budget("user-1")
+
+        assert status.tokens_used_today == 1000
+        assert status.can_proceed is False
+        assert status.llm_calls_today == 1
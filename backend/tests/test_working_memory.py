@@ -1,6 +1,7 @@
 """Tests for working memory module."""
 
 import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -278,6 +279,64 @@ def test_clear_resets_all_state() -> None:
     assert memory.user_id == "user-456"
 
 
+def test_truncation_matches_oldest_non_system_first() -> None:
+    """Truncation drops the oldest non-system messages and keeps counts exact."""
+    from src.memory.working import count_tokens
+
+    memory = WorkingMemory(conversation_id="conv-123", user_id="user-456", max_tokens=60)
+    memory.add_message(role="system", content="You are ARIA.")
+    for i in range(30):
+        memory.add_message(role="user" if i % 2 else "assistant", content=f"Message number {i} here.")
+        if i == 10:
+            memory.add_message(role="system", content="Late system note.")
+
+    contents = [m["content"] for m in memory.messages]
+    assert contents[:2] == ["You are ARIA.", "Late system note."]
+    assert contents[-1] == "Message number 29 here."
+    assert contents[2:] == [f"Message number {i} here." for i in range(30 - len(contents) + 2, 30)]
+    assert memory.context_tokens == sum(count_tokens(c) for c in contents)
+    assert memory.context_tokens <= memory.max_tokens
+
+
+def test_pop_message_removes_last_and_its_tokens() -> None:
+    """pop_message removes the latest message and keeps truncation consistent."""
+    memory = WorkingMemory(conversation_id="conv-123", user_id="user-456", max_tokens=40)
+    memory.add_message(role="user", content="Hello there, ARIA.")
+    memory.add_message(role="user", content="Original message text.")
+
+    popped = memory.pop_message()
+    memory.add_message(role="user", content="Enriched message text with signals.")
+    memory.add_message(role="assistant", content="A reply long enough to force truncation here.")
+
+    assert popped is not None and popped["content"] == "Original message text."
+    assert [m["content"] for m in memory.messages][-1].startswith("A reply")
+    assert memory.context_tokens == sum(m["token_count"] for m in memory.messages)
+
+
+def test_token_counts_round_trip_without_retokenizing() -> None:
+    """Cached counts survive to_dict/from_dict and are reused on restore."""
+    memory = WorkingMemory(conversation_id="conv-123", user_id="user-456")
+    memory.add_message(role="user", content="Hello!")
+    memory.add_message(role="assistant", content="Hi there, how can I help?")
+
+    data = json.loads(json.dumps(memory.to_dict()))
+    with patch("src.memory.working.count_tokens", side_effect=AssertionError("re-tokenized")):
+        restored = WorkingMemory.from_dict(data)
+
+    assert restored.context_tokens == memory.context_tokens
+    assert restored.get_context_for_llm() == memory.get_context_for_llm()
+
+
+def test_estimate_mode_skips_tokenizer() -> None:
+    """Estimate mode counts roughly four characters per token without tiktoken."""
+    memory = WorkingMemory(conversation_id="conv-123", user_id="user-456", estimate=True)
+    with patch("src.memory.working.count_tokens", side_effect=AssertionError("tokenized")):
+        memory.add_message(role="user", content="x" * 40)
+
+    assert memory.context_tokens == 10
+    assert WorkingMemory.from_dict(memory.to_dict()).estimate is True
+
+
 class TestWorkingMemoryManager:
     """Tests for WorkingMemoryManager."""
 
@@ -329,4 +388,125 @@ class TestWorkingMemoryManager:
 
         manager.delete("conv-123")
 
-        assert manager.get("conv-123") is None
\ No newline at end of file
+        assert manager.get("conv-123") is None
+
+class TestWorkingMemorySync:
+    """Tests for dirty tracking, batched sync and eviction."""
+
+    def setup_method(self) -> None:
+        """Reset the manager before each test."""
+        WorkingMemoryManager._sessions = {}
+
+    def test_mutations_mark_session_dirty(self) -> None:
+        """Only mutations should make a session dirty."""
+        memory = WorkingMemory(conversation_id="conv-1", user_id="user-1")
+        assert not memory.is_dirty
+
+        memory.get_context_for_llm()
+        memory.remove_entity("missing")
+        assert not memory.is_dirty
+
+        memory.set_entity("company", {"name": "Acme"})
+        assert memory.is_dirty
+
+    @pytest.mark.asyncio
+    async def test_sync_writes_only_dirty_sessions_in_one_batch(self) -> None:
+        """persist_all_sessions should send changed sessions in one RPC."""
+        manager = WorkingMemoryManager()
+        db = MagicMock()
+
+        with (
+            patch("src.db.supabase.get_supabase_client", return_value=db),
+            patch("src.db.supabase.execute_async", new_callable=AsyncMock) as execute,
+        ):
+            execute.return_value = MagicMock(data=[])
+            for i in range(3):
+                await manager.get_or_create(f"conv-{i}", "user-1")
+            execute.reset_mock()  # Session loads
+            manager.get("conv-0").add_message("user", "Hello")
+            manager.get("conv-2").set_goal("Close the deal")
+
+            assert await manager.persist_all_sessions() == 2
+            rows = db.rpc.call_args.args[1]["p_rows"]
+            assert [row["id"] for row in rows] == ["conv-0", "conv-2"]
+            assert execute.await_count == 1
+
+            # Nothing changed since: nothing to write
+            assert await manager.persist_all_sessions() == 0
+            assert execute.await_count == 1
+
+        assert manager.stats()["dirty_sessions"] == 0
+        assert manager.stats()["last_sync_written"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_persists_dirty_session_first(self) -> None:
+        """Opening a session over the bound evicts the LRU one after persisting it."""
+        manager = WorkingMemoryManager()
+        db = MagicMock()
+
+        with (
+            patch("src.db.supabase.get_supabase_client", return_value=db),
+            patch("src.db.supabase.execute_async", new_callable=AsyncMock) as execute,
+            patch("src.memory.working.settings") as mock_settings,
+        ):
+            execute.return_value = MagicMock(data=[])
+            mock_settings.WORKING_MEMORY_MAX_SESSIONS = 2
+            mock_settings.WORKING_MEMORY_MAX_BYTES = 10**9
+            mock_settings.WORKING_MEMORY_SYNC_BATCH_SIZE = 100
+            first = await manager.get_or_create("conv-1", "user-1")
+            first.add_message("user", "Remember me")
+            await manager.get_or_create("conv-2", "user-1")
+            manager.get("conv-2")
+            await manager.get_or_create("conv-3", "user-1")
+
+        assert manager.list_sessions() == ["conv-2", "conv-3"]
+        # Persisted through the batched RPC, awaited off the event loop
+        rows = db.rpc.call_args.args[1]["p_rows"]
+        assert [row["id"] for row in rows] == ["conv-1"]
+        assert rows[0]["working_memory"]["messages"][0]["content"] == "Remember me"
+        db.rpc.return_value.execute.assert_not_called()
+        db.table.return_value.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_session_used_during_eviction_write_stays_resident(self) -> None:
+        """A session touched while its eviction write is in flight is kept."""
+        manager = WorkingMemoryManager()
+        with patch("src.memory.working.WorkingMemoryManager._load_from_db", return_value=None):
+            idle = await manager.get_or_create("conv-1", "user-1")
+        idle.set_goal("Close the deal")
+        idle._last_access -= 3600
+
+        async def write_batch(sessions: list) -> int:
+            manager.get("conv-1")  # A request reopens it mid-write
+            for _, memory in sessions:
+                memory._persisted_revision = memory._revision
+            return len(sessions)
+
+        with (
+            patch.object(manager, "_write_batch", side_effect=write_batch),
+            patch("src.memory.working.settings") as mock_settings,
+        ):
+            mock_settings.WORKING_MEMORY_MAX_SESSIONS = 100
+            mock_settings.WORKING_MEMORY_MAX_BYTES = 10**9
+            mock_settings.WORKING_MEMORY_SYNC_BATCH_SIZE = 100
+            assert await manager._evict(idle_seconds=1800) == 0
+
+        assert manager.list_sessions() == ["conv-1"]
+
+    @pytest.mark.asyncio
+    async def test_sync_evicts_idle_sessions(self) -> None:
+        """Sessions idle past the limit are dropped once persisted."""
+        manager = WorkingMemoryManager()
+        with patch("src.memory.working.WorkingMemoryManager._load_from_db", return_value=None):
+            await manager.get_or_create("conv-1", "user-1")
+            await manager.get_or_create("conv-2", "user-1")
+        manager._sessions["conv-1"]._last_access -= 3600
+
+        with patch("src.memory.working.settings") as mock_settings:
+            mock_settings.WORKING_MEMORY_MAX_SESSIONS = 100
+            mock_settings.WORKING_MEMORY_MAX_BYTES = 10**9
+            mock_settings.WORKING_MEMORY_IDLE_SECONDS = 1800
+            mock_settings.WORKING_MEMORY_SYNC_BATCH_SIZE = 100
+            await manager.persist_all_sessions()
+
+        assert manager.list_sessions() == ["conv-2"]